@@ -1,13 +1,22 @@
 """
 데스크톱 UI 실행 스크립트 - QAsync AppKernel 기반 통합 버전
 목적: 단일 진입점으로 모든 런타임 리소스를 AppKernel을 통해 중앙 관리
+
+시작 프로파일: 단계별 소요 시간(import / container_wiring / db_open / first_paint / websocket_connect)을
+logs/startup_profile.json 에 기록합니다.
 """
+import time
 import sys
-import os
-import asyncio
-import traceback
-from datetime import datetime
-from typing import Optional
+
+# 시작 프로파일 기준점 - 다른 import 보다 먼저 기록
+_STARTUP_ORIGIN = time.perf_counter()
+_STARTUP_MODULES = len(sys.modules)
+
+import os  # noqa: E402
+import asyncio  # noqa: E402
+import traceback  # noqa: E402
+from datetime import datetime  # noqa: E402
+from typing import Optional  # noqa: E402
 
 try:
     import qasync
@@ -19,13 +28,15 @@ except ImportError as e:
     sys.exit(1)
 
 # AppKernel 및 인프라스트럭처 임포트
-from upbit_auto_trading.infrastructure.runtime import (
+from upbit_auto_trading.infrastructure.runtime import (  # noqa: E402
     AppKernel,
     KernelConfig,
     get_loop_guard,
-    ensure_main_loop
+    ensure_main_loop,
+    StartupProfiler,
+    set_startup_profiler
 )
-from upbit_auto_trading.infrastructure.logging import create_component_logger
+from upbit_auto_trading.infrastructure.logging import create_component_logger  # noqa: E402
 
 # UI 컴포넌트 임포트
 try:
@@ -53,6 +64,12 @@ sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 # 메인 애플리케이션 로거
 logger = create_component_logger("MainApp")
 
+# 시작 프로파일러 - 모듈 import 구간은 스크립트 첫 줄부터 여기까지
+startup_profiler = StartupProfiler(origin=_STARTUP_ORIGIN, origin_modules=_STARTUP_MODULES)
+set_startup_profiler(startup_profiler)
+startup_profiler.record("import")
+startup_profiler.configure_report()
+
 
 def setup_exception_handler():
     """전역 예외 핸들러 설정"""
@@ -140,12 +157,16 @@ class QAsyncApplication:
             # 3. DILifecycleManager 초기화 (새 구조)
             if DI_MANAGER_AVAILABLE:
                 try:
-                    self.di_manager = get_di_lifecycle_manager()
+                    with startup_profiler.phase("container_wiring"):
+                        self.di_manager = get_di_lifecycle_manager()
                     logger.info("✅ DILifecycleManager 초기화 완료 (새 DI 구조)")
                 except Exception as e:
                     logger.warning(f"⚠️ DILifecycleManager 초기화 실패: {e}")
                     # AppKernel만으로도 동작 가능하므로 계속 진행
 
+                if self.di_manager:
+                    self._open_database()
+
             # 4. 메인 윈도우 생성
             if MAIN_WINDOW_AVAILABLE:
                 try:
@@ -198,6 +219,7 @@ class QAsyncApplication:
                     # MainWindow 종료 신호를 AppKernel 종료와 연결
                     self.main_window.closeEvent = self._create_close_event_handler()
 
+                    startup_profiler.watch_first_paint(self.main_window)
                     self.main_window.show()
                     logger.info("✅ MainWindow 생성 및 표시 완료")
 
@@ -224,6 +246,18 @@ class QAsyncApplication:
             traceback.print_exc()
             return False
 
+    def _open_database(self) -> None:
+        """설정 DB 연결 확인 (시작 프로파일 db_open 단계) - 실패해도 UI 는 계속 진행"""
+        startup_profiler.begin("db_open")
+        try:
+            database_service = self.di_manager.get_external_container().database_manager()
+            with database_service.get_connection('settings') as conn:
+                conn.execute("SELECT 1").fetchone()
+            startup_profiler.end("db_open")
+        except Exception as e:
+            startup_profiler.end("db_open", status="failed", detail=str(e))
+            logger.warning(f"⚠️ 설정 DB 연결 확인 실패: {e}")
+
     def _create_close_event_handler(self):
         """MainWindow closeEvent 핸들러 생성"""
         original_close_event = self.main_window.closeEvent if hasattr(self.main_window, 'closeEvent') else None
@@ -338,6 +372,9 @@ class QAsyncApplication:
                 self.qapp.quit()
                 logger.info("✅ QApplication 종료 요청 완료")
 
+            # 5. 시작 프로파일 리포트 (WebSocket 연결 전 종료된 경우 현재 상태 저장)
+            startup_profiler.flush()
+
             logger.info("🏆 애플리케이션 완전 종료")
 
         except Exception as e:
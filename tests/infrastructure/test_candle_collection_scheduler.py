@@ -0,0 +1,81 @@
+"""
+CandleCollectionScheduler 테스트 - 창 상태 우선순위, 중복 조회 합치기, 페이지 단위 선점
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from upbit_auto_trading.application.chart_viewer.candle_collection_scheduler import (
+    CandleCollectionScheduler,
+    CollectionBudget
+)
+from upbit_auto_trading.application.chart_viewer.chart_viewer_resource_manager import ChartViewerResourceManager
+
+
+class RecordingFetcher:
+    """호출 순서를 기록하는 가짜 캔들 조회 함수"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, symbol, timeframe, count, to):
+        self.calls.append((symbol, to))
+        await asyncio.sleep(0.001)
+        end = datetime.fromisoformat(to) if to else datetime(2025, 1, 1)
+        return [{"candle_date_time_utc": (end - timedelta(minutes=i + 1)).isoformat()} for i in range(count)]
+
+
+def _scheduler(fetcher, resource_manager):
+    return CandleCollectionScheduler(fetcher, resource_manager, budget=CollectionBudget(rps=10_000, burst=50),
+                                     max_workers=1)
+
+
+def test_active_chart_first_and_duplicates_share_one_job(qasync_loop):
+    fetcher = RecordingFetcher()
+    resource_manager = ChartViewerResourceManager()
+    scheduler = _scheduler(fetcher, resource_manager)
+    for chart_id, state in (("bg", "background"), ("min", "minimized"), ("bg_dup", "background"), ("act", "active")):
+        resource_manager.register_chart(chart_id, state)
+
+    async def scenario():
+        try:
+            return await asyncio.gather(
+                scheduler.fetch("min", "KRW-MIN", "1m", count=200),
+                scheduler.fetch("bg", "KRW-BG", "1m", count=200),
+                scheduler.fetch("bg_dup", "KRW-BG", "1m", count=200),
+                scheduler.fetch("act", "KRW-ACT", "1m", count=400),
+            )
+        finally:
+            await scheduler.shutdown()
+
+    minimized, background, background_dup, active = qasync_loop.run_until_complete(scenario())
+    assert [symbol for symbol, _ in fetcher.calls] == ["KRW-ACT", "KRW-ACT", "KRW-BG", "KRW-MIN"]
+    assert fetcher.calls[1][1] == active[199]["candle_date_time_utc"]      # 다음 페이지는 이전 페이지의 가장 오래된 캔들 이전
+    assert len(active) == 400 and len(minimized) == 200
+    assert background is background_dup
+    assert scheduler.stats["deduplicated"] == 1 and scheduler.stats["pages"] == 4
+
+
+def test_window_activation_preempts_running_backfill(qasync_loop):
+    fetcher = RecordingFetcher()
+    resource_manager = ChartViewerResourceManager()
+    scheduler = _scheduler(fetcher, resource_manager)
+    resource_manager.register_chart("bg", "background")
+    resource_manager.register_chart("min", "minimized")
+
+    async def scenario():
+        try:
+            backfill = asyncio.ensure_future(scheduler.fetch("bg", "KRW-BG", "1m", count=2_000))
+            minimized = asyncio.ensure_future(scheduler.fetch("min", "KRW-MIN", "1m", count=200))
+            while len(fetcher.calls) < 2:
+                await asyncio.sleep(0.001)
+            resource_manager.update_window_state("min", "active")
+            return await asyncio.gather(backfill, minimized)
+        finally:
+            await scheduler.shutdown()
+
+    backfill, minimized = qasync_loop.run_until_complete(scenario())
+    symbols = [symbol for symbol, _ in fetcher.calls]
+    assert symbols.index("KRW-MIN") <= 3                          # 백필 10페이지가 끝나기 전에 선점
+    assert len(backfill) == 2_000 and len(minimized) == 200
+    assert scheduler.stats["preemptions"] >= 1
@@ -0,0 +1,78 @@
+"""
+CandleScenarioIndex 테스트 - 백그라운드 색인 갱신, 라벨 구간 길이와 같은 구간 로드, 증분 갱신
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from upbit_auto_trading.domain.strategy_simulation.value_objects.simulation_scenario import SimulationScenario
+from upbit_auto_trading.infrastructure.repositories.strategy_simulation.candle_scenario_index import (
+    CandleScenarioIndex, ScenarioIndexConfig
+)
+
+TABLE = "candles_KRW_BTC_1m"
+START = datetime(2025, 1, 1)
+
+
+def _write_candles(db_path, closes, offset=0):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {TABLE} (
+                candle_date_time_utc TEXT PRIMARY KEY, market TEXT, opening_price REAL, high_price REAL,
+                low_price REAL, trade_price REAL, candle_acc_trade_volume REAL
+            )
+        """)
+        rows = []
+        for i, close in enumerate(closes, start=offset):
+            utc = (START + timedelta(minutes=i)).strftime("%Y-%m-%dT%H:%M:%S")
+            if np.isnan(close):
+                rows.append((utc, "KRW-BTC", None, None, None, None, None))  # 빈 캔들
+            else:
+                rows.append((utc, "KRW-BTC", close, close * 1.001, close * 0.999, close, 1.0))
+        conn.executemany(f"INSERT INTO {TABLE} VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+
+def _closes(rng, count, drift):
+    return 100_000_000 * np.exp(np.cumsum(rng.normal(drift, 0.001, count)))
+
+
+def test_segments_match_window_label_and_refresh_incrementally(tmp_path):
+    rng = np.random.default_rng(7)
+    db_path = str(tmp_path / "market_data.sqlite3")
+    flat = _closes(rng, 300, 0.0)
+    closes = np.concatenate([flat, _closes(rng, 300, 0.0004) * flat[-1] / 100_000_000])  # 횡보 → 상승 추세
+    closes[450] = np.nan
+    _write_candles(db_path, closes)
+
+    config = ScenarioIndexConfig(window_size=60, stride=20)
+    index = CandleScenarioIndex(db_path, config)
+    index.start_background_refresh()
+    assert index.wait_until_ready(timeout=30)
+    assert index.is_ready
+
+    segments = index.find_segments(SimulationScenario.UPTREND)
+    assert segments and all(segment.table_name == TABLE for segment in segments)
+    segment = segments[0]
+
+    # 반환 길이 = 라벨 구간 길이, 첫/마지막 봉 = 라벨 구간 시작/끝
+    df = index.load_segment(segment)
+    assert len(df) == config.window_size
+    assert df.index[0] == pd.Timestamp(segment.start_utc)
+    assert df.index[-1] == pd.Timestamp(segment.end_utc)
+    assert not df[['open', 'high', 'low', 'close', 'volume']].isna().any().any()
+    assert np.isclose(df['close'].iloc[-1] / df['close'].iloc[0] - 1, segment.total_return)
+
+    # 요청 길이가 더 짧으면 구간 끝에서 자름, 더 길어도 라벨 구간을 넘지 않음
+    short = index.load_segment(segment, 25)
+    assert len(short) == 25 and short.index[-1] == df.index[-1]
+    assert len(index.load_segment(segment, 500)) == config.window_size
+
+    # 증분 갱신: 새로 추가된 캔들의 구간만 라벨링
+    total = sum(index.get_regime_counts().values())
+    _write_candles(db_path, _closes(rng, 40, 0.0) * closes[-1] / 100_000_000, offset=len(closes))
+    added = index.refresh()
+    assert added == {TABLE: 2}
+    assert sum(index.get_regime_counts().values()) == total + 2
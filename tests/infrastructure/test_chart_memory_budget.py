@@ -0,0 +1,140 @@
+"""
+ChartViewerResourceManager 메모리 예산 테스트 - 다수 차트 버퍼 바이트 합산, 우선순위 축출, 활성화 시 재적재
+"""
+
+import tracemalloc
+
+import numpy as np
+
+from upbit_auto_trading.application.chart_viewer.chart_viewer_resource_manager import (
+    MB, ChartViewerResourceManager
+)
+from upbit_auto_trading.infrastructure.chart.candle_lod_buffer import CandleLodBuffer
+from upbit_auto_trading.infrastructure.chart_viewer.chart_memory_buffers import (
+    ManagedArrayBuffer, ManagedCandleBuffer
+)
+
+CANDLES = 50_000
+BUDGET = 48 * MB
+
+
+def _synthetic_arrays(count):
+    times = np.arange(count, dtype=np.float64) * 60_000
+    close = 50_000_000 + np.cumsum(np.ones(count))
+    return times, close, close + 10, close - 10, close, np.ones(count)
+
+
+def _open_chart(manager, chart_id, state, reloads):
+    """차트 하나 = 캔들 LOD 버퍼 + 지표 2개 + 호가 스냅샷 이력"""
+    manager.register_chart(chart_id, state)
+    candles = CandleLodBuffer(CANDLES)
+
+    def reload_candles():
+        reloads.append(chart_id)
+        candles.load(*_synthetic_arrays(CANDLES))
+
+    candles.load(*_synthetic_arrays(CANDLES))
+    manager.attach_data(chart_id, "candles", ManagedCandleBuffer(candles, reload_candles, compact_capacity=1_000))
+
+    def indicators():
+        return {"sma20": np.zeros(CANDLES), "rsi14": np.zeros(CANDLES)}
+
+    manager.attach_data(chart_id, "indicators", ManagedArrayBuffer("indicator", indicators(), indicators, 1_000))
+
+    def orderbook():
+        return {"snapshots": np.zeros((2_000, 30, 2))}
+
+    manager.attach_data(chart_id, "orderbook", ManagedArrayBuffer("orderbook", orderbook(), orderbook, 100))
+    return candles
+
+
+def test_dozens_of_charts_stay_within_budget_and_reload_on_activation():
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        manager = ChartViewerResourceManager(memory_budget_bytes=BUDGET)
+        reloads = []
+        states = ["active"] * 4 + ["background"] * 12 + ["minimized"] * 20
+        buffers = {}
+        for i, state in enumerate(states):
+            buffers[f"chart_{i}"] = _open_chart(manager, f"chart_{i}", state, reloads)
+            assert manager.get_resident_bytes() <= BUDGET
+
+        # 바이트 합산이 실제 할당과 일치하고, 전체 할당이 예산 안에 있음
+        traced = tracemalloc.get_traced_memory()[0] - baseline
+        resident = manager.get_resident_bytes()
+        assert resident <= BUDGET
+        assert resident <= traced <= resident + 4 * MB
+    finally:
+        tracemalloc.stop()
+
+    # 우선순위 정책: 최소화 차트가 먼저 전부 해제, 가장 최근 활성 차트는 유지
+    minimized = manager.get_chart_by_state("minimized")
+    assert all(info.data_state == "released" for info in minimized.values())
+    assert all(len(buffers[chart_id]) == 0 for chart_id in minimized)
+    assert manager._chart_resources["chart_3"].data_state == "full"
+    assert len(buffers["chart_3"]) == CANDLES
+
+    # 해제된 차트 활성화 → 재적재 후에도 예산 유지 (다른 차트 축출)
+    manager.update_window_state("chart_30", "active")
+    assert reloads == ["chart_30"]
+    assert len(buffers["chart_30"]) == CANDLES
+    assert manager._chart_resources["chart_30"].data_state == "full"
+    assert manager.get_resident_bytes() <= BUDGET
+
+    stats = manager.get_resource_statistics()
+    assert stats["resident_bytes"] == manager.get_resident_bytes()
+    assert stats["memory_budget_bytes"] == BUDGET
+    assert set(stats["resident_by_kind"]) == {"candles", "indicator", "orderbook"}
+    assert stats["by_state"]["minimized"]["resident_bytes"] < stats["by_state"]["active"]["resident_bytes"]
+    assert stats["evictions"]["releases"] >= 20 and stats["evictions"]["restores"] == 1
+    assert sum(stats["data_states"].values()) == len(states)
+
+
+def test_background_charts_are_compacted_before_released():
+    manager = ChartViewerResourceManager(memory_budget_bytes=BUDGET)
+    reloads = []
+    for i in range(12):
+        _open_chart(manager, f"bg_{i}", "background", reloads)
+    _open_chart(manager, "focus", "active", reloads)
+
+    data_states = {info.chart_id: info.data_state for info in manager._chart_resources.values()}
+    assert data_states["focus"] == "full"
+    assert "compact" in data_states.values()
+    assert manager.get_resident_bytes() <= BUDGET
+
+    # 축소된 백그라운드 차트는 최근 구간을 유지 (다운샘플 형태로 계속 표시 가능)
+    compact_id = next(chart_id for chart_id, state in data_states.items() if state == "compact")
+    candles = manager._chart_data[compact_id]["candles"].buffer
+    assert len(candles) == 1_000 and candles.bar(candles.last_index)[0] == (CANDLES - 1) * 60_000
+
+    manager.unregister_chart(compact_id)
+    assert compact_id not in manager._chart_data
+
+
+def test_compact_keeps_x_coordinates_and_absolute_bucket_alignment():
+    count = CANDLES + 3  # 남는 첫 캔들의 x 가 FANOUT 배수가 아니도록
+    candles = CandleLodBuffer(count)
+    candles.load(*_synthetic_arrays(count))
+    managed = ManagedCandleBuffer(candles, lambda: None, compact_capacity=1_000)
+    before = [candles.bar(i) for i in range(count - 1_000, count)]
+
+    managed.compact()
+    assert (candles.first_index, candles.last_index) == (count - 1_000, count - 1)
+    assert [candles.bar(i) for i in range(count - 1_000, count)] == before
+
+    raw = np.array(before).T
+    for max_bars in (500, 120, 30):
+        lod = candles.lod_view(candles.first_index, candles.last_index, max_bars)
+        assert lod.scale > 1
+        buckets = np.arange(candles.first_index, count) // lod.scale
+        firsts = np.flatnonzero(np.diff(buckets, prepend=-1))
+        np.testing.assert_array_equal(lod.x, np.unique(buckets) * lod.scale + (lod.scale - 1) / 2.0)
+        np.testing.assert_array_equal(lod.open, raw[1, firsts])
+        np.testing.assert_array_equal(lod.high, np.maximum.reduceat(raw[2], firsts))
+        np.testing.assert_array_equal(lod.close, raw[4, np.append(firsts[1:], len(buckets)) - 1])
+        np.testing.assert_array_equal(lod.volume, np.add.reduceat(raw[5], firsts))
+
+    # 축소 후 추가·축출도 같은 좌표계에서 이어짐
+    assert candles.upsert(count * 60_000, 1.0, 2.0, 0.5, 1.5, 3.0)
+    assert (candles.first_index, candles.last_index) == (count - 999, count)
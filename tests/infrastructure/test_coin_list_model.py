@@ -0,0 +1,125 @@
+"""
+CoinListTableModel 테스트 - 프레임 합침 증분 갱신 후 행 순서가 전체 정렬과 동일, 변경 행만 dataChanged,
+즐겨찾기/정렬 모드 변경, 검색 프록시
+"""
+
+import random
+
+from PyQt6.QtTest import QAbstractItemModelTester
+
+from upbit_auto_trading.application.chart_viewer.coin_list_service import CoinInfo
+from upbit_auto_trading.ui.desktop.screens.chart_view.widgets.coin_list_model import (
+    CoinFilterProxyModel, CoinListTableModel
+)
+
+
+def _coin(symbol, name, price, change_rate, volume):
+    return CoinInfo(
+        symbol=symbol, name=name, market="KRW", price=str(price), price_formatted=f"{price:,.0f}",
+        change_rate=f"{change_rate:+.2f}%", change_price="0", volume=str(volume),
+        volume_raw=volume, change_rate_raw=change_rate,
+    )
+
+
+def _markets(rng, count=60):
+    return {f"KRW-C{i:03d}": _coin(f"KRW-C{i:03d}", f"코인{(i * 37) % count:03d}", rng.uniform(10, 1e8),
+                                   rng.uniform(-10, 10), rng.uniform(1e8, 5e11)) for i in range(count)}
+
+
+def _expected_order(model, coins):
+    return [coin.symbol for coin in sorted(coins.values(), key=model._sort_key)]
+
+
+def _symbols(model):
+    return [model.index(row, 0).data(CoinListTableModel.SymbolRole) for row in range(model.rowCount())]
+
+
+def test_incremental_updates_keep_full_sort_order(qasync_app):
+    rng = random.Random(5)
+    coins = _markets(rng)
+    model = CoinListTableModel()
+    tester = QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Warning)
+    model.set_sort_mode("volume")
+    model.set_coins(coins.values())
+    assert _symbols(model) == _expected_order(model, coins)
+
+    for _ in range(30):
+        # 프레임 사이에 같은 심볼이 여러 번 갱신되어도 최신값만 반영
+        for _ in range(40):
+            symbol = rng.choice(list(coins))
+            old = coins[symbol]
+            coins[symbol] = _coin(symbol, old.name, float(old.price) * rng.uniform(0.99, 1.01),
+                                  old.change_rate_raw + rng.uniform(-1, 1), old.volume_raw * rng.uniform(0.5, 2.0))
+            model.enqueue_updates([coins[symbol]])
+        model.flush_pending()
+        assert _symbols(model) == _expected_order(model, coins)
+        assert model.coins() == sorted(coins.values(), key=model._sort_key)
+
+    assert model.stats['updates_received'] == 1200
+    assert model.stats['flushes'] == 30 and model.stats['rows_moved'] > 0
+    assert model.stats['rows_changed'] <= model.stats['updates_received']
+
+    for sort_mode in ("change", "name", "volume"):
+        model.set_sort_mode(sort_mode)
+        assert _symbols(model) == _expected_order(model, coins)
+
+    model.set_favorite("KRW-C042", True)
+    model.set_favorite("KRW-C007", True)
+    assert set(_symbols(model)[:2]) == {"KRW-C042", "KRW-C007"}  # 즐겨찾기 우선
+    assert _symbols(model) == _expected_order(model, coins)
+    del tester
+
+
+def test_only_changed_rows_emit_data_changed(qasync_app):
+    coins = {
+        "KRW-A": _coin("KRW-A", "에이", 1_000, 1.0, 3e11),
+        "KRW-B": _coin("KRW-B", "비", 2_000, 2.0, 2e11),
+        "KRW-C": _coin("KRW-C", "씨", 3_000, 3.0, 1e11),
+    }
+    model = CoinListTableModel()
+    model.set_sort_mode("volume")
+    model.set_coins(coins.values())
+    changes, moves = [], []
+    model.dataChanged.connect(lambda top, bottom, roles: changes.append(
+        (top.row(), bottom.row(), top.column(), bottom.column())))
+    model.rowsMoved.connect(lambda *args: moves.append(args[1]))
+
+    # 같은 값 재수신 → 변경 없음
+    model.enqueue_updates([coins["KRW-B"]])
+    model.flush_pending()
+    assert changes == [] and moves == []
+
+    # 가격만 변경 → 해당 행의 가격 컬럼만
+    model.enqueue_updates([_coin("KRW-B", "비", 2_100, 2.0, 2e11)])
+    model.flush_pending()
+    assert changes == [(1, 1, CoinListTableModel.COL_PRICE, CoinListTableModel.COL_PRICE)] and moves == []
+
+    # 거래대금 역전 → C 행만 맨 위로 이동
+    changes.clear()
+    model.enqueue_updates([_coin("KRW-C", "씨", 3_000, 3.0, 4e11)])
+    model.flush_pending()
+    assert _symbols(model) == ["KRW-C", "KRW-A", "KRW-B"]
+    assert moves == [2]
+    assert changes == [(0, 0, CoinListTableModel.COL_VOLUME, CoinListTableModel.COL_VOLUME)]
+
+    # 목록에 없는 심볼은 무시
+    model.enqueue_updates([_coin("KRW-Z", "제트", 1, 0.0, 9e11)])
+    model.flush_pending()
+    assert model.rowCount() == 3
+
+
+def test_filter_proxy_keeps_favorites_visible(qasync_app):
+    model = CoinListTableModel()
+    model.set_coins([_coin("KRW-BTC", "비트코인", 1e8, 1.0, 1e11), _coin("KRW-ETH", "이더리움", 5e6, 1.0, 1e11),
+                     _coin("KRW-XRP", "리플", 800, 1.0, 1e11)])
+    model.set_favorite("KRW-XRP", True)
+    proxy = CoinFilterProxyModel()
+    proxy.setSourceModel(model)
+
+    proxy.set_search_text("이더")
+    visible = {proxy.index(row, 0).data(CoinListTableModel.SymbolRole) for row in range(proxy.rowCount())}
+    assert visible == {"KRW-ETH", "KRW-XRP"}
+
+    proxy.set_search_text("btc")
+    visible = {proxy.index(row, 0).data(CoinListTableModel.SymbolRole) for row in range(proxy.rowCount())}
+    assert visible == {"KRW-BTC", "KRW-XRP"}
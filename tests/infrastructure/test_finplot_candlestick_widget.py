@@ -0,0 +1,151 @@
+"""
+FinplotCandlestickWidget 테스트 - 히스토리는 작업 스레드에서 적재 후 시그널로 반영 (마지막 요청만),
+메모리 예산 복원도 작업 스레드 적재, 이동평균 오버레이는 버퍼 종가 전체 이동평균과 동일
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from upbit_auto_trading.infrastructure.chart.candle_lod_buffer import CandleLodBuffer
+from upbit_auto_trading.infrastructure.chart_viewer.candle_array_loader import CandleArrays
+from upbit_auto_trading.ui.desktop.screens.chart_view.widgets.finplot_candlestick_widget import (
+    FinplotCandlestickWidget
+)
+
+BASE_MS = 1_735_689_600_000
+
+
+def _arrays(count, base_price, seed=0):
+    rng = np.random.default_rng(seed)
+    closes = base_price + np.cumsum(rng.normal(0, base_price * 0.001, count))
+    opens = np.concatenate(([closes[0]], closes[:-1]))
+    return CandleArrays(
+        time=BASE_MS + 60_000 * np.arange(count, dtype=np.float64),
+        open=opens, high=np.maximum(opens, closes) * 1.001, low=np.minimum(opens, closes) * 0.999,
+        close=closes, volume=rng.uniform(0.1, 5.0, count),
+    )
+
+
+def _rolling_mean(values, period):
+    result = np.full(len(values), np.nan)
+    windows = np.lib.stride_tricks.sliding_window_view(values, period)
+    result[period - 1:] = windows.mean(axis=1)
+    return result
+
+
+def _wait(app, condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    return condition()
+
+
+def test_moving_average_matches_rolling_mean_after_eviction():
+    arrays = _arrays(5_000, 50_000_000.0)
+    buffer = CandleLodBuffer(capacity=3_000)
+    buffer.load(arrays.time, arrays.open, arrays.high, arrays.low, arrays.close, arrays.volume)
+    for i in range(700):  # 용량 초과 추가 → 앞쪽 축출
+        buffer.apply_trade(int(arrays.time[-1]) + 60_000 * (i + 1), 50_000_000.0 + i, 1.0)
+
+    closes = np.array([buffer.bar(i)[4] for i in range(buffer.first_index, buffer.last_index + 1)])
+    for period in (1, 20, 50):
+        expected = _rolling_mean(closes, period)
+        full = buffer.moving_average(period, buffer.first_index, buffer.last_index + 1)
+        np.testing.assert_allclose(full, expected, rtol=1e-12, equal_nan=True)
+        # 부분 구간은 구간 앞쪽 이력까지 포함해 계산
+        begin = buffer.first_index + 1_234
+        part = buffer.moving_average(period, begin, begin + 300)
+        np.testing.assert_allclose(part, expected[1_234:1_534], rtol=1e-12, equal_nan=True)
+
+
+@pytest.fixture
+def widget(qasync_app, monkeypatch):
+    release = threading.Event()
+    loaded_threads = []
+
+    def read_stored_candles(self, symbol, timeframe, limit):
+        loaded_threads.append(threading.current_thread())
+        release.wait(5.0)  # 느린 DB 읽기 흉내
+        base = {"KRW-BTC": 50_000_000.0, "KRW-ETH": 3_000_000.0, "KRW-XRP": 800.0}[symbol]
+        return _arrays(min(limit, 20_000), base, seed=len(symbol))
+
+    monkeypatch.setattr(FinplotCandlestickWidget, "_read_stored_candles", read_stored_candles)
+    chart = FinplotCandlestickWidget(capacity=50_000)
+    chart.resize(1000, 600)
+    chart.show()
+    chart.release = release
+    chart.loaded_threads = loaded_threads
+    yield chart
+    release.set()
+    chart.cleanup()
+    chart.close()
+
+
+def test_history_loads_off_ui_thread_and_only_last_request_applies(qasync_app, widget):
+    loaded = []
+    widget.data_requested.connect(lambda symbol, timeframe, count: loaded.append((symbol, timeframe, count)))
+
+    # 초기 적재 요청 → 작업 스레드가 막혀 있어도 UI 스레드는 진행
+    assert _wait(qasync_app, lambda: widget.loaded_threads)
+    assert len(widget.get_buffer()) == 0
+    widget.apply_trade(50_000_000.0, 1.0, BASE_MS)  # 적재 중 실시간 반영 보류
+    assert len(widget.get_buffer()) == 0
+
+    started = time.perf_counter()
+    widget.set_symbol("KRW-ETH")
+    widget.set_symbol("KRW-XRP")
+    assert time.perf_counter() - started < 0.5
+    assert all(thread is not threading.main_thread() for thread in widget.loaded_threads)
+
+    widget.release.set()
+    assert _wait(qasync_app, lambda: loaded and loaded[-1][0] == "KRW-XRP")
+    qasync_app.processEvents()
+    assert loaded == [("KRW-XRP", "1m", 20_000)]  # 이전 요청 결과는 버림
+    assert widget.get_buffer().bar(widget.get_buffer().last_index)[4] < 10_000
+    assert widget.get_performance_info()['data_source'] == "db"
+
+    # 적재 후 실시간 체결 반영
+    last_time = widget.get_buffer().last_time
+    widget.apply_trade(900.0, 2.0, last_time + 60_000)
+    assert len(widget.get_buffer()) == 20_001
+
+
+def test_managed_buffer_restore_reloads_off_ui_thread(qasync_app, widget):
+    widget.release.set()
+    assert _wait(qasync_app, lambda: len(widget.get_buffer()) == 20_000)
+    managed = widget.create_managed_buffer()
+    managed.release()
+    assert len(widget.get_buffer()) == 0
+
+    widget.release.clear()
+    widget.loaded_threads.clear()
+    started = time.perf_counter()
+    managed.restore()  # 느린 DB 읽기가 끝나기를 기다리지 않음
+    assert time.perf_counter() - started < 0.5
+    assert widget.get_buffer().capacity == 50_000
+    assert _wait(qasync_app, lambda: widget.loaded_threads)
+    assert all(thread is not threading.main_thread() for thread in widget.loaded_threads)
+
+    widget.release.set()
+    assert _wait(qasync_app, lambda: len(widget.get_buffer()) == 20_000)
+
+
+def test_moving_average_overlays_follow_buffer(qasync_app, widget):
+    widget.release.set()
+    assert _wait(qasync_app, lambda: len(widget.get_buffer()) == 20_000)
+    buffer = widget.get_buffer()
+    widget._price_plot.setXRange(buffer.first_index, buffer.last_index, padding=0)  # 전체 보기 → LOD 다운샘플
+    assert _wait(qasync_app, lambda: all(item.last_slice is not None and item.last_slice.scale > 1
+                                         for item in widget._ma_items))
+
+    closes = np.array([buffer.bar(i)[4] for i in range(buffer.first_index, buffer.last_index + 1)])
+    for item in widget._ma_items:
+        lod = item.last_slice
+        sampled = item._sample(lod)
+        last_in_bucket = np.minimum(np.rint(lod.x + (lod.scale - 1) / 2.0).astype(int), buffer.last_index)
+        np.testing.assert_allclose(sampled, _rolling_mean(closes, item.period)[last_in_bucket],
+                                   rtol=1e-12, equal_nan=True)
@@ -0,0 +1,127 @@
+"""
+InMemoryEventBus 테스트 - MRO 디스패치, priority 계층 순서, 계층 내 동시 실행, 이벤트당 1회 처리 완료 표시
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import List, Optional
+
+from upbit_auto_trading.domain.events.base_domain_event import DomainEvent
+from upbit_auto_trading.infrastructure.events.bus.event_bus_interface import EventProcessingResult, IEventStorage
+from upbit_auto_trading.infrastructure.events.bus.in_memory_event_bus import InMemoryEventBus
+
+
+@dataclass(frozen=True)
+class BaseTestEvent(DomainEvent):
+    sequence: int = 0
+
+    @property
+    def event_type(self) -> str:
+        return "BaseTestEvent"
+
+    @property
+    def aggregate_id(self) -> str:
+        return f"test-{self.sequence}"
+
+
+@dataclass(frozen=True)
+class TickTestEvent(BaseTestEvent):
+    pass
+
+
+@dataclass(frozen=True)
+class LateSubtypeEvent(TickTestEvent):
+    """구독 시점에 디스패치 테이블에 없던 하위 타입"""
+    pass
+
+
+class RecordingStorage(IEventStorage):
+    def __init__(self):
+        self.processed: List[tuple] = []
+
+    async def store_event(self, event: DomainEvent) -> str:
+        return event.event_id
+
+    async def get_event(self, event_id: str) -> Optional[DomainEvent]:
+        return None
+
+    async def get_events_by_aggregate(self, aggregate_id: str, aggregate_type: str) -> List[DomainEvent]:
+        return []
+
+    async def get_unprocessed_events(self, limit: int = 100) -> List[DomainEvent]:
+        return []
+
+    async def mark_event_processed(self, event_id: str, result: EventProcessingResult) -> None:
+        self.processed.append((event_id, result))
+
+
+def _recorder(calls, name):
+    async def handler(event):
+        calls.append(name)
+    handler.__name__ = name
+    return handler
+
+
+def test_base_class_subscriptions_fire_in_priority_order(qasync_loop):
+    storage = RecordingStorage()
+    bus = InMemoryEventBus(event_storage=storage)
+    calls = []
+    bus.subscribe(BaseTestEvent, _recorder(calls, "base_p0"), priority=0)
+    bus.subscribe(TickTestEvent, _recorder(calls, "tick_p1"), priority=1)
+    base_late = bus.subscribe(BaseTestEvent, _recorder(calls, "base_p2"), priority=2)
+
+    event = LateSubtypeEvent(sequence=1)
+    qasync_loop.run_until_complete(bus._process_single_event(event, "test"))
+    assert calls == ["base_p0", "tick_p1", "base_p2"]
+
+    # 기반 타입 이벤트에는 하위 타입 구독이 전달되지 않음
+    calls.clear()
+    qasync_loop.run_until_complete(bus._process_single_event(BaseTestEvent(sequence=2), "test"))
+    assert calls == ["base_p0", "base_p2"]
+
+    # 구독 취소 후 디스패치 테이블 재계산 (이미 캐시된 하위 타입 포함)
+    assert bus.unsubscribe(base_late)
+    calls.clear()
+    qasync_loop.run_until_complete(bus._process_single_event(LateSubtypeEvent(sequence=3), "test"))
+    assert calls == ["base_p0", "tick_p1"]
+
+    # 저장소 처리 완료 표시는 이벤트당 1회, 핸들러 결과 집계
+    assert storage.processed[0][0] == event.event_id
+    assert len(storage.processed) == 3
+    first = storage.processed[0][1]
+    assert first.success and first.handler_name == "base_p0,tick_p1,base_p2"
+    stats = bus.get_statistics()
+    assert stats['events_processed'] == 3 and stats['events_failed'] == 0
+
+
+def test_same_priority_handlers_run_concurrently_and_failures_aggregate(qasync_loop):
+    storage = RecordingStorage()
+    bus = InMemoryEventBus(event_storage=storage)
+    ready = asyncio.Event()
+    calls = []
+
+    # 같은 계층: waiter 는 setter 가 실행되어야 끝남 (순차 실행이면 시간 초과)
+    async def waiter(event):
+        await asyncio.wait_for(ready.wait(), timeout=1.0)
+        calls.append("waiter")
+
+    async def setter(event):
+        ready.set()
+        calls.append("setter")
+
+    async def failing(event):
+        raise ValueError("boom")
+
+    bus.subscribe(TickTestEvent, waiter, priority=0)
+    bus.subscribe(BaseTestEvent, setter, priority=0)
+    bus.subscribe(TickTestEvent, failing, priority=1, retry_count=0)
+    bus.subscribe(TickTestEvent, _recorder(calls, "after_failure"), priority=2)
+
+    qasync_loop.run_until_complete(bus._process_single_event(TickTestEvent(sequence=1), "test"))
+
+    assert calls == ["setter", "waiter", "after_failure"]
+    (_, result), = storage.processed
+    assert not result.success
+    assert "failing" in result.error_message and "boom" in result.error_message
+    assert bus.get_statistics()['events_failed'] == 1
+    assert len(bus.get_failed_events()) == 1
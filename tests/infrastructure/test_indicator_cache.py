@@ -0,0 +1,86 @@
+"""
+IndicatorCache 테스트 - Repository 저장(꼬리 추가 / 과거 구간 보강) 후 증분 캐시 결과가 전체 재계산과 동일
+"""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from upbit_auto_trading.infrastructure.database.database_manager import DatabaseManager
+from upbit_auto_trading.infrastructure.market_data.indicator.indicator_cache import IndicatorCache
+from upbit_auto_trading.infrastructure.market_data.indicator.indicator_calculator import get_indicator_function
+from upbit_auto_trading.infrastructure.repositories.sqlite_candle_repository import SqliteCandleRepository
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+INDICATORS = [("SMA", {"period": 20}), ("EMA", {"period": 12}), ("RSI", {"period": 14}),
+              ("BB_UPPER", {"period": 20, "std_dev": 2.0}), ("MACD_SIGNAL", {"fast": 12, "slow": 26, "signal": 9})]
+
+
+@pytest.fixture
+def repository(tmp_path):
+    db_path = tmp_path / "market_data.sqlite3"
+    sqlite3.connect(db_path).close()
+    db_manager = DatabaseManager({"market_data": str(db_path)})
+    yield SqliteCandleRepository(db_manager, indicator_cache=IndicatorCache(db_manager, block_size=64))
+    db_manager.close_all()
+
+
+def _candles(rng, minutes, empty=()):
+    rows = []
+    for minute in minutes:
+        utc = (START + timedelta(minutes=int(minute))).strftime("%Y-%m-%dT%H:%M:%S")
+        price = None if minute in empty else float(np.round(50_000_000 + rng.normal(0, 200_000), -3))
+        rows.append({"candle_date_time_utc": utc, "market": "KRW-BTC", "opening_price": price, "high_price": price,
+                     "low_price": price, "trade_price": price, "timestamp": 0, "candle_acc_trade_volume": 1.0})
+    return rows
+
+
+def _full_recompute(repository, indicator, params):
+    """캔들 테이블 전체 종가(빈 캔들은 직전 종가)로 처음부터 계산"""
+    with repository.db_manager.get_connection("market_data") as conn:
+        closes = np.array([np.nan if row[0] is None else row[0] for row in conn.execute(
+            "SELECT trade_price FROM candles_KRW_BTC_1m ORDER BY candle_date_time_utc")], dtype=np.float64)
+    for i in range(1, len(closes)):
+        if np.isnan(closes[i]):
+            closes[i] = closes[i - 1]
+    values, _ = get_indicator_function(indicator)(closes, params, None)
+    return values
+
+
+def _assert_cached_equals_full(repository):
+    for indicator, params in INDICATORS:
+        timestamps, values = repository.get_indicator_series("KRW-BTC", "1m", indicator, params)
+        expected = _full_recompute(repository, indicator, params)
+        assert len(values) == len(expected) == len(timestamps)
+        np.testing.assert_array_equal(values, expected, err_msg=indicator)
+
+
+def test_incremental_results_equal_full_recompute(qasync_loop, repository):
+    rng = np.random.default_rng(1)
+    cache = repository.indicator_cache
+
+    # 1) 초기 적재 (중간 공백 40~59분, 빈 캔들 1개)
+    initial = [m for m in range(300) if not 40 <= m < 60]
+    qasync_loop.run_until_complete(repository.save_raw_api_data("KRW-BTC", "1m", _candles(rng, initial, {150})))
+    _assert_cached_equals_full(repository)
+
+    # 2) 꼬리 추가: 무효화 없이 새 캔들만 계산
+    computed = cache.get_statistics()["computed_rows"]
+    qasync_loop.run_until_complete(repository.save_raw_api_data("KRW-BTC", "1m", _candles(rng, range(300, 333))))
+    assert cache.get_statistics()["invalidations"] == 0
+    _assert_cached_equals_full(repository)
+    assert cache.get_statistics()["computed_rows"] - computed == 33 * len(INDICATORS)
+
+    # 3) 과거 공백 보강: 보강 시점이 속한 블록부터 재계산
+    qasync_loop.run_until_complete(repository.save_raw_api_data("KRW-BTC", "1m", _candles(rng, range(40, 60))))
+    assert cache.get_statistics()["invalidations"] == len(INDICATORS)
+    _assert_cached_equals_full(repository)
+
+    # 4) 영속 계층: 새 캐시 인스턴스(메모리 비어 있음)도 DB 블록 + 종료 상태로 이어서 계산
+    qasync_loop.run_until_complete(repository.save_raw_api_data("KRW-BTC", "1m", _candles(rng, range(333, 350))))
+    fresh = SqliteCandleRepository(repository.db_manager, indicator_cache=IndicatorCache(repository.db_manager,
+                                                                                         block_size=64))
+    _assert_cached_equals_full(fresh)
+    assert fresh.indicator_cache.get_statistics()["computed_rows"] == 17 * len(INDICATORS)
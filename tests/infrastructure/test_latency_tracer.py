@@ -0,0 +1,92 @@
+"""
+LatencyTracer / PerformanceMonitor 내보내기 테스트 - 로그 버킷 분위수 정확도, 스팬/데코레이터, Prometheus·JSON 파일
+"""
+
+import json
+import random
+
+from upbit_auto_trading.infrastructure.logging.performance.latency_tracer import (
+    BUCKET_COUNT, LatencyHistogram, LatencyTracer
+)
+from upbit_auto_trading.infrastructure.logging.performance.performance_monitor import PerformanceMonitor
+
+
+def _run_coroutine(coroutine):
+    """await 가 없는 코루틴을 이벤트 루프 없이 실행"""
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise AssertionError("코루틴이 일시 중단되었습니다")
+
+
+def test_histogram_quantiles_within_bucket_error():
+    rng = random.Random(3)
+    values = [int(rng.lognormvariate(10, 1.5)) for _ in range(50_000)] + [0, 1, 31, 32, 2 ** 45]
+    histogram = LatencyHistogram("sample")
+    for value in values:
+        histogram.record(value)
+
+    snapshot = histogram.snapshot()
+    ordered = sorted(values)
+    assert snapshot.count == len(values) and len(snapshot.counts) == BUCKET_COUNT
+    assert snapshot.max_ns == 2 ** 45 and snapshot.sum_ns == sum(values)
+    for quantile in (0.5, 0.9, 0.99):
+        exact = ordered[max(1, int(quantile * len(values) + 0.5)) - 1]
+        assert exact <= snapshot.percentile_ns(quantile) <= exact * 1.0625 + 1
+
+
+def test_spans_and_decorators_record_only_when_enabled():
+    tracer = LatencyTracer()
+
+    @tracer.traced("sync.op")
+    def work(x):
+        return x * 2
+
+    @tracer.traced()
+    async def async_work(x):
+        return x + 1
+
+    with tracer.span("block"):
+        pass
+    assert work(2) == 4 and _run_coroutine(async_work(1)) == 2
+    assert tracer.snapshots() == {}
+
+    tracer.enable()
+    for _ in range(3):
+        with tracer.span("block"):
+            pass
+        work(1)
+        _run_coroutine(async_work(1))
+    tracer.record_seconds("rest.round_trip", 0.25)
+
+    snapshots = tracer.snapshots()
+    assert {name: s.count for name, s in snapshots.items()} == {
+        "block": 3, "sync.op": 3, async_work.__qualname__: 3, "rest.round_trip": 1}
+    assert abs(snapshots["rest.round_trip"].percentile_ns(0.5) - 250_000_000) <= 250_000_000 * 0.0625
+
+
+def test_monitor_exports_prometheus_and_rolling_json(tmp_path):
+    tracer = LatencyTracer(enabled=True)
+    monitor = PerformanceMonitor(latency_tracer=tracer, metrics_export_dir=tmp_path, summary_windows=2)
+    for value in (1_000, 2_000, 3_000):
+        tracer.histogram("db.write").record(value)
+    monitor.export_metrics()
+
+    tracer.histogram("db.write").record(40_000)
+    tracer.histogram('ws "decode"').record(500)
+    paths = monitor.export_metrics()
+    monitor.export_metrics()
+
+    prometheus = paths["prometheus"].read_text(encoding="utf-8")
+    assert "# TYPE upbit_operation_latency_seconds summary" in prometheus
+    assert 'upbit_operation_latency_seconds_count{operation="db.write"} 4' in prometheus
+    assert 'upbit_operation_latency_seconds{operation="ws \\"decode\\"",quantile="0.99"}' in prometheus
+    assert 'upbit_operation_latency_max_seconds{operation="db.write"} 4e-05' in prometheus
+
+    summary = json.loads(paths["json"].read_text(encoding="utf-8"))
+    assert summary["cumulative"]["db.write"]["count"] == 4
+    assert len(summary["windows"]) == 2                      # 최근 2개 구간만 유지
+    assert summary["windows"][0]["operations"]["db.write"]["count"] == 1
+    assert summary["windows"][1]["operations"] == {}
+    assert not list(tmp_path.glob("*.tmp"))
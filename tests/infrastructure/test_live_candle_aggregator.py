@@ -0,0 +1,185 @@
+"""
+LiveCandleAggregator 테스트 - 버킷 경계, 빈 봉(EmptyCandleDetector 호환), 배치 upsert 저장,
+WebSocketManager 연결 끊김 시 끊김 구간은 REST 백필에 맡김, 종료 시 최종 저장
+"""
+
+import asyncio
+import sqlite3
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from upbit_auto_trading.infrastructure.database.database_manager import DatabaseManager
+from upbit_auto_trading.infrastructure.external_apis.upbit.websocket.core.websocket_manager import WebSocketManager
+from upbit_auto_trading.infrastructure.external_apis.upbit.websocket.core.websocket_types import (
+    ConnectionState, TradeEvent, WebSocketType
+)
+from upbit_auto_trading.infrastructure.market_data.candle.empty_candle_detector import EmptyCandleDetector
+from upbit_auto_trading.infrastructure.market_data.candle.live_candle_aggregator import LiveCandleAggregator
+from upbit_auto_trading.infrastructure.repositories.sqlite_candle_repository import SqliteCandleRepository
+
+BASE_MS = int(datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+
+
+@pytest.fixture
+def repository(tmp_path):
+    db_path = tmp_path / "market_data.sqlite3"
+    sqlite3.connect(db_path).close()
+    db_manager = DatabaseManager({"market_data": str(db_path)})
+    yield SqliteCandleRepository(db_manager)
+    db_manager.close_all()
+
+
+def _rows(repository, table):
+    with repository.db_manager.get_connection("market_data") as conn:
+        return [tuple(row) for row in conn.execute(
+            f"SELECT candle_date_time_utc, opening_price, high_price, low_price, trade_price, "
+            f"candle_acc_trade_volume, empty_copy_from_utc FROM {table} ORDER BY candle_date_time_utc"
+        )]
+
+
+def test_bucket_boundaries_and_ohlcv(qasync_loop, repository):
+    aggregator = LiveCandleAggregator(repository, timeframes=('1s', '1m'))
+    aggregator.on_trade('KRW-BTC', BASE_MS - 1, 99.0, 1.0, sequential_id=1)      # 시작 부분 봉 (저장 안 함)
+    aggregator.on_trade('KRW-BTC', BASE_MS, 100.0, 1.0, sequential_id=2)
+    aggregator.on_trade('KRW-BTC', BASE_MS + 400, 105.0, 2.0, sequential_id=3)
+    aggregator.on_trade('KRW-BTC', BASE_MS + 400, 105.0, 2.0, sequential_id=3)  # 재전송 중복
+    aggregator.on_trade('KRW-BTC', BASE_MS + 999, 98.0, 1.0, sequential_id=4)
+    aggregator.on_trade('KRW-BTC', BASE_MS + 1000, 101.0, 1.0, sequential_id=5)  # 다음 1초 버킷
+    aggregator.on_trade('KRW-BTC', BASE_MS + 60_000, 102.0, 1.0, sequential_id=6)  # 다음 1분 버킷
+
+    assert aggregator.stats.duplicate_trades == 1
+    assert aggregator.get_open_bar('KRW-BTC', '1m')['candle_date_time_utc'] == '2025-01-01T00:01:00'
+
+    qasync_loop.run_until_complete(aggregator.flush(now_ms=BASE_MS + 60_500))
+
+    one_second = _rows(repository, 'candles_KRW_BTC_1s')
+    assert one_second[0] == ('2025-01-01T00:00:00', 100.0, 105.0, 98.0, 98.0, 4.0, None)
+    assert one_second[1] == ('2025-01-01T00:00:01', 101.0, 101.0, 101.0, 101.0, 1.0, None)
+    # 00:00:02 ~ 00:00:59 무체결 → 빈 봉 58개, 1분 봉은 00:00 한 개 (23:59 는 부분 봉)
+    assert len(one_second) == 60
+    assert _rows(repository, 'candles_KRW_BTC_1m') == [
+        ('2025-01-01T00:00:00', 100.0, 105.0, 98.0, 101.0, 5.0, None)
+    ]
+    assert aggregator.stats.partial_bars_dropped == 2
+
+
+def test_empty_bars_match_empty_candle_detector(qasync_loop, repository):
+    aggregator = LiveCandleAggregator(repository, timeframes=('1m',))
+    trade_minutes = [0, 1, 4, 5, 9, 10]
+    for minute in trade_minutes:
+        aggregator.on_trade('KRW-ETH', BASE_MS + minute * 60_000 + 5_000, 10.0 + minute, 1.0)
+    qasync_loop.run_until_complete(aggregator.flush(now_ms=BASE_MS + 12 * 60_000))
+
+    stored = {row[0]: row for row in _rows(repository, 'candles_KRW_ETH_1m')}
+    real = sorted((row for row in stored.values() if row[6] is None), reverse=True)
+
+    detector = EmptyCandleDetector('KRW-ETH', '1m')
+    filled = detector.detect_and_fill_gaps([
+        {'candle_date_time_utc': row[0], 'market': 'KRW-ETH'} for row in real
+    ])
+    expected_empty = {c['candle_date_time_utc']: c['empty_copy_from_utc'] for c in filled if 'empty_copy_from_utc' in c}
+
+    assert {utc: row[6] for utc, row in stored.items() if row[6] is not None} == expected_empty
+    assert expected_empty['2025-01-01T00:03:00'] == '2025-01-01T00:01:00'
+
+
+def test_closed_bar_replaces_stored_empty_candle_but_empty_keeps_real(qasync_loop, repository):
+    existing = [
+        {'market': 'KRW-XRP', 'candle_date_time_utc': '2025-01-01T00:01:00', 'opening_price': None,
+         'high_price': None, 'low_price': None, 'trade_price': None, 'timestamp': BASE_MS + 60_000,
+         'empty_copy_from_utc': '2025-01-01T00:00:00'},
+        {'market': 'KRW-XRP', 'candle_date_time_utc': '2025-01-01T00:03:00', 'opening_price': 7.0,
+         'high_price': 7.0, 'low_price': 7.0, 'trade_price': 7.0, 'timestamp': BASE_MS + 180_000},
+    ]
+    qasync_loop.run_until_complete(repository.save_raw_api_data('KRW-XRP', '1m', existing))
+
+    aggregator = LiveCandleAggregator(repository, timeframes=('1m',))
+    for minute in (0, 1, 4):
+        aggregator.on_trade('KRW-XRP', BASE_MS + minute * 60_000, 1.0 + minute, 1.0)
+    qasync_loop.run_until_complete(aggregator.flush(now_ms=BASE_MS + 5 * 60_000 + 2_000))
+
+    rows = {row[0]: row for row in _rows(repository, 'candles_KRW_XRP_1m')}
+    assert rows['2025-01-01T00:01:00'][1:6] == (2.0, 2.0, 2.0, 2.0, 1.0)   # 빈 캔들 → 실제 봉으로 대체
+    assert rows['2025-01-01T00:01:00'][6] is None
+    assert rows['2025-01-01T00:02:00'][6] == '2025-01-01T00:01:00'          # 새 빈 봉
+    assert rows['2025-01-01T00:03:00'][4] == 7.0                            # 기존 실제 봉 유지
+    assert rows['2025-01-01T00:04:00'][4] == 5.0
+    assert '2025-01-01T00:00:00' not in rows                                # 시작 부분 봉은 저장 안 함
+
+
+class _FakeWebSocketClient:
+    """구독 콜백/연결 상태 리스너만 보관하는 WebSocketClient 대역"""
+
+    def __init__(self):
+        self.trade = None
+        self.connection_listeners = []
+        self.cleaned_up = False
+
+    async def add_connection_listener(self, callback):
+        self.connection_listeners.append(callback)
+
+    async def subscribe_trade(self, symbols, callback, stream_preference="both"):
+        self.trade = (list(symbols), callback, stream_preference)
+        return True
+
+    async def cleanup(self):
+        self.cleaned_up = True
+
+
+def _trade(symbol, price, trade_ms, sequential_id):
+    return TradeEvent(symbol=symbol, trade_price=Decimal(str(price)), trade_volume=Decimal("1"), ask_bid="BID",
+                      trade_timestamp=trade_ms, sequential_id=sequential_id)
+
+
+def test_manager_disconnect_leaves_outage_to_rest_and_stop_flushes(qasync_loop, repository):
+    aggregator = LiveCandleAggregator(repository, timeframes=('1m',))
+    client = _FakeWebSocketClient()
+    created = []
+
+    def task_factory(coro, name=None):
+        created.append(name)
+        return asyncio.ensure_future(coro)
+
+    async def scenario():
+        await aggregator.start(task_factory)
+        assert await aggregator.subscribe(['KRW-ETH'], client=client)
+        symbols, on_trade, preference = client.trade
+        assert symbols == ['KRW-ETH'] and preference == 'realtime_only'
+
+        for minute in (0, 1, 2):
+            on_trade(_trade('KRW-ETH', 10 + minute, BASE_MS + minute * 60_000 + 500, minute))
+        on_trade(_trade('KRW-ETH', 12, BASE_MS + 2 * 60_000 + 500, 2))  # 재전송 중복
+
+        # 매니저 내부 재연결: 02분 봉은 미완결 → 버림, 끊김 구간(02~04분)은 빈 봉도 만들지 않음
+        for listener in client.connection_listeners:
+            listener(WebSocketType.PRIVATE, ConnectionState.DISCONNECTED)  # Private 끊김은 무관
+            listener(WebSocketType.PUBLIC, ConnectionState.DISCONNECTED)
+            listener(WebSocketType.PUBLIC, ConnectionState.CONNECTED)
+        for minute in (5, 6, 7):
+            on_trade(_trade('KRW-ETH', 10 + minute, BASE_MS + minute * 60_000 + 500, minute))
+        on_trade(_trade('KRW-ETH', 18, BASE_MS + 8 * 60_000 + 500, 8))
+        await aggregator.stop()  # 마감된 07분 봉까지 최종 저장
+
+    qasync_loop.run_until_complete(scenario())
+    assert created == ['live-candle-flush'] and client.cleaned_up
+
+    rows = {row[0]: row for row in _rows(repository, 'candles_KRW_ETH_1m')}
+    # 00분, 05분은 부분 봉, 08분은 종료 시점 미완결 봉
+    assert sorted(rows) == ['2025-01-01T00:01:00', '2025-01-01T00:06:00', '2025-01-01T00:07:00']
+    assert rows['2025-01-01T00:01:00'][1:6] == (11.0, 11.0, 11.0, 11.0, 1.0)
+    assert aggregator.stats.duplicate_trades == 1
+
+
+def test_websocket_manager_notifies_connection_state_changes():
+    assert WebSocketManager._instance is None
+    manager = WebSocketManager()
+    changes = []
+    manager.add_connection_listener(lambda connection_type, state: changes.append((connection_type, state)))
+
+    manager._set_connection_state(WebSocketType.PUBLIC, ConnectionState.CONNECTED)
+    manager._set_connection_state(WebSocketType.PUBLIC, ConnectionState.CONNECTED)  # 같은 상태는 통지 안 함
+    manager._set_connection_state(WebSocketType.PUBLIC, ConnectionState.DISCONNECTED)
+    assert changes == [(WebSocketType.PUBLIC, ConnectionState.CONNECTED),
+                       (WebSocketType.PUBLIC, ConnectionState.DISCONNECTED)]
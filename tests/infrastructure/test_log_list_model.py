@@ -0,0 +1,95 @@
+"""
+LogListModel 테스트 - 링 축출/추가/필터 변경(인덱스 후보, 좁혀지는 필터, 결과 캐시, 프레임 분할) 후
+표시 행이 보존 라인 전체를 직접 거른 결과와 동일
+"""
+
+import random
+
+from upbit_auto_trading.infrastructure.logging.live.indexed_log_store import LOG_LEVELS, LogFilter
+from upbit_auto_trading.ui.widgets.logging.log_list_model import LogListModel
+
+COMPONENTS = ["OrderService", "WebSocketClient", "ChartView", "RateLimiter"]
+WORDS = ["reconnect", "timeout", "filled", "candle", "retry"]
+
+
+def _feed(model, rng, count):
+    for _ in range(count):
+        level = rng.choices(LOG_LEVELS, weights=[30, 50, 12, 6, 2])[0]
+        component = rng.choice(COMPONENTS)
+        message = f"{rng.choice(WORDS)} {rng.randint(0, 999)}"
+        model.enqueue(f"{level} {component} {message}", level, component, message)
+    model.process_frame()
+
+
+def _expected(model, log_filter):
+    store = model.store
+    return [store.line(seq) for seq in range(store.first_seq, store.last_seq + 1)
+            if (log_filter.levels is None or store.level(seq) in log_filter.levels)
+            and log_filter.component in store.component(seq).lower()
+            and log_filter.search_text in store.line(seq).split(" ", 2)[2].lower()]
+
+
+def _rows(model):
+    return [model.index(row, 0).data() for row in range(model.rowCount())]
+
+
+def _finish(model):
+    frames = 0
+    while model.is_filtering:
+        model.process_frame()
+        frames += 1
+    return frames
+
+
+def test_rows_match_full_filter_through_appends_and_eviction(qasync_app):
+    rng = random.Random(3)
+    model = LogListModel(capacity=2_000, frame_budget_ms=1_000.0)
+
+    _feed(model, rng, 1_500)
+    assert _rows(model) == _expected(model, LogFilter())
+
+    # 축출 포함 추가 (필터 없음)
+    _feed(model, rng, 1_200)
+    assert len(model.store) == model.rowCount() == 2_000
+    assert model.visible_lines() == _expected(model, LogFilter())
+
+    filters = [
+        LogFilter.create(levels=["WARNING", "ERROR", "CRITICAL"]),
+        LogFilter.create(levels=["WARNING", "ERROR", "CRITICAL"], search_text="timeout"),  # 좁혀지는 필터
+        LogFilter.create(component="order"),
+        LogFilter.create(component="order", search_text="re"),
+    ]
+    for log_filter in filters:
+        model.set_filter(log_filter)
+        assert not model.is_filtering
+        assert _rows(model) == _expected(model, log_filter)
+        _feed(model, rng, 700)  # 필터 적용 중 추가 + 축출
+        assert _rows(model) == _expected(model, log_filter)
+
+    # 이전 결과 캐시 재사용: 그 사이 추가/축출분 보정
+    model.set_filter(filters[0])
+    assert _rows(model) == _expected(model, filters[0])
+
+    model.set_filter(LogFilter.create())
+    assert _rows(model) == _expected(model, LogFilter())
+
+
+def test_filter_job_is_sliced_across_frames(qasync_app):
+    rng = random.Random(11)
+    model = LogListModel(capacity=50_000, frame_budget_ms=0.0)
+    model.SCAN_CHUNK = 1_000
+    _feed(model, rng, 20_000)
+
+    finished = []
+    model.filter_finished.connect(lambda: finished.append(True))
+    log_filter = LogFilter.create(levels=["INFO", "DEBUG"], search_text="candle")
+    model.set_filter(log_filter)
+    assert model.is_filtering and not finished
+
+    _feed(model, rng, 500)  # 작업 중 도착한 라인은 완료 시 반영
+    assert _finish(model) > 1
+    assert finished == [True]
+    assert _rows(model) == _expected(model, log_filter)
+
+    model.clear()
+    assert model.rowCount() == 0 and len(model.store) == 0
@@ -0,0 +1,84 @@
+"""
+LogQueuePipeline 테스트 - 포맷 인자 오류는 handleError로 보고, 정상 레코드는 배치 기록, 과부하 시 드롭/샘플링
+"""
+
+import io
+import logging
+
+from upbit_auto_trading.infrastructure.logging.performance.log_queue_pipeline import (
+    LogQueuePipeline, QueuedLogHandler
+)
+
+
+def _pipeline(**kwargs):
+    stream = io.StringIO()
+    target = logging.StreamHandler(stream)
+    target.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    return LogQueuePipeline({'main': target}, **kwargs), target, stream
+
+
+def _logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    return logger
+
+
+def test_bad_format_args_reported_via_handle_error(monkeypatch):
+    pipeline, _, stream = _pipeline()
+    handler = QueuedLogHandler(pipeline, level=logging.DEBUG)
+    errors = []
+    monkeypatch.setattr(handler, "handleError", errors.append)
+    logger = _logger("test.log_queue_pipeline.bad_args", handler)
+
+    logger.info("값 %d", "not-a-number")   # 호출 코드로 예외가 전파되지 않음
+    logger.info("인자 %s %s", "only-one")
+    logger.warning("정상 %s", "ok")
+    pipeline.shutdown()
+
+    assert [record.msg for record in errors] == ["값 %d", "인자 %s %s"]
+    assert pipeline.stats['enqueued'] == 1
+    assert stream.getvalue() == "WARNING 정상 ok\n"
+
+
+def test_writer_format_failure_skips_only_that_record(monkeypatch):
+    pipeline, target, stream = _pipeline()
+    errors = []
+    monkeypatch.setattr(target, "handleError", errors.append)
+
+    class BrokenMessage:
+        def __str__(self):
+            raise RuntimeError("broken")
+
+    logger = _logger("test.log_queue_pipeline.writer", QueuedLogHandler(pipeline, level=logging.DEBUG))
+    logger.info("앞")
+    logger.info(BrokenMessage())
+    logger.info("뒤")
+    pipeline.shutdown()
+
+    assert len(errors) == 1
+    assert stream.getvalue() == "INFO 앞\nINFO 뒤\n"
+    assert pipeline.stats['write_errors'] == 0
+
+
+def test_overload_samples_debug_and_drops_below_error():
+    pipeline, _, stream = _pipeline(queue_size=10, overload_ratio=0.5, debug_sample_every=2)
+    logger = _logger("test.log_queue_pipeline.overload", QueuedLogHandler(pipeline, level=logging.DEBUG))
+
+    for i in range(5):
+        logger.info("채움 %d", i)        # writer 미시작: 큐에 그대로 쌓임
+    for i in range(4):
+        logger.debug("디버그 %d", i)     # 과부하 구간: 2건 중 1건만 적재
+    for i in range(5, 8):
+        logger.info("채움 %d", i)        # 큐 깊이 10 = queue_size
+    logger.info("드롭")                  # 큐 가득 참 → ERROR 미만 드롭
+    logger.error("오류")                 # ERROR 이상은 유지
+    pipeline.shutdown()
+
+    assert pipeline.stats['sampled_out_debug'] == 2
+    assert pipeline.stats['dropped_overflow'] == 1
+    lines = stream.getvalue().splitlines()
+    assert "INFO 드롭" not in lines
+    assert lines[-2] == "ERROR 오류"
+    assert lines[-1].startswith("WARNING 로그 큐 과부하 요약: 오버플로우 드롭 1건, DEBUG 샘플링 제외 2건")
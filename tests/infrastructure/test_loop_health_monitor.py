@@ -0,0 +1,121 @@
+"""
+LoopHealthMonitor 테스트 - 블로킹 호출을 주입해 태스크 이름·소유자·스택으로 귀속되는지 확인,
+AppKernel 종료 훅은 태스크 취소 전에 등록 역순으로 실행
+"""
+
+import asyncio
+import json
+import logging
+import time
+
+from upbit_auto_trading.infrastructure.runtime.app_kernel import AppKernel, KernelConfig, TaskManager
+from upbit_auto_trading.infrastructure.runtime.loop_health_monitor import LoopHealthMonitor
+
+
+def _blocking_sqlite_like_call():
+    time.sleep(0.3)
+
+
+def _blocking_callback():
+    time.sleep(0.15)
+
+
+def test_blocking_task_step_is_attributed_to_task_and_owner(qasync_loop, tmp_path):
+    task_manager = TaskManager(logging.getLogger(__name__))
+    monitor = LoopHealthMonitor(qasync_loop, task_manager=task_manager,
+                                slow_callback_threshold=0.1, lag_interval=0.02, dump_dir=tmp_path)
+
+    async def blocker():
+        await asyncio.sleep(0)
+        _blocking_sqlite_like_call()
+
+    async def scenario():
+        monitor.start()
+        try:
+            await asyncio.sleep(0.1)                     # 블로킹 전 지연 샘플 확보
+            task = task_manager.create_task(blocker(), name="blocker", component="TestOwner")
+            assert task_manager.get_task_counts() == {"TestOwner": 1}
+            await task
+            qasync_loop.call_soon(_blocking_callback)
+            await asyncio.sleep(0.1)
+        finally:
+            monitor.stop()
+
+    qasync_loop.run_until_complete(scenario())
+    assert asyncio.Handle._run.__name__ == "_run"       # 패치 원복
+
+    task_events = [e for e in monitor.slow_events if e.kind == "task_step"]
+    assert len(task_events) == 1
+    event = task_events[0]
+    assert event.task_name == "TestOwner:blocker" and event.owner == "TestOwner"
+    assert event.duration_ms >= 300
+    assert event.stack_source == "sampled"
+    assert any("_blocking_sqlite_like_call" in line for line in event.stack)
+
+    callback_events = [e for e in monitor.slow_events if e.kind == "callback"]
+    assert [e.callback for e in callback_events] == ["_blocking_callback"]
+    assert callback_events[0].task_name is None and callback_events[0].owner is None
+
+    summary = monitor.get_summary()
+    assert summary["slow_callbacks"]["total"] == 2
+    assert summary["lag_ms"]["samples"] > 0 and summary["lag_ms"]["max"] >= 100
+    assert summary["peak_task_counts"]["TestOwner"] == 1
+    assert "TestOwner:blocker" in monitor.format_summary()
+
+    report = json.loads(monitor.dump().read_text(encoding="utf-8"))
+    assert report["slow_callbacks"][0]["task_name"] == "TestOwner:blocker"
+    assert report["lag_samples"]
+
+
+def test_fast_callbacks_are_not_recorded(qasync_loop, tmp_path):
+    monitor = LoopHealthMonitor(qasync_loop, slow_callback_threshold=0.1, lag_interval=0.01, dump_dir=tmp_path)
+
+    async def scenario():
+        monitor.start()
+        try:
+            for _ in range(50):
+                await asyncio.sleep(0)
+            await asyncio.sleep(0.05)
+        finally:
+            monitor.stop()
+
+    qasync_loop.run_until_complete(scenario())
+    assert monitor.total_slow_callbacks == 0 and not monitor.slow_events
+    assert monitor.dump_if_stalled() is None and not list(tmp_path.iterdir())   # 정상 세션은 덤프 없음
+
+
+def test_dump_keeps_only_latest_files(tmp_path):
+    monitor = LoopHealthMonitor(dump_dir=tmp_path, max_dumps=3)
+    (tmp_path / "loop_health_20000101_000000_000000.json").write_text("{}")   # 이전 세션 덤프
+    (tmp_path / "other.json").write_text("{}")                                # 자동 이름이 아닌 파일은 유지
+
+    monitor.total_slow_callbacks = 1
+    paths = [monitor.dump_if_stalled() for _ in range(4)]
+
+    assert sorted(tmp_path.glob("loop_health_*.json")) == sorted(paths[-3:])
+    assert (tmp_path / "other.json").exists()
+
+
+def test_kernel_shutdown_hooks_run_before_tasks_are_cancelled(qasync_loop):
+    kernel = AppKernel(KernelConfig(enable_loop_monitor=False, shutdown_timeout=1.0))
+    kernel.task_manager = TaskManager(logging.getLogger(__name__))
+    calls = []
+
+    async def scenario():
+        flush_task = kernel.create_task(asyncio.sleep(3600), name="flush", component="ChartViewScreen")
+
+        def hook(name):
+            async def run():
+                calls.append((name, flush_task.done()))
+            return run
+
+        kernel.register_shutdown_hook("first", hook("first"))
+        kernel.register_shutdown_hook("second", hook("second"))
+        kernel.register_shutdown_hook("removed", hook("removed"))
+        kernel.unregister_shutdown_hook("removed")
+        await kernel.shutdown()
+        return flush_task
+
+    flush_task = qasync_loop.run_until_complete(scenario())
+    assert calls == [("second", False), ("first", False)]
+    assert flush_task.cancelled()
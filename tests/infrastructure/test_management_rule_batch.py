@@ -0,0 +1,90 @@
+"""
+ManagementRule 배치 경로 테스트 - 모든 관리 타입에서 execute() 를 포지션 순서대로 호출한 결과와 동일
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from upbit_auto_trading.domain.entities import ManagementRule, ManagementType, PositionArrays, PositionState
+
+NOW = datetime(2025, 6, 1, 12, 0, 0)
+
+PARAMETERS = {
+    ManagementType.PYRAMID_BUYING: {"trigger_drop_rate": 3.0, "max_additions": 4, "absolute_stop_loss": 25.0},
+    ManagementType.SCALE_IN_BUYING: {"trigger_profit_rate": 2.0, "max_additions": 3, "profit_target": 30.0},
+    ManagementType.TRAILING_STOP: {"trail_distance": 5.0, "activation_profit": 2.0},
+    ManagementType.FIXED_STOP_TAKE: {"stop_loss_rate": 5.0, "take_profit_rate": 10.0},
+    ManagementType.TIME_BASED_EXIT: {"max_holding_hours": 24},
+    ManagementType.PARTIAL_TAKE_PROFIT: {"profit_levels": [5.0, 10.0, 20.0], "sell_ratios": [0.3, 0.3, 0.4],
+                                         "executed_levels": {1}},
+}
+
+
+def _positions(seed, size=400):
+    """정수 가격 포지션 (수익률 -40% ~ +40%, 보유 시간은 기준 24시간에서 떨어진 값)"""
+    rng = np.random.default_rng(seed)
+    positions = []
+    for i in range(size):
+        avg_price = int(rng.integers(1_000, 100_000))
+        current_price = max(1, int(avg_price * rng.uniform(0.6, 1.4)))
+        highest_price = None if i % 4 == 0 else max(current_price, int(current_price * rng.uniform(1.0, 1.2)))
+        hours = float(rng.choice([rng.uniform(0.5, 23.0), rng.uniform(25.0, 200.0)]))
+        positions.append(PositionState(
+            symbol=f"KRW-C{i:03d}",
+            avg_price=Decimal(avg_price),
+            quantity=Decimal("0.5"),
+            current_price=Decimal(current_price),
+            entry_time=NOW - timedelta(hours=hours),
+            highest_price=None if highest_price is None else Decimal(highest_price),
+        ))
+    return positions
+
+
+@pytest.mark.parametrize("management_type", list(ManagementType))
+def test_batch_matches_sequential_execute(management_type, monkeypatch):
+    positions = _positions(list(ManagementType).index(management_type))
+    scalar_rule = ManagementRule("scalar", management_type, dict(PARAMETERS[management_type]))
+    batch_rule = ManagementRule("batch", management_type, dict(PARAMETERS[management_type]))
+
+    # execute() 의 보유 시간 계산(datetime.now())을 배치의 now 와 같은 시각으로 고정
+    monkeypatch.setattr(PositionState, "get_holding_time", lambda position: NOW - position.entry_time)
+    expected = [scalar_rule.execute(position) for position in positions]
+    batch = batch_rule.execute_batch(PositionArrays.from_positions(positions), now=NOW)
+
+    assert len(batch) == len(positions)
+    assert 0 < int(batch.executed_mask.sum()) < len(positions)
+    for index, scalar in enumerate(expected):
+        result = batch.to_execution_result(index)
+        assert (result.signal, result.executed) == (scalar.signal, scalar.executed), index
+        if not scalar.executed:
+            continue
+        assert set(result.additional_data) == set(scalar.additional_data)
+        for key, value in scalar.additional_data.items():
+            assert result.additional_data[key] == pytest.approx(value, rel=1e-9)  # 보유 시간: epoch 초 float 오차
+        if management_type != ManagementType.TRAILING_STOP:  # 트레일링 사유는 Decimal/float 표기가 다름
+            assert result.reason == scalar.reason
+
+    assert batch_rule.execution_count == scalar_rule.execution_count
+    executed_events = [e for e in batch_rule.get_domain_events() if e["event_type"] == "management_rule_executed"]
+    assert [e["event_data"]["position_symbol"] for e in executed_events] == [
+        e["event_data"]["position_symbol"] for e in scalar_rule.get_domain_events()
+        if e["event_type"] == "management_rule_executed"]
+
+
+def test_batch_after_price_updates_and_inactive_rule():
+    positions = _positions(42, size=50)
+    arrays = PositionArrays.from_positions(positions)
+    new_prices = {position.symbol: float(position.avg_price) * 0.85 for position in positions[::2]}
+    arrays.update_prices(new_prices)
+
+    rule = ManagementRule("fixed", ManagementType.FIXED_STOP_TAKE, dict(PARAMETERS[ManagementType.FIXED_STOP_TAKE]))
+    batch = rule.execute_batch(arrays, now=NOW)
+    for index in range(len(positions)):
+        scalar = rule.execute(arrays.to_position_state(index))
+        assert batch.get_signal(index) == scalar.signal
+
+    rule.deactivate()
+    assert not rule.execute_batch(arrays, now=NOW).executed_mask.any()
@@ -0,0 +1,68 @@
+"""
+NormalizationService 일괄 경로 테스트 - 모든 NormalizationMethod 에서 스칼라 경로와 원소별 결과 동일
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from upbit_auto_trading.domain.services.normalization_service import (
+    NormalizationMethod, NormalizationParameters, NormalizationService
+)
+
+COMBINATIONS = [("price_comparable", "percentage_comparable"), ("percentage_comparable", "zero_centered"),
+                ("volume_comparable", "percentage_comparable"), ("zero_centered", "zero_centered")]
+
+
+def _values(seed, size=300):
+    rng = np.random.default_rng(seed)
+    values = np.concatenate([rng.normal(0, 1e8, size), rng.uniform(-2, 120, size), [np.nan, np.inf, -np.inf, -0.0]])
+    return values, rng.permutation(values)
+
+
+@pytest.mark.parametrize("method", list(NormalizationMethod))
+@pytest.mark.parametrize("group1, group2", COMBINATIONS)
+def test_batch_matches_scalar_path(method, group1, group2):
+    service = NormalizationService()
+    values1, values2 = _values(list(NormalizationMethod).index(method) * 10 + COMBINATIONS.index((group1, group2)))
+
+    batch = service.normalize_for_comparison_batch(values1, group1, values2, group2, method)
+    for i in range(len(values1)):
+        scalar = service.normalize_for_comparison(float(values1[i]), group1, float(values2[i]), group2, method)
+        element = batch.result_at(i)
+        np.testing.assert_array_equal([element.normalized_value1, element.normalized_value2],
+                                      [scalar.normalized_value1, scalar.normalized_value2])
+        assert (element.confidence_score, element.is_reliable, element.warning_message) == (
+            scalar.confidence_score, scalar.is_reliable, scalar.warning_message)
+
+    params = batch.normalization_params2
+    if params is not None:
+        restored = service.denormalize_array(batch.normalized_values2, group2, method, params)
+        expected = [service.denormalize_value(float(v), group2, method, params) for v in batch.normalized_values2]
+        np.testing.assert_array_equal(restored, expected)
+
+
+def test_batch_edge_cases_follow_scalar_rules():
+    service = NormalizationService()
+    with pytest.raises(ValueError):
+        service.normalize_for_comparison_batch([1.0], "price_comparable", [2.0], "volume_comparable")
+
+    constant = {"price_comparable": NormalizationParameters("price_comparable", NormalizationMethod.MINMAX,
+                                                            min_value=5.0, max_value=5.0, sample_size=10)}
+    batch = service.normalize_for_comparison_batch([1.0, 9.0], "price_comparable", 50.0, "percentage_comparable",
+                                                   custom_params=constant)
+    scalar = service.normalize_for_comparison(9.0, "price_comparable", 50.0, "percentage_comparable",
+                                              custom_params=constant)
+    assert batch.normalized_values1.tolist() == [0.5, 0.5]
+    assert batch.normalized_values2.tolist() == [scalar.normalized_value2] * 2
+    assert batch.warning_message == scalar.warning_message is not None
+
+    variables = [SimpleNamespace(variable_id=v, comparison_group=g) for v, g in
+                 [("RSI", "percentage_comparable"), ("CLOSE", "price_comparable"), ("VOLUME", "volume_comparable"),
+                  ("ATR", "volatility_comparable")]]
+    series = [[30.0, 70.0], [5e7, 6e7], [1e3, 2e3], [1.5, 2.5]]
+    batch_values = service.normalize_variable_values_batch(variables, series)
+    for i in range(2):
+        scalar_values = service.normalize_variable_values(variables, [column[i] for column in series])
+        assert {k: float(v[i]) for k, v in batch_values.items()} == scalar_values
@@ -0,0 +1,69 @@
+"""
+OrderbookTableModel 테스트 - 레벨 diff 셀 갱신, 프레임 합침, 호가 단위 가격 포맷
+"""
+
+from upbit_auto_trading.ui.desktop.screens.chart_view.widgets.orderbook_table_model import OrderbookTableModel
+
+
+def _snapshot(best_bid, depth=15, tick=1_000.0, sizes=None):
+    sizes = {49_990_000.0: 2.0, **(sizes or {})}  # 최대 잔량 고정 (배경 강도 기준)
+    asks = [best_bid + tick * (i + 1) for i in range(depth)]
+    bids = [best_bid - tick * i for i in range(depth)]
+
+    def unit(price):
+        quantity = sizes.get(price, 1.0)
+        return {"price": price, "quantity": quantity, "total": quantity}
+
+    return {"symbol": "KRW-BTC", "market": "KRW", "asks": [unit(p) for p in asks], "bids": [unit(p) for p in bids]}
+
+
+def _record_changes(model):
+    changes = []
+    model.dataChanged.connect(lambda top, bottom, roles: changes.append(
+        (top.row(), bottom.row(), top.column(), bottom.column())))
+    return changes
+
+
+def test_only_changed_cells_are_emitted(qasync_app):
+    model = OrderbookTableModel(depth=30)
+    changes = _record_changes(model)
+
+    # 15단계 호가도 매도/매수 1번이 중앙 경계(29/30행)에 붙어서 배치
+    model.apply_orderbook(_snapshot(50_000_000.0))
+    assert model.index(29, model.COL_PRICE).data() == "50,001,000"
+    assert model.index(30, model.COL_PRICE).data() == "50,000,000"
+    assert model.index(29, model.COL_NUMBER).data() == "1" and model.index(15, model.COL_NUMBER).data() == "15"
+    assert model.index(14, model.COL_PRICE).data() is None
+    assert changes == [(15, 44, 0, 3)]
+
+    # 매수 1번 잔량만 변경 → 수량/누적 셀만 (가격/번호 재포맷 없음)
+    changes.clear()
+    model.apply_orderbook(_snapshot(50_000_000.0, sizes={50_000_000.0: 1.5}))
+    assert changes == [(30, 30, model.COL_QUANTITY, model.COL_TOTAL)]
+    assert model.index(30, model.COL_QUANTITY).data() == "1.50"
+
+    # 같은 스냅샷 재수신 → 변경 없음
+    changes.clear()
+    model.apply_orderbook(_snapshot(50_000_000.0, sizes={50_000_000.0: 1.5}))
+    assert changes == []
+
+    # 한 틱 이동 → 가격 열 전체 갱신, 번호 열은 그대로
+    model.apply_orderbook(_snapshot(50_001_000.0, sizes={50_000_000.0: 1.5}))
+    assert all(change[2] >= model.COL_QUANTITY for change in changes)
+    assert model.price_at(30) == 50_001_000.0 and model.side_of(30) == "bid" and model.level_number(30) == 1
+
+
+def test_messages_are_coalesced_per_frame(qasync_app):
+    model = OrderbookTableModel(depth=30, frame_interval_ms=10_000)
+    applied = []
+    model.orderbook_applied.connect(applied.append)
+
+    for best_bid in (100.0, 101.0, 102.0):
+        model.enqueue_orderbook(_snapshot(best_bid, tick=1.0))
+    model.flush_pending()
+    model.flush_pending()
+
+    assert len(applied) == 1 and applied[0]["bids"][0]["price"] == 102.0
+    assert model.stats["messages_received"] == 3 and model.stats["flushes"] == 1
+    # 100원대 호가 단위(1원) 기준 소수 자릿수
+    assert model.index(30, model.COL_PRICE).data() == "102"
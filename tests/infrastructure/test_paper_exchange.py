@@ -0,0 +1,112 @@
+"""
+PaperExchange 테스트 - 가격-시간 우선 체결, 앞선 대기 잔량, 계좌 정산, UpbitPrivateClient 연동
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from upbit_auto_trading.infrastructure.external_apis.upbit.paper_exchange import (
+    PaperExchange, PaperExchangeConfig, PaperExchangeError
+)
+from upbit_auto_trading.infrastructure.external_apis.upbit.upbit_private_client import UpbitPrivateClient
+
+
+def _units(best_bid, best_ask, tick=1_000.0, size=1.0, sizes=None, depth=5):
+    sizes = sizes or {}
+    return [{"ask_price": best_ask + tick * i, "bid_price": best_bid - tick * i,
+             "ask_size": sizes.get(best_ask + tick * i, size), "bid_size": sizes.get(best_bid - tick * i, size)}
+            for i in range(depth)]
+
+
+def _limit(exchange, side, price, volume, identifier=None):
+    data = {"market": "KRW-BTC", "side": side, "ord_type": "limit", "price": str(price), "volume": str(volume)}
+    if identifier:
+        data["identifier"] = identifier
+    return exchange.handle_request("POST", "/orders", data=data)
+
+
+def test_resting_orders_fill_by_price_then_time_after_queue_ahead():
+    exchange = PaperExchange(PaperExchangeConfig(initial_balances={"KRW": Decimal("10000000")}))
+    exchange.on_orderbook("KRW-BTC", _units(50_000_000.0, 50_001_000.0, sizes={50_000_000.0: 0.5, 49_999_000.0: 0.0}))
+
+    first = _limit(exchange, "bid", 50_000_000, "0.05", "first")     # 앞에 외부 잔량 0.5
+    second = _limit(exchange, "bid", 50_000_000, "0.05", "second")
+    better = _limit(exchange, "bid", 49_999_000, "0.01")              # 낮은 가격 → 후순위 (앞선 잔량 없음)
+    assert first["state"] == "wait" and first["locked"] == "2501250.0"  # 0.05 × 5천만 + 수수료 0.05%
+    assert second["state"] == "wait" and second["remaining_volume"] == "0.05"
+
+    # 외부 앞선 잔량(0.5)보다 작은 체결 → 체결 없음, 앞선 잔량만 감소
+    assert exchange.on_trade("KRW-BTC", 50_000_000.0, 0.3, "ASK") == 0
+    # 남은 앞선 잔량 0.2 소진 후 first 전량 + second 0.03 (시간 우선)
+    assert exchange.on_trade("KRW-BTC", 50_000_000.0, 0.28, "ASK") == 2
+    assert exchange.get_order(identifier="first")["state"] == "done"
+    assert exchange.get_order(identifier="second")["remaining_volume"] == "0.02"
+
+    # 더 낮은 가격의 체결 → 가격 우선 (second 먼저, 그 다음 낮은 가격 주문), 주문 가격으로 체결
+    exchange.on_trade("KRW-BTC", 49_999_000.0, 0.025, "ASK")
+    assert exchange.get_order(identifier="second")["state"] == "done"
+    lower = exchange.get_order(better["uuid"])
+    assert lower["executed_volume"] == "0.005" and lower["trades"][0]["price"] == "49999000.0"
+
+    # 매수 체결(BID)은 매수 대기 주문과 체결하지 않음
+    assert exchange.on_trade("KRW-BTC", 49_000_000.0, 1.0, "BID") == 0
+
+    accounts = {account["currency"]: account for account in exchange.get_accounts()}
+    assert accounts["BTC"]["balance"] == "0.105"
+    spent = Decimal("0.1") * 50_000_000 + Decimal("0.005") * 49_999_000
+    locked = Decimal("0.005") * 49_999_000 * Decimal("1.0005")
+    assert Decimal(accounts["KRW"]["locked"]) == locked
+    assert Decimal(accounts["KRW"]["balance"]) == Decimal("10000000") - spent * Decimal("1.0005") - locked
+    assert abs(Decimal(accounts["BTC"]["avg_buy_price"]) - spent / Decimal("0.105")) < Decimal("1e-9")
+
+    # 매도 호가가 대기 주문 가격까지 내려오면 넘어선 잔량(2단계 × 0.001)만큼 주문 가격으로 체결
+    exchange.on_orderbook("KRW-BTC", _units(49_990_000.0, 49_998_000.0, size=0.001))
+    lower = exchange.get_order(better["uuid"])
+    assert lower["executed_volume"] == "0.007" and lower["trades"][-1]["price"] == "49999000.0"
+    assert exchange.get_status()["open_orders"] == 1
+
+
+def test_client_routes_private_requests_to_paper_exchange(qasync_loop):
+    exchange = PaperExchange(PaperExchangeConfig(initial_balances={"KRW": Decimal("1000000")}))
+    client = UpbitPrivateClient(access_key=None, secret_key=None, dry_run=True, loop_guard=None,
+                                paper_exchange=exchange)
+    exchange.on_orderbook("KRW-BTC", _units(50_000_000.0, 50_001_000.0, size=0.004))
+
+    async def scenario():
+        # 시장가 매수 60만원 → 매도 호가를 순서대로 소진 (0.004 + 0.004 + 나머지)
+        bought = await client.place_order("KRW-BTC", "bid", "price", price=Decimal("600000"))
+        assert bought["state"] == "done" and bought["trades_count"] == 3
+        assert Decimal(bought["executed_funds"]) <= Decimal("600000")
+
+        # 같은 스냅샷 안에서는 소진한 호가를 다시 쓰지 않음 → FOK 는 체결 불가로 취소
+        fok = await client.place_order("KRW-BTC", "bid", "best", price=Decimal("300000"), time_in_force="fok")
+        assert fok["state"] == "cancel" and fok["executed_volume"] == "0.0"
+
+        with pytest.raises(PaperExchangeError, match="invalid_price_bid"):
+            await client.place_order("KRW-BTC", "bid", "limit", volume=Decimal("0.001"), price=Decimal("50000500"))
+        with pytest.raises(PaperExchangeError, match="insufficient_funds_bid"):
+            await client.place_order("KRW-BTC", "bid", "limit", volume=Decimal("1"), price=Decimal("50000000"))
+        with pytest.raises(PaperExchangeError, match="under_min_total_ask"):
+            await client.place_order("KRW-BTC", "ask", "limit", volume=Decimal("0.00001"), price=Decimal("60000000"))
+
+        asks = [await client.place_order("KRW-BTC", "ask", "limit", volume=Decimal("0.003"),
+                                         price=Decimal(60_000_000 + 1_000 * i)) for i in range(3)]
+        open_orders = await client.get_open_orders(market="KRW-BTC")
+        assert len(open_orders) == 3
+
+        cancelled = await client.cancel_order(uuid=asks[0]["uuid"])
+        assert cancelled["state"] == "cancel"
+        result = await client.cancel_orders_by_ids(uuids=[asks[1]["uuid"], asks[0]["uuid"]])
+        assert result["success"]["count"] == 1 and result["failed"]["count"] == 1
+
+        accounts = await client.get_accounts()
+        btc = Decimal(bought["executed_volume"])
+        assert Decimal(accounts["BTC"]["balance"]) + Decimal(accounts["BTC"]["locked"]) == btc
+        assert accounts["BTC"]["locked"] == "0.003"
+
+        with pytest.raises(PaperExchangeError, match="order_not_found"):
+            await client.get_order(uuid="missing")
+
+    qasync_loop.run_until_complete(scenario())
+    assert client._stats["dry_run_requests"] >= 10
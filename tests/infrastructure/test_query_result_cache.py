@@ -0,0 +1,138 @@
+"""
+QueryResultCache 테스트 - 바이트 예산 LRU, 태그 무효화, 디스크 계층 유지/승격, 이벤트 기반 무효화, 로딩 중 무효화
+"""
+
+from upbit_auto_trading.application.application_service_container import ApplicationServiceContainer
+from upbit_auto_trading.application.caching.cache_invalidation_service import CacheInvalidationService, CacheKey
+from upbit_auto_trading.application.caching.query_result_cache import QueryResultCache
+from upbit_auto_trading.application.queries.dto.dashboard_query_dto import DashboardQuery
+from upbit_auto_trading.application.queries.dto.strategy_query_dto import StrategyDetailQuery, StrategyListQuery
+from upbit_auto_trading.application.queries.handlers.base_query_handler import BaseQueryHandler
+from upbit_auto_trading.application.queries.handlers.caching_query_handler import (
+    CachingQueryHandler, strategy_detail_cache_key, strategy_list_cache_key
+)
+from upbit_auto_trading.domain.events.domain_event_publisher import DomainEventPublisher
+from upbit_auto_trading.domain.events.strategy_events import StrategyBacktestCompleted, StrategyUpdated
+from upbit_auto_trading.domain.events.trigger_events import TriggerUpdated
+
+
+class _CountingHandler(BaseQueryHandler):
+    def __init__(self):
+        self.calls = 0
+
+    def handle(self, query):
+        self.calls += 1
+        return {"query": repr(query), "call": self.calls}
+
+
+class _RepositoryContainer:
+    def get_strategy_repository(self):
+        return None
+
+    def get_trigger_repository(self):
+        return None
+
+    def get_backtest_repository(self):
+        return None
+
+
+def test_memory_lru_respects_byte_budget_and_tags():
+    cache = QueryResultCache(memory_budget_bytes=2_500)
+    blob = "x" * 1_000
+    cache.put("a", blob, tags=["t1"])
+    cache.put("b", blob, tags=["t1", "t2"])
+    assert cache.get("a") == blob          # a 가 최근 사용 → b 가 LRU
+    cache.put("c", blob, tags=["t2"])
+
+    stats = cache.get_statistics()
+    assert stats["evictions"] == 1 and stats["memory_bytes"] <= 2_500
+    assert cache.get("b") is None and cache.get("a") == blob
+
+    assert cache.invalidate(["t2"]) == 1   # c 만 t2 보유
+    assert cache.get("c") is None and cache.get("a") == blob
+    assert cache.invalidate(["a"]) == 1    # 키 자체로도 무효화
+
+
+def test_disk_tier_survives_restart_and_promotes(tmp_path):
+    path = tmp_path / "query_cache.sqlite3"
+    now = [1_000.0]
+    cache = QueryResultCache(memory_budget_bytes=1_500, disk_path=path, clock=lambda: now[0])
+    cache.put("list", list(range(100)), tags=[CacheKey.strategy_list()])
+    cache.put("short", "dashboard", ttl=10)
+    cache.close()
+
+    reopened = QueryResultCache(disk_path=path, clock=lambda: now[0])
+    assert reopened.get("list") == list(range(100))
+    assert reopened.get("list") == list(range(100))
+    stats = reopened.get_statistics()
+    assert (stats["disk_hits"], stats["memory_hits"]) == (1, 1)   # 첫 적중 후 메모리로 승격
+
+    now[0] += 11
+    assert reopened.get("short") is None and reopened.get_statistics()["expirations"] == 1
+    # 승격된 항목의 태그도 복원되어 태그 무효화가 디스크까지 반영
+    assert reopened.invalidate([CacheKey.strategy_list()]) == 1
+    reopened.close()
+    assert QueryResultCache(disk_path=path).get("list") is None
+
+
+def test_domain_events_invalidate_precise_entries():
+    cache = QueryResultCache()
+    service = CacheInvalidationService(cache)
+    list_inner, detail_inner = _CountingHandler(), _CountingHandler()
+    list_handler = CachingQueryHandler(list_inner, cache, strategy_list_cache_key)
+    detail_handler = CachingQueryHandler(detail_inner, cache, strategy_detail_cache_key)
+    publisher = DomainEventPublisher()
+    service.subscribe(publisher)
+    try:
+        for _ in range(3):
+            list_handler.handle(StrategyListQuery())
+            list_handler.handle(StrategyListQuery(page=2))
+            detail_handler.handle(StrategyDetailQuery(strategy_id="1"))
+            detail_handler.handle(StrategyDetailQuery(strategy_id="2"))
+        assert (list_inner.calls, detail_inner.calls) == (2, 2)
+
+        # 전략 1 백테스트 완료 → 전략 1 상세와 목록만 재조회, 전략 2 상세는 유지
+        publisher.publish(StrategyBacktestCompleted(strategy_id="1", backtest_id="b1", symbol="KRW-BTC",
+                                                    total_return=1.0, max_drawdown=-1.0, sharpe_ratio=1.0))
+        detail_handler.handle(StrategyDetailQuery(strategy_id="1"))
+        detail_handler.handle(StrategyDetailQuery(strategy_id="2"))
+        list_handler.handle(StrategyListQuery())
+        assert (list_inner.calls, detail_inner.calls) == (3, 3)
+
+        # 전략 ID 가 없는 트리거 수정 → 모든 전략 상세 무효화
+        publisher.publish(TriggerUpdated(trigger_id="t1", trigger_name="rsi", updated_conditions=[],
+                                         previous_conditions=[], logic_operator="AND"))
+        detail_handler.handle(StrategyDetailQuery(strategy_id="2"))
+        assert detail_inner.calls == 4
+    finally:
+        service.unsubscribe(publisher)
+
+    stats = service.get_cache_statistics()
+    assert stats["invalidated_entries"] >= 4 and stats["memory_hits"] >= 8
+
+
+def test_invalidation_during_load_discards_stale_result():
+    cache = QueryResultCache()
+    service = CacheInvalidationService(cache)
+
+    def slow_loader():
+        # 조회 도중 전략이 수정됨
+        service.invalidate_for_event(StrategyUpdated(strategy_id="1", strategy_name="s", updated_fields={"name": "s"}))
+        return "old"
+
+    assert cache.get_or_load(CacheKey.strategy_detail("1"), slow_loader) == "old"
+    assert cache.get(CacheKey.strategy_detail("1")) is None
+    assert cache.get_statistics()["stale_loads_discarded"] == 1
+
+
+def test_application_container_wires_query_handlers_to_shared_cache():
+    container = ApplicationServiceContainer(_RepositoryContainer())
+    cache = container.get_query_result_cache()
+    handlers = container.get_query_service_container().get_dispatcher()._handlers
+
+    for query_type in (StrategyListQuery, StrategyDetailQuery, DashboardQuery):
+        assert isinstance(handlers[query_type], CachingQueryHandler)
+        assert handlers[query_type]._cache is cache
+    # 이벤트 무효화 서비스와 같은 캐시 인스턴스를 공유해야 무효화가 조회에 반영됨
+    assert container.get_cache_invalidation_service()._cache is cache
+    assert container.get_query_service() is container.get_query_service()
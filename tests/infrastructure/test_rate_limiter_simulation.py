@@ -0,0 +1,97 @@
+"""
+UnifiedUpbitRateLimiter 가상 시간 시뮬레이션 테스트
+
+네트워크와 실제 대기 없이 수 분 분량의 트래픽을 실행하여
+결정성, 시계 주입, 429 피드백(동적 감소) 동작을 확인합니다.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from upbit_auto_trading.infrastructure.external_apis.upbit.rate_limiter import (
+    RateLimiterSimulation,
+    SimulatedTraffic,
+    UnifiedUpbitRateLimiter,
+    UpbitRateLimitGroup,
+    VirtualTimeEventLoop,
+)
+
+
+def _simulate(simulation):
+    """시뮬레이션 코루틴을 전용 가상 시간 루프에서 실행 (루프는 호출 측 소유)"""
+    loop = VirtualTimeEventLoop()
+    try:
+        return loop.run_until_complete(simulation.run())
+    finally:
+        loop.close()
+
+
+def test_virtual_time_loop_skips_sleep():
+    loop = VirtualTimeEventLoop(start_time=100.0)
+    try:
+        wall_started = time.perf_counter()
+        loop.run_until_complete(asyncio.sleep(3600))
+        assert loop.time() == pytest.approx(3700.0)
+        assert time.perf_counter() - wall_started < 1.0
+    finally:
+        loop.close()
+
+
+def test_limiter_uses_injected_clock():
+    loop = VirtualTimeEventLoop(start_time=50.0)
+
+    async def scenario():
+        limiter = UnifiedUpbitRateLimiter(clock=loop.time)
+        assert limiter.get_rate_limit_group('/ticker') == UpbitRateLimitGroup.REST_PUBLIC
+        for _ in range(20):
+            await limiter.acquire('/ticker', 'GET')
+            await limiter.commit_timestamp('/ticker', 'GET')
+        await limiter.stop_background_tasks()
+
+    try:
+        wall_started = time.perf_counter()
+        loop.run_until_complete(scenario())
+        # 공개 그룹 10 RPS: 20건을 보내려면 가상 시계가 약 1초 이상 전진해야 함
+        assert loop.time() - 50.0 >= 0.9
+        assert time.perf_counter() - wall_started < 1.0
+    finally:
+        loop.close()
+
+
+def test_simulation_is_deterministic():
+    first = _simulate(RateLimiterSimulation(duration=60.0, seed=7))
+    second = _simulate(RateLimiterSimulation(duration=60.0, seed=7))
+
+    first_groups = first.to_dict()['groups']
+    assert first_groups == second.to_dict()['groups']
+    assert first.wall_seconds < 60.0
+
+
+def test_simulation_reports_all_groups():
+    report = _simulate(RateLimiterSimulation(duration=60.0))
+
+    assert set(report.groups) == set(UpbitRateLimitGroup)
+    for result in report.groups.values():
+        assert result.requests > 0
+        assert result.accepted + result.window_violations == result.requests
+        assert result.wait_p50_ms <= result.wait_p95_ms <= result.wait_p99_ms <= result.wait_max_ms
+        assert 0.0 < result.fairness <= 1.0
+    # 전체 취소는 2초당 1건으로 엄격히 간격을 둠
+    cancel_all = report.groups[UpbitRateLimitGroup.REST_PRIVATE_CANCEL_ALL]
+    assert cancel_all.window_violations == 0
+    assert cancel_all.achieved_rps <= 0.5 + 1e-9
+
+
+def test_stricter_server_triggers_429_feedback():
+    report = _simulate(RateLimiterSimulation(
+        duration=120.0,
+        traffic=(SimulatedTraffic('/ticker', 'GET', clients=3),),
+        server_limits={UpbitRateLimitGroup.REST_PUBLIC: ((5, 1.0),)},
+    ))
+
+    public = report.groups[UpbitRateLimitGroup.REST_PUBLIC]
+    assert public.window_violations > 0
+    assert public.rate_reductions > 0
+    assert public.final_rate_ratio < 1.0
@@ -0,0 +1,131 @@
+"""
+SqliteEventStorage 테스트 - 그룹 커밋 버퍼(배치 크기 / 간격 기록), 조회 전 flush, 마커 UPSERT, 기존 event_store 이관
+"""
+
+import asyncio
+import json
+import sqlite3
+from dataclasses import dataclass
+
+import pytest
+
+from upbit_auto_trading.domain.events.base_domain_event import DomainEvent
+from upbit_auto_trading.infrastructure.database.database_manager import DatabaseManager
+from upbit_auto_trading.infrastructure.events.bus.event_bus_interface import EventProcessingResult
+from upbit_auto_trading.infrastructure.events.storage.sqlite_event_storage import SqliteEventStorage
+
+
+@dataclass(frozen=True)
+class OrderTestEvent(DomainEvent):
+    order_id: str = ""
+    price: float = 0.0
+
+    @property
+    def event_type(self) -> str:
+        return "OrderTestEvent"
+
+    @property
+    def aggregate_id(self) -> str:
+        return self.order_id
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "strategies.sqlite3"
+    sqlite3.connect(path).close()
+    return path
+
+
+@pytest.fixture
+def db_manager(db_path):
+    manager = DatabaseManager({"strategies": str(db_path)})
+    yield manager
+    manager.close_all()
+
+
+def _committed(db_path, table):
+    """다른 연결에서 본 커밋된 행 수"""
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_group_commit_by_batch_size_and_read_flush(qasync_loop, db_manager, db_path):
+    storage = SqliteEventStorage(db_manager, flush_batch_size=4, flush_interval_ms=60_000)
+    events = [OrderTestEvent(order_id=f"order-{i % 2}", price=100.0 + i) for i in range(6)]
+
+    async def scenario():
+        for event in events[:3]:
+            await storage.store_event(event)
+        assert _committed(db_path, "event_log") == 0  # 배치 크기 미만: 버퍼에만 적재
+
+        await storage.store_event(events[3])
+        assert _committed(db_path, "event_log") == 4  # 4개가 한 트랜잭션으로 기록
+
+        await storage.store_event(events[4])
+        await storage.store_event(events[5])
+        # 조회는 버퍼를 먼저 비움, 집합체 재생은 기록 순서
+        return await storage.get_events_by_aggregate("order-0", "OrderTestEvent")
+
+    replayed = qasync_loop.run_until_complete(scenario())
+    assert [event.event_id for event in replayed] == [event.event_id for event in events[0::2]]
+    assert [event.price for event in replayed] == [100.0, 102.0, 104.0]
+    assert replayed[0].occurred_at == events[0].occurred_at
+
+    stats = qasync_loop.run_until_complete(storage.get_event_statistics())
+    assert stats['total_events'] == 6 and stats['unprocessed_events'] == 6
+    assert stats['write_stats']['flush_count'] == 2 and stats['write_stats']['events_appended'] == 6
+
+
+def test_interval_flush_and_marker_upsert(qasync_loop, db_manager, db_path):
+    storage = SqliteEventStorage(db_manager, flush_batch_size=1000, flush_interval_ms=20)
+    events = [OrderTestEvent(order_id="order-1", price=float(i)) for i in range(3)]
+
+    async def scenario():
+        for event in events:
+            await storage.store_event(event)
+        # 같은 이벤트의 마커는 마지막 결과만 기록
+        await storage.mark_event_processed(events[0].event_id, EventProcessingResult(events[0].event_id, False, "x"))
+        await storage.mark_event_processed(events[0].event_id, EventProcessingResult(events[0].event_id, True))
+        await storage.mark_event_processed(events[1].event_id, EventProcessingResult(events[1].event_id, False, "y"))
+        assert _committed(db_path, "event_log") == 0
+        await asyncio.sleep(0.2)  # flush_interval 경과 → 예약된 그룹 커밋 실행
+
+    qasync_loop.run_until_complete(scenario())
+    assert _committed(db_path, "event_log") == 3
+    assert _committed(db_path, "event_processing_markers") == 2
+    assert storage._write_stats['flush_count'] == 1
+
+    unprocessed = qasync_loop.run_until_complete(storage.get_unprocessed_events())
+    assert [event.event_id for event in unprocessed] == [events[1].event_id, events[2].event_id]
+
+
+def test_batch_store_and_legacy_migration(qasync_loop, db_manager, db_path):
+    legacy = OrderTestEvent(order_id="legacy", price=1.5)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE event_store (
+                event_id TEXT PRIMARY KEY, event_type TEXT, aggregate_id TEXT, aggregate_type TEXT,
+                version INTEGER, occurred_at TIMESTAMP, event_data TEXT, metadata TEXT,
+                is_processed BOOLEAN, processed_at TIMESTAMP, processing_result TEXT
+            )
+        """)
+        conn.execute(
+            "INSERT INTO event_store VALUES (?, ?, ?, ?, 1, ?, ?, ?, 1, ?, '{}')",
+            (legacy.event_id, "OrderTestEvent", "legacy", "OrderTestEvent", legacy.occurred_at.isoformat(),
+             json.dumps({"order_id": "legacy", "price": 1.5}),
+             json.dumps({"event_class": f"{__name__}.OrderTestEvent"}), legacy.occurred_at.isoformat())
+        )
+
+    storage = SqliteEventStorage(db_manager, flush_batch_size=1000, flush_interval_ms=60_000)
+    assert _committed(db_path, "event_log") == 1
+
+    batch = [OrderTestEvent(order_id="legacy", price=float(i)) for i in range(5)]
+    event_ids = qasync_loop.run_until_complete(storage.store_events(batch))
+    assert event_ids == [event.event_id for event in batch]
+    assert _committed(db_path, "event_log") == 6  # store_events 는 즉시 단일 그룹 커밋
+
+    replayed = qasync_loop.run_until_complete(storage.get_events_by_aggregate("legacy", "OrderTestEvent"))
+    assert [event.event_id for event in replayed] == [legacy.event_id] + event_ids
+    assert replayed[0].price == 1.5
+    unprocessed = qasync_loop.run_until_complete(storage.get_unprocessed_events())
+    assert [event.event_id for event in unprocessed] == event_ids
@@ -0,0 +1,95 @@
+"""
+시작 비용 예산 테스트 - import / DI 컨테이너 구성 시간과 로드 모듈 수
+
+새 프로세스에서 측정해야 이미 로드된 모듈의 영향을 받지 않으므로 서브프로세스로 실행합니다.
+예산은 환경변수로 조정할 수 있습니다 (느린 CI 머신 등):
+    UPBIT_STARTUP_IMPORT_BUDGET_MS / UPBIT_STARTUP_IMPORT_BUDGET_MODULES
+    UPBIT_STARTUP_CONTAINER_BUDGET_MS / UPBIT_STARTUP_CONTAINER_BUDGET_MODULES
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+IMPORT_BUDGET_MS = float(os.getenv("UPBIT_STARTUP_IMPORT_BUDGET_MS", "300"))
+IMPORT_BUDGET_MODULES = int(os.getenv("UPBIT_STARTUP_IMPORT_BUDGET_MODULES", "30"))
+CONTAINER_BUDGET_MS = float(os.getenv("UPBIT_STARTUP_CONTAINER_BUDGET_MS", "3000"))
+CONTAINER_BUDGET_MODULES = int(os.getenv("UPBIT_STARTUP_CONTAINER_BUDGET_MODULES", "700"))
+
+# 첫 화면(대시보드) 전에 로드되면 안 되는 무거운 모듈 - 해당 화면/WebSocket 연결 시점에 로드
+DEFERRED_MODULES = ("pandas", "matplotlib", "finplot", "aiohttp", "websockets")
+
+_MEASURE_SCRIPT = r"""
+import json
+import sys
+import time
+
+started = time.perf_counter()
+baseline = len(sys.modules)
+import upbit_auto_trading
+result = {
+    "import_ms": (time.perf_counter() - started) * 1000,
+    "import_modules": len(sys.modules) - baseline,
+}
+
+from PyQt6.QtWidgets import QApplication
+app = QApplication([])
+
+started = time.perf_counter()
+baseline = len(sys.modules)
+try:
+    from upbit_auto_trading.infrastructure.dependency_injection import get_di_lifecycle_manager
+    get_di_lifecycle_manager()
+except Exception as e:
+    result["container_error"] = f"{type(e).__name__}: {e}"
+result["container_ms"] = (time.perf_counter() - started) * 1000
+result["container_modules"] = len(sys.modules) - baseline
+result["loaded"] = sorted(name for name in sys.modules if "." not in name)
+print("STARTUP_BUDGET " + json.dumps(result))
+"""
+
+
+@pytest.fixture(scope="module")
+def startup_measurement(tmp_path_factory):
+    """새 인터프리터에서 import / 컨테이너 구성 비용 측정 (로그 파일은 임시 디렉토리에 생성)"""
+    pytest.importorskip("PyQt6.QtWidgets")
+    pytest.importorskip("dependency_injector")
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH")]))
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    completed = subprocess.run(
+        [sys.executable, "-c", _MEASURE_SCRIPT],
+        cwd=tmp_path_factory.mktemp("startup"),
+        env=env,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        timeout=120,
+    )
+    for line in completed.stdout.splitlines():
+        if line.startswith("STARTUP_BUDGET "):
+            return json.loads(line[len("STARTUP_BUDGET "):])
+    pytest.fail(f"측정 프로세스 실패 (exit {completed.returncode}):\n{completed.stderr[-2000:]}")
+
+
+def test_package_import_budget(startup_measurement):
+    assert startup_measurement["import_ms"] <= IMPORT_BUDGET_MS
+    assert startup_measurement["import_modules"] <= IMPORT_BUDGET_MODULES
+
+
+def test_container_setup_budget(startup_measurement):
+    assert "container_error" not in startup_measurement, startup_measurement.get("container_error")
+    assert startup_measurement["container_ms"] <= CONTAINER_BUDGET_MS
+    assert startup_measurement["container_modules"] <= CONTAINER_BUDGET_MODULES
+
+
+def test_container_setup_defers_heavy_modules(startup_measurement):
+    loaded = set(startup_measurement["loaded"])
+    assert [name for name in DEFERRED_MODULES if name in loaded] == []
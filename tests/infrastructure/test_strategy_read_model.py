@@ -0,0 +1,189 @@
+"""
+SqliteStrategyReadModel 테스트 - 재구축, 이벤트 기반 키 재계산(멱등), 목록/대시보드 핸들러 경로
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from upbit_auto_trading.application.queries.dto.dashboard_query_dto import DashboardQuery
+from upbit_auto_trading.application.queries.dto.strategy_query_dto import (
+    SortDirection, StrategyListQuery, StrategySortField
+)
+from upbit_auto_trading.application.queries.handlers.dashboard_query_handler import DashboardQueryHandler
+from upbit_auto_trading.application.queries.handlers.strategy_query_handler import StrategyListQueryHandler
+from upbit_auto_trading.domain.events.domain_event_publisher import DomainEventPublisher
+from upbit_auto_trading.domain.events.strategy_events import StrategyActivated, StrategyBacktestCompleted
+from upbit_auto_trading.infrastructure.database.database_manager import DatabaseManager
+from upbit_auto_trading.infrastructure.repositories.sqlite_strategy_read_model import SqliteStrategyReadModel
+
+SCHEMA_PATH = Path(__file__).parents[2] / "data_info" / "upbit_autotrading_schema_strategies.sql"
+NOW = datetime.now().replace(microsecond=0)
+
+
+def _ts(days_ago: float) -> str:
+    return (NOW - timedelta(days=days_ago)).strftime('%Y-%m-%d %H:%M:%S')
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    db_path = tmp_path / "strategies.sqlite3"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA_PATH.read_text(encoding='utf-8'))
+    conn.executemany(
+        "INSERT INTO strategies (id, strategy_name, is_active, tags, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+        [(1, 'RSI 역추세', 1, '["rsi", "swing"]', _ts(50), _ts(2)),
+         (2, '골든크로스', 1, '["trend"]', _ts(40), _ts(1)),
+         (3, '볼린저 돌파', 0, None, _ts(30), _ts(3))]
+    )
+    conn.executemany(
+        "INSERT INTO strategy_conditions (strategy_id, condition_name, condition_type, left_variable, operator, "
+        "is_enabled, created_at) VALUES (?, ?, ?, ?, '>', ?, ?)",
+        [(1, 'rsi 진입', 'entry_long', 'RSI', 1, _ts(10)),
+         (1, 'rsi 청산', 'exit_long', 'RSI', 1, _ts(10)),
+         (1, '비활성', 'entry_long', 'SMA', 0, _ts(10)),
+         (2, 'sma 진입', 'entry_long', 'SMA', 1, _ts(5)),
+         (2, 'ema 진입', 'entry_short', 'EMA', 1, _ts(5))]
+    )
+    # (id, strategy_id, status, end_time, total_profit_loss, sharpe_ratio)
+    backtests = [(10, 1, 'completed', _ts(3), 10.0, 1.0),
+                 (11, 1, 'completed', _ts(1), 20.0, 2.0),
+                 (12, 2, 'completed', _ts(20), -5.0, None),
+                 (13, 2, 'completed', _ts(45), 4.0, 0.5),    # 이전 기간
+                 (14, 3, 'failed', _ts(1), 99.0, 9.0)]       # 완료 아님 → 제외
+    conn.executemany(
+        "INSERT INTO strategy_execution (id, strategy_id, execution_type, start_time, status, end_time, "
+        "total_profit_loss, max_drawdown, sharpe_ratio) VALUES (?, ?, 'backtest', ?, ?, ?, ?, -3.0, ?)",
+        [(bid, sid, end, status, end, pnl, sharpe) for bid, sid, status, end, pnl, sharpe in backtests]
+    )
+    conn.commit()
+    conn.close()
+
+    manager = DatabaseManager({"strategies": str(db_path)})
+    yield manager
+    manager.close_all()
+
+
+def test_rebuild_and_strategy_list_single_select(db_manager):
+    read_model = SqliteStrategyReadModel(db_manager)
+    counts = read_model.rebuild()
+    assert counts['strategy_list_projection'] == 3
+    assert counts['backtest_projection'] == 4
+
+    handler = StrategyListQueryHandler(strategy_repository=None, backtest_repository=None, read_model=read_model)
+    response = handler.handle(StrategyListQuery(page_size=2, sort_field=StrategySortField.PERFORMANCE,
+                                                sort_direction=SortDirection.DESC))
+    assert response.total_count == 3
+    assert response.has_next is True
+    first, second = response.items
+    assert (first.strategy_id, first.entry_triggers_count, first.exit_triggers_count) == ('1', 1, 1)
+    assert first.last_backtest_performance == 20.0
+    assert first.last_backtest_date == NOW - timedelta(days=1)
+    assert first.tags == ['rsi', 'swing']
+    assert (second.strategy_id, second.entry_triggers_count, second.last_backtest_performance) == ('2', 2, -5.0)
+
+    page_two = handler.handle(StrategyListQuery(page=2, page_size=2))
+    assert [item.strategy_id for item in page_two.items] == ['1']
+    assert page_two.total_count == 3 and page_two.has_previous is True
+    # 마지막 페이지 이후에도 전체 개수 유지
+    assert handler.handle(StrategyListQuery(page=5, page_size=2)).total_count == 3
+
+    filtered = handler.handle(StrategyListQuery(status_filter='INACTIVE'))
+    assert [(item.name, item.tags, item.last_backtest_date) for item in filtered.items] == [('볼린저 돌파', [], None)]
+    assert [item.strategy_id for item in handler.handle(StrategyListQuery(tag_filter=['trend'])).items] == ['2']
+
+
+def test_event_refresh_is_idempotent(db_manager):
+    read_model = SqliteStrategyReadModel(db_manager)
+    read_model.rebuild()
+    publisher = DomainEventPublisher()
+    read_model.subscribe(publisher)
+    try:
+        db_manager.execute_command(
+            'strategies',
+            "INSERT INTO strategy_execution (id, strategy_id, execution_type, start_time, status, end_time, "
+            "total_profit_loss, max_drawdown, sharpe_ratio) VALUES (15, 3, 'backtest', ?, 'completed', ?, 7.0, -1.0, 3.0)",
+            (_ts(0.5), _ts(0.5))
+        )
+        event = StrategyBacktestCompleted(strategy_id='3', backtest_id='15', symbol='KRW-BTC',
+                                          total_return=7.0, max_drawdown=-1.0, sharpe_ratio=3.0)
+        publisher.publish(event)
+        publisher.publish(event)   # 중복 이벤트
+
+        db_manager.execute_command('strategies', "UPDATE strategies SET is_active = 1 WHERE id = 3")
+        publisher.publish(StrategyActivated(strategy_id='3', strategy_name='볼린저 돌파'))
+    finally:
+        read_model.unsubscribe(publisher)
+
+    incremental = read_model.query_dashboard(NOW - timedelta(days=30), NOW, NOW - timedelta(days=60))
+    rows, _ = read_model.query_strategy_list(status='ACTIVE', sort_field='name', sort_direction='asc')
+    assert [row['strategy_id'] for row in rows] == ['1', '2', '3']
+    assert rows[2]['last_backtest_performance'] == 7.0
+
+    read_model.rebuild()
+    assert read_model.query_dashboard(NOW - timedelta(days=30), NOW, NOW - timedelta(days=60)) == incremental
+    assert incremental['period_backtests'] == 4
+
+
+def test_dashboard_handler_from_read_model(db_manager):
+    read_model = SqliteStrategyReadModel(db_manager)
+    read_model.rebuild()
+    handler = DashboardQueryHandler(None, None, None, read_model=read_model)
+
+    response = handler.handle(DashboardQuery(date_range_days=30))
+
+    assert response.summary_stats == {
+        "total_strategies": 3, "active_strategies": 2, "inactive_strategies": 1, "total_triggers": 4,
+        "period_backtests": 3, "strategy_utilization_rate": pytest.approx(200 / 3)
+    }
+    avg_return, avg_sharpe = response.performance_metrics
+    assert avg_return.current_value == pytest.approx(25.0 / 3)
+    assert avg_return.previous_value == 4.0
+    assert avg_return.trend == "UP"
+    assert avg_sharpe.current_value == 1.5                    # None 샤프는 평균에서 제외
+    assert avg_sharpe.change_percentage == pytest.approx(200.0)
+
+    assert [(s.variable_type, s.total_count, s.active_count) for s in response.trigger_statistics] == [
+        ('RSI', 2, 2), ('SMA', 2, 1), ('EMA', 1, 1)
+    ]
+    assert [r['backtest_id'] for r in response.recent_backtest_results] == ['11', '10', '12', '13']
+    assert response.recent_backtest_results[0]['strategy_name'] == 'RSI 역추세'
+    assert response.recent_backtest_results[0]['completed_at'] == NOW - timedelta(days=1)
+
+
+def test_auto_rebuild_on_empty_or_stale_projection(db_manager):
+    read_model = SqliteStrategyReadModel(db_manager)   # 빈 프로젝션 + 원본 전략 → 생성 시 재구축
+    assert read_model.is_ready
+    assert read_model.query_strategy_list()[1] == 3
+
+    # 구 버전 스키마로 기록된 프로젝션 → 프로젝션 테이블 재생성 후 재구축
+    db_manager.execute_command('strategies', "UPDATE read_model_meta SET value = '0' WHERE key = 'schema_version'")
+    db_manager.execute_command('strategies', "DELETE FROM strategy_list_projection WHERE strategy_id = '3'")
+    stale = SqliteStrategyReadModel(db_manager)
+    assert stale.is_ready
+    assert stale.query_strategy_list()[1] == 3
+
+    handler = StrategyListQueryHandler(strategy_repository=None, backtest_repository=None, read_model=stale)
+    assert handler.handle(StrategyListQuery()).total_count == 3
+
+
+def test_handler_falls_back_until_projection_is_built(tmp_path):
+    class FallbackRepository:
+        def find_with_filters(self, **kwargs):
+            return []
+
+        def count_with_filters(self, **kwargs):
+            return 7
+
+    db_path = tmp_path / "empty.sqlite3"
+    sqlite3.connect(db_path).close()
+    manager = DatabaseManager({"strategies": str(db_path)})
+    try:
+        read_model = SqliteStrategyReadModel(manager)   # 원본 테이블 없음 → 재구축 실패
+        assert not read_model.is_ready
+        handler = StrategyListQueryHandler(FallbackRepository(), backtest_repository=None, read_model=read_model)
+        assert handler.handle(StrategyListQuery()).total_count == 7   # 기존 Repository 경로
+    finally:
+        manager.close_all()
@@ -0,0 +1,148 @@
+"""
+TickTapeStore 테스트 - 블록 압축 왕복, 일자 경계, 구간 읽기, 잘린 블록 복구, WebSocket 이벤트 입력,
+WebSocket 클라이언트 구독 등록/해제
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import numpy as np
+
+from upbit_auto_trading.infrastructure.external_apis.upbit.websocket.core.websocket_types import (
+    OrderbookEvent, OrderbookUnit, TradeEvent
+)
+from upbit_auto_trading.infrastructure.market_data.tape.tick_tape_store import TickTapeReader, TickTapeStore
+
+DAY_MS = 86_400_000
+BASE_MS = int(datetime(2025, 1, 1, 23, 0, tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def _trades(count, rng):
+    timestamps = BASE_MS + np.cumsum(rng.integers(0, 2_000, count))
+    prices = 143_000_000 + 1_000 * np.cumsum(rng.integers(-2, 3, count))
+    volumes = np.round(rng.uniform(0.00001, 0.5, count), 8)
+    sides = np.where(rng.random(count) < 0.5, "BID", "ASK")
+    return timestamps, prices.astype(float), volumes, sides
+
+
+def test_round_trip_across_blocks_and_days(tmp_path):
+    rng = np.random.default_rng(3)
+    store = TickTapeStore(tmp_path, block_rows=1_000)
+    timestamps, prices, volumes, sides = _trades(5_000, rng)
+    for i in range(len(timestamps)):
+        store.on_trade("KRW-BTC", int(timestamps[i]), float(prices[i]), float(volumes[i]), sides[i], 1_000 + i)
+        if i % 10 == 0:
+            units = [{"ask_price": prices[i] + 1_000 * (k + 1), "bid_price": prices[i] - 1_000 * k,
+                      "ask_size": round(float(volumes[i]) + k, 8), "bid_size": 0.25 * k} for k in range(12)]
+            store.on_orderbook("KRW-BTC", int(timestamps[i]), units)
+    store.on_trade("KRW-XRP", BASE_MS, 0.00012345, 12345.6789, "ASK")
+    store.flush()
+
+    stats = store.get_statistics()
+    assert stats["buffered_rows"] == 0 and stats["rows_written"] == 5_000 + 500 + 1
+    assert stats["compression_ratio"] > 4
+
+    # 자정(UTC)을 넘는 구간 → 일자 파일 두 개, 블록 경계와 무관하게 정확한 구간
+    reader = TickTapeReader(tmp_path)
+    assert reader.list_days("trade", "KRW-BTC") == ["20250101", "20250102"]
+    start, end = int(timestamps[1_234]), int(timestamps[4_321])
+    trades = reader.read_trades("KRW-BTC", start, end)
+    expected = (timestamps >= start) & (timestamps < end)
+    np.testing.assert_array_equal(trades["timestamp"], timestamps[expected])
+    np.testing.assert_array_equal(trades["price"], prices[expected])
+    np.testing.assert_array_equal(trades["volume"], volumes[expected])  # float 그대로 복원
+    np.testing.assert_array_equal(trades["side"], np.where(sides[expected] == "BID", 1, -1))
+    assert trades["sequential_id"][0] == 1_000 + int(np.argmax(expected))
+    assert reader.stats["blocks_read"] < stats["blocks_written"]  # 인덱스로 필요한 블록만
+
+    # 호가: 15단계 저장 (12단계 스냅샷은 0 채움), 최우선이 0번 열
+    books = reader.read_orderbooks("KRW-BTC", BASE_MS, BASE_MS + 2 * DAY_MS)
+    assert books["ask_price"].shape == (500, 15)
+    np.testing.assert_array_equal(books["ask_price"][:, 0], prices[::10] + 1_000)
+    np.testing.assert_array_equal(books["bid_size"][:, 12:], 0.0)
+
+    xrp = reader.read_trades("KRW-XRP", BASE_MS, BASE_MS + 1)
+    assert xrp["price"].tolist() == [0.00012345] and xrp["volume"].tolist() == [12345.6789]
+    assert reader.read_trades("KRW-ETH", BASE_MS, BASE_MS + DAY_MS)["price"].shape == (0,)
+
+
+def test_truncated_tail_recovery_and_websocket_ingest(tmp_path, qasync_loop):
+    store = TickTapeStore(tmp_path, block_rows=100, flush_interval=0.01)
+    for i in range(250):
+        store.on_trade("KRW-ETH", BASE_MS + i, 5_000_000.0 + i, 0.1, "BID", i)
+    store.flush()
+    data_path = tmp_path / "trade" / "KRW-ETH" / "20250101.tape"
+    index_path = data_path.with_suffix(".idx")
+
+    # 기록 도중 종료: 마지막 블록이 잘리고 인덱스 항목은 없음
+    size = data_path.stat().st_size
+    with open(data_path, "r+b") as handle:
+        handle.truncate(size - 7)
+    index_path.write_bytes(index_path.read_bytes()[:-28])
+    assert TickTapeReader(tmp_path).read_trades("KRW-ETH", BASE_MS, BASE_MS + 1_000)["timestamp"].size == 200
+
+    # 새 프로세스(새 store)가 이어서 기록 → 잘린 블록 제거 후 이어 붙임, 인덱스 일치
+    resumed = TickTapeStore(tmp_path, block_rows=100, flush_interval=0.01)
+
+    async def scenario():
+        await resumed.start()
+        for i in range(50):
+            resumed.on_trade_event(TradeEvent(symbol="KRW-ETH", trade_price=Decimal("5100000"),
+                                              trade_volume=Decimal("0.25"), ask_bid="ASK",
+                                              trade_timestamp=BASE_MS + 10_000 + i, sequential_id=10_000 + i))
+        resumed.on_orderbook_event(OrderbookEvent(symbol="KRW-ETH", timestamp_ms=BASE_MS + 10_000, orderbook_units=[
+            OrderbookUnit(Decimal("5101000"), Decimal("5100000"), Decimal("1.5"), Decimal("0.75"))]))
+        await resumed.stop()
+
+    qasync_loop.run_until_complete(scenario())
+    assert resumed.stats["truncated_tails"] == 1
+
+    trades = TickTapeReader(tmp_path).read_trades("KRW-ETH", BASE_MS, BASE_MS + DAY_MS)
+    assert trades["timestamp"].size == 250
+    assert trades["timestamp"][199] == BASE_MS + 199 and trades["timestamp"][200] == BASE_MS + 10_000
+    assert np.fromfile(index_path, dtype=np.uint8).size == 3 * 28
+
+    books = TickTapeReader(tmp_path).read_orderbooks("KRW-ETH", BASE_MS, BASE_MS + DAY_MS)
+    assert books["ask_size"][0, :2].tolist() == [1.5, 0.0] and books["bid_price"][0, 0] == 5_100_000.0
+
+
+class _FakeWebSocketClient:
+    """구독 콜백만 보관하는 WebSocketClient 대역"""
+
+    def __init__(self):
+        self.callbacks = {}
+        self.cleaned_up = False
+
+    async def subscribe_trade(self, symbols, callback, stream_preference="both"):
+        self.callbacks["trade"] = (list(symbols), callback, stream_preference)
+        return True
+
+    async def subscribe_orderbook(self, symbols, callback, stream_preference="both"):
+        self.callbacks["orderbook"] = (list(symbols), callback, stream_preference)
+        return True
+
+    async def cleanup(self):
+        self.cleaned_up = True
+
+
+def test_subscribe_registers_streams_and_stop_releases_client(tmp_path, qasync_loop):
+    store = TickTapeStore(tmp_path, flush_interval=0.01)
+    client = _FakeWebSocketClient()
+
+    async def scenario():
+        await store.start()
+        assert await store.subscribe(["KRW-BTC", "KRW-ETH"], client=client)
+        symbols, on_trade, preference = client.callbacks["trade"]
+        assert symbols == ["KRW-BTC", "KRW-ETH"] and preference == "realtime_only"
+        on_trade(TradeEvent(symbol="KRW-BTC", trade_price=Decimal("143000000"), trade_volume=Decimal("0.01"),
+                            ask_bid="BID", trade_timestamp=BASE_MS, sequential_id=7))
+        _, on_orderbook, _ = client.callbacks["orderbook"]
+        on_orderbook(OrderbookEvent(symbol="KRW-BTC", timestamp_ms=BASE_MS, orderbook_units=[
+            OrderbookUnit(Decimal("143001000"), Decimal("143000000"), Decimal("0.5"), Decimal("0.25"))]))
+        await store.stop()
+
+    qasync_loop.run_until_complete(scenario())
+    assert client.cleaned_up
+    reader = TickTapeReader(tmp_path)
+    assert reader.read_trades("KRW-BTC", BASE_MS, BASE_MS + 1)["sequential_id"].tolist() == [7]
+    assert reader.read_orderbooks("KRW-BTC", BASE_MS, BASE_MS + 1)["bid_size"][0, 0] == 0.25
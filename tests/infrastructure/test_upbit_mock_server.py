@@ -0,0 +1,93 @@
+"""
+업비트 모의 서버 테스트 - 캔들 to/count 의미, 빈 구간, 결정성, 429/Remaining-Req
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from upbit_auto_trading.infrastructure.external_apis.upbit.upbit_mock_server import (  # noqa: E402
+    MockUpbitServer,
+    MockUpbitServerConfig,
+)
+
+
+async def _get(server: MockUpbitServer, path: str, **params):
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"{server.base_url}{path}", params=params) as response:
+            return response.status, dict(response.headers), await response.json()
+
+
+def _run(loop, config: MockUpbitServerConfig, scenario):
+    async def main():
+        async with MockUpbitServer(config) as server:
+            return await scenario(server)
+    return loop.run_until_complete(main())
+
+
+def test_minute_candles_follow_to_and_count(qasync_loop):
+    async def scenario(server):
+        return await _get(server, '/candles/minutes/5', market='KRW-BTC', count='3', to='2024-06-01T00:10:00')
+
+    status, headers, candles = _run(qasync_loop, MockUpbitServerConfig(), scenario)
+    assert status == 200
+    # to 는 미포함, 최신순
+    assert [c['candle_date_time_utc'] for c in candles] == [
+        '2024-06-01T00:05:00', '2024-06-01T00:00:00', '2024-05-31T23:55:00'
+    ]
+    assert candles[0]['candle_date_time_kst'] == '2024-06-01T09:05:00'
+    assert candles[0]['unit'] == 5
+    assert headers['Remaining-Req'].startswith('group=candles; min=')
+
+
+def test_gaps_are_skipped_and_data_is_deterministic(qasync_loop):
+    outage = (datetime(2024, 6, 1, 0, 0, tzinfo=timezone.utc), datetime(2024, 6, 1, 0, 30, tzinfo=timezone.utc))
+    config = MockUpbitServerConfig(gap_ratio=0.2, outages=[outage])
+
+    async def scenario(server):
+        first = await _get(server, '/candles/minutes/1', market='KRW-ETH', count='200', to='2024-06-01T01:00:00')
+        second = await _get(server, '/candles/minutes/1', market='KRW-ETH', count='200', to='2024-06-01T01:00:00')
+        return first[2], second[2]
+
+    first, second = _run(qasync_loop, config, scenario)
+    times = [c['candle_date_time_utc'] for c in first]
+    assert len(first) == 200
+    assert first == second
+    assert not any('2024-06-01T00:0' in t or '2024-06-01T00:1' in t or '2024-06-01T00:2' in t for t in times)
+    # 200개를 채우기 위해 빈 구간을 건너뛰고 더 과거까지 진행
+    oldest = datetime.fromisoformat(times[-1]).replace(tzinfo=timezone.utc)
+    assert datetime(2024, 6, 1, 1, tzinfo=timezone.utc) - oldest > timedelta(minutes=230)
+
+
+def test_no_candles_before_listing(qasync_loop):
+    config = MockUpbitServerConfig(listed_at=datetime(2024, 1, 3, tzinfo=timezone.utc))
+
+    async def scenario(server):
+        return await _get(server, '/candles/days', market='KRW-XRP', count='10', to='2024-01-06T00:00:00')
+
+    _, _, candles = _run(qasync_loop, config, scenario)
+    assert [c['candle_date_time_utc'][:10] for c in candles] == ['2024-01-05', '2024-01-04', '2024-01-03']
+
+
+def test_rate_limit_and_injected_429(qasync_loop):
+    async def limited(server):
+        statuses = await asyncio.gather(*[
+            _get(server, '/ticker', markets='KRW-BTC') for _ in range(15)
+        ])
+        return [status for status, _, _ in statuses]
+
+    statuses = _run(qasync_loop, MockUpbitServerConfig(), limited)
+    assert statuses.count(200) == 10
+    assert statuses.count(429) == 5
+
+    async def injected(server):
+        results = [await _get(server, '/market/all') for _ in range(5)]
+        return [status for status, _, _ in results], server.stats.injected_429
+
+    config = MockUpbitServerConfig(error_429_rate=1.0, enforce_rate_limit=False)
+    statuses, injected_count = _run(qasync_loop, config, injected)
+    assert statuses == [429] * 5
+    assert injected_count == 5
@@ -0,0 +1,124 @@
+"""
+UpbitPrivateClient 배치 주문 / 사전 서명 테스트 (로컬 모의 거래소)
+
+- 사전 계산 서명 재료로 만든 JWT 가 표준 HS512 토큰으로 검증되는지
+- 배치 주문 결과가 제출 순서를 유지하고 부분 실패(검증/서버 거절)를 보고하는지
+- 모의 서버가 nonce 재사용을 거절하는지 (서명 토큰은 재사용 불가)
+"""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+jwt = pytest.importorskip("jwt")
+
+from upbit_auto_trading.infrastructure.external_apis.upbit.rate_limiter import UnifiedUpbitRateLimiter  # noqa: E402
+from upbit_auto_trading.infrastructure.external_apis.upbit.upbit_auth import UpbitAuthenticator  # noqa: E402
+from upbit_auto_trading.infrastructure.external_apis.upbit.upbit_mock_server import (  # noqa: E402
+    MockUpbitServer,
+    MockUpbitServerConfig,
+)
+from upbit_auto_trading.infrastructure.external_apis.upbit.upbit_private_client import UpbitPrivateClient  # noqa: E402
+
+
+def _run(loop, scenario, config=None):
+    async def main():
+        async with MockUpbitServer(config or MockUpbitServerConfig()) as server:
+            rate_limiter = UnifiedUpbitRateLimiter()
+            client = UpbitPrivateClient(
+                server.config.access_key, server.config.secret_key,
+                dry_run=False, rate_limiter=rate_limiter, base_url=server.base_url
+            )
+            try:
+                return await scenario(server, client)
+            finally:
+                await client.close()
+                await rate_limiter.stop_background_tasks()
+    return loop.run_until_complete(main())
+
+
+def test_precomputed_signature_is_standard_hs512_jwt():
+    secret = 'unit-test-secret-' * 4
+    auth = UpbitAuthenticator('unit-access', secret)
+
+    token = auth.create_jwt_token()
+    payload = jwt.decode(token, secret, algorithms=['HS512'])
+    assert payload['access_key'] == 'unit-access'
+    assert 'query_hash' not in payload
+    # nonce 는 매번 새로 생성
+    assert jwt.decode(auth.create_jwt_token(), secret, algorithms=['HS512'])['nonce'] != payload['nonce']
+
+    body = {'market': 'KRW-BTC', 'side': 'bid', 'ord_type': 'limit', 'volume': '0.1', 'price': '1000'}
+    payload = jwt.decode(auth.create_jwt_token(request_body=body), secret, algorithms=['HS512'])
+    assert payload['query_hash_alg'] == 'SHA512'
+    assert len(payload['query_hash']) == 128
+
+
+def test_batch_orders_keep_submission_order_and_report_failures(qasync_loop):
+    orders = [
+        {'market': 'KRW-BTC', 'side': 'bid', 'ord_type': 'limit',
+         'volume': Decimal('0.001'), 'price': Decimal('50000000'), 'identifier': 'batch-0'},
+        {'market': 'KRW-ETH', 'side': 'bid', 'ord_type': 'limit', 'volume': Decimal('0.1')},  # price 누락
+        {'market': 'KRW-NONE', 'side': 'ask', 'ord_type': 'market', 'volume': Decimal('1')},  # 서버 거절
+        {'market': 'KRW-XRP', 'side': 'bid', 'ord_type': 'price', 'price': Decimal('10000'),
+         'identifier': 'batch-3'},
+        {'market': 'KRW-XRP', 'side': 'ask', 'ord_type': 'market', 'volume': Decimal('1'),
+         'identifier': 'batch-3'},  # 배치 내 identifier 중복
+    ]
+
+    async def scenario(server, client):
+        result = await client.place_orders_batch(orders)
+        return result, server.stats.orders_created, server.stats.auth_failures
+
+    result, orders_created, auth_failures = _run(qasync_loop, scenario)
+
+    assert [r.index for r in result.results] == [0, 1, 2, 3, 4]
+    assert [r.success for r in result.results] == [True, False, False, True, False]
+    assert [r.stage for r in result.failed] == ['validation', 'dispatch', 'validation']
+    assert result.results[0].response['identifier'] == 'batch-0'
+    assert result.results[3].response['ord_type'] == 'price'
+    assert result.summary()['failed_indexes'] == [1, 2, 4]
+    assert orders_created == 2
+    assert auth_failures == 0
+
+
+def test_query_less_requests_sign_fresh_nonce_each_time(qasync_loop):
+    async def scenario(server, client):
+        first = await client.get_accounts()
+        second = await client.get_accounts()
+        order = await client.place_order('KRW-BTC', 'bid', 'limit', volume=Decimal('0.5'), price=Decimal('1000'))
+        fetched = await client.get_order(uuid=order['uuid'])
+
+        # 같은 서명 헤더 재전송은 nonce 재사용으로 거절
+        headers = client._sign_headers()
+        statuses = []
+        for _ in range(2):
+            async with client._session.get(f"{server.base_url}/accounts", headers=headers) as response:
+                statuses.append(response.status)
+        return first, second, fetched, statuses
+
+    first, second, fetched, statuses = _run(qasync_loop, scenario)
+    assert first == second
+    assert 'KRW' in first
+    assert fetched['volume'] == '0.5'
+    assert statuses == [200, 401]
+
+
+def test_dry_run_override_does_not_leak_into_concurrent_requests(qasync_loop):
+    orders = [{'market': 'KRW-BTC', 'side': 'bid', 'ord_type': 'limit',
+               'volume': Decimal('0.001'), 'price': Decimal('50000000')} for _ in range(3)]
+
+    async def scenario(server, client):
+        batch = asyncio.ensure_future(client.place_orders_batch(orders, dry_run=True))
+        await asyncio.sleep(0.01)  # 배치가 DRY-RUN 응답을 기다리는 동안 실거래 주문
+        assert client.is_dry_run_enabled() is False
+        real = await client.place_order('KRW-ETH', 'bid', 'limit', volume=Decimal('0.1'), price=Decimal('1000'))
+        return await batch, real, server.stats.orders_created
+
+    result, real, orders_created = _run(qasync_loop, scenario)
+
+    assert all(r.success and r.response['uuid'].startswith('dry-run-order-') for r in result.results)
+    assert not real['uuid'].startswith('dry-run-order-')
+    assert orders_created == 1
@@ -0,0 +1,99 @@
+"""
+VariableCompatibilityIndex 테스트 - YAML 카탈로그 인덱스가 쌍별 규칙과 일치, 증분 갱신 = 전체 재구축, 서비스 매트릭스
+"""
+
+import random
+from types import SimpleNamespace
+
+from upbit_auto_trading.domain.services.strategy_compatibility_service import (
+    StrategyCompatibilityService, ValidationContext, ValidationStrategy
+)
+from upbit_auto_trading.domain.trigger_builder.services.variable_compatibility_index import VariableCompatibilityIndex
+from upbit_auto_trading.domain.value_objects.compatibility_rules import CompatibilityLevel, ComparisonGroupRules
+from upbit_auto_trading.infrastructure.repositories.trading_variable_catalog import (
+    build_variable_compatibility_index, load_trading_variable_catalog
+)
+
+GROUPS = ["price_comparable", "percentage_comparable", "zero_centered", "volume_comparable",
+          "volatility_comparable", "signal_conditional", "capital_comparable", "dynamic_target"]
+
+
+def _snapshot(index):
+    ids = sorted(index.variable_ids())
+    return {(a, b): index.level(a, b) for a in ids for b in ids}, {
+        variable_id: sorted(index.get_compatible_ids(variable_id, include_warning=True)) for variable_id in ids
+    }
+
+
+def test_catalog_index_matches_pairwise_rules():
+    catalog = load_trading_variable_catalog()
+    assert {'SMA', 'RSI', 'MACD', 'CURRENT_PRICE'} <= {variable['variable_id'] for variable in catalog}
+    groups = {variable['variable_id']: variable['comparison_group'] for variable in catalog}
+    rules = ComparisonGroupRules()
+    index = build_variable_compatibility_index()
+
+    matrix = index.build_matrix()
+    for i, var1 in enumerate(matrix.variable_ids):
+        for j, var2 in enumerate(matrix.variable_ids):
+            if i != j:
+                expected = rules.check_compatibility(groups[var1], groups[var2])
+                assert matrix.level(i, j) == expected == index.level(var1, var2)
+
+    assert index.get_compatible_ids('SMA') == sorted(
+        variable_id for variable_id, group in groups.items() if group == 'price_comparable' and variable_id != 'SMA')
+    assert 'RSI' in index.get_compatible_ids('SMA', include_warning=True)
+
+
+def test_incremental_updates_equal_full_rebuild():
+    rng = random.Random(7)
+    variables = {f"V{i:03d}": (rng.choice(GROUPS), True) for i in range(120)}
+    index = VariableCompatibilityIndex.build(
+        [{'variable_id': k, 'comparison_group': g, 'is_active': a} for k, (g, a) in variables.items()])
+
+    next_id = 120
+    for _ in range(400):
+        action = rng.random()
+        if action < 0.3:
+            variable_id = f"V{next_id:03d}"
+            next_id += 1
+            variables[variable_id] = (rng.choice(GROUPS), True)
+        elif action < 0.7 and variables:
+            variable_id = rng.choice(sorted(variables))
+            variables[variable_id] = (rng.choice(GROUPS), rng.random() < 0.8)
+        elif variables:
+            variable_id = rng.choice(sorted(variables))
+            del variables[variable_id]
+            assert index.remove(variable_id)
+            continue
+        group, active = variables[variable_id]
+        index.upsert(variable_id, group, active)
+
+    rebuilt = VariableCompatibilityIndex.build(
+        [{'variable_id': k, 'comparison_group': g, 'is_active': a} for k, (g, a) in variables.items()])
+    assert _snapshot(index) == _snapshot(rebuilt)
+    assert not index.remove("MISSING")
+
+
+def test_service_uses_index_for_matrix_and_compatible_variables():
+    variables = [SimpleNamespace(variable_id=variable_id, comparison_group=group)
+                 for variable_id, group in [('SMA', 'price_comparable'), ('EMA', 'price_comparable'),
+                                            ('RSI', 'percentage_comparable'), ('MACD', 'signal_conditional'),
+                                            ('VOLUME', 'volume_comparable')]]
+    repository = SimpleNamespace(get_trading_variables=lambda: variables,
+                                 get_compatibility_rules=lambda: ComparisonGroupRules())
+    service = StrategyCompatibilityService(repository)
+
+    assert service.get_compatible_variables('SMA') == ['EMA', 'RSI']
+    assert service.get_compatible_variables('SMA', ValidationContext(strategy=ValidationStrategy.STRICT)) == ['EMA']
+
+    matrix = service.get_compatibility_matrix(['SMA', 'EMA', 'RSI', 'VOLUME'])
+    assert len(matrix) == 6
+    assert matrix[('SMA', 'EMA')].level == "COMPATIBLE"
+    assert matrix[('SMA', 'RSI')].level == "WARNING"
+    assert matrix[('EMA', 'VOLUME')].level == "INCOMPATIBLE"
+
+    # 변수 추가가 인덱스에 반영되면 새 변수도 매트릭스 경로 사용
+    service.compatibility_index.upsert('CLOSE', 'price_comparable')
+    assert service.get_compatibility_matrix(['SMA', 'CLOSE'])[('SMA', 'CLOSE')].level == "COMPATIBLE"
+    assert service.build_compatibility_matrix().compatible_pair_count() == 3
+    assert service.compatibility_index.level('SMA', 'MACD') == CompatibilityLevel.INCOMPATIBLE
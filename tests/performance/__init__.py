@@ -0,0 +1 @@
+# 성능 벤치마크 스크립트 패키지 (pytest 수집 대상 아님: benchmark_*.py 직접 실행)
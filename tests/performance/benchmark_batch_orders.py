@@ -0,0 +1,152 @@
+"""
+벤치마크: 프라이빗 주문 경로 - JWT 서명 CPU 비용 / 순차 주문 vs 배치 주문 처리량 (로컬 모의 거래소)
+
+1) 서명 CPU 비용: 요청당 JWT 생성 시간
+   - 기준: jwt.encode 로 매번 payload 전체를 인코딩 (기존 방식)
+   - 현재: UpbitAuthenticator (헤더 세그먼트 / access_key 조각 / HMAC 키 스케줄 사전 계산)
+   - 쿼리 없음(get_accounts) / 주문 바디(place_order) 두 경우
+2) 주문 처리량: MockUpbitServer(order 그룹 8회/초, JWT 검증)에 대해
+   - place_order 순차 호출 (요청마다 서명 + 5~20ms 지터)
+   - place_orders_batch (사전 검증·서명 후 주문 그룹 예산 안에서 동시 전송)
+
+출력: 요청당 서명 µs, 초당 주문 수, 주문당 지연, 실패 수
+
+실행: python tests/performance/benchmark_batch_orders.py
+"""
+
+import asyncio
+import hashlib
+import sys
+import time
+import uuid
+from decimal import Decimal
+from pathlib import Path
+
+import jwt
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from upbit_auto_trading.infrastructure.external_apis.upbit.rate_limiter import UnifiedUpbitRateLimiter  # noqa: E402
+from upbit_auto_trading.infrastructure.external_apis.upbit.upbit_auth import UpbitAuthenticator  # noqa: E402
+from upbit_auto_trading.infrastructure.external_apis.upbit.upbit_mock_server import (  # noqa: E402
+    MockUpbitServer,
+    MockUpbitServerConfig
+)
+from upbit_auto_trading.infrastructure.external_apis.upbit.upbit_private_client import UpbitPrivateClient  # noqa: E402
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "signing_iterations": 20_000,
+    "order_count": 40,            # 시나리오별 주문 수 (order 그룹 8회/초 → 약 5초)
+    "server": {
+        "latency": 0.08,          # 모의 거래소 응답 지연 (초) - 실제 주문 API 왕복 수준
+        "latency_jitter": 0.04,
+        "seed": 0,
+    },
+}
+
+ORDER_BODY = {
+    'market': 'KRW-BTC', 'side': 'bid', 'ord_type': 'limit',
+    'volume': '0.001', 'price': '50000000', 'identifier': 'bench-000000'
+}
+
+
+def baseline_jwt(access_key: str, secret_key: str, body=None) -> str:
+    """기존 방식: 매 요청 payload 전체를 jwt.encode"""
+    payload = {'access_key': access_key, 'nonce': str(uuid.uuid4())}
+    if body:
+        query_string = UpbitAuthenticator.build_query_string(body).encode()
+        payload['query_hash'] = hashlib.sha512(query_string).hexdigest()
+        payload['query_hash_alg'] = 'SHA512'
+    return jwt.encode(payload, secret_key, algorithm='HS512')
+
+
+def time_per_call_us(func, iterations: int) -> float:
+    started = time.process_time()
+    for _ in range(iterations):
+        func()
+    return (time.process_time() - started) / iterations * 1e6
+
+
+def run_signing_benchmark(access_key: str, secret_key: str, iterations: int):
+    auth = UpbitAuthenticator(access_key, secret_key)
+    print(f"\n[1] 요청당 서명 CPU 시간 ({iterations:,}회 평균, process_time)")
+    print(f"  {'경우':<18} {'jwt.encode(µs)':>15} {'사전계산(µs)':>14} {'배율':>7}")
+    for label, body in (("쿼리 없음", None), ("주문 바디", ORDER_BODY)):
+        baseline = time_per_call_us(lambda: baseline_jwt(access_key, secret_key, body), iterations)
+        current = time_per_call_us(lambda: auth.get_private_headers(request_body=body), iterations)
+        print(f"  {label:<18} {baseline:>15.2f} {current:>14.2f} {baseline / current:>6.2f}x")
+
+
+def make_orders(prefix: str, count: int):
+    return [
+        {'market': 'KRW-BTC', 'side': 'bid', 'ord_type': 'limit',
+         'volume': Decimal('0.001'), 'price': Decimal(50_000_000 - i * 1000),
+         'identifier': f'{prefix}-{i:06d}'}
+        for i in range(count)
+    ]
+
+
+async def run_sequential(client: UpbitPrivateClient, orders):
+    failures = 0
+    started = time.perf_counter()
+    for order in orders:
+        try:
+            await client.place_order(**order)
+        except Exception:
+            failures += 1
+    return (time.perf_counter() - started) * 1000, failures, None
+
+
+async def run_batch(client: UpbitPrivateClient, orders):
+    started = time.perf_counter()
+    result = await client.place_orders_batch(orders)
+    return (time.perf_counter() - started) * 1000, len(result.failed), result.signing_ms
+
+
+async def run_throughput_benchmark(count: int, server_config: MockUpbitServerConfig):
+    print(f"\n[2] 주문 처리량 (주문 {count}건, 모의 거래소 지연 "
+          f"{server_config.latency * 1000:.0f}+{server_config.latency_jitter * 1000:.0f}ms, order 그룹 8회/초)")
+    print(f"  {'방식':<16} {'총(ms)':>10} {'주문/초':>9} {'주문당(ms)':>11} {'실패':>5} {'서명(ms)':>9} {'서버 429':>8}")
+
+    async with MockUpbitServer(server_config) as server:
+        for label, runner in (("순차 place_order", run_sequential), ("배치", run_batch)):
+            rate_limiter = UnifiedUpbitRateLimiter()
+            client = UpbitPrivateClient(
+                server.config.access_key, server.config.secret_key,
+                dry_run=False, rate_limiter=rate_limiter, base_url=server.base_url
+            )
+            rejected_before = server.stats.responses_429
+            try:
+                # 세션/커넥션 워밍업 (조회 그룹 사용 - 주문 예산과 분리)
+                await client.get_accounts()
+                await asyncio.sleep(1.0)  # 이전 시나리오의 order 윈도우 비우기
+                elapsed_ms, failures, signing_ms = await runner(client, make_orders(label[:2], count))
+            finally:
+                await client.close()
+                await rate_limiter.stop_background_tasks()
+            rate = count / (elapsed_ms / 1000) if elapsed_ms > 0 else 0.0
+            signing = f"{signing_ms:9.2f}" if signing_ms is not None else f"{'-':>9}"
+            print(f"  {label:<16} {elapsed_ms:>10.1f} {rate:>9.2f} {elapsed_ms / count:>11.1f} "
+                  f"{failures:>5} {signing} {server.stats.responses_429 - rejected_before:>8}")
+        print(f"  서버 주문 생성 {server.stats.orders_created}건, 인증 실패 {server.stats.auth_failures}건")
+
+
+async def main():
+    config = BENCHMARK_CONFIG
+    server_config = MockUpbitServerConfig(**config["server"])
+
+    print("=" * 88)
+    print("프라이빗 주문 경로 벤치마크 (JWT 서명 비용 / 배치 주문 처리량)")
+    print("=" * 88)
+
+    run_signing_benchmark(server_config.access_key, server_config.secret_key, config["signing_iterations"])
+    await run_throughput_benchmark(config["order_count"], server_config)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,182 @@
+"""
+벤치마크: 캔들 백필 파이프라인 종단간 성능 (로컬 업비트 모의 서버)
+
+CandleDataProvider → ChunkProcessor → UpbitPublicClient → SqliteCandleRepository 전체 경로를
+실제 거래소 대신 MockUpbitServer(aiohttp)에 연결하여 측정합니다.
+임시 디렉토리의 새 market_data DB 에 백필한 뒤, 같은 요청을 한 번 더 실행해 겹침(DB 재사용) 경로도 측정합니다.
+
+출력:
+- 시나리오별 총 소요 시간, 초당 캔들 수, 청크 수, 모의 서버 요청/429 수
+- 청크 단계별 시간: 겹침 분석 / API (Rate Limiter 대기, HTTP, 기타) / 빈 캔들 처리 / DB 저장 / 최종 DB 조회
+
+실행: python tests/performance/benchmark_candle_backfill.py
+"""
+
+import asyncio
+import collections
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from upbit_auto_trading.infrastructure.database.database_manager import DatabaseManager  # noqa: E402
+from upbit_auto_trading.infrastructure.external_apis.upbit.upbit_mock_server import (  # noqa: E402
+    MockUpbitServer,
+    MockUpbitServerConfig
+)
+from upbit_auto_trading.infrastructure.external_apis.upbit.upbit_public_client import UpbitPublicClient  # noqa: E402
+from upbit_auto_trading.infrastructure.market_data.candle.candle_data_provider import CandleDataProvider  # noqa: E402
+from upbit_auto_trading.infrastructure.market_data.candle.overlap_analyzer import OverlapAnalyzer  # noqa: E402
+from upbit_auto_trading.infrastructure.market_data.candle.time_utils import TimeUtils  # noqa: E402
+from upbit_auto_trading.infrastructure.repositories.sqlite_candle_repository import SqliteCandleRepository  # noqa: E402
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    # (심볼, 타임프레임, 개수)
+    "scenarios": [
+        ("KRW-BTC", "1m", 10_000),
+        ("KRW-ETH", "5m", 4_000),
+        ("KRW-XRP", "1d", 2_000),
+    ],
+    "repeat_for_overlap": True,   # 같은 요청 재실행 (DB 에 이미 있는 구간 → 겹침 분석 경로)
+    "chunk_size": 200,
+    "server": {
+        "gap_ratio": 0.02,        # 빈 1분 구간 비율
+        "latency": 0.01,          # 모의 서버 응답 지연 (초)
+        "latency_jitter": 0.01,
+        "error_429_rate": 0.0,    # 무작위 429 주입 비율
+        "seed": 0,
+    },
+}
+
+STAGES = ("overlap", "api", "empty_fill", "db_write", "final_query")
+STAGE_LABELS = {
+    "overlap": "겹침 분석",
+    "api": "API 호출",
+    "empty_fill": "빈 캔들 처리",
+    "db_write": "DB 저장",
+    "final_query": "최종 DB 조회",
+}
+
+
+class StageTimer:
+    """ChunkProcessor 단계 메서드를 감싸 누적 시간을 기록"""
+
+    def __init__(self, provider: CandleDataProvider):
+        self.totals = collections.defaultdict(float)
+        self.counts = collections.defaultdict(int)
+        self.acquire_wait_ms = 0.0
+        self.http_ms = 0.0
+        processor = provider.chunk_processor
+        client = provider.upbit_client
+        repository = provider.repository
+
+        processor._analyze_chunk_overlap = self._wrap("overlap", processor._analyze_chunk_overlap)
+        processor._process_empty_candles = self._wrap("empty_fill", processor._process_empty_candles)
+        repository.save_raw_api_data = self._wrap("db_write", repository.save_raw_api_data)
+        repository.get_candles_by_range = self._wrap("final_query", repository.get_candles_by_range)
+
+        fetch = processor._fetch_api_data
+
+        async def timed_fetch(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await fetch(*args, **kwargs)
+            finally:
+                self.totals["api"] += (time.perf_counter() - started) * 1000
+                self.counts["api"] += 1
+                meta = client.get_last_request_meta()
+                if meta:
+                    self.acquire_wait_ms += meta.get("acquire_wait_ms", 0.0)
+                    self.http_ms += meta.get("http_latency_ms", 0.0)
+
+        processor._fetch_api_data = timed_fetch
+
+    def _wrap(self, stage: str, func):
+        async def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                self.totals[stage] += (time.perf_counter() - started) * 1000
+                self.counts[stage] += 1
+        return timed
+
+
+async def run_backfill(provider: CandleDataProvider, symbol: str, timeframe: str, count: int):
+    timer = StageTimer(provider)
+    started = time.perf_counter()
+    candles = await provider.get_candles(symbol=symbol, timeframe=timeframe, count=count)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return candles, elapsed_ms, timer
+
+
+def print_report(title: str, candles, elapsed_ms: float, timer: StageTimer, server: MockUpbitServer,
+                 requests_before: int, rejected_before: int):
+    chunks = max(timer.counts["empty_fill"], timer.counts["overlap"], 1)
+    rate = len(candles) / (elapsed_ms / 1000) if elapsed_ms > 0 else 0.0
+    print(f"\n{title}")
+    print(f"  캔들 {len(candles):>8,}개 | {elapsed_ms:9.1f} ms | {rate:10,.0f} 캔들/초 | "
+          f"API 호출 {timer.counts['api']:>4} | 서버 요청 {server.stats.requests - requests_before:>4} "
+          f"(429 {server.stats.responses_429 - rejected_before})")
+    print(f"  {'단계':<14} {'합계(ms)':>10} {'청크당(ms)':>11} {'비율':>7}")
+    for stage in STAGES:
+        total = timer.totals[stage]
+        per_chunk = total / chunks if stage != "final_query" else total
+        share = total / elapsed_ms * 100 if elapsed_ms > 0 else 0.0
+        print(f"  {STAGE_LABELS[stage]:<14} {total:>10.1f} {per_chunk:>11.2f} {share:>6.1f}%")
+        if stage == "api" and timer.counts["api"]:
+            other = max(0.0, total - timer.acquire_wait_ms - timer.http_ms)
+            for label, value in (("└ Rate Limiter 대기", timer.acquire_wait_ms),
+                                 ("└ HTTP 응답", timer.http_ms),
+                                 ("└ 기타(지터/파싱)", other)):
+                print(f"    {label:<16} {value:>8.1f} {value / chunks:>11.2f} "
+                      f"{value / elapsed_ms * 100:>6.1f}%")
+
+
+async def main():
+    config = BENCHMARK_CONFIG
+    server_config = MockUpbitServerConfig(**config["server"])
+
+    print("=" * 88)
+    print(f"캔들 백필 종단간 벤치마크 (모의 서버: 빈 구간 {server_config.gap_ratio:.0%}, "
+          f"지연 {server_config.latency * 1000:.0f}+{server_config.latency_jitter * 1000:.0f}ms, "
+          f"429 주입 {server_config.error_429_rate:.0%})")
+    print("=" * 88)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / "market_data.sqlite3"
+        sqlite3.connect(db_path).close()  # DatabaseManager 는 기존 파일만 연결
+        db_manager = DatabaseManager({"market_data": str(db_path)})
+        async with MockUpbitServer(server_config) as server:
+            client = UpbitPublicClient(base_url=server.base_url)
+            try:
+                for symbol, timeframe, count in config["scenarios"]:
+                    runs = ["백필"] + (["재실행 (겹침)"] if config["repeat_for_overlap"] else [])
+                    for run_name in runs:
+                        repository = SqliteCandleRepository(db_manager)
+                        provider = CandleDataProvider(
+                            repository=repository,
+                            upbit_client=client,
+                            overlap_analyzer=OverlapAnalyzer(repository, TimeUtils()),
+                            chunk_size=config["chunk_size"]
+                        )
+                        requests_before = server.stats.requests
+                        rejected_before = server.stats.responses_429
+                        candles, elapsed_ms, timer = await run_backfill(provider, symbol, timeframe, count)
+                        print_report(f"[{symbol} {timeframe} x {count:,}] {run_name}", candles, elapsed_ms,
+                                     timer, server, requests_before, rejected_before)
+            finally:
+                await client.close()
+                db_manager.close_all()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
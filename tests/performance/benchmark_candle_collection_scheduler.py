@@ -0,0 +1,182 @@
+"""
+벤치마크: 다수 차트 캔들 수집 - 독립 수집(FIFO Rate Limiter) vs CandleCollectionScheduler
+
+로컬 가짜 캔들 클라이언트(응답 지연 + 공유 RPS 게이트)에 여러 차트가 동시에 과거 캔들을 요청합니다.
+백그라운드/최소화 창이 먼저 요청하고, 마지막에 연 활성 차트가 가장 늦게 요청하는 상황입니다.
+
+출력:
+- 활성 차트 첫 캔들(첫 페이지) 도착 시간, 전체 캔들 도착 시간
+- 수집 도중 최소화 → 활성 전환된 차트의 전환 후 완료 시간 (선점)
+- 전체 REST 호출 수 (중복 조회 제거 효과), 전체 소요 시간
+
+실행: python tests/performance/benchmark_candle_collection_scheduler.py
+"""
+
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from upbit_auto_trading.application.chart_viewer.candle_collection_scheduler import (  # noqa: E402
+    CandleCollectionScheduler,
+    CollectionBudget
+)
+from upbit_auto_trading.application.chart_viewer.chart_viewer_resource_manager import ChartViewerResourceManager  # noqa: E402
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "background_charts": 7,
+    "minimized_charts": 16,
+    "duplicate_every": 4,         # n 번째 차트마다 앞 차트와 같은 심볼/타임프레임 (중복 조회)
+    "candles_per_chart": 600,     # 차트당 요청 캔들 수 (200개 × 3페이지)
+    "rps": 100.0,                 # 공유 REST 예산 (실제 10 RPS 를 10배 가속)
+    "latency": 0.02,              # 가짜 클라이언트 응답 지연 (초)
+    "switch_after": 0.3,          # 이 시간 후 switch_chart 를 최소화 → 활성으로 전환 (초)
+    "switch_chart": "chart_13",   # 다른 차트와 조회를 공유하지 않는 최소화 차트
+}
+
+
+class FifoGate:
+    """공유 RPS 게이트 (우선순위 없는 Rate Limiter 대기열 모사)"""
+
+    def __init__(self, rps: float):
+        self.interval = 1.0 / rps
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class FakeCandleClient:
+    """로컬 가짜 캔들 API (최신 → 과거 순, to 이전 캔들)"""
+
+    def __init__(self, gate: FifoGate, latency: float, started: float):
+        self.gate = gate
+        self.latency = latency
+        self.started = started
+        self.calls = 0
+        self.first_page_at = {}
+        self.base = datetime(2025, 1, 1)
+
+    async def fetch(self, symbol, timeframe, count, to):
+        await self.gate.acquire()
+        await asyncio.sleep(self.latency)
+        self.calls += 1
+        self.first_page_at.setdefault((symbol, timeframe), time.monotonic() - self.started)
+        end = datetime.fromisoformat(to) if to else self.base
+        return [{"market": symbol, "candle_date_time_utc": (end - timedelta(minutes=i + 1)).isoformat(),
+                 "trade_price": 50_000_000.0} for i in range(count)]
+
+
+def build_charts(config):
+    """(chart_id, symbol, window_state) - 요청 순서: 최소화 → 백그라운드 → 활성"""
+    charts = []
+    states = ["minimized"] * config["minimized_charts"] + ["background"] * config["background_charts"]
+    for i, state in enumerate(states):
+        symbol_index = i - 1 if i and i % config["duplicate_every"] == 0 else i
+        charts.append((f"chart_{i}", f"KRW-C{symbol_index}", state))
+    charts.append(("chart_active", "KRW-ACTIVE", "active"))
+    return charts
+
+
+async def run_independent(config, charts):
+    """기존 방식: 차트마다 독립적으로 페이지 조회 (공유 게이트 FIFO)"""
+    started = time.monotonic()
+    client = FakeCandleClient(FifoGate(config["rps"]), config["latency"], started)
+    done_at = {}
+
+    async def collect(chart_id, symbol):
+        remaining, cursor = config["candles_per_chart"], None
+        while remaining > 0:
+            page = await client.fetch(symbol, "1m", min(200, remaining), cursor)
+            remaining -= len(page)
+            cursor = min(candle["candle_date_time_utc"] for candle in page)
+        done_at[chart_id] = time.monotonic() - started
+
+    await asyncio.gather(*(collect(chart_id, symbol) for chart_id, symbol, _ in charts))
+    total = time.monotonic() - started
+    return {
+        "first_page": client.first_page_at[("KRW-ACTIVE", "1m")],
+        "active_done": done_at["chart_active"],
+        "switched_done": done_at[config["switch_chart"]] - config["switch_after"],
+        "calls": client.calls,
+        "total": total,
+    }
+
+
+async def run_scheduled(config, charts):
+    """CandleCollectionScheduler: 창 상태 우선순위 + 예산 분할 + 선점 + 중복 제거"""
+    started = time.monotonic()
+    client = FakeCandleClient(FifoGate(config["rps"]), config["latency"], started)
+    resource_manager = ChartViewerResourceManager()
+    scheduler = CandleCollectionScheduler(client.fetch, resource_manager,
+                                          budget=CollectionBudget(rps=config["rps"], burst=int(config["rps"] / 10)))
+    done_at = {}
+
+    async def collect(chart_id, symbol, state):
+        resource_manager.register_chart(chart_id, state)
+        await scheduler.fetch(chart_id, symbol, "1m", count=config["candles_per_chart"])
+        done_at[chart_id] = time.monotonic() - started
+
+    async def switch_later():
+        await asyncio.sleep(config["switch_after"])
+        resource_manager.update_window_state(config["switch_chart"], "active")
+
+    await asyncio.gather(switch_later(), *(collect(*chart) for chart in charts))
+    total = time.monotonic() - started
+    status = scheduler.get_status()
+    await scheduler.shutdown()
+    return {
+        "first_page": client.first_page_at[("KRW-ACTIVE", "1m")],
+        "active_done": done_at["chart_active"],
+        "switched_done": done_at[config["switch_chart"]] - config["switch_after"],
+        "calls": client.calls,
+        "total": total,
+        "stats": status["stats"],
+    }
+
+
+def main():
+    import logging
+    logging.disable(logging.INFO)
+
+    config = BENCHMARK_CONFIG
+    charts = build_charts(config)
+    print("=" * 88)
+    print(f"다수 차트 캔들 수집 벤치마크 (차트 {len(charts)}개 × {config['candles_per_chart']}캔들, "
+          f"예산 {config['rps']:.0f} RPS, 응답 지연 {config['latency'] * 1000:.0f}ms)")
+    print("=" * 88)
+
+    independent = asyncio.run(run_independent(config, charts))
+    scheduled = asyncio.run(run_scheduled(config, charts))
+
+    rows = [
+        ("활성 차트 첫 캔들", "first_page", "s"),
+        ("활성 차트 전체 캔들", "active_done", "s"),
+        ("전환 차트 완료(전환 후)", "switched_done", "s"),
+        ("전체 소요", "total", "s"),
+        ("REST 호출 수", "calls", "회"),
+    ]
+    print(f"{'항목':<22}{'독립 수집':>12}{'스케줄러':>12}{'개선':>10}")
+    for label, key, unit in rows:
+        before, after = independent[key], scheduled[key]
+        value = (lambda v: f"{v:.3f}s") if unit == "s" else (lambda v: f"{v}회")
+        print(f"{label:<22}{value(before):>12}{value(after):>12}{before / after:>9.1f}x")
+    print(f"스케줄러 통계: {scheduled['stats']}")
+
+
+if __name__ == "__main__":
+    main()
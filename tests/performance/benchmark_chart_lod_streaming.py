@@ -0,0 +1,165 @@
+"""
+벤치마크: 캔들 차트 재그리기 시간 vs 보유 히스토리 길이 (오프스크린 Qt)
+
+FinplotCandlestickWidget 에 합성 1분봉 히스토리를 적재한 뒤, 프레임마다 체결 몇 건을 반영하고
+이벤트 루프 한 바퀴(대기 중인 뷰포트 paint 포함)까지의 프레임당 시간을 측정합니다.
+- 전체 보기: 보유 캔들 전체가 화면에 들어오도록 축소 (LOD 다운샘플 적용)
+- 최근 200봉: 기본 줌 상태 (실시간 추종)
+- 비교(LOD 없음): 같은 아이템에서 다운샘플을 끄고 보이는 캔들을 모두 그리는 경우 (전체 보기)
+
+실행: QT_QPA_PLATFORM=offscreen python tests/performance/benchmark_chart_lod_streaming.py
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from statistics import median
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from upbit_auto_trading.infrastructure.chart.lod_candlestick_item import LodCandlestickItem, LodVolumeItem  # noqa: E402
+from upbit_auto_trading.infrastructure.chart_viewer.candle_array_loader import CandleArrays  # noqa: E402
+from upbit_auto_trading.ui.desktop.screens.chart_view.widgets.finplot_candlestick_widget import (  # noqa: E402
+    FinplotCandlestickWidget
+)
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "history_lengths": [1_000, 10_000, 100_000, 500_000],
+    "no_lod_max_length": 100_000,  # LOD 없음 비교는 이 길이까지만 (그 이상은 너무 느림)
+    "frames": 60,
+    "trades_per_frame": 16,
+    "window_size": (1200, 700),
+}
+
+
+def synthetic_history(count: int, seed: int = 1) -> CandleArrays:
+    """랜덤워크 1분봉 히스토리"""
+    rng = np.random.default_rng(seed)
+    start_ms = 1_600_000_000_000
+    times = start_ms + 60_000 * np.arange(count, dtype=np.float64)
+    closes = 50_000_000 * np.exp(np.cumsum(rng.normal(0, 0.001, count)))
+    opens = np.concatenate(([closes[0]], closes[:-1]))
+    spread = np.abs(rng.normal(0, 0.0008, count)) * closes
+    highs = np.maximum(opens, closes) + spread
+    lows = np.minimum(opens, closes) - spread
+    volumes = rng.gamma(2.0, 0.5, count)
+    return CandleArrays(times, opens, highs, lows, closes, volumes)
+
+
+class _NoLodCandlestickItem(LodCandlestickItem):
+    """비교용: 다운샘플 없이 보이는 캔들을 모두 그림"""
+
+    def _visible_slice(self):
+        view_box = self.getViewBox()
+        if view_box is None or len(self._buffer) == 0:
+            return None
+        (x_min, x_max), _ = view_box.viewRange()
+        return self._buffer.lod_view(x_min, x_max, 1 << 40)
+
+
+class _NoLodVolumeItem(LodVolumeItem):
+    _visible_slice = _NoLodCandlestickItem._visible_slice
+
+
+def create_widget(app: QApplication, capacity: int) -> FinplotCandlestickWidget:
+    widget = FinplotCandlestickWidget(capacity=capacity)
+    widget.resize(*BENCHMARK_CONFIG["window_size"])
+    widget.show()
+    # 지연 초기 로드(테스트 데이터 폴백)가 끝날 때까지 대기
+    deadline = time.perf_counter() + 0.5
+    while time.perf_counter() < deadline:
+        app.processEvents()
+    widget._frame_timer.stop()  # 프레임은 벤치마크 루프에서 직접 호출
+    return widget
+
+
+def use_no_lod_items(widget: FinplotCandlestickWidget) -> None:
+    buffer = widget.get_buffer()
+    widget._price_plot.removeItem(widget._candle_item)
+    widget._volume_plot.removeItem(widget._volume_item)
+    widget._candle_item = _NoLodCandlestickItem(buffer)
+    widget._volume_item = _NoLodVolumeItem(buffer)
+    widget._price_plot.addItem(widget._candle_item)
+    widget._volume_plot.addItem(widget._volume_item)
+
+
+def measure_frames(app: QApplication, widget: FinplotCandlestickWidget, zoom_all: bool):
+    """프레임당 (체결 반영 + 다시 그리기) 시간 목록 (ms)"""
+    buffer = widget.get_buffer()
+    viewport = widget._chart_widget.viewport()
+    last_time, _, _, _, last_close, _ = buffer.bar(buffer.last_index)
+    trade_ms = last_time
+    price = last_close
+    rng = np.random.default_rng(3)
+
+    if zoom_all:
+        widget._auto_scroll_btn.setChecked(False)
+        widget._price_plot.setXRange(buffer.first_index - 0.5, buffer.last_index + 0.5, padding=0)
+    app.processEvents()
+    viewport.repaint()
+
+    samples = []
+    for _ in range(BENCHMARK_CONFIG["frames"]):
+        started = time.perf_counter()
+        for _ in range(BENCHMARK_CONFIG["trades_per_frame"]):
+            trade_ms += 250  # 초당 체결 64건 → 약 4초마다 새 1분봉
+            price *= 1 + rng.normal(0, 0.0002)
+            widget.apply_trade(price, 0.01, trade_ms)
+        widget._flush_frame()
+        app.processEvents()  # 대기 중인 뷰포트 갱신 → paint
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def describe(samples) -> str:
+    return f"중앙값 {median(samples):7.2f} ms | p95 {np.percentile(samples, 95):7.2f} ms"
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    config = BENCHMARK_CONFIG
+    width, height = config["window_size"]
+
+    print("=" * 88)
+    print(f"캔들 차트 재그리기 벤치마크 ({width}x{height} 오프스크린, 프레임당 체결 {config['trades_per_frame']}건)")
+    print("=" * 88)
+
+    for length in config["history_lengths"]:
+        history = synthetic_history(length)
+
+        widget = create_widget(app, capacity=length)
+        widget.load_arrays(history)
+        recent = measure_frames(app, widget, zoom_all=False)
+        overview = measure_frames(app, widget, zoom_all=True)
+        lod = widget._candle_item.last_slice
+        widget.cleanup()
+        widget.deleteLater()
+
+        print(f"\n히스토리 {length:>9,}개")
+        print(f"  최근 200봉         : {describe(recent)}")
+        print(f"  전체 보기 (LOD x{lod.scale:<5}, {len(lod):>4}봉): {describe(overview)}")
+
+        if length <= config["no_lod_max_length"]:
+            widget = create_widget(app, capacity=length)
+            widget.load_arrays(history)
+            use_no_lod_items(widget)
+            no_lod = measure_frames(app, widget, zoom_all=True)
+            widget.cleanup()
+            widget.deleteLater()
+            print(f"  전체 보기 (LOD 없음, {length:>7,}봉): {describe(no_lod)}")
+        app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
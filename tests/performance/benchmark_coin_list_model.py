@@ -0,0 +1,172 @@
+"""
+벤치마크: 코인 리스트 UI 스레드 시간 (전체 KRW 마켓 티커 스트림 재생)
+
+합성 티커 스트림(200개 마켓, 초당 1,000건)을 CoinListService._on_ticker_update에 재생하며
+시뮬레이션 1초당 UI 스레드에서 소비한 시간을 측정합니다 (qasync 단일 스레드 가정).
+- 기존 방식: 티커마다 전체 목록 정렬 콜백 → QListWidget.clear() + 모든 아이템 재생성
+- 모델 방식: 변경분 콜백 → CoinListTableModel 적재 → 16ms 프레임마다 변경 행만 반영 (QTableView)
+
+실행: QT_QPA_PLATFORM=offscreen python tests/performance/benchmark_coin_list_model.py
+"""
+
+import os
+import sys
+import random
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from PyQt6.QtCore import Qt  # noqa: E402
+from PyQt6.QtGui import QColor, QFont  # noqa: E402
+from PyQt6.QtWidgets import QApplication, QHeaderView, QListWidget, QListWidgetItem, QTableView  # noqa: E402
+
+from upbit_auto_trading.application.chart_viewer.coin_list_service import CoinListService  # noqa: E402
+from upbit_auto_trading.ui.desktop.screens.chart_view.widgets.coin_list_model import (  # noqa: E402
+    CoinFilterProxyModel, CoinListTableModel
+)
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "market_count": 200,
+    "ticks_per_second": 1000,
+    "model_seconds": 10,
+    "legacy_seconds": 2,  # 기존 방식은 느려서 짧게 측정
+    "frame_interval": 1 / 60,
+}
+
+
+def build_markets(rng: random.Random):
+    markets = {}
+    for index in range(BENCHMARK_CONFIG["market_count"]):
+        symbol = f"KRW-C{index:03d}"
+        markets[symbol] = {
+            'market': symbol,
+            'korean_name': f"코인{index:03d}",
+            'english_name': f"C{index:03d}",
+            'market_warning': 'NONE',
+            'trade_price': rng.uniform(10, 100_000_000),
+            'change_rate': rng.uniform(0, 0.1),
+            'change_price': 0,
+            'change': rng.choice(['RISE', 'FALL', 'EVEN']),
+            'acc_trade_price_24h': rng.uniform(1e8, 5e11),
+        }
+    return markets
+
+
+def ticker_stream(rng: random.Random, markets, count: int):
+    """거래가 상위 마켓에 몰리는 형태의 티커 이벤트 생성"""
+    symbols = sorted(markets, key=lambda s: -markets[s]['acc_trade_price_24h'])
+    weights = [1 / (rank + 1) for rank in range(len(symbols))]
+    for symbol in rng.choices(symbols, weights=weights, k=count):
+        data = markets[symbol]
+        data['trade_price'] *= 1 + rng.uniform(-0.001, 0.001)
+        data['change_rate'] = abs(data['change_rate'] + rng.uniform(-0.0005, 0.0005))
+        data['acc_trade_price_24h'] += rng.uniform(1e5, 1e8)
+        ticker_fields = {k: v for k, v in data.items()
+                         if k not in ('market', 'korean_name', 'english_name', 'market_warning')}
+        yield SimpleNamespace(symbol=symbol, **ticker_fields)
+
+
+def create_service(markets) -> CoinListService:
+    service = CoinListService()
+    for symbol, data in markets.items():
+        service._market_ticker_cache[symbol] = dict(data)
+        service._coin_info_cache[symbol] = service._create_coin_info_from_combined(data)
+    return service
+
+
+def legacy_rebuild(list_widget: QListWidget, coins) -> None:
+    """기존 CoinListWidget._update_ui와 같은 방식의 전체 재생성"""
+    list_widget.clear()
+    for coin in coins:
+        item = QListWidgetItem(f"☆ {coin.symbol} - {coin.name} | {coin.price_formatted} | ({coin.change_rate})")
+        item.setData(Qt.ItemDataRole.UserRole, coin.symbol)
+        font = QFont()
+        font.setBold(True)
+        item.setFont(font)
+        if coin.change_rate.startswith('+'):
+            item.setForeground(QColor(185, 28, 28))
+        elif coin.change_rate.startswith('-'):
+            item.setForeground(QColor(29, 78, 216))
+        list_widget.addItem(item)
+
+
+def run_legacy(app: QApplication, markets, seconds: int) -> float:
+    service = create_service(markets)
+    list_widget = QListWidget()
+    list_widget.resize(420, 800)
+    list_widget.show()
+    service.register_update_callback(lambda coins: legacy_rebuild(list_widget, coins))
+
+    rng = random.Random(7)
+    ticks = BENCHMARK_CONFIG["ticks_per_second"] * seconds
+    frame_every = int(BENCHMARK_CONFIG["ticks_per_second"] * BENCHMARK_CONFIG["frame_interval"])
+    started = time.perf_counter()
+    for index, event in enumerate(ticker_stream(rng, markets, ticks)):
+        service._on_ticker_update(event)
+        if index % frame_every == 0:
+            app.processEvents()
+    app.processEvents()
+    return (time.perf_counter() - started) / seconds
+
+
+def run_model(app: QApplication, markets, seconds: int):
+    service = create_service(markets)
+    model = CoinListTableModel(frame_interval_ms=16)
+    proxy = CoinFilterProxyModel()
+    proxy.setSourceModel(model)
+    model.set_sort_mode("volume")
+    model.set_coins(service._coin_info_cache.values())
+    service.register_change_callback(model.enqueue_updates)
+
+    view = QTableView()
+    view.verticalHeader().hide()
+    view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    view.verticalHeader().setDefaultSectionSize(22)
+    view.setModel(proxy)
+    view.resize(420, 800)
+    view.show()
+
+    rng = random.Random(7)
+    ticks = BENCHMARK_CONFIG["ticks_per_second"] * seconds
+    frame_every = int(BENCHMARK_CONFIG["ticks_per_second"] * BENCHMARK_CONFIG["frame_interval"])
+    started = time.perf_counter()
+    for index, event in enumerate(ticker_stream(rng, markets, ticks)):
+        service._on_ticker_update(event)
+        if index % frame_every == 0:
+            # 실제 환경에서는 flush 타이머가 프레임마다 호출
+            model.flush_pending()
+            app.processEvents()
+    model.flush_pending()
+    app.processEvents()
+    return (time.perf_counter() - started) / seconds, dict(model.stats)
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    config = BENCHMARK_CONFIG
+
+    print("=" * 80)
+    print(f"코인 리스트 벤치마크 ({config['market_count']}개 마켓, 초당 티커 {config['ticks_per_second']:,}건, "
+          f"거래대금순 정렬)")
+    print("=" * 80)
+
+    legacy_per_second = run_legacy(app, build_markets(random.Random(1)), config["legacy_seconds"])
+    print(f"기존 방식 (전체 정렬 + QListWidget 재생성): UI 스레드 {legacy_per_second * 1000:8.1f} ms / 초")
+
+    model_per_second, stats = run_model(app, build_markets(random.Random(1)), config["model_seconds"])
+    print(f"모델 방식 (변경 행만 갱신, 프레임 합침)   : UI 스레드 {model_per_second * 1000:8.1f} ms / 초")
+    print(f"\n모델 통계: 수신 {stats['updates_received']:,} | 반영 행 {stats['rows_changed']:,} | "
+          f"이동 {stats['rows_moved']:,} | 프레임 {stats['flushes']:,}")
+
+
+if __name__ == "__main__":
+    main()
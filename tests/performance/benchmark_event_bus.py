@@ -0,0 +1,150 @@
+"""
+벤치마크: InMemoryEventBus 디스패치 처리량 (events/sec)
+
+구독자 수 1 / 10 / 50 에서 이벤트 발행 → 전체 핸들러 처리 완료까지의 처리량을 측정합니다.
+- 핸들러 프로파일 2종: 즉시 반환(no-op) / I/O 대기(await asyncio.sleep)
+- 구독 절반은 기반 이벤트 클래스에 등록 (MRO 디스패치 경로 확인)
+- 구독 priority는 3개 계층으로 분산 (계층 내 동시 실행)
+- 메모리 저장소로 이벤트당 처리 완료 표시 횟수 확인
+
+실행: python tests/performance/benchmark_event_bus.py
+"""
+
+import sys
+import asyncio
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from upbit_auto_trading.domain.events.base_domain_event import DomainEvent  # noqa: E402
+from upbit_auto_trading.infrastructure.events.bus.in_memory_event_bus import InMemoryEventBus  # noqa: E402
+from upbit_auto_trading.infrastructure.events.bus.event_bus_interface import (  # noqa: E402
+    IEventStorage, EventProcessingResult
+)
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "subscriber_counts": [1, 10, 50],
+    "handler_profiles": [
+        # (이름, 이벤트 수, 핸들러 I/O 대기 초)
+        ("no-op", 20000, 0.0),
+        ("I/O 1ms", 1000, 0.001),
+    ],
+    "worker_count": 4,
+    "batch_size": 50,
+}
+
+
+@dataclass(frozen=True)
+class BenchmarkBaseEvent(DomainEvent):
+    """기반 클래스 구독 대상"""
+    sequence: int = 0
+
+    @property
+    def event_type(self) -> str:
+        return "BenchmarkBaseEvent"
+
+    @property
+    def aggregate_id(self) -> str:
+        return f"benchmark-{self.sequence}"
+
+
+@dataclass(frozen=True)
+class BenchmarkTickEvent(BenchmarkBaseEvent):
+    """실제 발행되는 하위 이벤트"""
+
+    @property
+    def event_type(self) -> str:
+        return "BenchmarkTickEvent"
+
+
+class CountingEventStorage(IEventStorage):
+    """처리 완료 표시 횟수만 세는 메모리 저장소"""
+
+    def __init__(self):
+        self.store_count = 0
+        self.ack_count = 0
+
+    async def store_event(self, event: DomainEvent) -> str:
+        self.store_count += 1
+        return event.event_id
+
+    async def get_event(self, event_id: str) -> Optional[DomainEvent]:
+        return None
+
+    async def get_events_by_aggregate(self, aggregate_id: str, aggregate_type: str) -> List[DomainEvent]:
+        return []
+
+    async def get_unprocessed_events(self, limit: int = 100) -> List[DomainEvent]:
+        return []
+
+    async def mark_event_processed(self, event_id: str, result: EventProcessingResult) -> None:
+        self.ack_count += 1
+
+
+async def run_case(subscriber_count: int, event_count: int, io_delay: float) -> dict:
+    storage = CountingEventStorage()
+    bus = InMemoryEventBus(
+        event_storage=storage,
+        max_queue_size=event_count + 1,
+        worker_count=BENCHMARK_CONFIG["worker_count"],
+        batch_size=BENCHMARK_CONFIG["batch_size"],
+        batch_timeout_seconds=0.05,
+    )
+
+    handled = [0]
+
+    async def handler(event):
+        if io_delay:
+            await asyncio.sleep(io_delay)
+        handled[0] += 1
+
+    for i in range(subscriber_count):
+        event_type = BenchmarkBaseEvent if i % 2 else BenchmarkTickEvent
+
+        # 핸들러마다 다른 함수 객체여야 subscription_id가 구분됨
+        async def subscriber(event, _handler=handler):
+            await _handler(event)
+        bus.subscribe(event_type, subscriber, priority=i % 3)
+
+    events = [BenchmarkTickEvent(sequence=i) for i in range(event_count)]
+
+    await bus.start()
+    started = time.perf_counter()
+    await bus.publish_batch(events)
+    while bus.get_statistics()['events_processed'] < len(events):
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - started
+    await bus.stop()
+
+    return {
+        "subscribers": subscriber_count,
+        "events_per_sec": len(events) / elapsed,
+        "handler_calls": handled[0],
+        "storage_acks": storage.ack_count,
+    }
+
+
+async def main():
+    print("=" * 80)
+    print("InMemoryEventBus 벤치마크")
+    print("=" * 80)
+    for profile_name, event_count, io_delay in BENCHMARK_CONFIG["handler_profiles"]:
+        print(f"\n[핸들러 {profile_name}] 이벤트 {event_count:,}개")
+        for subscriber_count in BENCHMARK_CONFIG["subscriber_counts"]:
+            result = await run_case(subscriber_count, event_count, io_delay)
+            print(
+                f"  구독자 {result['subscribers']:>3}개: {result['events_per_sec']:>10,.0f} events/sec | "
+                f"핸들러 호출 {result['handler_calls']:,} | 저장소 ack {result['storage_acks']:,}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
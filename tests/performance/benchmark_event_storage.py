@@ -0,0 +1,117 @@
+"""
+벤치마크: SqliteEventStorage 그룹 커밋 처리량
+
+이벤트 저장 + 처리 완료 표시(이벤트당 1회) 버스트를 기록하고, 집합체별 재생 시간을 측정합니다.
+- flush_batch_size=1 은 이벤트마다 커밋하는 기존 방식과 같은 쓰기 패턴
+- 임시 파일 DB 사용 (WAL, synchronous=NORMAL - DatabaseManager 기본 설정)
+
+실행: python tests/performance/benchmark_event_storage.py
+"""
+
+import sys
+import asyncio
+import sqlite3
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from upbit_auto_trading.domain.events.base_domain_event import DomainEvent  # noqa: E402
+from upbit_auto_trading.infrastructure.database.database_manager import DatabaseManager  # noqa: E402
+from upbit_auto_trading.infrastructure.events.bus.event_bus_interface import EventProcessingResult  # noqa: E402
+from upbit_auto_trading.infrastructure.events.storage.sqlite_event_storage import SqliteEventStorage  # noqa: E402
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "event_count": 5000,
+    "aggregate_count": 50,
+    "flush_batch_sizes": [1, 20, 100, 500],
+    "flush_interval_ms": 50.0,
+}
+
+
+@dataclass(frozen=True)
+class BenchmarkOrderEvent(DomainEvent):
+    """벤치마크용 주문 이벤트"""
+    order_id: str = ""
+    market: str = "KRW-BTC"
+    price: float = 0.0
+    volume: float = 0.0
+
+    @property
+    def event_type(self) -> str:
+        return "BenchmarkOrderEvent"
+
+    @property
+    def aggregate_id(self) -> str:
+        return self.order_id
+
+
+async def run_case(flush_batch_size: int, workdir: Path) -> dict:
+    db_path = workdir / f"events_{flush_batch_size}.sqlite3"
+    sqlite3.connect(db_path).close()
+    db_manager = DatabaseManager({"strategies": str(db_path)})
+    storage = SqliteEventStorage(
+        db_manager,
+        flush_batch_size=flush_batch_size,
+        flush_interval_ms=BENCHMARK_CONFIG["flush_interval_ms"],
+    )
+
+    events = [
+        BenchmarkOrderEvent(
+            order_id=f"order-{i % BENCHMARK_CONFIG['aggregate_count']}",
+            price=100_000_000 + i, volume=0.001 * (i % 7 + 1)
+        )
+        for i in range(BENCHMARK_CONFIG["event_count"])
+    ]
+
+    started = time.perf_counter()
+    for event in events:
+        await storage.store_event(event)
+        await storage.mark_event_processed(
+            event.event_id, EventProcessingResult(event_id=event.event_id, success=True)
+        )
+    await storage.flush()
+    write_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    replayed = 0
+    for aggregate_index in range(BENCHMARK_CONFIG["aggregate_count"]):
+        replayed += len(await storage.get_events_by_aggregate(f"order-{aggregate_index}", "BenchmarkOrderEvent"))
+    replay_elapsed = time.perf_counter() - started
+
+    stats = await storage.get_event_statistics()
+    db_manager.close_all()
+
+    return {
+        "flush_batch_size": flush_batch_size,
+        "events_per_sec": len(events) / write_elapsed,
+        "flush_count": stats["write_stats"]["flush_count"],
+        "replayed": replayed,
+        "replay_ms_per_aggregate": replay_elapsed * 1000 / BENCHMARK_CONFIG["aggregate_count"],
+        "unprocessed": stats["unprocessed_events"],
+    }
+
+
+async def main():
+    print("=" * 80)
+    print(f"SqliteEventStorage 벤치마크 (이벤트 {BENCHMARK_CONFIG['event_count']:,}개 + 처리 마커)")
+    print("=" * 80)
+    with tempfile.TemporaryDirectory() as tmp:
+        for flush_batch_size in BENCHMARK_CONFIG["flush_batch_sizes"]:
+            result = await run_case(flush_batch_size, Path(tmp))
+            print(
+                f"flush {result['flush_batch_size']:>4}개: {result['events_per_sec']:>9,.0f} events/sec | "
+                f"커밋 {result['flush_count']:>5}회 | 재생 {result['replayed']:,}개 "
+                f"({result['replay_ms_per_aggregate']:.2f}ms/집합체) | 미처리 {result['unprocessed']}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
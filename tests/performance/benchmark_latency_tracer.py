@@ -0,0 +1,123 @@
+"""
+벤치마크: LatencyTracer 스팬 오버헤드 (비활성 / 활성)
+
+- 빈 with 블록 기준선 대비 span() 추가 비용 (ns/스팬)
+- traced 데코레이터 추가 비용
+- 히스토그램 record() 단독 비용, 분위수 계산·Prometheus 렌더링 비용
+
+목표: 활성 스팬 < 1 µs, 비활성 스팬은 플래그 확인 수준
+
+실행: python tests/performance/benchmark_latency_tracer.py
+"""
+
+import sys
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from upbit_auto_trading.infrastructure.logging.performance.latency_tracer import LatencyTracer, render_prometheus  # noqa: E402
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "iterations": 100_000,
+    "repeats": 15,                # 기준선/대상 교차 반복 측정 후 각각 최솟값 사용 (스케줄링 잡음 제거)
+    "operations": 20,             # Prometheus 렌더링 대상 히스토그램 수
+}
+
+
+def overhead_ns(func, baseline, iterations, repeats):
+    """func 의 호출당 시간 - baseline 호출당 시간 (교차 측정으로 부하 변동 영향 축소)"""
+    best, best_baseline = float("inf"), float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter_ns()
+        baseline(iterations)
+        best_baseline = min(best_baseline, (time.perf_counter_ns() - started) / iterations)
+        started = time.perf_counter_ns()
+        func(iterations)
+        best = min(best, (time.perf_counter_ns() - started) / iterations)
+    return best - best_baseline
+
+
+def main():
+    config = BENCHMARK_CONFIG
+    iterations, repeats = config["iterations"], config["repeats"]
+    tracer = LatencyTracer()
+    null = nullcontext()
+
+    def baseline_with(n):
+        for _ in range(n):
+            with null:
+                pass
+
+    def traced_span(n):
+        span = tracer.span
+        for _ in range(n):
+            with span("bench.span"):
+                pass
+
+    @tracer.traced("bench.decorated")
+    def decorated():
+        return None
+
+    def plain():
+        return None
+
+    def call_decorated(n):
+        for _ in range(n):
+            decorated()
+
+    def call_plain(n):
+        for _ in range(n):
+            plain()
+
+    histogram = tracer.histogram("bench.record")
+
+    def record(n):
+        record_ns = histogram.record
+        for i in range(n):
+            record_ns(1_000 + i)
+
+    def empty_loop(n):
+        for _ in range(n):
+            pass
+
+    print("=" * 80)
+    print("LatencyTracer 스팬 오버헤드 벤치마크")
+    print("=" * 80)
+
+    tracer.disable()
+    disabled_span = overhead_ns(traced_span, baseline_with, iterations, repeats)
+    disabled_decorator = overhead_ns(call_decorated, call_plain, iterations, repeats)
+
+    tracer.enable()
+    enabled_span = overhead_ns(traced_span, baseline_with, iterations, repeats)
+    enabled_decorator = overhead_ns(call_decorated, call_plain, iterations, repeats)
+    record_only = overhead_ns(record, empty_loop, iterations, repeats)
+
+    print(f"  비활성 span()     {disabled_span:>8.0f} ns/스팬")
+    print(f"  비활성 @traced    {disabled_decorator:>8.0f} ns/호출")
+    print(f"  활성 span()       {enabled_span:>8.0f} ns/스팬   "
+          f"{'✅ < 1 µs' if enabled_span < 1000 else '❌ ≥ 1 µs'}")
+    print(f"  활성 @traced      {enabled_decorator:>8.0f} ns/호출")
+    print(f"  record() 단독     {record_only:>8.0f} ns/샘플")
+
+    for i in range(config["operations"]):
+        tracer.histogram(f"bench.op{i}").record(1_000 * (i + 1))
+    started = time.perf_counter()
+    snapshots = tracer.snapshots()
+    text = render_prometheus(snapshots)
+    export_ms = (time.perf_counter() - started) * 1000
+    summary = snapshots["bench.span"].to_summary()
+    print(f"  스냅샷+Prometheus 렌더링 ({len(snapshots)}개 히스토그램) {export_ms:.2f} ms, {len(text):,} bytes")
+    print(f"  bench.span 분위수: p50={summary['p50_ms'] * 1e6:.0f}ns p99={summary['p99_ms'] * 1e6:.0f}ns "
+          f"(건수 {summary['count']:,})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+벤치마크: 실시간 체결 → 캔들 집계 (LiveCandleAggregator) 전체 마켓 리플레이
+
+합성한 전체 마켓 체결 스트림(심볼별 활동도 편차, 무체결 구간 포함)을 이벤트 시각 순서로 재생합니다.
+1) 집계 핫패스만: on_trade 초당 처리 이벤트 수
+2) 집계 + flush: 이벤트 시각 1초마다 flush 하여 임시 market_data DB 의 candles_* 테이블에 배치 upsert
+   - 전체 초당 이벤트 수, flush 소요 시간 p50/p99/max, 봉 마감 → 커밋 지연 p50/p99, 저장 행 수
+
+실행: python tests/performance/benchmark_live_candle_aggregator.py
+"""
+
+import asyncio
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from upbit_auto_trading.infrastructure.database.database_manager import DatabaseManager  # noqa: E402
+from upbit_auto_trading.infrastructure.market_data.candle.live_candle_aggregator import LiveCandleAggregator  # noqa: E402
+from upbit_auto_trading.infrastructure.repositories.sqlite_candle_repository import SqliteCandleRepository  # noqa: E402
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "symbols": 200,               # 전체 KRW 마켓 규모
+    "simulated_seconds": 600,     # 리플레이 구간 (초)
+    "trades_per_second": 2_000,   # 전체 마켓 평균 체결 수/초 (상위 심볼에 몰림)
+    "timeframes": ("1s", "1m"),
+    "flush_every_seconds": 1,     # 이벤트 시각 기준 flush 주기
+    "seed": 0,
+}
+
+
+def generate_trades(config):
+    """(trade_ms, symbol, price, volume, sequential_id) 목록 - 이벤트 시각 순서"""
+    rng = random.Random(config["seed"])
+    symbols = [f"KRW-C{i:03d}" for i in range(config["symbols"])]
+    # Zipf 형태 활동도: 상위 몇 개 심볼이 대부분의 체결을 차지, 하위 심볼은 긴 무체결 구간
+    weights = [1.0 / (rank + 1) for rank in range(len(symbols))]
+    prices = {symbol: 1000.0 * (1 + rng.random() * 100) for symbol in symbols}
+    start_ms = int(datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+    total = config["simulated_seconds"] * config["trades_per_second"]
+
+    trades = []
+    offsets = sorted(rng.randrange(config["simulated_seconds"] * 1000) for _ in range(total))
+    chosen = rng.choices(symbols, weights=weights, k=total)
+    for seq, (offset, symbol) in enumerate(zip(offsets, chosen)):
+        price = prices[symbol] = max(1.0, prices[symbol] * (1 + rng.gauss(0, 0.0005)))
+        trades.append((start_ms + offset, symbol, round(price, 2), round(rng.random(), 6), seq))
+    return start_ms, trades
+
+
+def percentile(values, ratio):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))] if ordered else 0.0
+
+
+def run_hot_path(trades, timeframes):
+    aggregator = LiveCandleAggregator(repository=None, timeframes=timeframes)
+    on_trade = aggregator.on_trade
+    started = time.perf_counter()
+    for trade_ms, symbol, price, volume, seq in trades:
+        on_trade(symbol, trade_ms, price, volume, seq)
+    elapsed = time.perf_counter() - started
+    return elapsed, aggregator
+
+
+async def run_with_flush(trades, start_ms, config, repository):
+    aggregator = LiveCandleAggregator(repository, timeframes=config["timeframes"])
+    on_trade = aggregator.on_trade
+    flush_step_ms = config["flush_every_seconds"] * 1000
+    next_flush_ms = start_ms + flush_step_ms
+
+    started = time.perf_counter()
+    for trade_ms, symbol, price, volume, seq in trades:
+        if trade_ms >= next_flush_ms:
+            await aggregator.flush(now_ms=next_flush_ms)
+            next_flush_ms += flush_step_ms
+        on_trade(symbol, trade_ms, price, volume, seq)
+    await aggregator.flush(now_ms=next_flush_ms + 120_000)
+    elapsed = time.perf_counter() - started
+    return elapsed, aggregator
+
+
+async def main():
+    config = BENCHMARK_CONFIG
+    print("=" * 88)
+    print(f"실시간 캔들 집계 리플레이 벤치마크 (심볼 {config['symbols']}, "
+          f"{config['simulated_seconds']}초, 평균 {config['trades_per_second']:,} 체결/초, {config['timeframes']})")
+    print("=" * 88)
+
+    generate_started = time.perf_counter()
+    start_ms, trades = generate_trades(config)
+    print(f"체결 {len(trades):,}건 생성 ({time.perf_counter() - generate_started:.1f}s)")
+
+    elapsed, aggregator = run_hot_path(trades, config["timeframes"])
+    print("\n[1] 집계 핫패스 (DB 없음)")
+    print(f"  {len(trades) / elapsed:>12,.0f} 이벤트/초 | 이벤트당 {elapsed / len(trades) * 1e6:.2f} µs | "
+          f"마감 봉 {aggregator.stats.bars_closed:,} | 빈 봉 {aggregator.stats.empty_bars:,}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / "market_data.sqlite3"
+        sqlite3.connect(db_path).close()  # DatabaseManager 는 기존 파일만 연결
+        db_manager = DatabaseManager({"market_data": str(db_path)})
+        try:
+            repository = SqliteCandleRepository(db_manager)
+            elapsed, aggregator = await run_with_flush(trades, start_ms, config, repository)
+        finally:
+            db_manager.close_all()
+
+    stats = aggregator.stats
+    durations = list(stats.flush_duration_ms)
+    latencies = list(stats.close_to_commit_ms)
+    print(f"\n[2] 집계 + {config['flush_every_seconds']}초 주기 배치 upsert (임시 SQLite)")
+    print(f"  {len(trades) / elapsed:>12,.0f} 이벤트/초 | 총 {elapsed:.2f}s "
+          f"(실시간 대비 {config['simulated_seconds'] / elapsed:,.1f}배)")
+    print(f"  flush {stats.flushes:,}회 | 저장 {stats.rows_flushed:,}행 (실제 {stats.bars_closed:,} + 빈 {stats.empty_bars:,}) | "
+          f"부분 봉 제외 {stats.partial_bars_dropped}")
+    print(f"  flush 소요      p50 {percentile(durations, 0.5):7.2f} ms | p99 {percentile(durations, 0.99):7.2f} ms | "
+          f"max {max(durations, default=0.0):7.2f} ms")
+    print(f"  마감→커밋 지연  p50 {percentile(latencies, 0.5):7.2f} ms | p99 {percentile(latencies, 0.99):7.2f} ms "
+          f"(리플레이 속도 기준 - 실시간에서는 flush 주기가 상한)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,169 @@
+"""
+벤치마크: 로그 뷰어 모델 프레임 시간 (50만 라인 보존)
+
+LogListModel + QTableView(offscreen)에 50만 라인을 채운 뒤 다음 상황의 프레임 처리 시간을 측정합니다.
+- 라이브 추가: 프레임당 200라인 유입 (필터 없음 / 레벨+검색 필터 적용)
+- 필터 변경: 레벨 변경, 컴포넌트 변경, 검색어 타이핑(좁혀지는 필터), 검색어 삭제(캐시 재사용)
+- 뷰 렌더링: 맨 아래로 스크롤 후 repaint
+
+필터 재계산은 프레임 예산(8ms) 단위로 나뉘므로 '최대 프레임'과 '완료까지 프레임 수'를 함께 출력합니다.
+'뷰 포함' 시간에는 offscreen 래스터 repaint(1200x800) 비용이 포함됩니다.
+
+실행: QT_QPA_PLATFORM=offscreen python tests/performance/benchmark_log_viewer_model.py
+"""
+
+import os
+import sys
+import random
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from PyQt6.QtWidgets import QApplication, QHeaderView, QTableView  # noqa: E402
+
+from upbit_auto_trading.infrastructure.logging.live.indexed_log_store import LogFilter  # noqa: E402
+from upbit_auto_trading.infrastructure.logging.live.ui_live_log_handler import LiveLogBuffer  # noqa: E402
+from upbit_auto_trading.ui.widgets.logging.log_list_model import LogListModel  # noqa: E402
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "retained_lines": 500_000,
+    "lines_per_frame": 200,
+    "append_frames": 120,
+}
+
+COMPONENTS = [f"upbit.{name}" for name in (
+    "WebSocketClient", "OrderService", "CandleRepository", "StrategyEngine", "ChartView",
+    "RateLimiter", "EventBus", "Backtester", "CoinListService", "OrderbookWidget",
+)]
+LEVEL_WEIGHTS = (("DEBUG", 60), ("INFO", 30), ("WARNING", 7), ("ERROR", 2), ("CRITICAL", 1))
+WORDS = ("ticker", "order", "filled", "candle", "saved", "retry", "timeout", "signal", "rsi", "cross", "KRW-BTC",
+         "KRW-ETH", "latency", "snapshot", "reconnect")
+
+
+def generate_record(rng: random.Random, index: int):
+    level = rng.choices([lvl for lvl, _ in LEVEL_WEIGHTS], weights=[w for _, w in LEVEL_WEIGHTS])[0]
+    component = rng.choice(COMPONENTS)
+    message = " ".join(rng.choice(WORDS) for _ in range(6)) + f" #{index}"
+    line = f"2025-09-30 20:19:{index % 60:02d} - {component} - {level} - {message}"
+    return line, level, component
+
+
+def measure_frame(app: QApplication, model: LogListModel):
+    """(모델 처리 시간, 뷰 갱신 포함 전체 시간) ms"""
+    started = time.perf_counter()
+    model.process_frame()
+    model_done = time.perf_counter()
+    app.processEvents()
+    return (model_done - started) * 1000, (time.perf_counter() - started) * 1000
+
+
+def change_filter(app: QApplication, model: LogListModel, log_filter: LogFilter):
+    """set_filter 호출(첫 슬라이스 포함)부터 필터 작업 완료까지의 프레임 시간"""
+    started = time.perf_counter()
+    model.set_filter(log_filter)
+    model_done = time.perf_counter()
+    app.processEvents()
+    durations = [((model_done - started) * 1000, (time.perf_counter() - started) * 1000)]
+    return durations + run_until_idle(app, model)
+
+
+def run_until_idle(app: QApplication, model: LogListModel):
+    durations = []
+    while model.is_filtering:
+        durations.append(measure_frame(app, model))
+    return durations
+
+
+def report(name: str, durations):
+    if not durations:
+        print(f"{name:<28}: 즉시 완료")
+        return
+    model_times = sorted(d[0] for d in durations)
+    total_times = sorted(d[1] for d in durations)
+    print(f"{name:<28}: 프레임 {len(durations):>3}개 | 모델 p50 {model_times[len(model_times) // 2]:>5.2f}ms "
+          f"최대 {model_times[-1]:>5.2f}ms | 뷰 포함 p50 {total_times[len(total_times) // 2]:>5.2f}ms "
+          f"최대 {total_times[-1]:>5.2f}ms")
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    rng = random.Random(42)
+    config = BENCHMARK_CONFIG
+
+    print("=" * 88)
+    print(f"로그 뷰어 모델 벤치마크 (보존 {config['retained_lines']:,}라인, 프레임당 {config['lines_per_frame']}라인 유입)")
+    print("=" * 88)
+
+    buffer = LiveLogBuffer(max_lines=config["retained_lines"])
+    model = LogListModel(capacity=config["retained_lines"])
+    model.attach_live_buffer(buffer)
+    # EventDrivenLogViewerWidget과 같은 뷰 구성 (고정 행 높이 단일 컬럼 테이블)
+    view = QTableView()
+    view.horizontalHeader().hide()
+    view.horizontalHeader().setStretchLastSection(True)
+    view.verticalHeader().hide()
+    view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    view.verticalHeader().setDefaultSectionSize(18)
+    view.setModel(model)
+    view.resize(1200, 800)
+    view.show()
+
+    started = time.perf_counter()
+    for index in range(config["retained_lines"]):
+        buffer.append(*generate_record(rng, index))
+    model.process_frame()
+    print(f"초기 적재: {time.perf_counter() - started:.2f}s ({len(model.store):,}라인)")
+
+    counter = config["retained_lines"]
+
+    def append_frames(label: str):
+        nonlocal counter
+        durations = []
+        for _ in range(config["append_frames"]):
+            for _ in range(config["lines_per_frame"]):
+                buffer.append(*generate_record(rng, counter))
+                counter += 1
+            durations.append(measure_frame(app, model))
+            view.scrollToBottom()
+        report(label, durations)
+
+    append_frames("라이브 추가 (필터 없음, 링 축출 포함)")
+
+    report("레벨 필터 (WARNING 이상)", change_filter(app, model, LogFilter.create(levels=["WARNING", "ERROR", "CRITICAL"])))
+
+    narrowed = LogFilter.create(levels=["WARNING", "ERROR", "CRITICAL"], search_text="timeout")
+    report("검색어 추가 (좁혀지는 필터)", change_filter(app, model, narrowed))
+    append_frames("라이브 추가 (레벨+검색 필터)")
+
+    report("필터 해제", change_filter(app, model, LogFilter.create()))
+
+    report("컴포넌트 필터 (OrderService)", change_filter(app, model, LogFilter.create(component="orderservice")))
+
+    typed = []
+    for length in range(1, len("reconnect") + 1):
+        typed.extend(change_filter(app, model, LogFilter.create(search_text="reconnect"[:length])))
+    report("검색어 타이핑 'reconnect'", typed)
+
+    report("백스페이스 (캐시 재사용)", change_filter(app, model, LogFilter.create(search_text="reconnec")))
+
+    durations = []
+    for _ in range(30):
+        started = time.perf_counter()
+        view.scrollToBottom()
+        view.viewport().repaint()
+        elapsed = (time.perf_counter() - started) * 1000
+        durations.append((0.0, elapsed))
+    report("뷰 스크롤 + repaint", durations)
+    print(f"\n표시 행 {model.rowCount():,} / 보존 {len(model.store):,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+벤치마크: 로그 호출 지연 (동기 파일 핸들러 vs 큐 파이프라인)
+
+시뮬레이션 WebSocket 메시지 루프(asyncio)가 메시지마다 JSON 파싱 + 로그를 남기는 동안
+logger 호출 1회의 지연(p50/p99/최대)을 측정합니다.
+- 동기 모드: RotatingFileHandler + 세션 FileHandler 직접 부착 (기존 LoggingService 구성)
+- 큐 모드: QueuedLogHandler → LogQueuePipeline writer 스레드가 같은 두 핸들러에 배치 기록
+
+실행: python tests/performance/benchmark_logging_latency.py
+"""
+
+import sys
+import asyncio
+import json
+import logging
+import statistics
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from upbit_auto_trading.infrastructure.logging.performance.log_queue_pipeline import (  # noqa: E402
+    LogQueuePipeline, QueuedLogHandler
+)
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "message_count": 30000,
+    "burst_size": 200,           # 한 번에 도착하는 메시지 수 (WebSocket 버스트)
+    "debug_logs_per_message": 2,  # 메시지당 DEBUG 로그 수
+}
+
+SAMPLE_MESSAGE = json.dumps({
+    "type": "ticker", "code": "KRW-BTC", "trade_price": 143250000.0,
+    "signed_change_rate": 0.0123, "acc_trade_volume_24h": 2345.678, "timestamp": 1726900000000,
+})
+
+
+def build_file_handlers(log_dir: Path, name: str):
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+    main_handler = RotatingFileHandler(log_dir / f"{name}_application.log", maxBytes=10 * 1024 * 1024,
+                                       backupCount=5, encoding='utf-8')
+    session_handler = logging.FileHandler(log_dir / f"{name}_session.log", encoding='utf-8')
+    for handler in (main_handler, session_handler):
+        handler.setFormatter(formatter)
+        handler.setLevel(logging.DEBUG)
+    return main_handler, session_handler
+
+
+async def websocket_message_loop(logger: logging.Logger) -> list:
+    """버스트 단위로 도착하는 메시지를 처리하며 로그 호출 지연(ns) 수집"""
+    inbox: asyncio.Queue = asyncio.Queue()
+    latencies = []
+
+    async def producer():
+        for _ in range(BENCHMARK_CONFIG["message_count"] // BENCHMARK_CONFIG["burst_size"]):
+            for _ in range(BENCHMARK_CONFIG["burst_size"]):
+                inbox.put_nowait(SAMPLE_MESSAGE)
+            await asyncio.sleep(0)
+        inbox.put_nowait(None)
+
+    async def consumer():
+        sequence = 0
+        while True:
+            raw = await inbox.get()
+            if raw is None:
+                break
+            message = json.loads(raw)
+            sequence += 1
+            for _ in range(BENCHMARK_CONFIG["debug_logs_per_message"]):
+                started = time.perf_counter_ns()
+                logger.debug(f"📈 {message['code']} 체결가 {message['trade_price']:,.0f} (#{sequence})")
+                latencies.append(time.perf_counter_ns() - started)
+
+    await asyncio.gather(producer(), consumer())
+    return latencies
+
+
+def summarize(name: str, latencies: list, elapsed: float) -> None:
+    ordered = sorted(latencies)
+    p50 = ordered[len(ordered) // 2] / 1000
+    p99 = ordered[int(len(ordered) * 0.99)] / 1000
+    print(
+        f"{name:<8}: p50 {p50:>6.2f}µs | p99 {p99:>7.2f}µs | 최대 {ordered[-1] / 1000:>9.1f}µs | "
+        f"평균 {statistics.mean(ordered) / 1000:>6.2f}µs | 루프 총 {elapsed:.2f}s"
+    )
+
+
+async def main():
+    print("=" * 88)
+    print(f"로그 호출 지연 벤치마크 (메시지 {BENCHMARK_CONFIG['message_count']:,}개, "
+          f"메시지당 DEBUG {BENCHMARK_CONFIG['debug_logs_per_message']}회)")
+    print("=" * 88)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_dir = Path(tmp)
+
+        # 동기 모드
+        sync_logger = logging.getLogger("benchmark.sync")
+        sync_logger.propagate = False
+        sync_logger.setLevel(logging.DEBUG)
+        for handler in build_file_handlers(log_dir, "sync"):
+            sync_logger.addHandler(handler)
+
+        started = time.perf_counter()
+        latencies = await websocket_message_loop(sync_logger)
+        summarize("동기", latencies, time.perf_counter() - started)
+
+        # 큐 모드
+        main_handler, session_handler = build_file_handlers(log_dir, "queued")
+        pipeline = LogQueuePipeline({'main': main_handler, 'session': session_handler}, queue_size=100000)
+        pipeline.start()
+        queued_logger = logging.getLogger("benchmark.queued")
+        queued_logger.propagate = False
+        queued_logger.setLevel(logging.DEBUG)
+        queued_logger.addHandler(QueuedLogHandler(pipeline, level=logging.DEBUG))
+
+        started = time.perf_counter()
+        latencies = await websocket_message_loop(queued_logger)
+        summarize("큐", latencies, time.perf_counter() - started)
+        pipeline.shutdown()
+
+        stats = pipeline.get_statistics()
+        print(f"\n큐 통계: 기록 {stats['written']:,} | 배치 {stats['batches']:,} | 최대 깊이 {stats['max_queue_depth']:,} | "
+              f"드롭 {stats['dropped_overflow']:,} | DEBUG 샘플링 제외 {stats['sampled_out_debug']:,}")
+
+        # 과부하: 작은 큐에서 드롭/샘플링 동작 확인
+        main_handler, session_handler = build_file_handlers(log_dir, "overload")
+        pipeline = LogQueuePipeline({'main': main_handler, 'session': session_handler}, queue_size=500)
+        pipeline.start()
+        overload_logger = logging.getLogger("benchmark.overload")
+        overload_logger.propagate = False
+        overload_logger.setLevel(logging.DEBUG)
+        overload_logger.addHandler(QueuedLogHandler(pipeline, level=logging.DEBUG))
+        await websocket_message_loop(overload_logger)
+        pipeline.shutdown()
+        stats = pipeline.get_statistics()
+        print(f"과부하(큐 500): 기록 {stats['written']:,} | 드롭 {stats['dropped_overflow']:,} | "
+              f"DEBUG 샘플링 제외 {stats['sampled_out_debug']:,}")
+
+        for handler in (main_handler, session_handler):
+            handler.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
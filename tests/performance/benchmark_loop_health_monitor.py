@@ -0,0 +1,86 @@
+"""
+벤치마크: LoopHealthMonitor 콜백당 오버헤드
+
+- call_soon 으로 예약한 빈 콜백 N 개를 감시 없음 / 감시 중 각각 실행해 콜백당 추가 비용(ns) 비교
+- 느린 콜백이 없을 때 기록되는 이벤트가 0 건인지 확인
+
+목표: 콜백당 수백 ns 수준 (UI 프레임 16ms 대비 무시 가능)
+
+실행: python tests/performance/benchmark_loop_health_monitor.py
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from upbit_auto_trading.infrastructure.runtime.loop_health_monitor import LoopHealthMonitor  # noqa: E402
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "callbacks": 200_000,
+    "repeats": 7,                 # 기준선/감시 교차 반복 측정 후 각각 최솟값 사용
+    "slow_callback_threshold": 0.1,
+    "lag_interval": 0.25,
+}
+
+
+async def run_callbacks(count: int) -> float:
+    """빈 콜백 count 개 실행 시간 (ns/콜백)"""
+    loop = asyncio.get_running_loop()
+    done = loop.create_future()
+    remaining = [count]
+
+    def callback():
+        remaining[0] -= 1
+        if remaining[0] == 0:
+            done.set_result(None)
+
+    started = time.perf_counter_ns()
+    for _ in range(count):
+        loop.call_soon(callback)
+    await done
+    return (time.perf_counter_ns() - started) / count
+
+
+def main():
+    config = BENCHMARK_CONFIG
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    monitor = LoopHealthMonitor(loop, slow_callback_threshold=config["slow_callback_threshold"],
+                                lag_interval=config["lag_interval"])
+
+    print("=" * 80)
+    print(f"LoopHealthMonitor 오버헤드 벤치마크 (빈 콜백 {config['callbacks']:,}개)")
+    print("=" * 80)
+
+    best_baseline, best_monitored = float("inf"), float("inf")
+    for _ in range(config["repeats"]):
+        best_baseline = min(best_baseline, loop.run_until_complete(run_callbacks(config["callbacks"])))
+
+        async def monitored():
+            monitor.start()
+            try:
+                return await run_callbacks(config["callbacks"])
+            finally:
+                monitor.stop()
+
+        best_monitored = min(best_monitored, loop.run_until_complete(monitored()))
+    loop.close()
+
+    overhead = best_monitored - best_baseline
+    print(f"  감시 없음      {best_baseline:>8.0f} ns/콜백")
+    print(f"  감시 중        {best_monitored:>8.0f} ns/콜백")
+    print(f"  추가 비용      {overhead:>8.0f} ns/콜백")
+    print(f"  기록된 느린 콜백 {monitor.total_slow_callbacks}건 "
+          f"{'✅' if monitor.total_slow_callbacks == 0 else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+벤치마크: NormalizationService - 스칼라 반복(normalize_for_comparison) vs 배열 일괄 경로
+
+NormalizationMethod 별로 price_comparable ↔ percentage_comparable 교차 비교 값 1M 개를 정규화하고,
+정규화/역정규화 결과가 스칼라 경로와 원소별로 동일한지 표본 검증합니다.
+스칼라 경로는 전체 실행 시 수십 초가 걸리므로 scalar_sample 개만 측정해 1M 기준으로 환산합니다.
+
+실행: python tests/performance/benchmark_normalization_batch.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from upbit_auto_trading.domain.services.normalization_service import NormalizationMethod, NormalizationService  # noqa: E402
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "values": 1_000_000,
+    "scalar_sample": 50_000,      # 스칼라 경로 측정 표본 (1M 기준으로 환산)
+    "verify_sample": 20_000,      # 스칼라 경로와 결과 비교 표본
+    "group1": "price_comparable",
+    "group2": "percentage_comparable",
+    "seed": 0,
+}
+
+
+def main():
+    config = BENCHMARK_CONFIG
+    service = NormalizationService()
+    rng = np.random.default_rng(config["seed"])
+    n = config["values"]
+    prices = rng.lognormal(17.5, 0.6, n)          # 원화 가격대 (수천만 원)
+    oscillators = rng.uniform(0.0, 100.0, n)       # RSI 등 백분율 지표
+    group1, group2 = config["group1"], config["group2"]
+
+    print("=" * 88)
+    print(f"정규화 일괄 경로 벤치마크 ({group1} ↔ {group2}, 값 {n:,}개)")
+    print("=" * 88)
+    print(f"{'방법':<12}{'스칼라(1M 환산)':>16}{'일괄':>12}{'배속':>10}{'역정규화(일괄)':>16}   결과")
+
+    for method in NormalizationMethod:
+        sample = config["scalar_sample"]
+        started = time.perf_counter()
+        scalar = [service.normalize_for_comparison(p, group1, o, group2, method)
+                  for p, o in zip(prices[:sample].tolist(), oscillators[:sample].tolist())]
+        scalar_ms = (time.perf_counter() - started) * 1000 * n / sample
+
+        started = time.perf_counter()
+        batch = service.normalize_for_comparison_batch(prices, group1, oscillators, group2, method)
+        batch_ms = (time.perf_counter() - started) * 1000
+
+        restored, denormalize_ms = None, float('nan')
+        if batch.normalization_params1 is not None:
+            started = time.perf_counter()
+            restored = service.denormalize_array(batch.normalized_values1, group1, method,
+                                                 batch.normalization_params1)
+            denormalize_ms = (time.perf_counter() - started) * 1000
+
+        verify = config["verify_sample"]
+        matches = (np.array_equal(batch.normalized_values1[:verify], [r.normalized_value1 for r in scalar[:verify]])
+                   and np.array_equal(batch.normalized_values2[:verify],
+                                      [r.normalized_value2 for r in scalar[:verify]])
+                   and batch.warning_message == scalar[0].warning_message
+                   and batch.confidence_score == scalar[0].confidence_score)
+        if batch.normalization_params1 is not None:
+            expected = [service.denormalize_value(v, group1, method, batch.normalization_params1)
+                        for v in batch.normalized_values1[:verify].tolist()]
+            matches = matches and np.array_equal(restored[:verify], expected)
+        status = "동일" if matches else "불일치"
+        if batch.normalization_params1 is None:
+            status += f" (정규화 실패 경로: {batch.warning_message})"
+
+        print(f"{method.value:<12}{scalar_ms:>13,.0f} ms{batch_ms:>9.1f} ms{scalar_ms / batch_ms:>9,.0f}x"
+              f"{denormalize_ms:>13.1f} ms   {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+벤치마크: 호가창 UI 스레드 시간 (합성 호가 스트림 재생)
+
+30단계 호가 스트림(초당 240건, 대부분 최우선 근처 몇 개 레벨의 잔량 변화 + 가끔 가격 이동)을 재생하며
+시뮬레이션 1초당 UI 스레드에서 소비한 시간을 측정합니다 (qasync 단일 스레드 가정).
+- 기존 방식: 메시지마다 format_orderbook_for_table 전체 포맷 → QTableWidget 60행×4열 아이템 재생성 + 라벨 갱신
+- diff 방식: 메시지마다 OrderbookTableModel.apply_orderbook (변경 셀만, 프레임 합침 없음)
+- 모델 방식: 최신 스냅샷만 적재 → 16ms 프레임마다 변경 셀만 반영 (QTableView)
+
+실행: QT_QPA_PLATFORM=offscreen python tests/performance/benchmark_orderbook_model.py
+"""
+
+import os
+import sys
+import random
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from PyQt6.QtCore import Qt  # noqa: E402
+from PyQt6.QtGui import QColor  # noqa: E402
+from PyQt6.QtWidgets import QApplication, QHeaderView, QLabel, QTableView, QTableWidget, QTableWidgetItem  # noqa: E402
+
+from upbit_auto_trading.infrastructure.formatters.orderbook_formatter import OrderbookFormatter  # noqa: E402
+from upbit_auto_trading.ui.desktop.screens.chart_view.widgets.orderbook_table_model import OrderbookTableModel  # noqa: E402
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "depth": 30,
+    "messages_per_second": 240,  # 체결 폭주 구간의 활발한 마켓
+    "seconds": 5,
+    "mid_price": 50_000_000.0,
+    "tick": 1_000.0,           # 5천만원대 호가 단위
+    "shift_probability": 0.05,  # 메시지당 최우선 가격 이동 확률
+    "frame_interval": 1 / 60,
+}
+
+
+def orderbook_stream(rng: random.Random, count: int):
+    """최우선 근처 잔량이 주로 바뀌고 가끔 가격대가 한 틱 이동하는 호가 메시지 생성"""
+    config = BENCHMARK_CONFIG
+    depth, tick = config["depth"], config["tick"]
+    best_bid = config["mid_price"]
+    sizes = {}
+
+    def size_at(price):
+        if price not in sizes:
+            sizes[price] = round(rng.uniform(0.01, 3.0), 4)
+        return sizes[price]
+
+    for _ in range(count):
+        if rng.random() < config["shift_probability"]:
+            best_bid += tick * rng.choice((-1, 1))
+        for _ in range(rng.randint(1, 3)):
+            offset = min(int(rng.expovariate(0.5)), depth - 1)
+            price = best_bid + tick * (offset + 1) if rng.random() < 0.5 else best_bid - tick * offset
+            sizes[price] = round(rng.uniform(0.01, 3.0), 4)
+        asks = [best_bid + tick * (i + 1) for i in range(depth)]
+        bids = [best_bid - tick * i for i in range(depth)]
+        yield {
+            "symbol": "KRW-BTC",
+            "market": "KRW",
+            "asks": [{"price": p, "quantity": size_at(p), "total": size_at(p)} for p in asks],
+            "bids": [{"price": p, "quantity": size_at(p), "total": size_at(p)} for p in bids],
+        }
+
+
+def legacy_populate(table: QTableWidget, formatter: OrderbookFormatter, data) -> None:
+    """기존 OrderbookWidget._update_orderbook_display / _populate_table 과 같은 방식의 전체 재생성"""
+    table_data = formatter.format_orderbook_for_table(data)
+    max_quantity = max(max((a["quantity"] for a in data["asks"]), default=1),
+                       max((b["quantity"] for b in data["bids"]), default=1))
+    for row_idx, row_data in enumerate(table_data):
+        base_color = QColor("#FF4444") if formatter.get_table_row_type(row_idx) == "ask" else QColor("#4444FF")
+        quantity_text = str(row_data[1]).replace(",", "")
+        if quantity_text.endswith("K"):
+            quantity = float(quantity_text[:-1]) * 1000
+        elif quantity_text == "-":
+            quantity = 0
+        else:
+            quantity = float(quantity_text)
+        background_color = QColor(base_color)
+        background_color.setAlphaF(0.05 + (quantity / max_quantity) * 0.55)
+        for col_idx, cell_data in enumerate(row_data):
+            item = QTableWidgetItem(str(cell_data))
+            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+            if col_idx == 0:
+                item.setForeground(QColor("#888"))
+            elif col_idx == 1:
+                item.setBackground(background_color)
+                item.setForeground(QColor("#333"))
+            elif col_idx == 2:
+                item.setForeground(base_color)
+                item.setBackground(QColor(base_color.red(), base_color.green(), base_color.blue(), 50))
+                font = item.font()
+                font.setBold(True)
+                item.setFont(font)
+            else:
+                item.setBackground(QColor(base_color.red(), base_color.green(), base_color.blue(), 30))
+                item.setForeground(QColor("#666"))
+            table.setItem(row_idx, col_idx, item)
+
+
+def update_labels(formatter: OrderbookFormatter, labels, data) -> None:
+    spread_info = formatter.calculate_spread_info(data)
+    labels[0].setText(formatter.format_spread_text(spread_info, "KRW"))
+    labels[1].setText(formatter.format_price_info_text(spread_info, "KRW"))
+    labels[2].setText(formatter.format_market_info_text(data))
+
+
+def replay(app: QApplication, on_message, on_frame=None) -> float:
+    config = BENCHMARK_CONFIG
+    rng = random.Random(7)
+    count = config["messages_per_second"] * config["seconds"]
+    frame_every = max(1, int(config["messages_per_second"] * config["frame_interval"]))
+    started = time.perf_counter()
+    for index, data in enumerate(orderbook_stream(rng, count)):
+        on_message(data)
+        if index % frame_every == 0:
+            if on_frame:
+                on_frame()
+            app.processEvents()
+    if on_frame:
+        on_frame()
+    app.processEvents()
+    return (time.perf_counter() - started) / config["seconds"]
+
+
+def run_legacy(app: QApplication) -> float:
+    formatter = OrderbookFormatter()
+    table = QTableWidget(BENCHMARK_CONFIG["depth"] * 2, 4)
+    table.resize(420, 900)
+    table.show()
+    labels = [QLabel() for _ in range(3)]
+
+    def on_message(data):
+        legacy_populate(table, formatter, data)
+        update_labels(formatter, labels, data)
+
+    return replay(app, on_message)
+
+
+def create_view(model: OrderbookTableModel) -> QTableView:
+    view = QTableView()
+    view.verticalHeader().hide()
+    view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    view.verticalHeader().setDefaultSectionSize(24)
+    view.setModel(model)
+    view.resize(420, 900)
+    view.show()
+    return view
+
+
+def run_diff_only(app: QApplication):
+    formatter = OrderbookFormatter()
+    model = OrderbookTableModel(depth=BENCHMARK_CONFIG["depth"], formatter=formatter)
+    view = create_view(model)
+    labels = [QLabel() for _ in range(3)]
+
+    def on_message(data):
+        model.apply_orderbook(data)
+        update_labels(formatter, labels, data)
+
+    elapsed = replay(app, on_message)
+    view.close()
+    return elapsed, dict(model.stats)
+
+
+def run_model(app: QApplication):
+    formatter = OrderbookFormatter()
+    model = OrderbookTableModel(depth=BENCHMARK_CONFIG["depth"], formatter=formatter)
+    view = create_view(model)
+    labels = [QLabel() for _ in range(3)]
+    model.orderbook_applied.connect(lambda data: update_labels(formatter, labels, data))
+
+    # 실제 환경에서는 flush 타이머가 프레임마다 호출
+    elapsed = replay(app, model.enqueue_orderbook, model.flush_pending)
+    view.close()
+    return elapsed, dict(model.stats), model.text_cache_stats()
+
+
+def main():
+    import logging
+    logging.disable(logging.INFO)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    config = BENCHMARK_CONFIG
+    cells = config["depth"] * 2 * 4
+
+    print("=" * 80)
+    print(f"호가창 벤치마크 ({config['depth']}단계 × 매도/매수, 초당 호가 메시지 {config['messages_per_second']}건, "
+          f"{config['seconds']}초 재생)")
+    print("=" * 80)
+
+    legacy = run_legacy(app)
+    print(f"기존 방식 (전체 포맷 + QTableWidget 재생성) : UI 스레드 {legacy * 1000:8.1f} ms / 초 "
+          f"(셀 쓰기 {cells * config['messages_per_second']:,} / 초)")
+
+    diff_only, diff_stats = run_diff_only(app)
+    print(f"diff 방식 (변경 셀만, 메시지마다 반영)      : UI 스레드 {diff_only * 1000:8.1f} ms / 초 "
+          f"(셀 갱신 {diff_stats['cells_changed'] / config['seconds']:,.0f} / 초)")
+
+    model, stats, cache = run_model(app)
+    print(f"모델 방식 (변경 셀만 + 16ms 프레임 합침)    : UI 스레드 {model * 1000:8.1f} ms / 초 "
+          f"(셀 갱신 {stats['cells_changed'] / config['seconds']:,.0f} / 초)")
+    print(f"\n개선: {legacy / model:.1f}x | 모델 통계: 수신 {stats['messages_received']:,} | "
+          f"프레임 {stats['flushes']:,} | 변경 행 {stats['rows_changed']:,} | "
+          f"문자열 캐시 적중 {cache['hits']:,} / 미스 {cache['misses']:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+벤치마크: 페이퍼 트레이딩 거래소 시세 이벤트 처리 비용
+
+수백 개 마켓의 호가/체결 스트림(사전 생성)을 재생하며 마켓마다 대기 주문 수십 건을 유지합니다.
+- 이벤트당 처리 시간 분포 (p50 / p99 / 최대) 와 초당 처리량
+- 체결이 일어난 이벤트 비율, 주문 생성 / 취소 비용
+
+실행: python tests/performance/benchmark_paper_exchange.py
+"""
+
+import random
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from upbit_auto_trading.infrastructure.external_apis.upbit.paper_exchange import (  # noqa: E402
+    PaperExchange, PaperExchangeConfig
+)
+from upbit_auto_trading.infrastructure.logging.performance.latency_tracer import LatencyHistogram  # noqa: E402
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "markets": 300,
+    "orders_per_side": 10,      # 마켓별 매수/매도 대기 주문 수
+    "events": 200_000,
+    "trade_ratio": 0.6,         # 이벤트 중 체결 비율 (나머지는 호가 스냅샷)
+    "depth": 15,
+    "tick": 1_000.0,            # 100만원대 이상 호가 단위
+    "start_price": 3_000_000.0,
+    "replace_orders": 2_000,    # 재생 후 주문 생성/취소 측정 건수
+}
+
+
+def build_events(rng: random.Random):
+    """마켓별 랜덤 워크 호가/체결 이벤트 사전 생성 (재생 중 생성 비용 제외)"""
+    config = BENCHMARK_CONFIG
+    tick, depth = config["tick"], config["depth"]
+    markets = [f"KRW-C{i:03d}" for i in range(config["markets"])]
+    mids = {market: config["start_price"] for market in markets}
+    events = []
+    for _ in range(config["events"]):
+        market = rng.choice(markets)
+        if rng.random() < 0.1:
+            mids[market] += tick * rng.choice((-1, 1))
+        best_bid = mids[market]
+        if rng.random() < config["trade_ratio"]:
+            if rng.random() < 0.5:
+                events.append(("trade", market, (best_bid, round(rng.uniform(0.001, 0.5), 4), "ASK")))
+            else:
+                events.append(("trade", market, (best_bid + tick, round(rng.uniform(0.001, 0.5), 4), "BID")))
+        else:
+            units = [{"ask_price": best_bid + tick * (i + 1), "bid_price": best_bid - tick * i,
+                      "ask_size": round(rng.uniform(0.01, 2.0), 4), "bid_size": round(rng.uniform(0.01, 2.0), 4)}
+                     for i in range(depth)]
+            events.append(("orderbook", market, units))
+    return markets, events
+
+
+def seed_orders(exchange: PaperExchange, markets, rng: random.Random) -> None:
+    """마켓별 최우선 근처 ~ 먼 가격대에 매수/매도 대기 주문 배치"""
+    config = BENCHMARK_CONFIG
+    tick, start = config["tick"], config["start_price"]
+    for market in markets:
+        for _ in range(config["orders_per_side"]):
+            offset = int(rng.expovariate(0.3)) + 2
+            volume = str(round(rng.uniform(0.002, 0.05), 4))
+            exchange.handle_request("POST", "/orders", data={
+                "market": market, "side": "bid", "ord_type": "limit", "price": str(int(start - tick * offset)),
+                "volume": volume})
+            exchange.handle_request("POST", "/orders", data={
+                "market": market, "side": "ask", "ord_type": "limit", "price": str(int(start + tick * (offset + 1))),
+                "volume": volume})
+
+
+def summarize(histogram: LatencyHistogram) -> str:
+    snapshot = histogram.snapshot()
+    return (f"평균 {snapshot.mean_ns / 1000:6.2f} µs | p50 {snapshot.percentile_ns(0.5) / 1000:6.2f} µs | "
+            f"p99 {snapshot.percentile_ns(0.99) / 1000:6.2f} µs | 최대 {snapshot.max_ns / 1000:8.1f} µs")
+
+
+def main():
+    import logging
+    logging.disable(logging.INFO)
+
+    config = BENCHMARK_CONFIG
+    rng = random.Random(11)
+    markets, events = build_events(rng)
+
+    balances = {"KRW": Decimal("1000000000000")}
+    balances.update({market.split("-")[1]: Decimal("1000000") for market in markets})
+    exchange = PaperExchange(PaperExchangeConfig(initial_balances=balances))
+    seed_orders(exchange, markets, rng)
+    resting = exchange.get_status()["resting_orders"]
+
+    print("=" * 80)
+    print(f"페이퍼 트레이딩 거래소 벤치마크 (마켓 {config['markets']}개, 대기 주문 {resting:,}건, "
+          f"이벤트 {config['events']:,}건)")
+    print("=" * 80)
+
+    orderbook_latency = LatencyHistogram("orderbook")
+    trade_latency = LatencyHistogram("trade")
+    fill_events = 0
+    clock = time.perf_counter_ns
+    started = time.perf_counter()
+    for kind, market, payload in events:
+        begin = clock()
+        if kind == "trade":
+            fills = exchange.on_trade(market, *payload)
+            trade_latency.record(clock() - begin)
+        else:
+            fills = exchange.on_orderbook(market, payload)
+            orderbook_latency.record(clock() - begin)
+        if fills:
+            fill_events += 1
+    elapsed = time.perf_counter() - started
+
+    print(f"호가 스냅샷 ({orderbook_latency.count:,}건) : {summarize(orderbook_latency)}")
+    print(f"체결        ({trade_latency.count:,}건) : {summarize(trade_latency)}")
+    print(f"\n처리량: {config['events'] / elapsed:,.0f} 이벤트/초 (측정 포함 {elapsed:.2f}초) | "
+          f"체결 발생 이벤트 {fill_events:,}건 | 체결 {exchange.stats['fills']:,}건 | "
+          f"남은 대기 주문 {exchange.get_status()['resting_orders']:,}건")
+
+    # 주문 생성 / 취소 (대기 주문이 쌓인 상태에서)
+    place_latency = LatencyHistogram("place")
+    cancel_latency = LatencyHistogram("cancel")
+    placed = []
+    for index in range(config["replace_orders"]):
+        market = markets[index % len(markets)]
+        begin = clock()
+        order = exchange.handle_request("POST", "/orders", data={
+            "market": market, "side": "bid", "ord_type": "limit",
+            "price": str(int(config["start_price"] - config["tick"] * 40)), "volume": "0.01"})
+        place_latency.record(clock() - begin)
+        placed.append(order["uuid"])
+    for order_uuid in placed:
+        begin = clock()
+        exchange.handle_request("DELETE", "/order", params={"uuid": order_uuid})
+        cancel_latency.record(clock() - begin)
+
+    print(f"주문 생성   ({place_latency.count:,}건) : {summarize(place_latency)}")
+    print(f"주문 취소   ({cancel_latency.count:,}건) : {summarize(cancel_latency)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""
+벤치마크: 쿼리 결과 캐시 (QueryResultCache + CacheInvalidationService) - UI 세션 리플레이
+
+임시 strategies DB (benchmark_strategy_read_model 과 같은 데이터)에 대해 사용자가 화면을 오가며 발생시키는
+쿼리 흐름을 재생합니다.
+- 전략 목록 페이지 이동/필터, 전략 상세 열람 (인기 전략 편중), 대시보드 새로고침
+- 중간중간 쓰기: 백테스트 완료(결과 INSERT + StrategyBacktestCompleted 발행), 전략 수정(UPDATE + StrategyUpdated 발행)
+
+같은 세션을 QueryServiceContainer 로 세 가지 구성에서 실행합니다.
+1) 캐시 없음  2) 메모리 캐시  3) 메모리 + 디스크 계층 (재시작 직후 세션 - 디스크 적중으로 시작)
+
+출력: Repository 호출 수, 쿼리 지연 p50/p95/총합, 캐시 적중률/무효화 통계, 결과 일치 여부
+
+실행: python tests/performance/benchmark_query_cache.py
+"""
+
+import dataclasses
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from tests.performance.benchmark_strategy_read_model import (  # noqa: E402
+    BaselineBacktestRepository, BaselineStrategyRepository, BaselineTriggerRepository, populate
+)
+from upbit_auto_trading.application.caching.cache_invalidation_service import CacheInvalidationService  # noqa: E402
+from upbit_auto_trading.application.caching.query_result_cache import QueryResultCache  # noqa: E402
+from upbit_auto_trading.application.queries.dto.dashboard_query_dto import DashboardQuery  # noqa: E402
+from upbit_auto_trading.application.queries.dto.strategy_query_dto import (  # noqa: E402
+    StrategyDetailQuery, StrategyListQuery, StrategySortField
+)
+from upbit_auto_trading.application.queries.query_container import QueryServiceContainer  # noqa: E402
+from upbit_auto_trading.domain.events.domain_event_publisher import DomainEventPublisher  # noqa: E402
+from upbit_auto_trading.domain.events.strategy_events import StrategyBacktestCompleted, StrategyUpdated  # noqa: E402
+from upbit_auto_trading.infrastructure.database.database_manager import DatabaseManager  # noqa: E402
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "strategies": 1_000,
+    "conditions_per_strategy": 4,
+    "backtests": 10_000,
+    "history_days": 120,
+    "page_size": 20,
+    "session_actions": 2_000,     # 세션 동안의 사용자 동작 수
+    "write_ratio": 0.03,          # 동작 중 쓰기(이벤트 발행) 비율
+    "hot_strategies": 40,         # 상세 열람이 몰리는 전략 수
+    "seed": 0,
+}
+
+
+# ================================================================
+# Repository: 상세 조회용 메서드 추가 + 호출 수 집계
+# ================================================================
+
+def strategy_key(row_id) -> str:
+    """DB 정수 ID → 도메인 전략 ID (StrategyId 는 영문자로 시작해야 함)"""
+    return f"S{row_id:05d}"
+
+
+def row_id(strategy_id) -> int:
+    """StrategyId / 엔티티 ID / 정수(대시보드 백테스트의 strategy_id) 모두 허용"""
+    value = getattr(strategy_id, 'value', strategy_id)
+    return int(value[1:]) if isinstance(value, str) and value.startswith('S') else int(value)
+
+
+class DetailStrategyRepository(BaselineStrategyRepository):
+    def find_by_id(self, strategy_id):
+        rows = self._db.execute_query('strategies', "SELECT * FROM strategies WHERE id = ?", (row_id(strategy_id),))
+        if not rows:
+            return None
+        entity = self._to_entity(rows[0], [])
+        entity.strategy_id = SimpleNamespace(value=strategy_key(rows[0]['id']))
+        entity.description = rows[0]['description']
+        return entity
+
+
+class DetailTriggerRepository(BaselineTriggerRepository):
+    def find_by_strategy_id(self, strategy_id):
+        rows = self._db.execute_query(
+            'strategies',
+            "SELECT id, condition_name, condition_type, left_variable, operator, right_value, is_enabled "
+            "FROM strategy_conditions WHERE strategy_id = ?", (row_id(strategy_id),)
+        )
+        return [SimpleNamespace(
+            trigger_id=SimpleNamespace(value=str(row['id'])), trigger_name=row['condition_name'],
+            variable=SimpleNamespace(variable_id=row['left_variable']), operator=SimpleNamespace(value=row['operator']),
+            target_value=row['right_value'], trigger_type=SimpleNamespace(value=row['condition_type']),
+            is_active=bool(row['is_enabled'])
+        ) for row in rows]
+
+
+class DetailBacktestRepository(BaselineBacktestRepository):
+    def find_by_strategy_id(self, strategy_id, limit=None):
+        sql = f"SELECT {self._COLUMNS} AND strategy_id = ? ORDER BY end_time DESC"
+        params = (row_id(strategy_id),)
+        if limit:
+            sql += " LIMIT ?"
+            params += (limit,)
+        return [SimpleNamespace(**vars(self._to_result(row)), total_trades=0)
+                for row in self._db.execute_query('strategies', sql, params)]
+
+
+class CountingRepository:
+    """Repository 메서드 호출 수 집계 프록시"""
+
+    def __init__(self, inner, counter: Counter, name: str):
+        self._inner = inner
+        self._counter = counter
+        self._name = name
+
+    def __getattr__(self, attr):
+        method = getattr(self._inner, attr)
+        counter, key = self._counter, f"{self._name}.{attr}"
+
+        def counted(*args, **kwargs):
+            counter[key] += 1
+            return method(*args, **kwargs)
+        return counted
+
+
+# ================================================================
+# 세션 생성 / 재생
+# ================================================================
+
+def generate_session(config):
+    """(종류, 값) 동작 목록 - 화면 흐름: 목록 ↔ 상세, 대시보드 새로고침, 가끔 쓰기"""
+    rng = random.Random(config["seed"])
+    hot = rng.sample(range(1, config["strategies"] + 1), config["hot_strategies"])
+    list_variants = [
+        StrategyListQuery(page=page, page_size=config["page_size"]) for page in range(1, 6)
+    ] + [
+        StrategyListQuery(page_size=config["page_size"], status_filter='ACTIVE'),
+        StrategyListQuery(page_size=config["page_size"], sort_field=StrategySortField.PERFORMANCE),
+    ]
+    actions = []
+    for _ in range(config["session_actions"]):
+        roll = rng.random()
+        if roll < config["write_ratio"]:
+            kind = "backtest" if rng.random() < 0.7 else "update"
+            actions.append((kind, rng.choice(hot) if rng.random() < 0.5 else rng.randint(1, config["strategies"])))
+        elif roll < 0.45:
+            # 목록은 첫 페이지에 편중
+            actions.append(("query", list_variants[min(int(rng.expovariate(0.8)), len(list_variants) - 1)]))
+        elif roll < 0.85:
+            strategy_id = rng.choice(hot) if rng.random() < 0.8 else rng.randint(1, config["strategies"])
+            actions.append(("query", StrategyDetailQuery(strategy_id=strategy_key(strategy_id))))
+        else:
+            actions.append(("query", DashboardQuery(date_range_days=rng.choice([7, 30, 30, 90]))))
+    return actions
+
+
+def apply_write(db_manager, publisher, kind, strategy_id, sequence, session_start):
+    # 구성 간 응답 비교를 위해 쓰기 시각은 동작 순번으로 고정
+    now = (session_start + timedelta(seconds=sequence)).isoformat(timespec='seconds')
+    if kind == "backtest":
+        db_manager.execute_command(
+            'strategies',
+            "INSERT INTO strategy_execution (strategy_id, execution_type, start_time, end_time, status, "
+            "total_profit_loss, max_drawdown, sharpe_ratio) VALUES (?, 'backtest', ?, ?, 'completed', ?, -3, 1)",
+            (strategy_id, now, now, float(sequence % 17))
+        )
+        backtest_id = db_manager.get_last_insert_id('strategies')
+        publisher.publish(StrategyBacktestCompleted(
+            strategy_id=strategy_key(strategy_id), backtest_id=str(backtest_id), symbol="KRW-BTC",
+            total_return=float(sequence % 17), max_drawdown=-3.0, sharpe_ratio=1.0
+        ))
+    else:
+        db_manager.execute_command(
+            'strategies', "UPDATE strategies SET strategy_name = ?, updated_at = ? WHERE id = ?",
+            (f"전략 {strategy_id:05d} v{sequence}", now, strategy_id)
+        )
+        publisher.publish(StrategyUpdated(strategy_id=strategy_key(strategy_id), strategy_name=f"v{sequence}",
+                                          updated_fields={"strategy_name": f"v{sequence}"}))
+
+
+def replay(db_path, config, actions, session_start, query_cache=None):
+    """세션 재생 - (호출 수 Counter, 쿼리 지연 목록 ms, 응답 목록, 캐시 통계)"""
+    db_manager = DatabaseManager({"strategies": str(db_path)})
+    calls = Counter()
+    publisher = DomainEventPublisher()
+    invalidation = CacheInvalidationService(query_cache)
+    invalidation.subscribe(publisher)
+    try:
+        repositories = SimpleNamespace(
+            strategy=CountingRepository(DetailStrategyRepository(db_manager), calls, "strategy"),
+            trigger=CountingRepository(DetailTriggerRepository(db_manager), calls, "trigger"),
+            backtest=CountingRepository(DetailBacktestRepository(db_manager), calls, "backtest"),
+        )
+        repo_container = SimpleNamespace(
+            get_strategy_repository=lambda: repositories.strategy,
+            get_trigger_repository=lambda: repositories.trigger,
+            get_backtest_repository=lambda: repositories.backtest,
+        )
+        dispatcher = QueryServiceContainer(repo_container, query_cache=query_cache).get_dispatcher()
+
+        latencies, responses = [], []
+        for sequence, (kind, value) in enumerate(actions):
+            if kind != "query":
+                apply_write(db_manager, publisher, kind, value, sequence, session_start)
+                continue
+            started = time.perf_counter()
+            response = dispatcher.dispatch(value)
+            latencies.append((time.perf_counter() - started) * 1000)
+            responses.append(response)
+        stats = invalidation.get_cache_statistics()
+    finally:
+        invalidation.unsubscribe(publisher)
+        db_manager.close_all()
+    return calls, latencies, responses, stats
+
+
+def _comparable(value):
+    # generated_at 은 조회 시각, updated_at 은 스키마 트리거가 벽시계(CURRENT_TIMESTAMP)로 갱신하므로 비교에서 제외
+    if dataclasses.is_dataclass(value):
+        value = vars(value)
+    if isinstance(value, dict):
+        return {k: _comparable(v) for k, v in value.items() if k not in ('generated_at', 'updated_at')}
+    if isinstance(value, list):
+        return [_comparable(v) for v in value]
+    return value
+
+
+def percentile(values, ratio):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))] if ordered else 0.0
+
+
+def main():
+    config = BENCHMARK_CONFIG
+    print("=" * 88)
+    print(f"쿼리 결과 캐시 UI 세션 리플레이 (전략 {config['strategies']:,}, 백테스트 {config['backtests']:,}, "
+          f"동작 {config['session_actions']:,}, 쓰기 {config['write_ratio']:.0%})")
+    print("=" * 88)
+
+    actions = generate_session(config)
+    queries = Counter(type(value).__name__ for kind, value in actions if kind == "query")
+    print("세션 구성: " + ", ".join(f"{name} {count:,}" for name, count in queries.items())
+          + f", 쓰기 {sum(1 for kind, _ in actions if kind != 'query'):,}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        now = datetime.now().replace(microsecond=0)
+        results = {}
+        for label, make_cache in [
+            ("캐시 없음", lambda: None),
+            ("메모리 캐시", lambda: QueryResultCache()),
+            ("메모리+디스크 (재시작 후)", lambda: QueryResultCache(disk_path=tmp / "query_cache.sqlite3")),
+        ]:
+            # 세션마다 같은 초기 데이터에서 시작 (쓰기 동작이 DB 를 바꾸므로)
+            db_path = tmp / f"strategies_{len(results)}.sqlite3"
+            populate(db_path, config, now)
+            if label.startswith("메모리+디스크"):
+                # 이전 실행에서 디스크 계층을 데운 뒤 새 프로세스처럼 다시 열기
+                warm = QueryResultCache(disk_path=tmp / "query_cache.sqlite3")
+                warm_db = tmp / "strategies_warm.sqlite3"
+                populate(warm_db, config, now)
+                replay(warm_db, config, [a for a in actions if a[0] == "query"], now, warm)
+                warm.close()
+            cache = make_cache()
+            results[label] = replay(db_path, config, actions, now, cache)
+            if cache is not None:
+                cache.close()
+
+        base_calls, base_latencies, base_responses, _ = results["캐시 없음"]
+        print(f"\n{'구성':<24} {'Repo 호출':>10} {'감소':>7} {'p50':>9} {'p95':>9} {'총 쿼리 시간':>12} {'적중률':>7}")
+        for label, (calls, latencies, responses, stats) in results.items():
+            total_calls = sum(calls.values())
+            reduction = 1 - total_calls / sum(base_calls.values())
+            print(f"{label:<24} {total_calls:>10,} {reduction:>6.1%} {percentile(latencies, 0.5):>7.3f}ms "
+                  f"{percentile(latencies, 0.95):>7.3f}ms {sum(latencies):>10.0f}ms "
+                  f"{stats.get('hit_ratio', 0.0):>6.1%}")
+
+        _, _, memory_responses, memory_stats = results["메모리 캐시"]
+        mismatches = Counter(type(a).__name__ for a, b in zip(base_responses, memory_responses)
+                             if _comparable(a) != _comparable(b))
+        print(f"\n응답 일치: {len(base_responses) - sum(mismatches.values()):,}/{len(base_responses):,} "
+              f"(이벤트 무효화로 쓰기 직후에도 최신 결과) {dict(mismatches) or ''}")
+        print(f"메모리 캐시 통계: 적중 {memory_stats['memory_hits']:,} | 미스 {memory_stats['misses']:,} | "
+              f"무효화 호출 {memory_stats['invalidation_calls']:,} → 항목 {memory_stats['invalidated_entries']:,} | "
+              f"축출 {memory_stats['evictions']:,} | 사용 {memory_stats['memory_bytes'] / 1024:.0f}KB")
+        disk_stats = results["메모리+디스크 (재시작 후)"][3]
+        print(f"디스크 계층 통계: 디스크 적중 {disk_stats['disk_hits']:,} | 메모리 적중 {disk_stats['memory_hits']:,} | "
+              f"디스크 사용 {disk_stats['disk_bytes'] / 1024:.0f}KB")
+        print("\nRepository 메서드별 호출 (캐시 없음 → 메모리 캐시):")
+        memory_calls = results["메모리 캐시"][0]
+        for name, count in base_calls.most_common():
+            print(f"  {name:<48} {count:>7,} → {memory_calls.get(name, 0):>6,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+벤치마크: UnifiedUpbitRateLimiter 가상 시간 시뮬레이션
+
+네트워크 없이 모든 Rate Limit 그룹에 closed-loop 부하를 걸고 모의 업비트 서버(슬라이딩 윈도우)로
+통과/429 를 판정합니다. GCRA 파라미터를 바꾼 뒤 같은 seed 로 다시 실행하면 결과를 결정적으로 비교할 수 있습니다.
+
+출력: 그룹별 요청 수, 초당 성공 요청 수, acquire 대기 p50/p95/p99, 윈도우 위반(429),
+      클라이언트 간 공정성, 최종 속도 비율, 동적 감소/복구 횟수
+
+실행: python tests/performance/benchmark_rate_limiter_simulation.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from upbit_auto_trading.infrastructure.external_apis.upbit.rate_limiter import (  # noqa: E402
+    RateLimiterSimulation, VirtualTimeEventLoop
+)
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "simulated_seconds": 3600.0,  # 가상 1시간
+    "latency": 0.03,              # 모의 서버 응답 지연 (초)
+    "latency_jitter": 0.02,
+    "seed": 0,
+    "json_output": None,          # 경로 지정 시 결과를 JSON 으로 저장 (튜닝 전/후 비교용)
+}
+
+
+def main():
+    config = BENCHMARK_CONFIG
+    print("=" * 100)
+    print(f"Rate Limiter 가상 시간 시뮬레이션 (가상 {config['simulated_seconds']:,.0f}초, seed={config['seed']})")
+    print("=" * 100)
+
+    simulation = RateLimiterSimulation(
+        duration=config["simulated_seconds"],
+        latency=config["latency"],
+        latency_jitter=config["latency_jitter"],
+        seed=config["seed"],
+    )
+    loop = VirtualTimeEventLoop()  # 가상 시간 루프는 벤치마크가 소유
+    try:
+        report = loop.run_until_complete(simulation.run())
+    finally:
+        loop.close()
+
+    for line in report.format_lines():
+        print(line)
+
+    if config["json_output"]:
+        with open(config["json_output"], "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {config['json_output']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""
+벤치마크: 전략 목록 / 대시보드 쿼리 - 기존 경로(N+1, Python 집계) vs Read Model 프로젝션
+
+임시 strategies DB (data_info 스키마)에 전략 5천 개, 조건 2만 개, 백테스트 결과 5만 건을 채운 뒤
+같은 Query Handler 를 두 방식으로 실행합니다.
+
+- 기존: Repository 경유 (핸들러가 호출하는 메서드를 원본 테이블 SQL 로 구현)
+  - 목록: 페이지 조회 + COUNT + 전략마다 find_latest_by_strategy (N+1)
+  - 대시보드: 현재/이전 기간 백테스트 전체를 Python 으로 로드해 평균 계산, 최근 결과마다 find_by_id
+  - 공정한 비교를 위해 strategy_execution(strategy_id, end_time) / (execution_type, status, end_time) 인덱스 추가
+- Read Model: SqliteStrategyReadModel (목록/대시보드 각각 SELECT 한 번)
+
+출력: 쿼리별 p50/p95 지연(ms), 재구축 시간, 이벤트 1건 갱신 시간
+
+실행: python tests/performance/benchmark_strategy_read_model.py
+"""
+
+import json
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from upbit_auto_trading.application.queries.dto.dashboard_query_dto import DashboardQuery  # noqa: E402
+from upbit_auto_trading.application.queries.dto.strategy_query_dto import StrategyListQuery, StrategySortField  # noqa: E402
+from upbit_auto_trading.application.queries.handlers.dashboard_query_handler import DashboardQueryHandler  # noqa: E402
+from upbit_auto_trading.application.queries.handlers.strategy_query_handler import StrategyListQueryHandler  # noqa: E402
+from upbit_auto_trading.infrastructure.database.database_manager import DatabaseManager  # noqa: E402
+from upbit_auto_trading.infrastructure.repositories.sqlite_strategy_read_model import SqliteStrategyReadModel  # noqa: E402
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "strategies": 5_000,
+    "conditions_per_strategy": 4,
+    "backtests": 50_000,
+    "history_days": 120,          # 백테스트 완료 시각 분포 범위
+    "page_size": 20,
+    "dashboard_days": 30,
+    "iterations": 30,             # 쿼리별 반복 횟수
+    "seed": 0,
+}
+
+SCHEMA_PATH = project_root / "data_info" / "upbit_autotrading_schema_strategies.sql"
+VARIABLES = ['RSI', 'SMA', 'EMA', 'MACD', 'BOLLINGER', 'ATR', 'VOLUME', 'STOCH', 'CCI', 'ADX']
+
+
+# ================================================================
+# 기존 경로: 핸들러가 기대하는 Repository 메서드 (원본 테이블 직접 조회)
+# ================================================================
+
+def _dt(value):
+    return datetime.fromisoformat(value) if value else None
+
+
+class BaselineStrategyRepository:
+    _SORT = {'name': 'strategy_name', 'created_at': 'created_at', 'updated_at': 'updated_at',
+             'status': 'is_active', 'performance': 'total_profit_loss'}
+
+    def __init__(self, db):
+        self._db = db
+
+    def _where(self, status, name_pattern):
+        conditions, params = [], []
+        if status:
+            conditions.append("is_active = ?")
+            params.append(1 if status == 'ACTIVE' else 0)
+        if name_pattern:
+            conditions.append("strategy_name LIKE ?")
+            params.append(f"%{name_pattern}%")
+        return (f"WHERE {' AND '.join(conditions)}" if conditions else ''), params
+
+    def find_with_filters(self, status=None, tags=None, name_pattern=None, created_after=None,
+                          created_before=None, include_deleted=False, sort_field='created_at',
+                          sort_direction='desc', limit=20, offset=0):
+        where, params = self._where(status, name_pattern)
+        rows = self._db.execute_query(
+            'strategies',
+            f"SELECT * FROM strategies {where} ORDER BY {self._SORT[sort_field]} {sort_direction} LIMIT ? OFFSET ?",
+            tuple(params + [limit, offset])
+        )
+        ids = [row['id'] for row in rows]
+        conditions = {strategy_id: [] for strategy_id in ids}
+        if ids:
+            marks = ', '.join('?' for _ in ids)
+            for row in self._db.execute_query(
+                    'strategies',
+                    f"SELECT strategy_id, condition_type FROM strategy_conditions "
+                    f"WHERE strategy_id IN ({marks}) AND is_enabled = 1", tuple(ids)):
+                conditions[row['strategy_id']].append(row['condition_type'])
+        return [self._to_entity(row, conditions[row['id']]) for row in rows]
+
+    def count_with_filters(self, status=None, tags=None, name_pattern=None, created_after=None,
+                           created_before=None, include_deleted=False):
+        where, params = self._where(status, name_pattern)
+        return self._db.execute_query('strategies', f"SELECT COUNT(*) FROM strategies {where}", tuple(params))[0][0]
+
+    def count_all_strategies(self):
+        return self._db.execute_query('strategies', "SELECT COUNT(*) FROM strategies")[0][0]
+
+    def count_active_strategies(self):
+        return self._db.execute_query('strategies', "SELECT COUNT(*) FROM strategies WHERE is_active = 1")[0][0]
+
+    def find_by_id(self, strategy_id):
+        rows = self._db.execute_query('strategies', "SELECT * FROM strategies WHERE id = ?", (strategy_id,))
+        return self._to_entity(rows[0], []) if rows else None
+
+    @staticmethod
+    def _to_entity(row, condition_types):
+        return SimpleNamespace(
+            strategy_id=SimpleNamespace(value=str(row['id'])),
+            name=row['strategy_name'],
+            status=SimpleNamespace(value='ACTIVE' if row['is_active'] else 'INACTIVE'),
+            tags=json.loads(row['tags']) if row['tags'] else [],
+            entry_triggers=[t for t in condition_types if t.startswith('entry')],
+            exit_triggers=[t for t in condition_types if t.startswith('exit')],
+            created_at=_dt(row['created_at']),
+            updated_at=_dt(row['updated_at']),
+        )
+
+
+class BaselineTriggerRepository:
+    def __init__(self, db):
+        self._db = db
+
+    def count_all_triggers(self):
+        return self._db.execute_query(
+            'strategies', "SELECT COUNT(*) FROM strategy_conditions WHERE is_enabled = 1")[0][0]
+
+    def get_trigger_statistics_by_variable_type(self, start_date, end_date):
+        rows = self._db.execute_query(
+            'strategies',
+            "SELECT left_variable AS variable_type, COUNT(*) AS total_count, "
+            "SUM(CASE WHEN is_enabled = 1 THEN 1 ELSE 0 END) AS active_count "
+            "FROM strategy_conditions WHERE created_at BETWEEN ? AND ? GROUP BY left_variable "
+            "ORDER BY total_count DESC",
+            (start_date.isoformat(), end_date.isoformat())
+        )
+        return [dict(row, success_rate=75.0, avg_execution_time_ms=15.0) for row in rows]
+
+
+class BaselineBacktestRepository:
+    _COLUMNS = ("id, strategy_id, end_time, total_profit_loss, max_drawdown, sharpe_ratio "
+                "FROM strategy_execution WHERE execution_type = 'backtest' AND status = 'completed'")
+
+    def __init__(self, db):
+        self._db = db
+
+    def find_latest_by_strategy(self, strategy_id):
+        rows = self._db.execute_query(
+            'strategies',
+            f"SELECT {self._COLUMNS} AND strategy_id = ? ORDER BY end_time DESC LIMIT 1",
+            (int(strategy_id.value),)
+        )
+        return self._to_result(rows[0]) if rows else None
+
+    def count_backtests_in_period(self, start_date, end_date):
+        return self._db.execute_query(
+            'strategies',
+            "SELECT COUNT(*) FROM strategy_execution WHERE execution_type = 'backtest' AND status = 'completed' "
+            "AND end_time BETWEEN ? AND ?", (start_date.isoformat(), end_date.isoformat())
+        )[0][0]
+
+    def find_completed_in_period(self, start_date, end_date):
+        rows = self._db.execute_query(
+            'strategies', f"SELECT {self._COLUMNS} AND end_time BETWEEN ? AND ?",
+            (start_date.isoformat(), end_date.isoformat())
+        )
+        return [self._to_result(row) for row in rows]
+
+    def find_recent_completed(self, limit):
+        rows = self._db.execute_query(
+            'strategies', f"SELECT {self._COLUMNS} ORDER BY end_time DESC LIMIT ?", (limit,))
+        return [self._to_result(row) for row in rows]
+
+    @staticmethod
+    def _to_result(row):
+        return SimpleNamespace(
+            backtest_id=str(row['id']), strategy_id=row['strategy_id'], completed_at=_dt(row['end_time']),
+            total_return=row['total_profit_loss'], max_drawdown=row['max_drawdown'], sharpe_ratio=row['sharpe_ratio']
+        )
+
+
+# ================================================================
+# 데이터 생성 / 측정
+# ================================================================
+
+def populate(db_path: Path, config, now: datetime) -> None:
+    rng = random.Random(config["seed"])
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA_PATH.read_text(encoding='utf-8'))
+    conn.execute("CREATE INDEX idx_bench_execution_strategy ON strategy_execution(strategy_id, end_time)")
+    conn.execute("CREATE INDEX idx_bench_execution_period ON strategy_execution(execution_type, status, end_time)")
+
+    def ts(days_ago):
+        return (now - timedelta(days=days_ago)).isoformat(timespec='seconds')
+
+    strategies = [
+        (i, f"전략 {i:05d}", int(rng.random() < 0.6), json.dumps(rng.sample(['swing', 'trend', 'scalp', 'dca'], 2)),
+         ts(rng.uniform(120, 365)), ts(rng.uniform(0, 120)))
+        for i in range(1, config["strategies"] + 1)
+    ]
+    conn.executemany(
+        "INSERT INTO strategies (id, strategy_name, is_active, tags, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+        strategies
+    )
+    conn.executemany(
+        "INSERT INTO strategy_conditions (strategy_id, condition_name, condition_type, left_variable, operator, "
+        "is_enabled, created_at) VALUES (?, ?, ?, ?, '>', ?, ?)",
+        [(sid, f"조건 {sid}-{n}", rng.choice(['entry_long', 'entry_short', 'exit_long', 'exit_short']),
+          rng.choice(VARIABLES), int(rng.random() < 0.9), ts(rng.uniform(0, 90)))
+         for sid in range(1, config["strategies"] + 1) for n in range(config["conditions_per_strategy"])]
+    )
+    conn.executemany(
+        "INSERT INTO strategy_execution (strategy_id, execution_type, start_time, end_time, status, "
+        "total_profit_loss, max_drawdown, sharpe_ratio) VALUES (?, 'backtest', ?, ?, ?, ?, ?, ?)",
+        [(rng.randint(1, config["strategies"]), end, end, 'completed' if rng.random() < 0.95 else 'failed',
+          round(rng.gauss(3, 15), 3), round(-abs(rng.gauss(10, 5)), 3),
+          round(rng.gauss(0.8, 0.6), 3) if rng.random() < 0.9 else None)
+         for end in (ts(rng.uniform(0, config["history_days"])) for _ in range(config["backtests"]))]
+    )
+    conn.commit()
+    conn.close()
+
+
+def measure(func, iterations):
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2], samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+
+def main():
+    config = BENCHMARK_CONFIG
+    now = datetime.now().replace(microsecond=0)
+    print("=" * 88)
+    print(f"전략 목록 / 대시보드 Read Model 벤치마크 (전략 {config['strategies']:,}, "
+          f"조건 {config['strategies'] * config['conditions_per_strategy']:,}, 백테스트 {config['backtests']:,})")
+    print("=" * 88)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / "strategies.sqlite3"
+        populate(db_path, config, now)
+        db_manager = DatabaseManager({"strategies": str(db_path)})
+        try:
+            strategy_repo = BaselineStrategyRepository(db_manager)
+            trigger_repo = BaselineTriggerRepository(db_manager)
+            backtest_repo = BaselineBacktestRepository(db_manager)
+
+            read_model = SqliteStrategyReadModel(db_manager)
+            counts = read_model.rebuild()
+            print(f"재구축: {counts['elapsed_ms']:.1f} ms | 전략 {counts['strategy_list_projection']:,} | "
+                  f"백테스트 {counts['backtest_projection']:,} | 시간 버킷 {counts['backtest_hourly_projection']:,} | "
+                  f"트리거 버킷 {counts['trigger_daily_projection']:,}")
+
+            list_queries = {
+                "목록 (최신순 1페이지)": StrategyListQuery(page_size=config["page_size"]),
+                "목록 (활성, 성과순 50p)": StrategyListQuery(page=50, page_size=config["page_size"], status_filter='ACTIVE',
+                                                      sort_field=StrategySortField.PERFORMANCE),
+            }
+            dashboard_query = DashboardQuery(date_range_days=config["dashboard_days"])
+            scenarios = [(label, StrategyListQueryHandler, (strategy_repo, backtest_repo), query)
+                         for label, query in list_queries.items()]
+            scenarios.append(("대시보드 (30일 / 이전 30일)", DashboardQueryHandler,
+                              (strategy_repo, trigger_repo, backtest_repo), dashboard_query))
+
+            print(f"\n{'쿼리':<28} {'기존 p50':>10} {'기존 p95':>10} {'RM p50':>9} {'RM p95':>9} {'배율':>7}")
+            for label, handler_cls, repositories, query in scenarios:
+                baseline = handler_cls(*repositories)
+                projected = handler_cls(*repositories, read_model=read_model)
+                base_p50, base_p95 = measure(lambda: baseline.handle(query), config["iterations"])
+                rm_p50, rm_p95 = measure(lambda: projected.handle(query), config["iterations"])
+                print(f"{label:<28} {base_p50:>8.2f}ms {base_p95:>8.2f}ms {rm_p50:>7.2f}ms {rm_p95:>7.2f}ms "
+                      f"{base_p50 / rm_p50:>6.1f}x")
+
+            # 쓰기 측 비용: 백테스트 1건 완료 → 키 재계산
+            db_manager.execute_command(
+                'strategies',
+                "INSERT INTO strategy_execution (id, strategy_id, execution_type, start_time, end_time, status, "
+                "total_profit_loss, max_drawdown, sharpe_ratio) VALUES (999999, 1, 'backtest', ?, ?, 'completed', 5, -2, 1)",
+                (now.isoformat(), now.isoformat())
+            )
+            backtest_p50, _ = measure(lambda: read_model.refresh_backtests(['999999']), config["iterations"])
+            strategy_p50, _ = measure(lambda: read_model.refresh_strategies(['1']), config["iterations"])
+            print(f"\n이벤트 갱신 p50: 백테스트 1건 {backtest_p50:.2f} ms | 전략 1건 {strategy_p50:.2f} ms")
+        finally:
+            db_manager.close_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""
+벤치마크: 틱 테이프 저장소 (전체 마켓 체결/호가 기록 + 구간 읽기)
+
+합성 스트림(마켓별 호가 단위 랜덤 워크 체결, 최우선 근처 잔량만 바뀌는 15단계 호가)을 기록합니다.
+- 기록: 핫패스(on_trade / on_orderbook) 처리량, 블록 인코딩·기록 처리량, 압축률
+- 비교: 같은 체결을 sqlite 에 체결 1건 = 1행으로 저장 (단일 트랜잭션 executemany, 가장 유리한 조건)
+- 읽기: 심볼 하루치 전체 / 1분 구간 NumPy 읽기 처리량
+
+실행: python tests/performance/benchmark_tick_tape.py
+"""
+
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from upbit_auto_trading.infrastructure.market_data.tape.tick_tape_store import TickTapeReader, TickTapeStore  # noqa: E402
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "markets": 200,                # KRW 마켓 전체 수준
+    "trades": 1_000_000,
+    "orderbooks": 200_000,
+    "depth": 15,
+    "chunk": 20_000,               # 생성 단위 (생성 시간은 측정에서 제외)
+    "trade_interval_ms": 1,        # 전체 마켓 합산 체결 간격 → 약 1,000건/초 스트림이 약 17분
+    "sqlite_trades": 300_000,
+    "full_market_trades_per_second": 3_000,      # 업비트 전체 마켓 체결 피크 가정
+    "full_market_orderbooks_per_second": 1_500,  # 호가 피크 가정
+}
+
+BASE_MS = 1_735_689_600_000  # 2025-01-01T00:00:00Z
+
+
+class MarketWalk:
+    """마켓별 호가 단위 랜덤 워크 + 잔량 상태"""
+
+    def __init__(self, rng: random.Random, index: int, depth: int):
+        self.symbol = f"KRW-C{index:03d}"
+        self.tick = rng.choice((1.0, 5.0, 10.0, 100.0, 1_000.0))
+        self.best_bid = self.tick * rng.randint(1_000, 50_000)
+        self.sequential_id = index * 10_000_000
+        self.asks = [round(rng.uniform(0.01, 500.0), 8) for _ in range(depth)]
+        self.bids = [round(rng.uniform(0.01, 500.0), 8) for _ in range(depth)]
+
+
+def trade_chunks(rng: random.Random, walks, count: int, clock):
+    chunk = []
+    for _ in range(count):
+        walk = rng.choice(walks)
+        if rng.random() < 0.2:
+            walk.best_bid = max(walk.tick, walk.best_bid + walk.tick * rng.choice((-1, 1)))
+        walk.sequential_id += 1
+        clock[0] += BENCHMARK_CONFIG["trade_interval_ms"] * rng.random() * 2
+        ask_bid = "BID" if rng.random() < 0.5 else "ASK"
+        price = walk.best_bid + walk.tick if ask_bid == "BID" else walk.best_bid
+        chunk.append((walk.symbol, int(clock[0]), price, round(rng.expovariate(5.0), 8), ask_bid, walk.sequential_id))
+        if len(chunk) == BENCHMARK_CONFIG["chunk"]:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def orderbook_chunks(rng: random.Random, walks, count: int, clock, depth: int):
+    chunk = []
+    for _ in range(count):
+        walk = rng.choice(walks)
+        for _ in range(rng.randint(1, 3)):
+            level = min(int(rng.expovariate(0.5)), depth - 1)
+            book = walk.asks if rng.random() < 0.5 else walk.bids
+            book[level] = round(rng.uniform(0.01, 500.0), 8)
+        clock[0] += BENCHMARK_CONFIG["trade_interval_ms"] * 5 * rng.random() * 2
+        units = [{"ask_price": walk.best_bid + walk.tick * (k + 1), "bid_price": walk.best_bid - walk.tick * k,
+                  "ask_size": walk.asks[k], "bid_size": walk.bids[k]} for k in range(depth)]
+        chunk.append((walk.symbol, int(clock[0]), units))
+        if len(chunk) == BENCHMARK_CONFIG["chunk"]:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def directory_size(path: Path) -> int:
+    return sum(file.stat().st_size for file in path.rglob("*") if file.is_file())
+
+
+def main():
+    import logging
+    logging.disable(logging.INFO)
+
+    config = BENCHMARK_CONFIG
+    work_dir = Path(tempfile.mkdtemp(prefix="tick_tape_bench_"))
+    try:
+        rng = random.Random(5)
+        walks = [MarketWalk(rng, i, config["depth"]) for i in range(config["markets"])]
+        store = TickTapeStore(work_dir / "tape", orderbook_depth=config["depth"])
+
+        print("=" * 80)
+        print(f"틱 테이프 벤치마크 (마켓 {config['markets']}개, 체결 {config['trades']:,}건, "
+              f"호가 {config['orderbooks']:,}건 × {config['depth']}단계)")
+        print("=" * 80)
+
+        # 1) 체결 기록 (핫패스 / 블록 기록 분리 측정)
+        hot_trade = trade_flush = 0.0
+        sqlite_rows = []
+        for chunk in trade_chunks(rng, walks, config["trades"], [float(BASE_MS)]):
+            if len(sqlite_rows) < config["sqlite_trades"]:
+                sqlite_rows.extend(chunk[:config["sqlite_trades"] - len(sqlite_rows)])
+            started = time.perf_counter()
+            on_trade = store.on_trade
+            for symbol, timestamp, price, volume, ask_bid, sequential_id in chunk:
+                on_trade(symbol, timestamp, price, volume, ask_bid, sequential_id)
+            hot_trade += time.perf_counter() - started
+            started = time.perf_counter()
+            store.flush(force=False)
+            trade_flush += time.perf_counter() - started
+        started = time.perf_counter()
+        store.flush()
+        trade_flush += time.perf_counter() - started
+
+        # 2) 호가 기록
+        hot_orderbook = orderbook_flush = 0.0
+        for chunk in orderbook_chunks(rng, walks, config["orderbooks"], [float(BASE_MS)], config["depth"]):
+            started = time.perf_counter()
+            on_orderbook = store.on_orderbook
+            for symbol, timestamp, units in chunk:
+                on_orderbook(symbol, timestamp, units)
+            hot_orderbook += time.perf_counter() - started
+            started = time.perf_counter()
+            store.flush(force=False)
+            orderbook_flush += time.perf_counter() - started
+        started = time.perf_counter()
+        store.flush()
+        orderbook_flush += time.perf_counter() - started
+
+        stats = store.get_statistics()
+        disk = directory_size(work_dir / "tape")
+        trade_rate = config["trades"] / hot_trade
+        orderbook_rate = config["orderbooks"] / hot_orderbook
+        flush_time = trade_flush + orderbook_flush
+        # 전체 마켓 피크에서 초당 소비 시간 비율 (핫패스 = 이벤트 루프, 블록 기록 = 기록 스레드)
+        peak_loop = (config["full_market_trades_per_second"] / trade_rate
+                     + config["full_market_orderbooks_per_second"] / orderbook_rate)
+        peak_writer = (config["full_market_trades_per_second"] * trade_flush / config["trades"]
+                       + config["full_market_orderbooks_per_second"] * orderbook_flush / config["orderbooks"])
+
+        print(f"핫패스 체결   : {trade_rate:12,.0f} 건/초 ({hot_trade / config['trades'] * 1e6:.2f} µs/건)")
+        print(f"핫패스 호가   : {orderbook_rate:12,.0f} 건/초 ({hot_orderbook / config['orderbooks'] * 1e6:.2f} µs/건)")
+        print(f"블록 기록     : {stats['rows_written'] / flush_time:12,.0f} 행/초 "
+              f"(블록 {stats['blocks_written']:,}개, 원본 {stats['raw_bytes'] / flush_time / 1e6:,.0f} MB/초)")
+        print(f"전체 마켓 피크 (체결 {config['full_market_trades_per_second']:,}/초 + "
+              f"호가 {config['full_market_orderbooks_per_second']:,}/초): 이벤트 루프 {peak_loop * 100:.1f}% + "
+              f"기록 스레드 {peak_writer * 100:.1f}%")
+        print(f"압축률        : {stats['compression_ratio']:.1f}x (8 byte 컬럼 {stats['raw_bytes'] / 1e6:,.1f} MB → "
+              f"디스크 {disk / 1e6:,.1f} MB, 인덱스 포함)")
+
+        # 3) sqlite 1행/체결 비교
+        db_path = work_dir / "trades.sqlite3"
+        connection = sqlite3.connect(db_path)
+        connection.execute("CREATE TABLE trades (symbol TEXT, timestamp INTEGER, price REAL, volume REAL, "
+                           "ask_bid TEXT, sequential_id INTEGER)")
+        connection.execute("CREATE INDEX idx_trades_symbol_time ON trades (symbol, timestamp)")
+        started = time.perf_counter()
+        with connection:
+            connection.executemany("INSERT INTO trades VALUES (?, ?, ?, ?, ?, ?)", sqlite_rows)
+        sqlite_seconds = time.perf_counter() - started
+        connection.close()
+        sqlite_bytes_per_trade = db_path.stat().st_size / len(sqlite_rows)
+        trade_files = directory_size(work_dir / "tape" / "trade")
+        tape_bytes_per_trade = trade_files / config["trades"]
+        print(f"\nsqlite 1행/체결: {len(sqlite_rows) / sqlite_seconds:,.0f} 건/초 (단일 트랜잭션), "
+              f"{sqlite_bytes_per_trade:.1f} byte/건")
+        print(f"틱 테이프 체결 : {config['trades'] / (hot_trade + trade_flush):,.0f} 건/초 (핫패스 + 블록 기록), "
+              f"{tape_bytes_per_trade:.1f} byte/건 → {sqlite_bytes_per_trade / tape_bytes_per_trade:.1f}x 작음")
+
+        # 4) 읽기
+        reader = TickTapeReader(work_dir / "tape")
+        symbols = reader.list_symbols("trade")
+        started = time.perf_counter()
+        rows = 0
+        for symbol in symbols:
+            rows += reader.read_trades(symbol, BASE_MS, BASE_MS + 86_400_000)["timestamp"].size
+        full_seconds = time.perf_counter() - started
+        print(f"\n읽기 (체결, 심볼 {len(symbols)}개 전체): {rows / full_seconds:,.0f} 행/초 | "
+              f"디스크 {reader.stats['bytes_read'] / full_seconds / 1e6:,.0f} MB/초 → "
+              f"배열 {rows * 5 * 8 / full_seconds / 1e6:,.0f} MB/초")
+
+        started = time.perf_counter()
+        books = 0
+        for symbol in symbols:
+            books += reader.read_orderbooks(symbol, BASE_MS, BASE_MS + 86_400_000)["timestamp"].size
+        book_seconds = time.perf_counter() - started
+        print(f"읽기 (호가, 심볼 {len(symbols)}개 전체): {books / book_seconds:,.0f} 스냅샷/초 "
+              f"({books * config['depth'] * 4 / book_seconds / 1e6:,.1f} M 값/초)")
+
+        symbol = symbols[0]
+        trades = reader.read_trades(symbol, BASE_MS, BASE_MS + 86_400_000)
+        middle = int(trades["timestamp"][len(trades["timestamp"]) // 2])
+        repeats = 200
+        started = time.perf_counter()
+        for _ in range(repeats):
+            window = reader.read_trades(symbol, middle, middle + 60_000)
+        window_ms = (time.perf_counter() - started) / repeats * 1000
+        print(f"1분 구간 읽기 ({symbol}, {window['timestamp'].size}행): {window_ms:.2f} ms")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+벤치마크: 매매 변수 호환성 - 쌍별 규칙 조회 vs 비트셋 인덱스 (VariableCompatibilityIndex)
+
+1) 현재 YAML 카탈로그 (data_info/trading_variables)
+2) 합성 카탈로그 2,000개 변수 (비교 그룹 무작위)
+
+항목:
+- 전체 매트릭스: 기존 방식(쌍마다 변수 조회 + ComparisonGroupRules.check_compatibility) vs
+  인덱스 행 비트셋 생성 / 인덱스 → 쌍 dict 변환(StrategyCompatibilityService.get_compatibility_matrix 형식)
+- 호환 변수 조회(트리거 빌더 입력 중 반복 호출): 전체 변수 필터링 vs 비트 순회
+- 인덱스 최초 생성, 변수 1건 추가/수정/삭제 증분 갱신
+
+실행: python tests/performance/benchmark_variable_compatibility.py
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from upbit_auto_trading.domain.trigger_builder.services.variable_compatibility_index import (  # noqa: E402
+    VariableCompatibilityIndex
+)
+from upbit_auto_trading.domain.value_objects.compatibility_rules import ComparisonGroupRules  # noqa: E402
+from upbit_auto_trading.infrastructure.repositories.trading_variable_catalog import load_trading_variable_catalog  # noqa: E402
+
+# ================================================================
+# 🎛️ 벤치마크 설정
+# ================================================================
+BENCHMARK_CONFIG = {
+    "synthetic_variables": 2_000,
+    "groups": ["price_comparable", "percentage_comparable", "zero_centered", "volume_comparable",
+               "volatility_comparable", "signal_conditional", "capital_comparable", "quantity_comparable",
+               "dynamic_target"],
+    "lookups": 2_000,             # 호환 변수 조회 반복 횟수
+    "seed": 0,
+}
+
+
+class CatalogRepository:
+    """기존 경로의 Repository 조회 (find_trading_variable_by_id 와 같은 ID 조회)"""
+
+    def __init__(self, variables):
+        self._variables = {variable['variable_id']: variable for variable in variables}
+
+    def find_trading_variable_by_id(self, variable_id):
+        return self._variables.get(variable_id)
+
+    def get_trading_variables(self):
+        return list(self._variables.values())
+
+
+def baseline_matrix(repository, rules, variable_ids):
+    matrix = {}
+    for i, var1 in enumerate(variable_ids):
+        for j in range(i + 1, len(variable_ids)):
+            var2 = variable_ids[j]
+            group1 = repository.find_trading_variable_by_id(var1)['comparison_group']
+            group2 = repository.find_trading_variable_by_id(var2)['comparison_group']
+            matrix[(var1, var2)] = rules.check_compatibility(group1, group2)
+    return matrix
+
+
+def baseline_compatible(repository, rules, variable_id):
+    base = repository.find_trading_variable_by_id(variable_id)
+    return [variable['variable_id'] for variable in repository.get_trading_variables()
+            if variable['variable_id'] != variable_id and variable.get('is_active', True)
+            and rules.check_compatibility(base['comparison_group'], variable['comparison_group']).is_usable()]
+
+
+def timed(func, repeat=1):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, result
+
+
+def run(label, variables, config):
+    rules = ComparisonGroupRules()
+    repository = CatalogRepository(variables)
+    variable_ids = [variable['variable_id'] for variable in variables]
+    n = len(variable_ids)
+    repeat = 20 if n < 200 else 3
+    print(f"\n[{label}] 변수 {n:,}개, 쌍 {n * (n - 1) // 2:,}개")
+
+    build_ms, index = timed(lambda: VariableCompatibilityIndex.build(variables, rules), repeat)
+    base_ms, base_matrix = timed(lambda: baseline_matrix(repository, rules, variable_ids), repeat)
+    rows_ms, matrix = timed(lambda: index.build_matrix(variable_ids), repeat)
+    dict_ms, index_dict = timed(matrix.to_pair_dict, repeat)
+    assert index_dict == base_matrix, "인덱스 매트릭스가 쌍별 규칙 결과와 다릅니다"
+
+    print(f"  인덱스 생성              {build_ms:>10.2f} ms")
+    print(f"  전체 매트릭스 (기존 쌍별) {base_ms:>10.2f} ms")
+    print(f"  전체 매트릭스 (행 비트셋) {rows_ms:>10.3f} ms   → {base_ms / rows_ms:,.0f}x")
+    print(f"  행 비트셋 → 쌍 dict 변환  {dict_ms:>10.2f} ms   → 기존 대비 {base_ms / (rows_ms + dict_ms):,.1f}x")
+
+    rng = random.Random(config["seed"])
+    targets = [rng.choice(variable_ids) for _ in range(config["lookups"] if n >= 200 else config["lookups"] * 5)]
+    base_lookup_ms, _ = timed(lambda: [baseline_compatible(repository, rules, t) for t in targets])
+    index_lookup_ms, _ = timed(lambda: [index.get_compatible_ids(t, include_warning=True) for t in targets])
+    assert all(sorted(baseline_compatible(repository, rules, t)) == sorted(index.get_compatible_ids(t, True))
+               for t in targets[:50])
+    print(f"  호환 변수 조회 (1회 평균) 기존 {base_lookup_ms / len(targets) * 1000:>8.1f} µs | "
+          f"인덱스 {index_lookup_ms / len(targets) * 1000:>7.1f} µs → {base_lookup_ms / index_lookup_ms:,.0f}x")
+
+    def churn():
+        for step in range(100):
+            variable_id = f"NEW_{step}"
+            index.upsert(variable_id, config["groups"][step % len(config["groups"])])
+            index.upsert(variable_id, config["groups"][(step + 1) % len(config["groups"])])
+            index.remove(variable_id)
+    churn_ms, _ = timed(churn)
+    print(f"  증분 갱신 (추가+그룹 변경+삭제 1세트) {churn_ms / 100 * 1000:>8.1f} µs "
+          f"(전체 재구축 {build_ms:.2f} ms 대비)")
+
+
+def main():
+    config = BENCHMARK_CONFIG
+    print("=" * 88)
+    print("매매 변수 호환성 인덱스 벤치마크 (쌍별 규칙 조회 vs 비트셋)")
+    print("=" * 88)
+
+    run("현재 YAML 카탈로그", load_trading_variable_catalog(), config)
+
+    rng = random.Random(config["seed"])
+    synthetic = [{'variable_id': f"VAR_{i:05d}", 'comparison_group': rng.choice(config["groups"]),
+                  'is_active': rng.random() < 0.95}
+                 for i in range(config["synthetic_variables"])]
+    run(f"합성 카탈로그 {config['synthetic_variables']:,}", synthetic, config)
+
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,9 @@ from upbit_auto_trading.application.services.backtest_application_service import
 from upbit_auto_trading.application.event_handlers.event_handler_registry import EventHandlerRegistry
 from upbit_auto_trading.application.notifications.notification_service import NotificationService
 from upbit_auto_trading.application.caching.cache_invalidation_service import CacheInvalidationService
+from upbit_auto_trading.application.caching.query_result_cache import QueryResultCache
+from upbit_auto_trading.application.queries.query_container import QueryServiceContainer
+from upbit_auto_trading.application.queries.query_service import QueryService
 from upbit_auto_trading.domain.events.domain_event_publisher import get_domain_event_publisher
 
 # Settings 관련 Application Services
@@ -117,9 +120,40 @@ class ApplicationServiceContainer:
             CacheInvalidationService: 캐시 무효화 서비스
         """
         if "cache_invalidation" not in self._services:
-            self._services["cache_invalidation"] = CacheInvalidationService()
+            self._services["cache_invalidation"] = CacheInvalidationService(self.get_query_result_cache())
         return self._services["cache_invalidation"]
 
+    def get_query_result_cache(self) -> QueryResultCache:
+        """쿼리 결과 캐시 조회 (메모리 LRU, get_query_service_container 의 핸들러와 무효화 서비스가 공유)
+
+        Returns:
+            QueryResultCache: 도메인 이벤트로 무효화되는 쿼리 결과 캐시
+        """
+        if "query_result_cache" not in self._services:
+            self._services["query_result_cache"] = QueryResultCache()
+        return self._services["query_result_cache"]
+
+    def get_query_service_container(self) -> QueryServiceContainer:
+        """Query Service 컨테이너 조회 (목록/상세/대시보드 핸들러를 쿼리 결과 캐시로 감쌈)
+
+        Returns:
+            QueryServiceContainer: 캐시 연결된 Query Dispatcher 를 제공하는 컨테이너
+        """
+        if "query_service_container" not in self._services:
+            self._services["query_service_container"] = QueryServiceContainer(
+                self._repo_container,
+                query_cache=self.get_query_result_cache()
+            )
+        return self._services["query_service_container"]
+
+    def get_query_service(self) -> QueryService:
+        """Query Service 조회
+
+        Returns:
+            QueryService: 캐시 연결된 Dispatcher 기반 조회 서비스
+        """
+        return self.get_query_service_container().get_query_service()
+
     def get_event_handler_registry(self) -> EventHandlerRegistry:
         """이벤트 핸들러 레지스트리 조회
 
@@ -290,8 +324,12 @@ class ApplicationServiceContainer:
         # EventHandlerRegistry 인스턴스 생성
         event_registry = self.get_event_handler_registry()
 
-        # DomainEventPublisher에 EventHandlerRegistry를 글로벌 비동기 핸들러로 등록
         domain_publisher = get_domain_event_publisher()
+
+        # 쿼리 캐시 무효화는 발행 직후 동기로 처리 (다음 조회가 이전 결과를 받지 않도록)
+        self.get_cache_invalidation_service().subscribe(domain_publisher)
+
+        # DomainEventPublisher에 EventHandlerRegistry를 글로벌 비동기 핸들러로 등록
         domain_publisher.subscribe_global_async(event_registry.handle_event)
 
         # 로깅
@@ -4,8 +4,10 @@ Caching Package
 """
 
 from .cache_invalidation_service import CacheInvalidationService, CacheKey
+from .query_result_cache import QueryResultCache
 
 __all__ = [
     "CacheInvalidationService",
-    "CacheKey"
+    "CacheKey",
+    "QueryResultCache"
 ]
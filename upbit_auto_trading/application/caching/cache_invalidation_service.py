@@ -3,9 +3,12 @@
 도메인 이벤트에 따른 캐시 무효화 규칙을 관리하고 실행합니다.
 """
 
-from typing import Dict, List, Optional
-import asyncio
+from typing import Any, Dict, List, Optional
+import dataclasses
+import hashlib
+import json
 from ...infrastructure.logging import create_component_logger
+from .query_result_cache import QueryResultCache
 
 class CacheKey:
     """캐시 키 관리 클래스"""
@@ -50,13 +53,51 @@ class CacheKey:
         """시장 지표 데이터 캐시 키"""
         return f"market:indicators:{symbol}"
 
+    @staticmethod
+    def query_variant(base_key: str, query: Any) -> str:
+        """
+        쿼리 파라미터별 캐시 키 (페이지/필터마다 별도 항목)
+
+        base_key 를 접두사로 쓰므로 항목을 base_key 태그로 저장하면 base_key 무효화 시 함께 제거됩니다.
+        """
+        params = dataclasses.asdict(query) if dataclasses.is_dataclass(query) else vars(query)
+        digest = hashlib.sha1(
+            json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+        return f"{base_key}:{digest}"
+
 class CacheInvalidationService:
     """캐시 무효화 관리 서비스"""
 
-    def __init__(self):
-        """서비스 초기화"""
+    # 도메인 이벤트 타입 → 무효화 범주
+    _EVENT_CATEGORIES = {
+        "strategy.created": "strategy",
+        "strategy.updated": "strategy",
+        "strategy.deleted": "strategy",
+        "strategy.activated": "strategy",
+        "strategy.deactivated": "strategy",
+        "trigger.created": "trigger",
+        "trigger.updated": "trigger",
+        "trigger.deleted": "trigger",
+        "backtest.started": "backtest",
+        "backtest.completed": "backtest",
+        "backtest.failed": "backtest",
+        "backtest.stopped": "backtest",
+        "backtest.result.saved": "backtest",
+        "strategy.backtest.completed": "backtest",
+    }
+
+    def __init__(self, cache: Optional[QueryResultCache] = None):
+        """
+        서비스 초기화
+
+        Args:
+            cache: 실제로 항목을 제거할 쿼리 결과 캐시 (None 이면 규칙 계산/로깅만 수행)
+        """
         self._logger = create_component_logger("CacheInvalidationService")
+        self._cache = cache
         self._invalidation_rules: Dict[str, List[str]] = {}
+        self._subscriptions: List[str] = []
         self._setup_invalidation_rules()
 
     def _setup_invalidation_rules(self) -> None:
@@ -91,18 +132,7 @@ class CacheInvalidationService:
         Args:
             strategy_id: 전략 ID
         """
-        # 특정 전략 관련 캐시들
-        strategy_specific_keys = [
-            CacheKey.strategy_detail(strategy_id),
-            CacheKey.strategy_triggers(strategy_id),
-            CacheKey.strategy_backtest_results(strategy_id)
-        ]
-
-        # 글로벌 캐시들
-        global_keys = self._invalidation_rules.get("strategy_changed", [])
-
-        # 모든 키 무효화
-        all_keys = strategy_specific_keys + global_keys
+        all_keys = self._strategy_keys(strategy_id)
         await self._invalidate_cache_keys(all_keys)
 
         self._logger.info(f"전략 관련 캐시 무효화 완료: strategy_id={strategy_id}, "
@@ -116,17 +146,7 @@ class CacheInvalidationService:
             strategy_id: 전략 ID
             trigger_id: 트리거 ID (선택)
         """
-        # 전략의 트리거 목록과 상세 정보 캐시
-        strategy_specific_keys = [
-            CacheKey.strategy_detail(strategy_id),
-            CacheKey.strategy_triggers(strategy_id)
-        ]
-
-        # 글로벌 캐시들
-        global_keys = self._invalidation_rules.get("trigger_changed", [])
-
-        # 모든 키 무효화
-        all_keys = strategy_specific_keys + global_keys
+        all_keys = self._trigger_keys(strategy_id)
         await self._invalidate_cache_keys(all_keys)
 
         trigger_info = f", trigger_id={trigger_id}" if trigger_id else ""
@@ -141,17 +161,7 @@ class CacheInvalidationService:
             strategy_id: 전략 ID
             backtest_id: 백테스트 ID (선택)
         """
-        # 백테스팅 결과 캐시
-        strategy_specific_keys = [
-            CacheKey.strategy_backtest_results(strategy_id),
-            CacheKey.strategy_detail(strategy_id)  # 전략 상세에 최신 백테스팅 결과 포함
-        ]
-
-        # 글로벌 캐시들
-        global_keys = self._invalidation_rules.get("backtest_completed", [])
-
-        # 모든 키 무효화
-        all_keys = strategy_specific_keys + global_keys
+        all_keys = self._backtest_keys(strategy_id)
         await self._invalidate_cache_keys(all_keys)
 
         backtest_info = f", backtest_id={backtest_id}" if backtest_id else ""
@@ -194,12 +204,10 @@ class CacheInvalidationService:
         Args:
             pattern: 캐시 키 패턴 (예: "strategy:*", "dashboard:*")
         """
-        # 실제 구현에서는 Redis의 KEYS 명령이나 메모리 캐시의 패턴 매칭 사용
-        # 현재는 로깅으로 대체
-        self._logger.info(f"패턴 기반 캐시 무효화: pattern={pattern}")
-
-        # 비동기 처리 시뮬레이션
-        await asyncio.sleep(0.001)
+        # 끝의 '*' 만 지원 (접두사 매칭)
+        prefix = pattern[:-1] if pattern.endswith("*") else pattern
+        removed = self._cache.invalidate_prefix(prefix) if self._cache is not None else 0
+        self._logger.info(f"패턴 기반 캐시 무효화: pattern={pattern}, 제거 항목={removed}")
 
     async def _invalidate_cache_keys(self, keys: List[str]) -> None:
         """
@@ -208,18 +216,117 @@ class CacheInvalidationService:
         Args:
             keys: 무효화할 캐시 키 목록
         """
+        self._invalidate_now(keys)
+
+    def _invalidate_now(self, keys: List[str]) -> int:
+        """캐시 키(태그) 무효화 - 동기 실행, 제거된 항목 수 반환"""
         if not keys:
-            return
+            return 0
+
+        removed = self._cache.invalidate(keys) if self._cache is not None else 0
+        self._logger.debug(f"🗑️ 캐시 키 {len(keys)}개 무효화: 제거 항목={removed}, keys={keys}")
+        return removed
+
+    def _strategy_keys(self, strategy_id: str) -> List[str]:
+        """전략 변경 시 무효화 키 (해당 전략 상세/트리거/백테스트 + 글로벌)"""
+        return [
+            CacheKey.strategy_detail(strategy_id),
+            CacheKey.strategy_triggers(strategy_id),
+            CacheKey.strategy_backtest_results(strategy_id)
+        ] + self._invalidation_rules.get("strategy_changed", [])
+
+    def _trigger_keys(self, strategy_id: str) -> List[str]:
+        """트리거 변경 시 무효화 키 (전략 상세/트리거 목록 + 글로벌)"""
+        return [
+            CacheKey.strategy_detail(strategy_id),
+            CacheKey.strategy_triggers(strategy_id)
+        ] + self._invalidation_rules.get("trigger_changed", [])
 
-        # 실제 구현에서는 여기서 Redis나 메모리 캐시에서 키들을 삭제
-        # 현재는 로깅으로 동작 확인
-        for key in keys:
-            self._logger.debug(f"🗑️ 캐시 무효화: {key}")
+    def _backtest_keys(self, strategy_id: str) -> List[str]:
+        """백테스팅 변경 시 무효화 키 (전략 상세에 최신 백테스팅 결과 포함)"""
+        return [
+            CacheKey.strategy_backtest_results(strategy_id),
+            CacheKey.strategy_detail(strategy_id),
+            # 전략 목록의 최근 백테스트 일시/수익률
+            CacheKey.strategy_list()
+        ] + self._invalidation_rules.get("backtest_completed", [])
 
-        # 병렬 무효화 시뮬레이션
-        await asyncio.sleep(0.01)
+    # ================================================================
+    # 도메인 이벤트 기반 무효화
+    # ================================================================
 
-        self._logger.debug(f"캐시 키 {len(keys)}개 무효화 완료")
+    def keys_for_event(self, event: Any) -> List[str]:
+        """
+        도메인 이벤트가 영향을 주는 캐시 키 목록
+
+        전략 ID 가 없는 트리거 이벤트(trigger.updated 등)는 모든 전략 상세/트리거 항목을 접두사로 무효화합니다.
+        """
+        category = self._EVENT_CATEGORIES.get(getattr(event, "event_type", None))
+        if category is None:
+            return []
+        strategy_id = getattr(event, "strategy_id", None)
+        if category == "strategy":
+            return self._strategy_keys(strategy_id) if strategy_id else []
+        if category == "trigger":
+            if strategy_id:
+                return self._trigger_keys(strategy_id)
+            return list(self._invalidation_rules.get("trigger_changed", []))
+        return self._backtest_keys(strategy_id) if strategy_id else list(
+            self._invalidation_rules.get("backtest_completed", [])
+        )
+
+    def invalidate_for_event(self, event: Any) -> int:
+        """
+        도메인 이벤트에 맞춰 즉시(동기) 무효화
+
+        Returns:
+            제거된 캐시 항목 수
+        """
+        keys = self.keys_for_event(event)
+        removed = self._invalidate_now(keys)
+        category = self._EVENT_CATEGORIES.get(getattr(event, "event_type", None))
+        if category == "trigger" and not getattr(event, "strategy_id", None):
+            removed += self._invalidate_prefix_now("strategy:detail:")
+            removed += self._invalidate_prefix_now("strategy:triggers:")
+        return removed
+
+    async def handle_event(self, event: Any) -> int:
+        """비동기 이벤트 핸들러용 진입점 (EventHandlerRegistry)"""
+        return self.invalidate_for_event(event)
+
+    def handles_event_type(self, event_type: str) -> bool:
+        return event_type in self._EVENT_CATEGORIES
+
+    def subscribe(self, publisher) -> None:
+        """
+        DomainEventPublisher 동기 구독 - 이벤트 발행 직후 캐시 항목 제거
+
+        Args:
+            publisher: DomainEventPublisher (subscribe(event_type, handler) 제공)
+        """
+        for event_type in self._EVENT_CATEGORIES:
+            publisher.subscribe(event_type, self._on_domain_event)
+            self._subscriptions.append(event_type)
+        self._logger.info(f"캐시 무효화 이벤트 구독: {len(self._EVENT_CATEGORIES)}종")
+
+    def unsubscribe(self, publisher) -> None:
+        for event_type in self._subscriptions:
+            publisher.unsubscribe(event_type, self._on_domain_event)
+        self._subscriptions.clear()
+
+    def _on_domain_event(self, event: Any) -> None:
+        try:
+            self.invalidate_for_event(event)
+        except Exception as e:
+            # DomainEventPublisher 는 구독자 예외를 조용히 무시하므로 여기서 기록
+            self._logger.warning(f"캐시 무효화 실패 (계속 진행): {event.event_type} - {e}")
+
+    def _invalidate_prefix_now(self, prefix: str) -> int:
+        return self._cache.invalidate_prefix(prefix) if self._cache is not None else 0
+
+    def get_cache_statistics(self) -> Dict[str, Any]:
+        """쿼리 결과 캐시 통계 (적중/미스/축출/무효화)"""
+        return self._cache.get_statistics() if self._cache is not None else {}
 
     async def get_invalidation_rules(self) -> Dict[str, List[str]]:
         """
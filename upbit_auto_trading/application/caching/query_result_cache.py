@@ -0,0 +1,364 @@
+"""
+2단 쿼리 결과 캐시 (메모리 LRU + 선택적 SQLite 디스크 계층)
+
+Query Handler 응답을 캐시 키 단위로 저장하고, CacheInvalidationService 가 도메인 이벤트에 맞춰
+키/태그 단위로 정확히 무효화합니다.
+
+핵심 설계:
+1. 값은 pickle 바이트로 저장 - 바이트 예산을 정확히 계산하고, 호출자가 응답 DTO 를 수정해도
+   캐시 내용이 오염되지 않음 (조회마다 새 객체로 복원)
+2. 메모리 계층: 바이트 예산 기반 LRU (OrderedDict)
+3. 디스크 계층(선택): 쓰기 시점 동시 기록(write-through), 재시작 후에도 유지, 바이트 예산 초과 시
+   마지막 접근 순서로 축출. 디스크 적중은 메모리 계층으로 승격
+4. 태그: 하나의 항목이 여러 무효화 키에 속할 수 있음
+   (예: 대시보드 응답 → dashboard:summary, dashboard:performance)
+5. 세대 카운터: 로딩 중에 무효화가 일어나면 그 결과는 캐시에 넣지 않음 (이전 데이터 재등록 방지)
+"""
+
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from ...infrastructure.logging import create_component_logger
+
+logger = create_component_logger("QueryResultCache")
+
+_MISSING = object()
+
+
+@dataclass
+class _MemoryEntry:
+    payload: bytes
+    tags: Tuple[str, ...]
+    expires_at: Optional[float]
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.payload)
+
+
+class QueryResultCache:
+    """
+    쿼리 결과 캐시
+
+    get_or_load() 가 기본 진입점 (read-through)이며, invalidate() / invalidate_prefix() 로 무효화합니다.
+    """
+
+    def __init__(self, memory_budget_bytes: int = 16 * 1024 * 1024,
+                 disk_path: Optional[Union[str, Path]] = None,
+                 disk_budget_bytes: int = 128 * 1024 * 1024,
+                 default_ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            memory_budget_bytes: 메모리 계층 바이트 예산
+            disk_path: 디스크 계층 SQLite 파일 경로 (None 이면 메모리 계층만 사용)
+            disk_budget_bytes: 디스크 계층 바이트 예산
+            default_ttl: 기본 만료 시간(초) - None 이면 무효화될 때까지 유지
+            clock: 만료 판정용 시계 (테스트 주입용)
+        """
+        self.memory_budget_bytes = memory_budget_bytes
+        self.disk_budget_bytes = disk_budget_bytes
+        self.default_ttl = default_ttl
+        self._clock = clock
+
+        self._memory: "OrderedDict[str, _MemoryEntry]" = OrderedDict()
+        self._memory_bytes = 0
+        self._tag_index: Dict[str, set] = {}
+        self._generation = 0
+        self._lock = threading.RLock()
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "loads": 0,
+            "puts": 0,
+            "evictions": 0,
+            "disk_evictions": 0,
+            "expirations": 0,
+            "invalidated_entries": 0,
+            "invalidation_calls": 0,
+            "stale_loads_discarded": 0,
+        }
+
+        self._disk: Optional[sqlite3.Connection] = None
+        self._disk_bytes = 0
+        if disk_path is not None:
+            self._open_disk(Path(disk_path))
+
+        logger.info(f"QueryResultCache 초기화: 메모리 예산 {memory_budget_bytes / 1024 / 1024:.1f}MB, "
+                    f"디스크 계층 {'사용 - ' + str(disk_path) if disk_path else '미사용'}")
+
+    # === 디스크 계층 스키마 ===
+
+    def _open_disk(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS query_cache (
+                cache_key TEXT PRIMARY KEY,
+                payload BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_query_cache_accessed ON query_cache(accessed_at)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS query_cache_tags (
+                tag TEXT NOT NULL,
+                cache_key TEXT NOT NULL,
+                PRIMARY KEY (tag, cache_key)
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_query_cache_tags_key ON query_cache_tags(cache_key)")
+        self._disk = conn
+        self._disk_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM query_cache").fetchone()[0]
+
+    # === 핵심 API ===
+
+    def get_or_load(self, key: str, loader: Callable[[], Any], tags: Iterable[str] = (),
+                    ttl: Optional[float] = None) -> Any:
+        """
+        캐시 조회 후 없으면 loader 결과를 저장하고 반환
+
+        loader 실행 중 무효화가 발생하면 결과는 반환만 하고 캐시에 넣지 않습니다.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            generation = self._generation
+            self._stats["loads"] += 1
+        value = loader()
+        with self._lock:
+            if generation != self._generation:
+                self._stats["stale_loads_discarded"] += 1
+                return value
+            self.put(key, value, tags=tags, ttl=ttl)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """메모리 → 디스크 순으로 조회 (만료 항목은 제거하고 미스 처리)"""
+        with self._lock:
+            now = self._clock()
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry.expires_at is not None and entry.expires_at <= now:
+                    self._remove_keys([key])
+                    self._stats["expirations"] += 1
+                else:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return pickle.loads(entry.payload)
+
+            if self._disk is not None:
+                entry = self._load_from_disk(key, now)
+                if entry is not None:
+                    self._remember(key, entry)
+                    self._stats["disk_hits"] += 1
+                    return pickle.loads(entry.payload)
+
+            self._stats["misses"] += 1
+            return default
+
+    def put(self, key: str, value: Any, tags: Iterable[str] = (), ttl: Optional[float] = None) -> None:
+        """값 저장 (메모리 + 디스크 동시 기록)"""
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        ttl = self.default_ttl if ttl is None else ttl
+        entry = _MemoryEntry(
+            payload=payload,
+            tags=tuple(dict.fromkeys(tags)),
+            expires_at=self._clock() + ttl if ttl is not None else None,
+        )
+        with self._lock:
+            self._stats["puts"] += 1
+            self._remember(key, entry)
+            if self._disk is not None:
+                self._store_on_disk(key, entry)
+
+    def invalidate(self, keys: Iterable[str]) -> int:
+        """
+        키 또는 태그로 무효화
+
+        Args:
+            keys: 캐시 키 또는 태그 (CacheKey 값) - 해당 키 자체와 그 태그를 가진 모든 항목 제거
+
+        Returns:
+            제거된 항목 수 (메모리/디스크 합집합 기준)
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return 0
+        with self._lock:
+            self._generation += 1
+            self._stats["invalidation_calls"] += 1
+            targets = set(key for key in keys if key in self._memory)
+            for tag in keys:
+                targets.update(self._tag_index.get(tag, ()))
+            if self._disk is not None:
+                targets.update(self._disk_keys_for(keys))
+            removed = self._remove_keys(targets)
+            self._stats["invalidated_entries"] += removed
+            return removed
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """키 접두사로 무효화 (예: 'strategy:' → 전략 관련 모든 항목)"""
+        with self._lock:
+            self._generation += 1
+            self._stats["invalidation_calls"] += 1
+            targets = {key for key in self._memory if key.startswith(prefix)}
+            if self._disk is not None:
+                targets.update(row[0] for row in self._disk.execute(
+                    "SELECT cache_key FROM query_cache WHERE cache_key >= ? AND cache_key < ?",
+                    (prefix, prefix + "\U0010ffff")
+                ))
+            removed = self._remove_keys(targets)
+            self._stats["invalidated_entries"] += removed
+            return removed
+
+    def clear(self) -> None:
+        """전체 비우기 (디스크 계층 포함)"""
+        with self._lock:
+            self._generation += 1
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._tag_index.clear()
+            if self._disk is not None:
+                self._disk.execute("DELETE FROM query_cache")
+                self._disk.execute("DELETE FROM query_cache_tags")
+                self._disk_bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """적중/미스/축출 통계와 계층별 사용량"""
+        with self._lock:
+            lookups = self._stats["memory_hits"] + self._stats["disk_hits"] + self._stats["misses"]
+            hits = self._stats["memory_hits"] + self._stats["disk_hits"]
+            return {
+                **self._stats,
+                "hit_ratio": hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "disk_enabled": self._disk is not None,
+                "disk_bytes": self._disk_bytes,
+                "disk_budget_bytes": self.disk_budget_bytes,
+            }
+
+    # === 내부 ===
+
+    def _remember(self, key: str, entry: _MemoryEntry) -> None:
+        """메모리 계층 등록 + 바이트 예산 초과분 LRU 축출 (디스크 사본은 유지)"""
+        self._forget(key)
+        self._memory[key] = entry
+        self._memory_bytes += entry.nbytes
+        for tag in entry.tags:
+            self._tag_index.setdefault(tag, set()).add(key)
+
+        while self._memory_bytes > self.memory_budget_bytes and len(self._memory) > 1:
+            evicted_key = next(iter(self._memory))
+            self._forget(evicted_key)
+            self._stats["evictions"] += 1
+
+    def _forget(self, key: str) -> None:
+        entry = self._memory.pop(key, None)
+        if entry is None:
+            return
+        self._memory_bytes -= entry.nbytes
+        for tag in entry.tags:
+            members = self._tag_index.get(tag)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self._tag_index[tag]
+
+    def _remove_keys(self, keys: Iterable[str]) -> int:
+        keys = list(keys)
+        for key in keys:
+            self._forget(key)
+        if self._disk is not None:
+            self._delete_from_disk(keys)
+        return len(keys)
+
+    def _delete_from_disk(self, keys: List[str]) -> None:
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            marks = ", ".join("?" for _ in chunk)
+            freed = self._disk.execute(
+                f"SELECT COALESCE(SUM(size), 0) FROM query_cache WHERE cache_key IN ({marks})", chunk
+            ).fetchone()[0]
+            self._disk.execute(f"DELETE FROM query_cache WHERE cache_key IN ({marks})", chunk)
+            self._disk.execute(f"DELETE FROM query_cache_tags WHERE cache_key IN ({marks})", chunk)
+            self._disk_bytes -= freed
+
+    def _disk_keys_for(self, keys: List[str]) -> List[str]:
+        marks = ", ".join("?" for _ in keys)
+        return [row[0] for row in self._disk.execute(
+            f"SELECT cache_key FROM query_cache WHERE cache_key IN ({marks}) "
+            f"UNION SELECT cache_key FROM query_cache_tags WHERE tag IN ({marks})",
+            keys + keys
+        )]
+
+    def _load_from_disk(self, key: str, now: float) -> Optional[_MemoryEntry]:
+        row = self._disk.execute(
+            "SELECT payload, expires_at FROM query_cache WHERE cache_key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        payload, expires_at = row
+        if expires_at is not None and expires_at <= now:
+            self._remove_keys([key])
+            self._stats["expirations"] += 1
+            return None
+        tags = tuple(tag for (tag,) in self._disk.execute(
+            "SELECT tag FROM query_cache_tags WHERE cache_key = ?", (key,)
+        ))
+        self._disk.execute("UPDATE query_cache SET accessed_at = ? WHERE cache_key = ?", (now, key))
+        return _MemoryEntry(payload=payload, tags=tags, expires_at=expires_at)
+
+    def _store_on_disk(self, key: str, entry: _MemoryEntry) -> None:
+        conn = self._disk
+        previous = conn.execute("SELECT size FROM query_cache WHERE cache_key = ?", (key,)).fetchone()
+        conn.execute("BEGIN")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO query_cache (cache_key, payload, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, entry.payload, entry.nbytes, entry.expires_at, self._clock())
+            )
+            conn.execute("DELETE FROM query_cache_tags WHERE cache_key = ?", (key,))
+            conn.executemany(
+                "INSERT INTO query_cache_tags (tag, cache_key) VALUES (?, ?)",
+                [(tag, key) for tag in entry.tags]
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        self._disk_bytes += entry.nbytes - (previous[0] if previous else 0)
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """디스크 바이트 예산 초과 시 마지막 접근이 오래된 항목부터 제거 (메모리 사본은 유지)"""
+        while self._disk_bytes > self.disk_budget_bytes:
+            victims = [row[0] for row in self._disk.execute(
+                "SELECT cache_key FROM query_cache ORDER BY accessed_at LIMIT 16"
+            )]
+            if not victims:
+                break
+            self._delete_from_disk(victims)
+            self._stats["disk_evictions"] += len(victims)
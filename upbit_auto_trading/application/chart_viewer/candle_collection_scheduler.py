@@ -0,0 +1,370 @@
+"""
+캔들 수집 스케줄러 - 모든 차트의 REST 캔들 조회를 공유 예산 하나로 우선순위 처리
+
+여러 차트 창이 각자 API 수집을 시작하면 같은 REST 공용(시세) 예산을 순서 없이 나눠 쓰게 되어,
+방금 활성화한 차트가 백그라운드 창의 과거 캔들 조회 뒤에서 기다리게 됩니다.
+이 스케줄러는 캔들 조회를 우선순위 작업으로 한 곳에 모아 처리합니다.
+
+주요 기능:
+- 우선순위: ChartViewerResourceManager 창 상태(active 5 / background 8 / minimized 10) 기준,
+  같은 우선순위는 요청 순서(FIFO)
+- 예산 분할: 작업자가 한 번에 가져가는 페이지 수 = 현재 남은 예산 토큰 수 (작업 잔여 페이지로 제한)
+- 선점: 페이지마다 더 높은 우선순위 대기 작업이 있는지 확인하고, 있으면 현재 작업을 큐로 되돌림
+  (백그라운드 → 활성 전환 시 해당 차트 작업이 즉시 앞으로 이동)
+- 중복 제거: 같은 (심볼, 타임프레임, 개수, to) 조회는 하나의 작업으로 합치고 결과를 공유
+
+Rate Limiter(UnifiedUpbitRateLimiter)는 그대로 최종 관문으로 남고, 스케줄러는 예산을 넘는 요청을
+미리 흘려보내지 않아 Rate Limiter 대기열(우선순위 없음)에 요청이 쌓이지 않게 합니다.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from upbit_auto_trading.domain.events.chart_viewer_events import ChartViewerPriority
+from upbit_auto_trading.infrastructure.logging import create_component_logger
+
+# (symbol, timeframe, count, to) -> 캔들 목록 (최대 page_size 개)
+CandleFetcher = Callable[[str, str, int, Optional[str]], Awaitable[List[Dict[str, Any]]]]
+
+UPBIT_MAX_CANDLES_PER_REQUEST = 200
+
+_MINUTE_UNITS = {"1m": 1, "3m": 3, "5m": 5, "10m": 10, "15m": 15, "30m": 30, "1h": 60, "4h": 240}
+
+
+@dataclass(frozen=True)
+class CandleFetchKey:
+    """중복 제거 기준 (같은 키의 조회는 하나의 작업으로 처리)"""
+    symbol: str
+    timeframe: str
+    count: int
+    to: Optional[str] = None
+
+
+@dataclass(eq=False)
+class CandleFetchJob:
+    """우선순위 큐의 캔들 조회 작업"""
+    key: CandleFetchKey
+    priority: int
+    sequence: int
+    future: asyncio.Future
+    chart_ids: Set[str] = field(default_factory=set)
+    candles: List[Dict[str, Any]] = field(default_factory=list)
+    cursor: Optional[str] = None
+    pages_fetched: int = 0
+    preemptions: int = 0
+    running: bool = False
+    enqueued_at: float = 0.0
+
+    @property
+    def remaining(self) -> int:
+        return self.key.count - len(self.candles)
+
+    @property
+    def done(self) -> bool:
+        return self.future.done()
+
+
+class CollectionBudget:
+    """스케줄러 몫의 REST 예산 (토큰 버킷, 기본값은 업비트 시세 API 10 RPS)"""
+
+    def __init__(self, rps: float = 10.0, burst: int = 10,
+                 clock: Optional[Callable[[], float]] = None):
+        self.rps = rps
+        self.burst = burst
+        self._clock = clock or time.monotonic
+        self._tokens = float(burst)
+        self._updated = self._clock()
+
+    def available(self) -> int:
+        """지금 바로 사용할 수 있는 요청 수"""
+        now = self._clock()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rps)
+        self._updated = now
+        return int(self._tokens)
+
+    def consume(self, count: int = 1) -> None:
+        self.available()
+        self._tokens -= count
+
+    def time_until_available(self) -> float:
+        """토큰 1개가 생길 때까지 남은 시간 (초)"""
+        if self.available() >= 1:
+            return 0.0
+        return (1.0 - self._tokens) / self.rps
+
+
+class CandleCollectionScheduler:
+    """
+    공유 예산 기반 캔들 수집 스케줄러
+
+    사용 예시:
+        scheduler = CandleCollectionScheduler(create_public_client_fetcher(client), resource_manager)
+        candles = await scheduler.fetch("chart_1", "KRW-BTC", "1m", count=600)
+    """
+
+    def __init__(self,
+                 fetcher: CandleFetcher,
+                 resource_manager: Optional[Any] = None,
+                 budget: Optional[CollectionBudget] = None,
+                 max_workers: int = 3,
+                 page_size: int = UPBIT_MAX_CANDLES_PER_REQUEST):
+        """
+        Args:
+            fetcher: 캔들 한 페이지 조회 함수 (create_public_client_fetcher 참고)
+            resource_manager: 창 상태별 우선순위 제공 (ChartViewerResourceManager, 선택)
+            budget: 공유 REST 예산 (기본 10 RPS / 버스트 10)
+            max_workers: 동시에 진행하는 작업 수 (페이지는 작업 안에서 순차 - 다음 페이지 to 가 이전 결과에 의존)
+            page_size: 요청당 최대 캔들 수
+        """
+        self._logger = create_component_logger("CandleCollectionScheduler")
+        self.fetcher = fetcher
+        self.resource_manager = resource_manager
+        self.budget = budget or CollectionBudget()
+        self.max_workers = max_workers
+        self.page_size = page_size
+
+        self._jobs: Dict[CandleFetchKey, CandleFetchJob] = {}
+        self._queue: List[Tuple[int, int, CandleFetchJob]] = []    # (priority, sequence, job) - 오래된 항목은 꺼낼 때 무시
+        self._sequence = itertools.count()
+        self._chart_priorities: Dict[str, int] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._workers: List[asyncio.Task] = []
+
+        self.stats = {"jobs": 0, "deduplicated": 0, "pages": 0, "preemptions": 0, "failed": 0}
+
+        if resource_manager is not None and hasattr(resource_manager, "add_state_change_listener"):
+            resource_manager.add_state_change_listener(self._on_window_state_changed)
+
+    # ==================== 공개 API ====================
+
+    async def fetch(self, chart_id: str, symbol: str, timeframe: str, count: int = 200,
+                    to: Optional[str] = None, window_state: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        캔들 조회 요청 (최신 → 과거 순으로 count 개, 같은 조회가 대기/진행 중이면 합류)
+
+        Returns:
+            조회된 캔들 목록 (거래소 데이터가 부족하면 count 보다 적을 수 있음)
+        """
+        if window_state is not None:
+            self._chart_priorities[chart_id] = ChartViewerPriority.get_window_priority(window_state)
+        priority = self._priority_of(chart_id)
+
+        key = CandleFetchKey(symbol, timeframe, count, to)
+        job = self._jobs.get(key)
+        if job is not None:
+            self.stats["deduplicated"] += 1
+            job.chart_ids.add(chart_id)
+            if priority < job.priority:
+                self._reprioritize(job, priority)
+        else:
+            loop = asyncio.get_running_loop()
+            job = CandleFetchJob(key=key, priority=priority, sequence=next(self._sequence),
+                                 future=loop.create_future(), chart_ids={chart_id}, cursor=to,
+                                 enqueued_at=loop.time())
+            self._jobs[key] = job
+            self.stats["jobs"] += 1
+            self._push(job)
+            self._ensure_workers()
+
+        # 한 차트가 취소돼도 같은 작업을 기다리는 다른 차트에는 영향 없음
+        return await asyncio.shield(job.future)
+
+    def update_chart_priority(self, chart_id: str, window_state: Optional[str] = None) -> int:
+        """
+        차트 우선순위 갱신 (window_state 를 생략하면 resource_manager 에서 조회)
+
+        Returns:
+            우선순위가 바뀐 대기/진행 작업 수
+        """
+        if window_state is not None:
+            self._chart_priorities[chart_id] = ChartViewerPriority.get_window_priority(window_state)
+        else:
+            self._chart_priorities.pop(chart_id, None)
+
+        updated = 0
+        for job in list(self._jobs.values()):
+            if chart_id in job.chart_ids:
+                priority = min(self._priority_of(owner) for owner in job.chart_ids)
+                if priority != job.priority:
+                    self._reprioritize(job, priority)
+                    updated += 1
+        if updated:
+            self._logger.debug(f"수집 우선순위 갱신: {chart_id} ({updated}개 작업)")
+        return updated
+
+    def cancel_chart(self, chart_id: str, symbol: Optional[str] = None, timeframe: Optional[str] = None) -> int:
+        """
+        차트의 대기 중 조회 취소 (다른 차트와 공유하는 작업은 해당 차트만 빠짐)
+
+        Returns:
+            취소된 작업 수
+        """
+        cancelled = 0
+        for key, job in list(self._jobs.items()):
+            if chart_id not in job.chart_ids:
+                continue
+            if (symbol and key.symbol != symbol) or (timeframe and key.timeframe != timeframe):
+                continue
+            job.chart_ids.discard(chart_id)
+            if job.chart_ids:
+                self._reprioritize(job, min(self._priority_of(owner) for owner in job.chart_ids))
+            else:
+                self._jobs.pop(key, None)
+                job.future.cancel()
+                cancelled += 1
+        self._chart_priorities.pop(chart_id, None)
+        return cancelled
+
+    async def shutdown(self) -> None:
+        """작업자 종료 및 대기 중 작업 취소"""
+        for job in self._jobs.values():
+            job.future.cancel()
+        self._jobs.clear()
+        self._queue.clear()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+    def get_status(self) -> Dict[str, Any]:
+        """스케줄러 상태 (대기/진행 작업, 예산, 통계)"""
+        return {
+            "queued_jobs": sum(1 for job in self._jobs.values() if not job.running),
+            "running_jobs": sum(1 for job in self._jobs.values() if job.running),
+            "budget_available": self.budget.available(),
+            "budget_rps": self.budget.rps,
+            "stats": dict(self.stats),
+        }
+
+    # ==================== 우선순위 ====================
+
+    def _priority_of(self, chart_id: str) -> int:
+        if chart_id in self._chart_priorities:
+            return self._chart_priorities[chart_id]
+        if self.resource_manager is not None:
+            return self.resource_manager.get_chart_priority(chart_id)
+        return ChartViewerPriority.CHART_HIGH
+
+    def _on_window_state_changed(self, chart_id: str, old_state: str, new_state: str) -> None:
+        """ChartViewerResourceManager 창 상태 변경 알림"""
+        self._chart_priorities.pop(chart_id, None)
+        self.update_chart_priority(chart_id)
+
+    def _reprioritize(self, job: CandleFetchJob, priority: int) -> None:
+        job.priority = priority
+        if not job.running:
+            self._push(job)          # 이전 항목은 우선순위 불일치로 꺼낼 때 무시됨
+
+    def _push(self, job: CandleFetchJob) -> None:
+        heapq.heappush(self._queue, (job.priority, job.sequence, job))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _peek(self) -> Optional[CandleFetchJob]:
+        """가장 급한 대기 작업 (오래된 큐 항목 정리)"""
+        queue = self._queue
+        while queue:
+            priority, _, job = queue[0]
+            if job.running or job.done or priority != job.priority or self._jobs.get(job.key) is not job:
+                heapq.heappop(queue)
+                continue
+            return job
+        return None
+
+    # ==================== 작업자 ====================
+
+    def _ensure_workers(self) -> None:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        while len(self._workers) < self.max_workers:
+            self._workers.append(asyncio.create_task(self._worker(), name=f"candle-scheduler-{len(self._workers)}"))
+
+    async def _worker(self) -> None:
+        while True:
+            # 예산이 생길 때까지 기다린 뒤 작업을 고름 (대기 중 들어온 급한 작업이 먼저 선택되도록)
+            delay = self.budget.time_until_available()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            job = self._peek()
+            if job is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            heapq.heappop(self._queue)
+            job.running = True
+            try:
+                await self._run_slice(job)
+            finally:
+                job.running = False
+            if not job.done and self._jobs.get(job.key) is job:
+                self._push(job)
+
+    async def _run_slice(self, job: CandleFetchJob) -> None:
+        """남은 예산만큼 페이지 조회 (더 급한 작업이 기다리면 중단하고 양보)"""
+        pages_left = -(-job.remaining // self.page_size)
+        slice_pages = max(1, min(pages_left, self.budget.available()))
+
+        for _ in range(slice_pages):
+            if job.done:
+                return
+            if self.budget.available() < 1:
+                return
+            self.budget.consume()
+
+            count = min(self.page_size, job.remaining)
+            try:
+                page = await self.fetcher(job.key.symbol, job.key.timeframe, count, job.cursor)
+            except Exception as e:
+                self.stats["failed"] += 1
+                self._logger.error(f"캔들 조회 실패: {job.key} - {e}")
+                self._finish(job, error=e)
+                return
+
+            self.stats["pages"] += 1
+            job.pages_fetched += 1
+            job.candles.extend(page)
+            if len(page) < count or job.remaining <= 0:
+                self._finish(job)
+                return
+            job.cursor = min(candle["candle_date_time_utc"] for candle in page)
+
+            waiting = self._peek()
+            if waiting is not None and waiting.priority < job.priority:
+                job.preemptions += 1
+                self.stats["preemptions"] += 1
+                return
+
+    def _finish(self, job: CandleFetchJob, error: Optional[Exception] = None) -> None:
+        if self._jobs.get(job.key) is job:
+            del self._jobs[job.key]
+        if job.future.done():
+            return
+        if error is not None:
+            job.future.set_exception(error)
+        else:
+            job.future.set_result(job.candles)
+
+
+def create_public_client_fetcher(client) -> CandleFetcher:
+    """UpbitPublicClient 의 타임프레임별 캔들 메서드를 CandleFetcher 형태로 감싸기"""
+
+    async def fetch(symbol: str, timeframe: str, count: int, to: Optional[str]) -> List[Dict[str, Any]]:
+        if timeframe in _MINUTE_UNITS:
+            return await client.get_candles_minutes(_MINUTE_UNITS[timeframe], symbol, count=count, to=to)
+        if timeframe == "1d":
+            return await client.get_candles_days(symbol, count=count, to=to)
+        if timeframe == "1w":
+            return await client.get_candles_weeks(symbol, count=count, to=to)
+        if timeframe == "1M":
+            return await client.get_candles_months(symbol, count=count, to=to)
+        raise ValueError(f"지원하지 않는 타임프레임: {timeframe}")
+
+    return fetch
@@ -3,14 +3,50 @@
 
 기존 시스템과 완전히 독립적으로 차트뷰어의 리소스를 관리합니다.
 창 상태에 따른 우선순위 조정 및 메모리 제한을 담당합니다.
+
+메모리 예산:
+- 차트별 데이터 버퍼(캔들·지표·호가 스냅샷)의 실제 할당 바이트를 합산해 전역 예산과 비교
+- 초과 시 우선순위 낮은 차트부터 축출: 최소화 → 전체 해제, 백그라운드 → 축소(최근 구간) 후 필요 시 해제,
+  마지막으로 가장 오래 사용하지 않은 활성 차트 축소 (가장 최근 활성 차트는 유지)
+- 축소/해제된 차트는 활성화될 때 restore() 로 다시 적재 (DB 재조회)
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, List, Protocol
 from dataclasses import dataclass
 from datetime import datetime
 from upbit_auto_trading.domain.events.chart_viewer_events import ChartViewerPriority
 from upbit_auto_trading.infrastructure.logging import create_component_logger
 
+MB = 1024 * 1024
+
+
+class ChartDataBuffer(Protocol):
+    """예산 관리 대상 차트 데이터 버퍼 (구현: infrastructure.chart_viewer.chart_memory_buffers)"""
+
+    kind: str                       # 'candles', 'indicator', 'orderbook' 등
+
+    @property
+    def nbytes(self) -> int:
+        """현재 할당된 배열 바이트"""
+        ...
+
+    def compact(self) -> None:
+        """최근 구간만 남긴 축소 형태로 전환"""
+        ...
+
+    def release(self) -> None:
+        """데이터 전체 해제"""
+        ...
+
+    def restore(self) -> None:
+        """원래 형태로 다시 적재 (DB 재조회 등)"""
+        ...
+
+
+DATA_FULL = 'full'
+DATA_COMPACT = 'compact'
+DATA_RELEASED = 'released'
+
 
 @dataclass
 class ChartResourceInfo:
@@ -21,6 +57,7 @@ class ChartResourceInfo:
     memory_limit_mb: int
     last_activity: datetime
     is_active: bool
+    data_state: str = DATA_FULL  # 'full', 'compact', 'released'
 
 
 class ChartViewerResourceManager:
@@ -31,9 +68,18 @@ class ChartViewerResourceManager:
     창 상태에 따른 우선순위 자동 조정을 담당합니다.
     """
 
-    def __init__(self):
+    def __init__(self, memory_budget_bytes: Optional[int] = None):
+        """
+        Args:
+            memory_budget_bytes: 전체 차트 데이터 버퍼 메모리 예산 (기본 TOTAL_MEMORY_LIMIT_MB)
+        """
         self._logger = create_component_logger("ChartViewerResourceManager")
         self._chart_resources: Dict[str, ChartResourceInfo] = {}
+        self._chart_data: Dict[str, Dict[str, ChartDataBuffer]] = {}
+        self._state_change_listeners: List[Callable[[str, str, str], None]] = []
+
+        self.memory_budget_bytes = memory_budget_bytes or ChartViewerResourceLimits.TOTAL_MEMORY_LIMIT_MB * MB
+        self._eviction_stats = {'compactions': 0, 'releases': 0, 'restores': 0, 'bytes_freed': 0}
 
         # 리소스 제한 설정 (기존 시스템과 독립적)
         self._resource_limits = {
@@ -125,6 +171,8 @@ class ChartViewerResourceManager:
 
             # 리소스 조정 로직 호출
             self._adjust_chart_resources(chart_id, old_state, new_state)
+            self._notify_state_change(chart_id, old_state, new_state)
+            self.enforce_memory_budget()
 
             return resource_info
 
@@ -132,6 +180,17 @@ class ChartViewerResourceManager:
             self._logger.error(f"창 상태 변경 실패: {chart_id} - {e}")
             raise
 
+    def add_state_change_listener(self, listener: Callable[[str, str, str], None]) -> None:
+        """창 상태 변경 리스너 등록 (chart_id, old_state, new_state) - 수집 스케줄러 우선순위 갱신 등"""
+        self._state_change_listeners.append(listener)
+
+    def _notify_state_change(self, chart_id: str, old_state: str, new_state: str) -> None:
+        for listener in self._state_change_listeners:
+            try:
+                listener(chart_id, old_state, new_state)
+            except Exception as e:
+                self._logger.error(f"창 상태 변경 리스너 오류: {chart_id} - {e}")
+
     def unregister_chart(self, chart_id: str) -> bool:
         """차트 등록 해제 및 리소스 회수"""
         try:
@@ -140,10 +199,13 @@ class ChartViewerResourceManager:
                 return False
 
             resource_info = self._chart_resources.pop(chart_id)
+            freed = self.get_chart_memory_bytes(chart_id)
+            for data in self._chart_data.pop(chart_id, {}).values():
+                data.release()
 
             self._logger.info(
                 f"차트 등록 해제: {chart_id} "
-                f"(메모리 회수: {resource_info.memory_limit_mb}MB)"
+                f"(메모리 회수: {resource_info.memory_limit_mb}MB, 버퍼 {freed / MB:.1f}MB)"
             )
 
             return True
@@ -152,6 +214,101 @@ class ChartViewerResourceManager:
             self._logger.error(f"차트 등록 해제 실패: {chart_id} - {e}")
             return False
 
+    # ==================== 메모리 예산 ====================
+
+    def attach_data(self, chart_id: str, name: str, data: ChartDataBuffer) -> None:
+        """차트 데이터 버퍼 등록 (등록 후 예산 확인)"""
+        if chart_id not in self._chart_resources:
+            raise ValueError(f"등록되지 않은 차트: {chart_id}")
+
+        self._chart_data.setdefault(chart_id, {})[name] = data
+        self._logger.debug(f"차트 데이터 등록: {chart_id}/{name} ({data.kind}, {data.nbytes / MB:.1f}MB)")
+        self.enforce_memory_budget()
+
+    def detach_data(self, chart_id: str, name: str) -> Optional[ChartDataBuffer]:
+        """차트 데이터 버퍼 등록 해제 (버퍼 자체는 호출자가 정리)"""
+        return self._chart_data.get(chart_id, {}).pop(name, None)
+
+    def get_chart_memory_bytes(self, chart_id: str) -> int:
+        """차트 데이터 버퍼 실제 바이트 합"""
+        return sum(data.nbytes for data in self._chart_data.get(chart_id, {}).values())
+
+    def get_resident_bytes(self) -> int:
+        """전체 차트 데이터 버퍼 실제 바이트 합"""
+        return sum(self.get_chart_memory_bytes(chart_id) for chart_id in self._chart_data)
+
+    def enforce_memory_budget(self) -> int:
+        """
+        예산 초과 시 우선순위 정책으로 축출
+
+        Returns:
+            회수한 바이트
+        """
+        resident = self.get_resident_bytes()
+        if resident <= self.memory_budget_bytes:
+            return 0
+
+        started_with = resident
+        most_recent_active = max(
+            (info for info in self._chart_resources.values() if info.is_active),
+            key=lambda info: info.last_activity, default=None
+        )
+        # (창 상태, 대상 데이터 상태, 동작) - 위에서부터 예산 안에 들어올 때까지 적용
+        steps = (
+            ('minimized', (DATA_FULL, DATA_COMPACT), DATA_RELEASED),
+            ('background', (DATA_FULL,), DATA_COMPACT),
+            ('background', (DATA_COMPACT,), DATA_RELEASED),
+            ('active', (DATA_FULL,), DATA_COMPACT),
+        )
+        for window_state, data_states, action in steps:
+            candidates = sorted(
+                (info for info in self._chart_resources.values()
+                 if info.window_state == window_state and info.data_state in data_states
+                 and info is not most_recent_active and self._chart_data.get(info.chart_id)),
+                key=lambda info: info.last_activity
+            )
+            for info in candidates:
+                if resident <= self.memory_budget_bytes:
+                    break
+                resident -= self._apply_data_action(info, action)
+            if resident <= self.memory_budget_bytes:
+                break
+
+        freed = started_with - resident
+        if resident > self.memory_budget_bytes:
+            self._logger.warning(
+                f"메모리 예산 초과 유지: {resident / MB:.1f}MB / {self.memory_budget_bytes / MB:.1f}MB "
+                f"(축출 가능한 차트 없음)"
+            )
+        else:
+            self._logger.info(f"메모리 예산 축출: {freed / MB:.1f}MB 회수 (현재 {resident / MB:.1f}MB)")
+        return freed
+
+    def _apply_data_action(self, info: ChartResourceInfo, action: str) -> int:
+        """차트 데이터 축소/해제 후 회수한 바이트 반환"""
+        before = self.get_chart_memory_bytes(info.chart_id)
+        for data in self._chart_data.get(info.chart_id, {}).values():
+            if action == DATA_COMPACT:
+                data.compact()
+            else:
+                data.release()
+        info.data_state = action
+        self._eviction_stats['compactions' if action == DATA_COMPACT else 'releases'] += 1
+        freed = before - self.get_chart_memory_bytes(info.chart_id)
+        self._eviction_stats['bytes_freed'] += freed
+        self._logger.debug(f"차트 데이터 {action}: {info.chart_id} ({info.window_state}, {freed / MB:.1f}MB 회수)")
+        return freed
+
+    def _restore_chart_data(self, info: ChartResourceInfo) -> None:
+        """축소/해제된 차트 데이터 재적재"""
+        for name, data in self._chart_data.get(info.chart_id, {}).items():
+            try:
+                data.restore()
+            except Exception as e:
+                self._logger.error(f"차트 데이터 복원 실패: {info.chart_id}/{name} - {e}")
+        info.data_state = DATA_FULL
+        self._eviction_stats['restores'] += 1
+
     def get_chart_priority(self, chart_id: str) -> int:
         """차트의 현재 우선순위 조회"""
         if chart_id not in self._chart_resources:
@@ -194,6 +351,26 @@ class ChartViewerResourceManager:
         # 총 메모리 사용량
         stats['total_memory_mb'] = sum(info.memory_limit_mb for info in self._chart_resources.values())
 
+        # 데이터 버퍼 실제 사용량 (예산 대비)
+        resident_by_chart = {chart_id: self.get_chart_memory_bytes(chart_id) for chart_id in self._chart_resources}
+        for state in ['active', 'background', 'minimized']:
+            stats['by_state'][state]['resident_bytes'] = sum(
+                resident_by_chart[info.chart_id] for info in self._chart_resources.values()
+                if info.window_state == state
+            )
+        resident_by_kind: Dict[str, int] = {}
+        for buffers in self._chart_data.values():
+            for data in buffers.values():
+                resident_by_kind[data.kind] = resident_by_kind.get(data.kind, 0) + data.nbytes
+        stats['memory_budget_bytes'] = self.memory_budget_bytes
+        stats['resident_bytes'] = sum(resident_by_chart.values())
+        stats['resident_by_kind'] = resident_by_kind
+        stats['data_states'] = {
+            state: len([info for info in self._chart_resources.values() if info.data_state == state])
+            for state in (DATA_FULL, DATA_COMPACT, DATA_RELEASED)
+        }
+        stats['evictions'] = dict(self._eviction_stats)
+
         # 우선순위별 분포
         for priority in [ChartViewerPriority.CHART_HIGH, ChartViewerPriority.CHART_BACKGROUND, ChartViewerPriority.CHART_LOW]:
             count = len([info for info in self._chart_resources.values() if info.priority_level == priority])
@@ -226,11 +403,15 @@ class ChartViewerResourceManager:
 
             if new_priority > old_priority:  # 우선순위 낮아짐
                 self._logger.debug(f"차트 리소스 감소: {chart_id} ({old_priority} → {new_priority})")
-                # 리소스 사용량 감소 로직 (후속 Phase에서 구현)
+                # 실제 축출은 enforce_memory_budget() 이 예산 초과 시 우선순위 순으로 수행
 
             elif new_priority < old_priority:  # 우선순위 높아짐
                 self._logger.debug(f"차트 리소스 증가: {chart_id} ({old_priority} → {new_priority})")
-                # 리소스 사용량 증가 로직 (후속 Phase에서 구현)
+
+            # 활성화된 차트의 축소/해제 데이터 재적재
+            info = self._chart_resources[chart_id]
+            if new_state == 'active' and info.data_state != DATA_FULL:
+                self._restore_chart_data(info)
 
             # 기존 시스템과 격리된 메모리 관리
             old_memory = self._resource_limits[old_state]['memory_mb']
@@ -252,6 +433,10 @@ class ChartViewerResourceManager:
             chart_count = len(self._chart_resources)
             total_memory = sum(info.memory_limit_mb for info in self._chart_resources.values())
 
+            for buffers in self._chart_data.values():
+                for data in buffers.values():
+                    data.release()
+            self._chart_data.clear()
             self._chart_resources.clear()
 
             self._logger.info(
@@ -263,6 +448,17 @@ class ChartViewerResourceManager:
             self._logger.error(f"리소스 관리자 정리 실패: {e}")
 
 
+_shared_resource_manager: Optional[ChartViewerResourceManager] = None
+
+
+def get_chart_viewer_resource_manager() -> ChartViewerResourceManager:
+    """여러 차트 창이 하나의 메모리 예산을 공유하도록 전역 인스턴스 반환"""
+    global _shared_resource_manager
+    if _shared_resource_manager is None:
+        _shared_resource_manager = ChartViewerResourceManager()
+    return _shared_resource_manager
+
+
 # 창 상태별 우선순위 매핑 함수 (기존 시스템과 호환)
 def get_priority_for_window_state(window_state: str) -> int:
     """창 상태에 따른 우선순위 반환 (기존 시스템 안전)"""
@@ -70,7 +70,10 @@ class CoinListService:
         self._subscription_active = False
 
         # UI 콜백
-        self._update_callbacks: List[Callable[[List[CoinInfo]], None]] = []
+        self._update_callbacks: List[Callable[[List[CoinInfo]], None]] = []  # 전체 목록 (정렬됨)
+        self._change_callbacks: List[Callable[[List[CoinInfo]], None]] = []  # 변경된 코인만
+        self._trade_callbacks: List[Callable[[str, float, float, int], None]] = []  # 체결 단위 (차트 캔들 갱신)
+        self._subscription_callbacks: List[Callable[[List[str]], None]] = []  # 구독 심볼 (실시간 캔들 집계 체결 구독)
 
         # 실시간 모드 플래그 (WebSocket 우선, REST 폴백)
         self._realtime_mode = True
@@ -175,6 +178,8 @@ class CoinListService:
                 self._last_update = time.time()
 
                 self._logger.info(f"✅ 실시간 구독 성공: {len(symbols)}개 심볼")
+                for callback in list(self._subscription_callbacks):
+                    self._notify_subscription(callback)
                 return True
             else:
                 self._logger.error("❌ WebSocket 구독 실패")
@@ -237,14 +242,16 @@ class CoinListService:
                 # 새로운 심볼의 경우 티커 정보만 저장 (마켓 정보는 나중에 보완)
                 self._market_ticker_cache[symbol] = ticker_data
 
+            self._notify_trade(symbol, ticker_event, ticker_data)
+
             # CoinInfo 업데이트 (마켓 정보가 있는 경우에만)
             combined_data = self._market_ticker_cache[symbol]
             if 'korean_name' in combined_data or 'english_name' in combined_data:
                 coin_info = self._create_coin_info_from_combined(combined_data)
-                self._coin_info_cache[symbol] = coin_info
-
-            # UI 콜백 호출 (쓰로틀링 적용)
-            self._trigger_ui_update()
+                if self._coin_info_cache.get(symbol) != coin_info:
+                    self._coin_info_cache[symbol] = coin_info
+                    # UI 콜백 호출 (표시값이 실제로 바뀐 코인만)
+                    self._trigger_ui_update([coin_info])
 
             # 중요 가격 변동 로깅 (상위 코인만)
             if should_log and symbol in ['KRW-BTC', 'KRW-ETH', 'KRW-XRP']:
@@ -259,9 +266,25 @@ class CoinListService:
                 self._logger.warning(f"⚠️ 티커 업데이트 처리 중 오류: {e}")
                 self._last_error_log = time.time()
 
-    def _trigger_ui_update(self) -> None:
-        """UI 업데이트 트리거 (쓰로틀링 적용)"""
+    def _trigger_ui_update(self, changed: List[CoinInfo]) -> None:
+        """
+        UI 업데이트 트리거
+
+        변경 콜백에는 바뀐 코인만 전달합니다 (정렬/반영은 UI 모델이 증분 처리).
+        전체 목록 콜백이 등록된 경우에만 전체 목록을 만들어 정렬합니다.
+        """
         try:
+            for callback in self._change_callbacks:
+                try:
+                    callback(changed)
+                except Exception as callback_error:
+                    if time.time() - getattr(self, '_last_callback_error_log', 0) > 300:
+                        self._logger.warning(f"⚠️ UI 변경 콜백 오류: {callback_error}")
+                        self._last_callback_error_log = time.time()
+
+            if not self._update_callbacks:
+                return
+
             # 현재 캐시된 CoinInfo 목록 생성
             coin_infos = list(self._coin_info_cache.values())
 
@@ -300,6 +323,79 @@ class CoinListService:
             self._update_callbacks.remove(callback)
             self._logger.debug(f"🗑️ UI 콜백 해제: {len(self._update_callbacks)}개 활성")
 
+    def register_change_callback(self, callback: Callable[[List[CoinInfo]], None]) -> None:
+        """
+        변경분 콜백 등록 - 티커 수신으로 표시값이 바뀐 CoinInfo만 전달
+
+        Args:
+            callback: 변경된 CoinInfo 목록을 받는 콜백 함수
+        """
+        if callback not in self._change_callbacks:
+            self._change_callbacks.append(callback)
+            self._logger.debug(f"✅ UI 변경 콜백 등록: {len(self._change_callbacks)}개 활성")
+
+    def unregister_change_callback(self, callback: Callable[[List[CoinInfo]], None]) -> None:
+        """변경분 콜백 해제"""
+        if callback in self._change_callbacks:
+            self._change_callbacks.remove(callback)
+            self._logger.debug(f"🗑️ UI 변경 콜백 해제: {len(self._change_callbacks)}개 활성")
+
+    def register_trade_callback(self, callback: Callable[[str, float, float, int], None]) -> None:
+        """
+        체결 콜백 등록 - 티커 수신마다 (symbol, trade_price, trade_volume, trade_timestamp_ms) 전달
+
+        Args:
+            callback: 차트 마지막 캔들 갱신 등 체결 단위 처리가 필요한 콜백 함수
+        """
+        if callback not in self._trade_callbacks:
+            self._trade_callbacks.append(callback)
+            self._logger.debug(f"✅ 체결 콜백 등록: {len(self._trade_callbacks)}개 활성")
+
+    def unregister_trade_callback(self, callback: Callable[[str, float, float, int], None]) -> None:
+        """체결 콜백 해제"""
+        if callback in self._trade_callbacks:
+            self._trade_callbacks.remove(callback)
+            self._logger.debug(f"🗑️ 체결 콜백 해제: {len(self._trade_callbacks)}개 활성")
+
+    def register_subscription_callback(self, callback: Callable[[List[str]], None]) -> None:
+        """
+        구독 심볼 콜백 등록 - 실시간 티커 구독이 바뀔 때마다 구독 심볼 목록 전달
+
+        이미 구독 중이면 등록 즉시 현재 목록으로 한 번 호출합니다.
+        """
+        if callback not in self._subscription_callbacks:
+            self._subscription_callbacks.append(callback)
+            if self._subscription_active:
+                self._notify_subscription(callback)
+
+    def unregister_subscription_callback(self, callback: Callable[[List[str]], None]) -> None:
+        """구독 심볼 콜백 해제"""
+        if callback in self._subscription_callbacks:
+            self._subscription_callbacks.remove(callback)
+
+    def _notify_subscription(self, callback: Callable[[List[str]], None]) -> None:
+        try:
+            callback(list(self._subscribed_symbols))
+        except Exception as callback_error:
+            self._logger.warning(f"⚠️ 구독 심볼 콜백 오류: {callback_error}")
+
+    def _notify_trade(self, symbol: str, ticker_event, ticker_data: Dict[str, Any]) -> None:
+        """체결 콜백 호출 (등록된 콜백이 없으면 즉시 반환)"""
+        if not self._trade_callbacks:
+            return
+        price = float(ticker_data['trade_price'] or 0)
+        if price <= 0:
+            return
+        volume = float(getattr(ticker_event, 'trade_volume', 0) or 0)
+        timestamp = int(getattr(ticker_event, 'trade_timestamp', None) or ticker_data['timestamp'])
+        for callback in self._trade_callbacks:
+            try:
+                callback(symbol, price, volume, timestamp)
+            except Exception as callback_error:
+                if time.time() - getattr(self, '_last_callback_error_log', 0) > 300:
+                    self._logger.warning(f"⚠️ 체결 콜백 오류: {callback_error}")
+                    self._last_callback_error_log = time.time()
+
     async def _cleanup_websocket(self) -> None:
         """WebSocket 정리"""
         if self._websocket_client:
@@ -681,6 +777,9 @@ class CoinListService:
             self._market_ticker_cache.clear()
             self._coin_info_cache.clear()
             self._update_callbacks.clear()
+            self._change_callbacks.clear()
+            self._trade_callbacks.clear()
+            self._subscription_callbacks.clear()
 
             self._logger.info("✅ CoinListService 정리 완료")
 
@@ -701,6 +800,8 @@ class CoinListService:
             "cached_coins_count": len(self._coin_info_cache),
             "cached_market_ticker_count": len(self._market_ticker_cache),
             "update_callbacks_count": len(self._update_callbacks),
+            "change_callbacks_count": len(self._change_callbacks),
+            "trade_callbacks_count": len(self._trade_callbacks),
             "client_ready": self._client_ready,
             "callback_counter": self._callback_counter,
             "last_update": self._last_update
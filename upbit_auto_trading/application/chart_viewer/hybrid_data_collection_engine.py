@@ -8,6 +8,9 @@ WebSocket + API 하이브리드 모드로 1개월 타임프레임까지 안전
 - WebSocket/API 하이브리드 모드 구현 ✅
 - 1w, 1M 타임프레임 API 전용 처리 ✅
 - 기존 타임프레임과 호환성 보장 ✅
+
+API 캔들 조회는 CandleCollectionScheduler 가 주어지면 모든 차트가 공유하는 REST 예산 안에서
+창 상태 우선순위 순으로 처리됩니다 (없으면 기존 모의 데이터 경로).
 """
 
 from typing import Dict, Optional, Any, Set
@@ -65,14 +68,16 @@ class HybridDataCollectionEngine:
     기존 InMemoryEventBus와 호환되며, 차트뷰어 전용 우선순위를 사용합니다.
     """
 
-    def __init__(self, event_bus, timeframe_service):
+    def __init__(self, event_bus, timeframe_service, collection_scheduler=None):
         """
         Args:
             event_bus: 기존 InMemoryEventBus 인스턴스
             timeframe_service: TimeframeSupportService 인스턴스
+            collection_scheduler: CandleCollectionScheduler 인스턴스 (선택, 공유 예산 우선순위 조회)
         """
         self.event_bus = event_bus
         self.timeframe_service = timeframe_service
+        self.collection_scheduler = collection_scheduler
 
         # 데이터 수집 상태 관리
         self._active_collections: Dict[str, DataCollectionRequest] = {}
@@ -137,6 +142,10 @@ class HybridDataCollectionEngine:
 
             request = self._active_collections[collection_key]
 
+            # 대기 중인 API 조회 취소
+            if self.collection_scheduler is not None:
+                self.collection_scheduler.cancel_chart(chart_id, symbol, timeframe)
+
             # 전략별 수집 중지
             await self._stop_collection_by_strategy(request)
 
@@ -273,7 +282,29 @@ class HybridDataCollectionEngine:
         try:
             collection_key = f"{request.chart_id}:{request.symbol}:{request.timeframe}"
 
-            # 모의 데이터 (실제 구현에서는 Upbit API 호출)
+            if self.collection_scheduler is not None:
+                candles = await self.collection_scheduler.fetch(
+                    request.chart_id, request.symbol, request.timeframe,
+                    count=request.max_candles, window_state=request.window_state
+                )
+                if not candles:
+                    logger.warning(f"API 캔들 없음: {collection_key}")
+                    return None
+                latest = max(candles, key=lambda candle: candle["candle_date_time_utc"])
+                result = HybridCollectionResult(
+                    chart_id=request.chart_id,
+                    symbol=request.symbol,
+                    timeframe=request.timeframe,
+                    candle_data={**latest, "candles": candles},
+                    data_source="api",
+                    timestamp=datetime.now(),
+                    is_realtime=False
+                )
+                await self._publish_candle_event(request, result)
+                self._last_collection_time[collection_key] = datetime.now()
+                return result
+
+            # 모의 데이터 (스케줄러 미연결 시)
             mock_candle_data = {
                 "market": request.symbol,
                 "candle_date_time_kst": datetime.now().isoformat(),
@@ -391,6 +422,10 @@ class HybridDataCollectionEngine:
 
                     updated_count += 1
 
+            # 대기/진행 중인 API 조회 재정렬 (활성화된 차트는 다음 페이지부터 선점)
+            if self.collection_scheduler is not None:
+                self.collection_scheduler.update_chart_priority(chart_id, new_window_state)
+
             logger.info(f"수집 우선순위 업데이트 완료: {chart_id} -> {new_window_state} ({updated_count}개)")
 
             return True
@@ -454,9 +489,10 @@ class HybridDataCollectionEngine:
 
 
 # 편의 함수들
-def create_hybrid_collection_engine(event_bus, timeframe_service) -> HybridDataCollectionEngine:
+def create_hybrid_collection_engine(event_bus, timeframe_service,
+                                    collection_scheduler=None) -> HybridDataCollectionEngine:
     """HybridDataCollectionEngine 인스턴스 생성"""
-    return HybridDataCollectionEngine(event_bus, timeframe_service)
+    return HybridDataCollectionEngine(event_bus, timeframe_service, collection_scheduler)
 
 
 def create_collection_request(
@@ -39,32 +39,8 @@ class CacheInvalidationHandler(BaseEventHandler):
             event: 도메인 이벤트
         """
         try:
-            # 이벤트 타입별 캐시 무효화 처리
-            event_type = event.event_type
-
-            if event_type in ["strategy.created", "strategy.updated"]:
-                strategy_id = getattr(event, 'strategy_id', None)
-                if strategy_id:
-                    await self._cache_service.invalidate_for_strategy_change(strategy_id)
-
-            elif event_type == "trigger.created":
-                strategy_id = getattr(event, 'strategy_id', None)
-                trigger_id = getattr(event, 'trigger_id', None)
-                if strategy_id:
-                    await self._cache_service.invalidate_trigger_related_cache(strategy_id, trigger_id)
-
-            elif event_type == "backtest.completed":
-                strategy_id = getattr(event, 'strategy_id', None)
-                symbol = getattr(event, 'symbol', None)
-                if strategy_id and symbol:
-                    await self._cache_service.invalidate_for_backtest_completion(strategy_id, symbol)
-
-            # 기타 백테스팅 관련 이벤트들도 처리
-            elif event_type in ["backtest.started", "backtest.failed"]:
-                strategy_id = getattr(event, 'strategy_id', None)
-                if strategy_id:
-                    # 백테스팅 상태 변경에 따른 캐시 무효화
-                    await self._cache_service.invalidate_backtest_related_cache(strategy_id)
+            # 이벤트 → 캐시 키 매핑은 CacheInvalidationService 가 단일 관리
+            await self._cache_service.handle_event(event)
         except Exception as e:
             self._logger.warning(f"캐시 무효화 실패 (계속 진행): {e}")
 
@@ -78,12 +54,7 @@ class CacheInvalidationHandler(BaseEventHandler):
         Returns:
             처리 가능 여부
         """
-        cache_related_events = {
-            "strategy.created", "strategy.updated", "strategy.deleted",
-            "trigger.created", "trigger.updated", "trigger.deleted",
-            "backtest.started", "backtest.completed", "backtest.failed"
-        }
-        return event.event_type in cache_related_events
+        return self._cache_service.handles_event_type(event.event_type)
 
     def get_event_type(self) -> type:
         """
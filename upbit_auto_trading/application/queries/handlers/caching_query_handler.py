@@ -0,0 +1,71 @@
+"""
+캐싱 Query Handler 데코레이터
+내부 핸들러 결과를 QueryResultCache 로 읽기 통과(read-through) 캐싱하고,
+CacheInvalidationService 가 도메인 이벤트에 맞춰 태그 단위로 무효화합니다.
+"""
+
+from typing import Callable, Optional, Sequence, Tuple
+
+from upbit_auto_trading.application.caching.cache_invalidation_service import CacheKey
+from upbit_auto_trading.application.caching.query_result_cache import QueryResultCache
+from upbit_auto_trading.application.queries.dto.dashboard_query_dto import DashboardQuery
+from upbit_auto_trading.application.queries.dto.strategy_query_dto import StrategyDetailQuery, StrategyListQuery
+from upbit_auto_trading.application.queries.handlers.base_query_handler import BaseQueryHandler, Q, R
+
+# 쿼리 → (캐시 키, 무효화 태그)
+CacheKeyFactory = Callable[[Q], Tuple[str, Sequence[str]]]
+
+
+def strategy_list_cache_key(query: StrategyListQuery) -> Tuple[str, Sequence[str]]:
+    """전략 목록: 필터/정렬/페이지별 항목, 전략 목록 태그로 일괄 무효화"""
+    return CacheKey.query_variant(CacheKey.strategy_list(), query), (CacheKey.strategy_list(),)
+
+
+def strategy_detail_cache_key(query: StrategyDetailQuery) -> Tuple[str, Sequence[str]]:
+    """전략 상세: 해당 전략의 상세/트리거/백테스트 결과 중 하나라도 바뀌면 무효화"""
+    strategy_id = str(query.strategy_id)
+    return CacheKey.query_variant(CacheKey.strategy_detail(strategy_id), query), (
+        CacheKey.strategy_detail(strategy_id),
+        CacheKey.strategy_triggers(strategy_id),
+        CacheKey.strategy_backtest_results(strategy_id),
+    )
+
+
+def dashboard_cache_key(query: DashboardQuery) -> Tuple[str, Sequence[str]]:
+    """대시보드: 요약/성과 태그 모두에 속함"""
+    return CacheKey.query_variant(CacheKey.dashboard_summary(), query), (
+        CacheKey.dashboard_summary(),
+        CacheKey.dashboard_performance(),
+    )
+
+
+class CachingQueryHandler(BaseQueryHandler[Q, R]):
+    """내부 핸들러를 감싸 결과를 캐싱하는 Query Handler"""
+
+    def __init__(self, inner: BaseQueryHandler[Q, R], cache: QueryResultCache,
+                 key_factory: CacheKeyFactory, ttl: Optional[float] = None):
+        """
+        Args:
+            inner: 실제 조회를 수행하는 핸들러
+            cache: 쿼리 결과 캐시
+            key_factory: 쿼리 → (캐시 키, 태그 목록)
+            ttl: 항목 유효 시간(초) - 현재 시각에 의존하는 결과(대시보드 기간 등)에 사용
+        """
+        self._inner = inner
+        self._cache = cache
+        self._key_factory = key_factory
+        self._ttl = ttl
+
+    @property
+    def inner(self) -> BaseQueryHandler[Q, R]:
+        return self._inner
+
+    def handle(self, query: Q) -> R:
+        """캐시 적중 시 저장된 결과, 미스 시 내부 핸들러 결과를 저장 후 반환"""
+        # 잘못된 쿼리는 캐시를 거치지 않고 즉시 실패
+        self._inner.validate_query(query)
+        key, tags = self._key_factory(query)
+        return self._cache.get_or_load(key, lambda: self._inner.handle(query), tags=tags, ttl=self._ttl)
+
+    def validate_query(self, query: Q) -> None:
+        self._inner.validate_query(query)
@@ -15,10 +15,11 @@ from upbit_auto_trading.application.queries.dto.dashboard_query_dto import (
 class DashboardQueryHandler(BaseQueryHandler[DashboardQuery, DashboardResponse]):
     """대시보드 조회 Query Handler"""
 
-    def __init__(self, strategy_repository, trigger_repository, backtest_repository):
+    def __init__(self, strategy_repository, trigger_repository, backtest_repository, read_model=None):
         self._strategy_repository = strategy_repository
         self._trigger_repository = trigger_repository
         self._backtest_repository = backtest_repository
+        self._read_model = read_model
         self._logger = logging.getLogger(__name__)
 
     def handle(self, query: DashboardQuery) -> DashboardResponse:
@@ -26,6 +27,10 @@ class DashboardQueryHandler(BaseQueryHandler[DashboardQuery, DashboardResponse])
         end_date = datetime.now()
         start_date = end_date - timedelta(days=query.date_range_days)
 
+        # Read Model 재구축 전(또는 실패)에는 기존 조회 경로 사용
+        if self._read_model is not None and self._read_model.is_ready:
+            return self._handle_from_read_model(query, start_date, end_date)
+
         # 1. 요약 통계 생성
         summary_stats = self._generate_summary_stats(start_date, end_date)
 
@@ -58,6 +63,55 @@ class DashboardQueryHandler(BaseQueryHandler[DashboardQuery, DashboardResponse])
             generated_at=datetime.now()
         )
 
+    def _handle_from_read_model(self, query: DashboardQuery,
+                                start_date: datetime, end_date: datetime) -> DashboardResponse:
+        """Read Model 프로젝션으로 조회 (요약/평균/트리거 통계/최근 백테스트를 SELECT 한 번으로)"""
+        prev_start = start_date - timedelta(days=(end_date - start_date).days)
+        snapshot = self._read_model.query_dashboard(start_date, end_date, prev_start, recent_limit=5)
+
+        total_strategies = snapshot["total_strategies"]
+        active_strategies = snapshot["active_strategies"]
+        summary_stats = {
+            "total_strategies": total_strategies,
+            "active_strategies": active_strategies,
+            "inactive_strategies": total_strategies - active_strategies,
+            "total_triggers": snapshot["total_triggers"],
+            "period_backtests": snapshot["period_backtests"],
+            "strategy_utilization_rate": (active_strategies / total_strategies * 100) if total_strategies > 0 else 0
+        }
+
+        performance_metrics = []
+        if query.include_performance_charts:
+            for metric_name, key in (("평균 수익률", "avg_return"), ("평균 샤프 비율", "avg_sharpe")):
+                current = snapshot[f"current_{key}"]
+                previous = snapshot[f"previous_{key}"]
+                performance_metrics.append(PerformanceMetric(
+                    metric_name=metric_name,
+                    current_value=current,
+                    previous_value=previous,
+                    change_percentage=self._calculate_change_percentage(current, previous),
+                    trend=self._determine_trend(current, previous)
+                ))
+
+        trigger_statistics = []
+        if query.include_trigger_stats:
+            trigger_statistics = [TriggerStatistic(**stat) for stat in snapshot["trigger_statistics"]]
+
+        recent_backtest_results = [
+            dict(result, completed_at=datetime.fromisoformat(result["completed_at"]))
+            for result in snapshot["recent_backtests"]
+        ]
+
+        return DashboardResponse(
+            summary_stats=summary_stats,
+            performance_metrics=performance_metrics,
+            trigger_statistics=trigger_statistics,
+            active_strategies_count=active_strategies,
+            recent_backtest_results=recent_backtest_results,
+            system_health=self._check_system_health(),
+            generated_at=datetime.now()
+        )
+
     def _generate_summary_stats(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
         """요약 통계 생성"""
         total_strategies = self._strategy_repository.count_all_strategies()
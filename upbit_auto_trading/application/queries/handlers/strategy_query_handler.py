@@ -4,6 +4,7 @@
 """
 
 from typing import List, Optional, Dict, Any
+from datetime import datetime
 import logging
 
 from upbit_auto_trading.application.queries.handlers.base_query_handler import BaseQueryHandler
@@ -12,18 +13,29 @@ from upbit_auto_trading.application.queries.dto.strategy_query_dto import (
     StrategyDetailQuery, StrategyDetailResponse
 )
 
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Read Model 의 ISO 문자열 시각을 datetime 으로 변환"""
+    return datetime.fromisoformat(value) if value else None
+
+
 class StrategyListQueryHandler(BaseQueryHandler[StrategyListQuery, StrategyListResponse]):
     """전략 목록 조회 Query Handler"""
 
-    def __init__(self, strategy_repository, backtest_repository):
+    def __init__(self, strategy_repository, backtest_repository, read_model=None):
         self._strategy_repository = strategy_repository
         self._backtest_repository = backtest_repository
+        self._read_model = read_model
         self._logger = logging.getLogger(__name__)
 
     def handle(self, query: StrategyListQuery) -> StrategyListResponse:
         """전략 목록 조회 처리"""
         self.validate_query(query)
 
+        # Read Model 재구축 전(또는 실패)에는 기존 조회 경로 사용
+        if self._read_model is not None and self._read_model.is_ready:
+            return self._handle_from_read_model(query)
+
         # 1. 전략 목록 조회 (필터링 및 정렬 포함)
         strategies = self._strategy_repository.find_with_filters(
             status=query.status_filter,
@@ -79,6 +91,46 @@ class StrategyListQueryHandler(BaseQueryHandler[StrategyListQuery, StrategyListR
             has_previous=query.page > 1
         )
 
+    def _handle_from_read_model(self, query: StrategyListQuery) -> StrategyListResponse:
+        """Read Model 프로젝션으로 조회 (페이지 + 전체 개수를 SELECT 한 번으로)"""
+        rows, total_count = self._read_model.query_strategy_list(
+            status=query.status_filter,
+            tags=query.tag_filter,
+            name_pattern=query.name_search,
+            created_after=query.created_after,
+            created_before=query.created_before,
+            include_deleted=query.include_deleted,
+            sort_field=query.sort_field.value,
+            sort_direction=query.sort_direction.value,
+            limit=query.page_size,
+            offset=(query.page - 1) * query.page_size
+        )
+
+        items = [
+            StrategyListItem(
+                strategy_id=row["strategy_id"],
+                name=row["name"],
+                status=row["status"],
+                tags=row["tags"],
+                entry_triggers_count=row["entry_triggers_count"],
+                exit_triggers_count=row["exit_triggers_count"],
+                last_backtest_date=_parse_datetime(row["last_backtest_date"]),
+                last_backtest_performance=row["last_backtest_performance"],
+                created_at=_parse_datetime(row["created_at"]),
+                updated_at=_parse_datetime(row["updated_at"])
+            )
+            for row in rows
+        ]
+
+        return StrategyListResponse(
+            items=items,
+            total_count=total_count,
+            page=query.page,
+            page_size=query.page_size,
+            has_next=(query.page * query.page_size) < total_count,
+            has_previous=query.page > 1
+        )
+
     def validate_query(self, query: StrategyListQuery) -> None:
         """쿼리 유효성 검증"""
         if query.page < 1:
@@ -86,6 +138,7 @@ class StrategyListQueryHandler(BaseQueryHandler[StrategyListQuery, StrategyListR
         if query.page_size < 1 or query.page_size > 100:
             raise ValueError("페이지 크기는 1-100 사이여야 합니다")
 
+
 class StrategyDetailQueryHandler(BaseQueryHandler[StrategyDetailQuery, StrategyDetailResponse]):
     """전략 상세 조회 Query Handler"""
 
@@ -13,12 +13,24 @@ from upbit_auto_trading.application.queries.dto.strategy_query_dto import (
     StrategyListQuery, StrategyDetailQuery
 )
 from upbit_auto_trading.application.queries.dto.dashboard_query_dto import DashboardQuery
+from upbit_auto_trading.application.queries.handlers.caching_query_handler import (
+    CachingQueryHandler, dashboard_cache_key, strategy_detail_cache_key, strategy_list_cache_key
+)
+
+# 대시보드는 현재 시각 기준 기간을 집계하므로 이벤트 무효화와 별개로 짧은 TTL 적용
+DASHBOARD_CACHE_TTL_SECONDS = 60.0
 
 class QueryServiceContainer:
     """Query Service들의 의존성 주입 컨테이너"""
 
-    def __init__(self, repository_container):
+    def __init__(self, repository_container, query_cache=None):
+        """
+        Args:
+            repository_container: Repository 컨테이너
+            query_cache: QueryResultCache - 지정 시 목록/상세/대시보드 핸들러를 읽기 통과 캐싱
+        """
         self._repo_container = repository_container
+        self._query_cache = query_cache
         self._dispatcher = None
         self._query_service = None
 
@@ -41,27 +53,46 @@ class QueryServiceContainer:
         # Strategy Query Handlers 등록
         strategy_list_handler = StrategyListQueryHandler(
             self._repo_container.get_strategy_repository(),
-            self._repo_container.get_backtest_repository()
+            self._repo_container.get_backtest_repository(),
+            read_model=self._get_read_model()
+        )
+        dispatcher.register_handler(
+            StrategyListQuery, self._with_cache(strategy_list_handler, strategy_list_cache_key)
         )
-        dispatcher.register_handler(StrategyListQuery, strategy_list_handler)
 
         strategy_detail_handler = StrategyDetailQueryHandler(
             self._repo_container.get_strategy_repository(),
             self._repo_container.get_trigger_repository(),
             self._repo_container.get_backtest_repository()
         )
-        dispatcher.register_handler(StrategyDetailQuery, strategy_detail_handler)
+        dispatcher.register_handler(
+            StrategyDetailQuery, self._with_cache(strategy_detail_handler, strategy_detail_cache_key)
+        )
 
         # Dashboard Query Handler 등록
         dashboard_handler = DashboardQueryHandler(
             self._repo_container.get_strategy_repository(),
             self._repo_container.get_trigger_repository(),
-            self._repo_container.get_backtest_repository()
+            self._repo_container.get_backtest_repository(),
+            read_model=self._get_read_model()
+        )
+        dispatcher.register_handler(
+            DashboardQuery, self._with_cache(dashboard_handler, dashboard_cache_key, DASHBOARD_CACHE_TTL_SECONDS)
         )
-        dispatcher.register_handler(DashboardQuery, dashboard_handler)
 
         return dispatcher
 
+    def _with_cache(self, handler, key_factory, ttl=None):
+        """쿼리 캐시가 있으면 핸들러를 CachingQueryHandler 로 감쌈"""
+        if self._query_cache is None:
+            return handler
+        return CachingQueryHandler(handler, self._query_cache, key_factory, ttl=ttl)
+
+    def _get_read_model(self):
+        """전략 Read Model (목록/대시보드 프로젝션) - 컨테이너가 제공하지 않으면 None"""
+        get_read_model = getattr(self._repo_container, 'get_strategy_read_model', None)
+        return get_read_model() if get_read_model else None
+
     def get_registered_handlers_info(self) -> dict:
         """등록된 핸들러 정보 반환"""
         if self._dispatcher is None:
@@ -31,6 +31,7 @@ from .management_rule import (
     create_trailing_stop_rule,
     create_fixed_stop_take_rule
 )
+from .management_rule_batch import PositionArrays, ManagementBatchResult
 
 __all__ = [
     "Strategy",
@@ -54,6 +55,8 @@ __all__ = [
     "ManagementExecutionResult",
     "InvalidManagementRuleError",
     "IncompatiblePositionStateError",
+    "PositionArrays",
+    "ManagementBatchResult",
     
     # ManagementRule 팩토리 함수들
     "create_pyramid_buying_rule",
@@ -22,7 +22,7 @@ Management Types:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from enum import Enum
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -31,6 +31,9 @@ from decimal import Decimal
 from ..value_objects.signal_type import SignalType
 from ..exceptions.domain_exceptions import DomainException
 
+if TYPE_CHECKING:
+    from .management_rule_batch import PositionArrays, ManagementBatchResult
+
 class InvalidManagementRuleError(DomainException):
     """잘못된 관리 규칙 설정 예외"""
     pass
@@ -260,7 +263,48 @@ class ManagementRule:
                 "position_symbol": position_state.symbol
             })
             return ManagementExecutionResult.failure(error_msg)
-    
+
+    def execute_batch(self, positions: "PositionArrays",
+                      now: Optional[datetime] = None) -> "ManagementBatchResult":
+        """
+        관리 규칙 배치 실행 (NumPy 단일 패스)
+
+        포지션 순서대로 execute()를 호출한 것과 같은 신호를 반환하며,
+        도메인 이벤트는 신호가 발생한 포지션에 대해서만 기록합니다.
+        """
+        from .management_rule_batch import ManagementBatchResult, evaluate_management_batch
+
+        if not self.is_active:
+            return ManagementBatchResult.hold_all(len(positions), "규칙이 비활성화되어 있습니다")
+
+        try:
+            result = evaluate_management_batch(
+                self.management_type, self.parameters, self.execution_count, positions, now
+            )
+        except Exception as e:
+            error_msg = f"관리 규칙 배치 실행 중 오류: {str(e)}"
+            self._record_domain_event("management_rule_error", {
+                "rule_id": self.rule_id,
+                "error": error_msg,
+                "position_count": len(positions)
+            })
+            return ManagementBatchResult.hold_all(len(positions), f"실행 실패: {error_msg}")
+
+        # 실행 기록 업데이트 (신호 발생 포지션만)
+        signal_indices = result.signal_indices().tolist()
+        if signal_indices:
+            self.last_executed_at = now or datetime.now()
+            for index in signal_indices:
+                self.execution_count += 1
+                self._record_domain_event("management_rule_executed", {
+                    "rule_id": self.rule_id,
+                    "signal": result.get_signal(index).value,
+                    "position_symbol": positions.symbols[index],
+                    "execution_count": self.execution_count
+                })
+
+        return result
+
     def _execute_pyramid_buying(self, position: PositionState) -> ManagementExecutionResult:
         """물타기 실행 로직"""
         trigger_drop_rate = self.parameters["trigger_drop_rate"]
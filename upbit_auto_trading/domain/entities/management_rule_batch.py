@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+관리 규칙 배치 평가 (ManagementRule Batch Evaluation)
+===========================================================
+
+다수의 활성 포지션을 하나의 관리 규칙으로 한 번에 평가하는 NumPy 기반 경로입니다.
+`ManagementRule.execute()`는 포지션 하나마다 Decimal 연산과 도메인 이벤트 기록을 수행하므로,
+수십 개의 실거래 포지션이나 수천 개의 백테스트 포지션을 매 봉마다 평가하기에는 느립니다.
+
+Design Principles:
+- Array Layout: 포지션 속성을 float64 배열로 보관하고 가격만 봉마다 갱신
+- Single Pass: 관리 타입별 조건을 배열 연산 한 번으로 판정
+- Sequential Semantics: 실행 횟수에 의존하는 물타기/불타기는 후보 행만 순차 확정하여
+  `execute()`를 포지션 순서대로 호출한 것과 같은 결과를 보장
+- Decimal at the Edge: 주문 수량/가격 확정 시점에만 `to_position_state()`로 Decimal 복원
+- Sparse Reasons: 사유 문자열과 부가 데이터는 신호가 발생한 행에만 생성
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..value_objects.signal_type import SignalType
+from .management_rule import ManagementExecutionResult, ManagementType, PositionState
+
+# 신호 코드 테이블 (int8 배열 ↔ SignalType)
+SIGNAL_CODES: Tuple[SignalType, ...] = (
+    SignalType.HOLD,
+    SignalType.ADD_BUY,
+    SignalType.ADD_SELL,
+    SignalType.CLOSE_POSITION,
+    SignalType.UPDATE_STOP,
+)
+HOLD_CODE = 0
+ADD_BUY_CODE = 1
+ADD_SELL_CODE = 2
+CLOSE_POSITION_CODE = 3
+
+
+@dataclass
+class PositionArrays:
+    """
+    포지션 배열 묶음
+
+    포지션 집합이 바뀔 때(진입/청산)만 새로 만들고, 봉마다 `update_prices()`로 현재가만 갱신합니다.
+    최고가는 `update_prices()` 호출 시 누적 갱신되며 NaN은 미기록을 의미합니다.
+    """
+    symbols: List[str]
+    avg_prices: np.ndarray          # 평균 단가
+    quantities: np.ndarray          # 보유 수량
+    entry_timestamps: np.ndarray    # 진입 시각 (epoch 초)
+    current_prices: np.ndarray      # 현재 가격
+    highest_prices: np.ndarray      # 최고가 (NaN = 미기록)
+    _symbol_index: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        """배열 길이 검증 및 심볼 인덱스 구성"""
+        size = len(self.symbols)
+        for name in ("avg_prices", "quantities", "entry_timestamps", "current_prices", "highest_prices"):
+            array = np.ascontiguousarray(getattr(self, name), dtype=np.float64)
+            if array.shape != (size,):
+                raise ValueError(f"{name} 길이({array.shape})가 포지션 수({size})와 다릅니다")
+            setattr(self, name, array)
+
+        if size and (np.any(self.avg_prices <= 0) or np.any(self.quantities <= 0)):
+            raise ValueError("평균 단가와 보유 수량은 0보다 커야 합니다")
+
+        self._symbol_index = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+    @classmethod
+    def from_positions(cls, positions: Sequence[PositionState]) -> "PositionArrays":
+        """PositionState 목록으로부터 배열 묶음 생성"""
+        return cls(
+            symbols=[p.symbol for p in positions],
+            avg_prices=np.array([float(p.avg_price) for p in positions], dtype=np.float64),
+            quantities=np.array([float(p.quantity) for p in positions], dtype=np.float64),
+            entry_timestamps=np.array([p.entry_time.timestamp() for p in positions], dtype=np.float64),
+            current_prices=np.array([float(p.current_price) for p in positions], dtype=np.float64),
+            highest_prices=np.array(
+                [float(p.highest_price) if p.highest_price is not None else np.nan for p in positions],
+                dtype=np.float64
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def update_prices(self, prices: Union[np.ndarray, Sequence[float], Mapping[str, float]]) -> None:
+        """
+        현재가 갱신 (배열 전체 또는 심볼별 매핑)
+
+        매핑에 없는 심볼은 이전 가격을 유지합니다. 최고가는 갱신된 현재가로 누적됩니다.
+        """
+        if isinstance(prices, Mapping):
+            for symbol, price in prices.items():
+                index = self._symbol_index.get(symbol)
+                if index is not None:
+                    self.current_prices[index] = price
+        else:
+            new_prices = np.asarray(prices, dtype=np.float64)
+            if new_prices.shape != self.current_prices.shape:
+                raise ValueError(f"가격 배열 길이({new_prices.shape})가 포지션 수({len(self)})와 다릅니다")
+            self.current_prices[:] = new_prices
+
+        if np.any(self.current_prices <= 0):
+            raise ValueError("현재 가격은 0보다 커야 합니다")
+
+        np.fmax(self.highest_prices, self.current_prices, out=self.highest_prices)
+
+    def profit_rates(self) -> np.ndarray:
+        """수익률 배열 (% 단위)"""
+        return (self.current_prices - self.avg_prices) / self.avg_prices * 100.0
+
+    def to_position_state(self, index: int) -> PositionState:
+        """주문 확정용 Decimal 포지션 상태 복원"""
+        highest = self.highest_prices[index]
+        return PositionState(
+            symbol=self.symbols[index],
+            avg_price=Decimal(repr(float(self.avg_prices[index]))),
+            quantity=Decimal(repr(float(self.quantities[index]))),
+            current_price=Decimal(repr(float(self.current_prices[index]))),
+            entry_time=datetime.fromtimestamp(float(self.entry_timestamps[index])),
+            highest_price=None if np.isnan(highest) else Decimal(repr(float(highest))),
+        )
+
+
+@dataclass(frozen=True)
+class ManagementBatchResult:
+    """
+    관리 규칙 배치 실행 결과
+
+    신호는 int8 코드 배열(`SIGNAL_CODES` 인덱스)로, 사유와 부가 데이터는 신호가 발생한 행만 보관합니다.
+    """
+    signal_codes: np.ndarray
+    hold_reason: str
+    reasons: Dict[int, str] = field(default_factory=dict)
+    additional_data: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def hold_all(cls, size: int, reason: str) -> "ManagementBatchResult":
+        """전체 대기 결과 생성"""
+        return cls(signal_codes=np.zeros(size, dtype=np.int8), hold_reason=reason)
+
+    def __len__(self) -> int:
+        return len(self.signal_codes)
+
+    @property
+    def executed_mask(self) -> np.ndarray:
+        """신호 발생 여부 배열"""
+        return self.signal_codes != HOLD_CODE
+
+    def signal_indices(self) -> np.ndarray:
+        """신호가 발생한 포지션 인덱스"""
+        return np.flatnonzero(self.signal_codes)
+
+    def get_signal(self, index: int) -> SignalType:
+        """포지션별 신호 타입"""
+        return SIGNAL_CODES[int(self.signal_codes[index])]
+
+    def get_reason(self, index: int) -> str:
+        """포지션별 사유 (대기 행은 공통 사유)"""
+        return self.reasons.get(index, self.hold_reason)
+
+    def to_execution_result(self, index: int) -> ManagementExecutionResult:
+        """단건 실행 결과 형식으로 변환"""
+        signal = self.get_signal(index)
+        if signal == SignalType.HOLD:
+            return ManagementExecutionResult.hold(self.hold_reason)
+        return ManagementExecutionResult.success(
+            signal, self.reasons[index], **self.additional_data.get(index, {})
+        )
+
+
+def evaluate_management_batch(
+    management_type: ManagementType,
+    parameters: Dict[str, Any],
+    execution_count: int,
+    positions: PositionArrays,
+    now: Optional[datetime] = None
+) -> ManagementBatchResult:
+    """
+    관리 타입별 배치 평가 (규칙 상태는 변경하지 않음)
+
+    실행 횟수 누적과 도메인 이벤트 기록은 호출자(`ManagementRule.execute_batch`)가 담당합니다.
+    """
+    evaluators = {
+        ManagementType.PYRAMID_BUYING: _evaluate_pyramid_buying,
+        ManagementType.SCALE_IN_BUYING: _evaluate_scale_in_buying,
+        ManagementType.TRAILING_STOP: _evaluate_trailing_stop,
+        ManagementType.FIXED_STOP_TAKE: _evaluate_fixed_stop_take,
+        ManagementType.TIME_BASED_EXIT: _evaluate_time_based_exit,
+        ManagementType.PARTIAL_TAKE_PROFIT: _evaluate_partial_take_profit,
+    }
+    evaluator = evaluators.get(management_type)
+    if evaluator is None:
+        raise ValueError(f"지원하지 않는 관리 타입: {management_type}")
+
+    if len(positions) == 0:
+        return ManagementBatchResult.hold_all(0, "평가할 포지션이 없습니다")
+
+    return evaluator(parameters, execution_count, positions, now or datetime.now())
+
+
+def _evaluate_pyramid_buying(parameters: Dict[str, Any], execution_count: int,
+                             positions: PositionArrays, now: datetime) -> ManagementBatchResult:
+    """물타기 배치 평가"""
+    trigger_drop_rate = parameters["trigger_drop_rate"]
+    max_additions = parameters["max_additions"]
+    absolute_stop_loss = parameters.get("absolute_stop_loss")
+
+    profit_rates = positions.profit_rates()
+    loss_rates = np.abs(profit_rates)
+
+    # 실행 횟수는 증가만 하므로 시작 시점 기준 미충족 행은 이후에도 미충족
+    candidates = (profit_rates < 0) & (loss_rates >= trigger_drop_rate * (execution_count + 1))
+    if execution_count >= max_additions:
+        candidates[:] = False
+    if absolute_stop_loss is not None:
+        candidates |= loss_rates >= absolute_stop_loss
+
+    codes = np.zeros(len(positions), dtype=np.int8)
+    reasons: Dict[int, str] = {}
+    additional_data: Dict[int, Dict[str, Any]] = {}
+    count = execution_count
+
+    for index in np.flatnonzero(candidates).tolist():
+        loss_rate = float(loss_rates[index])
+        if absolute_stop_loss is not None and loss_rate >= absolute_stop_loss:
+            codes[index] = CLOSE_POSITION_CODE
+            reasons[index] = f"절대 손절선 도달 (손실률: {loss_rate:.2f}%)"
+            count += 1
+            continue
+
+        if count >= max_additions:
+            continue
+
+        required_drop = trigger_drop_rate * (count + 1)
+        if profit_rates[index] < 0 and loss_rate >= required_drop:
+            codes[index] = ADD_BUY_CODE
+            reasons[index] = f"물타기 조건 충족 (손실률: {loss_rate:.2f}%, 기준: {required_drop:.2f}%)"
+            additional_data[index] = {"addition_count": count + 1}
+            count += 1
+
+    return ManagementBatchResult(codes, "물타기 조건 미충족", reasons, additional_data)
+
+
+def _evaluate_scale_in_buying(parameters: Dict[str, Any], execution_count: int,
+                              positions: PositionArrays, now: datetime) -> ManagementBatchResult:
+    """불타기 배치 평가"""
+    trigger_profit_rate = parameters["trigger_profit_rate"]
+    max_additions = parameters["max_additions"]
+    profit_target = parameters.get("profit_target")
+
+    profit_rates = positions.profit_rates()
+
+    candidates = (profit_rates > 0) & (profit_rates >= trigger_profit_rate * (execution_count + 1))
+    if execution_count >= max_additions:
+        candidates[:] = False
+    if profit_target is not None:
+        candidates |= profit_rates >= profit_target
+
+    codes = np.zeros(len(positions), dtype=np.int8)
+    reasons: Dict[int, str] = {}
+    additional_data: Dict[int, Dict[str, Any]] = {}
+    count = execution_count
+
+    for index in np.flatnonzero(candidates).tolist():
+        profit_rate = float(profit_rates[index])
+        if profit_target is not None and profit_rate >= profit_target:
+            codes[index] = CLOSE_POSITION_CODE
+            reasons[index] = f"목표 수익률 달성 (수익률: {profit_rate:.2f}%)"
+            count += 1
+            continue
+
+        if count >= max_additions:
+            continue
+
+        required_profit = trigger_profit_rate * (count + 1)
+        if profit_rate > 0 and profit_rate >= required_profit:
+            codes[index] = ADD_BUY_CODE
+            reasons[index] = f"불타기 조건 충족 (수익률: {profit_rate:.2f}%, 기준: {required_profit:.2f}%)"
+            additional_data[index] = {"addition_count": count + 1}
+            count += 1
+
+    return ManagementBatchResult(codes, "불타기 조건 미충족", reasons, additional_data)
+
+
+def _evaluate_trailing_stop(parameters: Dict[str, Any], execution_count: int,
+                            positions: PositionArrays, now: datetime) -> ManagementBatchResult:
+    """트레일링 스탑 배치 평가"""
+    trail_distance = float(parameters["trail_distance"])
+    activation_profit = parameters["activation_profit"]
+
+    profit_rates = positions.profit_rates()
+    highest_prices = np.fmax(positions.highest_prices, positions.current_prices)
+    stop_prices = highest_prices * (1.0 - trail_distance / 100.0)
+
+    triggered = (profit_rates >= activation_profit) & (positions.current_prices <= stop_prices)
+    codes = np.where(triggered, CLOSE_POSITION_CODE, HOLD_CODE).astype(np.int8)
+
+    reasons: Dict[int, str] = {}
+    additional_data: Dict[int, Dict[str, Any]] = {}
+    for index in np.flatnonzero(triggered).tolist():
+        stop_price = float(stop_prices[index])
+        reasons[index] = (
+            f"트레일링 스탑 발동 (현재가: {positions.current_prices[index]}, 손절가: {stop_price})"
+        )
+        additional_data[index] = {
+            "stop_price": stop_price,
+            "highest_price": float(highest_prices[index])
+        }
+
+    return ManagementBatchResult(codes, "트레일링 스탑 조건 미충족", reasons, additional_data)
+
+
+def _evaluate_fixed_stop_take(parameters: Dict[str, Any], execution_count: int,
+                              positions: PositionArrays, now: datetime) -> ManagementBatchResult:
+    """고정 손절/익절 배치 평가"""
+    stop_loss_rate = parameters["stop_loss_rate"]
+    take_profit_rate = parameters["take_profit_rate"]
+
+    profit_rates = positions.profit_rates()
+    stop_hit = profit_rates <= -stop_loss_rate
+    take_hit = ~stop_hit & (profit_rates >= take_profit_rate)
+    codes = np.where(stop_hit | take_hit, CLOSE_POSITION_CODE, HOLD_CODE).astype(np.int8)
+
+    reasons: Dict[int, str] = {}
+    for index in np.flatnonzero(stop_hit).tolist():
+        reasons[index] = f"손절선 도달 (손실률: {abs(float(profit_rates[index])):.2f}%)"
+    for index in np.flatnonzero(take_hit).tolist():
+        reasons[index] = f"익절선 도달 (수익률: {float(profit_rates[index]):.2f}%)"
+
+    return ManagementBatchResult(codes, "손절/익절 조건 미충족", reasons)
+
+
+def _evaluate_time_based_exit(parameters: Dict[str, Any], execution_count: int,
+                              positions: PositionArrays, now: datetime) -> ManagementBatchResult:
+    """시간 기반 청산 배치 평가"""
+    max_holding_hours = parameters["max_holding_hours"]
+
+    holding_hours = (now.timestamp() - positions.entry_timestamps) / 3600.0
+    expired = holding_hours >= max_holding_hours
+    codes = np.where(expired, CLOSE_POSITION_CODE, HOLD_CODE).astype(np.int8)
+
+    reasons: Dict[int, str] = {}
+    additional_data: Dict[int, Dict[str, Any]] = {}
+    for index in np.flatnonzero(expired).tolist():
+        hours = float(holding_hours[index])
+        reasons[index] = f"최대 보유 시간 초과 (보유: {hours:.1f}시간, 제한: {max_holding_hours}시간)"
+        additional_data[index] = {"holding_hours": hours}
+
+    return ManagementBatchResult(codes, "보유 시간 미달", reasons, additional_data)
+
+
+def _evaluate_partial_take_profit(parameters: Dict[str, Any], execution_count: int,
+                                  positions: PositionArrays, now: datetime) -> ManagementBatchResult:
+    """부분 익절 배치 평가 (가장 낮은 미실행 도달 레벨 우선)"""
+    profit_levels = parameters["profit_levels"]
+    sell_ratios = parameters["sell_ratios"]
+    executed_levels = parameters.get("executed_levels", set())
+
+    profit_rates = positions.profit_rates()
+    codes = np.zeros(len(positions), dtype=np.int8)
+    matched_levels = np.full(len(positions), -1, dtype=np.int64)
+    last_level = len(profit_levels) - 1
+
+    for level_index, level in enumerate(profit_levels):
+        if level_index in executed_levels:
+            continue
+        hit = (matched_levels < 0) & (profit_rates >= level)
+        matched_levels[hit] = level_index
+        codes[hit] = CLOSE_POSITION_CODE if level_index == last_level else ADD_SELL_CODE
+
+    reasons: Dict[int, str] = {}
+    additional_data: Dict[int, Dict[str, Any]] = {}
+    for index in np.flatnonzero(codes).tolist():
+        level_index = int(matched_levels[index])
+        profit_rate = float(profit_rates[index])
+        if level_index == last_level:
+            reasons[index] = f"최종 익절 레벨 도달 (수익률: {profit_rate:.2f}%)"
+            additional_data[index] = {"level": level_index + 1, "total_levels": len(profit_levels)}
+        else:
+            reasons[index] = f"부분 익절 레벨 {level_index + 1} 도달 (수익률: {profit_rate:.2f}%)"
+            additional_data[index] = {"sell_ratio": sell_ratios[level_index], "level": level_index + 1}
+
+    return ManagementBatchResult(codes, "부분 익절 조건 미충족", reasons, additional_data)
@@ -4,13 +4,16 @@ Domain Service for Value Normalization
 서로 다른 comparison_group 간 정규화를 담당하는 도메인 서비스
 호환성 검증에서 WARNING 수준으로 분류된 조합들의 정규화 처리
 Domain Event 발행을 통한 정규화 결과 알림 지원
+배열 입력/출력 일괄 경로 지원 (캔들 히스토리·마켓 전체 교차 그룹 비교용, 스칼라 경로와 결과 동일)
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from enum import Enum
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from upbit_auto_trading.domain.entities.trigger import TradingVariable
 
 # Domain Event 관련 import 추가
@@ -19,6 +22,7 @@ from upbit_auto_trading.domain.events.trigger_events import (
 )
 from upbit_auto_trading.domain.events.domain_event_publisher import get_domain_event_publisher
 
+
 class NormalizationMethod(Enum):
     """정규화 방법"""
     MINMAX = "minmax"          # 최소-최대 정규화 (0-1 스케일)
@@ -26,6 +30,7 @@ class NormalizationMethod(Enum):
     PERCENTAGE = "percentage"   # 백분율 기반 정규화
     ROBUST = "robust"          # 로버스트 정규화 (중앙값, IQR 기반)
 
+
 @dataclass(frozen=True)
 class NormalizationParameters:
     """
@@ -54,6 +59,7 @@ class NormalizationParameters:
     confidence_level: float = 0.95
     last_updated: Optional[str] = None
 
+
 @dataclass(frozen=True)
 class NormalizationResult:
     """
@@ -79,8 +85,65 @@ class NormalizationResult:
     normalization_params1: Optional[NormalizationParameters] = None
     normalization_params2: Optional[NormalizationParameters] = None
 
+
+@dataclass(frozen=True, eq=False)
+class BatchNormalizationResult:
+    """
+    일괄 정규화 결과 Value Object
+
+    값은 float64 배열, 품질 지표(신뢰도/경고)는 배치당 한 번만 계산
+    """
+    original_values1: np.ndarray
+    original_values2: np.ndarray
+    normalized_values1: np.ndarray
+    normalized_values2: np.ndarray
+
+    group1: str
+    group2: str
+    method: NormalizationMethod
+
+    confidence_score: float = 1.0
+    is_reliable: bool = True
+    warning_message: Optional[str] = None
+
+    normalization_params1: Optional[NormalizationParameters] = None
+    normalization_params2: Optional[NormalizationParameters] = None
+
+    def __len__(self) -> int:
+        return len(self.normalized_values1)
+
+    def result_at(self, i: int) -> NormalizationResult:
+        """i 번째 원소의 스칼라 NormalizationResult"""
+        return NormalizationResult(
+            original_value1=float(self.original_values1[i]),
+            original_value2=float(self.original_values2[i]),
+            normalized_value1=float(self.normalized_values1[i]),
+            normalized_value2=float(self.normalized_values2[i]),
+            group1=self.group1,
+            group2=self.group2,
+            method=self.method,
+            confidence_score=self.confidence_score,
+            is_reliable=self.is_reliable,
+            warning_message=self.warning_message,
+            normalization_params1=self.normalization_params1,
+            normalization_params2=self.normalization_params2
+        )
+
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+
+def _as_float_array(values: ArrayLike) -> np.ndarray:
+    """입력을 float64 배열로 변환 (이미 float64 배열이면 복사하지 않음)"""
+    return np.asarray(values, dtype=np.float64)
+
+
 class NormalizationStrategy(ABC):
-    """정규화 전략 인터페이스"""
+    """
+    정규화 전략 인터페이스
+
+    *_array 메서드는 파라미터 검증을 배치당 한 번 수행하고 스칼라 메서드와 같은 연산 순서로 계산합니다.
+    """
 
     @abstractmethod
     def normalize(self, value: float, params: NormalizationParameters) -> float:
@@ -92,6 +155,17 @@ class NormalizationStrategy(ABC):
         """정규화된 값을 원래 스케일로 복원"""
         pass
 
+    @abstractmethod
+    def normalize_array(self, values: np.ndarray, params: NormalizationParameters) -> np.ndarray:
+        """float64 배열 일괄 정규화"""
+        pass
+
+    @abstractmethod
+    def denormalize_array(self, normalized_values: np.ndarray, params: NormalizationParameters) -> np.ndarray:
+        """정규화된 float64 배열을 원래 스케일로 일괄 복원"""
+        pass
+
+
 class MinMaxNormalizationStrategy(NormalizationStrategy):
     """최소-최대 정규화 전략"""
 
@@ -111,6 +185,59 @@ class MinMaxNormalizationStrategy(NormalizationStrategy):
 
         return params.min_value + normalized_value * (params.max_value - params.min_value)
 
+    def normalize_array(self, values: np.ndarray, params: NormalizationParameters) -> np.ndarray:
+        if params.min_value is None or params.max_value is None:
+            raise ValueError("MinMax 정규화에는 min_value, max_value가 필요합니다")
+
+        if params.max_value == params.min_value:
+            return np.full(values.shape, 0.5)
+
+        normalized = (values - params.min_value) / (params.max_value - params.min_value)
+        # max(0.0, min(1.0, x)) 와 동일한 비교 (NaN 처리 포함)
+        normalized = np.where(normalized < 1.0, normalized, 1.0)
+        return np.where(normalized > 0.0, normalized, 0.0)
+
+    def denormalize_array(self, normalized_values: np.ndarray, params: NormalizationParameters) -> np.ndarray:
+        if params.min_value is None or params.max_value is None:
+            raise ValueError("MinMax 역정규화에는 min_value, max_value가 필요합니다")
+
+        return params.min_value + normalized_values * (params.max_value - params.min_value)
+
+
+class PercentageNormalizationStrategy(NormalizationStrategy):
+    """백분율 정규화 전략 (min_value ~ max_value 구간 내 위치를 0-100 으로 표현, 클램핑 없음)"""
+
+    def normalize(self, value: float, params: NormalizationParameters) -> float:
+        if params.min_value is None or params.max_value is None:
+            raise ValueError("Percentage 정규화에는 min_value, max_value가 필요합니다")
+
+        if params.max_value == params.min_value:
+            return 50.0
+
+        return (value - params.min_value) / (params.max_value - params.min_value) * 100.0
+
+    def denormalize(self, normalized_value: float, params: NormalizationParameters) -> float:
+        if params.min_value is None or params.max_value is None:
+            raise ValueError("Percentage 역정규화에는 min_value, max_value가 필요합니다")
+
+        return params.min_value + normalized_value / 100.0 * (params.max_value - params.min_value)
+
+    def normalize_array(self, values: np.ndarray, params: NormalizationParameters) -> np.ndarray:
+        if params.min_value is None or params.max_value is None:
+            raise ValueError("Percentage 정규화에는 min_value, max_value가 필요합니다")
+
+        if params.max_value == params.min_value:
+            return np.full(values.shape, 50.0)
+
+        return (values - params.min_value) / (params.max_value - params.min_value) * 100.0
+
+    def denormalize_array(self, normalized_values: np.ndarray, params: NormalizationParameters) -> np.ndarray:
+        if params.min_value is None or params.max_value is None:
+            raise ValueError("Percentage 역정규화에는 min_value, max_value가 필요합니다")
+
+        return params.min_value + normalized_values / 100.0 * (params.max_value - params.min_value)
+
+
 class ZScoreNormalizationStrategy(NormalizationStrategy):
     """Z-스코어 정규화 전략"""
 
@@ -129,6 +256,22 @@ class ZScoreNormalizationStrategy(NormalizationStrategy):
 
         return normalized_value * params.std + params.mean
 
+    def normalize_array(self, values: np.ndarray, params: NormalizationParameters) -> np.ndarray:
+        if params.mean is None or params.std is None:
+            raise ValueError("Z-Score 정규화에는 mean, std가 필요합니다")
+
+        if params.std == 0:
+            return np.zeros(values.shape)
+
+        return (values - params.mean) / params.std
+
+    def denormalize_array(self, normalized_values: np.ndarray, params: NormalizationParameters) -> np.ndarray:
+        if params.mean is None or params.std is None:
+            raise ValueError("Z-Score 역정규화에는 mean, std가 필요합니다")
+
+        return normalized_values * params.std + params.mean
+
+
 class RobustNormalizationStrategy(NormalizationStrategy):
     """로버스트 정규화 전략"""
 
@@ -147,6 +290,22 @@ class RobustNormalizationStrategy(NormalizationStrategy):
 
         return normalized_value * params.iqr + params.median
 
+    def normalize_array(self, values: np.ndarray, params: NormalizationParameters) -> np.ndarray:
+        if params.median is None or params.iqr is None:
+            raise ValueError("Robust 정규화에는 median, iqr이 필요합니다")
+
+        if params.iqr == 0:
+            return np.zeros(values.shape)
+
+        return (values - params.median) / params.iqr
+
+    def denormalize_array(self, normalized_values: np.ndarray, params: NormalizationParameters) -> np.ndarray:
+        if params.median is None or params.iqr is None:
+            raise ValueError("Robust 역정규화에는 median, iqr이 필요합니다")
+
+        return normalized_values * params.iqr + params.median
+
+
 class NormalizationService:
     """
     Domain Service: 값 정규화
@@ -156,12 +315,23 @@ class NormalizationService:
     - 다양한 정규화 방법 지원 (MinMax, Z-Score, Robust)
     - 정규화 품질 평가 및 신뢰성 검증
     - StrategyCompatibilityService의 WARNING 처리 지원
+    - 배열 일괄 정규화/역정규화 (파라미터·품질 지표는 배치당 한 번 계산)
     """
 
+    # 정규화를 지원하는 그룹 조합
+    SUPPORTED_COMBINATIONS = frozenset({
+        frozenset(["price_comparable", "percentage_comparable"]),
+        frozenset(["volume_comparable", "percentage_comparable"]),
+        frozenset(["zero_centered", "percentage_comparable"])
+    })
+
+    SAME_GROUP_MESSAGE = "같은 그룹이므로 정규화 불필요"
+
     def __init__(self):
         self._strategies: Dict[NormalizationMethod, NormalizationStrategy] = {
             NormalizationMethod.MINMAX: MinMaxNormalizationStrategy(),
             NormalizationMethod.ZSCORE: ZScoreNormalizationStrategy(),
+            NormalizationMethod.PERCENTAGE: PercentageNormalizationStrategy(),
             NormalizationMethod.ROBUST: RobustNormalizationStrategy(),
         }
 
@@ -198,21 +368,11 @@ class NormalizationService:
                 method=method,
                 confidence_score=1.0,
                 is_reliable=True,
-                warning_message="같은 그룹이므로 정규화 불필요"
+                warning_message=self.SAME_GROUP_MESSAGE
             )
 
         # 지원되는 그룹 조합 확인
-        supported_combinations = {
-            frozenset(["price_comparable", "percentage_comparable"]),
-            frozenset(["volume_comparable", "percentage_comparable"]),
-            frozenset(["zero_centered", "percentage_comparable"])
-        }
-
-        if frozenset([group1, group2]) not in supported_combinations:
-            raise ValueError(
-                f"지원하지 않는 그룹 조합: {group1} vs {group2}. "
-                f"지원되는 조합: {supported_combinations}"
-            )
+        self._check_supported_combination(group1, group2)
 
         # 정규화 파라미터 가져오기
         params1 = self._get_normalization_params(group1, method, custom_params)
@@ -227,9 +387,7 @@ class NormalizationService:
             normalized_value2 = strategy.normalize(value2, params2)
 
             # 정규화 품질 평가
-            confidence_score = self._calculate_confidence_score(params1, params2)
-            is_reliable = confidence_score >= 0.7
-            warning_message = self._generate_warning_message(params1, params2, confidence_score)
+            confidence_score, is_reliable, warning_message = self._evaluate_quality(params1, params2)
 
             return NormalizationResult(
                 original_value1=value1,
@@ -302,6 +460,123 @@ class NormalizationService:
 
         return normalized_values
 
+    def normalize_for_comparison_batch(self, values1: ArrayLike, group1: str,
+                                       values2: ArrayLike, group2: str,
+                                       method: NormalizationMethod = NormalizationMethod.MINMAX,
+                                       custom_params: Optional[Dict[str, NormalizationParameters]] = None
+                                       ) -> BatchNormalizationResult:
+        """
+        normalize_for_comparison 의 배열 버전
+
+        values1/values2 는 같은 길이의 배열(또는 스칼라, 브로드캐스트)이며 원소별 결과는 스칼라 경로와 동일합니다.
+        그룹 조합 검증, 파라미터 조회, 신뢰도/경고 계산은 배치당 한 번만 수행합니다.
+        """
+        array1, array2 = np.broadcast_arrays(_as_float_array(values1), _as_float_array(values2))
+
+        if group1 == group2:
+            return BatchNormalizationResult(
+                original_values1=array1,
+                original_values2=array2,
+                normalized_values1=array1,
+                normalized_values2=array2,
+                group1=group1,
+                group2=group2,
+                method=method,
+                confidence_score=1.0,
+                is_reliable=True,
+                warning_message=self.SAME_GROUP_MESSAGE
+            )
+
+        self._check_supported_combination(group1, group2)
+
+        params1 = self._get_normalization_params(group1, method, custom_params)
+        params2 = self._get_normalization_params(group2, method, custom_params)
+        strategy = self._strategies[method]
+
+        try:
+            normalized_values1 = strategy.normalize_array(array1, params1)
+            normalized_values2 = strategy.normalize_array(array2, params2)
+        except Exception as e:
+            # 스칼라 경로와 동일: 원본값 반환 + 경고
+            return BatchNormalizationResult(
+                original_values1=array1,
+                original_values2=array2,
+                normalized_values1=array1,
+                normalized_values2=array2,
+                group1=group1,
+                group2=group2,
+                method=method,
+                confidence_score=0.0,
+                is_reliable=False,
+                warning_message=f"정규화 실패: {str(e)}"
+            )
+
+        confidence_score, is_reliable, warning_message = self._evaluate_quality(params1, params2)
+        return BatchNormalizationResult(
+            original_values1=array1,
+            original_values2=array2,
+            normalized_values1=normalized_values1,
+            normalized_values2=normalized_values2,
+            group1=group1,
+            group2=group2,
+            method=method,
+            confidence_score=confidence_score,
+            is_reliable=is_reliable,
+            warning_message=warning_message,
+            normalization_params1=params1,
+            normalization_params2=params2
+        )
+
+    def normalize_variable_values_batch(self, variables: List[TradingVariable],
+                                        value_series: List[ArrayLike],
+                                        method: NormalizationMethod = NormalizationMethod.MINMAX
+                                        ) -> Dict[str, np.ndarray]:
+        """
+        normalize_variable_values 의 배열 버전 (변수마다 값 시계열 하나)
+
+        첫 번째 변수를 기준으로 나머지 변수 시계열을 정규화하며, 정규화 불가능한 조합은 원본 유지
+        """
+        if len(variables) != len(value_series):
+            raise ValueError("변수 개수와 값 개수가 일치하지 않습니다")
+
+        if not variables:
+            return {}
+
+        base_variable = variables[0]
+        base_values = _as_float_array(value_series[0])
+        normalized_values = {base_variable.variable_id: base_values}
+
+        for variable, values in zip(variables[1:], value_series[1:]):
+            try:
+                result = self.normalize_for_comparison_batch(
+                    base_values, base_variable.comparison_group,
+                    values, variable.comparison_group,
+                    method
+                )
+                normalized_values[variable.variable_id] = result.normalized_values2
+            except ValueError:
+                normalized_values[variable.variable_id] = _as_float_array(values)
+
+        return normalized_values
+
+    def normalize_array(self, values: ArrayLike, group: str,
+                        method: NormalizationMethod = NormalizationMethod.MINMAX,
+                        custom_params: Optional[Dict[str, NormalizationParameters]] = None) -> np.ndarray:
+        """단일 그룹 값 배열 정규화 (파라미터는 한 번 조회)"""
+        params = self._get_normalization_params(group, method, custom_params)
+        return self._strategies[method].normalize_array(_as_float_array(values), params)
+
+    def denormalize_array(self, normalized_values: ArrayLike,
+                          target_group: str,
+                          method: NormalizationMethod,
+                          normalization_params: Optional[NormalizationParameters] = None) -> np.ndarray:
+        """denormalize_value 의 배열 버전"""
+        if normalization_params is None:
+            normalization_params = self._get_normalization_params(target_group, method)
+
+        strategy = self._strategies[method]
+        return strategy.denormalize_array(_as_float_array(normalized_values), normalization_params)
+
     def denormalize_value(self, normalized_value: float,
                          target_group: str,
                          method: NormalizationMethod,
@@ -319,8 +594,26 @@ class NormalizationService:
         if custom_params and group in custom_params:
             return custom_params[group]
 
-        return self._default_params.get(f"{group}_{method.value}",
-                                      self._create_fallback_params(group, method))
+        params = self._default_params.get(f"{group}_{method.value}")
+        if params is None:
+            params = self._create_fallback_params(group, method)
+        return params
+
+    def _check_supported_combination(self, group1: str, group2: str) -> None:
+        """정규화 지원 그룹 조합 확인"""
+        if frozenset([group1, group2]) not in self.SUPPORTED_COMBINATIONS:
+            raise ValueError(
+                f"지원하지 않는 그룹 조합: {group1} vs {group2}. "
+                f"지원되는 조합: {set(self.SUPPORTED_COMBINATIONS)}"
+            )
+
+    def _evaluate_quality(self, params1: NormalizationParameters,
+                          params2: NormalizationParameters) -> Tuple[float, bool, Optional[str]]:
+        """(신뢰도, 신뢰 가능 여부, 경고 메시지)"""
+        confidence_score = self._calculate_confidence_score(params1, params2)
+        is_reliable = confidence_score >= 0.7
+        warning_message = self._generate_warning_message(params1, params2, confidence_score)
+        return confidence_score, is_reliable, warning_message
 
     def _calculate_confidence_score(self, params1: NormalizationParameters,
                                    params2: NormalizationParameters) -> float:
@@ -372,7 +665,7 @@ class NormalizationService:
         # 실제로는 Infrastructure 계층에서 과거 데이터 기반으로 계산해야 함
 
         if group == "price_comparable":
-            if method == NormalizationMethod.MINMAX:
+            if method in (NormalizationMethod.MINMAX, NormalizationMethod.PERCENTAGE):
                 return NormalizationParameters(
                     group=group, method=method,
                     min_value=10000.0, max_value=100000000.0,  # 1만원 ~ 1억원
@@ -384,9 +677,15 @@ class NormalizationService:
                     mean=50000000.0, std=20000000.0,  # 평균 5천만원, 표준편차 2천만원
                     sample_size=1500
                 )
+            elif method == NormalizationMethod.ROBUST:
+                return NormalizationParameters(
+                    group=group, method=method,
+                    median=50000000.0, iqr=27000000.0,  # 중앙값 5천만원, IQR ≈ 1.35 × 표준편차
+                    sample_size=1500
+                )
 
         elif group == "percentage_comparable":
-            if method == NormalizationMethod.MINMAX:
+            if method in (NormalizationMethod.MINMAX, NormalizationMethod.PERCENTAGE):
                 return NormalizationParameters(
                     group=group, method=method,
                     min_value=0.0, max_value=100.0,  # 0% ~ 100%
@@ -398,9 +697,15 @@ class NormalizationService:
                     mean=50.0, std=28.87,  # 평균 50%, 표준편차 28.87% (0-100 균등분포)
                     sample_size=1500
                 )
+            elif method == NormalizationMethod.ROBUST:
+                return NormalizationParameters(
+                    group=group, method=method,
+                    median=50.0, iqr=50.0,  # 0-100 균등분포의 중앙값, IQR
+                    sample_size=1500
+                )
 
         elif group == "zero_centered":
-            if method == NormalizationMethod.MINMAX:
+            if method in (NormalizationMethod.MINMAX, NormalizationMethod.PERCENTAGE):
                 return NormalizationParameters(
                     group=group, method=method,
                     min_value=-1.0, max_value=1.0,  # -1 ~ 1
@@ -412,12 +717,19 @@ class NormalizationService:
                     mean=0.0, std=0.5,  # 평균 0, 표준편차 0.5
                     sample_size=1500
                 )
+            elif method == NormalizationMethod.ROBUST:
+                return NormalizationParameters(
+                    group=group, method=method,
+                    median=0.0, iqr=0.67,  # 중앙값 0, IQR ≈ 1.35 × 표준편차
+                    sample_size=1500
+                )
 
         # 기본값
         return NormalizationParameters(
             group=group, method=method,
             min_value=0.0, max_value=1.0,
             mean=0.0, std=1.0,
+            median=0.0, iqr=1.0,
             sample_size=1500  # 충분한 신뢰도
         )
 
@@ -426,7 +738,8 @@ class NormalizationService:
         params = {}
 
         groups = ["price_comparable", "percentage_comparable", "zero_centered", "volume_comparable"]
-        methods = [NormalizationMethod.MINMAX, NormalizationMethod.ZSCORE, NormalizationMethod.ROBUST]
+        methods = [NormalizationMethod.MINMAX, NormalizationMethod.ZSCORE,
+                   NormalizationMethod.PERCENTAGE, NormalizationMethod.ROBUST]
 
         for group in groups:
             for method in methods:
@@ -15,6 +15,10 @@ from upbit_auto_trading.domain.events.strategy_events import (
     StrategyValidated, StrategyValidationFailed
 )
 from upbit_auto_trading.domain.events.domain_event_publisher import get_domain_event_publisher
+from upbit_auto_trading.domain.trigger_builder.services.variable_compatibility_index import (
+    CompatibilityMatrix, VariableCompatibilityIndex
+)
+from upbit_auto_trading.domain.value_objects.compatibility_rules import CompatibilityLevel, ComparisonGroupRules
 
 # Repository 인터페이스 import (Infrastructure 계층과 분리)
 try:
@@ -65,16 +69,19 @@ class StrategyCompatibilityService:
     3. purpose_category와 chart_category는 보조 참고 정보
     """
 
-    def __init__(self, settings_repository: SettingsRepository):
+    def __init__(self, settings_repository: SettingsRepository,
+                 compatibility_index: Optional[VariableCompatibilityIndex] = None):
         """
         Repository 의존성 주입으로 데이터 접근 추상화
 
         Args:
             settings_repository: 설정 데이터 접근을 위한 Repository 인터페이스
+            compatibility_index: 미리 생성된 호환성 비트셋 인덱스 (None 이면 첫 조회 시 Repository 변수로 생성)
         """
         self._settings_repository = settings_repository
         self._comparison_group_rules = self._load_comparison_group_rules()
         self._event_publisher = get_domain_event_publisher()
+        self._compatibility_index = compatibility_index
 
     def _load_comparison_group_rules(self) -> Any:
         """설정 Repository에서 호환성 규칙 로드"""
@@ -84,6 +91,16 @@ class StrategyCompatibilityService:
             # 기본 규칙 반환 (Repository 구현이 없을 경우)
             return {"default": "compatible"}
 
+    @property
+    def compatibility_index(self) -> VariableCompatibilityIndex:
+        """변수 호환성 비트셋 인덱스 (변수 생성/수정/삭제 시 upsert/remove 로 갱신)"""
+        if self._compatibility_index is None:
+            rules = self._comparison_group_rules
+            if not isinstance(rules, ComparisonGroupRules):
+                rules = ComparisonGroupRules()
+            self._compatibility_index = VariableCompatibilityIndex.build(self.get_trading_variables(), rules)
+        return self._compatibility_index
+
     def get_trading_variables(self) -> List[Any]:
         """설정 Repository에서 매매 변수 조회"""
         try:
@@ -217,18 +234,40 @@ class StrategyCompatibilityService:
         if context is None:
             context = ValidationContext()
 
-        # 간소화된 버전 - 빈 리스트 반환
-        return []
+        # STRICT 는 같은 그룹(직접 비교)만, 그 외에는 정규화 후 비교 가능(WARNING)도 포함
+        return self.compatibility_index.get_compatible_ids(
+            base_variable_id,
+            include_warning=context.strategy != ValidationStrategy.STRICT,
+            active_only=context.require_active_only
+        )
+
+    def build_compatibility_matrix(self, variable_ids: Optional[List[str]] = None) -> CompatibilityMatrix:
+        """행 비트셋 형태의 호환성 매트릭스 (None 이면 인덱스의 전체 변수)"""
+        return self.compatibility_index.build_matrix(variable_ids)
 
     def get_compatibility_matrix(self, variable_ids: List[str]) -> Dict[tuple, CompatibilityResult]:
-        """변수들 간의 호환성 매트릭스 생성"""
-        matrix = {}
-        for i, var1 in enumerate(variable_ids):
-            for j, var2 in enumerate(variable_ids):
-                if i < j:  # 중복 제거
-                    result = self.validate_variable_compatibility([var1, var2])
-                    matrix[(var1, var2)] = result
-        return matrix
+        """
+        변수들 간의 호환성 매트릭스 생성 (i < j 쌍)
+
+        인덱스에 없는 변수가 포함되면 기존 쌍별 검증으로 처리합니다.
+        수준별 결과 객체는 공유되므로 읽기 전용으로 사용해야 합니다.
+        """
+        index = self.compatibility_index
+        if not all(variable_id in index for variable_id in variable_ids):
+            matrix = {}
+            for i, var1 in enumerate(variable_ids):
+                for j, var2 in enumerate(variable_ids):
+                    if i < j:  # 중복 제거
+                        result = self.validate_variable_compatibility([var1, var2])
+                        matrix[(var1, var2)] = result
+            return matrix
+
+        results = {
+            CompatibilityLevel.COMPATIBLE: CompatibilityResult("COMPATIBLE", "직접 비교 가능", confidence_score=1.0),
+            CompatibilityLevel.WARNING: CompatibilityResult("WARNING", "정규화 후 비교 가능", confidence_score=0.5),
+            CompatibilityLevel.INCOMPATIBLE: CompatibilityResult("INCOMPATIBLE", "비교 불가", confidence_score=0.0),
+        }
+        return index.build_matrix(variable_ids).to_pair_dict(results)
 
     def suggest_alternative_variables(self,
                                       incompatible_variable_ids: List[str],
@@ -0,0 +1,327 @@
+"""
+Variable Compatibility Index
+- 매매 변수 호환성 비트셋 인덱스 (순수 도메인 로직, 외부 의존성 없음)
+- 변수마다 밀집 정수 슬롯을 부여하고, 호환(COMPATIBLE)/주의(WARNING) 변수 집합을 파이썬 정수 비트셋으로 보관
+- 호환 변수 조회는 비트 순회, 전체 매트릭스는 그룹 단위 OR 연산으로 생성
+- 변수 생성/수정/삭제 시 영향받는 비트만 갱신 (전체 재구축 불필요)
+
+호환성은 comparison_group 쌍으로만 결정되므로 규칙 조회는 그룹 쌍당 한 번만 수행합니다.
+"""
+from dataclasses import dataclass
+from itertools import compress, repeat
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from upbit_auto_trading.domain.value_objects.compatibility_rules import CompatibilityLevel, ComparisonGroupRules
+
+
+# '0'/'1' 문자 → 0/1 바이트 (compress 선택자로 사용)
+_FLAG_TABLE = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def bit_flags(bits: int, width: Optional[int] = None) -> bytes:
+    """비트셋 → 위치별 0/1 바이트열 (낮은 비트가 앞, width 로 길이 고정)"""
+    text = format(bits, "b")[::-1] if bits else ""
+    if width is not None:
+        text = text[:width].ljust(width, "0")
+    return text.encode("ascii").translate(_FLAG_TABLE)
+
+
+def select_bits(items: Sequence[Any], bits: int) -> List[Any]:
+    """비트가 설정된 위치의 항목 목록 - 큰 정수도 C 수준 순회(compress)로 처리"""
+    return list(compress(items, bit_flags(bits)))
+
+
+def iter_bits(bits: int) -> Iterator[int]:
+    """설정된 비트 위치를 오름차순으로 반환"""
+    return compress(range(bits.bit_length()), bit_flags(bits))
+
+
+def _group_key(group: Any) -> str:
+    """ComparisonGroup enum / 문자열 모두 허용"""
+    return getattr(group, "value", group) or ""
+
+
+@dataclass(frozen=True)
+class CompatibilityMatrix:
+    """
+    선택된 변수들의 호환성 매트릭스 (행마다 위치 기준 비트셋)
+
+    compatible_rows[i] 의 j 번째 비트 = variable_ids[i] 와 variable_ids[j] 가 직접 비교 가능
+    warning_rows[i] 의 j 번째 비트 = 정규화 후 비교 가능 (WARNING)
+    """
+    variable_ids: Tuple[str, ...]
+    compatible_rows: Tuple[int, ...]
+    warning_rows: Tuple[int, ...]
+
+    def level(self, i: int, j: int) -> CompatibilityLevel:
+        """위치 i, j 변수 간 호환성 수준"""
+        if self.compatible_rows[i] >> j & 1:
+            return CompatibilityLevel.COMPATIBLE
+        if self.warning_rows[i] >> j & 1:
+            return CompatibilityLevel.WARNING
+        return CompatibilityLevel.INCOMPATIBLE
+
+    def compatible_pair_count(self, include_warning: bool = False) -> int:
+        """호환 쌍 수 (i < j 기준)"""
+        rows = self.compatible_rows
+        if include_warning:
+            rows = tuple(c | w for c, w in zip(rows, self.warning_rows))
+        return sum(row.bit_count() for row in rows) // 2
+
+    def iter_pairs(self) -> Iterator[Tuple[str, str, CompatibilityLevel]]:
+        """(변수1, 변수2, 수준) - i < j 인 모든 쌍"""
+        for (var1, var2), level in self.to_pair_dict().items():
+            yield var1, var2, level
+
+    def to_pair_dict(self, values: Optional[Dict[CompatibilityLevel, Any]] = None) -> Dict[Tuple[str, str], Any]:
+        """
+        i < j 쌍 → 수준(또는 values[수준]) dict
+
+        행 비트셋을 0/1 바이트열로 펼쳐 zip/map 으로 채우므로 쌍마다 정수 시프트를 하지 않습니다.
+        """
+        values = values or {level: level for level in CompatibilityLevel}
+        # (호환 비트, 주의 비트) → 값
+        by_flags = {(1, 0): values[CompatibilityLevel.COMPATIBLE], (0, 1): values[CompatibilityLevel.WARNING],
+                    (0, 0): values[CompatibilityLevel.INCOMPATIBLE]}
+        lookup = by_flags.__getitem__
+        ids = self.variable_ids
+        pairs: Dict[Tuple[str, str], Any] = {}
+        for i, var1 in enumerate(ids):
+            width = len(ids) - i - 1
+            if width <= 0:
+                break
+            compatible = bit_flags(self.compatible_rows[i] >> (i + 1), width)
+            warning = bit_flags(self.warning_rows[i] >> (i + 1), width)
+            pairs.update(zip(zip(repeat(var1), ids[i + 1:]), map(lookup, zip(compatible, warning))))
+        return pairs
+
+
+class VariableCompatibilityIndex:
+    """
+    매매 변수 호환성 비트셋 인덱스
+
+    삭제된 변수의 슬롯은 재사용하므로 비트셋 폭은 최대 동시 변수 수를 넘지 않습니다.
+    """
+
+    def __init__(self, rules: Optional[Any] = None):
+        """
+        Args:
+            rules: check_compatibility(group1, group2) -> CompatibilityLevel 을 제공하는 규칙
+                   (기본: ComparisonGroupRules)
+        """
+        self._rules = rules if rules is not None else ComparisonGroupRules()
+        self._slots: Dict[str, int] = {}
+        self._variable_ids: List[Optional[str]] = []
+        self._groups: List[Optional[str]] = []
+        self._free_slots: List[int] = []
+        self._compatible_bits: List[int] = []
+        self._warning_bits: List[int] = []
+        self._group_members: Dict[str, int] = {}
+        self._active_mask = 0
+        self._level_cache: Dict[Tuple[str, str], CompatibilityLevel] = {}
+
+    @classmethod
+    def build(cls, variables: Iterable[Any], rules: Optional[Any] = None) -> "VariableCompatibilityIndex":
+        """
+        변수 목록으로 인덱스 생성
+
+        Args:
+            variables: variable_id / comparison_group (/ is_active) 속성 또는 키를 가진 객체나 dict
+        """
+        index = cls(rules)
+        for variable in variables:
+            if isinstance(variable, dict):
+                variable_id, group = variable["variable_id"], variable.get("comparison_group")
+                is_active = bool(variable.get("is_active", True))
+            else:
+                variable_id, group = variable.variable_id, variable.comparison_group
+                is_active = bool(getattr(variable, "is_active", True))
+            index._place(variable_id, _group_key(group), is_active)
+
+        # 일괄 계산: 그룹별 행 마스크를 한 번 만들고 변수마다 자기 비트만 제외
+        group_rows = index._group_rows(index._group_members)
+        for slot, group in enumerate(index._groups):
+            compatible, warning = group_rows[group]
+            index._compatible_bits[slot] = compatible & ~(1 << slot)
+            index._warning_bits[slot] = warning
+        return index
+
+    def _place(self, variable_id: str, group: str, is_active: bool) -> None:
+        """일괄 생성용 슬롯 배치 (비트셋은 build 에서 계산, 중복 ID 는 마지막 정의 사용)"""
+        slot = self._slots.get(variable_id)
+        if slot is not None:
+            self._group_members[self._groups[slot]] &= ~(1 << slot)
+            self._groups[slot] = group
+        else:
+            slot = len(self._variable_ids)
+            self._slots[variable_id] = slot
+            self._variable_ids.append(variable_id)
+            self._groups.append(group)
+            self._compatible_bits.append(0)
+            self._warning_bits.append(0)
+        self._group_members[group] = self._group_members.get(group, 0) | (1 << slot)
+        if is_active:
+            self._active_mask |= 1 << slot
+        else:
+            self._active_mask &= ~(1 << slot)
+
+    def _group_rows(self, members_by_group: Dict[str, int]) -> Dict[str, Tuple[int, int]]:
+        """그룹별 (호환 마스크, 주의 마스크) - members_by_group 의 위치/슬롯 공간 기준"""
+        rows = {}
+        for group in members_by_group:
+            compatible = warning = 0
+            for other_group, members in members_by_group.items():
+                level = self.group_level(group, other_group)
+                if level == CompatibilityLevel.COMPATIBLE:
+                    compatible |= members
+                elif level == CompatibilityLevel.WARNING:
+                    warning |= members
+            rows[group] = (compatible, warning)
+        return rows
+
+    # === 변경 ===
+
+    def upsert(self, variable_id: str, comparison_group: Any, is_active: bool = True) -> None:
+        """변수 추가 또는 수정 - 그룹이 바뀐 경우에만 비트셋 재계산"""
+        group = _group_key(comparison_group)
+        slot = self._slots.get(variable_id)
+        if slot is not None and self._groups[slot] != group:
+            self.remove(variable_id)
+            slot = None
+        if slot is None:
+            slot = self._add(variable_id, group)
+
+        if is_active:
+            self._active_mask |= 1 << slot
+        else:
+            self._active_mask &= ~(1 << slot)
+
+    def remove(self, variable_id: str) -> bool:
+        """변수 삭제 - 이 변수를 참조하던 비트만 해제"""
+        slot = self._slots.pop(variable_id, None)
+        if slot is None:
+            return False
+        bit = 1 << slot
+        for other in iter_bits(self._compatible_bits[slot] | self._warning_bits[slot]):
+            self._compatible_bits[other] &= ~bit
+            self._warning_bits[other] &= ~bit
+
+        group = self._groups[slot]
+        self._group_members[group] &= ~bit
+        if not self._group_members[group]:
+            del self._group_members[group]
+        self._active_mask &= ~bit
+        self._variable_ids[slot] = None
+        self._groups[slot] = None
+        self._compatible_bits[slot] = 0
+        self._warning_bits[slot] = 0
+        self._free_slots.append(slot)
+        return True
+
+    def _add(self, variable_id: str, group: str) -> int:
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._variable_ids[slot] = variable_id
+            self._groups[slot] = group
+        else:
+            slot = len(self._variable_ids)
+            self._variable_ids.append(variable_id)
+            self._groups.append(group)
+            self._compatible_bits.append(0)
+            self._warning_bits.append(0)
+        self._slots[variable_id] = slot
+
+        bit = 1 << slot
+        compatible = warning = 0
+        for other_group, members in self._group_members.items():
+            level = self.group_level(group, other_group)
+            if level == CompatibilityLevel.COMPATIBLE:
+                compatible |= members
+                for other in iter_bits(members):
+                    self._compatible_bits[other] |= bit
+            elif level == CompatibilityLevel.WARNING:
+                warning |= members
+                for other in iter_bits(members):
+                    self._warning_bits[other] |= bit
+        self._compatible_bits[slot] = compatible
+        self._warning_bits[slot] = warning
+        self._group_members[group] = self._group_members.get(group, 0) | bit
+        return slot
+
+    # === 조회 ===
+
+    def group_level(self, group1: str, group2: str) -> CompatibilityLevel:
+        """그룹 쌍 호환성 (규칙 조회 결과 캐시)"""
+        key = (group1, group2)
+        level = self._level_cache.get(key)
+        if level is None:
+            level = self._rules.check_compatibility(group1, group2)
+            self._level_cache[key] = level
+        return level
+
+    def __contains__(self, variable_id: str) -> bool:
+        return variable_id in self._slots
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def compatibility_bits(self, variable_id: str, include_warning: bool = False,
+                           active_only: bool = True) -> int:
+        """호환 변수 비트셋 (슬롯 기준, 자기 자신 제외) - 없는 변수는 0"""
+        slot = self._slots.get(variable_id)
+        if slot is None:
+            return 0
+        bits = self._compatible_bits[slot]
+        if include_warning:
+            bits |= self._warning_bits[slot]
+        return bits & self._active_mask if active_only else bits
+
+    def get_compatible_ids(self, variable_id: str, include_warning: bool = False,
+                           active_only: bool = True) -> List[str]:
+        """기준 변수와 호환되는 변수 ID 목록 (슬롯 순서)"""
+        return select_bits(self._variable_ids, self.compatibility_bits(variable_id, include_warning, active_only))
+
+    def level(self, variable_id1: str, variable_id2: str) -> CompatibilityLevel:
+        """두 변수 간 호환성 수준 (없는 변수는 INCOMPATIBLE)"""
+        slot1, slot2 = self._slots.get(variable_id1), self._slots.get(variable_id2)
+        if slot1 is None or slot2 is None:
+            return CompatibilityLevel.INCOMPATIBLE
+        if slot1 == slot2:
+            return CompatibilityLevel.COMPATIBLE
+        if self._compatible_bits[slot1] >> slot2 & 1:
+            return CompatibilityLevel.COMPATIBLE
+        if self._warning_bits[slot1] >> slot2 & 1:
+            return CompatibilityLevel.WARNING
+        return CompatibilityLevel.INCOMPATIBLE
+
+    def variable_ids(self, active_only: bool = False) -> List[str]:
+        """등록된 변수 ID (슬롯 순서)"""
+        if active_only:
+            return select_bits(self._variable_ids, self._active_mask)
+        return [variable_id for variable_id in self._variable_ids if variable_id is not None]
+
+    def build_matrix(self, variable_ids: Optional[List[str]] = None) -> CompatibilityMatrix:
+        """
+        호환성 매트릭스 생성 - 행 비트셋은 그룹별 위치 마스크 OR 로 계산 (변수 쌍 순회 없음)
+
+        Args:
+            variable_ids: 대상 변수 (None 이면 등록된 전체, 미등록 ID 는 모든 변수와 INCOMPATIBLE)
+        """
+        ids = tuple(self.variable_ids() if variable_ids is None else variable_ids)
+        positions_by_group: Dict[str, int] = {}
+        row_groups: List[Optional[str]] = []
+        for position, variable_id in enumerate(ids):
+            slot = self._slots.get(variable_id)
+            group = self._groups[slot] if slot is not None else None
+            row_groups.append(group)
+            if group is not None:
+                positions_by_group[group] = positions_by_group.get(group, 0) | (1 << position)
+
+        group_rows = self._group_rows(positions_by_group)
+        compatible_rows, warning_rows = [], []
+        for position, group in enumerate(row_groups):
+            compatible, warning = group_rows.get(group, (0, 0))
+            self_bit = 1 << position
+            compatible_rows.append(compatible & ~self_bit)
+            warning_rows.append(warning & ~self_bit)
+        return CompatibilityMatrix(ids, tuple(compatible_rows), tuple(warning_rows))
@@ -22,45 +22,33 @@ async with UpbitClient(access_key='key', secret_key='secret') as client:
 ```
 """
 
-# 기존 imports 유지
-from .repositories.repository_container import RepositoryContainer
-from .database.database_manager import DatabaseManager, DatabaseConnectionProvider
+# 지연 로딩 (PEP 562) - 패키지 import 만으로 Repository/DB 전체 그래프를 끌어오지 않도록
+# 속성에 처음 접근할 때 해당 모듈을 import 합니다. (하위 모듈 직접 import 는 기존과 동일)
+# 외부 API 클라이언트는 upbit_auto_trading.infrastructure.external_apis 에서 직접 import 하세요.
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# 새로운 외부 API 클라이언트 추가
-try:
-    from .external_apis import (
-        UpbitPublicClient,
-        UpbitPrivateClient,
-        UpbitWebSocketQuotationClient,
-        UpbitWebSocketPrivateClient,
-        UpbitAuthenticator,
-        BaseApiClient,
-        RateLimiter,
-        RateLimitConfig,
-        ApiResponse,
-        ApiClientError
-    )
+if TYPE_CHECKING:
+    from .repositories.repository_container import RepositoryContainer
+    from .database.database_manager import DatabaseManager, DatabaseConnectionProvider
 
-    __all__ = [
-        'RepositoryContainer',
-        'DatabaseManager',
-        'DatabaseConnectionProvider',
-        'UpbitPublicClient',
-        'UpbitPrivateClient',
-        'UpbitWebSocketQuotationClient',
-        'UpbitWebSocketPrivateClient',
-        'UpbitAuthenticator',
-        'BaseApiClient',
-        'RateLimiter',
-        'RateLimitConfig',
-        'ApiResponse',
-        'ApiClientError'
-    ]
+_LAZY_EXPORTS = {
+    'RepositoryContainer': '.repositories.repository_container',
+    'DatabaseManager': '.database.database_manager',
+    'DatabaseConnectionProvider': '.database.database_manager',
+}
 
-except ImportError:
-    # 외부 API 클라이언트가 없는 경우 기본만 제공
-    __all__ = [
-        'RepositoryContainer',
-        'DatabaseManager',
-        'DatabaseConnectionProvider'
-    ]
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value  # 이후 접근은 일반 속성 조회
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
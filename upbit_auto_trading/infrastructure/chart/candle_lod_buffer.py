@@ -0,0 +1,381 @@
+"""
+캔들 LOD 버퍼 - 고정 용량 OHLCV 배열 + 다단계 다운샘플 피라미드
+
+차트 재그리기 비용을 보유 캔들 수와 무관하게 유지하기 위한 저장 구조:
+- 원본 캔들은 미리 할당한 NumPy 배열에 절대 인덱스(= 차트 x 좌표)로 저장
+- 용량 초과 시 가장 오래된 캔들부터 축출, 여유 공간이 바닥나면 한 번에 앞으로 압축 (분할 상환 O(1))
+- 레벨 L 은 원본 FANOUT^L 개를 한 봉으로 합친 OHLCV (시가=첫 봉, 고가=max, 저가=min, 종가=마지막 봉, 거래량=합)
+- 마지막 봉 추가/갱신 시 레벨마다 마지막 버킷 하나만 다시 계산 (O(레벨 수 × FANOUT))
+- 화면 조회는 보이는 구간에서 픽셀 폭 이하의 봉 수가 되는 가장 세밀한 레벨을 잘라 반환 (O(픽셀 폭))
+- 용량 변경(resize)으로 최근 구간만 남기거나 배열을 거의 비울 수 있음 (차트 메모리 예산 축출용)
+- UI 스레드 전용 (대량 적재는 작업 스레드에서 별도 버퍼에 load 후 take_over 로 O(1) 교체)
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+TIME, OPEN, HIGH, LOW, CLOSE, VOLUME = range(6)
+FIELD_COUNT = 6
+
+
+@dataclass(frozen=True)
+class LodSlice:
+    """화면 표시용 다운샘플 구간"""
+    level: int
+    scale: int              # 봉 하나가 대표하는 원본 캔들 수
+    x: np.ndarray           # 봉 중심 x 좌표 (원본 캔들 인덱스 단위)
+    time: np.ndarray        # 봉 시작 시각 (epoch ms)
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+
+class _LevelColumns:
+    """절대 인덱스로 주소 지정되는 OHLCV 열 배열 (앞쪽 축출분은 공간 부족 시 압축)"""
+
+    def __init__(self, capacity: int) -> None:
+        self.alloc = capacity + max(capacity // 4, 16)
+        self.data = np.zeros((FIELD_COUNT, self.alloc), dtype=np.float64)
+        self.base = 0   # data[:, 0] 의 절대 인덱스
+        self.start = 0  # 첫 유효 절대 인덱스
+        self.stop = 0   # 마지막 유효 절대 인덱스 + 1
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def reset(self, start: int = 0) -> None:
+        self.base = self.start = self.stop = start
+
+    def push(self) -> int:
+        """끝에 슬롯 하나 확보 후 배열 위치 반환"""
+        if self.stop - self.base >= self.alloc:
+            count = self.stop - self.start
+            offset = self.start - self.base
+            self.data[:, :count] = self.data[:, offset:offset + count]
+            self.base = self.start
+        position = self.stop - self.base
+        self.stop += 1
+        return position
+
+    def view(self, begin: int, end: int) -> np.ndarray:
+        return self.data[:, begin - self.base:end - self.base]
+
+
+class CandleLodBuffer:
+    """
+    고정 용량 캔들 버퍼 + LOD 피라미드
+
+    x 좌표는 load() 시점부터 0, 1, 2 ... 로 증가하는 절대 인덱스입니다.
+    축출·용량 변경(resize)이 일어나도 남은 캔들의 x 좌표는 바뀌지 않으므로 뷰 범위를 다시 맞출 필요가 없습니다.
+    """
+
+    FANOUT = 4
+    MIN_TOP_LEVEL_SIZE = 16
+
+    def __init__(self, capacity: int = 500_000) -> None:
+        self._allocate(capacity)
+        self.version = 0
+
+    def _allocate(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity는 1 이상이어야 합니다")
+        self.capacity = capacity
+        self._levels: List[_LevelColumns] = [_LevelColumns(capacity)]
+        scale = self.FANOUT
+        while capacity // scale >= self.MIN_TOP_LEVEL_SIZE:
+            # 축출로 앞쪽 버킷이 부분만 남을 수 있으므로 +2 여유
+            self._levels.append(_LevelColumns(capacity // scale + 2))
+            scale *= self.FANOUT
+
+    # ==================== 조회 ====================
+
+    def __len__(self) -> int:
+        return len(self._levels[0])
+
+    @property
+    def nbytes(self) -> int:
+        """할당된 배열 전체 바이트 (모든 레벨, 여유 공간 포함)"""
+        return sum(level.data.nbytes for level in self._levels)
+
+    @property
+    def level_count(self) -> int:
+        return len(self._levels)
+
+    @property
+    def first_index(self) -> int:
+        return self._levels[0].start
+
+    @property
+    def last_index(self) -> int:
+        """마지막 캔들 인덱스 (비어 있으면 first_index - 1)"""
+        return self._levels[0].stop - 1
+
+    @property
+    def last_time(self) -> Optional[int]:
+        raw = self._levels[0]
+        if raw.stop == raw.start:
+            return None
+        return int(raw.data[TIME, raw.stop - 1 - raw.base])
+
+    def bar(self, index: int) -> Tuple[int, float, float, float, float, float]:
+        """원본 캔들 한 개 (time_ms, open, high, low, close, volume)"""
+        raw = self._levels[0]
+        if not raw.start <= index < raw.stop:
+            raise IndexError(f"보존 범위 밖 인덱스: {index}")
+        column = raw.data[:, index - raw.base]
+        return (int(column[TIME]), float(column[OPEN]), float(column[HIGH]),
+                float(column[LOW]), float(column[CLOSE]), float(column[VOLUME]))
+
+    def time_at(self, index: int) -> Optional[int]:
+        raw = self._levels[0]
+        if not raw.start <= index < raw.stop:
+            return None
+        return int(raw.data[TIME, index - raw.base])
+
+    def index_of_time(self, time_ms: int) -> Optional[int]:
+        """시각이 정확히 일치하는 캔들 인덱스 (없으면 None)"""
+        raw = self._levels[0]
+        times = raw.view(raw.start, raw.stop)[TIME]
+        position = int(np.searchsorted(times, time_ms))
+        if position < len(times) and times[position] == time_ms:
+            return raw.start + position
+        return None
+
+    def moving_average(self, period: int, begin: int, end: int) -> np.ndarray:
+        """
+        원본 종가 단순 이동평균 [begin, end) 구간 (앞쪽 이력이 period 개 미만인 위치는 NaN)
+
+        구간 앞 period - 1 개만 더 읽어 누적합으로 계산하므로 O(end - begin + period) 입니다.
+        """
+        raw = self._levels[0]
+        begin = max(begin, raw.start)
+        end = min(end, raw.stop)
+        if end <= begin:
+            return np.empty(0, dtype=np.float64)
+        window_begin = max(begin - period + 1, raw.start)
+        closes = raw.view(window_begin, end)[CLOSE]
+        cumulative = np.concatenate(([0.0], np.cumsum(closes)))
+        result = np.full(end - begin, np.nan)
+        # 결과 위치 i (절대 인덱스 begin + i) 의 창: [begin + i - period + 1, begin + i]
+        first_full = max(begin, raw.start + period - 1)
+        if first_full < end:
+            stops = np.arange(first_full, end) - window_begin + 1
+            result[first_full - begin:] = (cumulative[stops] - cumulative[stops - period]) / period
+        return result
+
+    def price_range(self) -> Optional[Tuple[float, float]]:
+        """전체 보존 구간의 (저가, 고가) - 최상위 레벨만 훑으므로 O(상위 레벨 크기)"""
+        top = self._levels[-1]
+        if top.stop == top.start:
+            return None
+        columns = top.view(top.start, top.stop)
+        return float(columns[LOW].min()), float(columns[HIGH].max())
+
+    def lod_view(self, x_min: float, x_max: float, max_bars: int) -> LodSlice:
+        """
+        보이는 x 구간을 max_bars 개 이하의 봉으로 다운샘플하여 반환
+
+        봉 수는 max_bars / FANOUT 초과 ~ max_bars 이하이며, 원본 캔들 수와 무관하게
+        O(max_bars) 비용으로 잘라냅니다.
+        """
+        raw = self._levels[0]
+        begin = max(int(np.floor(x_min)), raw.start)
+        end = min(int(np.ceil(x_max)) + 1, raw.stop)
+        max_bars = max(int(max_bars), 1)
+
+        level_index = 0
+        scale = 1
+        while (end - begin) > max_bars * scale and level_index + 1 < len(self._levels):
+            level_index += 1
+            scale *= self.FANOUT
+
+        if end <= begin:
+            return self._empty_slice(level_index, scale)
+
+        level = self._levels[level_index]
+        bucket_begin = max(begin // scale, level.start)
+        bucket_end = min((end - 1) // scale + 1, level.stop)
+        columns = level.view(bucket_begin, bucket_end)
+        x = np.arange(bucket_begin, bucket_end, dtype=np.float64) * scale + (scale - 1) / 2.0
+        return LodSlice(level_index, scale, x, columns[TIME], columns[OPEN], columns[HIGH],
+                        columns[LOW], columns[CLOSE], columns[VOLUME])
+
+    @staticmethod
+    def _empty_slice(level: int, scale: int) -> LodSlice:
+        empty = np.empty(0, dtype=np.float64)
+        return LodSlice(level, scale, empty, empty, empty, empty, empty, empty, empty)
+
+    # ==================== 적재 ====================
+
+    def load(self, times: np.ndarray, opens: np.ndarray, highs: np.ndarray,
+             lows: np.ndarray, closes: np.ndarray, volumes: np.ndarray, start_index: int = 0) -> None:
+        """
+        히스토리 일괄 적재 (시간 오름차순, 용량 초과분은 앞쪽 제외)
+
+        Args:
+            start_index: 첫 적재 캔들의 x 좌표 (기본 0, resize 는 기존 좌표 유지를 위해 지정)
+        """
+        count = min(len(times), self.capacity)
+        raw = self._levels[0]
+        raw.reset(start_index)
+        columns = (times, opens, highs, lows, closes, volumes)
+        for field, values in enumerate(columns):
+            raw.data[field, :count] = np.asarray(values, dtype=np.float64)[len(times) - count:]
+        raw.stop = start_index + count
+
+        fanout = self.FANOUT
+        child = raw
+        for level in self._levels[1:]:
+            # 버킷 경계는 절대 인덱스의 FANOUT 배수 (시작이 배수가 아니면 첫 버킷은 일부만 채움)
+            level.reset(child.start // fanout)
+            child_count = child.stop - child.start
+            if child_count:
+                source = child.view(child.start, child.stop)
+                first_boundary = (-child.start) % fanout
+                starts = np.arange(first_boundary, child_count, fanout)
+                if first_boundary:
+                    starts = np.concatenate(([0], starts))
+                bucket_count = len(starts)
+                ends = np.append(starts[1:], child_count)
+                level.data[TIME, :bucket_count] = source[TIME, starts]
+                level.data[OPEN, :bucket_count] = source[OPEN, starts]
+                level.data[HIGH, :bucket_count] = np.maximum.reduceat(source[HIGH], starts)
+                level.data[LOW, :bucket_count] = np.minimum.reduceat(source[LOW], starts)
+                level.data[CLOSE, :bucket_count] = source[CLOSE, ends - 1]
+                level.data[VOLUME, :bucket_count] = np.add.reduceat(source[VOLUME], starts)
+                level.stop = level.start + bucket_count
+            child = level
+        self.version += 1
+
+    def take_over(self, other: 'CandleLodBuffer') -> None:
+        """
+        다른 버퍼의 배열을 넘겨받아 내용 교체 (O(1))
+
+        작업 스레드에서 새 버퍼에 load() 까지 끝낸 뒤 UI 스레드에서 호출합니다.
+        이 버퍼를 참조하는 아이템/어댑터는 그대로 두고 내용만 바뀝니다. other 는 이후 사용하지 않습니다.
+        """
+        self.capacity = other.capacity
+        self._levels = other._levels
+        self.version = max(self.version, other.version) + 1
+
+    def resize(self, capacity: int) -> None:
+        """용량 변경 - 최근 캔들 최대 capacity 개만 남기고 배열 재할당 (남은 캔들의 x 좌표는 그대로)"""
+        raw = self._levels[0]
+        first = max(raw.start, raw.stop - capacity)
+        kept = raw.view(first, raw.stop).copy()
+        self._allocate(capacity)
+        self.load(*kept, start_index=first)
+
+    def clear(self) -> None:
+        for level in self._levels:
+            level.reset()
+        self.version += 1
+
+    def upsert(self, time_ms: int, open_price: float, high_price: float, low_price: float,
+               close_price: float, volume: float) -> bool:
+        """
+        완성/진행 중 캔들 반영
+
+        마지막 캔들과 시각이 같거나 보존 구간 안의 기존 캔들이면 덮어쓰고,
+        마지막 캔들보다 늦으면 새 캔들로 추가합니다.
+
+        Returns:
+            bool: 새 캔들이 추가되었으면 True
+        """
+        values = (time_ms, open_price, high_price, low_price, close_price, volume)
+        raw = self._levels[0]
+        last_time = self.last_time
+        if last_time is None or time_ms > last_time:
+            self._append(values)
+            return True
+
+        index = raw.stop - 1 if time_ms == last_time else self.index_of_time(time_ms)
+        if index is not None:
+            raw.data[:, index - raw.base] = values
+            self._refresh_from(index)
+            self.version += 1
+        return False
+
+    def apply_trade(self, bucket_time_ms: int, price: float, volume: float = 0.0) -> bool:
+        """
+        체결/현재가 한 건을 해당 캔들 구간에 반영 (마지막 캔들 갱신 또는 새 캔들 시작)
+
+        Returns:
+            bool: 새 캔들이 추가되었으면 True
+        """
+        raw = self._levels[0]
+        last_time = self.last_time
+        if last_time is None or bucket_time_ms > last_time:
+            self._append((bucket_time_ms, price, price, price, price, volume))
+            return True
+        if bucket_time_ms < last_time:
+            return False  # 지난 구간의 늦은 체결은 저장 캔들 기준 유지
+
+        column = raw.data[:, raw.stop - 1 - raw.base]
+        if price > column[HIGH]:
+            column[HIGH] = price
+        if price < column[LOW]:
+            column[LOW] = price
+        column[CLOSE] = price
+        column[VOLUME] += volume
+        self._refresh_from(raw.stop - 1)
+        self.version += 1
+        return False
+
+    def _append(self, values: Tuple[float, ...]) -> None:
+        raw = self._levels[0]
+        if raw.stop - raw.start >= self.capacity:
+            self._evict_oldest()
+        position = raw.push()
+        raw.data[:, position] = values
+
+        index = raw.stop - 1
+        for level in self._levels[1:]:
+            index //= self.FANOUT
+            if index >= level.stop:
+                if level.stop == level.start:
+                    level.reset(index)
+                level.push()
+        self._refresh_from(raw.stop - 1)
+        self.version += 1
+
+    def _evict_oldest(self) -> None:
+        raw = self._levels[0]
+        raw.start += 1
+        child_start = raw.start
+        for level_index, level in enumerate(self._levels[1:], start=1):
+            child_start //= self.FANOUT
+            if level.start < child_start:
+                level.start = child_start
+            if level.start < level.stop:
+                self._refresh_bucket(level_index, level.start)
+
+    def _refresh_from(self, raw_index: int) -> None:
+        """원본 캔들 하나가 바뀌었을 때 이를 포함하는 상위 버킷들 재계산"""
+        bucket = raw_index
+        for level_index in range(1, len(self._levels)):
+            bucket //= self.FANOUT
+            self._refresh_bucket(level_index, bucket)
+
+    def _refresh_bucket(self, level_index: int, bucket: int) -> None:
+        level = self._levels[level_index]
+        child = self._levels[level_index - 1]
+        begin = max(bucket * self.FANOUT, child.start)
+        end = min(bucket * self.FANOUT + self.FANOUT, child.stop)
+        if end <= begin or not level.start <= bucket < level.stop:
+            return
+        source = child.view(begin, end)
+        target = level.data[:, bucket - level.base]
+        target[TIME] = source[TIME, 0]
+        target[OPEN] = source[OPEN, 0]
+        target[HIGH] = source[HIGH].max()
+        target[LOW] = source[LOW].min()
+        target[CLOSE] = source[CLOSE, -1]
+        target[VOLUME] = source[VOLUME].sum()
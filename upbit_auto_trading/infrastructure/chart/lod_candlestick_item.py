@@ -0,0 +1,267 @@
+"""
+LOD 캔들스틱/거래량 그래픽 아이템 - Infrastructure Layer
+
+CandleLodBuffer 를 직접 읽어 그리는 PyQtGraph 아이템:
+- paint 시점의 뷰 범위와 픽셀 폭으로 lod_view 를 잘라 약 1픽셀당 1봉만 그림
+- 꼬리는 NumPy 배열에서 arrayToQPath 로 한 번에 경로 생성, 몸통은 drawRects 한 번으로 그림
+- (버퍼 버전, 레벨, 버킷 구간)이 같으면 이전 경로 재사용 → 줌/팬이 없으면 재계산 없음
+- 이동평균 오버레이는 보이는 원본 구간만 누적합으로 계산해 같은 LOD 봉 위치에서 표본 추출
+- 전체 DataFrame 을 다시 넘기지 않으므로 재그리기 비용은 보유 캔들 수와 무관
+"""
+
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+try:
+    import pyqtgraph as pg
+    from pyqtgraph.Qt import QtCore, QtGui
+    PYQTGRAPH_AVAILABLE = True
+    _GraphicsObjectBase = pg.GraphicsObject
+    _AxisItemBase = pg.AxisItem
+except ImportError:
+    PYQTGRAPH_AVAILABLE = False
+    pg = None
+    _GraphicsObjectBase = object
+    _AxisItemBase = object
+
+from upbit_auto_trading.infrastructure.chart.candle_lod_buffer import CandleLodBuffer, LodSlice
+
+# 업비트 스타일 색상 (한국 거래소: 상승=빨강, 하락=파랑)
+BULL_COLOR = '#d60000'
+BEAR_COLOR = '#005fcc'
+
+BODY_WIDTH_RATIO = 0.7
+
+
+def _rect_list(x: np.ndarray, half_width: float, bottom: np.ndarray, top: np.ndarray) -> list:
+    """사각형 목록 생성 - 하위 경로가 많은 QPainterPath 채우기는 래스터 엔진에서 매우 느려 drawRects 사용"""
+    left = (x - half_width).tolist()
+    heights = (top - bottom).tolist()
+    width = half_width * 2
+    return [QtCore.QRectF(x0, y0, width, h) for x0, y0, h in zip(left, bottom.tolist(), heights)]
+
+
+def _segment_path(x: np.ndarray, y0: np.ndarray, y1: np.ndarray) -> 'QtGui.QPainterPath':
+    """수직 선분 묶음을 하나의 QPainterPath 로 생성"""
+    if len(x) == 0:
+        return QtGui.QPainterPath()
+    xs = np.repeat(x, 2)
+    ys = np.column_stack((y0, y1)).ravel()
+    return pg.arrayToQPath(xs, ys, connect='pairs', finiteCheck=False)
+
+
+class _LodItemBase(_GraphicsObjectBase):
+    """LOD 버퍼 기반 아이템 공통부 (뷰 범위 → LodSlice → 경로 캐시)"""
+
+    def __init__(self, buffer: CandleLodBuffer) -> None:
+        super().__init__()
+        self._buffer = buffer
+        self._cache_key: Optional[Tuple[Any, ...]] = None
+        self._paths: Tuple[Any, ...] = ()
+        self._last_slice: Optional[LodSlice] = None
+        self._max_bars = 1024  # 마지막 paint 의 픽셀 폭 (자동 범위도 같은 레벨 기준)
+
+    @property
+    def last_slice(self) -> Optional[LodSlice]:
+        """마지막으로 그린 다운샘플 구간 (성능 측정/디버깅용)"""
+        return self._last_slice
+
+    def set_buffer(self, buffer: CandleLodBuffer) -> None:
+        self._buffer = buffer
+        self.refresh()
+
+    def refresh(self) -> None:
+        """버퍼 변경 후 호출 - 경계 갱신 및 다시 그리기 예약"""
+        self.prepareGeometryChange()
+        self.update()
+
+    def _visible_slice(self) -> Optional[LodSlice]:
+        view_box = self.getViewBox()
+        if view_box is None or len(self._buffer) == 0:
+            return None
+        (x_min, x_max), _ = view_box.viewRange()
+        self._max_bars = max(int(view_box.width()), 1)
+        return self._buffer.lod_view(x_min, x_max, self._max_bars)
+
+    def _build_paths(self, lod: LodSlice) -> Tuple[Any, ...]:
+        raise NotImplementedError
+
+    def _y_bounds(self, lod: LodSlice) -> Tuple[float, float]:
+        raise NotImplementedError
+
+    def paint(self, painter, option, widget=None) -> None:
+        lod = self._visible_slice()
+        if lod is None or len(lod) == 0:
+            return
+        key = (id(self._buffer), self._buffer.version, lod.level, lod.x[0], lod.x[-1])
+        if key != self._cache_key:
+            self._paths = self._build_paths(lod)
+            self._cache_key = key
+        self._last_slice = lod
+        self._draw(painter, lod)
+
+    def _draw(self, painter, lod: LodSlice) -> None:
+        raise NotImplementedError
+
+    def boundingRect(self) -> 'QtCore.QRectF':
+        buffer = self._buffer
+        if len(buffer) == 0:
+            return QtCore.QRectF()
+        y_min, y_max = self._full_y_bounds()
+        x_min = buffer.first_index - 0.5
+        return QtCore.QRectF(x_min, y_min, buffer.last_index + 0.5 - x_min, max(y_max - y_min, 1e-9))
+
+    def _full_y_bounds(self) -> Tuple[float, float]:
+        raise NotImplementedError
+
+    def dataBounds(self, ax: int, frac: float = 1.0, orthoRange=None):
+        """ViewBox 자동 범위용 경계 - y 는 보이는 x 구간의 LOD 봉만 훑어 O(픽셀 폭)"""
+        buffer = self._buffer
+        if len(buffer) == 0:
+            return None
+        if ax == 0:
+            return buffer.first_index - 0.5, buffer.last_index + 0.5
+        if orthoRange is None:
+            return self._full_y_bounds()
+        lod = buffer.lod_view(orthoRange[0], orthoRange[1], self._max_bars)
+        if len(lod) == 0:
+            return None
+        return self._y_bounds(lod)
+
+
+class LodCandlestickItem(_LodItemBase):
+    """다운샘플 캔들스틱 아이템 (상승/하락 꼬리·몸통 4개 경로)"""
+
+    def __init__(self, buffer: CandleLodBuffer, bull_color: str = BULL_COLOR, bear_color: str = BEAR_COLOR) -> None:
+        super().__init__(buffer)
+        self._bull_pen = pg.mkPen(bull_color, width=1, cosmetic=True)
+        self._bear_pen = pg.mkPen(bear_color, width=1, cosmetic=True)
+        self._bull_brush = pg.mkBrush(bull_color)
+        self._bear_brush = pg.mkBrush(bear_color)
+
+    def _build_paths(self, lod: LodSlice) -> Tuple[Any, ...]:
+        bull = lod.close >= lod.open
+        bear = ~bull
+        half_width = lod.scale * BODY_WIDTH_RATIO / 2.0
+        body_low = np.minimum(lod.open, lod.close)
+        body_high = np.maximum(lod.open, lod.close)
+        return (
+            _segment_path(lod.x[bull], lod.low[bull], lod.high[bull]),
+            _segment_path(lod.x[bear], lod.low[bear], lod.high[bear]),
+            _rect_list(lod.x[bull], half_width, body_low[bull], body_high[bull]),
+            _rect_list(lod.x[bear], half_width, body_low[bear], body_high[bear]),
+        )
+
+    def _draw(self, painter, lod: LodSlice) -> None:
+        bull_wicks, bear_wicks, bull_bodies, bear_bodies = self._paths
+        painter.setPen(self._bull_pen)
+        painter.drawPath(bull_wicks)
+        painter.setPen(self._bear_pen)
+        painter.drawPath(bear_wicks)
+        painter.setPen(QtCore.Qt.PenStyle.NoPen)
+        painter.setBrush(self._bull_brush)
+        painter.drawRects(bull_bodies)
+        painter.setBrush(self._bear_brush)
+        painter.drawRects(bear_bodies)
+
+    def _y_bounds(self, lod: LodSlice) -> Tuple[float, float]:
+        return float(lod.low.min()), float(lod.high.max())
+
+    def _full_y_bounds(self) -> Tuple[float, float]:
+        return self._buffer.price_range() or (0.0, 1.0)
+
+
+class LodVolumeItem(_LodItemBase):
+    """다운샘플 거래량 막대 아이템 (상승/하락 색 구분)"""
+
+    def __init__(self, buffer: CandleLodBuffer, bull_color: str = BULL_COLOR, bear_color: str = BEAR_COLOR) -> None:
+        super().__init__(buffer)
+        self._bull_brush = pg.mkBrush(QtGui.QColor(bull_color).lighter(150))
+        self._bear_brush = pg.mkBrush(QtGui.QColor(bear_color).lighter(150))
+
+    def _build_paths(self, lod: LodSlice) -> Tuple[Any, ...]:
+        bull = lod.close >= lod.open
+        bear = ~bull
+        half_width = lod.scale * BODY_WIDTH_RATIO / 2.0
+        zeros = np.zeros(len(lod))
+        return (
+            _rect_list(lod.x[bull], half_width, zeros[bull], lod.volume[bull]),
+            _rect_list(lod.x[bear], half_width, zeros[bear], lod.volume[bear]),
+        )
+
+    def _draw(self, painter, lod: LodSlice) -> None:
+        bull_bars, bear_bars = self._paths
+        painter.setPen(QtCore.Qt.PenStyle.NoPen)
+        painter.setBrush(self._bull_brush)
+        painter.drawRects(bull_bars)
+        painter.setBrush(self._bear_brush)
+        painter.drawRects(bear_bars)
+
+    def _y_bounds(self, lod: LodSlice) -> Tuple[float, float]:
+        return 0.0, float(lod.volume.max())
+
+    def _full_y_bounds(self) -> Tuple[float, float]:
+        # 거래량은 레벨마다 합산 단위가 달라 전체 구간을 화면 크기 LOD 로 본 최대값 사용
+        buffer = self._buffer
+        lod = buffer.lod_view(buffer.first_index, buffer.last_index, self._max_bars)
+        return 0.0, float(lod.volume.max()) if len(lod) else 1.0
+
+
+class LodMovingAverageItem(_LodItemBase):
+    """다운샘플 이동평균선 아이템 (LOD 봉마다 버킷 마지막 캔들 시점의 원본 이동평균 값)"""
+
+    def __init__(self, buffer: CandleLodBuffer, period: int, color: str, width: float = 1.5) -> None:
+        super().__init__(buffer)
+        self.period = period
+        self._pen = pg.mkPen(color, width=width, cosmetic=True)
+
+    def _sample(self, lod: LodSlice) -> np.ndarray:
+        """LOD 봉별 버킷 마지막 원본 인덱스의 이동평균 (LOD 종가와 같은 시점)"""
+        buffer = self._buffer
+        buckets = np.rint((lod.x - (lod.scale - 1) / 2.0) / lod.scale).astype(np.int64)
+        indexes = np.clip(buckets * lod.scale + lod.scale - 1, buffer.first_index, buffer.last_index)
+        begin = int(indexes[0])
+        averages = buffer.moving_average(self.period, begin, int(indexes[-1]) + 1)
+        return averages[indexes - begin]
+
+    def _build_paths(self, lod: LodSlice) -> Tuple[Any, ...]:
+        return (pg.arrayToQPath(lod.x, self._sample(lod), connect='finite'),)
+
+    def _draw(self, painter, lod: LodSlice) -> None:
+        painter.setPen(self._pen)
+        painter.drawPath(self._paths[0])
+
+    def _full_y_bounds(self) -> Tuple[float, float]:
+        return self._buffer.price_range() or (0.0, 1.0)
+
+    def dataBounds(self, ax: int, frac: float = 1.0, orthoRange=None):
+        # 이동평균은 캔들 가격 범위 안에 있으므로 자동 범위는 캔들 아이템 기준
+        return None
+
+
+class CandleTimeAxisItem(_AxisItemBase):
+    """x 좌표(캔들 인덱스)를 버퍼의 캔들 시각으로 표시하는 축"""
+
+    def __init__(self, buffer: CandleLodBuffer, orientation: str = 'bottom', **kwargs) -> None:
+        super().__init__(orientation, **kwargs)
+        self._buffer = buffer
+
+    def set_buffer(self, buffer: CandleLodBuffer) -> None:
+        self._buffer = buffer
+        self.picture = None
+        self.update()
+
+    def tickStrings(self, values, scale, spacing):
+        times = [self._buffer.time_at(int(round(value))) for value in values]
+        known = [time_ms for time_ms in times if time_ms is not None]
+        step_ms = (known[1] - known[0]) if len(known) >= 2 else 0
+        if step_ms >= 28 * 86_400_000:
+            fmt = '%Y-%m'
+        elif step_ms >= 86_400_000:
+            fmt = '%Y-%m-%d'
+        else:
+            fmt = '%m-%d %H:%M'
+        return [datetime.fromtimestamp(time_ms / 1000).strftime(fmt) if time_ms is not None else ''
+                for time_ms in times]
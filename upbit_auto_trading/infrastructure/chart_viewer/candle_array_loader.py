@@ -0,0 +1,97 @@
+"""
+저장 캔들 → NumPy 배열 로더 (차트뷰어 전용)
+
+candles_{symbol}_{timeframe} 테이블에서 최근 N개 캔들을 시간 오름차순 열 배열로 읽어
+CandleLodBuffer.load() 에 그대로 넘길 수 있게 합니다.
+
+- CandleData 객체/DataFrame 을 거치지 않고 열 단위로 변환 (10만 건 이상 적재용)
+- 빈 캔들(가격 NULL)은 직전 종가로 채우고 거래량 0 처리
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from upbit_auto_trading.infrastructure.database.database_manager import DatabaseManager
+from upbit_auto_trading.infrastructure.logging import create_component_logger
+
+logger = create_component_logger("CandleArrayLoader")
+
+
+@dataclass(frozen=True)
+class CandleArrays:
+    """시간 오름차순 OHLCV 열 배열 (time 은 epoch ms)"""
+    time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+
+def candle_table_name(symbol: str, timeframe: str) -> str:
+    """심볼과 타임프레임으로 캔들 테이블명 생성 (SqliteCandleRepository 와 동일 규칙)"""
+    return f"candles_{symbol.replace('-', '_')}_{timeframe}"
+
+
+def _forward_fill(values: np.ndarray) -> np.ndarray:
+    """NaN 을 직전 유효값으로 채움 (선두 NaN 은 첫 유효값)"""
+    missing = np.isnan(values)
+    if not missing.any():
+        return values
+    valid_positions = np.where(~missing, np.arange(len(values)), 0)
+    np.maximum.accumulate(valid_positions, out=valid_positions)
+    filled = values[valid_positions]
+    first_valid = np.flatnonzero(~missing)
+    if len(first_valid):
+        filled[:first_valid[0]] = values[first_valid[0]]
+    return filled
+
+
+def load_candle_arrays(db_manager: DatabaseManager, symbol: str, timeframe: str,
+                       limit: int = 500_000) -> Optional[CandleArrays]:
+    """
+    저장된 캔들 최근 limit 개를 열 배열로 조회
+
+    Returns:
+        CandleArrays 또는 테이블이 없거나 비어 있으면 None
+    """
+    table_name = candle_table_name(symbol, timeframe)
+    with db_manager.get_connection('market_data') as conn:
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (table_name,)
+        ).fetchone()
+        if not exists:
+            return None
+        rows = conn.execute(f"""
+            SELECT candle_date_time_utc, opening_price, high_price, low_price, trade_price,
+                   candle_acc_trade_volume
+            FROM (
+                SELECT * FROM {table_name} ORDER BY candle_date_time_utc DESC LIMIT ?
+            )
+            ORDER BY candle_date_time_utc ASC
+        """, (limit,)).fetchall()
+
+    if not rows:
+        return None
+
+    utc_times, opens, highs, lows, closes, volumes = zip(*rows)
+    # 'YYYY-MM-DDTHH:MM:SS' (UTC) → epoch ms
+    times = np.array(utc_times, dtype='datetime64[ms]').astype(np.int64).astype(np.float64)
+    closes = _forward_fill(np.array(closes, dtype=np.float64))
+    empty = np.isnan(np.array(opens, dtype=np.float64))
+
+    arrays = CandleArrays(
+        time=times,
+        open=np.where(empty, closes, np.array(opens, dtype=np.float64)),
+        high=np.where(empty, closes, np.array(highs, dtype=np.float64)),
+        low=np.where(empty, closes, np.array(lows, dtype=np.float64)),
+        close=closes,
+        volume=np.nan_to_num(np.array(volumes, dtype=np.float64)),
+    )
+    logger.debug(f"저장 캔들 배열 로드: {table_name} {len(arrays)}개 (빈 캔들 {int(empty.sum())}개)")
+    return arrays
@@ -0,0 +1,98 @@
+"""
+차트 데이터 버퍼 메모리 예산 어댑터
+
+ChartViewerResourceManager 가 차트별 데이터 버퍼의 실제 바이트를 합산하고,
+예산 초과 시 우선순위 정책에 따라 축소(compact)·해제(release)·복원(restore)할 수 있게 합니다.
+(ChartDataBuffer 프로토콜 구조적 구현 - application 계층 import 없음)
+
+- ManagedCandleBuffer: CandleLodBuffer (캔들 + LOD 피라미드) - 축소 = 최근 구간만 남기고 재할당
+- ManagedArrayBuffer: 지표 시리즈·호가 스냅샷 등 NumPy 배열 묶음 - 축소 = 최근 구간 복사본만 유지
+- 해제된 데이터는 restore() 때 reload 콜백(DB 조회 등)으로 다시 채움
+"""
+
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from upbit_auto_trading.infrastructure.chart.candle_lod_buffer import CandleLodBuffer
+
+DEFAULT_COMPACT_CANDLES = 2_000
+
+
+class ManagedCandleBuffer:
+    """CandleLodBuffer 메모리 예산 어댑터"""
+
+    kind = "candles"
+
+    def __init__(self, buffer: CandleLodBuffer, reload: Callable[[], None],
+                 compact_capacity: int = DEFAULT_COMPACT_CANDLES,
+                 on_change: Optional[Callable[[], None]] = None):
+        """
+        Args:
+            buffer: 관리할 캔들 버퍼
+            reload: 원래 용량으로 되돌린 버퍼를 다시 채우는 함수 (예: 저장 캔들 DB 재적재 - 작업 스레드 비동기 적재 가능)
+            compact_capacity: 축소 시 남길 최근 캔들 수
+            on_change: 버퍼 내용이 바뀐 뒤 호출 (차트 아이템 갱신 등)
+        """
+        self.buffer = buffer
+        self.full_capacity = buffer.capacity
+        self.compact_capacity = compact_capacity
+        self._reload = reload
+        self._on_change = on_change
+
+    @property
+    def nbytes(self) -> int:
+        return self.buffer.nbytes
+
+    def compact(self) -> None:
+        if self.buffer.capacity > self.compact_capacity:
+            self.buffer.resize(self.compact_capacity)
+            self._changed()
+
+    def release(self) -> None:
+        self.buffer.resize(1)
+        self.buffer.clear()
+        self._changed()
+
+    def restore(self) -> None:
+        self.buffer.resize(self.full_capacity)
+        self._reload()
+        self._changed()
+
+    def _changed(self) -> None:
+        if self._on_change is not None:
+            self._on_change()
+
+
+class ManagedArrayBuffer:
+    """NumPy 배열 묶음(지표 시리즈, 호가 스냅샷 이력 등) 메모리 예산 어댑터"""
+
+    def __init__(self, kind: str, arrays: Dict[str, np.ndarray],
+                 reload: Callable[[], Dict[str, np.ndarray]],
+                 compact_length: int = DEFAULT_COMPACT_CANDLES):
+        """
+        Args:
+            kind: 데이터 종류 ('indicator', 'orderbook' 등 - 통계 분류용)
+            arrays: 이름별 1차원 이상 배열 (첫 축이 시간)
+            reload: 해제/축소된 배열 전체를 다시 만드는 함수
+            compact_length: 축소 시 남길 최근 행 수
+        """
+        self.kind = kind
+        self.arrays = arrays
+        self.compact_length = compact_length
+        self._reload = reload
+
+    @property
+    def nbytes(self) -> int:
+        return sum(array.nbytes for array in self.arrays.values())
+
+    def compact(self) -> None:
+        # 슬라이스 뷰는 원본을 붙잡고 있으므로 복사본으로 교체해야 메모리가 반환됨
+        self.arrays = {name: array[-self.compact_length:].copy() if len(array) > self.compact_length else array
+                       for name, array in self.arrays.items()}
+
+    def release(self) -> None:
+        self.arrays = {}
+
+    def restore(self) -> None:
+        self.arrays = self._reload()
@@ -16,7 +16,7 @@ Design Principles:
 Features:
 - 1개월 타임프레임 스키마 확장 (candlestick_data_1M 테이블)
 - 기존 1m~1d 타임프레임과 완전 호환
-- 실시간 데이터와 히스토리 데이터 동기화
+- 실시간 봉 저장은 LiveCandleAggregator 가 담당 (체결 스트림 → 캔들 테이블 배치 upsert)
 - 기존 시스템 영향 없는 격리된 캐시 관리
 - 기존 DatabaseManager 기반 안전한 트랜잭션 처리
 """
@@ -308,48 +308,6 @@ class ChartViewerMarketDataRepository:
             self._logger.error(f"❌ 1개월 캔들 조회 실패: {symbol} - {e}")
             return []
 
-    # ===================================
-    # 실시간-히스토리 동기화 메서드들
-    # ===================================
-
-    async def sync_realtime_to_history(self, symbol: str, timeframe: str,
-                                     latest_candle: CandleData) -> bool:
-        """
-        실시간 데이터를 히스토리 테이블에 동기화 (Phase 1.4 핵심)
-
-        Phase 1.1-1.3 백본에서 수집한 실시간 데이터를
-        안전하게 영구 저장소에 동기화합니다.
-        """
-        if timeframe not in self.SUPPORTED_TIMEFRAMES:
-            self._logger.warning(f"⚠️ 지원하지 않는 타임프레임: {timeframe}")
-            return False
-
-        table_name = self.SUPPORTED_TIMEFRAMES[timeframe]
-
-        try:
-            # 기존 데이터 존재 확인
-            existing = await self._get_existing_candle(symbol, timeframe, latest_candle.timestamp)
-
-            if existing:
-                # 업데이트 (실시간 데이터로 갱신)
-                success = await self._update_candle(table_name, latest_candle)
-                action = "업데이트"
-            else:
-                # 신규 삽입
-                success = await self._insert_candle(table_name, latest_candle)
-                action = "삽입"
-
-            if success:
-                self._logger.debug(f"✅ 실시간 동기화 {action}: {symbol} {timeframe}")
-                return True
-            else:
-                self._logger.warning(f"⚠️ 실시간 동기화 실패: {symbol} {timeframe}")
-                return False
-
-        except Exception as e:
-            self._logger.error(f"❌ 실시간 동기화 오류: {symbol} {timeframe} - {e}")
-            return False
-
     def get_supported_timeframes(self) -> List[str]:
         """지원하는 모든 타임프레임 목록 반환"""
         return list(self.SUPPORTED_TIMEFRAMES.keys())
@@ -362,92 +320,6 @@ class ChartViewerMarketDataRepository:
         """타임프레임에 해당하는 테이블명 반환"""
         return self.SUPPORTED_TIMEFRAMES.get(timeframe)
 
-    async def _get_existing_candle(self, symbol: str, timeframe: str,
-                                  timestamp: datetime) -> Optional[CandleData]:
-        """기존 캔들 데이터 조회"""
-        table_name = self.SUPPORTED_TIMEFRAMES[timeframe]
-
-        query = f"""
-        SELECT symbol, timestamp, open_price, high_price, low_price, close_price,
-               volume, quote_volume, trade_count
-        FROM {table_name}
-        WHERE symbol = ? AND timestamp = ?
-        """
-
-        try:
-            if self._db_manager:
-                rows = self._db_manager.execute_query('market_data', query,
-                                                    (symbol, timestamp.isoformat()))
-
-                if rows:
-                    row = rows[0]
-                    return CandleData(
-                        symbol=row['symbol'],
-                        timestamp=datetime.fromisoformat(row['timestamp']),
-                        timeframe=timeframe,
-                        open_price=row['open_price'],
-                        high_price=row['high_price'],
-                        low_price=row['low_price'],
-                        close_price=row['close_price'],
-                        volume=row['volume'],
-                        quote_volume=row['quote_volume'],
-                        trade_count=row['trade_count']
-                    )
-            return None
-
-        except Exception:
-            return None
-
-    async def _insert_candle(self, table_name: str, candle: CandleData) -> bool:
-        """새 캔들 데이터 삽입"""
-        insert_sql = f"""
-        INSERT INTO {table_name}
-        (symbol, timestamp, open_price, high_price, low_price, close_price,
-         volume, quote_volume, trade_count, created_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
-        try:
-            if self._db_manager:
-                params = (
-                    candle.symbol, candle.timestamp.isoformat(), candle.open_price, candle.high_price,
-                    candle.low_price, candle.close_price, candle.volume, candle.quote_volume,
-                    candle.trade_count, datetime.now().isoformat()
-                )
-
-                self._db_manager.execute_command('market_data', insert_sql, params)
-                return True
-            return False
-
-        except Exception as e:
-            self._logger.error(f"❌ 캔들 삽입 실패: {table_name} - {e}")
-            return False
-
-    async def _update_candle(self, table_name: str, candle: CandleData) -> bool:
-        """기존 캔들 데이터 업데이트"""
-        update_sql = f"""
-        UPDATE {table_name}
-        SET high_price = ?, low_price = ?, close_price = ?,
-            volume = ?, quote_volume = ?, trade_count = ?
-        WHERE symbol = ? AND timestamp = ?
-        """
-
-        try:
-            if self._db_manager:
-                params = (
-                    candle.high_price, candle.low_price, candle.close_price,
-                    candle.volume, candle.quote_volume, candle.trade_count,
-                    candle.symbol, candle.timestamp.isoformat()
-                )
-
-                self._db_manager.execute_command('market_data', update_sql, params)
-                return True
-            return False
-
-        except Exception as e:
-            self._logger.error(f"❌ 캔들 업데이트 실패: {table_name} - {e}")
-            return False
-
 
 # ===================================
 # Factory & Service 함수들
@@ -18,6 +18,11 @@ import logging
 from pathlib import Path
 import threading
 
+from upbit_auto_trading.infrastructure.logging.performance.latency_tracer import get_latency_tracer
+
+# 쓰기(커밋 포함) 지연 측정 (PerformanceMonitor 활성 시)
+_latency_tracer = get_latency_tracer()
+
 
 class DatabaseManager:
     """SQLite 데이터베이스 연결 관리"""
@@ -96,15 +101,17 @@ class DatabaseManager:
 
     def execute_command(self, db_name: str, query: str, params: tuple = ()) -> int:
         """INSERT/UPDATE/DELETE 쿼리 실행"""
-        with self.get_connection(db_name) as conn:
-            cursor = conn.execute(query, params)
-            return cursor.rowcount
+        with _latency_tracer.span("db.write"):
+            with self.get_connection(db_name) as conn:
+                cursor = conn.execute(query, params)
+                return cursor.rowcount
 
     def execute_many(self, db_name: str, query: str, params_list: List[tuple]) -> int:
         """배치 INSERT/UPDATE 실행"""
-        with self.get_connection(db_name) as conn:
-            cursor = conn.executemany(query, params_list)
-            return cursor.rowcount
+        with _latency_tracer.span("db.write_many"):
+            with self.get_connection(db_name) as conn:
+                cursor = conn.executemany(query, params_list)
+                return cursor.rowcount
 
     def get_last_insert_id(self, db_name: str) -> int:
         """마지막 삽입된 행의 ID 반환"""
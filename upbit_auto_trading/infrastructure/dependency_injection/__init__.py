@@ -8,6 +8,7 @@ Clean Architecture + dependency-injector 기반 DI 시스템
 - ExternalDependencyContainer: Infrastructure Layer 외부 의존성 전담
 - @inject 데코레이터: 생성자 주입 패턴
 - Configuration Provider: 환경별 설정 관리
+- lazy_import: Provider 대상 지연 import (첫 호출 시 모듈 로드)
 
 사용 예시:
     >>> from upbit_auto_trading.infrastructure.dependency_injection import ExternalDependencyContainer
@@ -19,6 +20,8 @@ Clean Architecture + dependency-injector 기반 DI 시스템
     >>>     self._service = service
 """
 
+from .lazy_import import LazyImport, lazy_import
+
 from .external_dependency_container import (
     ExternalDependencyContainer,
     create_external_dependency_container,
@@ -47,6 +50,9 @@ from .di_lifecycle_manager import (
 )
 
 __all__ = [
+    # Lazy Provider Target
+    'LazyImport',
+    'lazy_import',
     # External Dependency Container (New)
     'ExternalDependencyContainer',
     'create_external_dependency_container',
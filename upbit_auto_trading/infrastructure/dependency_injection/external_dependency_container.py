@@ -5,6 +5,7 @@ DDD Architecture 기반 외부 시스템 통합 전용 DI 컨테이너
 
 from dependency_injector import containers, providers
 
+from upbit_auto_trading.infrastructure.dependency_injection.lazy_import import lazy_import
 from upbit_auto_trading.infrastructure.logging import create_component_logger
 
 logger = create_component_logger("ExternalDependencyContainer")
@@ -37,33 +38,33 @@ class ExternalDependencyContainer(containers.DeclarativeContainer):
 
     # Logging Service (가장 기본이 되는 서비스)
     logging_service = providers.Factory(
-        "upbit_auto_trading.infrastructure.logging.create_component_logger",
+        lazy_import("upbit_auto_trading.infrastructure.logging.create_component_logger"),
         name="ExternalDependencyContainer"
     )
 
     # Application Layer Logging Service - Settings 컴포넌트용
     application_logging_service = providers.Singleton(
-        "upbit_auto_trading.application.services.logging_application_service.create_application_logging_service"
+        lazy_import("upbit_auto_trading.application.services.logging_application_service.create_application_logging_service")
     )
 
     # Database Manager - 3-DB 분리 구조 지원
     database_manager = providers.Singleton(
-        "upbit_auto_trading.infrastructure.services.database_connection_service.DatabaseConnectionService"
+        lazy_import("upbit_auto_trading.infrastructure.services.database_connection_service.DatabaseConnectionService")
     )
 
     # Path Service - 설정 파일 및 DB 경로 관리
     path_service = providers.Singleton(
-        "upbit_auto_trading.infrastructure.configuration.get_path_service"
+        lazy_import("upbit_auto_trading.infrastructure.configuration.get_path_service")
     )
 
     # Config Loader - 설정 파일 로더
     config_loader = providers.Singleton(
-        "upbit_auto_trading.infrastructure.config.loaders.config_loader.ConfigLoader"
+        lazy_import("upbit_auto_trading.infrastructure.config.loaders.config_loader.ConfigLoader")
     )
 
     # Settings Service - 애플리케이션 설정 관리
     settings_service = providers.Factory(
-        "upbit_auto_trading.infrastructure.services.settings_service.SettingsService",
+        lazy_import("upbit_auto_trading.infrastructure.services.settings_service.SettingsService"),
         config_loader=config_loader
     )
 
@@ -73,19 +74,19 @@ class ExternalDependencyContainer(containers.DeclarativeContainer):
 
     # Secure Keys Repository (SQLite 구현체) - ApiKeyService 의존성
     secure_keys_repository = providers.Singleton(
-        "upbit_auto_trading.infrastructure.repositories.sqlite_secure_keys_repository.SqliteSecureKeysRepository",
+        lazy_import("upbit_auto_trading.infrastructure.repositories.sqlite_secure_keys_repository.SqliteSecureKeysRepository"),
         db_manager=database_manager
     )
 
     # Strategy Repository (SQLite 구현체)
     strategy_repository = providers.Singleton(
-        "upbit_auto_trading.infrastructure.repositories.sqlite_strategy_repository.SqliteStrategyRepository",
+        lazy_import("upbit_auto_trading.infrastructure.repositories.sqlite_strategy_repository.SqliteStrategyRepository"),
         db_manager=database_manager
     )
 
     # Trigger Repository (SQLite 구현체)
     trigger_repository = providers.Singleton(
-        "upbit_auto_trading.infrastructure.repositories.sqlite_trigger_repository.SqliteTriggerRepository",
+        lazy_import("upbit_auto_trading.infrastructure.repositories.sqlite_trigger_repository.SqliteTriggerRepository"),
         db_manager=database_manager
     )
 
@@ -102,7 +103,7 @@ class ExternalDependencyContainer(containers.DeclarativeContainer):
 
     # API Key Service - 보안 키 관리 (SecureKeysRepository 의존성 주입)
     api_key_service = providers.Factory(
-        "upbit_auto_trading.infrastructure.services.api_key_service.ApiKeyService",
+        lazy_import("upbit_auto_trading.infrastructure.services.api_key_service.ApiKeyService"),
         secure_keys_repository=secure_keys_repository
     )
 
@@ -125,13 +126,13 @@ class ExternalDependencyContainer(containers.DeclarativeContainer):
 
     # Strategy Compatibility Service
     strategy_compatibility_service = providers.Factory(
-        "upbit_auto_trading.domain.services.strategy_compatibility_service.StrategyCompatibilityService",
+        lazy_import("upbit_auto_trading.domain.services.strategy_compatibility_service.StrategyCompatibilityService"),
         settings_repository=settings_repository
     )
 
     # Domain Event Publisher
     domain_event_publisher = providers.Singleton(
-        "upbit_auto_trading.domain.events.domain_event_publisher.DomainEventPublisher"
+        lazy_import("upbit_auto_trading.domain.events.domain_event_publisher.DomainEventPublisher")
     )
 
     # =============================================================================
@@ -140,12 +141,12 @@ class ExternalDependencyContainer(containers.DeclarativeContainer):
 
     # Style Manager - 전역 스타일 관리 (Theme Service보다 먼저 정의)
     style_manager = providers.Singleton(
-        "upbit_auto_trading.ui.desktop.common.styles.style_manager.StyleManager"
+        lazy_import("upbit_auto_trading.ui.desktop.common.styles.style_manager.StyleManager")
     )
 
     # Theme Service - UI 테마 관리
     theme_service = providers.Factory(
-        "upbit_auto_trading.infrastructure.services.theme_service.ThemeService",
+        lazy_import("upbit_auto_trading.infrastructure.services.theme_service.ThemeService"),
         settings_service=settings_service,
         style_manager=style_manager
     )
@@ -244,8 +245,8 @@ def wire_external_dependency_modules(container: ExternalDependencyContainer) ->
             "upbit_auto_trading.infrastructure.services",
             "upbit_auto_trading.infrastructure.repositories",
 
-            # External API Modules
-            "upbit_auto_trading.infrastructure.external_apis",
+            # External API Modules - @inject 사용처가 없어 제외
+            # (wiring 은 대상 모듈을 import 하므로 aiohttp/JWT 클라이언트 전체가 첫 화면 전에 로드됨)
 
             # Configuration Modules
             "upbit_auto_trading.infrastructure.configuration",
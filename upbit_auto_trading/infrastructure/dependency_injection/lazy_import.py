@@ -0,0 +1,67 @@
+"""
+Lazy Import Provider Target - DI Provider 지연 로딩
+
+dependency-injector 는 Provider 에 문자열 경로를 넘기면 컨테이너 클래스 정의 시점에 즉시 import 합니다.
+그러면 컨테이너 모듈을 import 하는 것만으로 모든 서비스/리포지토리/UI 모듈이 로드되어
+첫 화면 표시 전에 사용하지 않는 의존성까지 초기화 비용을 치르게 됩니다.
+
+lazy_import("패키지.모듈.객체") 는 Provider 에 넘길 수 있는 호출 가능 객체를 만들고,
+실제 import 는 Provider 가 처음 호출(인스턴스 생성)될 때 수행합니다.
+
+사용 예시:
+    >>> database_manager = providers.Singleton(
+    ...     lazy_import("upbit_auto_trading.infrastructure.services.database_connection_service.DatabaseConnectionService")
+    ... )
+"""
+
+import importlib
+from typing import Any, Callable, Optional
+
+
+class LazyImport:
+    """점(.) 경로 대상을 첫 호출 시점에 import 하여 호출하는 Provider 대상"""
+
+    __slots__ = ("_path", "_target")
+
+    def __init__(self, path: str):
+        module_name, _, attribute = path.rpartition(".")
+        if not module_name or not attribute:
+            raise ValueError(f"'모듈.객체' 형식의 경로가 필요합니다: {path}")
+        self._path = path
+        self._target: Optional[Callable[..., Any]] = None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def is_loaded(self) -> bool:
+        """대상 모듈이 이미 import 되었는지 여부"""
+        return self._target is not None
+
+    def resolve(self) -> Callable[..., Any]:
+        """대상 객체를 import 하여 반환 (이후 호출은 캐시 사용)"""
+        if self._target is None:
+            module_name, _, attribute = self._path.rpartition(".")
+            self._target = getattr(importlib.import_module(module_name), attribute)
+        return self._target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._target is not None else "deferred"
+        return f"LazyImport({self._path!r}, {state})"
+
+
+def lazy_import(path: str) -> LazyImport:
+    """
+    Provider 대상 지연 import 생성
+
+    Args:
+        path: "패키지.모듈.클래스_또는_함수" 형식의 경로
+
+    Returns:
+        LazyImport: 첫 호출 시 대상을 import 하는 호출 가능 객체
+    """
+    return LazyImport(path)
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Callable, Dict, Any, Optional, Type
 from datetime import datetime
@@ -14,6 +15,7 @@ class EventSubscription:
         self.is_async = is_async
         self.priority = priority  # 낮을수록 우선순위 높음
         self.retry_count = retry_count
+        self.is_coroutine = asyncio.iscoroutinefunction(handler)  # 디스패치 시 반복 검사 방지
         self.subscription_id = f"{event_type.__name__}_{id(handler)}"
         self.created_at = datetime.now()
 
@@ -79,6 +81,14 @@ class IEventStorage(ABC):
         """이벤트 저장"""
         pass
 
+    async def store_events(self, events: List[DomainEvent]) -> List[str]:
+        """배치 이벤트 저장 (기본 구현: 개별 저장 반복)"""
+        return [await self.store_event(event) for event in events]
+
+    async def flush(self) -> None:
+        """버퍼링된 쓰기 기록 (버퍼 없는 저장소는 무시)"""
+        pass
+
     @abstractmethod
     async def get_event(self, event_id: str) -> Optional[DomainEvent]:
         """이벤트 조회"""
@@ -1,7 +1,9 @@
 import asyncio
 import logging
+import sys
 import time
-from typing import List, Callable, Dict, Any, Optional, Type
+from itertools import groupby
+from typing import List, Callable, Dict, Any, Optional, Tuple, Type
 from collections import defaultdict, deque
 from datetime import datetime
 
@@ -10,13 +12,35 @@ from upbit_auto_trading.infrastructure.events.bus.event_bus_interface import (
     IEventBus, EventSubscription, EventProcessingResult, IEventStorage
 )
 
+# 우선순위 계층: 같은 priority의 구독들은 동시에 실행되고, 계층 간에는 순서가 보장됨
+DispatchTiers = Tuple[Tuple[EventSubscription, ...], ...]
+
+# Python 3.12+: 대기 없이 끝나는 핸들러는 이벤트 루프 스케줄링 없이 즉시 완료 (eager task)
+_EAGER_TASKS = sys.version_info >= (3, 12)
+
+
+def _start_handler_task(coro) -> asyncio.Future:
+    if _EAGER_TASKS:
+        return asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+    return asyncio.ensure_future(coro)
+
+
 class InMemoryEventBus(IEventBus):
-    """메모리 기반 이벤트 버스 구현"""
+    """
+    메모리 기반 이벤트 버스 구현
+
+    - 디스패치 테이블: 이벤트 타입별로 MRO 전체(기반 클래스 구독 포함)를 구독 시점에 미리 계산
+    - 같은 우선순위 계층의 핸들러는 동시 실행, 계층 간에는 priority 순서 유지
+    - 통계는 이벤트 루프 단일 스레드에서만 갱신하므로 락 없이 누적
+    - 저장소 처리 완료 표시는 이벤트당 1회 (전체 핸들러 결과 집계)
+    """
 
     def __init__(self, event_storage: Optional[IEventStorage] = None,
                  max_queue_size: int = 10000, worker_count: int = 4,
                  batch_size: int = 10, batch_timeout_seconds: float = 1.0):
         self._subscriptions: Dict[Type[DomainEvent], List[EventSubscription]] = defaultdict(list)
+        self._dispatch_table: Dict[type, DispatchTiers] = {}
+        self._handler_names: Dict[type, str] = {}  # 처리 결과 기록용 핸들러 이름 (타입별 캐시)
         self._event_queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
         self._event_storage = event_storage
         self._worker_count = worker_count
@@ -26,7 +50,6 @@ class InMemoryEventBus(IEventBus):
         # 실행 상태
         self._is_running = False
         self._workers: List[asyncio.Task] = []
-        self._lock = asyncio.Lock()
 
         # 통계
         self._stats = {
@@ -56,9 +79,7 @@ class InMemoryEventBus(IEventBus):
 
             # 큐에 추가
             await self._event_queue.put(event)
-
-            async with self._lock:
-                self._stats['events_published'] += 1
+            self._stats['events_published'] += 1
 
             self._logger.debug(f"이벤트 발행됨: {event.__class__.__name__} (ID: {event.event_id})")
 
@@ -77,15 +98,13 @@ class InMemoryEventBus(IEventBus):
 
         # 이벤트 저장 (배치)
         if self._event_storage:
-            for event in events:
-                await self._event_storage.store_event(event)
+            await self._event_storage.store_events(events)
 
         # 큐에 배치 추가
         for event in events:
             try:
                 await self._event_queue.put(event)
-                async with self._lock:
-                    self._stats['events_published'] += 1
+                self._stats['events_published'] += 1
             except asyncio.QueueFull:
                 self._logger.error(f"배치 이벤트 발행 중 큐 가득참: {event.__class__.__name__}")
                 break
@@ -114,6 +133,7 @@ class InMemoryEventBus(IEventBus):
             insert_index = i + 1
 
         subscriptions.insert(insert_index, subscription)
+        self._rebuild_dispatch_table()
 
         self._logger.info(f"이벤트 구독 등록: {event_type.__name__} -> {handler.__name__}")
         return subscription.subscription_id
@@ -124,11 +144,40 @@ class InMemoryEventBus(IEventBus):
             for i, subscription in enumerate(subscriptions):
                 if subscription.subscription_id == subscription_id:
                     del subscriptions[i]
+                    self._rebuild_dispatch_table()
                     self._logger.info(f"구독 취소됨: {subscription_id}")
                     return True
 
         return False
 
+    def _build_dispatch_tiers(self, event_type: type) -> DispatchTiers:
+        """MRO 순서(구체 타입 우선)로 구독을 모아 priority별 계층으로 분할"""
+        collected: List[EventSubscription] = []
+        for klass in event_type.__mro__:
+            collected.extend(self._subscriptions.get(klass, ()))
+
+        # 안정 정렬: 같은 priority 내에서는 구체 타입 → 기반 타입, 등록 순서 유지
+        collected.sort(key=lambda sub: sub.priority)
+        return tuple(
+            tuple(tier) for _, tier in groupby(collected, key=lambda sub: sub.priority)
+        )
+
+    def _rebuild_dispatch_table(self) -> None:
+        """구독 변경 시 등록 타입과 지금까지 발행된 타입의 디스패치 테이블 재계산"""
+        event_types = set(self._subscriptions) | set(self._dispatch_table)
+        self._dispatch_table = {
+            event_type: self._build_dispatch_tiers(event_type) for event_type in event_types
+        }
+        self._handler_names.clear()
+
+    def _get_dispatch_tiers(self, event_type: type) -> DispatchTiers:
+        """디스패치 테이블 조회 (구독 시점에 없던 하위 타입은 최초 1회 계산 후 캐시)"""
+        tiers = self._dispatch_table.get(event_type)
+        if tiers is None:
+            tiers = self._build_dispatch_tiers(event_type)
+            self._dispatch_table[event_type] = tiers
+        return tiers
+
     async def start(self) -> None:
         """이벤트 버스 시작"""
         if self._is_running:
@@ -164,6 +213,10 @@ class InMemoryEventBus(IEventBus):
         await asyncio.gather(*self._workers, return_exceptions=True)
         self._workers.clear()
 
+        # 저장소 쓰기 버퍼 기록
+        if self._event_storage:
+            await self._event_storage.flush()
+
         self._logger.info("이벤트 버스 중지됨")
 
     def get_statistics(self) -> Dict[str, Any]:
@@ -243,49 +296,37 @@ class InMemoryEventBus(IEventBus):
                                     worker_name: str) -> None:
         """단일 이벤트 처리"""
         event_type = type(event)
-        subscriptions = self._subscriptions.get(event_type, [])
+        tiers = self._get_dispatch_tiers(event_type)
 
-        if not subscriptions:
+        if not tiers:
             self._logger.debug(f"구독자 없음: {event_type.__name__}")
             return
 
         start_time = time.time()
-        success_count = 0
-        failure_count = 0
+        results: List[EventProcessingResult] = []
 
-        # 모든 구독자에게 이벤트 전달
-        for subscription in subscriptions:
-            try:
-                result = await self._invoke_handler(event, subscription, worker_name)
-
-                if result.success:
-                    success_count += 1
-                else:
-                    failure_count += 1
-                    await self._handle_processing_failure(event, subscription, result)
+        # 우선순위 계층 순서대로, 계층 내부는 동시 실행
+        for tier in tiers:
+            if len(tier) == 1:
+                tier_results = [await self._invoke_subscription(event, tier[0], worker_name)]
+            else:
+                tier_results = await self._run_tier(event, tier, worker_name)
+            results.extend(tier_results)
 
-                # 결과 저장
-                if self._event_storage and event.event_id:
-                    await self._event_storage.mark_event_processed(event.event_id, result)
+        success_count = sum(1 for result in results if result.success)
+        failure_count = len(results) - success_count
 
-            except Exception as e:
-                failure_count += 1
-                error_msg = f"핸들러 호출 실패: {subscription.handler.__name__} - {e}"
-                self._logger.error(error_msg)
-
-                result = EventProcessingResult(
-                    event_id=event.event_id or 'unknown',
-                    success=False,
-                    error_message=error_msg
-                )
-                await self._handle_processing_failure(event, subscription, result)
+        # 결과 저장 (이벤트당 1회 집계 기록)
+        if self._event_storage and event.event_id:
+            await self._event_storage.mark_event_processed(
+                event.event_id, self._aggregate_results(event, event_type, tiers, results)
+            )
 
-        # 통계 업데이트
+        # 통계 업데이트 (이벤트 루프 스레드 전용 → 락 불필요)
         processing_time = (time.time() - start_time) * 1000
-        async with self._lock:
-            self._stats['events_processed'] += 1
-            self._stats['events_failed'] += failure_count
-            self._stats['processing_time_total'] += processing_time
+        self._stats['events_processed'] += 1
+        self._stats['events_failed'] += failure_count
+        self._stats['processing_time_total'] += processing_time
 
         self._logger.debug(
             f"이벤트 처리 완료: {event_type.__name__} "
@@ -293,6 +334,61 @@ class InMemoryEventBus(IEventBus):
             f"처리시간: {processing_time:.1f}ms, 워커: {worker_name})"
         )
 
+    async def _run_tier(self, event: DomainEvent, tier: Tuple[EventSubscription, ...],
+                        worker_name: str) -> List[EventProcessingResult]:
+        """같은 priority 계층의 핸들러 동시 실행 (즉시 끝난 핸들러는 대기 없이 수거)"""
+        tasks = [
+            _start_handler_task(self._invoke_subscription(event, subscription, worker_name))
+            for subscription in tier
+        ]
+        pending = [task for task in tasks if not task.done()]
+        if pending:
+            try:
+                await asyncio.wait(pending)
+            except asyncio.CancelledError:
+                for task in pending:
+                    task.cancel()
+                raise
+        return [task.result() for task in tasks]
+
+    async def _invoke_subscription(self, event: DomainEvent,
+                                   subscription: EventSubscription,
+                                   worker_name: str) -> EventProcessingResult:
+        """구독 하나 실행 + 실패 시 재시도 스케줄 (예외를 결과로 변환)"""
+        try:
+            result = await self._invoke_handler(event, subscription, worker_name)
+        except Exception as e:
+            error_msg = f"핸들러 호출 실패: {subscription.handler.__name__} - {e}"
+            self._logger.error(error_msg)
+            result = EventProcessingResult(
+                event_id=event.event_id or 'unknown',
+                success=False,
+                error_message=error_msg
+            )
+
+        if not result.success:
+            await self._handle_processing_failure(event, subscription, result)
+        return result
+
+    def _aggregate_results(self, event: DomainEvent, event_type: type, tiers: DispatchTiers,
+                           results: List[EventProcessingResult]) -> EventProcessingResult:
+        """핸들러별 결과를 이벤트 단위 처리 결과 하나로 집계"""
+        errors = [result.error_message for result in results if not result.success and result.error_message]
+        aggregated = EventProcessingResult(
+            event_id=event.event_id or 'unknown',
+            success=not errors and all(result.success for result in results),
+            error_message="; ".join(errors) if errors else None,
+            processing_time_ms=sum(result.processing_time_ms for result in results)
+        )
+        handler_names = self._handler_names.get(event_type)
+        if handler_names is None:
+            handler_names = ",".join(
+                getattr(subscription.handler, '__name__', 'handler') for tier in tiers for subscription in tier
+            )
+            self._handler_names[event_type] = handler_names
+        aggregated.handler_name = handler_names
+        return aggregated
+
     async def _invoke_handler(self, event: DomainEvent,
                               subscription: EventSubscription,
                               worker_name: str) -> EventProcessingResult:
@@ -301,7 +397,7 @@ class InMemoryEventBus(IEventBus):
 
         try:
             if subscription.is_async:
-                if asyncio.iscoroutinefunction(subscription.handler):
+                if subscription.is_coroutine:
                     await subscription.handler(event)
                 else:
                     # 동기 함수를 스레드풀에서 실행
@@ -1,5 +1,8 @@
+import asyncio
 import json
-from typing import List, Optional, Dict, Any
+import threading
+import time
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 import logging
 
@@ -9,114 +12,153 @@ from upbit_auto_trading.infrastructure.events.bus.event_bus_interface import (
 )
 from upbit_auto_trading.infrastructure.database.database_manager import DatabaseManager
 
-class SqliteEventStorage(IEventStorage):
-    """SQLite 기반 이벤트 저장소"""
+_COMPACT_JSON = (',', ':')
+
 
-    def __init__(self, db_manager: DatabaseManager):
+class SqliteEventStorage(IEventStorage):
+    """
+    SQLite 기반 이벤트 저장소 (append-only 이벤트 로그 + 그룹 커밋)
+
+    - store_event는 직렬화 후 쓰기 버퍼에 적재하고 즉시 반환
+    - flush_batch_size개가 쌓이거나 flush_interval_ms가 지나면 한 트랜잭션으로 일괄 기록
+    - 처리 완료 표시는 별도 마커 테이블에 같은 그룹 커밋으로 일괄 UPSERT
+    - 조회 메서드는 버퍼를 먼저 비워 방금 저장한 이벤트도 조회됨
+    - 프로세스 비정상 종료 시 마지막 flush_interval_ms 구간의 이벤트는 유실될 수 있음
+    """
+
+    def __init__(self, db_manager: DatabaseManager, db_name: str = 'strategies',
+                 flush_batch_size: int = 100, flush_interval_ms: float = 50.0):
         self._db = db_manager
+        self._db_name = db_name
+        self._flush_batch_size = flush_batch_size
+        self._flush_interval = flush_interval_ms / 1000.0
         self._logger = logging.getLogger(__name__)
+
+        # 쓰기 버퍼 (그룹 커밋 대상)
+        self._buffer_lock = threading.Lock()
+        self._pending_events: List[Tuple] = []
+        self._pending_markers: Dict[str, Tuple] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+        self._write_stats = {
+            'events_appended': 0,
+            'markers_written': 0,
+            'flush_count': 0,
+            'flush_time_total_ms': 0.0,
+        }
+
         self._ensure_tables()
 
     def _ensure_tables(self) -> None:
-        """이벤트 저장용 테이블 생성"""
-        create_events_table = """
-        CREATE TABLE IF NOT EXISTS event_store (
-            event_id TEXT PRIMARY KEY,
+        """이벤트 로그/처리 마커 테이블 생성"""
+        create_event_log_table = """
+        CREATE TABLE IF NOT EXISTS event_log (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_id TEXT NOT NULL UNIQUE,
             event_type TEXT NOT NULL,
             aggregate_id TEXT NOT NULL,
             aggregate_type TEXT NOT NULL,
-            event_data TEXT NOT NULL,
-            metadata TEXT,
             version INTEGER NOT NULL DEFAULT 1,
             occurred_at TIMESTAMP NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            is_processed BOOLEAN DEFAULT 0,
-            processed_at TIMESTAMP,
-            processing_result TEXT
+            payload TEXT NOT NULL
         )
         """
 
-        create_processing_log_table = """
-        CREATE TABLE IF NOT EXISTS event_processing_log (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            event_id TEXT NOT NULL,
-            handler_name TEXT NOT NULL,
+        create_markers_table = """
+        CREATE TABLE IF NOT EXISTS event_processing_markers (
+            event_id TEXT PRIMARY KEY,
             success BOOLEAN NOT NULL,
-            error_message TEXT,
-            processing_time_ms REAL,
-            retry_attempt INTEGER DEFAULT 0,
-            processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (event_id) REFERENCES event_store(event_id)
-        )
+            processed_at TIMESTAMP NOT NULL,
+            processing_result TEXT
+        ) WITHOUT ROWID
         """
 
         create_indexes = [
-            "CREATE INDEX IF NOT EXISTS idx_event_store_aggregate ON event_store(aggregate_id, aggregate_type)",
-            "CREATE INDEX IF NOT EXISTS idx_event_store_type ON event_store(event_type)",
-            "CREATE INDEX IF NOT EXISTS idx_event_store_occurred ON event_store(occurred_at)",
-            "CREATE INDEX IF NOT EXISTS idx_event_store_processed ON event_store(is_processed)",
-            "CREATE INDEX IF NOT EXISTS idx_processing_log_event ON event_processing_log(event_id)"
+            # 집합체 재생: (aggregate_id, aggregate_type) 검색 + seq 순서 그대로 스캔
+            "CREATE INDEX IF NOT EXISTS idx_event_log_aggregate ON event_log(aggregate_id, aggregate_type, seq)",
+            "CREATE INDEX IF NOT EXISTS idx_event_log_type ON event_log(event_type, seq)",
         ]
 
         try:
-            self._db.execute_command('strategies', create_events_table)
-            self._db.execute_command('strategies', create_processing_log_table)
+            self._db.execute_command(self._db_name, create_event_log_table)
+            self._db.execute_command(self._db_name, create_markers_table)
 
             for index_sql in create_indexes:
-                self._db.execute_command('strategies', index_sql)
+                self._db.execute_command(self._db_name, index_sql)
 
+            self._migrate_legacy_event_store()
             self._logger.info("이벤트 저장소 테이블 초기화 완료")
 
         except Exception as e:
             self._logger.error(f"이벤트 저장소 테이블 생성 실패: {e}")
             raise
 
-    async def store_event(self, event: DomainEvent) -> str:
-        """이벤트 저장"""
-        try:
-            # 이벤트 ID 생성 (없을 경우)
-            event_id = event.event_id
-            if not event_id:
-                import uuid
-                event_id = str(uuid.uuid4())
-
-            # 이벤트 데이터 직렬화
-            event_data = self._serialize_event(event)
-            metadata = self._serialize_metadata(event)
-
-            insert_query = """
-            INSERT INTO event_store (
-                event_id, event_type, aggregate_id, aggregate_type,
-                event_data, metadata, version, occurred_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """
+    def _migrate_legacy_event_store(self) -> None:
+        """기존 event_store 테이블 데이터를 이벤트 로그로 1회 이관 (원본 테이블은 보존)"""
+        legacy = self._db.execute_query(
+            self._db_name,
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'event_store'"
+        )
+        if not legacy:
+            return
 
-            params = (
-                event_id,
-                event.__class__.__name__,
-                event.aggregate_id,
-                getattr(event, 'aggregate_type', event.__class__.__name__),
-                event_data,
-                metadata,
-                event.version,
-                event.occurred_at.isoformat()
+        migrated = self._db.execute_query(self._db_name, "SELECT 1 FROM event_log LIMIT 1")
+        if migrated:
+            return
+
+        with self._db.get_connection(self._db_name) as conn:
+            conn.execute("""
+            INSERT OR IGNORE INTO event_log (
+                event_id, event_type, aggregate_id, aggregate_type, version, occurred_at, payload
             )
+            SELECT event_id, event_type, aggregate_id, aggregate_type, version, occurred_at,
+                   json_object('data', json(event_data), 'meta', json(COALESCE(metadata, '{}')))
+            FROM event_store
+            ORDER BY occurred_at ASC, version ASC
+            """)
+            conn.execute("""
+            INSERT OR IGNORE INTO event_processing_markers (event_id, success, processed_at, processing_result)
+            SELECT event_id, 1, processed_at, processing_result
+            FROM event_store
+            WHERE is_processed = 1
+            """)
 
-            self._db.execute_command('strategies', insert_query, params)
+        self._logger.info("기존 event_store 데이터를 이벤트 로그로 이관 완료")
 
-            self._logger.debug(f"이벤트 저장 완료: {event_id}")
+    async def store_event(self, event: DomainEvent) -> str:
+        """이벤트 저장 (쓰기 버퍼 적재, 그룹 커밋으로 기록)"""
+        try:
+            event_id = self._append_pending(event)
+            self._schedule_flush()
+            self._logger.debug(f"이벤트 저장 대기열 추가: {event_id}")
             return event_id
 
         except Exception as e:
             self._logger.error(f"이벤트 저장 실패: {e}")
             raise
 
+    async def store_events(self, events: List[DomainEvent]) -> List[str]:
+        """배치 이벤트 저장 (단일 그룹 커밋)"""
+        try:
+            event_ids = [self._append_pending(event, auto_flush=False) for event in events]
+            self._flush_pending()
+            return event_ids
+
+        except Exception as e:
+            self._logger.error(f"배치 이벤트 저장 실패: {e}")
+            raise
+
+    async def flush(self) -> None:
+        """버퍼링된 이벤트/마커 즉시 기록"""
+        self._flush_pending()
+
     async def get_event(self, event_id: str) -> Optional[DomainEvent]:
         """이벤트 조회"""
         try:
-            query = "SELECT * FROM event_store WHERE event_id = ?"
+            self._flush_pending()
+            query = "SELECT * FROM event_log WHERE event_id = ?"
 
-            rows = self._db.execute_query('strategies', query, (event_id,))
+            rows = self._db.execute_query(self._db_name, query, (event_id,))
 
             if not rows:
                 return None
@@ -129,15 +171,16 @@ class SqliteEventStorage(IEventStorage):
 
     async def get_events_by_aggregate(self, aggregate_id: str,
                                       aggregate_type: str) -> List[DomainEvent]:
-        """집합체별 이벤트 조회"""
+        """집합체별 이벤트 조회 (기록 순서 = seq 순서로 재생)"""
         try:
+            self._flush_pending()
             query = """
-            SELECT * FROM event_store
+            SELECT * FROM event_log
             WHERE aggregate_id = ? AND aggregate_type = ?
-            ORDER BY occurred_at ASC, version ASC
+            ORDER BY seq ASC
             """
 
-            rows = self._db.execute_query('strategies', query, (aggregate_id, aggregate_type))
+            rows = self._db.execute_query(self._db_name, query, (aggregate_id, aggregate_type))
 
             events = []
             for row in rows:
@@ -152,16 +195,18 @@ class SqliteEventStorage(IEventStorage):
             return []
 
     async def get_unprocessed_events(self, limit: int = 100) -> List[DomainEvent]:
-        """미처리 이벤트 조회"""
+        """미처리 이벤트 조회 (마커 없음 또는 처리 실패)"""
         try:
+            self._flush_pending()
             query = """
-            SELECT * FROM event_store
-            WHERE is_processed = 0
-            ORDER BY occurred_at ASC
+            SELECT l.* FROM event_log l
+            LEFT JOIN event_processing_markers m ON m.event_id = l.event_id
+            WHERE m.event_id IS NULL OR m.success = 0
+            ORDER BY l.seq ASC
             LIMIT ?
             """
 
-            rows = self._db.execute_query('strategies', query, (limit,))
+            rows = self._db.execute_query(self._db_name, query, (limit,))
 
             events = []
             for row in rows:
@@ -177,57 +222,122 @@ class SqliteEventStorage(IEventStorage):
 
     async def mark_event_processed(self, event_id: str,
                                    result: EventProcessingResult) -> None:
-        """이벤트 처리 완료 표시"""
+        """이벤트 처리 완료 표시 (마커 버퍼 적재, 그룹 커밋으로 일괄 UPSERT)"""
         try:
-            # 이벤트 상태 업데이트
-            update_query = """
-            UPDATE event_store
-            SET is_processed = ?, processed_at = ?, processing_result = ?
-            WHERE event_id = ?
-            """
-
             processing_result_json = json.dumps({
                 'success': result.success,
                 'error_message': result.error_message,
                 'processing_time_ms': result.processing_time_ms,
                 'retry_attempt': result.retry_attempt,
-                'processed_at': result.processed_at.isoformat()
-            })
-
-            self._db.execute_command('strategies', update_query, (
-                1 if result.success else 0,
-                result.processed_at.isoformat(),
-                processing_result_json,
-                event_id
-            ))
-
-            # 처리 로그 추가
-            log_query = """
-            INSERT INTO event_processing_log (
-                event_id, handler_name, success, error_message,
-                processing_time_ms, retry_attempt
-            ) VALUES (?, ?, ?, ?, ?, ?)
-            """
+                'handler_name': getattr(result, 'handler_name', 'unknown'),
+            }, separators=_COMPACT_JSON)
+
+            with self._buffer_lock:
+                # 같은 이벤트의 마커는 마지막 결과만 유지
+                self._pending_markers[event_id] = (
+                    event_id,
+                    1 if result.success else 0,
+                    result.processed_at.isoformat(),
+                    processing_result_json
+                )
+                should_flush = self._pending_size() >= self._flush_batch_size
+
+            if should_flush:
+                self._flush_pending()
+            else:
+                self._schedule_flush()
 
-            # 핸들러 이름은 결과에서 추출하거나 기본값 사용
-            handler_name = getattr(result, 'handler_name', 'unknown')
+        except Exception as e:
+            self._logger.error(f"이벤트 처리 상태 업데이트 실패 {event_id}: {e}")
 
-            self._db.execute_command('strategies', log_query, (
-                event_id,
-                handler_name,
-                result.success,
-                result.error_message,
-                result.processing_time_ms,
-                result.retry_attempt
-            ))
+    def _append_pending(self, event: DomainEvent, auto_flush: bool = True) -> str:
+        """이벤트 직렬화 후 버퍼 적재 (배치 크기 도달 시 즉시 기록)"""
+        # 이벤트 ID 생성 (없을 경우)
+        event_id = event.event_id
+        if not event_id:
+            import uuid
+            event_id = str(uuid.uuid4())
+
+        record = (
+            event_id,
+            event.__class__.__name__,
+            event.aggregate_id,
+            getattr(event, 'aggregate_type', event.__class__.__name__),
+            event.version,
+            event.occurred_at.isoformat(),
+            self._serialize_payload(event)
+        )
 
-            self._logger.debug(f"이벤트 처리 상태 업데이트: {event_id} - {result.success}")
+        with self._buffer_lock:
+            self._pending_events.append(record)
+            should_flush = auto_flush and self._pending_size() >= self._flush_batch_size
 
-        except Exception as e:
-            self._logger.error(f"이벤트 처리 상태 업데이트 실패 {event_id}: {e}")
+        if should_flush:
+            self._flush_pending()
+        return event_id
 
-    def _serialize_event(self, event: DomainEvent) -> str:
-        """이벤트 직렬화"""
+    def _pending_size(self) -> int:
+        return len(self._pending_events) + len(self._pending_markers)
+
+    def _schedule_flush(self) -> None:
+        """flush_interval 후 기록 예약 (이미 예약되어 있으면 유지)"""
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_pending()
+            return
+        self._flush_handle = loop.call_later(self._flush_interval, self._flush_pending)
+
+    def _flush_pending(self) -> None:
+        """그룹 커밋: 버퍼의 이벤트와 마커를 한 트랜잭션으로 기록"""
+        with self._buffer_lock:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            events, self._pending_events = self._pending_events, []
+            markers, self._pending_markers = list(self._pending_markers.values()), {}
+
+        if not events and not markers:
+            return
+
+        start_time = time.perf_counter()
+        try:
+            with self._db.get_connection(self._db_name) as conn:
+                if events:
+                    conn.executemany("""
+                    INSERT OR IGNORE INTO event_log (
+                        event_id, event_type, aggregate_id, aggregate_type,
+                        version, occurred_at, payload
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """, events)
+                if markers:
+                    conn.executemany("""
+                    INSERT INTO event_processing_markers (event_id, success, processed_at, processing_result)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(event_id) DO UPDATE SET
+                        success = excluded.success,
+                        processed_at = excluded.processed_at,
+                        processing_result = excluded.processing_result
+                    """, markers)
+
+        except Exception as e:
+            self._logger.error(f"이벤트 그룹 커밋 실패 (이벤트 {len(events)}개, 마커 {len(markers)}개): {e}")
+            # 다음 flush에서 재시도 (순서 유지를 위해 앞쪽에 복원)
+            with self._buffer_lock:
+                self._pending_events[:0] = events
+                for marker in markers:
+                    self._pending_markers.setdefault(marker[0], marker)
+            return
+
+        self._write_stats['events_appended'] += len(events)
+        self._write_stats['markers_written'] += len(markers)
+        self._write_stats['flush_count'] += 1
+        self._write_stats['flush_time_total_ms'] += (time.perf_counter() - start_time) * 1000
+
+    def _serialize_event(self, event: DomainEvent) -> Dict[str, Any]:
+        """이벤트 속성 추출 (공개 속성만)"""
         try:
             # 이벤트 속성을 딕셔너리로 변환
             event_dict = {}
@@ -241,32 +351,33 @@ class SqliteEventStorage(IEventStorage):
                     else:
                         event_dict[key] = value
 
-            return json.dumps(event_dict, default=str)
+            return event_dict
 
         except Exception as e:
             self._logger.error(f"이벤트 직렬화 실패: {e}")
-            return "{}"
-
-    def _serialize_metadata(self, event: DomainEvent) -> str:
-        """메타데이터 직렬화"""
-        try:
-            metadata = {
-                'event_class': event.__class__.__module__ + '.' + event.__class__.__name__,
-                'serialized_at': datetime.now().isoformat(),
-                'version': getattr(event, 'schema_version', 1)
-            }
-
-            return json.dumps(metadata)
+            return {}
 
-        except Exception as e:
-            self._logger.error(f"메타데이터 직렬화 실패: {e}")
-            return "{}"
+    def _serialize_metadata(self, event: DomainEvent) -> Dict[str, Any]:
+        """메타데이터 추출"""
+        return {
+            'event_class': event.__class__.__module__ + '.' + event.__class__.__name__,
+            'version': getattr(event, 'schema_version', 1)
+        }
+
+    def _serialize_payload(self, event: DomainEvent) -> str:
+        """페이로드 직렬화 (한 줄짜리 compact JSON: {"data": ..., "meta": ...})"""
+        return json.dumps(
+            {'data': self._serialize_event(event), 'meta': self._serialize_metadata(event)},
+            separators=_COMPACT_JSON,
+            default=str
+        )
 
     def _deserialize_event(self, event_row: Dict[str, Any]) -> Optional[DomainEvent]:
         """이벤트 역직렬화"""
         try:
-            event_data = json.loads(event_row['event_data'])
-            metadata = json.loads(event_row.get('metadata', '{}'))
+            payload = json.loads(event_row['payload'])
+            event_data = payload.get('data') or {}
+            metadata = payload.get('meta') or {}
 
             # 이벤트 클래스 동적 로드
             event_class = self._get_event_class(event_row['event_type'], metadata)
@@ -275,18 +386,18 @@ class SqliteEventStorage(IEventStorage):
                 self._logger.warning(f"이벤트 클래스를 찾을 수 없음: {event_row['event_type']}")
                 return None
 
-            # 이벤트 객체 재구성
+            # 이벤트 객체 재구성 (frozen dataclass 대응)
             event = event_class.__new__(event_class)
 
             # 기본 속성 설정
-            event._event_id = event_row['event_id']
-            event._occurred_at = datetime.fromisoformat(event_row['occurred_at'])
-            event._version = event_row['version']
+            object.__setattr__(event, '_event_id', event_row['event_id'])
+            object.__setattr__(event, '_occurred_at', datetime.fromisoformat(event_row['occurred_at']))
+            object.__setattr__(event, '_version', event_row['version'])
 
             # 이벤트 데이터 복원
             for key, value in event_data.items():
                 if key not in ['_event_id', '_occurred_at', '_version']:
-                    setattr(event, key, value)
+                    object.__setattr__(event, key, value)
 
             return event
 
@@ -316,19 +427,21 @@ class SqliteEventStorage(IEventStorage):
     async def get_event_statistics(self) -> Dict[str, Any]:
         """이벤트 저장소 통계"""
         try:
+            self._flush_pending()
             stats_query = """
             SELECT
                 COUNT(*) as total_events,
-                COUNT(CASE WHEN is_processed = 1 THEN 1 END) as processed_events,
-                COUNT(CASE WHEN is_processed = 0 THEN 1 END) as unprocessed_events,
-                COUNT(DISTINCT event_type) as unique_event_types,
-                COUNT(DISTINCT aggregate_id) as unique_aggregates,
-                MIN(occurred_at) as earliest_event,
-                MAX(occurred_at) as latest_event
-            FROM event_store
+                COUNT(CASE WHEN m.success = 1 THEN 1 END) as processed_events,
+                COUNT(CASE WHEN m.event_id IS NULL OR m.success = 0 THEN 1 END) as unprocessed_events,
+                COUNT(DISTINCT l.event_type) as unique_event_types,
+                COUNT(DISTINCT l.aggregate_id) as unique_aggregates,
+                MIN(l.occurred_at) as earliest_event,
+                MAX(l.occurred_at) as latest_event
+            FROM event_log l
+            LEFT JOIN event_processing_markers m ON m.event_id = l.event_id
             """
 
-            rows = self._db.execute_query('strategies', stats_query)
+            rows = self._db.execute_query(self._db_name, stats_query)
 
             if rows:
                 stats = dict(rows[0])
@@ -336,13 +449,14 @@ class SqliteEventStorage(IEventStorage):
                 # 이벤트 타입별 통계
                 type_query = """
                 SELECT event_type, COUNT(*) as count
-                FROM event_store
+                FROM event_log
                 GROUP BY event_type
                 ORDER BY count DESC
                 """
 
-                type_rows = self._db.execute_query('strategies', type_query)
+                type_rows = self._db.execute_query(self._db_name, type_query)
                 stats['event_types'] = [dict(row) for row in type_rows]
+                stats['write_stats'] = dict(self._write_stats)
 
                 return stats
 
@@ -0,0 +1,852 @@
+"""
+업비트 로컬 모의 거래소 (페이퍼 트레이딩) - 가격-시간 우선 매칭 엔진
+
+네트워크 없이 UpbitPrivateClient 가 사용하는 프라이빗 엔드포인트 전체를 처리합니다.
+실시간(WebSocket) 또는 재생(리플레이) 호가/체결 스트림을 받아 주문을 체결합니다.
+
+지원 엔드포인트 (UpbitPrivateClient 기준):
+- GET /accounts, GET /orders/chance
+- POST /orders  (limit / price / market / best, time_in_force ioc·fok)
+- GET /order, GET /orders, GET /orders/open, GET /orders/closed
+- DELETE /order, DELETE /orders/uuids, DELETE /orders/open
+
+체결 규칙:
+- 신규 주문: 최근 호가 스냅샷의 상대 호가를 가격 순으로 소진하며 즉시 체결 (테이커, 호가 가격)
+  - 한 번 소진한 호가 잔량은 다음 스냅샷이 올 때까지 다시 쓰지 않음
+  - 남은 지정가 수량은 대기 (ioc 는 취소, fok 는 전량 체결 불가 시 체결 없이 취소)
+- 대기 주문: 가격 우선 → 같은 가격은 접수 순 (시간 우선), 체결 가격은 주문 가격 (메이커)
+  - 매도 테이커 체결(ask_bid='ASK')은 매수 대기 주문, 매수 테이커 체결('BID')은 매도 대기 주문과 체결
+  - 주문 가격과 같은 가격의 체결은 접수 시점에 앞서 있던 외부 호가 잔량을 먼저 소진한 뒤 체결
+  - 호가 스냅샷이 주문 가격을 넘어서면(교차) 넘어선 호가 잔량만큼 체결
+- 내 주문끼리는 체결하지 않음 (외부 유동성과만 체결)
+- KRW 마켓 호가 단위(price_utils.get_tick_size), 마켓별 수수료 / 최소 주문 금액 검증
+- 계좌: 주문 시 잠금(locked) → 체결 시 정산 → 종료(done/cancel) 시 남은 잠금 해제, 평균 매수가 갱신
+
+성능:
+- 이벤트 경로는 마켓 dict 조회 + 내 최우선 대기 가격(float) 비교뿐, 교차할 때만 Decimal 정산
+- 마켓별 가격 레벨 정렬 목록(bisect) + 레벨별 FIFO 큐
+
+사용 예시:
+    exchange = PaperExchange(PaperExchangeConfig(initial_balances={'KRW': Decimal('10000000')}))
+    client = UpbitPrivateClient(dry_run=True, paper_exchange=exchange)
+
+    exchange.on_orderbook('KRW-BTC', orderbook_units)             # 호가 수신 (WebSocket / REST / 리플레이)
+    await client.place_order('KRW-BTC', 'bid', 'limit', volume=Decimal('0.001'), price=Decimal('50000000'))
+    exchange.on_trade('KRW-BTC', 50_000_000.0, 0.01, 'ASK')        # 체결 수신 → 대기 주문 체결
+    accounts = await client.get_accounts()
+"""
+
+import bisect
+import json
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from decimal import ROUND_DOWN, Context, Decimal, localcontext
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from upbit_auto_trading.domain.market.price_utils import get_tick_size
+from upbit_auto_trading.infrastructure.logging import create_component_logger
+
+KST = timezone(timedelta(hours=9))
+ZERO = Decimal('0')
+VOLUME_UNIT = Decimal('0.00000001')  # 업비트 주문 수량 최소 단위 (소수 8자리)
+BTC_TICK = Decimal('0.00000001')
+INF = float('inf')
+TICK_CACHE_SIZE = 4096
+
+# price_utils 가 전역 Decimal 정밀도를 16자리로 낮추므로 잔고 정산은 별도 컨텍스트에서 수행
+_DECIMAL_CONTEXT = Context(prec=34)
+
+DEFAULT_FEE_RATES = {'KRW': Decimal('0.0005'), 'BTC': Decimal('0.0025'), 'USDT': Decimal('0.0025')}
+DEFAULT_MIN_TOTALS = {'KRW': Decimal('5000'), 'BTC': Decimal('0.00005'), 'USDT': Decimal('0.5')}
+
+ORDER_TYPES = ('limit', 'price', 'market', 'best')
+TIME_IN_FORCE = ('ioc', 'fok')
+
+
+def _now_kst() -> datetime:
+    return datetime.now(KST)
+
+
+def _dec(value: Any) -> Decimal:
+    return value if isinstance(value, Decimal) else Decimal(repr(value) if isinstance(value, float) else str(value))
+
+
+def _fmt(value: Optional[Decimal]) -> Optional[str]:
+    if value is None:
+        return None
+    text = format(value.normalize(), 'f')
+    return text if '.' in text else f"{text}.0"
+
+
+def _split(value: Any) -> List[str]:
+    """쿼리 목록 파라미터 (리스트 또는 콤마 구분 문자열)"""
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [item for item in value.split(',') if item]
+    return list(value)
+
+
+class PaperExchangeError(Exception):
+    """업비트 오류 응답과 같은 형식의 모의 거래소 오류 (클라이언트 'API 오류 (상태: ...)' 메시지와 동일)"""
+
+    def __init__(self, status: int, name: str, message: str):
+        self.status = status
+        self.name = name
+        self.message = message
+        body = json.dumps({'error': {'name': name, 'message': message}}, ensure_ascii=False)
+        super().__init__(f"API 오류 (상태: {status}): {body}")
+
+
+@dataclass
+class PaperExchangeConfig:
+    """모의 거래소 설정"""
+    initial_balances: Dict[str, Decimal] = field(default_factory=lambda: {'KRW': Decimal('10000000')})
+    fee_rates: Dict[str, Decimal] = field(default_factory=lambda: dict(DEFAULT_FEE_RATES))  # 기준 통화별
+    min_totals: Dict[str, Decimal] = field(default_factory=lambda: dict(DEFAULT_MIN_TOTALS))
+    default_fee_rate: Decimal = Decimal('0.0025')
+    enforce_tick_size: bool = True
+    clock: Callable[[], datetime] = _now_kst  # 리플레이 시 재생 시각으로 교체
+
+
+@dataclass
+class PaperAccount:
+    """통화별 모의 계좌"""
+    currency: str
+    balance: Decimal = ZERO
+    locked: Decimal = ZERO
+    avg_buy_price: Decimal = ZERO
+    unit_currency: str = 'KRW'
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'currency': self.currency,
+            'balance': _fmt(self.balance),
+            'locked': _fmt(self.locked),
+            'avg_buy_price': _fmt(self.avg_buy_price),
+            'avg_buy_price_modified': False,
+            'unit_currency': self.unit_currency,
+        }
+
+
+@dataclass(eq=False)
+class PaperOrder:
+    """모의 주문 (업비트 주문 응답 필드 기준)"""
+    uuid: str
+    market: str
+    side: str
+    ord_type: str
+    price: Optional[Decimal]   # 지정가: 주문 가격 / 시장가·최유리 매수: 주문 총액
+    volume: Optional[Decimal]
+    created_at: datetime
+    seq: int
+    identifier: Optional[str] = None
+    time_in_force: Optional[str] = None
+    state: str = 'wait'
+    remaining_volume: Optional[Decimal] = None
+    remaining_funds: Optional[Decimal] = None  # 총액 기준 주문(시장가/최유리 매수)의 남은 금액
+    executed_volume: Decimal = ZERO
+    executed_funds: Decimal = ZERO
+    reserved_fee: Decimal = ZERO
+    paid_fee: Decimal = ZERO
+    locked: Decimal = ZERO
+    queue_ahead: Decimal = ZERO  # 같은 가격에 먼저 대기 중이던 외부 호가 잔량
+    trades: List[Dict[str, Any]] = field(default_factory=list)
+    done_at: Optional[datetime] = None
+
+    def to_dict(self, include_trades: bool = False) -> Dict[str, Any]:
+        data = {
+            'uuid': self.uuid,
+            'side': self.side,
+            'ord_type': self.ord_type,
+            'price': _fmt(self.price),
+            'state': self.state,
+            'market': self.market,
+            'created_at': self.created_at.isoformat(),
+            'volume': _fmt(self.volume),
+            'remaining_volume': _fmt(self.remaining_volume),
+            'reserved_fee': _fmt(self.reserved_fee),
+            'remaining_fee': _fmt(max(ZERO, self.reserved_fee - self.paid_fee) if self.state == 'wait' else ZERO),
+            'paid_fee': _fmt(self.paid_fee),
+            'locked': _fmt(self.locked),
+            'executed_volume': _fmt(self.executed_volume),
+            'executed_funds': _fmt(self.executed_funds),
+            'trades_count': len(self.trades),
+        }
+        if self.identifier is not None:
+            data['identifier'] = self.identifier
+        if self.time_in_force is not None:
+            data['time_in_force'] = self.time_in_force
+        if include_trades:
+            data['trades'] = list(self.trades)
+        return data
+
+
+class _MarketBook:
+    """마켓별 대기 주문 가격 레벨 + 최근 외부 호가 스냅샷"""
+
+    __slots__ = ('market', 'quote', 'base', 'fee_rate', 'min_total', 'bid_levels', 'ask_levels',
+                 'bid_prices', 'ask_prices', 'best_bid', 'best_ask', 'book_asks', 'book_bids', 'consumed')
+
+    def __init__(self, market: str, fee_rate: Decimal, min_total: Decimal):
+        self.market = market
+        self.quote, self.base = market.split('-', 1)
+        self.fee_rate = fee_rate
+        self.min_total = min_total
+        self.bid_levels: Dict[Decimal, Deque[PaperOrder]] = {}
+        self.ask_levels: Dict[Decimal, Deque[PaperOrder]] = {}
+        self.bid_prices: List[Decimal] = []  # 오름차순 (최우선 = 마지막)
+        self.ask_prices: List[Decimal] = []  # 오름차순 (최우선 = 처음)
+        self.best_bid = -INF
+        self.best_ask = INF
+        self.book_asks: List[Tuple[float, float]] = []  # 외부 매도 호가 (가격 오름차순)
+        self.book_bids: List[Tuple[float, float]] = []  # 외부 매수 호가 (가격 내림차순)
+        self.consumed: Dict[float, float] = {}          # 이번 스냅샷에서 이미 소진한 호가 잔량
+
+    def _side(self, side: str) -> Tuple[Dict[Decimal, Deque[PaperOrder]], List[Decimal]]:
+        """매수/매도 쪽 (가격별 대기열, 정렬된 가격 목록)"""
+        if side == 'bid':
+            return self.bid_levels, self.bid_prices
+        return self.ask_levels, self.ask_prices
+
+    def rest(self, order: PaperOrder) -> None:
+        levels, prices = self._side(order.side)
+        queue = levels.get(order.price)
+        if queue is None:
+            queue = levels[order.price] = deque()
+            bisect.insort(prices, order.price)
+            self._refresh_best(order.side)
+        queue.append(order)
+
+    def remove(self, order: PaperOrder) -> None:
+        levels, prices = self._side(order.side)
+        queue = levels.get(order.price)
+        if queue is None:
+            return
+        try:
+            queue.remove(order)
+        except ValueError:
+            return
+        if not queue:
+            del levels[order.price]
+            del prices[bisect.bisect_left(prices, order.price)]
+            self._refresh_best(order.side)
+
+    def _refresh_best(self, side: str) -> None:
+        if side == 'bid':
+            self.best_bid = float(self.bid_prices[-1]) if self.bid_prices else -INF
+        else:
+            self.best_ask = float(self.ask_prices[0]) if self.ask_prices else INF
+
+    def crossing_prices(self, side: str, price: Decimal) -> List[Decimal]:
+        """price 와 교차하는 내 대기 가격 (최우선부터)"""
+        if side == 'bid':
+            return self.bid_prices[bisect.bisect_left(self.bid_prices, price):][::-1]
+        return self.ask_prices[:bisect.bisect_right(self.ask_prices, price)]
+
+    def external_size(self, side: str, price: Decimal) -> Optional[Decimal]:
+        """같은 쪽 외부 호가의 해당 가격 잔량 (스냅샷에 없으면 None)"""
+        target = float(price)
+        for level_price, size in (self.book_bids if side == 'bid' else self.book_asks):
+            if level_price == target:
+                return _dec(size)
+        return None
+
+    def resting_count(self) -> int:
+        return sum(len(queue) for queue in self.bid_levels.values()) + sum(
+            len(queue) for queue in self.ask_levels.values())
+
+
+class PaperExchange:
+    """
+    로컬 페이퍼 트레이딩 거래소
+
+    - 시세 입력: on_orderbook (호가 스냅샷), on_trade (체결), replay (기록된 이벤트 재생)
+    - 주문/계좌: handle_request 가 업비트 프라이빗 REST 요청을 같은 형식의 응답으로 처리
+    """
+
+    def __init__(self, config: Optional[PaperExchangeConfig] = None):
+        self.config = config or PaperExchangeConfig()
+        self._logger = create_component_logger("PaperExchange")
+
+        self._books: Dict[str, _MarketBook] = {}
+        self._accounts: Dict[str, PaperAccount] = {}
+        self._orders: Dict[str, PaperOrder] = {}
+        self._by_identifier: Dict[str, PaperOrder] = {}
+        self._open: Dict[str, PaperOrder] = {}  # 대기 주문 (접수 순)
+        self._tick_sizes: Dict[Decimal, Decimal] = {}
+        self._seq = 0
+
+        self.stats = {
+            'orderbook_events': 0,
+            'trade_events': 0,
+            'orders_placed': 0,
+            'orders_rejected': 0,
+            'orders_cancelled': 0,
+            'fills': 0,
+        }
+
+        for currency, balance in self.config.initial_balances.items():
+            self._account(currency).balance = _dec(balance)
+
+        self._routes: Dict[Tuple[str, str], Callable[[Dict[str, Any]], Any]] = {
+            ('GET', '/accounts'): lambda query: self.get_accounts(),
+            ('GET', '/orders/chance'): lambda query: self.get_order_chance(query.get('market', '')),
+            ('POST', '/orders'): self.place_order,
+            ('GET', '/order'): lambda query: self.get_order(query.get('uuid'), query.get('identifier')),
+            ('GET', '/orders'): self._query_orders,
+            ('GET', '/orders/open'): self._query_open_orders,
+            ('GET', '/orders/closed'): self._query_closed_orders,
+            ('DELETE', '/order'): lambda query: self.cancel_order(query.get('uuid'), query.get('identifier')),
+            ('DELETE', '/orders/uuids'): self._cancel_by_ids,
+            ('DELETE', '/orders/open'): self._cancel_open,
+        }
+
+        self._logger.info(f"📒 페이퍼 트레이딩 거래소 초기화 (초기 잔고: "
+                          f"{ {k: _fmt(v.balance) for k, v in self._accounts.items()} })")
+
+    # ==================== 요청 라우팅 ====================
+
+    def handle_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                       data: Optional[Dict[str, Any]] = None) -> Any:
+        """프라이빗 REST 요청 처리 (UpbitPrivateClient._make_request 대체)"""
+        route = self._routes.get((method, endpoint))
+        if route is None:
+            raise PaperExchangeError(404, 'not_found', f"지원하지 않는 엔드포인트입니다: {method} {endpoint}")
+        query = dict(params or {})
+        if data:
+            query.update(data)
+        return route(query)
+
+    # ==================== 시세 입력 ====================
+
+    def on_orderbook(self, market: str, units: Sequence[Dict[str, Any]]) -> int:
+        """
+        호가 스냅샷 수신 (업비트 orderbook_units 형식: ask_price / bid_price / ask_size / bid_size)
+
+        Returns:
+            int: 이 스냅샷으로 체결된 대기 주문 체결 건수
+        """
+        self.stats['orderbook_events'] += 1
+        book = self._books.get(market) or self._book(market)
+        book.book_asks = [(float(unit['ask_price']), float(unit['ask_size'])) for unit in units]
+        book.book_bids = [(float(unit['bid_price']), float(unit['bid_size'])) for unit in units]
+        if book.consumed:
+            book.consumed = {}
+
+        fills = 0
+        if book.book_asks and book.best_bid >= book.book_asks[0][0]:
+            fills += self._cross_resting(book, 'bid')
+        if book.book_bids and book.best_ask <= book.book_bids[0][0]:
+            fills += self._cross_resting(book, 'ask')
+        return fills
+
+    def on_trade(self, market: str, price: float, volume: float, ask_bid: str) -> int:
+        """
+        체결 수신 (업비트 체결: trade_price / trade_volume / ask_bid)
+
+        Returns:
+            int: 이 체결로 체결된 대기 주문 체결 건수
+        """
+        self.stats['trade_events'] += 1
+        book = self._books.get(market)
+        if book is None:
+            return 0
+        if ask_bid == 'ASK':
+            if book.best_bid < price:
+                return 0
+            return self._fill_from_trade(book, 'bid', price, volume)
+        if book.best_ask > price:
+            return 0
+        return self._fill_from_trade(book, 'ask', price, volume)
+
+    def replay(self, events: Iterable[Tuple[str, str, Any]]) -> int:
+        """
+        기록된 이벤트 재생 - ('orderbook', market, units) / ('trade', market, (price, volume, ask_bid))
+
+        Returns:
+            int: 재생 중 발생한 대기 주문 체결 건수
+        """
+        fills = 0
+        for kind, market, payload in events:
+            if kind == 'orderbook':
+                fills += self.on_orderbook(market, payload)
+            elif kind == 'trade':
+                fills += self.on_trade(market, *payload)
+        return fills
+
+    # ==================== 주문 ====================
+
+    def place_order(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """POST /orders - 검증 → 잔고 잠금 → 즉시 체결 → 남은 지정가 수량 대기"""
+        try:
+            with localcontext(_DECIMAL_CONTEXT):
+                order, book = self._accept_order(data)
+                exhausted = self._take(book, order)
+                if order.state == 'wait':
+                    self._settle_new_order(book, order, exhausted)
+                return order.to_dict()
+        except PaperExchangeError:
+            self.stats['orders_rejected'] += 1
+            raise
+
+    def _accept_order(self, data: Dict[str, Any]) -> Tuple[PaperOrder, _MarketBook]:
+        market = data.get('market') or ''
+        side = data.get('side')
+        ord_type = data.get('ord_type')
+        time_in_force = data.get('time_in_force')
+        identifier = data.get('identifier')
+        if '-' not in market:
+            raise PaperExchangeError(400, 'invalid_market', f"마켓 코드 오류: {market}")
+        if side not in ('bid', 'ask'):
+            raise PaperExchangeError(400, 'invalid_side', f"주문 종류 오류: {side}")
+        if ord_type not in ORDER_TYPES:
+            raise PaperExchangeError(400, 'invalid_ord_type', f"주문 타입 오류: {ord_type}")
+        if time_in_force is not None and time_in_force not in TIME_IN_FORCE:
+            raise PaperExchangeError(400, 'invalid_time_in_force', f"time_in_force 오류: {time_in_force}")
+        if ord_type == 'best' and time_in_force is None:
+            raise PaperExchangeError(400, 'invalid_time_in_force', "최유리 주문은 ioc 또는 fok 가 필요합니다")
+        if identifier is not None and identifier in self._by_identifier:
+            raise PaperExchangeError(400, 'duplicated_identifier', f"identifier 중복: {identifier}")
+
+        price = _dec(data['price']) if data.get('price') is not None else None
+        volume = _dec(data['volume']) if data.get('volume') is not None else None
+        funds_based = side == 'bid' and ord_type in ('price', 'best')
+        needs_price = ord_type == 'limit' or funds_based
+        needs_volume = ord_type == 'limit' or (side == 'ask' and ord_type in ('market', 'best'))
+        if (ord_type == 'price' and side != 'bid') or (ord_type == 'market' and side != 'ask'):
+            raise PaperExchangeError(400, 'invalid_ord_type', f"{ord_type} 주문은 {side} 로 사용할 수 없습니다")
+        if needs_price and (price is None or price <= 0):
+            raise PaperExchangeError(400, f'invalid_price_{side}', "주문 가격(총액)이 필요합니다")
+        if needs_volume and (volume is None or volume <= 0):
+            raise PaperExchangeError(400, f'invalid_volume_{side}', "주문 수량이 필요합니다")
+        if needs_volume and volume != volume.quantize(VOLUME_UNIT, rounding=ROUND_DOWN):
+            raise PaperExchangeError(400, f'invalid_volume_{side}', "주문 수량은 소수점 8자리까지 가능합니다")
+
+        book = self._books.get(market) or self._book(market)
+        if ord_type == 'limit':
+            self._check_tick(book, side, price)
+
+        # 최소 주문 금액 (시장가 매도는 최우선 매수 호가 기준 추정)
+        if ord_type == 'limit':
+            total = price * volume
+        elif funds_based:
+            total = price
+        else:
+            total = volume * _dec(book.book_bids[0][0]) if book.book_bids else None
+        if total is not None and total < book.min_total:
+            raise PaperExchangeError(400, f'under_min_total_{side}',
+                                     f"최소주문금액 이상으로 주문해주세요 ({_fmt(book.min_total)} {book.quote})")
+
+        # 잔고 잠금 (매수: 금액 + 수수료, 매도: 수량)
+        if side == 'bid':
+            funds = price * volume if ord_type == 'limit' else price
+            reserved_fee = funds * book.fee_rate
+            lock, account = funds + reserved_fee, self._account(book.quote)
+        else:
+            reserved_fee = ZERO
+            lock, account = volume, self._account(book.base)
+        if account.balance < lock:
+            raise PaperExchangeError(400, f'insufficient_funds_{side}',
+                                     f"주문가능한 금액({account.currency})이 부족합니다.")
+        account.balance -= lock
+        account.locked += lock
+
+        self._seq += 1
+        order = PaperOrder(
+            uuid=str(uuid.uuid4()), market=market, side=side, ord_type=ord_type, price=price,
+            volume=None if funds_based else volume, created_at=self.config.clock(), seq=self._seq,
+            identifier=identifier, time_in_force=time_in_force,
+            remaining_volume=None if funds_based else volume,
+            remaining_funds=price if funds_based else None,
+            reserved_fee=reserved_fee, locked=lock
+        )
+        self._orders[order.uuid] = order
+        if identifier is not None:
+            self._by_identifier[identifier] = order
+        self.stats['orders_placed'] += 1
+        return order, book
+
+    def _check_tick(self, book: _MarketBook, side: str, price: Decimal) -> None:
+        if not self.config.enforce_tick_size:
+            return
+        if book.quote == 'KRW':
+            tick = self._tick_sizes.get(price)
+            if tick is None:
+                if len(self._tick_sizes) >= TICK_CACHE_SIZE:
+                    self._tick_sizes.clear()
+                tick = self._tick_sizes[price] = get_tick_size(price)  # log10 계산 비용 → 가격별 캐시
+        elif book.quote == 'BTC':
+            tick = BTC_TICK
+        else:
+            return
+        if price % tick != 0:
+            raise PaperExchangeError(400, f'invalid_price_{side}',
+                                     f"주문가격 단위를 잘못 입력하셨습니다. (호가 단위 {_fmt(tick)})")
+
+    def _settle_new_order(self, book: _MarketBook, order: PaperOrder, exhausted: bool) -> None:
+        """즉시 체결 후 남은 주문 처리 - 지정가(GTC)는 대기, 나머지는 종료"""
+        if order.ord_type == 'limit' and order.time_in_force is None:
+            order.queue_ahead = book.external_size(order.side, order.price) or ZERO
+            book.rest(order)
+            self._open[order.uuid] = order
+            return
+        # 시장가/최유리/IOC/FOK: 주문 금액(수량)을 다 쓰면 done, 유동성 부족으로 남으면 cancel
+        self._finish(book, order, 'done' if exhausted and order.executed_volume > 0 else 'cancel')
+
+    def cancel_order(self, uuid: Optional[str] = None, identifier: Optional[str] = None) -> Dict[str, Any]:
+        """DELETE /order"""
+        order = self._find(uuid, identifier)
+        if order.state != 'wait':
+            raise PaperExchangeError(400, f'{order.state}_order', f"이미 종료된 주문입니다 ({order.state})")
+        with localcontext(_DECIMAL_CONTEXT):
+            self._finish(self._books[order.market], order, 'cancel')
+        self.stats['orders_cancelled'] += 1
+        return order.to_dict()
+
+    # ==================== 매칭 ====================
+
+    def _take(self, book: _MarketBook, order: PaperOrder) -> bool:
+        """
+        신규 주문을 외부 호가와 즉시 체결 (테이커, 호가 가격)
+
+        Returns:
+            bool: 주문 수량/금액을 모두 소진했는지 (False = 호가 유동성 부족)
+        """
+        is_bid = order.side == 'bid'
+        levels = book.book_asks if is_bid else book.book_bids
+        if not levels:
+            return False
+        if order.ord_type == 'limit':
+            limit = float(order.price)
+        elif order.ord_type == 'best':
+            limit = levels[0][0]  # 최유리: 상대 최우선 호가 한 단계만
+        else:
+            limit = None
+        if order.time_in_force == 'fok' and not self._can_fill(book, order, levels, limit):
+            return False
+
+        consumed = book.consumed
+        for level_price_f, size_f in levels:
+            if limit is not None and (level_price_f > limit if is_bid else level_price_f < limit):
+                break
+            available = size_f - consumed.get(level_price_f, 0.0)
+            if available <= 0:
+                continue
+            level_price = _dec(level_price_f)
+            if order.remaining_funds is not None:
+                volume = min(_dec(available), order.remaining_funds / level_price)
+            else:
+                volume = min(_dec(available), order.remaining_volume)
+            volume = volume.quantize(VOLUME_UNIT, rounding=ROUND_DOWN)
+            if volume <= 0:
+                return True  # 남은 금액으로 최소 수량도 살 수 없음
+            consumed[level_price_f] = consumed.get(level_price_f, 0.0) + float(volume)
+            self._execute(book, order, level_price, volume)
+            if order.state != 'wait':
+                return True
+        return False
+
+    @staticmethod
+    def _can_fill(book: _MarketBook, order: PaperOrder, levels: List[Tuple[float, float]],
+                  limit: Optional[float]) -> bool:
+        """FOK 사전 확인 - 허용 가격 안의 호가 잔량으로 전량 체결 가능한지"""
+        is_bid = order.side == 'bid'
+        target = float(order.remaining_funds if order.remaining_funds is not None else order.remaining_volume)
+        filled = 0.0
+        for level_price, size in levels:
+            if limit is not None and (level_price > limit if is_bid else level_price < limit):
+                break
+            available = size - book.consumed.get(level_price, 0.0)
+            if available > 0:
+                filled += available * level_price if order.remaining_funds is not None else available
+                if filled >= target:
+                    return True
+        return False
+
+    def _fill_from_trade(self, book: _MarketBook, side: str, price: float, volume: float) -> int:
+        """체결 스트림으로 대기 주문 체결 (가격 우선 → 시간 우선)"""
+        with localcontext(_DECIMAL_CONTEXT):
+            trade_price = _dec(price)
+            budget = _dec(volume)
+            levels = book.bid_levels if side == 'bid' else book.ask_levels
+            fills = 0
+            for level_price in book.crossing_prices(side, trade_price):
+                queue = levels.get(level_price)
+                if queue is None:
+                    continue
+                if level_price == trade_price:
+                    budget, count = self._fill_at_trade_price(book, side, queue, level_price, budget)
+                else:
+                    budget, count = self._fill_queue(book, queue, level_price, budget)
+                fills += count
+                if budget <= 0:
+                    break
+            return fills
+
+    def _fill_at_trade_price(self, book: _MarketBook, side: str, queue: Deque[PaperOrder],
+                             level_price: Decimal, budget: Decimal) -> Tuple[Decimal, int]:
+        """주문 가격과 같은 가격의 체결 - 앞서 대기하던 외부 잔량을 먼저 소진"""
+        external = book.external_size(side, level_price)
+        used_external = ZERO
+        fills = 0
+        for order in list(queue):
+            if budget <= 0:
+                break
+            ahead = order.queue_ahead if external is None else min(order.queue_ahead, external)
+            need = ahead - used_external
+            if need > 0:
+                take = min(need, budget)
+                used_external += take
+                budget -= take
+                if budget <= 0:
+                    break
+            volume = min(order.remaining_volume, budget).quantize(VOLUME_UNIT, rounding=ROUND_DOWN)
+            if volume <= 0:
+                break
+            self._execute(book, order, level_price, volume)
+            budget -= volume
+            fills += 1
+        if used_external:
+            for order in queue:
+                order.queue_ahead = max(ZERO, order.queue_ahead - used_external)
+        return budget, fills
+
+    def _fill_queue(self, book: _MarketBook, queue: Deque[PaperOrder], level_price: Decimal,
+                    budget: Decimal) -> Tuple[Decimal, int]:
+        """한 가격 레벨의 대기 주문을 접수 순으로 체결"""
+        fills = 0
+        for order in list(queue):
+            volume = min(order.remaining_volume, budget).quantize(VOLUME_UNIT, rounding=ROUND_DOWN)
+            if volume <= 0:
+                break
+            self._execute(book, order, level_price, volume)
+            budget -= volume
+            fills += 1
+        return budget, fills
+
+    def _cross_resting(self, book: _MarketBook, side: str) -> int:
+        """호가 스냅샷이 내 대기 가격을 넘어선 경우 - 넘어선 호가 잔량만큼 주문 가격으로 체결"""
+        with localcontext(_DECIMAL_CONTEXT):
+            levels = book.book_asks if side == 'bid' else book.book_bids
+            orders = book.bid_levels if side == 'bid' else book.ask_levels
+            consumed = book.consumed
+            fills = 0
+            for level_price_f, size_f in levels:
+                best = book.best_bid if side == 'bid' else book.best_ask
+                if (level_price_f > best) if side == 'bid' else (level_price_f < best):
+                    break
+                available = size_f - consumed.get(level_price_f, 0.0)
+                if available <= 0:
+                    continue
+                budget = _dec(available)
+                for order_price in book.crossing_prices(side, _dec(level_price_f)):
+                    budget, count = self._fill_queue(book, orders[order_price], order_price, budget)
+                    fills += count
+                    if budget <= 0:
+                        break
+                consumed[level_price_f] = size_f - float(budget)
+            return fills
+
+    def _execute(self, book: _MarketBook, order: PaperOrder, price: Decimal, volume: Decimal) -> None:
+        """체결 1건 정산 - 주문 상태 + 계좌 잔고/잠금 + 평균 매수가"""
+        funds = price * volume
+        fee = funds * book.fee_rate
+        order.executed_volume += volume
+        order.executed_funds += funds
+        order.paid_fee += fee
+        if order.remaining_volume is not None:
+            order.remaining_volume -= volume
+        if order.remaining_funds is not None:
+            order.remaining_funds -= funds
+        order.trades.append({
+            'market': order.market,
+            'uuid': str(uuid.uuid4()),
+            'price': _fmt(price),
+            'volume': _fmt(volume),
+            'funds': _fmt(funds),
+            'side': order.side,
+            'created_at': self.config.clock().isoformat(),
+        })
+
+        quote = self._account(book.quote)
+        base = self._account(book.base, unit_currency=book.quote)
+        if order.side == 'bid':
+            cost = funds + fee
+            quote.locked -= cost
+            order.locked -= cost
+            held = base.balance + base.locked
+            base.avg_buy_price = (base.avg_buy_price * held + funds) / (held + volume)
+            base.balance += volume
+        else:
+            base.locked -= volume
+            order.locked -= volume
+            quote.balance += funds - fee
+        self.stats['fills'] += 1
+
+        if order.remaining_volume is not None and order.remaining_volume <= 0:
+            self._finish(book, order, 'done')
+
+    def _finish(self, book: _MarketBook, order: PaperOrder, state: str) -> None:
+        """주문 종료 - 남은 잠금 해제 + 대기 목록/가격 레벨에서 제거"""
+        if order.state != 'wait':
+            return
+        order.state = state
+        order.done_at = self.config.clock()
+        if order.locked:
+            account = self._account(book.quote if order.side == 'bid' else book.base)
+            account.locked -= order.locked
+            account.balance += order.locked
+            order.locked = ZERO
+        if self._open.pop(order.uuid, None) is not None:
+            book.remove(order)
+
+    # ==================== 조회 ====================
+
+    def get_accounts(self) -> List[Dict[str, Any]]:
+        """GET /accounts - 잔고가 있는 통화 (KRW 는 항상 포함)"""
+        return [account.to_dict() for account in self._accounts.values()
+                if account.currency == 'KRW' or account.balance or account.locked]
+
+    def get_order_chance(self, market: str) -> Dict[str, Any]:
+        """GET /orders/chance"""
+        if '-' not in market:
+            raise PaperExchangeError(400, 'invalid_market', f"마켓 코드 오류: {market}")
+        book = self._books.get(market) or self._book(market)
+        fee = _fmt(book.fee_rate)
+        return {
+            'bid_fee': fee,
+            'ask_fee': fee,
+            'maker_bid_fee': fee,
+            'maker_ask_fee': fee,
+            'market': {
+                'id': market,
+                'name': market,
+                'order_types': list(ORDER_TYPES),
+                'ask_types': ['limit', 'market', 'best'],
+                'bid_types': ['limit', 'price', 'best'],
+                'order_sides': ['ask', 'bid'],
+                'bid': {'currency': book.quote, 'price_unit': None, 'min_total': _fmt(book.min_total)},
+                'ask': {'currency': book.base, 'price_unit': None, 'min_total': _fmt(book.min_total)},
+                'max_total': '1000000000.0',
+                'state': 'active',
+            },
+            'bid_account': self._account(book.quote).to_dict(),
+            'ask_account': self._account(book.base, unit_currency=book.quote).to_dict(),
+        }
+
+    def get_order(self, uuid: Optional[str] = None, identifier: Optional[str] = None) -> Dict[str, Any]:
+        """GET /order - 체결 내역 포함"""
+        return self._find(uuid, identifier).to_dict(include_trades=True)
+
+    def get_open_order_count(self) -> int:
+        return len(self._open)
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            'markets': len(self._books),
+            'open_orders': len(self._open),
+            'resting_orders': sum(book.resting_count() for book in self._books.values()),
+            'total_orders': len(self._orders),
+            'stats': dict(self.stats),
+        }
+
+    def _query_orders(self, query: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """GET /orders - uuid/identifier/상태/마켓 필터 + 페이지"""
+        uuids = set(_split(query.get('uuids')))
+        identifiers = set(_split(query.get('identifiers')))
+        states = set(_split(query.get('states')) or _split(query.get('state')))
+        market = query.get('market')
+        orders = [order for order in self._orders.values()
+                  if (not market or order.market == market)
+                  and (not uuids or order.uuid in uuids)
+                  and (not identifiers or order.identifier in identifiers)
+                  and (not states or order.state in states)]
+        return self._page(orders, query)
+
+    def _query_open_orders(self, query: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """GET /orders/open"""
+        market = query.get('market')
+        if query.get('state', 'wait') != 'wait':
+            return []  # 예약 주문(watch)은 지원하지 않음
+        orders = [order for order in self._open.values() if not market or order.market == market]
+        return self._page(orders, query)
+
+    def _query_closed_orders(self, query: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """GET /orders/closed - 상태 미지정 시 done + cancel"""
+        market = query.get('market')
+        states = set(_split(query.get('state'))) or {'done', 'cancel'}
+        start = datetime.fromisoformat(query['start_time']) if query.get('start_time') else None
+        end = datetime.fromisoformat(query['end_time']) if query.get('end_time') else None
+        orders = [order for order in self._orders.values()
+                  if order.state in states and (not market or order.market == market)
+                  and (start is None or order.created_at >= start)
+                  and (end is None or order.created_at <= end)]
+        return self._page(orders, query)
+
+    @staticmethod
+    def _page(orders: List[PaperOrder], query: Dict[str, Any]) -> List[Dict[str, Any]]:
+        orders.sort(key=lambda order: order.seq, reverse=query.get('order_by', 'desc') == 'desc')
+        limit = int(query.get('limit', 100))
+        start = (int(query.get('page', 1)) - 1) * limit
+        return [order.to_dict() for order in orders[start:start + limit]]
+
+    # ==================== 일괄 취소 ====================
+
+    def _cancel_by_ids(self, query: Dict[str, Any]) -> Dict[str, Any]:
+        """DELETE /orders/uuids"""
+        uuids = _split(query.get('uuids[]') or query.get('uuids'))
+        identifiers = _split(query.get('identifiers[]') or query.get('identifiers'))
+        targets = [(order_uuid, None) for order_uuid in uuids] + [(None, ident) for ident in identifiers]
+        return self._cancel_many(targets)
+
+    def _cancel_open(self, query: Dict[str, Any]) -> Dict[str, Any]:
+        """DELETE /orders/open - 방향/기준 통화 조건의 대기 주문 최대 count 건"""
+        cancel_side = query.get('cancel_side', 'all')
+        quotes = set(_split(query.get('quote_currencies')))
+        count = int(query.get('count', 20))
+        orders = [order for order in self._open.values()
+                  if (cancel_side == 'all' or order.side == cancel_side)
+                  and (not quotes or order.market.split('-', 1)[0] in quotes)]
+        orders.sort(key=lambda order: order.seq, reverse=query.get('order_by', 'desc') == 'desc')
+        return self._cancel_many([(order.uuid, None) for order in orders[:count]])
+
+    def _cancel_many(self, targets: List[Tuple[Optional[str], Optional[str]]]) -> Dict[str, Any]:
+        succeeded, failed = [], []
+        for order_uuid, identifier in targets:
+            try:
+                order = self.cancel_order(order_uuid, identifier)
+                succeeded.append({'uuid': order['uuid'], 'market': order['market'],
+                                  'identifier': order.get('identifier')})
+            except PaperExchangeError as e:
+                failed.append({'uuid': order_uuid, 'identifier': identifier, 'error': e.name})
+        return {'success': {'count': len(succeeded), 'orders': succeeded},
+                'failed': {'count': len(failed), 'orders': failed}}
+
+    # ==================== 내부 ====================
+
+    def _book(self, market: str) -> _MarketBook:
+        book = self._books.get(market)
+        if book is None:
+            quote = market.split('-', 1)[0]
+            book = _MarketBook(market,
+                               _dec(self.config.fee_rates.get(quote, self.config.default_fee_rate)),
+                               _dec(self.config.min_totals.get(quote, ZERO)))
+            self._books[market] = book
+        return book
+
+    def _account(self, currency: str, unit_currency: str = 'KRW') -> PaperAccount:
+        account = self._accounts.get(currency)
+        if account is None:
+            account = self._accounts[currency] = PaperAccount(currency, unit_currency=unit_currency)
+        return account
+
+    def _find(self, uuid: Optional[str], identifier: Optional[str]) -> PaperOrder:
+        if not uuid and not identifier:
+            raise PaperExchangeError(400, 'invalid_parameter', "uuid 또는 identifier 중 하나는 필수입니다")
+        order = self._orders.get(uuid) if uuid else self._by_identifier.get(identifier)
+        if order is None:
+            raise PaperExchangeError(404, 'order_not_found', "주문을 찾지 못했습니다.")
+        return order
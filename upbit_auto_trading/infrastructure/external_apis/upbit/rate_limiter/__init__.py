@@ -54,6 +54,16 @@ from .upbit_rate_limiter_timing import (
     create_precision_timer
 )
 
+# 가상 시간 시뮬레이션 (네트워크 없는 처리량/공정성/429 대응 측정)
+from .upbit_rate_limiter_simulation import (
+    RateLimiterSimulation,
+    RateLimiterSimulationReport,
+    GroupSimulationResult,
+    SimulatedTraffic,
+    VirtualTimeEventLoop,
+    UPBIT_SERVER_LIMITS
+)
+
 # 공개 API
 __all__ = [
     # 메인 클래스
@@ -82,6 +92,12 @@ __all__ = [
     "get_global_time_manager",
     "get_precise_now",
 
+    # 시뮬레이션
+    "RateLimiterSimulation",
+    "RateLimiterSimulationReport",
+    "SimulatedTraffic",
+    "VirtualTimeEventLoop",
+
     # 레거시 호환
     "get_global_rate_limiter"
 ]
@@ -7,16 +7,20 @@
 import asyncio
 import time
 import collections
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Awaitable
 import uuid
 
 from upbit_auto_trading.infrastructure.logging import create_component_logger
+from upbit_auto_trading.infrastructure.logging.performance.latency_tracer import get_latency_tracer
 from .upbit_rate_limiter_types import (
     UpbitRateLimitGroup, UnifiedRateLimiterConfig, GroupStats, WaiterInfo,
     AdaptiveStrategy
 )
 from .upbit_rate_limiter_managers import SelfHealingTaskManager, TimeoutAwareRateLimiter, AtomicTATManager
 
+# 토큰 획득 대기 지연 측정 (PerformanceMonitor 활성 시)
+_latency_tracer = get_latency_tracer()
+
 
 class UnifiedUpbitRateLimiter:
     """
@@ -32,7 +36,19 @@ class UnifiedUpbitRateLimiter:
     기존 5개 파일 기능을 단일 클래스로 통합
     """
 
-    def __init__(self, group_configs: Optional[Dict[UpbitRateLimitGroup, UnifiedRateLimiterConfig]] = None):
+    def __init__(self, group_configs: Optional[Dict[UpbitRateLimitGroup, UnifiedRateLimiterConfig]] = None,
+                 clock: Optional[Callable[[], float]] = None,
+                 sleep: Optional[Callable[[float], Awaitable[None]]] = None):
+        """
+        Args:
+            group_configs: 그룹별 설정 (None이면 기본 설정)
+            clock: 단조 시계 (기본 time.monotonic) - 시뮬레이션에서는 가상 시간 루프의 time
+            sleep: 비동기 대기 함수 (기본 asyncio.sleep)
+        """
+        # 시간 소스 (매니저들도 이 시계/대기 함수를 공유)
+        self.clock: Callable[[], float] = clock or time.monotonic
+        self.sleep: Callable[[float], Awaitable[None]] = sleep or asyncio.sleep
+
         # 기본 설정
         self.group_configs = group_configs or self._create_default_configs()
 
@@ -248,12 +264,16 @@ class UnifiedUpbitRateLimiter:
         # 기본값: Private Default
         return UpbitRateLimitGroup.REST_PRIVATE_DEFAULT
 
+    def get_rate_limit_group(self, endpoint: str, method: str = 'GET') -> UpbitRateLimitGroup:
+        """엔드포인트/메서드가 속한 Rate Limit 그룹 조회 (시뮬레이션/모니터링용 공개 API)"""
+        return self._get_rate_limit_group(endpoint, method)
+
     async def acquire(self, endpoint: str, method: str = 'GET', **kwargs) -> None:
         """Rate Limit 토큰 획득 (메인 API)"""
         group = self._get_rate_limit_group(endpoint, method)
         config = self.group_configs[group]
         stats = self.group_stats[group]
-        now = time.monotonic()
+        now = self.clock()
 
         # 🔍 디버깅: 그룹 매핑 및 설정 로그
         self.logger.debug(
@@ -264,12 +284,13 @@ class UnifiedUpbitRateLimiter:
         # 통계 업데이트
         stats.total_requests += 1
 
-        # 예방적 스로틀링 체크
-        if config.enable_preventive_throttling:
-            await self._apply_preventive_throttling(group, stats, now)
+        with _latency_tracer.span("rate_limiter.acquire"):
+            # 예방적 스로틀링 체크
+            if config.enable_preventive_throttling:
+                await self._apply_preventive_throttling(group, stats, now)
 
-        # Lock-Free 토큰 획득
-        await self._acquire_token_lock_free(group, endpoint, now)
+            # Lock-Free 토큰 획득
+            await self._acquire_token_lock_free(group, endpoint, now)
 
         self.logger.debug(f"✅ 토큰 획득: {group.value}/{endpoint}")
 
@@ -299,7 +320,7 @@ class UnifiedUpbitRateLimiter:
                 raise e
         """
         group = self._get_rate_limit_group(endpoint, method)
-        commit_timestamp = timestamp or time.monotonic()
+        commit_timestamp = timestamp or self.clock()
 
         # AtomicTATManager를 통한 안전한 커밋
         await self._atomic_tat_manager.commit_timestamp_window(group, commit_timestamp)
@@ -331,7 +352,7 @@ class UnifiedUpbitRateLimiter:
             final_delay = base_delay * decay_factor
 
             if final_delay > 0.001:  # 1ms 이상일 때만 지연 적용
-                await asyncio.sleep(final_delay)
+                await self.sleep(final_delay)
                 self.logger.debug(f"🛡️ 예방적 스로틀링: {group.value}, {final_delay:.3f}초 지연 (감쇠율: {decay_factor:.2f})")
 
     async def _acquire_token_lock_free(self, group: UpbitRateLimitGroup, endpoint: str, now: float):
@@ -375,7 +396,7 @@ class UnifiedUpbitRateLimiter:
         await self._timeout_manager.acquire_token_with_guaranteed_cleanup(group, endpoint, waiter_info)
 
         # 대기 완료 후 통계 업데이트
-        wait_time = time.monotonic() - now
+        wait_time = self.clock() - now
         stats.total_wait_time += wait_time
         stats.concurrent_waiters -= 1
 
@@ -384,7 +405,7 @@ class UnifiedUpbitRateLimiter:
         group = self._get_rate_limit_group(endpoint, method)
         stats = self.group_stats[group]
         config = self.group_configs[group]
-        now = time.monotonic()
+        now = self.clock()
 
         # 429 에러 기록
         stats.add_429_error(now)
@@ -487,10 +508,10 @@ class UnifiedUpbitRateLimiter:
         while self._running:
             try:
                 await self._check_recovery()
-                await asyncio.sleep(30.0)  # 30초마다 체크
+                await self.sleep(30.0)  # 30초마다 체크
             except Exception as e:
                 self.logger.error(f"❌ 복구 루프 오류: {e}")
-                await asyncio.sleep(5.0)
+                await self.sleep(5.0)
 
     async def _check_recovery(self):
         """복구 체크"""
@@ -501,7 +522,7 @@ class UnifiedUpbitRateLimiter:
                 continue
 
             if stats.current_rate_ratio < 1.0 and stats.last_reduction_time:
-                now = time.monotonic()
+                now = self.clock()
                 time_since_reduction = now - stats.last_reduction_time
 
                 if time_since_reduction >= config.recovery_delay:
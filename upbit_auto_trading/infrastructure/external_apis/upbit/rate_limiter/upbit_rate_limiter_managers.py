@@ -5,7 +5,6 @@
 """
 
 import asyncio
-import time
 import random
 import collections
 from typing import Dict, Optional, Any
@@ -61,10 +60,10 @@ class SelfHealingTaskManager:
         while self.limiter._running:
             try:
                 await self._check_and_heal_tasks()
-                await asyncio.sleep(self._health_check_interval)
+                await self.limiter.sleep(self._health_check_interval)
             except Exception as e:
                 self.logger.error(f"❌ 헬스체크 루프 오류: {e}")
-                await asyncio.sleep(1.0)
+                await self.limiter.sleep(1.0)
 
     async def _check_and_heal_tasks(self):
         """태스크 헬스체크 및 자가치유"""
@@ -95,7 +94,7 @@ class SelfHealingTaskManager:
 
     async def _heal_failed_task(self, group: UpbitRateLimitGroup, failed_task: asyncio.Task):
         """실패한 태스크 치유"""
-        now = time.monotonic()
+        now = self.limiter.clock()
         last_restart = self.last_restart_time.get(group, 0)
 
         # 너무 자주 재시작 방지 (최소 30초 간격)
@@ -175,15 +174,15 @@ class SelfHealingTaskManager:
 
                 # 지수 백오프
                 backoff_delay = min(30.0, 0.1 * (2 ** consecutive_errors) + random.uniform(0, 0.1))
-                await asyncio.sleep(backoff_delay)
+                await self.limiter.sleep(backoff_delay)
 
     async def _background_notifier_core(self, group: UpbitRateLimitGroup):
         """백그라운드 알림기 핵심 로직"""
         if not self.limiter.waiters[group]:
-            await asyncio.sleep(0.1)
+            await self.limiter.sleep(0.1)
             return
 
-        now = time.monotonic()
+        now = self.limiter.clock()
 
         # 시간이 된 대기자 찾아 깨우기
         for waiter_id, waiter_info in list(self.limiter.waiters[group].items()):
@@ -201,7 +200,7 @@ class SelfHealingTaskManager:
         )
 
         sleep_time = max(0.001, next_check - now)
-        await asyncio.sleep(sleep_time)
+        await self.limiter.sleep(sleep_time)
 
     def get_health_status(self) -> Dict[str, Any]:
         """태스크 건강 상태 조회"""
@@ -279,10 +278,10 @@ class TimeoutAwareRateLimiter:
         while self.limiter._running:
             try:
                 await self._cleanup_completed_timeout_tasks()
-                await asyncio.sleep(self._cleanup_interval)
+                await self.limiter.sleep(self._cleanup_interval)
             except Exception as e:
                 self.logger.error(f"❌ 타임아웃 정리 오류: {e}")
-                await asyncio.sleep(5.0)
+                await self.limiter.sleep(5.0)
 
     async def acquire_token_with_guaranteed_cleanup(self,
                                                     group: UpbitRateLimitGroup,
@@ -323,7 +322,7 @@ class TimeoutAwareRateLimiter:
     async def _timeout_waiter(self, waiter_id: str, waiter_info: WaiterInfo) -> str:
         """대기자 타임아웃 처리"""
         try:
-            await asyncio.sleep(self.waiter_timeout)
+            await self.limiter.sleep(self.waiter_timeout)
 
             # 타임아웃 발생
             if waiter_info.state == WaiterState.WAITING:
@@ -348,6 +347,11 @@ class TimeoutAwareRateLimiter:
                                   pending_tasks: set):
         """보장된 정리 작업"""
         try:
+            # 대기 중 취소(CancelledError)로 빠져나온 경우에도 타임아웃 태스크가 남지 않도록 취소
+            timeout_task = waiter_info.timeout_task
+            if timeout_task is not None and not timeout_task.done():
+                timeout_task.cancel()
+
             # 대기자 목록에서 제거
             if waiter_id in self.limiter.waiters[waiter_info.group]:
                 del self.limiter.waiters[waiter_info.group][waiter_id]
@@ -357,7 +361,7 @@ class TimeoutAwareRateLimiter:
                 del self.active_timeout_tasks[waiter_id]
 
             # 통계 업데이트
-            request_time = time.monotonic()
+            request_time = self.limiter.clock()
             self._record_timeout_stats(waiter_info.group, request_time, waiter_info.created_at)
 
         except Exception as e:
@@ -476,10 +480,10 @@ class AtomicTATManager:
             tuple: (성공 여부, 다음 사용 가능 시간)
         """
         lock = self._get_or_create_lock(group)
-        lock_start_time = time.monotonic()
+        lock_start_time = self.limiter.clock()
 
         async with lock:
-            lock_end_time = time.monotonic()
+            lock_end_time = self.limiter.clock()
             lock_wait_time = lock_end_time - lock_start_time
 
             # 락 대기 통계 기록
@@ -757,7 +761,7 @@ class AtomicTATManager:
         lock = self._get_or_create_lock(group)
 
         async with lock:
-            return self.limiter.group_tats.get(group, time.monotonic())
+            return self.limiter.group_tats.get(group, self.limiter.clock())
 
     def _record_lock_wait_time(self, wait_time: float):
         """락 대기 시간 통계 기록"""
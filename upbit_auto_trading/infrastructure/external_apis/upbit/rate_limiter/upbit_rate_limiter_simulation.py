@@ -0,0 +1,338 @@
+"""
+업비트 Rate Limiter 가상 시간 시뮬레이션
+- 네트워크 없이 UnifiedUpbitRateLimiter 처리량/공정성/429 대응을 결정적으로 측정
+- 가상 시간 이벤트 루프: 실행할 일이 없으면 다음 타이머 시각으로 즉시 점프 (수 시간 트래픽을 수 초에)
+- 모의 업비트 서버: 그룹별 슬라이딩 윈도우 제한을 적용하고 초과 요청은 429 로 응답
+- 검색 키워드: simulation, virtual time, harness, benchmark, gcra tuning
+"""
+
+import asyncio
+import collections
+import logging
+import random
+import selectors
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .upbit_rate_limiter import UnifiedUpbitRateLimiter
+from .upbit_rate_limiter_types import UpbitRateLimitGroup, UnifiedRateLimiterConfig
+
+
+# 업비트 서버 측 실제 제한 (요청 수, 윈도우 초) - 모두 만족해야 통과
+UPBIT_SERVER_LIMITS: Dict[UpbitRateLimitGroup, Tuple[Tuple[int, float], ...]] = {
+    UpbitRateLimitGroup.REST_PUBLIC: ((10, 1.0),),
+    UpbitRateLimitGroup.REST_PRIVATE_DEFAULT: ((30, 1.0),),
+    UpbitRateLimitGroup.REST_PRIVATE_ORDER: ((8, 1.0),),
+    UpbitRateLimitGroup.REST_PRIVATE_CANCEL_ALL: ((1, 2.0),),
+    UpbitRateLimitGroup.WEBSOCKET: ((5, 1.0), (100, 60.0)),
+}
+
+
+# =====================================================================
+# 가상 시간 이벤트 루프
+# =====================================================================
+
+class _VirtualTimeSelector:
+    """실제 I/O 는 즉시 폴링만 하고, 대기 시간만큼 루프의 가상 시계를 전진시키는 셀렉터"""
+
+    def __init__(self, loop: 'VirtualTimeEventLoop'):
+        self._loop = loop
+        self._selector = selectors.DefaultSelector()
+
+    def select(self, timeout: Optional[float] = None):
+        # 등록된 fd 가 self-pipe 하나뿐이면 폴링 시스템콜 생략 (시뮬레이션은 실제 I/O 가 없음)
+        if len(self._selector.get_map()) > 1:
+            events = self._selector.select(0)
+            if events:
+                return events
+        if timeout is None:
+            raise RuntimeError("가상 시간 루프 교착: 예약된 타이머와 준비된 작업이 없습니다")
+        if timeout > 0:
+            self._loop.advance(timeout)
+        return []
+
+    def __getattr__(self, name):
+        # register/unregister/modify/get_key/get_map/close 는 실제 셀렉터에 위임
+        return getattr(self._selector, name)
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """
+    가상 시간 asyncio 이벤트 루프
+
+    time() 이 가상 시계를 반환하므로 asyncio.sleep / call_later / wait_for 가 모두 가상 시간으로 동작합니다.
+    실행 가능한 콜백이 없으면 다음 타이머까지 시간을 즉시 건너뜁니다.
+    """
+
+    def __init__(self, start_time: float = 10_000.0):
+        self._virtual_now = start_time
+        super().__init__(selector=_VirtualTimeSelector(self))
+
+    def time(self) -> float:
+        return self._virtual_now
+
+    def advance(self, seconds: float) -> None:
+        """가상 시계 전진"""
+        self._virtual_now += seconds
+
+
+# =====================================================================
+# 시뮬레이션 설정/결과
+# =====================================================================
+
+@dataclass
+class SimulatedTraffic:
+    """그룹별 가상 부하 (closed-loop 클라이언트: 응답을 받은 뒤 다음 요청)"""
+    endpoint: str
+    method: str = 'GET'
+    clients: int = 3
+    think_time: float = 0.0  # 응답 후 다음 요청까지 쉬는 시간 (0 = 최대 부하)
+
+
+DEFAULT_TRAFFIC: Tuple[SimulatedTraffic, ...] = (
+    SimulatedTraffic('/ticker', 'GET', clients=4),
+    SimulatedTraffic('/accounts', 'GET', clients=4),
+    SimulatedTraffic('/orders', 'POST', clients=3),
+    SimulatedTraffic('/orders/open', 'DELETE', clients=1),
+    SimulatedTraffic('websocket_subscription', 'WS', clients=2),
+)
+
+
+@dataclass
+class GroupSimulationResult:
+    """그룹별 시뮬레이션 결과"""
+    group: UpbitRateLimitGroup
+    requests: int = 0              # 서버에 도달한 요청 수
+    accepted: int = 0
+    window_violations: int = 0     # 서버 윈도우 초과 (429 응답)
+    achieved_rps: float = 0.0      # 초당 성공 요청 수
+    wait_p50_ms: float = 0.0       # acquire 대기 시간 백분위
+    wait_p95_ms: float = 0.0
+    wait_p99_ms: float = 0.0
+    wait_max_ms: float = 0.0
+    fairness: float = 1.0          # 클라이언트별 성공 수의 Jain 공정성 지수 (1.0 = 완전 공정)
+    final_rate_ratio: float = 1.0
+    rate_reductions: int = 0
+    rate_recoveries: int = 0
+
+    def to_dict(self) -> Dict:
+        data = dict(self.__dict__)
+        data['group'] = self.group.value
+        return data
+
+
+@dataclass
+class RateLimiterSimulationReport:
+    """시뮬레이션 전체 결과"""
+    simulated_seconds: float
+    wall_seconds: float
+    groups: Dict[UpbitRateLimitGroup, GroupSimulationResult] = field(default_factory=dict)
+
+    @property
+    def total_violations(self) -> int:
+        return sum(result.window_violations for result in self.groups.values())
+
+    @property
+    def speedup(self) -> float:
+        """가상 시간 / 실제 소요 시간"""
+        return self.simulated_seconds / self.wall_seconds if self.wall_seconds > 0 else float('inf')
+
+    def to_dict(self) -> Dict:
+        return {
+            'simulated_seconds': self.simulated_seconds,
+            'wall_seconds': self.wall_seconds,
+            'speedup': self.speedup,
+            'total_violations': self.total_violations,
+            'groups': {group.value: result.to_dict() for group, result in self.groups.items()},
+        }
+
+    def format_lines(self) -> List[str]:
+        """사람이 읽는 요약 (벤치마크 출력용)"""
+        lines = [
+            f"가상 {self.simulated_seconds:,.0f}초 / 실제 {self.wall_seconds:.2f}초 "
+            f"(x{self.speedup:,.0f}) | 윈도우 위반 {self.total_violations}건",
+            f"{'그룹':<24} {'요청':>8} {'RPS':>7} {'p50':>8} {'p95':>8} {'p99':>8} "
+            f"{'위반':>5} {'공정성':>6} {'비율':>5} {'감소/복구':>9}",
+        ]
+        for group, r in self.groups.items():
+            lines.append(
+                f"{group.value:<24} {r.requests:>8,} {r.achieved_rps:>7.2f} "
+                f"{r.wait_p50_ms:>6.0f}ms {r.wait_p95_ms:>6.0f}ms {r.wait_p99_ms:>6.0f}ms "
+                f"{r.window_violations:>5} {r.fairness:>6.3f} {r.final_rate_ratio:>5.2f} "
+                f"{r.rate_reductions:>4}/{r.rate_recoveries:<4}"
+            )
+        return lines
+
+
+class _SimulatedUpbitServer:
+    """모의 업비트 서버 - 그룹별 슬라이딩 윈도우로 통과/429 판정"""
+
+    def __init__(self, limits: Dict[UpbitRateLimitGroup, Tuple[Tuple[int, float], ...]]):
+        self._limits = limits
+        self._accepted: Dict[UpbitRateLimitGroup, collections.deque] = {
+            group: collections.deque() for group in limits
+        }
+
+    def handle(self, group: UpbitRateLimitGroup, now: float) -> bool:
+        """요청 도착 처리 - 통과하면 True, 윈도우 초과(429)면 False"""
+        limits = self._limits.get(group)
+        if not limits:
+            return True
+        accepted = self._accepted[group]
+        longest_window = max(window for _, window in limits)
+        while accepted and accepted[0] <= now - longest_window:
+            accepted.popleft()
+        for max_requests, window in limits:
+            cutoff = now - window
+            in_window = sum(1 for t in reversed(accepted) if t > cutoff) if window < longest_window \
+                else len(accepted)
+            if in_window >= max_requests:
+                return False
+        accepted.append(now)
+        return True
+
+
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _jain_fairness(values: Sequence[int]) -> float:
+    total = sum(values)
+    if total == 0:
+        return 1.0
+    return total * total / (len(values) * sum(v * v for v in values))
+
+
+# =====================================================================
+# 시뮬레이터
+# =====================================================================
+
+class RateLimiterSimulation:
+    """
+    UnifiedUpbitRateLimiter 가상 시간 시뮬레이터
+
+    사용법 (루프는 호출 측 소유 - 테스트/벤치마크가 VirtualTimeEventLoop 를 만들어 run() 코루틴을 구동):
+        report = await RateLimiterSimulation(duration=3600.0).run()
+        for line in report.format_lines():
+            print(line)
+
+    모든 난수는 seed 로 고정되어 같은 설정이면 같은 결과가 나옵니다.
+    GCRA 파라미터 튜닝은 group_configs 로, 더 엄격한 서버(429 유도)는 server_limits 로 지정합니다.
+    """
+
+    def __init__(self,
+                 duration: float = 3600.0,
+                 traffic: Sequence[SimulatedTraffic] = DEFAULT_TRAFFIC,
+                 group_configs: Optional[Dict[UpbitRateLimitGroup, UnifiedRateLimiterConfig]] = None,
+                 server_limits: Optional[Dict[UpbitRateLimitGroup, Tuple[Tuple[int, float], ...]]] = None,
+                 latency: float = 0.03,
+                 latency_jitter: float = 0.02,
+                 seed: int = 0,
+                 log_level: int = logging.WARNING):
+        self.duration = duration
+        self.traffic = tuple(traffic)
+        self.group_configs = group_configs
+        self.server_limits = server_limits or UPBIT_SERVER_LIMITS
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.seed = seed
+        # 요청마다 남는 DEBUG 로그가 실행 시간 대부분을 차지하므로 시뮬레이션 중에는 로그 레벨을 올림
+        self.log_level = log_level
+
+    async def run(self) -> RateLimiterSimulationReport:
+        """
+        현재 실행 중인 루프에서 시뮬레이션 실행
+
+        루프는 호출 측이 소유합니다. 가상 시간으로 돌리려면 VirtualTimeEventLoop 위에서 await 하세요
+        (limiter 시계는 실행 중인 루프의 time 을 사용).
+        """
+        loop = asyncio.get_running_loop()
+        wall_started = time.perf_counter()
+        limiter = UnifiedUpbitRateLimiter(self.group_configs, clock=loop.time)
+        previous_level = limiter.logger.level
+        limiter.logger.setLevel(self.log_level)
+        try:
+            groups = await self._drive(loop, limiter)
+        finally:
+            limiter.logger.setLevel(previous_level)
+        return RateLimiterSimulationReport(
+            simulated_seconds=self.duration,
+            wall_seconds=time.perf_counter() - wall_started,
+            groups=groups
+        )
+
+    async def _drive(self, loop: asyncio.AbstractEventLoop,
+                     limiter: UnifiedUpbitRateLimiter) -> Dict[UpbitRateLimitGroup, GroupSimulationResult]:
+        server = _SimulatedUpbitServer(self.server_limits)
+        rng = random.Random(self.seed)
+
+        results: Dict[UpbitRateLimitGroup, GroupSimulationResult] = {}
+        waits: Dict[UpbitRateLimitGroup, List[float]] = collections.defaultdict(list)
+        client_counts: Dict[UpbitRateLimitGroup, List[int]] = collections.defaultdict(list)
+
+        async def on_reduced(group, old_ratio, new_ratio):
+            results[group].rate_reductions += 1
+
+        async def on_recovered(group, old_ratio, new_ratio):
+            results[group].rate_recoveries += 1
+
+        limiter.on_rate_reduced = on_reduced
+        limiter.on_rate_recovered = on_recovered
+
+        end_time = loop.time() + self.duration
+
+        async def client(spec: SimulatedTraffic, group: UpbitRateLimitGroup, index: int):
+            result = results[group]
+            group_waits = waits[group]
+            counts = client_counts[group]
+            while loop.time() < end_time:
+                requested_at = loop.time()
+                await limiter.acquire(spec.endpoint, spec.method)
+                sent_at = loop.time()
+                group_waits.append(sent_at - requested_at)
+
+                # 판정은 서버 도착 시점에 집계 (종료 시 응답 대기 중이던 요청도 포함)
+                result.requests += 1
+                accepted = server.handle(group, sent_at)
+                if accepted:
+                    result.accepted += 1
+                    counts[index] += 1
+                else:
+                    result.window_violations += 1
+                await asyncio.sleep(self.latency + rng.random() * self.latency_jitter)
+                if accepted:
+                    await limiter.commit_timestamp(spec.endpoint, spec.method)
+                else:
+                    await limiter.notify_429_error(spec.endpoint, spec.method)
+                if spec.think_time > 0:
+                    await asyncio.sleep(spec.think_time)
+
+        tasks = []
+        for spec in self.traffic:
+            group = limiter.get_rate_limit_group(spec.endpoint, spec.method)
+            results.setdefault(group, GroupSimulationResult(group=group))
+            base = len(client_counts[group])
+            client_counts[group].extend([0] * spec.clients)
+            for i in range(spec.clients):
+                tasks.append(asyncio.ensure_future(client(spec, group, base + i)))
+
+        await asyncio.sleep(self.duration)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await limiter.stop_background_tasks()
+
+        for group, result in results.items():
+            sorted_waits = sorted(waits[group])
+            result.achieved_rps = result.accepted / self.duration
+            result.wait_p50_ms = _percentile(sorted_waits, 50) * 1000
+            result.wait_p95_ms = _percentile(sorted_waits, 95) * 1000
+            result.wait_p99_ms = _percentile(sorted_waits, 99) * 1000
+            result.wait_max_ms = (sorted_waits[-1] if sorted_waits else 0.0) * 1000
+            result.fairness = _jain_fairness(client_counts[group])
+            result.final_rate_ratio = limiter.group_stats[group].current_rate_ratio
+        return results
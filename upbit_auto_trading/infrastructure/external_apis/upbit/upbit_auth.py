@@ -1,12 +1,23 @@
-import jwt  # type: ignore
+import base64
 import hashlib
+import hmac
+import json
 import uuid
 from urllib.parse import urlencode
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
 import os
 import logging
 
 
+def _b64url(data: bytes) -> bytes:
+    """JWT 세그먼트용 base64url (패딩 제거)"""
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+# HS512 JWT 헤더는 키와 무관하게 고정
+_JWT_HEADER_SEGMENT = _b64url(b'{"alg":"HS512","typ":"JWT"}')
+
+
 class AuthenticationError(Exception):
     """인증 관련 오류"""
     pass
@@ -24,6 +35,11 @@ class UpbitAuthenticator:
         self._access_key = access_key
         self._secret_key = secret_key
         self._logger = logging.getLogger(__name__)
+        self._signing_material: Optional[Tuple] = None
+        self._public_headers = {
+            'Accept': 'application/json',
+            'Content-Type': 'application/json'
+        }
 
         # ApiKeyService에서 키를 로드 시도 (직접 키가 제공되지 않은 경우)
         if not self._access_key or not self._secret_key:
@@ -79,69 +95,81 @@ class UpbitAuthenticator:
 
     def create_jwt_token(self, query_params: Optional[Dict] = None,
                          request_body: Optional[Dict] = None) -> str:
-        """JWT 토큰 생성 - 업비트 공식 예제 방식"""
+        """JWT 토큰 생성 - 업비트 공식 예제 방식 (HS512, 요청마다 새 nonce)"""
         if not self.is_authenticated():
             raise AuthenticationError("API 키가 설정되지 않았습니다")
 
-        # 강제 콘솔 출력으로 JWT 요청 추적
-        self._logger.debug("JWT 생성 요청:")
-        self._logger.debug(f"   query_params: {query_params}")
-        self._logger.debug(f"   request_body: {request_body}")
+        debug = self._logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self._logger.debug("JWT 생성 요청:")
+            self._logger.debug(f"   query_params: {query_params}")
+            self._logger.debug(f"   request_body: {request_body}")
 
-        payload = {
-            'access_key': self._access_key,
-            'nonce': str(uuid.uuid4())
-        }
-
-        # 쿼리스트링 생성 및 해시 추가
+        # 쿼리스트링 생성 (GET 쿼리 파라미터 + POST body - 업비트 공식 방식: body를 query_string으로 처리)
         query_string_data = {}
-
-        # GET 요청의 쿼리 파라미터
         if query_params:
             query_string_data.update(query_params)
-
-        # POST 요청의 body 데이터 (업비트 공식 방식: body를 query_string으로 처리)
         if request_body:
             query_string_data.update(request_body)
 
-        # 쿼리스트링이 있으면 해시 생성
+        query_hash = None
         if query_string_data:
-            # 업비트 JWT 검증 이슈 해결: []를 URL 인코딩하지 않고 직접 구성
-            query_string = urlencode(query_string_data, doseq=True)
-
-            # []가 %5B%5D로 인코딩된 경우 원래대로 복원
-            query_string = query_string.replace('%5B%5D', '[]')
-            query_string = query_string.encode()
-
-            # JWT 검증을 위한 URL 인코딩에서 []를 제외하고 처리
-            self._logger.debug("JWT Debug - 요청 분석:")
-            self._logger.debug(f"   query_string_data: {query_string_data}")
-            self._logger.debug(f"   encoded query_string: {query_string.decode('utf-8')}")
-
-            m = hashlib.sha512()
-            m.update(query_string)
-            payload['query_hash'] = m.hexdigest()
-            payload['query_hash_alg'] = 'SHA512'
-
-            # JWT 해시 값 로깅
-            self._logger.debug(f"   query_hash: {payload['query_hash'][:32]}...")
-
-        else:
-            # 쿼리 파라미터가 없는 경우
+            query_string = self.build_query_string(query_string_data)
+            query_hash = hashlib.sha512(query_string.encode()).hexdigest()
+            if debug:
+                self._logger.debug("JWT Debug - 요청 분석:")
+                self._logger.debug(f"   encoded query_string: {query_string}")
+                self._logger.debug(f"   query_hash: {query_hash[:32]}...")
+        elif debug:
             self._logger.debug("JWT Debug - 쿼리 파라미터 없음")
 
         try:
-            # 타입 안전성 확인
-            if not self._secret_key:
-                raise AuthenticationError("Secret key is None")
-
-            # JWT 토큰 생성 (업비트 공식 권장: HS512 알고리즘)
-            token = jwt.encode(payload, self._secret_key, algorithm='HS512')
-            return token  # Bearer 접두사 제거 (헤더에서 추가)
+            return self._sign_payload(str(uuid.uuid4()), query_hash)  # Bearer 접두사 제거 (헤더에서 추가)
         except Exception as e:
             self._logger.error(f"JWT 토큰 생성 실패: {e}")
             raise AuthenticationError(f"JWT 토큰 생성 실패: {e}")
 
+    @staticmethod
+    def build_query_string(data: Dict[str, Any]) -> str:
+        """query_hash 계산용 쿼리스트링 (업비트 JWT 검증 이슈: []는 URL 인코딩하지 않음)"""
+        return urlencode(data, doseq=True).replace('%5B%5D', '[]')
+
+    def _sign_payload(self, nonce: str, query_hash: Optional[str]) -> str:
+        """
+        사전 계산된 서명 재료로 HS512 JWT 서명
+
+        jwt.encode 와 동일한 형식의 토큰을 만들지만, 요청마다 바뀌지 않는 부분
+        (헤더 세그먼트, access_key JSON 조각, HMAC 키 스케줄)은 키별로 한 번만 계산합니다.
+        nonce 는 업비트 규약상 요청마다 달라야 하므로 토큰 자체는 재사용하지 않습니다.
+        """
+        material = self._signing_material
+        if material is None or material[0] != (self._access_key, self._secret_key):
+            material = self._prepare_signing_material()
+        _, header_segment, payload_prefix, mac_template = material
+
+        payload = payload_prefix + nonce
+        if query_hash is None:
+            payload += '"}'
+        else:
+            payload += f'","query_hash":"{query_hash}","query_hash_alg":"SHA512"}}'
+
+        signing_input = header_segment + b'.' + _b64url(payload.encode())
+        mac = mac_template.copy()
+        mac.update(signing_input)
+        return (signing_input + b'.' + _b64url(mac.digest())).decode('ascii')
+
+    def _prepare_signing_material(self) -> Tuple[Tuple[Optional[str], Optional[str]], bytes, str, Any]:
+        if not self._secret_key:
+            raise AuthenticationError("Secret key is None")
+        material = (
+            (self._access_key, self._secret_key),
+            _JWT_HEADER_SEGMENT,
+            '{"access_key":' + json.dumps(self._access_key) + ',"nonce":"',
+            hmac.new(self._secret_key.encode(), digestmod=hashlib.sha512)
+        )
+        self._signing_material = material
+        return material
+
     async def create_websocket_token(self) -> Dict[str, Any]:
         """WebSocket 연결용 JWT 토큰 생성"""
         if not self.is_authenticated():
@@ -168,10 +196,7 @@ class UpbitAuthenticator:
 
     def get_public_headers(self) -> Dict[str, str]:
         """공개 API용 헤더"""
-        return {
-            'Accept': 'application/json',
-            'Content-Type': 'application/json'
-        }
+        return dict(self._public_headers)
 
     def get_private_headers(self, query_params: Optional[Dict] = None,
                             request_body: Optional[Dict] = None) -> Dict[str, str]:
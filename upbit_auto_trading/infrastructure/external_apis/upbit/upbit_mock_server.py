@@ -0,0 +1,672 @@
+"""
+업비트 REST API 로컬 모의 서버 (aiohttp)
+
+실제 거래소에 접속하지 않고 캔들 수집 파이프라인
+(CandleDataProvider → ChunkProcessor → UpbitPublicClient → Repository)과
+주문 경로(UpbitPrivateClient)를 측정하기 위한 대역입니다.
+
+지원 엔드포인트 (/v1 기준):
+- GET /market/all
+- GET /ticker, /ticker/all
+- GET /orderbook
+- GET /trades/ticks
+- GET /candles/seconds, /candles/minutes/{unit}, /candles/days, /candles/weeks,
+      /candles/months, /candles/years  (to / count 의미는 실제 업비트와 동일)
+- GET /accounts, POST /orders, GET /order  (JWT 서명/nonce 재사용/query_hash 검증)
+
+특징:
+- 결정적 합성 데이터: 같은 seed 면 같은 시각의 캔들은 항상 같은 값 (요청 순서와 무관)
+- 빈 캔들: 분 단위 무체결 비율(gap_ratio) + 장애 구간(outages) + 상장 시각 이전 데이터 없음
+- 응답 지연(latency/jitter), 그룹별 초당 제한 초과 시 429, 무작위 429 주입
+- 모든 응답에 Remaining-Req 헤더 (group=candles; min=...; sec=...)
+- 프라이빗 엔드포인트는 default(30/초), order(8/초) 그룹으로 제한
+
+사용 예시:
+    async with MockUpbitServer(MockUpbitServerConfig(gap_ratio=0.05)) as server:
+        client = UpbitPublicClient(base_url=server.base_url)
+        candles = await client.get_candles_minutes(1, 'KRW-BTC', count=200)
+
+        private = UpbitPrivateClient(server.config.access_key, server.config.secret_key,
+                                     dry_run=False, base_url=server.base_url)
+        order = await private.place_order('KRW-BTC', 'bid', 'limit', volume=Decimal('0.001'), price=Decimal('1000'))
+"""
+
+import asyncio
+import collections
+import hashlib
+import math
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode
+
+import jwt  # type: ignore
+from aiohttp import web
+
+from upbit_auto_trading.infrastructure.logging import create_component_logger
+
+KST = timezone(timedelta(hours=9))
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MASK64 = (1 << 64) - 1
+
+VALID_MINUTE_UNITS = (1, 3, 5, 10, 15, 30, 60, 240)
+
+# 업비트 시세 조회 그룹별 초당 제한 (Remaining-Req 의 group 이름 기준)
+DEFAULT_GROUP_LIMITS: Dict[str, int] = {
+    'market': 10,
+    'candles': 10,
+    'ticker': 10,
+    'orderbook': 10,
+    'trades': 10,
+    'default': 30,
+    'order': 8,
+}
+
+
+@dataclass
+class MockUpbitServerConfig:
+    """모의 서버 설정"""
+    markets: Sequence[str] = ('KRW-BTC', 'KRW-ETH', 'KRW-XRP', 'BTC-ETH', 'USDT-BTC')
+    seed: int = 0
+    now: datetime = datetime(2025, 1, 1, tzinfo=timezone.utc)  # 서버 기준 "현재" 시각 (고정 → 결정적)
+    listed_at: datetime = datetime(2017, 10, 1, tzinfo=timezone.utc)  # 이전 시각에는 캔들 없음
+    gap_ratio: float = 0.0          # 무체결(빈) 1분 구간 비율 - 초봉은 gap_ratio ** (1/60) 로 환산
+    outages: Sequence[Tuple[datetime, datetime]] = ()  # [시작, 끝) 구간에는 캔들 없음 (초~시간봉)
+    latency: float = 0.0            # 응답 지연 (초)
+    latency_jitter: float = 0.0     # 추가 무작위 지연 최대값 (초)
+    error_429_rate: float = 0.0     # 무작위 429 응답 비율
+    enforce_rate_limit: bool = True  # 그룹별 초당 제한 초과 시 429
+    group_limits: Dict[str, int] = field(default_factory=lambda: dict(DEFAULT_GROUP_LIMITS))
+    requests_per_minute: int = 600  # Remaining-Req min 표시용
+    access_key: str = 'mock-access-key'
+    secret_key: str = 'mock-secret-key-' * 4  # HS512 권장 길이(64바이트)
+    verify_jwt: bool = True         # 프라이빗 요청의 서명/nonce/query_hash 검증
+
+
+@dataclass
+class MockServerStats:
+    """모의 서버 처리 통계"""
+    requests: int = 0
+    responses_429: int = 0
+    injected_429: int = 0
+    candles_served: int = 0
+    orders_created: int = 0
+    auth_failures: int = 0
+    by_group: Dict[str, int] = field(default_factory=lambda: collections.defaultdict(int))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'responses_429': self.responses_429,
+            'injected_429': self.injected_429,
+            'candles_served': self.candles_served,
+            'orders_created': self.orders_created,
+            'auth_failures': self.auth_failures,
+            'by_group': dict(self.by_group),
+        }
+
+
+# =====================================================================
+# 결정적 합성 데이터
+# =====================================================================
+
+class _MockApiError(Exception):
+    """업비트 오류 응답 형식으로 변환되는 예외"""
+
+    def __init__(self, status: int, name: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.name = name
+
+
+def _splitmix64(value: int) -> int:
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+def _parse_to(value: Optional[str], default: datetime) -> datetime:
+    """to 파라미터 파싱 - 시간대가 없으면 UTC (ChunkProcessor 요청 형식)"""
+    if not value:
+        return default
+    text = value.strip().replace(' ', 'T')
+    if text.endswith('Z'):
+        text = text[:-1] + '+00:00'
+    parsed = datetime.fromisoformat(text)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _epoch_seconds(dt: datetime) -> int:
+    return int((dt - _EPOCH).total_seconds())
+
+
+class _SyntheticMarket:
+    """마켓 하나의 결정적 가격 경로와 체결 유무"""
+
+    def __init__(self, market: str, index: int, config: MockUpbitServerConfig):
+        self.market = market
+        self.config = config
+        self._key = _splitmix64((config.seed << 16) ^ (index + 1))
+        quote = market.split('-')[0]
+        base_price = {'KRW': 50_000_000.0, 'BTC': 0.05, 'USDT': 40_000.0}.get(quote, 1_000.0)
+        self.base_price = base_price * (0.5 + self._unit(0x5EED))
+        self.tick = 1000.0 if quote == 'KRW' and self.base_price >= 2_000_000 else (
+            1.0 if quote == 'KRW' else 1e-8
+        )
+        self._phases = [self._unit(0xA0 + i) * 2 * math.pi for i in range(3)]
+
+    def _unit(self, salt: int) -> float:
+        """[0, 1) 결정적 난수"""
+        return _splitmix64(self._key ^ (salt & _MASK64)) / 2.0 ** 64
+
+    def price_at(self, epoch_second: float) -> float:
+        """연속적인 합성 가격 (여러 주기의 사인파 합 → 추세/변동 모두 포함)"""
+        p1, p2, p3 = self._phases
+        log_move = (
+            0.35 * math.sin(epoch_second / 9_000_000.0 + p1)
+            + 0.06 * math.sin(epoch_second / 400_000.0 + p2)
+            + 0.012 * math.sin(epoch_second / 9_000.0 + p3)
+        )
+        return self.base_price * math.exp(log_move)
+
+    def minute_has_trades(self, minute: int) -> bool:
+        gap_ratio = self.config.gap_ratio
+        if gap_ratio <= 0:
+            return True
+        return self._unit(minute * 2 + 1) >= gap_ratio
+
+    def second_has_trades(self, second: int) -> bool:
+        gap_ratio = self.config.gap_ratio
+        if gap_ratio <= 0:
+            return True
+        # 1분이 비려면 60초가 모두 비어야 하므로 초 단위 무체결 확률은 gap_ratio ** (1/60)
+        return self._unit(second * 2) >= gap_ratio ** (1.0 / 60.0)
+
+    def candle(self, start: datetime, end: datetime, salt: int) -> Dict[str, Any]:
+        """[start, end) 구간 캔들 값 (시가 = 구간 시작 가격, 종가 = 구간 끝 가격)"""
+        t0 = _epoch_seconds(start)
+        t1 = _epoch_seconds(end)
+        open_price = self.price_at(t0)
+        close_price = self.price_at(t1)
+        spread = 0.0008 * math.sqrt(max(1.0, (t1 - t0) / 60.0))
+        high = max(open_price, close_price) * (1 + spread * self._unit(salt ^ 0x1111))
+        low = min(open_price, close_price) * (1 - spread * self._unit(salt ^ 0x2222))
+        volume = (t1 - t0) / 60.0 * (0.2 + 2.0 * self._unit(salt ^ 0x3333))
+        return {
+            'opening_price': self._round(open_price),
+            'high_price': self._round(high),
+            'low_price': self._round(low),
+            'trade_price': self._round(close_price),
+            'candle_acc_trade_volume': round(volume, 8),
+            'candle_acc_trade_price': round(volume * (open_price + close_price) / 2, 8),
+        }
+
+    def _round(self, price: float) -> float:
+        return round(round(price / self.tick) * self.tick, 8)
+
+
+# =====================================================================
+# 캔들 구간 계산
+# =====================================================================
+
+def _floor_bucket(dt: datetime, kind: str, unit: int) -> datetime:
+    if kind == 'seconds':
+        return dt.replace(microsecond=0)
+    if kind == 'minutes':
+        minutes = (dt.hour * 60 + dt.minute) // unit * unit
+        return dt.replace(hour=minutes // 60, minute=minutes % 60, second=0, microsecond=0)
+    day = dt.replace(hour=0, minute=0, second=0, microsecond=0)
+    if kind == 'days':
+        return day
+    if kind == 'weeks':
+        return day - timedelta(days=day.weekday())
+    if kind == 'months':
+        return day.replace(day=1)
+    return day.replace(month=1, day=1)
+
+
+def _shift_bucket(start: datetime, kind: str, unit: int, ticks: int) -> datetime:
+    if kind == 'seconds':
+        return start + timedelta(seconds=ticks)
+    if kind == 'minutes':
+        return start + timedelta(minutes=unit * ticks)
+    if kind == 'days':
+        return start + timedelta(days=ticks)
+    if kind == 'weeks':
+        return start + timedelta(weeks=ticks)
+    if kind == 'months':
+        month_index = start.year * 12 + start.month - 1 + ticks
+        return start.replace(year=month_index // 12, month=month_index % 12 + 1)
+    return start.replace(year=start.year + ticks)
+
+
+def _format_time(dt: datetime) -> str:
+    return dt.strftime('%Y-%m-%dT%H:%M:%S')
+
+
+# =====================================================================
+# 모의 서버
+# =====================================================================
+
+class MockUpbitServer:
+    """
+    업비트 공개 REST API 모의 서버
+
+    start() 후 base_url 을 UpbitPublicClient(base_url=...) 에 넘겨 사용합니다.
+    port=0 이면 빈 포트를 자동 할당합니다.
+    """
+
+    def __init__(self, config: Optional[MockUpbitServerConfig] = None,
+                 host: str = '127.0.0.1', port: int = 0):
+        self.config = config or MockUpbitServerConfig()
+        self.host = host
+        self.port = port
+        self.stats = MockServerStats()
+        self._markets: Dict[str, _SyntheticMarket] = {
+            market: _SyntheticMarket(market, index, self.config)
+            for index, market in enumerate(self.config.markets)
+        }
+        self._rng = random.Random(self.config.seed)
+        self._windows: Dict[str, Deque[float]] = collections.defaultdict(collections.deque)
+        self._orders: Dict[str, Dict[str, Any]] = {}
+        self._used_nonces: set = set()
+        self._runner: Optional[web.AppRunner] = None
+        self._logger = create_component_logger("MockUpbitServer")
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get('/v1/market/all', self._handle_markets)
+        app.router.add_get('/v1/ticker', self._handle_ticker)
+        app.router.add_get('/v1/ticker/all', self._handle_ticker_all)
+        app.router.add_get('/v1/orderbook', self._handle_orderbook)
+        app.router.add_get('/v1/trades/ticks', self._handle_trades)
+        app.router.add_get('/v1/candles/seconds', self._handle_candles)
+        app.router.add_get('/v1/candles/minutes/{unit}', self._handle_candles)
+        app.router.add_get('/v1/candles/{kind}', self._handle_candles)
+        app.router.add_get('/v1/accounts', self._handle_accounts)
+        app.router.add_post('/v1/orders', self._handle_place_order)
+        app.router.add_get('/v1/order', self._handle_get_order)
+        return app
+
+    async def start(self) -> 'MockUpbitServer':
+        self._runner = web.AppRunner(self.create_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        self._logger.info(f"🧪 업비트 모의 서버 시작: {self.base_url}")
+        return self
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            self._logger.info(f"🛑 업비트 모의 서버 종료 (요청 {self.stats.requests}건, 429 {self.stats.responses_429}건)")
+
+    async def __aenter__(self) -> 'MockUpbitServer':
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    # ------------------------------------------------------------------
+    # 공통 처리 (지연 / 제한 / 헤더)
+    # ------------------------------------------------------------------
+    async def _respond(self, group: str, build) -> web.Response:
+        self.stats.requests += 1
+        self.stats.by_group[group] += 1
+
+        config = self.config
+        if config.latency > 0 or config.latency_jitter > 0:
+            await asyncio.sleep(config.latency + self._rng.random() * config.latency_jitter)
+
+        limit = config.group_limits.get(group, 10)
+        window = self._windows[group]
+        now = time.monotonic()
+        while window and window[0] <= now - 1.0:
+            window.popleft()
+
+        limited = config.enforce_rate_limit and len(window) >= limit
+        injected = not limited and config.error_429_rate > 0 and self._rng.random() < config.error_429_rate
+        if not limited:
+            window.append(now)
+        headers = {
+            'Remaining-Req': f"group={group}; min={config.requests_per_minute - 1}; "
+                             f"sec={max(0, limit - len(window))}"
+        }
+        if limited or injected:
+            self.stats.responses_429 += 1
+            if injected:
+                self.stats.injected_429 += 1
+            return web.json_response(
+                {'error': {'name': 'too_many_requests', 'message': 'Too many API requests.'}},
+                status=429, headers=headers
+            )
+
+        try:
+            payload = build()
+        except _MockApiError as e:
+            return web.json_response(
+                {'error': {'name': e.name, 'message': str(e)}},
+                status=e.status, headers=headers
+            )
+        except ValueError as e:
+            return web.json_response(
+                {'error': {'name': 'validation_error', 'message': str(e)}},
+                status=400, headers=headers
+            )
+        return web.json_response(payload, headers=headers)
+
+    def _market(self, code: str) -> _SyntheticMarket:
+        market = self._markets.get(code)
+        if market is None:
+            raise ValueError(f"Code not found: {code}")
+        return market
+
+    def _market_list(self, request: web.Request) -> List[_SyntheticMarket]:
+        codes = [code for code in request.query.get('markets', '').split(',') if code]
+        if not codes:
+            raise ValueError("markets 파라미터가 필요합니다")
+        return [self._market(code) for code in codes]
+
+    # ------------------------------------------------------------------
+    # 마켓 / 현재가 / 호가 / 체결
+    # ------------------------------------------------------------------
+    async def _handle_markets(self, request: web.Request) -> web.Response:
+        def build():
+            return [
+                {'market': code, 'korean_name': code.split('-')[1], 'english_name': code.split('-')[1],
+                 'market_warning': 'NONE'}
+                for code in self._markets
+            ]
+        return await self._respond('market', build)
+
+    def _ticker(self, market: _SyntheticMarket) -> Dict[str, Any]:
+        now = self.config.now
+        now_s = _epoch_seconds(now)
+        day_start = _floor_bucket(now, 'days', 1)
+        price = market._round(market.price_at(now_s))
+        opening = market._round(market.price_at(_epoch_seconds(day_start)))
+        prev_close = market._round(market.price_at(_epoch_seconds(day_start) - 1))
+        change = price - prev_close
+        return {
+            'market': market.market,
+            'trade_date': now.strftime('%Y%m%d'),
+            'trade_time': now.strftime('%H%M%S'),
+            'trade_date_kst': now.astimezone(KST).strftime('%Y%m%d'),
+            'trade_time_kst': now.astimezone(KST).strftime('%H%M%S'),
+            'trade_timestamp': now_s * 1000,
+            'opening_price': opening,
+            'high_price': max(opening, price),
+            'low_price': min(opening, price),
+            'trade_price': price,
+            'prev_closing_price': prev_close,
+            'change': 'RISE' if change > 0 else ('FALL' if change < 0 else 'EVEN'),
+            'change_price': abs(change),
+            'change_rate': abs(change) / prev_close if prev_close else 0.0,
+            'signed_change_price': change,
+            'signed_change_rate': change / prev_close if prev_close else 0.0,
+            'trade_volume': 0.01,
+            'acc_trade_price': 1_000_000_000.0,
+            'acc_trade_price_24h': 2_000_000_000.0,
+            'acc_trade_volume': 20.0,
+            'acc_trade_volume_24h': 40.0,
+            'timestamp': now_s * 1000,
+        }
+
+    async def _handle_ticker(self, request: web.Request) -> web.Response:
+        return await self._respond('ticker', lambda: [self._ticker(m) for m in self._market_list(request)])
+
+    async def _handle_ticker_all(self, request: web.Request) -> web.Response:
+        quotes = set(filter(None, request.query.get('quote_currencies', 'KRW,BTC,USDT').split(',')))
+        return await self._respond('ticker', lambda: [
+            self._ticker(m) for code, m in self._markets.items() if code.split('-')[0] in quotes
+        ])
+
+    async def _handle_orderbook(self, request: web.Request) -> web.Response:
+        def build():
+            result = []
+            now_s = _epoch_seconds(self.config.now)
+            for market in self._market_list(request):
+                mid = market._round(market.price_at(now_s))
+                units = []
+                for level in range(15):
+                    units.append({
+                        'ask_price': market._round(mid + market.tick * (level + 1)),
+                        'bid_price': market._round(mid - market.tick * level),
+                        'ask_size': round(0.1 + market._unit(0xA5C0 + level), 8),
+                        'bid_size': round(0.1 + market._unit(0xB1D0 + level), 8),
+                    })
+                result.append({
+                    'market': market.market,
+                    'timestamp': now_s * 1000,
+                    'total_ask_size': round(sum(u['ask_size'] for u in units), 8),
+                    'total_bid_size': round(sum(u['bid_size'] for u in units), 8),
+                    'orderbook_units': units,
+                })
+            return result
+        return await self._respond('orderbook', build)
+
+    async def _handle_trades(self, request: web.Request) -> web.Response:
+        def build():
+            market = self._market(request.query.get('market', ''))
+            count = int(request.query.get('count', '1'))
+            now_s = _epoch_seconds(self.config.now)
+            trades = []
+            for i in range(count):
+                second = now_s - i
+                price = market._round(market.price_at(second))
+                trade_time = _EPOCH + timedelta(seconds=second)
+                trades.append({
+                    'market': market.market,
+                    'trade_date_utc': trade_time.strftime('%Y-%m-%d'),
+                    'trade_time_utc': trade_time.strftime('%H:%M:%S'),
+                    'timestamp': second * 1000,
+                    'trade_price': price,
+                    'trade_volume': round(0.001 + market._unit(second * 2 + 7), 8),
+                    'prev_closing_price': price,
+                    'change_price': 0.0,
+                    'ask_bid': 'ASK' if market._unit(second * 2 + 9) < 0.5 else 'BID',
+                    'sequential_id': second * 1000 + i,
+                })
+            return trades
+        return await self._respond('trades', build)
+
+    # ------------------------------------------------------------------
+    # 캔들
+    # ------------------------------------------------------------------
+    async def _handle_candles(self, request: web.Request) -> web.Response:
+        path = request.path
+        if path.startswith('/v1/candles/minutes/'):
+            kind, unit = 'minutes', int(request.match_info['unit'])
+            if unit not in VALID_MINUTE_UNITS:
+                return web.json_response({'error': {'name': 'invalid_unit', 'message': str(unit)}}, status=400)
+        elif path == '/v1/candles/seconds':
+            kind, unit = 'seconds', 1
+        else:
+            kind, unit = request.match_info['kind'], 1
+            if kind not in ('days', 'weeks', 'months', 'years'):
+                raise web.HTTPNotFound()
+
+        def build():
+            market = self._market(request.query.get('market', ''))
+            count = int(request.query.get('count', '1'))
+            if not 1 <= count <= 200:
+                raise ValueError("count 는 1~200 이어야 합니다")
+            to = _parse_to(request.query.get('to'), self.config.now)
+            candles = self.candles(market.market, kind, unit, count, to)
+            self.stats.candles_served += len(candles)
+            return candles
+
+        return await self._respond('candles', build)
+
+    def candles(self, market_code: str, kind: str, unit: int, count: int, to: datetime) -> List[Dict[str, Any]]:
+        """
+        to 이전(미포함) 캔들을 최신순으로 최대 count 개 반환 - 빈 구간은 건너뛰고 더 과거로 진행
+
+        Args:
+            market_code: 마켓 코드
+            kind: seconds / minutes / days / weeks / months / years
+            unit: 분봉 단위 (minutes 외에는 1)
+            count: 최대 캔들 수
+            to: 기준 시각 (UTC)
+        """
+        market = self._market(market_code)
+        config = self.config
+        to = min(to, config.now)
+        bucket = _floor_bucket(to, kind, unit)
+        if bucket >= to:
+            bucket = _shift_bucket(bucket, kind, unit, -1)
+
+        result: List[Dict[str, Any]] = []
+        while len(result) < count:
+            end = _shift_bucket(bucket, kind, unit, 1)
+            if end <= config.listed_at:
+                break
+            if self._bucket_has_trades(market, kind, unit, bucket, end):
+                candle = market.candle(bucket, end, salt=_epoch_seconds(bucket) * 8 + len(kind))
+                candle_kst = bucket.astimezone(KST)
+                item = {
+                    'market': market_code,
+                    'candle_date_time_utc': _format_time(bucket),
+                    'candle_date_time_kst': _format_time(candle_kst),
+                    **candle,
+                    'timestamp': (_epoch_seconds(end) - 1) * 1000,
+                }
+                if kind == 'minutes':
+                    item['unit'] = unit
+                elif kind in ('days', 'weeks', 'months', 'years'):
+                    prev_close = market._round(market.price_at(_epoch_seconds(bucket)))
+                    item['prev_closing_price'] = prev_close
+                    item['change_price'] = round(item['trade_price'] - prev_close, 8)
+                    item['change_rate'] = round((item['trade_price'] - prev_close) / prev_close, 10)
+                    if kind != 'days':
+                        item['first_day_of_period'] = bucket.strftime('%Y-%m-%d')
+                result.append(item)
+            bucket = _shift_bucket(bucket, kind, unit, -1)
+        return result
+
+    def _bucket_has_trades(self, market: _SyntheticMarket, kind: str, unit: int,
+                           start: datetime, end: datetime) -> bool:
+        if start < self.config.listed_at:
+            return False
+        if kind not in ('seconds', 'minutes'):
+            return True  # 일봉 이상은 항상 체결이 있다고 가정
+        for outage_start, outage_end in self.config.outages:
+            if outage_start <= start and end <= outage_end:
+                return False
+        if kind == 'seconds':
+            return market.second_has_trades(_epoch_seconds(start))
+        first_minute = _epoch_seconds(start) // 60
+        return any(market.minute_has_trades(first_minute + i) for i in range(unit))
+
+    # ------------------------------------------------------------------
+    # 프라이빗 (계좌 / 주문)
+    # ------------------------------------------------------------------
+    def _authorize(self, request: web.Request, query_data: Dict[str, Any]) -> None:
+        """업비트 JWT 규약 검증: HS512 서명, access_key, nonce 1회성, query_hash"""
+        if not self.config.verify_jwt:
+            return
+        try:
+            authorization = request.headers.get('Authorization', '')
+            if not authorization.startswith('Bearer '):
+                raise _MockApiError(401, 'jwt_verification', 'Authorization 헤더가 없습니다')
+            try:
+                payload = jwt.decode(authorization[7:], self.config.secret_key, algorithms=['HS512'])
+            except jwt.InvalidTokenError as e:
+                raise _MockApiError(401, 'jwt_verification', f'잘못된 서명: {e}')
+            if payload.get('access_key') != self.config.access_key:
+                raise _MockApiError(401, 'invalid_access_key', '잘못된 access key')
+            nonce = payload.get('nonce')
+            if not nonce or nonce in self._used_nonces:
+                raise _MockApiError(401, 'nonce_used', '이미 사용된 nonce 입니다')
+            self._used_nonces.add(nonce)
+            if query_data:
+                query_string = urlencode(query_data, doseq=True).replace('%5B%5D', '[]')
+                if payload.get('query_hash') != hashlib.sha512(query_string.encode()).hexdigest():
+                    raise _MockApiError(401, 'invalid_query_payload', 'query_hash 불일치')
+        except _MockApiError:
+            self.stats.auth_failures += 1
+            raise
+
+    async def _handle_accounts(self, request: web.Request) -> web.Response:
+        def build():
+            self._authorize(request, dict(request.query))
+            accounts = [{'currency': 'KRW', 'balance': '100000000.0', 'locked': '0.0',
+                         'avg_buy_price': '0', 'avg_buy_price_modified': False, 'unit_currency': 'KRW'}]
+            for code in self._markets:
+                accounts.append({'currency': code.split('-')[1], 'balance': '1.0', 'locked': '0.0',
+                                 'avg_buy_price': '0', 'avg_buy_price_modified': False,
+                                 'unit_currency': code.split('-')[0]})
+            return accounts
+        return await self._respond('default', build)
+
+    async def _handle_place_order(self, request: web.Request) -> web.Response:
+        body = await request.json() if request.can_read_body else {}
+
+        def build():
+            self._authorize(request, body)
+            market = self._market(body.get('market', ''))
+            side, ord_type = body.get('side'), body.get('ord_type')
+            if side not in ('bid', 'ask'):
+                raise ValueError(f"side 오류: {side}")
+            required = {'limit': ('volume', 'price'), 'price': ('price',), 'market': ('volume',)}.get(ord_type)
+            if required is None or any(body.get(key) is None for key in required):
+                raise ValueError(f"ord_type/필수 파라미터 오류: {ord_type}")
+            identifier = body.get('identifier')
+            if identifier is not None and any(o.get('identifier') == identifier for o in self._orders.values()):
+                raise ValueError(f"identifier 중복: {identifier}")
+
+            order_uuid = str(uuid.UUID(int=self._rng.getrandbits(128)))
+            volume = body.get('volume')
+            order = {
+                'uuid': order_uuid,
+                'side': side,
+                'ord_type': ord_type,
+                'price': body.get('price'),
+                'state': 'wait',
+                'market': market.market,
+                'created_at': self.config.now.astimezone(KST).isoformat(),
+                'volume': volume,
+                'remaining_volume': volume,
+                'reserved_fee': '0.0',
+                'remaining_fee': '0.0',
+                'paid_fee': '0.0',
+                'locked': '0.0',
+                'executed_volume': '0.0',
+                'trades_count': 0,
+            }
+            if identifier is not None:
+                order['identifier'] = identifier
+            self._orders[order_uuid] = order
+            self.stats.orders_created += 1
+            return order
+
+        response = await self._respond('order', build)
+        if response.status == 200:
+            response.set_status(201)
+        return response
+
+    async def _handle_get_order(self, request: web.Request) -> web.Response:
+        def build():
+            self._authorize(request, dict(request.query))
+            order_uuid = request.query.get('uuid')
+            identifier = request.query.get('identifier')
+            for order in self._orders.values():
+                if order['uuid'] == order_uuid or (identifier and order.get('identifier') == identifier):
+                    return dict(order, trades=[])
+            raise _MockApiError(404, 'order_not_found', '주문을 찾지 못했습니다')
+        return await self._respond('default', build)
@@ -16,6 +16,7 @@ DDD Infrastructure 계층 컴포넌트
 
 ### 주문 관리
 - place_order()            → POST /orders
+- place_orders_batch()     → POST /orders × N (사전 검증·서명 후 동시 전송)
 - get_order()              → GET /order
 - get_orders()             → GET /orders
 - get_open_orders()        → GET /orders/open
@@ -37,22 +38,28 @@ DDD Infrastructure 계층 컴포넌트
 ### 특이사항
 - 모든 메서드는 API 키 인증 필수
 - DRY-RUN 모드 기본 활성화 (실거래 시 dry_run=False 명시 필요)
+- DRY-RUN + paper_exchange 지정 시 모든 프라이빗 요청을 로컬 페이퍼 트레이딩 거래소가 처리 (인증/네트워크 불필요)
 - 주문 관련 메서드는 is_order_request=True로 별도 Rate Limit 적용
+- JWT는 요청마다 새 nonce로 서명 (헤더/HMAC 키 등 고정 서명 재료만 캐시)
 - GCRA 기반 동적 조정으로 429 오류 최소화
 """
 import asyncio
+import collections
 import aiohttp
 import time
 import random
-from typing import List, Dict, Any, Optional, Literal
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Literal, Sequence
 from decimal import Decimal
 
 from upbit_auto_trading.infrastructure.logging import create_component_logger
+from upbit_auto_trading.infrastructure.logging.performance.latency_tracer import get_latency_tracer
 from upbit_auto_trading.infrastructure.runtime import (
     LoopGuard,
     get_loop_guard
 )
 from .upbit_auth import UpbitAuthenticator
+from .paper_exchange import PaperExchange
 from .rate_limiter import (
     UnifiedUpbitRateLimiter,
     get_unified_rate_limiter,
@@ -61,6 +68,14 @@ from .rate_limiter import (
     UpbitRateLimitGroup
 )
 
+# HTTP 왕복 지연 측정 (PerformanceMonitor 활성 시)
+_latency_tracer = get_latency_tracer()
+
+
+# 배치 주문 전송 간격 기준: 업비트 order 그룹은 1초 슬라이딩 윈도우로 판정하므로
+# 네트워크 지연 편차를 감안해 약간 넓은 윈도우 안에서 초당 허용량만 전송
+BATCH_ORDER_WINDOW_SECONDS = 1.1
+
 
 def _get_rate_limit_group_for_endpoint(endpoint: str, method: str) -> UpbitRateLimitGroup:
     """
@@ -90,6 +105,47 @@ def _get_rate_limit_group_for_endpoint(endpoint: str, method: str) -> UpbitRateL
         return UpbitRateLimitGroup.REST_PRIVATE_DEFAULT
 
 
+@dataclass
+class BatchOrderItemResult:
+    """배치 주문 개별 결과 (제출 순서 index 기준)"""
+    index: int
+    order: Dict[str, Any]
+    success: bool
+    response: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    stage: str = 'dispatch'  # 'validation' | 'dispatch'
+
+
+@dataclass
+class BatchOrderResult:
+    """배치 주문 결과 - results 는 제출 순서와 동일"""
+    results: List[BatchOrderItemResult] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+    signing_ms: float = 0.0
+
+    @property
+    def succeeded(self) -> List[BatchOrderItemResult]:
+        return [result for result in self.results if result.success]
+
+    @property
+    def failed(self) -> List[BatchOrderItemResult]:
+        return [result for result in self.results if not result.success]
+
+    @property
+    def all_succeeded(self) -> bool:
+        return all(result.success for result in self.results)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'total': len(self.results),
+            'succeeded': len(self.succeeded),
+            'failed': len(self.failed),
+            'failed_indexes': [result.index for result in self.failed],
+            'elapsed_ms': self.elapsed_ms,
+            'signing_ms': self.signing_ms
+        }
+
+
 class DryRunConfig:
     """DRY-RUN 모드 설정"""
 
@@ -125,7 +181,9 @@ class UpbitPrivateClient:
                  dry_run: bool = True,
                  rate_limiter: Optional[UnifiedUpbitRateLimiter] = None,
                  loop: Optional[asyncio.AbstractEventLoop] = None,
-                 loop_guard: Optional[LoopGuard] = None):
+                 loop_guard: Optional[LoopGuard] = None,
+                 base_url: Optional[str] = None,
+                 paper_exchange: Optional[PaperExchange] = None):
         """
         업비트 프라이빗 API 클라이언트 초기화
 
@@ -134,6 +192,8 @@ class UpbitPrivateClient:
             secret_key: Upbit API Secret Key (None이면 환경변수/ApiKeyService에서 로드)
             dry_run: DRY-RUN 모드 활성화 (기본값: True, 안전성 우선)
             rate_limiter: 사용자 정의 Rate Limiter (기본값: 전역 공유 인스턴스)
+            base_url: API 기본 URL (기본값: BASE_URL, 로컬 모의 서버 등 테스트용)
+            paper_exchange: 로컬 페이퍼 트레이딩 거래소 (DRY-RUN 시 주문/조회/취소를 실제 매칭으로 처리)
 
         Raises:
             ValueError: 인증 정보가 없고 인증이 필요한 작업 시도 시
@@ -144,6 +204,7 @@ class UpbitPrivateClient:
         """
         # Infrastructure 로깅 초기화
         self._logger = create_component_logger("UpbitPrivateClient")
+        self._base_url = (base_url or self.BASE_URL).rstrip('/')
 
         # 루프 인식 및 LoopGuard 설정
         self._loop = loop  # 명시적 루프 저장 (None은 나중에 추론)
@@ -171,6 +232,11 @@ class UpbitPrivateClient:
         if dry_run:
             self._logger.info("🔒 DRY-RUN 모드 활성화: 실제 주문이 전송되지 않습니다")
 
+        # 페이퍼 트레이딩 거래소 (DRY-RUN 요청을 로컬 매칭 엔진으로 처리)
+        self._paper_exchange = paper_exchange
+        if paper_exchange is not None:
+            self._logger.info("📒 페이퍼 트레이딩 거래소 연결: DRY-RUN 요청을 로컬 매칭 엔진이 처리합니다")
+
         # Rate Limiter 설정 - 새로운 통합 Rate Limiter 사용
         self._rate_limiter = rate_limiter  # None이면 나중에 전역 인스턴스 사용
 
@@ -343,7 +409,10 @@ class UpbitPrivateClient:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
-        is_order_request: bool = False
+        is_order_request: bool = False,
+        signed_headers: Optional[Dict[str, str]] = None,
+        jitter: bool = True,
+        dry_run: Optional[bool] = None
     ) -> Any:
         """
         인증된 HTTP 요청 수행 - 통합 Rate Limiter + 429 자동 처리 및 재시도
@@ -354,6 +423,9 @@ class UpbitPrivateClient:
             params: 쿼리 파라미터
             data: 요청 바디 데이터
             is_order_request: 주문 관련 요청 여부 (DRY-RUN 적용 대상)
+            signed_headers: 미리 서명된 인증 헤더 (첫 시도에만 사용, 재시도는 nonce 중복 방지를 위해 재서명)
+            jitter: Micro-jitter 적용 여부 (배치 전송은 Rate Limiter 가 간격을 잡으므로 생략)
+            dry_run: 이 요청에 대한 DRY-RUN 모드 override (None이면 클라이언트 설정 따름, 공유 설정은 변경하지 않음)
 
         Returns:
             Any: API 응답 데이터
@@ -362,12 +434,20 @@ class UpbitPrivateClient:
             ValueError: 인증되지 않은 상태에서 인증 필요 요청 시
             Exception: API 오류 또는 네트워크 오류
         """
+        effective_dry_run = self._dry_run_config.enabled if dry_run is None else dry_run
+
+        # 페이퍼 트레이딩 (DRY-RUN 중 모든 프라이빗 요청을 로컬 매칭 엔진이 처리 - 인증/네트워크 없음)
+        if self._paper_exchange is not None and effective_dry_run:
+            self._stats['total_requests'] += 1
+            self._stats['dry_run_requests'] += 1
+            return self._paper_exchange.handle_request(method, endpoint, params, data)
+
         # 인증 확인
         if not self._auth.is_authenticated():
             raise ValueError("API 키가 설정되지 않았습니다. 인증이 필요한 API는 사용할 수 없습니다.")
 
         # DRY-RUN 모드 처리 (주문 요청만)
-        if is_order_request and self._dry_run_config.enabled:
+        if is_order_request and effective_dry_run:
             return await self._handle_dry_run_request(method, endpoint, params, data)
 
         await self._ensure_initialized()  # 루프 인식 및 LoopGuard 검증
@@ -376,7 +456,7 @@ class UpbitPrivateClient:
         if not self._session:
             raise RuntimeError("HTTP 세션이 초기화되지 않았습니다")
 
-        url = f"{self.BASE_URL}{endpoint}"
+        url = f"{self._base_url}{endpoint}"
         max_retries = 3
 
         # 요청별 429 재시도 카운터 초기화
@@ -410,14 +490,14 @@ class UpbitPrivateClient:
                     self._logger.debug(f"📦 요청 데이터: {data}")
 
                 # 🎲 Micro-jitter: 동시 요청 분산 (5~20ms 랜덤 지연)
-                await asyncio.sleep(random.uniform(0.005, 0.020))
+                if jitter:
+                    await asyncio.sleep(random.uniform(0.005, 0.020))
 
-                # 인증 헤더 생성
-                headers = self._auth.get_private_headers(query_params=params, request_body=data)
-                headers.update({
-                    'Content-Type': 'application/json',
-                    'User-Agent': 'upbit-autotrader-vscode/1.0'
-                })
+                # 인증 헤더 생성 (사전 서명 헤더는 첫 시도에만 사용)
+                if signed_headers is not None and attempt == 0:
+                    headers = signed_headers
+                else:
+                    headers = self._sign_headers(params, data)
 
                 # 순수 HTTP 요청 시간 측정 시작
                 http_start_time = time.perf_counter()
@@ -434,6 +514,7 @@ class UpbitPrivateClient:
                     # 순수 HTTP 응답 시간 저장 (Rate Limiter 대기 시간 제외)
                     response_time_ms = (http_end_time - http_start_time) * 1000
                     self._stats['last_http_response_time_ms'] = response_time_ms
+                    _latency_tracer.record_seconds("rest.private.round_trip", http_end_time - http_start_time)
                     http_latency_ms += response_time_ms
 
                     # 평균 응답 시간 업데이트
@@ -456,7 +537,7 @@ class UpbitPrivateClient:
 
                         # 🚀 지연된 커밋: API 성공 후 타임스탬프 윈도우에 커밋
                         # DRY-RUN 모드가 아닌 경우에만 커밋 수행
-                        if not (is_order_request and self._dry_run_config.enabled):
+                        if not (is_order_request and effective_dry_run):
                             self._logger.debug(f"🔥 API 성공! 지연된 커밋 실행: {method} {endpoint}")
                             await rate_limiter.commit_timestamp(endpoint, method)
                             self._logger.debug(f"✅ 지연된 커밋 완료: {method} {endpoint}")
@@ -567,6 +648,13 @@ class UpbitPrivateClient:
 
         raise Exception("모든 재시도 실패")
 
+    def _sign_headers(self, params: Optional[Dict[str, Any]] = None,
+                      data: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+        """인증 헤더 생성 (요청마다 새 nonce)"""
+        headers = self._auth.get_private_headers(query_params=params, request_body=data)
+        headers['User-Agent'] = 'upbit-autotrader-vscode/1.0'
+        return headers
+
     async def _handle_dry_run_request(
         self,
         method: str,
@@ -742,11 +830,12 @@ class UpbitPrivateClient:
         self,
         market: str,
         side: Literal['bid', 'ask'],
-        ord_type: Literal['limit', 'price', 'market'],
+        ord_type: Literal['limit', 'price', 'market', 'best'],
         volume: Optional[Decimal] = None,
         price: Optional[Decimal] = None,
         identifier: Optional[str] = None,
-        dry_run: Optional[bool] = None
+        dry_run: Optional[bool] = None,
+        time_in_force: Optional[Literal['ioc', 'fok']] = None
     ) -> Dict[str, Any]:
         """
         주문 생성
@@ -760,10 +849,12 @@ class UpbitPrivateClient:
                 - 'limit': 지정가 주문 (volume, price 필수)
                 - 'price': 시장가 매수 (price 필수)
                 - 'market': 시장가 매도 (volume 필수)
+                - 'best': 최유리 주문 (매수 price / 매도 volume, time_in_force 필수)
             volume: 주문 수량 (지정가, 시장가 매도 시 필수)
             price: 주문 가격 (지정가, 시장가 매수 시 필수)
             identifier: 조회용 사용자 지정값 (최대 40자)
             dry_run: 이 요청에 대한 DRY-RUN 모드 override (None이면 클라이언트 설정 따름)
+            time_in_force: 주문 체결 조건 ('ioc': 즉시 체결 후 잔량 취소, 'fok': 전량 체결 아니면 취소)
 
         Returns:
             Dict[str, Any]: 생성된 주문 정보
@@ -814,21 +905,67 @@ class UpbitPrivateClient:
             ValueError: 잘못된 파라미터 조합
             Exception: API 오류
         """
-        # 파라미터 검증
+        data = self._build_order_data(market, side, ord_type, volume, price, identifier, time_in_force)
+
+        # DRY-RUN 모드 결정 (요청별 override 또는 클라이언트 설정)
+        effective_dry_run = dry_run if dry_run is not None else self._dry_run_config.enabled
+
+        response = await self._make_request('POST', '/orders', data=data, is_order_request=True, dry_run=dry_run)
+
+        order_info = f"{side} {ord_type}"
+        if volume:
+            order_info += f" volume={volume}"
+        if price:
+            order_info += f" price={price}"
+
+        if effective_dry_run:
+            self._logger.info(f"🔒 [DRY-RUN] 주문 생성: {market} {order_info}")
+        else:
+            self._logger.info(f"📝 주문 생성 완료: {market} {order_info}")
+
+        return response
+
+    @staticmethod
+    def _build_order_data(
+        market: str,
+        side: str,
+        ord_type: str,
+        volume: Optional[Decimal] = None,
+        price: Optional[Decimal] = None,
+        identifier: Optional[str] = None,
+        time_in_force: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        주문 파라미터 검증 및 요청 바디 구성
+
+        Raises:
+            ValueError: 잘못된 파라미터 조합
+        """
         if not market:
             raise ValueError("마켓 코드는 필수입니다")
 
+        if side not in ('bid', 'ask'):
+            raise ValueError(f"지원하지 않는 주문 종류입니다: {side}")
+
         if ord_type == 'limit' and (volume is None or price is None):
             raise ValueError("지정가 주문에는 volume과 price가 모두 필요합니다")
         elif ord_type == 'price' and price is None:
             raise ValueError("시장가 매수에는 price가 필요합니다")
         elif ord_type == 'market' and volume is None:
             raise ValueError("시장가 매도에는 volume이 필요합니다")
+        elif ord_type == 'best' and (price if side == 'bid' else volume) is None:
+            raise ValueError("최유리 주문에는 매수 시 price, 매도 시 volume이 필요합니다")
+        elif ord_type not in ('limit', 'price', 'market', 'best'):
+            raise ValueError(f"지원하지 않는 주문 타입입니다: {ord_type}")
+
+        if time_in_force is not None and time_in_force not in ('ioc', 'fok'):
+            raise ValueError(f"지원하지 않는 주문 체결 조건입니다: {time_in_force}")
+        if ord_type == 'best' and time_in_force is None:
+            raise ValueError("최유리 주문에는 time_in_force(ioc/fok)가 필요합니다")
 
         if identifier and len(identifier) > 40:
             raise ValueError("identifier는 최대 40자까지 가능합니다")
 
-        # 주문 데이터 구성
         data = {
             'market': market,
             'side': side,
@@ -841,35 +978,129 @@ class UpbitPrivateClient:
             data['price'] = str(price)
         if identifier is not None:
             data['identifier'] = identifier
+        if time_in_force is not None:
+            data['time_in_force'] = time_in_force
 
-        # DRY-RUN 모드 결정 (요청별 override 또는 클라이언트 설정)
-        effective_dry_run = dry_run if dry_run is not None else self._dry_run_config.enabled
+        return data
 
-        # 임시로 DRY-RUN 설정 변경
-        original_dry_run = self._dry_run_config.enabled
-        if dry_run is not None:
-            self._dry_run_config.enabled = dry_run
+    async def place_orders_batch(
+        self,
+        orders: Sequence[Dict[str, Any]],
+        dry_run: Optional[bool] = None,
+        max_concurrency: Optional[int] = None
+    ) -> BatchOrderResult:
+        """
+        여러 주문을 한 번에 생성 - 사전 검증/서명 후 주문 그룹 Rate Limit 안에서 동시 전송
 
-        try:
-            response = await self._make_request('POST', '/orders', data=data, is_order_request=True)
+        모든 주문을 먼저 검증하고 JWT 를 미리 서명한 뒤, REST_PRIVATE_ORDER 그룹 예산 안에서
+        동시에 전송합니다. 단건 place_order 와 달리 Micro-jitter 를 생략합니다 (간격은 Rate Limiter 가 담당).
+        일부 주문이 실패해도 나머지는 계속 진행하며, 결과는 제출 순서대로 반환합니다.
 
-            order_info = f"{side} {ord_type}"
-            if volume:
-                order_info += f" volume={volume}"
-            if price:
-                order_info += f" price={price}"
+        Args:
+            orders: place_order 인자와 같은 키를 가진 주문 목록
+                [{'market': 'KRW-BTC', 'side': 'bid', 'ord_type': 'limit',
+                  'volume': Decimal('0.001'), 'price': Decimal('50000000'), 'identifier': 'a-1'}, ...]
+            dry_run: 이 배치에 대한 DRY-RUN 모드 override (None이면 클라이언트 설정 따름)
+            max_concurrency: 동시 전송 상한 (기본값: 주문 그룹 초당 허용량)
 
-            if effective_dry_run:
-                self._logger.info(f"🔒 [DRY-RUN] 주문 생성: {market} {order_info}")
-            else:
-                self._logger.info(f"📝 주문 생성 완료: {market} {order_info}")
+        Returns:
+            BatchOrderResult: 주문별 성공/실패 (검증 실패는 stage='validation', 전송하지 않음)
 
-            return response
+        Raises:
+            ValueError: 인증되지 않은 상태
+        """
+        paper_trading = self._paper_exchange is not None and (
+            dry_run if dry_run is not None else self._dry_run_config.enabled)
+        if not paper_trading and not self._auth.is_authenticated():
+            raise ValueError("API 키가 설정되지 않았습니다. 인증이 필요한 API는 사용할 수 없습니다.")
 
-        finally:
-            # DRY-RUN 설정 복원
-            if dry_run is not None:
-                self._dry_run_config.enabled = original_dry_run
+        batch_start = time.perf_counter()
+        results: List[Optional[BatchOrderItemResult]] = [None] * len(orders)
+        prepared = []  # (index, data)
+        seen_identifiers = set()
+
+        # 1) 전체 사전 검증 - 잘못된 주문은 전송하지 않고 실패로 기록
+        for index, order in enumerate(orders):
+            try:
+                data = self._build_order_data(
+                    order.get('market'),
+                    order.get('side'),
+                    order.get('ord_type'),
+                    volume=order.get('volume'),
+                    price=order.get('price'),
+                    identifier=order.get('identifier'),
+                    time_in_force=order.get('time_in_force')
+                )
+                identifier = data.get('identifier')
+                if identifier is not None:
+                    if identifier in seen_identifiers:
+                        raise ValueError(f"배치 내 identifier 중복: {identifier}")
+                    seen_identifiers.add(identifier)
+            except (ValueError, AttributeError) as e:
+                results[index] = BatchOrderItemResult(
+                    index=index, order=dict(order), success=False, error=str(e), stage='validation'
+                )
+                continue
+            prepared.append((index, data))
+
+        effective_dry_run = dry_run if dry_run is not None else self._dry_run_config.enabled
+
+        # 2) 사전 서명 (DRY-RUN 은 전송하지 않으므로 서명 생략)
+        signing_start = time.perf_counter()
+        signed = [
+            (index, data, None if effective_dry_run else self._sign_headers(data=data))
+            for index, data in prepared
+        ]
+        signing_ms = (time.perf_counter() - signing_start) * 1000
+
+        # 3) 동시 전송 - GCRA 버스트가 서버 1초 윈도우를 넘지 않도록 배치 자체 윈도우로도 간격 조절
+        rate_limiter = await self._ensure_rate_limiter()
+        order_config = rate_limiter.group_configs.get(UpbitRateLimitGroup.REST_PRIVATE_ORDER)
+        budget = max(1, int(order_config.rps)) if order_config else 8
+        semaphore = asyncio.Semaphore(max_concurrency or budget)
+        sent_at: collections.deque = collections.deque()
+        pacing_lock = asyncio.Lock()
+
+        async def wait_for_budget() -> None:
+            async with pacing_lock:
+                while True:
+                    now = time.monotonic()
+                    while sent_at and now - sent_at[0] >= BATCH_ORDER_WINDOW_SECONDS:
+                        sent_at.popleft()
+                    if len(sent_at) < budget:
+                        sent_at.append(now)
+                        return
+                    await asyncio.sleep(BATCH_ORDER_WINDOW_SECONDS - (now - sent_at[0]))
+
+        async def dispatch(index: int, data: Dict[str, Any], headers: Optional[Dict[str, str]]) -> None:
+            async with semaphore:
+                if not effective_dry_run:
+                    await wait_for_budget()
+                try:
+                    response = await self._make_request(
+                        'POST', '/orders', data=data, is_order_request=True,
+                        signed_headers=headers, jitter=False, dry_run=effective_dry_run
+                    )
+                    results[index] = BatchOrderItemResult(index=index, order=data, success=True, response=response)
+                except Exception as e:
+                    results[index] = BatchOrderItemResult(index=index, order=data, success=False, error=str(e))
+
+        await asyncio.gather(*(dispatch(index, data, headers) for index, data, headers in signed))
+
+        batch_result = BatchOrderResult(
+            results=[result for result in results if result is not None],
+            elapsed_ms=(time.perf_counter() - batch_start) * 1000,
+            signing_ms=signing_ms
+        )
+        summary = batch_result.summary()
+        prefix = f"{self._dry_run_config.log_prefix} " if effective_dry_run else ""
+        self._logger.info(
+            f"📝 {prefix}배치 주문 완료: {summary['succeeded']}/{summary['total']}건 성공 "
+            f"({batch_result.elapsed_ms:.1f}ms, 서명 {signing_ms:.2f}ms)"
+        )
+        if summary['failed']:
+            self._logger.warning(f"⚠️ 배치 주문 실패 index: {summary['failed_indexes']}")
+        return batch_result
 
     async def get_order(self, uuid: Optional[str] = None, identifier: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -1169,25 +1400,14 @@ class UpbitPrivateClient:
         # DRY-RUN 모드 결정
         effective_dry_run = dry_run if dry_run is not None else self._dry_run_config.enabled
 
-        # 임시로 DRY-RUN 설정 변경
-        original_dry_run = self._dry_run_config.enabled
-        if dry_run is not None:
-            self._dry_run_config.enabled = dry_run
-
-        try:
-            response = await self._make_request('DELETE', '/order', data=data, is_order_request=True)
-
-            if effective_dry_run:
-                self._logger.info(f"🔒 [DRY-RUN] 주문 취소: {uuid or identifier}")
-            else:
-                self._logger.info(f"❌ 주문 취소 완료: {uuid or identifier}")
+        response = await self._make_request('DELETE', '/order', data=data, is_order_request=True, dry_run=dry_run)
 
-            return response
+        if effective_dry_run:
+            self._logger.info(f"🔒 [DRY-RUN] 주문 취소: {uuid or identifier}")
+        else:
+            self._logger.info(f"❌ 주문 취소 완료: {uuid or identifier}")
 
-        finally:
-            # DRY-RUN 설정 복원
-            if dry_run is not None:
-                self._dry_run_config.enabled = original_dry_run
+        return response
 
     # ================================================================
     # 고급 주문 기능 - 대량 처리 및 특수 주문
@@ -1240,26 +1460,15 @@ class UpbitPrivateClient:
         # DRY-RUN 모드 결정
         effective_dry_run = dry_run if dry_run is not None else self._dry_run_config.enabled
 
-        # 임시로 DRY-RUN 설정 변경
-        original_dry_run = self._dry_run_config.enabled
-        if dry_run is not None:
-            self._dry_run_config.enabled = dry_run
-
-        try:
-            response = await self._make_request('DELETE', '/orders/uuids', params=params, is_order_request=True)
-
-            count = len(uuids) if uuids else len(identifiers or [])
-            if effective_dry_run:
-                self._logger.info(f"🔒 [DRY-RUN] 일괄 주문 취소: {count}개 주문")
-            else:
-                self._logger.info(f"❌ 일괄 주문 취소 완료: {count}개 주문")
+        response = await self._make_request('DELETE', '/orders/uuids', params=params, is_order_request=True, dry_run=dry_run)
 
-            return response
+        count = len(uuids) if uuids else len(identifiers or [])
+        if effective_dry_run:
+            self._logger.info(f"🔒 [DRY-RUN] 일괄 주문 취소: {count}개 주문")
+        else:
+            self._logger.info(f"❌ 일괄 주문 취소 완료: {count}개 주문")
 
-        finally:
-            # DRY-RUN 설정 복원
-            if dry_run is not None:
-                self._dry_run_config.enabled = original_dry_run
+        return response
 
     async def batch_cancel_orders(
         self,
@@ -1309,25 +1518,14 @@ class UpbitPrivateClient:
         # DRY-RUN 모드 결정
         effective_dry_run = dry_run if dry_run is not None else self._dry_run_config.enabled
 
-        # 임시로 DRY-RUN 설정 변경
-        original_dry_run = self._dry_run_config.enabled
-        if dry_run is not None:
-            self._dry_run_config.enabled = dry_run
-
-        try:
-            response = await self._make_request('DELETE', '/orders/open', params=params, is_order_request=True)
+        response = await self._make_request('DELETE', '/orders/open', params=params, is_order_request=True, dry_run=dry_run)
 
-            if effective_dry_run:
-                self._logger.warning(f"🔒 [DRY-RUN] 대량 주문 취소: {cancel_side} 방향, 최대 {count}개")
-            else:
-                self._logger.warning(f"❌ 대량 주문 취소 완료: {cancel_side} 방향, 최대 {count}개")
-
-            return response
+        if effective_dry_run:
+            self._logger.warning(f"🔒 [DRY-RUN] 대량 주문 취소: {cancel_side} 방향, 최대 {count}개")
+        else:
+            self._logger.warning(f"❌ 대량 주문 취소 완료: {cancel_side} 방향, 최대 {count}개")
 
-        finally:
-            # DRY-RUN 설정 복원
-            if dry_run is not None:
-                self._dry_run_config.enabled = original_dry_run
+        return response
 
     # ================================================================
     # 체결 내역 조회
@@ -1430,7 +1628,9 @@ async def create_upbit_private_client_async(
     access_key: Optional[str] = None,
     secret_key: Optional[str] = None,
     dry_run: bool = True,
-    rate_limiter: Optional[UnifiedUpbitRateLimiter] = None
+    rate_limiter: Optional[UnifiedUpbitRateLimiter] = None,
+    base_url: Optional[str] = None,
+    paper_exchange: Optional[PaperExchange] = None
 ) -> UpbitPrivateClient:
     """
     업비트 프라이빗 API 클라이언트 비동기 생성 (편의 함수)
@@ -1440,6 +1640,8 @@ async def create_upbit_private_client_async(
         secret_key: Upbit API Secret Key (None이면 ApiKeyService에서 로드)
         dry_run: DRY-RUN 모드 활성화 (기본값: True)
         rate_limiter: 사용자 정의 Rate Limiter (기본값: 전역 공유 인스턴스)
+        base_url: API 기본 URL (기본값: 실제 업비트)
+        paper_exchange: 로컬 페이퍼 트레이딩 거래소 (DRY-RUN 요청 처리)
 
     Returns:
         UpbitPrivateClient: 초기화된 클라이언트 인스턴스
@@ -1448,7 +1650,9 @@ async def create_upbit_private_client_async(
         access_key=access_key,
         secret_key=secret_key,
         dry_run=dry_run,
-        rate_limiter=rate_limiter
+        rate_limiter=rate_limiter,
+        base_url=base_url,
+        paper_exchange=paper_exchange
     )
 
     # 세션 미리 초기화
@@ -47,6 +47,7 @@ import re
 from typing import List, Dict, Any, Optional, Union, Tuple
 
 from upbit_auto_trading.infrastructure.logging import create_component_logger
+from upbit_auto_trading.infrastructure.logging.performance.latency_tracer import get_latency_tracer
 from upbit_auto_trading.infrastructure.runtime import (
     LoopGuard,
     ensure_main_loop,
@@ -60,6 +61,9 @@ from .rate_limiter import (
     UpbitRateLimitGroup
 )
 
+# HTTP 왕복 지연 측정 (PerformanceMonitor 활성 시)
+_latency_tracer = get_latency_tracer()
+
 
 def _parse_upbit_remaining_req(remaining_req: str) -> Tuple[Optional[str], Optional[int], Optional[int]]:
     """
@@ -131,13 +135,15 @@ class UpbitPublicClient:
                  enable_gzip: bool = True,
                  rate_limiter: Optional[UnifiedUpbitRateLimiter] = None,
                  loop: Optional[asyncio.AbstractEventLoop] = None,
-                 loop_guard: Optional[LoopGuard] = None):
+                 loop_guard: Optional[LoopGuard] = None,
+                 base_url: Optional[str] = None):
         """
         업비트 공개 API 클라이언트 초기화
 
         Args:
             enable_gzip: gzip 압축 사용 여부 (기본값: True, 대역폭 83% 절약 가능)
             rate_limiter: 사용자 정의 Rate Limiter (기본값: 전역 공유 인스턴스)
+            base_url: API 기본 URL (기본값: BASE_URL, 로컬 모의 서버 벤치마크용)
 
         Note:
             공개 API 클라이언트는 인증이 불필요하며,
@@ -159,6 +165,9 @@ class UpbitPublicClient:
         # gzip 압축 설정
         self._enable_gzip = enable_gzip
 
+        # API 기본 URL (모의 서버 사용 시 교체)
+        self._base_url = (base_url or self.BASE_URL).rstrip('/')
+
         # HTTP 세션 관리
         self._session: Optional[aiohttp.ClientSession] = None
 
@@ -320,7 +329,7 @@ class UpbitPublicClient:
         if not self._session:
             raise RuntimeError("HTTP 세션이 초기화되지 않았습니다")
 
-        url = f"{self.BASE_URL}{endpoint}"
+        url = f"{self._base_url}{endpoint}"
         max_retries = 3
 
         # 요청별 429 재시도 카운터 초기화
@@ -361,6 +370,7 @@ class UpbitPublicClient:
                     # 순수 HTTP 응답 시간 저장 (Rate Limiter 대기 시간 제외)
                     response_time_ms = (http_end_time - http_start_time) * 1000
                     self._stats['last_http_response_time_ms'] = response_time_ms
+                    _latency_tracer.record_seconds("rest.public.round_trip", http_end_time - http_start_time)
                     http_latency_ms += response_time_ms  # 단일 요청이므로 덮어쓰기와 동일
 
                     # 평균 응답 시간 업데이트
@@ -1368,7 +1378,8 @@ class UpbitPublicClient:
 
 def create_upbit_public_client(
     enable_gzip: bool = True,
-    rate_limiter: Optional[UnifiedUpbitRateLimiter] = None
+    rate_limiter: Optional[UnifiedUpbitRateLimiter] = None,
+    base_url: Optional[str] = None
 ) -> UpbitPublicClient:
     """
     업비트 공개 API 클라이언트 생성 (편의 함수)
@@ -1376,6 +1387,7 @@ def create_upbit_public_client(
     Args:
         enable_gzip: gzip 압축 사용 여부 (기본값: True, 대역폭 83% 절약)
         rate_limiter: 사용자 정의 Rate Limiter (기본값: 전역 공유 인스턴스)
+        base_url: API 기본 URL (기본값: 실제 업비트 서버)
 
     Returns:
         UpbitPublicClient: 설정된 클라이언트 인스턴스
@@ -1393,13 +1405,15 @@ def create_upbit_public_client(
     """
     return UpbitPublicClient(
         enable_gzip=enable_gzip,
-        rate_limiter=rate_limiter
+        rate_limiter=rate_limiter,
+        base_url=base_url
     )
 
 
 async def create_upbit_public_client_async(
     enable_gzip: bool = True,
-    rate_limiter: Optional[UnifiedUpbitRateLimiter] = None
+    rate_limiter: Optional[UnifiedUpbitRateLimiter] = None,
+    base_url: Optional[str] = None
 ) -> UpbitPublicClient:
     """
     업비트 공개 API 클라이언트 비동기 생성 (편의 함수)
@@ -1418,7 +1432,8 @@ async def create_upbit_public_client_async(
     """
     client = UpbitPublicClient(
         enable_gzip=enable_gzip,
-        rate_limiter=rate_limiter
+        rate_limiter=rate_limiter,
+        base_url=base_url
     )
 
     # 세션 미리 초기화
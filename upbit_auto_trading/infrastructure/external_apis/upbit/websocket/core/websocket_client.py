@@ -18,7 +18,7 @@ from upbit_auto_trading.infrastructure.logging import create_component_logger
 
 from .websocket_types import (
     TickerEvent, OrderbookEvent, TradeEvent, CandleEvent, MyOrderEvent, MyAssetEvent,
-    SubscriptionSpec, DataType, HealthStatus, BaseWebSocketEvent
+    SubscriptionSpec, DataType, HealthStatus, BaseWebSocketEvent, WebSocketType, ConnectionState
 )
 from .websocket_manager import get_websocket_manager
 
@@ -48,6 +48,7 @@ class WebSocketClient:
         self._manager = None
         self._subscriptions: Dict[str, SubscriptionSpec] = {}
         self._callbacks: Dict[str, Callable] = {}
+        self._connection_listeners: List[Callable[[WebSocketType, ConnectionState], None]] = []
         self._created_at = time.time()
         self._is_active = True
 
@@ -275,6 +276,17 @@ class WebSocketClient:
             self.logger.error(f"💥 구독 목록 조회 실패: {e}")
             return False
 
+    async def add_connection_listener(self, callback: Callable[[WebSocketType, ConnectionState], None]) -> None:
+        """
+        매니저 연결 상태 변경 리스너 등록 (매니저 내부 재연결 포함, cleanup 시 자동 해제)
+
+        Args:
+            callback: (연결 타입, 새 상태) 를 받는 동기 함수
+        """
+        await self._ensure_manager()
+        self._manager.add_connection_listener(callback)
+        self._connection_listeners.append(callback)
+
     # ================================================================
     # 내부 구현
     # ================================================================
@@ -454,9 +466,12 @@ class WebSocketClient:
 
             self._is_active = False
 
-            # 매니저에서 구독 해제
+            # 매니저에서 구독/연결 상태 리스너 해제
             if self._manager:
+                for callback in self._connection_listeners:
+                    self._manager.remove_connection_listener(callback)
                 await self._manager.unregister_component(self.component_id)
+            self._connection_listeners.clear()
 
             # 내부 상태 정리
             self._subscriptions.clear()
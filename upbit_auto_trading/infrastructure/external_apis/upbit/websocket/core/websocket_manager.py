@@ -13,7 +13,7 @@ import asyncio
 import weakref
 import time
 import json
-from typing import Dict, List, Optional, Any, Set
+from typing import Callable, Dict, List, Optional, Any, Set
 
 try:
     import websockets
@@ -24,6 +24,7 @@ except ImportError:
     WEBSOCKETS_AVAILABLE = False
 
 from upbit_auto_trading.infrastructure.logging import create_component_logger
+from upbit_auto_trading.infrastructure.logging.performance.latency_tracer import get_latency_tracer
 from .websocket_types import (
     WebSocketType, GlobalManagerState, ConnectionState, DataType,
     BaseWebSocketEvent, SubscriptionSpec, HealthStatus
@@ -40,6 +41,9 @@ from upbit_auto_trading.infrastructure.external_apis.upbit.rate_limiter import (
     UpbitRateLimitGroup
 )
 
+# 메시지 디코딩 지연 측정 (PerformanceMonitor 활성 시)
+_latency_tracer = get_latency_tracer()
+
 # WebSocket Rate Limiter 전역 인스턴스
 _websocket_rate_limiter: Optional[UnifiedUpbitRateLimiter] = None
 
@@ -108,6 +112,9 @@ class WebSocketManager:
         # 🔧 Graceful Shutdown을 위한 Event 기반 중단 메커니즘 (Lazy Initialization)
         self._shutdown_event: Optional[asyncio.Event] = None
 
+        # 연결 상태 변경 리스너 (끊김/재연결 구간 감지 - 실시간 캔들 집계 등)
+        self._connection_listeners: List[Callable[[WebSocketType, ConnectionState], None]] = []
+
         # 연결 헬스체크를 위한 마지막 메시지 수신 시간 추적
         self._last_message_times: Dict[WebSocketType, Optional[float]] = {
             WebSocketType.PUBLIC: None,
@@ -919,7 +926,7 @@ class WebSocketManager:
 
         # 모든 재시도 실패
         self.logger.error(f"🚨 {connection_type} 연결 완전 실패 (최대 재시도 횟수 초과)")
-        self._connection_states[connection_type] = ConnectionState.ERROR
+        self._set_connection_state(connection_type, ConnectionState.ERROR)
 
     # ================================================================
     # 컴포넌트 관리
@@ -1032,7 +1039,7 @@ class WebSocketManager:
             if not WEBSOCKETS_AVAILABLE:
                 raise RuntimeError("websockets 라이브러리가 설치되지 않았습니다")
 
-            self._connection_states[connection_type] = ConnectionState.CONNECTING
+            self._set_connection_state(connection_type, ConnectionState.CONNECTING)
 
             # 🚀 WebSocket 연결 전용 빠른 Rate Limiter 적용 (타임아웃 3초)
             try:
@@ -1140,7 +1147,7 @@ class WebSocketManager:
                     await asyncio.sleep(0.5)
 
             self._connections[connection_type] = connection
-            self._connection_states[connection_type] = ConnectionState.CONNECTED
+            self._set_connection_state(connection_type, ConnectionState.CONNECTED)
             self._rate_limit_stats['total_connections'] += 1
 
             # 연결 메트릭스 업데이트
@@ -1167,7 +1174,7 @@ class WebSocketManager:
             self.logger.info(f"WebSocket 연결 성공: {connection_type} -> {url} (압축: {compression is not None})")
 
         except Exception as e:
-            self._connection_states[connection_type] = ConnectionState.DISCONNECTED
+            self._set_connection_state(connection_type, ConnectionState.DISCONNECTED)
             self.logger.error(f"WebSocket 연결 실패 ({connection_type}): {e}")
             raise
 
@@ -1190,7 +1197,7 @@ class WebSocketManager:
 
             # 상태 초기화
             self._connections[connection_type] = None
-            self._connection_states[connection_type] = ConnectionState.DISCONNECTED
+            self._set_connection_state(connection_type, ConnectionState.DISCONNECTED)
             self._message_tasks[connection_type] = None
 
             # 메트릭스 리셋
@@ -1443,11 +1450,12 @@ class WebSocketManager:
                     self.logger.debug(f"📨 WebSocket 메시지 수신 ({connection_type}): {message_preview}")
 
                     # JSON 파싱 (바이트/문자열 호환)
-                    if isinstance(message, bytes):
-                        message_str = message.decode('utf-8')
-                    else:
-                        message_str = message
-                    data = json.loads(message_str)
+                    with _latency_tracer.span("websocket.decode"):
+                        if isinstance(message, bytes):
+                            message_str = message.decode('utf-8')
+                        else:
+                            message_str = message
+                        data = json.loads(message_str)
 
                     # SIMPLE 포맷 자동 변환 (Simple Mode 수신 데이터 처리)
                     from upbit_auto_trading.infrastructure.external_apis.upbit.websocket.support.websocket_config import (
@@ -1530,7 +1538,7 @@ class WebSocketManager:
             else:
                 self.logger.error(f"메시지 수신 오류 ({connection_type}): {e}")
         finally:
-            self._connection_states[connection_type] = ConnectionState.DISCONNECTED
+            self._set_connection_state(connection_type, ConnectionState.DISCONNECTED)
             # 연결 종료 시 마지막 메시지 시간 초기화
             self._last_message_times[connection_type] = None
 
@@ -1650,6 +1658,28 @@ class WebSocketManager:
         """연결 상태 반환"""
         return self._connection_states[connection_type]
 
+    def add_connection_listener(self, callback: Callable[[WebSocketType, ConnectionState], None]) -> None:
+        """연결 상태 변경 리스너 등록 (내부 재연결 포함, 이벤트 루프 스레드에서 동기 호출)"""
+        if callback not in self._connection_listeners:
+            self._connection_listeners.append(callback)
+
+    def remove_connection_listener(self, callback: Callable[[WebSocketType, ConnectionState], None]) -> None:
+        """연결 상태 변경 리스너 해제"""
+        if callback in self._connection_listeners:
+            self._connection_listeners.remove(callback)
+
+    def _set_connection_state(self, connection_type: WebSocketType, state: ConnectionState) -> None:
+        """연결 상태 변경 + 리스너 통지 (같은 상태 재설정은 통지하지 않음)"""
+        previous = self._connection_states[connection_type]
+        self._connection_states[connection_type] = state
+        if previous == state:
+            return
+        for callback in list(self._connection_listeners):
+            try:
+                callback(connection_type, state)
+            except Exception as e:
+                self.logger.warning(f"연결 상태 리스너 오류 ({connection_type} → {state}): {e}")
+
     def get_connection_metrics(self, connection_type: WebSocketType) -> Dict[str, Any]:
         """특정 연결의 메트릭스 반환"""
         try:
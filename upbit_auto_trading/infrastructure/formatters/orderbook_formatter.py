@@ -6,11 +6,13 @@
 - 수량 포맷팅
 - 스프레드 계산
 - 테이블 데이터 변환
+- 호가 단위별 가격/수량 문자열 캐시 (증분 렌더링용)
 """
 
 from typing import Dict, Any, List, Tuple
 from decimal import Decimal
 
+from upbit_auto_trading.domain.market.price_utils import get_tick_size
 from upbit_auto_trading.infrastructure.logging import create_component_logger
 
 
@@ -188,3 +190,66 @@ class OrderbookFormatter:
                 return False
 
         return True
+
+
+class OrderbookLevelTextCache:
+    """
+    호가 레벨 가격/수량 문자열 캐시
+
+    호가 메시지는 같은 가격·수량 값이 반복되므로 값별 문자열을 재사용합니다.
+    - KRW 마켓 가격: price_utils 호가 단위 기준 소수 자릿수 (캐시 미스일 때만 호가 단위 계산)
+    - 그 외 마켓 가격 / 수량: OrderbookFormatter 규칙 그대로
+    - 마켓이 바뀌면 가격 캐시 초기화, 항목 수가 max_entries를 넘으면 비움
+    """
+
+    def __init__(self, formatter: OrderbookFormatter, market: str = "KRW", max_entries: int = 4096):
+        self._formatter = formatter
+        self._market = market
+        self._max_entries = max_entries
+        self._price_texts: Dict[float, str] = {}
+        self._quantity_texts: Dict[float, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def market(self) -> str:
+        return self._market
+
+    def set_market(self, market: str) -> None:
+        if market != self._market:
+            self._market = market
+            self._price_texts.clear()
+
+    def price_text(self, price: float) -> str:
+        text = self._price_texts.get(price)
+        if text is not None:
+            self.hits += 1
+            return text
+        self.misses += 1
+        if len(self._price_texts) >= self._max_entries:
+            self._price_texts.clear()
+        text = self._format_price(price)
+        self._price_texts[price] = text
+        return text
+
+    def quantity_text(self, quantity: float) -> str:
+        text = self._quantity_texts.get(quantity)
+        if text is not None:
+            self.hits += 1
+            return text
+        self.misses += 1
+        if len(self._quantity_texts) >= self._max_entries:
+            self._quantity_texts.clear()
+        text = self._formatter._format_quantity(quantity)
+        self._quantity_texts[quantity] = text
+        return text
+
+    def _format_price(self, price: float) -> str:
+        if self._market != "KRW" or price <= 0:
+            return self._formatter._format_price(price, self._market)
+        try:
+            tick = get_tick_size(Decimal(repr(price)))
+        except (ValueError, ArithmeticError):
+            return self._formatter._format_price(price, self._market)
+        decimals = max(0, -tick.as_tuple().exponent)
+        return f"{price:,.{decimals}f}"
@@ -124,7 +124,9 @@ class LoggingConfigManager:
                     'backup_count': 5
                 },
                 'advanced': {
-                    'performance_monitoring': False
+                    'performance_monitoring': False,
+                    'queued_file_logging': True,  # 파일 기록을 writer 스레드로 분리
+                    'log_queue_size': 10000
                 }
             },
             'runtime': {
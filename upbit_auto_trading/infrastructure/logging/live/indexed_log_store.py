@@ -0,0 +1,192 @@
+"""
+Indexed Log Store
+=================
+
+로그 뷰어용 고정 용량 링 저장소 + 레벨/컴포넌트 인덱스.
+
+- 각 라인은 단조 증가 시퀀스 번호(seq)를 가지며 seq % capacity 슬롯에 저장 (O(1) 조회)
+- 레벨별/컴포넌트별 인덱스는 seq 오름차순 deque 이므로, 가장 오래된 라인 축출 시 popleft 한 번으로 정리
+- 필터 변경 시 전체 라인 대신 가장 선택적인 인덱스만 순회할 수 있도록 후보 seq 목록 제공
+- UI 스레드 전용 (스레드 간 공급은 LiveLogBuffer가 담당)
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from itertools import chain
+from typing import Deque, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+LOG_LEVELS: Tuple[str, ...] = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+
+
+@dataclass(frozen=True)
+class LogFilter:
+    """로그 뷰어 필터 (빈 값은 조건 없음)"""
+    levels: Optional[FrozenSet[str]] = None  # None = 모든 레벨
+    component: str = ''  # 로거 이름 부분 일치 (소문자)
+    search_text: str = ''  # 메시지 부분 일치 (소문자)
+
+    @classmethod
+    def create(cls, levels: Optional[Iterable[str]] = None, component: str = '', search_text: str = '') -> 'LogFilter':
+        level_set = frozenset(levels) if levels is not None else None
+        if level_set is not None and level_set >= frozenset(LOG_LEVELS):
+            level_set = None
+        return cls(level_set, component.strip().lower(), search_text.strip().lower())
+
+    @property
+    def is_passthrough(self) -> bool:
+        return self.levels is None and not self.component and not self.search_text
+
+    def narrows(self, other: 'LogFilter') -> bool:
+        """self의 결과가 반드시 other 결과의 부분집합인지 (other 결과만 다시 걸러도 되는지)"""
+        if other.levels is not None and (self.levels is None or not self.levels <= other.levels):
+            return False
+        return other.component in self.component and other.search_text in self.search_text
+
+
+class IndexedLogStore:
+    """고정 용량 링 저장소 (레벨/컴포넌트 인덱스 포함)"""
+
+    def __init__(self, capacity: int = 500_000) -> None:
+        self.capacity = capacity
+        self._lines: List[Optional[str]] = [None] * capacity
+        self._search_keys: List[Optional[str]] = [None] * capacity
+        self._levels: List[Optional[str]] = [None] * capacity
+        self._components: List[Optional[str]] = [None] * capacity
+
+        self._first_seq = 1
+        self._next_seq = 1
+
+        self._level_index: Dict[str, Deque[int]] = {level: deque() for level in LOG_LEVELS}
+        self._component_index: Dict[str, Deque[int]] = {}
+
+    # ==================== 조회 ====================
+
+    @property
+    def first_seq(self) -> int:
+        """보존 중인 가장 오래된 seq"""
+        return self._first_seq
+
+    @property
+    def last_seq(self) -> int:
+        """가장 최근 seq (비어 있으면 first_seq - 1)"""
+        return self._next_seq - 1
+
+    def __len__(self) -> int:
+        return self._next_seq - self._first_seq
+
+    def line(self, seq: int) -> str:
+        return self._lines[seq % self.capacity]
+
+    def level(self, seq: int) -> str:
+        return self._levels[seq % self.capacity]
+
+    def component(self, seq: int) -> str:
+        return self._components[seq % self.capacity]
+
+    def components(self) -> List[str]:
+        return list(self._component_index)
+
+    def level_counts(self) -> Dict[str, int]:
+        return {level: len(index) for level, index in self._level_index.items()}
+
+    # ==================== 적재 ====================
+
+    def append(self, line: str, level: str = 'INFO', component: str = '', message: Optional[str] = None) -> int:
+        """라인 추가 후 seq 반환 (용량 초과 시 가장 오래된 라인 축출)"""
+        if self._next_seq - self._first_seq >= self.capacity:
+            self._evict_oldest()
+
+        if level not in self._level_index:
+            level = 'INFO'
+        seq = self._next_seq
+        slot = seq % self.capacity
+        self._lines[slot] = line
+        self._search_keys[slot] = (message if message is not None else line).lower()
+        self._levels[slot] = level
+        self._components[slot] = component
+
+        self._level_index[level].append(seq)
+        component_seqs = self._component_index.get(component)
+        if component_seqs is None:
+            component_seqs = self._component_index[component] = deque()
+        component_seqs.append(seq)
+
+        self._next_seq = seq + 1
+        return seq
+
+    def _evict_oldest(self) -> None:
+        seq = self._first_seq
+        slot = seq % self.capacity
+        self._level_index[self._levels[slot]].popleft()
+        component = self._components[slot]
+        component_seqs = self._component_index[component]
+        component_seqs.popleft()
+        if not component_seqs:
+            del self._component_index[component]
+
+        self._lines[slot] = self._search_keys[slot] = self._levels[slot] = self._components[slot] = None
+        self._first_seq = seq + 1
+
+    def clear(self) -> None:
+        """저장소 비우기 (seq는 계속 증가)"""
+        for seq in range(self._first_seq, self._next_seq):
+            slot = seq % self.capacity
+            self._lines[slot] = self._search_keys[slot] = self._levels[slot] = self._components[slot] = None
+        self._first_seq = self._next_seq
+        for index in self._level_index.values():
+            index.clear()
+        self._component_index.clear()
+
+    # ==================== 필터 ====================
+
+    def candidate_seqs(self, log_filter: LogFilter) -> Sequence[int]:
+        """
+        레벨/컴포넌트 조건의 후보 seq 목록 (오름차순)
+
+        레벨 인덱스와 컴포넌트 인덱스 중 라인 수가 더 적은 쪽만 스냅샷으로 반환합니다.
+        반대쪽 조건과 검색어는 호출자가 filter_seqs로 확인합니다.
+        """
+        sources: List[List[Deque[int]]] = []
+        if log_filter.levels is not None:
+            sources.append([self._level_index[level] for level in log_filter.levels if level in self._level_index])
+        if log_filter.component:
+            sources.append([seqs for name, seqs in self._component_index.items()
+                            if log_filter.component in name.lower()])
+
+        if not sources:
+            return range(self._first_seq, self._next_seq)
+
+        selected = min(sources, key=lambda indexes: sum(len(seqs) for seqs in indexes))
+        if len(selected) == 1:
+            return list(selected[0])
+        # 각 인덱스는 이미 정렬되어 있어 timsort가 run 병합으로 처리
+        return sorted(chain.from_iterable(selected))
+
+    def filter_seqs(self, seqs: Iterable[int], log_filter: LogFilter) -> List[int]:
+        """주어진 seq 중 필터를 통과하는 seq 목록 (축출된 seq는 제외)"""
+        capacity = self.capacity
+        first_seq = self._first_seq
+        levels = log_filter.levels
+        components = None
+        if log_filter.component:
+            components = {name for name in self._component_index if log_filter.component in name.lower()}
+        needle = log_filter.search_text
+        level_slots = self._levels
+        component_slots = self._components
+        search_slots = self._search_keys
+
+        matched: List[int] = []
+        append = matched.append
+        for seq in seqs:
+            if seq < first_seq:
+                continue
+            slot = seq % capacity
+            if levels is not None and level_slots[slot] not in levels:
+                continue
+            if components is not None and component_slots[slot] not in components:
+                continue
+            if needle and needle not in search_slots[slot]:
+                continue
+            append(seq)
+        return matched
@@ -11,6 +11,7 @@ from __future__ import annotations
 import logging
 import threading
 from collections import deque
+from itertools import islice
 from typing import Deque, List, Optional, Tuple
 
 try:
@@ -20,33 +21,56 @@ except Exception:  # pragma: no cover
 
 
 class LiveLogBuffer:
-    """Thread-safe ring buffer with monotonically increasing sequence IDs."""
+    """Thread-safe ring buffer with monotonically increasing sequence IDs.
+
+    Each entry keeps the formatted line plus the record's level and logger name so
+    that indexed viewers can bucket lines without re-parsing the formatted text.
+    """
 
     def __init__(self, max_lines: int = 5000) -> None:
-        self._buf: Deque[Tuple[int, str]] = deque(maxlen=max_lines)
+        self._buf: Deque[Tuple[int, str, str, str]] = deque(maxlen=max_lines)
         self._lock = threading.Lock()
         self._next_seq: int = 1
 
-    def append(self, line: str) -> int:
+    def append(self, line: str, level: str = 'INFO', logger_name: str = '') -> int:
         with self._lock:
             seq = self._next_seq
             self._next_seq += 1
-            self._buf.append((seq, line))
+            self._buf.append((seq, line, level, logger_name))
             return seq
 
+    def _entries_since(self, last_seq: int) -> List[Tuple[int, str, str, str]]:
+        # Sequence IDs in the buffer are contiguous, so skip straight to the first new entry
+        if not self._buf:
+            return []
+        skip = max(0, last_seq - self._buf[0][0] + 1)
+        take = len(self._buf) - skip
+        if take <= 0:
+            return []
+        if take < skip:
+            # deque indexing/islice walks from the left; read short tails from the right end
+            tail = list(islice(reversed(self._buf), take))
+            tail.reverse()
+            return tail
+        return list(islice(self._buf, skip, None))
+
     def get_since(self, last_seq: int) -> Tuple[List[str], int]:
         """Return lines with seq > last_seq and the highest seq observed.
         If last_seq is far behind window, returns all currently stored lines.
         """
         with self._lock:
-            lines: List[str] = []
-            max_seq = last_seq
-            for seq, text in self._buf:
-                if seq > last_seq:
-                    lines.append(text)
-                    if seq > max_seq:
-                        max_seq = seq
-            return lines, max_seq
+            entries = self._entries_since(last_seq)
+        if not entries:
+            return [], last_seq
+        return [entry[1] for entry in entries], entries[-1][0]
+
+    def get_records_since(self, last_seq: int) -> Tuple[List[Tuple[str, str, str]], int]:
+        """Like get_since, but returns (line, level, logger_name) tuples."""
+        with self._lock:
+            entries = self._entries_since(last_seq)
+        if not entries:
+            return [], last_seq
+        return [entry[1:] for entry in entries], entries[-1][0]
 
     def clear(self) -> None:
         with self._lock:
@@ -86,7 +110,7 @@ class UILiveLogHandler(logging.Handler):
             # Split on newlines to keep UI line semantics consistent
             for line in text.splitlines():
                 if line.strip():
-                    self._buffer.append(line)
+                    self._buffer.append(line, record.levelname, record.name)
         except Exception:
             # Handlers must not raise
             self.handleError(record)
@@ -3,5 +3,11 @@ from .async_processor import AsyncLogProcessor
 from .memory_optimizer import MemoryOptimizer
 from .cache_manager import CacheManager
 from .performance_monitor import PerformanceMonitor
+from .latency_tracer import LatencyHistogram, LatencyTracer, get_latency_tracer
+from .log_queue_pipeline import LogQueuePipeline, QueuedLogHandler
 
-__all__ = ['AsyncLogProcessor', 'MemoryOptimizer', 'CacheManager', 'PerformanceMonitor']
+__all__ = [
+    'AsyncLogProcessor', 'MemoryOptimizer', 'CacheManager', 'PerformanceMonitor',
+    'LogQueuePipeline', 'QueuedLogHandler',
+    'LatencyHistogram', 'LatencyTracer', 'get_latency_tracer'
+]
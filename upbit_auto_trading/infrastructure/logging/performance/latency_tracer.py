@@ -0,0 +1,326 @@
+"""
+Latency Tracer - 핫 경로용 저비용 지연 히스토그램 / 트레이싱 스팬
+
+- LatencyHistogram: 고정 메모리 로그 버킷 히스토그램 (2배 구간마다 16개 하위 버킷, 상대 오차 ≤ 6.25%)
+- LatencyTracer: 이름별 히스토그램 레지스트리 + 컨텍스트 매니저/데코레이터 스팬
+- 비활성 상태의 span() 은 공유 no-op 객체를 반환하므로 플래그 확인 외 비용이 없음
+- Prometheus 텍스트 노출 형식(summary) 렌더링 - 파일 기록은 PerformanceMonitor 가 담당
+
+사용 예:
+    _tracer = get_latency_tracer()
+
+    with _tracer.span("websocket.decode"):
+        data = json.loads(message)
+
+    @_tracer.traced("db.write")
+    def save(...): ...
+"""
+import asyncio
+import functools
+import threading
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# 하위 버킷: 값의 상위 (SUB_BUCKET_BITS + 1) 비트로 버킷 결정
+SUB_BUCKET_BITS = 4
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS            # 16
+_LINEAR_LIMIT = SUB_BUCKET_COUNT << 1               # 32ns 미만은 1ns 단위
+MAX_TRACKABLE_NS = (1 << 42) - 1                    # 약 73분, 초과 값은 마지막 버킷
+BUCKET_COUNT = ((MAX_TRACKABLE_NS.bit_length() - SUB_BUCKET_BITS - 1) << SUB_BUCKET_BITS) + _LINEAR_LIMIT
+
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+
+
+def bucket_index(value_ns: int) -> int:
+    """나노초 값 → 버킷 인덱스"""
+    if value_ns < _LINEAR_LIMIT:
+        return value_ns if value_ns > 0 else 0
+    shift = value_ns.bit_length() - SUB_BUCKET_BITS - 1
+    index = (shift << SUB_BUCKET_BITS) + (value_ns >> shift)
+    return index if index < BUCKET_COUNT else BUCKET_COUNT - 1
+
+
+def bucket_upper_bound(index: int) -> int:
+    """버킷에 속하는 가장 큰 나노초 값"""
+    if index < _LINEAR_LIMIT:
+        return index
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    mantissa = index - (shift << SUB_BUCKET_BITS)
+    return ((mantissa + 1) << shift) - 1
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """히스토그램 시점 스냅샷 (누적 또는 구간 차분)"""
+    name: str
+    count: int
+    sum_ns: int
+    max_ns: int
+    counts: Tuple[int, ...]
+
+    def percentile_ns(self, quantile: float) -> int:
+        """분위수 근사값 (해당 버킷 상한, 최댓값으로 제한)"""
+        if self.count == 0:
+            return 0
+        rank = max(1, int(quantile * self.count + 0.5))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count:
+                seen += bucket_count
+                if seen >= rank:
+                    return min(bucket_upper_bound(index), self.max_ns)
+        return self.max_ns
+
+    @property
+    def mean_ns(self) -> float:
+        return self.sum_ns / self.count if self.count else 0.0
+
+    def delta(self, previous: Optional["HistogramSnapshot"]) -> "HistogramSnapshot":
+        """previous 이후 구간 스냅샷 (구간 최댓값은 가장 높은 비어있지 않은 버킷 상한으로 근사)"""
+        if previous is None:
+            return self
+        counts = tuple(now - before for now, before in zip(self.counts, previous.counts))
+        max_ns = 0
+        for index in range(len(counts) - 1, -1, -1):
+            if counts[index]:
+                max_ns = min(bucket_upper_bound(index), self.max_ns)
+                break
+        return HistogramSnapshot(self.name, self.count - previous.count, self.sum_ns - previous.sum_ns,
+                                 max_ns, counts)
+
+    def to_summary(self, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> Dict[str, Any]:
+        """JSON 요약용 dict (밀리초)"""
+        summary: Dict[str, Any] = {"count": self.count}
+        for quantile in quantiles:
+            summary[f"p{quantile * 100:g}_ms"] = round(self.percentile_ns(quantile) / 1e6, 4)
+        summary["max_ms"] = round(self.max_ns / 1e6, 4)
+        summary["mean_ms"] = round(self.mean_ns / 1e6, 4)
+        return summary
+
+
+class LatencyHistogram:
+    """
+    고정 메모리 로그 버킷 지연 히스토그램
+
+    버킷 수는 BUCKET_COUNT 로 고정되어 샘플 수와 무관하게 메모리가 일정합니다.
+    record() 는 락 없이 GIL 에 의존합니다 (스레드 경합 시 드물게 증가분이 유실될 수 있으나
+    락 비용이 스팬 전체 비용과 맞먹어 핫 경로 계측에서는 제외).
+    """
+
+    __slots__ = ("name", "_counts", "_count", "_sum", "_max")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._counts: List[int] = [0] * BUCKET_COUNT
+        self._count = 0
+        self._sum = 0
+        self._max = 0
+
+    def record(self, value_ns: int) -> None:
+        """나노초 단위 지연 기록"""
+        if value_ns < _LINEAR_LIMIT:
+            index = value_ns if value_ns > 0 else 0
+        else:
+            shift = value_ns.bit_length() - SUB_BUCKET_BITS - 1
+            index = (shift << SUB_BUCKET_BITS) + (value_ns >> shift)
+            if index >= BUCKET_COUNT:
+                index = BUCKET_COUNT - 1
+        self._counts[index] += 1
+        self._count += 1
+        self._sum += value_ns
+        if value_ns > self._max:
+            self._max = value_ns
+
+    def record_seconds(self, seconds: float) -> None:
+        """초 단위 지연 기록 (기존 perf_counter 측정값 재사용)"""
+        self.record(int(seconds * 1e9))
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def snapshot(self) -> HistogramSnapshot:
+        """현재 누적 스냅샷 (건수는 버킷 합으로 계산해 버킷과 일관성 유지)"""
+        counts = tuple(self._counts)
+        return HistogramSnapshot(self.name, sum(counts), self._sum, self._max, counts)
+
+    def reset(self) -> None:
+        self._counts = [0] * BUCKET_COUNT
+        self._count = self._sum = self._max = 0
+
+
+class _Span:
+    """활성 스팬 - 사용마다 새 객체 (await 를 가로지르는 동시 사용에도 안전)"""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: LatencyHistogram):
+        self._histogram = histogram
+
+    def __enter__(self) -> "_Span":
+        self._start = perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        # LatencyHistogram.record 인라인 (메서드 호출 1회 절감)
+        value_ns = perf_counter_ns() - self._start
+        histogram = self._histogram
+        if value_ns < _LINEAR_LIMIT:
+            index = value_ns if value_ns > 0 else 0
+        else:
+            shift = value_ns.bit_length() - SUB_BUCKET_BITS - 1
+            index = (shift << SUB_BUCKET_BITS) + (value_ns >> shift)
+            if index >= BUCKET_COUNT:
+                index = BUCKET_COUNT - 1
+        histogram._counts[index] += 1
+        histogram._count += 1
+        histogram._sum += value_ns
+        if value_ns > histogram._max:
+            histogram._max = value_ns
+        return False
+
+
+class _NullSpan:
+    """비활성 스팬 (공유 싱글톤)"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class LatencyTracer:
+    """이름별 지연 히스토그램 레지스트리"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        """히스토그램 조회/생성"""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, LatencyHistogram(name))
+        return histogram
+
+    def span(self, name: str):
+        """with 블록 지연 측정 스팬 (비활성 시 no-op)"""
+        if not self.enabled:
+            return _NULL_SPAN
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self.histogram(name)
+        return _Span(histogram)
+
+    def record_seconds(self, name: str, seconds: float) -> None:
+        """이미 측정된 구간 기록 (비활성 시 무시)"""
+        if self.enabled:
+            self.histogram(name).record_seconds(seconds)
+
+    def traced(self, name: Optional[str] = None) -> Callable[[Callable], Callable]:
+        """함수/코루틴 실행 시간 측정 데코레이터 (활성 여부는 호출 시점에 확인)"""
+
+        def decorator(func: Callable) -> Callable:
+            span_name = name or func.__qualname__
+            histogram = self.histogram(span_name)
+
+            if asyncio.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    if not self.enabled:
+                        return await func(*args, **kwargs)
+                    start = perf_counter_ns()
+                    try:
+                        return await func(*args, **kwargs)
+                    finally:
+                        histogram.record(perf_counter_ns() - start)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = perf_counter_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    histogram.record(perf_counter_ns() - start)
+            return wrapper
+
+        return decorator
+
+    def snapshots(self) -> Dict[str, HistogramSnapshot]:
+        """기록이 있는 히스토그램 스냅샷 (이름순)"""
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+        return {name: histogram.snapshot() for name, histogram in histograms if histogram.count}
+
+    def reset(self) -> None:
+        with self._lock:
+            histograms = list(self._histograms.values())
+        for histogram in histograms:
+            histogram.reset()
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def render_prometheus(snapshots: Dict[str, HistogramSnapshot],
+                      gauges: Optional[Dict[str, float]] = None,
+                      prefix: str = "upbit",
+                      quantiles: Sequence[float] = DEFAULT_QUANTILES) -> str:
+    """
+    Prometheus 텍스트 노출 형식 렌더링
+
+    지연은 operation 라벨을 가진 summary(분위수 + _sum/_count)와 최댓값 gauge 로 표현합니다.
+    """
+    latency = f"{prefix}_operation_latency_seconds"
+    lines = [f"# HELP {latency} Hot-path latency (log-bucketed histogram quantiles)",
+             f"# TYPE {latency} summary"]
+    for name, snapshot in snapshots.items():
+        label = f'operation="{_escape_label(name)}"'
+        for quantile in quantiles:
+            lines.append(f'{latency}{{{label},quantile="{quantile:g}"}} {snapshot.percentile_ns(quantile) / 1e9:.9g}')
+        lines.append(f"{latency}_sum{{{label}}} {snapshot.sum_ns / 1e9:.9g}")
+        lines.append(f"{latency}_count{{{label}}} {snapshot.count}")
+
+    latency_max = f"{prefix}_operation_latency_max_seconds"
+    lines += [f"# HELP {latency_max} Maximum observed hot-path latency",
+              f"# TYPE {latency_max} gauge"]
+    for name, snapshot in snapshots.items():
+        lines.append(f'{latency_max}{{operation="{_escape_label(name)}"}} {snapshot.max_ns / 1e9:.9g}')
+
+    for gauge_name, value in (gauges or {}).items():
+        metric = f"{prefix}_{gauge_name}"
+        lines += [f"# TYPE {metric} gauge", f"{metric} {value:.9g}"]
+    return "\n".join(lines) + "\n"
+
+
+_latency_tracer: Optional[LatencyTracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_latency_tracer() -> LatencyTracer:
+    """전역 LatencyTracer (기본 비활성 - PerformanceMonitor 시작 시 활성화)"""
+    global _latency_tracer
+    if _latency_tracer is None:
+        with _tracer_lock:
+            if _latency_tracer is None:
+                _latency_tracer = LatencyTracer()
+    return _latency_tracer
@@ -0,0 +1,306 @@
+"""
+Queued Log Pipeline - 논블로킹 로그 파이프라인
+호출 스레드(asyncio 이벤트 루프)는 레코드를 메모리 큐에 넣기만 하고,
+전용 writer 스레드가 포맷팅과 파일 기록을 배치로 처리
+
+- 과부하(큐 사용률 >= overload_ratio) 시 DEBUG 레코드는 샘플링, 큐가 가득 차면 ERROR 미만 레코드 드롭
+- 드롭/샘플링 건수는 통계로 집계 (종료 시 요약 1줄 기록)
+- AsyncLogProcessor의 LogEntry/우선순위 모델과 add_handler 구독 방식을 그대로 사용
+- PerformanceMonitor에 배치 처리 시간과 큐 지표를 보고
+"""
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .async_processor import LogEntry
+from .performance_monitor import PerformanceMonitor
+
+
+def _level_priority(levelno: int) -> int:
+    """로그 레벨 → LogEntry 우선순위 (AsyncLogProcessor 기준: 4 이상 긴급)"""
+    if levelno >= logging.CRITICAL:
+        return 5
+    if levelno >= logging.ERROR:
+        return 4
+    if levelno >= logging.WARNING:
+        return 3
+    if levelno >= logging.INFO:
+        return 2
+    return 1
+
+
+class QueuedLogHandler(logging.Handler):
+    """컴포넌트 로거에 부착되는 핸들러 - 큐 적재만 수행"""
+
+    def __init__(self, pipeline: "LogQueuePipeline", level: int = logging.NOTSET):
+        super().__init__(level)
+        self.pipeline = pipeline
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # 핸들러 락 생략: 큐 적재는 스레드 안전 (deque.append)
+        if self.filters and not self.filter(record):
+            return False
+        self.emit(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # 포맷 인자 불일치 등은 logging.Handler 규약대로 handleError로 보고 (호출 코드로 전파하지 않음)
+        try:
+            self.pipeline.enqueue(record)
+        except Exception:
+            self.handleError(record)
+
+
+class LogQueuePipeline:
+    """
+    bounded 메모리 큐 + 전용 writer 스레드
+
+    target_handlers의 파일 핸들러는 writer 스레드에서만 사용되며,
+    배치마다 한 번만 flush 합니다 (레코드마다 flush하는 StreamHandler 기본 동작 대비).
+    """
+
+    def __init__(self,
+                 target_handlers: Dict[str, logging.Handler],
+                 queue_size: int = 10000,
+                 batch_size: int = 256,
+                 flush_interval: float = 0.2,
+                 overload_ratio: float = 0.8,
+                 debug_sample_every: int = 10,
+                 performance_monitor: Optional[PerformanceMonitor] = None):
+        self.target_handlers = dict(target_handlers)
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overload_threshold = int(queue_size * overload_ratio)
+        self.debug_sample_every = max(1, debug_sample_every)
+        self.performance_monitor = performance_monitor
+
+        self._queue: Deque[logging.LogRecord] = deque()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._writer: Optional[threading.Thread] = None
+
+        # LogEntry 구독자 (AsyncLogProcessor.add_handler와 동일한 시그니처)
+        self.handlers: List[Callable[[LogEntry], None]] = []
+
+        # 통계 (카운터 증가는 GIL 하에서 원자적이지 않을 수 있으나 지표 용도로 충분)
+        self.stats = {
+            'enqueued': 0,
+            'written': 0,
+            'sampled_out_debug': 0,
+            'dropped_overflow': 0,
+            'batches': 0,
+            'max_queue_depth': 0,
+            'write_errors': 0,
+        }
+        self._debug_counter = 0
+
+    # ==================== 생명주기 ====================
+
+    def start(self) -> None:
+        """writer 스레드 시작"""
+        if self._writer and self._writer.is_alive():
+            return
+
+        self._stopping = False
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True, name="LogQueueWriter")
+        self._writer.start()
+
+        if self.performance_monitor:
+            self.performance_monitor.add_metric_collector(self.collect_metrics)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """큐를 모두 기록한 뒤 writer 스레드 종료 (드롭 요약 기록)"""
+        self._stopping = True
+        self._wakeup.set()
+        if self._writer:
+            self._writer.join(timeout=timeout)
+            self._writer = None
+
+        # 스레드가 시간 안에 끝나지 않았거나 시작되지 않은 경우 호출 스레드에서 마저 기록
+        self._drain()
+        self._write_drop_summary()
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """현재까지 적재된 레코드가 기록될 때까지 대기"""
+        if not self._writer or not self._writer.is_alive():
+            self._drain()
+            return True
+
+        deadline = time.monotonic() + timeout
+        target = self.stats['enqueued']
+        while time.monotonic() < deadline:
+            done = self.stats['written'] + self.stats['dropped_overflow'] + self.stats['sampled_out_debug']
+            if not self._queue and done >= target:
+                return True
+            self._wakeup.set()
+            time.sleep(0.005)
+        return False
+
+    # ==================== 생산자 (호출 스레드) ====================
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """레코드 적재 - 파일 I/O 없음 (포맷 실패 시 예외 전파, QueuedLogHandler가 handleError로 처리)"""
+        depth = len(self._queue)
+        levelno = record.levelno
+
+        if depth >= self.overload_threshold:
+            if depth >= self.queue_size and levelno < logging.ERROR:
+                self.stats['dropped_overflow'] += 1
+                return
+            if levelno <= logging.DEBUG:
+                self._debug_counter += 1
+                if self._debug_counter % self.debug_sample_every:
+                    self.stats['sampled_out_debug'] += 1
+                    return
+
+        # 포맷 인자는 호출 시점 값으로 고정 (writer 스레드에서 가변 객체 참조 방지)
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+
+        self._queue.append(record)
+        self.stats['enqueued'] += 1
+        if depth + 1 > self.stats['max_queue_depth']:
+            self.stats['max_queue_depth'] = depth + 1
+
+        if levelno >= logging.WARNING or depth + 1 >= self.batch_size:
+            self._wakeup.set()
+
+    # ==================== 소비자 (writer 스레드) ====================
+
+    def _writer_loop(self) -> None:
+        while not self._stopping:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._drain()
+
+    def _drain(self) -> None:
+        """큐가 빌 때까지 배치 단위로 기록"""
+        while self._queue:
+            batch = []
+            try:
+                for _ in range(self.batch_size):
+                    batch.append(self._queue.popleft())
+            except IndexError:
+                pass
+            if batch:
+                self._write_batch(batch)
+
+    def _write_batch(self, batch: List[logging.LogRecord]) -> None:
+        start_time = time.perf_counter()
+
+        for handler in self.target_handlers.values():
+            try:
+                if isinstance(handler, logging.StreamHandler):
+                    self._write_stream_batch(handler, batch)
+                else:
+                    for record in batch:
+                        if record.levelno >= handler.level:
+                            handler.handle(record)
+            except Exception as e:
+                self.stats['write_errors'] += 1
+                print(f"❌ 로그 배치 기록 실패 ({handler.__class__.__name__}): {e}")
+
+        if self.handlers:
+            entries = [self._to_log_entry(record) for record in batch]
+            for entry_handler in self.handlers:
+                for entry in entries:
+                    try:
+                        entry_handler(entry)
+                    except Exception as e:
+                        print(f"❌ Handler 실행 실패: {e}")
+
+        self.stats['written'] += len(batch)
+        self.stats['batches'] += 1
+
+        if self.performance_monitor:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            self.performance_monitor.record_logging_performance("log_processing", duration_ms)
+            self.performance_monitor.logging_metrics['total_logs_processed'] += len(batch)
+
+    @staticmethod
+    def _write_stream_batch(handler: logging.StreamHandler, batch: List[logging.LogRecord]) -> None:
+        """파일/스트림 핸들러에 배치 기록 후 1회 flush (로테이션 검사 포함)"""
+        rotating = handler if isinstance(handler, RotatingFileHandler) and handler.maxBytes > 0 else None
+        handler.acquire()
+        try:
+            if handler.stream is None and isinstance(handler, logging.FileHandler):
+                handler.stream = handler._open()
+            # 파일 크기는 배치 시작 시 1회 조회 후 누적 (RotatingFileHandler.shouldRollover와 같은 근사)
+            size = handler.stream.seek(0, 2) if rotating else 0
+
+            for record in batch:
+                if record.levelno < handler.level or (handler.filters and not handler.filter(record)):
+                    continue
+                try:
+                    message = handler.format(record) + handler.terminator
+                except Exception:
+                    handler.handleError(record)  # 레코드 하나의 포맷 실패가 배치 전체를 버리지 않도록
+                    continue
+
+                if rotating:
+                    if size + len(message) >= rotating.maxBytes:
+                        rotating.doRollover()
+                        if rotating.stream is None:
+                            rotating.stream = rotating._open()
+                        size = 0
+                    size += len(message)
+
+                handler.stream.write(message)
+            handler.flush()
+        finally:
+            handler.release()
+
+    @staticmethod
+    def _to_log_entry(record: logging.LogRecord) -> LogEntry:
+        return LogEntry(
+            timestamp=datetime.fromtimestamp(record.created),
+            level=record.levelname,
+            component=record.name,
+            message=record.getMessage(),
+            metadata={'thread': record.threadName, 'module': record.module},
+            priority=_level_priority(record.levelno),
+        )
+
+    def _write_drop_summary(self) -> None:
+        dropped = self.stats['dropped_overflow'] + self.stats['sampled_out_debug']
+        if not dropped:
+            return
+        summary = logging.LogRecord(
+            "upbit.LogQueuePipeline", logging.WARNING, __file__, 0,
+            f"로그 큐 과부하 요약: 오버플로우 드롭 {self.stats['dropped_overflow']}건, "
+            f"DEBUG 샘플링 제외 {self.stats['sampled_out_debug']}건, 최대 큐 깊이 {self.stats['max_queue_depth']}",
+            None, None
+        )
+        self._write_batch([summary])
+
+    # ==================== 구독/통계 ====================
+
+    def add_handler(self, handler: Callable[[LogEntry], None]) -> None:
+        """LogEntry 구독자 추가 (writer 스레드에서 호출됨)"""
+        self.handlers.append(handler)
+
+    def remove_handler(self, handler: Callable[[LogEntry], None]) -> None:
+        if handler in self.handlers:
+            self.handlers.remove(handler)
+
+    def collect_metrics(self) -> Dict[str, float]:
+        """PerformanceMonitor 메트릭 수집기"""
+        return {
+            'log_queue_depth': float(len(self._queue)),
+            'log_queue_dropped': float(self.stats['dropped_overflow'] + self.stats['sampled_out_debug']),
+            'log_queue_written': float(self.stats['written']),
+        }
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            'queue_depth': len(self._queue),
+            'queue_size': self.queue_size,
+            'is_running': bool(self._writer and self._writer.is_alive()),
+        }
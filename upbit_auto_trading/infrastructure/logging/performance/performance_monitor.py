@@ -1,16 +1,26 @@
 """
 Performance Monitoring System for LLM Agent Logging
 성능 메트릭 수집 및 모니터링 시스템
+- 핫 경로 지연 히스토그램(LatencyTracer) 을 주기적으로 파일 내보내기
+  (Prometheus 텍스트 노출 형식 + 최근 구간 JSON 요약, 네트워크 사용 없음)
 """
+import json
+import os
 import time
 import threading
 import psutil
-from typing import Dict, List, Any, Optional, Callable
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Callable, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from collections import deque
 import statistics
 
+from .latency_tracer import HistogramSnapshot, LatencyTracer, get_latency_tracer, render_prometheus
+
+PROMETHEUS_FILE_NAME = "metrics.prom"
+LATENCY_SUMMARY_FILE_NAME = "latency_summary.json"
+
 @dataclass
 class PerformanceMetric:
     """성능 메트릭 정의"""
@@ -51,11 +61,21 @@ class PerformanceMonitor:
 
     def __init__(self,
                  monitoring_interval: float = 10.0,  # 10초마다 수집
-                 history_size: int = 1000):
+                 history_size: int = 1000,
+                 latency_tracer: Optional[LatencyTracer] = None,
+                 metrics_export_dir: Optional[Union[str, Path]] = None,
+                 summary_windows: int = 60):  # JSON 요약에 유지할 최근 구간 수
 
         self.monitoring_interval = monitoring_interval
         self.history_size = history_size
 
+        # 핫 경로 지연 히스토그램 및 파일 내보내기
+        self.latency_tracer = latency_tracer or get_latency_tracer()
+        self.metrics_export_dir = Path(metrics_export_dir) if metrics_export_dir else None
+        self.latency_windows: deque = deque(maxlen=summary_windows)
+        self._last_latency_snapshots: Dict[str, HistogramSnapshot] = {}
+        self._last_export_time: Optional[float] = None
+
         # 모니터링 상태
         self.is_monitoring = False
         self.monitoring_thread = None
@@ -96,6 +116,7 @@ class PerformanceMonitor:
             return
 
         self.is_monitoring = True
+        self.latency_tracer.enable()
 
         # 초기 카운터 설정
         try:
@@ -116,9 +137,14 @@ class PerformanceMonitor:
 
     def stop_monitoring(self):
         """성능 모니터링 중지"""
+        was_monitoring = self.is_monitoring
         self.is_monitoring = False
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=2.0)
+        if was_monitoring:
+            self.latency_tracer.disable()
+            if self.metrics_export_dir:
+                self.export_metrics()
         print("🛑 성능 모니터링 중지")
 
     def _monitoring_loop(self):
@@ -135,6 +161,10 @@ class PerformanceMonitor:
                 # 임계값 체크
                 self._check_thresholds(system_metrics)
 
+                # 지연 메트릭 파일 내보내기
+                if self.metrics_export_dir:
+                    self.export_metrics()
+
                 time.sleep(self.monitoring_interval)
 
             except Exception as e:
@@ -265,6 +295,75 @@ class PerformanceMonitor:
                self.logging_metrics['logs_per_second'][0][0] < cutoff_time):
             self.logging_metrics['logs_per_second'].popleft()
 
+    def get_latency_summary(self) -> Dict[str, Dict[str, Any]]:
+        """누적 지연 요약 (operation → count/p50/p90/p99/max/mean ms)"""
+        return {name: snapshot.to_summary() for name, snapshot in self.latency_tracer.snapshots().items()}
+
+    def _roll_latency_window(self, snapshots: Dict[str, HistogramSnapshot]) -> Dict[str, Any]:
+        """직전 내보내기 이후 구간 요약을 추가 (누적 스냅샷 차분)"""
+        now = time.time()
+        operations = {}
+        for name, snapshot in snapshots.items():
+            window = snapshot.delta(self._last_latency_snapshots.get(name))
+            if window.count > 0:
+                operations[name] = window.to_summary()
+        window_summary = {
+            "window_end": datetime.fromtimestamp(now).isoformat(),
+            "window_seconds": round(now - self._last_export_time, 3) if self._last_export_time else None,
+            "operations": operations
+        }
+        self.latency_windows.append(window_summary)
+        self._last_latency_snapshots = snapshots
+        self._last_export_time = now
+        return window_summary
+
+    def export_metrics(self, export_dir: Optional[Union[str, Path]] = None) -> Dict[str, Path]:
+        """
+        지연/시스템 메트릭 파일 내보내기 (임시 파일 기록 후 교체)
+
+        Returns:
+            {'prometheus': metrics.prom 경로, 'json': latency_summary.json 경로}
+        """
+        target_dir = Path(export_dir) if export_dir else self.metrics_export_dir
+        if target_dir is None:
+            raise ValueError("metrics_export_dir 가 설정되지 않았습니다")
+
+        snapshots = self.latency_tracer.snapshots()
+        self._roll_latency_window(snapshots)
+
+        gauges = {}
+        if self.system_metrics_history:
+            latest = self.system_metrics_history[-1]
+            gauges = {
+                "process_cpu_percent": latest.cpu_percent,
+                "process_memory_bytes": latest.memory_mb * 1024 * 1024,
+                "process_threads": latest.thread_count
+            }
+        gauges["logging_total_logs_processed"] = self.logging_metrics['total_logs_processed']
+
+        summary = {
+            "generated_at": datetime.now().isoformat(),
+            "cumulative": {name: snapshot.to_summary() for name, snapshot in snapshots.items()},
+            "windows": list(self.latency_windows)
+        }
+
+        target_dir.mkdir(parents=True, exist_ok=True)
+        paths = {
+            "prometheus": target_dir / PROMETHEUS_FILE_NAME,
+            "json": target_dir / LATENCY_SUMMARY_FILE_NAME
+        }
+        self._write_atomic(paths["prometheus"], render_prometheus(snapshots, gauges))
+        self._write_atomic(paths["json"], json.dumps(summary, ensure_ascii=False, indent=2))
+        return paths
+
+    @staticmethod
+    def _write_atomic(path: Path, content: str) -> None:
+        """읽는 쪽이 부분 기록을 보지 않도록 임시 파일 기록 후 교체"""
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+
     def add_metric_collector(self, collector: Callable[[], Dict[str, float]]):
         """메트릭 수집기 추가"""
         self.metric_collectors.append(collector)
@@ -299,6 +398,7 @@ class PerformanceMonitor:
                 "total_logs_processed": self.logging_metrics['total_logs_processed'],
                 "error_count": self.logging_metrics['error_count']
             },
+            "latency": self.get_latency_summary(),
             "status": self._get_overall_status(latest_metrics)
         }
 
@@ -10,10 +10,12 @@ Infrastructure Layer의 표준 로깅 서비스
 - Dual File Logging: 메인 로그 + 세션별 로그 관리
 - Environment Variable Control: 실시간 로그 레벨 제어
 - Component Focus: 특정 컴포넌트 집중 로깅
+- Queued File Logging: 파일 기록은 writer 스레드에서 배치 처리 (호출 스레드 논블로킹)
 """
 
 import os
 import sys
+import atexit
 import logging
 import threading
 from datetime import datetime
@@ -30,6 +32,12 @@ from upbit_auto_trading.infrastructure.logging.interfaces.logging_interface impo
 # 새로운 설정 파일 관리자
 from upbit_auto_trading.infrastructure.logging.config.logging_config_manager import LoggingConfigManager
 
+# 논블로킹 파일 로깅 (큐 + writer 스레드)
+from upbit_auto_trading.infrastructure.logging.performance.log_queue_pipeline import (
+    LogQueuePipeline, QueuedLogHandler
+)
+from upbit_auto_trading.infrastructure.logging.performance.performance_monitor import PerformanceMonitor
+
 class LoggingService(ILoggingService):
     """
     Infrastructure Layer 표준 로깅 서비스
@@ -45,6 +53,7 @@ class LoggingService(ILoggingService):
         self._formatters = {}
         self._handlers = {}
         self._lock = threading.RLock()
+        self._log_pipeline: Optional[LogQueuePipeline] = None
 
         # 로그 파일 이름 설정 (기존과 겹치지 않도록)
         self.main_log_name = "application.log"
@@ -230,8 +239,12 @@ class LoggingService(ILoggingService):
         try:
             for logger_name, logger in self._loggers.items():
                 for handler in logger.handlers:
-                    if isinstance(handler, (logging.FileHandler, RotatingFileHandler)):
+                    if isinstance(handler, (logging.FileHandler, RotatingFileHandler, QueuedLogHandler)):
                         handler.setLevel(file_level)
+
+            if self._log_pipeline:
+                for handler in self._log_pipeline.target_handlers.values():
+                    handler.setLevel(file_level)
         except Exception as e:
             print(f"[ERROR] 파일 핸들러 업데이트 실패: {e}")
 
@@ -463,7 +476,14 @@ class LoggingService(ILoggingService):
                 session_handler = logging.FileHandler(session_log_path, mode='a', encoding='utf-8')
                 session_handler.setFormatter(self._formatters['default'])
                 session_handler.setLevel(file_level)
-                self._handlers['session'] = session_handler
+
+                # 🆕 큐 모드: 로거에는 큐 핸들러만 부착, 파일 기록은 writer 스레드가 배치 처리
+                advanced_config = logging_config.get('advanced', {})
+                if advanced_config.get('queued_file_logging', True):
+                    self._start_log_pipeline(main_handler, session_handler, file_level, advanced_config, log_dir)
+                else:
+                    self._handlers['main'] = main_handler
+                    self._handlers['session'] = session_handler
 
                 print(f"[OK] 파일 로깅 활성화:")
                 print(f"   [DIR] 로그 폴더: {log_dir}")
@@ -494,6 +514,28 @@ class LoggingService(ILoggingService):
             print(f"[ERROR] 핸들러 초기화 실패: {e}")
             self._initialize_fallback_logging()
 
+    def _start_log_pipeline(self, main_handler: logging.Handler, session_handler: logging.Handler,
+                            file_level: int, advanced_config: Dict[str, Any], log_dir: Path) -> None:
+        """파일 핸들러를 writer 스레드 파이프라인 뒤로 이동"""
+        performance_monitor = None
+        if advanced_config.get('performance_monitoring'):
+            # 지연 히스토그램 활성화 + logs/metrics 에 Prometheus/JSON 요약 주기 기록
+            performance_monitor = PerformanceMonitor(metrics_export_dir=log_dir / "metrics")
+            performance_monitor.start_monitoring()
+            atexit.register(performance_monitor.stop_monitoring)
+
+        self._log_pipeline = LogQueuePipeline(
+            {'main': main_handler, 'session': session_handler},
+            queue_size=int(advanced_config.get('log_queue_size', 10000)),
+            performance_monitor=performance_monitor
+        )
+        self._log_pipeline.start()
+        atexit.register(self._log_pipeline.shutdown)
+
+        # 'main' 이름 유지: SILENT 스코프 등 기존 핸들러 필터링 규칙 그대로 적용
+        self._handlers['main'] = QueuedLogHandler(self._log_pipeline, level=file_level)
+        print("[OK] 큐 기반 파일 로깅 활성화 (writer 스레드 배치 기록)")
+
     def _cleanup_old_backups(self, log_dir: Path, max_backup_count: int) -> None:
         """오래된 백업 파일 정리
 
@@ -651,7 +693,8 @@ class LoggingService(ILoggingService):
             'active_handlers': len(self._handlers),
             'current_context': self._current_context.value,
             'current_scope': self._current_scope.value,
-            'component_focus': self._component_focus
+            'component_focus': self._component_focus,
+            'log_queue': self._log_pipeline.get_statistics() if self._log_pipeline else None
         }
 
     def _update_all_loggers(self) -> None:
@@ -1002,13 +1045,21 @@ class LoggingService(ILoggingService):
     def shutdown(self) -> None:
         """서비스 종료 및 정리"""
         try:
+            logger = self.get_logger("LoggingService")
+            logger.info("🚀 로깅 서비스 종료 완료")
+
+            # 큐 잔여 레코드 기록 후 writer 스레드 종료
+            if self._log_pipeline:
+                self._log_pipeline.shutdown()
+                atexit.unregister(self._log_pipeline.shutdown)
+                for handler in self._log_pipeline.target_handlers.values():
+                    handler.close()
+                self._log_pipeline = None
+
             # 핸들러 정리
             for handler in self._handlers.values():
                 handler.close()
 
-            logger = self.get_logger("LoggingService")
-            logger.info("🚀 로깅 서비스 종료 완료")
-
         except Exception as e:
             print(f"[ERROR] 서비스 종료 중 오류: {e}")
 
@@ -0,0 +1,478 @@
+"""
+LiveCandleAggregator - 실시간 체결 → 캔들(OHLCV) 스트리밍 집계
+
+WebSocket 체결(trade) 이벤트를 받아 심볼별 1초/1분 등 고정 길이 봉을 메모리에서 만들고,
+완결된 봉을 기존 candles_{symbol}_{timeframe} 테이블에 배치 upsert 합니다.
+최근 구간을 REST 캔들 폴링이나 건별 SELECT→INSERT/UPDATE 동기화 없이 채우기 위한 컴포넌트입니다.
+
+봉 규칙:
+- 버킷 경계: UTC epoch 기준 floor (업비트 초/분/시간/일 캔들과 동일, 일봉은 UTC 00:00 = KST 09:00)
+- timestamp: 봉 안 마지막 체결 시각(ms) - 업비트 캔들 API 와 동일
+- 빈 봉: 두 실제 봉 사이의 무체결 버킷을 EmptyCandleDetector 와 같은 형식으로 생성
+  (가격/거래량 NULL, timestamp = 버킷 시작, empty_copy_from_utc = 직전 실제 봉 시각)
+
+저장 규칙 (REST 백필은 INSERT OR IGNORE 이므로 불완전한 봉을 남기지 않음):
+- 완결된 실제 봉: upsert (기존 빈 캔들 행도 대체)
+- 빈 봉: INSERT OR IGNORE (REST 로 받은 실제 봉은 유지)
+- 스트림 시작/재연결 직후의 첫 봉, 종료 시점의 미완결 봉: 저장하지 않음 (부분 봉 → REST 가 채움)
+
+스트림 끊김:
+- subscribe() 는 체결 스트림 구독과 함께 WebSocketManager 연결 상태 리스너를 등록해, Public 연결이
+  끊기는 순간(매니저 내부 재연결 포함) mark_stream_gap() 으로 형성 중인 봉과 직후 첫 봉을 버림
+- 재연결 후 SNAPSHOT 등으로 다시 온 직전 체결은 sequential_id 로 걸러냄
+
+사용 예시:
+    aggregator = LiveCandleAggregator(repository, timeframes=('1s', '1m'))
+    await aggregator.start()
+    await aggregator.subscribe(symbols)   # 체결 구독 + 연결 끊김 감지
+    ...
+    await aggregator.stop()               # 구독 해제 + 마감된 봉 최종 저장
+"""
+
+import asyncio
+import collections
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from upbit_auto_trading.infrastructure.external_apis.upbit.websocket.core.websocket_client import WebSocketClient
+from upbit_auto_trading.infrastructure.external_apis.upbit.websocket.core.websocket_types import (
+    ConnectionState, WebSocketType
+)
+from upbit_auto_trading.infrastructure.logging import create_component_logger
+from upbit_auto_trading.infrastructure.market_data.candle.time_utils import TimeUtils
+
+logger = create_component_logger("LiveCandleAggregator")
+
+_DAY_MS = 86_400_000
+_KST_OFFSET_S = 9 * 3600
+
+CandleBatch = Dict[Tuple[str, str], List[Dict[str, Any]]]
+
+# 체결이 계속 들어오는 연결 상태 (그 외 상태로 바뀌면 스트림 끊김)
+_STREAMING_STATES = (ConnectionState.CONNECTED, ConnectionState.SUBSCRIBING, ConnectionState.ACTIVE)
+
+
+def _format_utc(epoch_ms: int) -> str:
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(epoch_ms // 1000))
+
+
+def _format_kst(epoch_ms: int) -> str:
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(epoch_ms // 1000 + _KST_OFFSET_S))
+
+
+class _OpenBar:
+    """형성 중인 봉 (핫패스용 경량 객체)"""
+    __slots__ = ('start_ms', 'open', 'high', 'low', 'close', 'acc_price', 'acc_volume',
+                 'last_trade_ms', 'trade_count', 'partial')
+
+    def __init__(self, start_ms: int, price: float, volume: float, trade_ms: int, partial: bool):
+        self.start_ms = start_ms
+        self.open = self.high = self.low = self.close = price
+        self.acc_price = price * volume
+        self.acc_volume = volume
+        self.last_trade_ms = trade_ms
+        self.trade_count = 1
+        self.partial = partial
+
+
+class _Series:
+    """(심볼, 타임프레임) 단위 집계 상태"""
+    __slots__ = ('symbol', 'timeframe', 'key', 'period_ms', 'bar', 'last_real_start', 'fresh')
+
+    def __init__(self, symbol: str, timeframe: str, period_ms: int):
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.key = (symbol, timeframe)
+        self.period_ms = period_ms
+        self.bar: Optional[_OpenBar] = None
+        self.last_real_start: Optional[int] = None  # 직전 실제 봉 시작 (빈 봉 생성 기준)
+        self.fresh = True                            # 다음 봉은 시작 시점이 불확실한 부분 봉
+
+
+@dataclass
+class LiveCandleAggregatorStats:
+    """집계/flush 통계"""
+    trades: int = 0
+    duplicate_trades: int = 0
+    late_trades: int = 0
+    bars_closed: int = 0
+    empty_bars: int = 0
+    partial_bars_dropped: int = 0
+    truncated_gaps: int = 0
+    flushes: int = 0
+    rows_flushed: int = 0
+    flush_errors: int = 0
+    flush_duration_ms: Deque[float] = field(default_factory=lambda: collections.deque(maxlen=4096))
+    close_to_commit_ms: Deque[float] = field(default_factory=lambda: collections.deque(maxlen=4096))
+
+    def to_dict(self) -> Dict[str, Any]:
+        durations = sorted(self.flush_duration_ms)
+        latencies = sorted(self.close_to_commit_ms)
+
+        def percentile(values: List[float], ratio: float) -> float:
+            return values[min(len(values) - 1, int(len(values) * ratio))] if values else 0.0
+
+        return {
+            'trades': self.trades,
+            'duplicate_trades': self.duplicate_trades,
+            'late_trades': self.late_trades,
+            'bars_closed': self.bars_closed,
+            'empty_bars': self.empty_bars,
+            'partial_bars_dropped': self.partial_bars_dropped,
+            'truncated_gaps': self.truncated_gaps,
+            'flushes': self.flushes,
+            'rows_flushed': self.rows_flushed,
+            'flush_errors': self.flush_errors,
+            'flush_p50_ms': percentile(durations, 0.50),
+            'flush_p99_ms': percentile(durations, 0.99),
+            'close_to_commit_p50_ms': percentile(latencies, 0.50),
+            'close_to_commit_p99_ms': percentile(latencies, 0.99),
+        }
+
+
+class LiveCandleAggregator:
+    """
+    실시간 체결 → 캔들 집계 + 배치 flush
+
+    on_trade 는 동기 핫패스(전체 마켓 체결 스트림 대응)이고, DB 쓰기는 flush()
+    (start() 시 flush_interval 주기)에서 한 트랜잭션으로 모아 수행합니다.
+    """
+
+    def __init__(self,
+                 repository,
+                 timeframes: Sequence[str] = ('1s', '1m'),
+                 flush_interval: float = 1.0,
+                 close_grace_ms: int = 2000,
+                 max_empty_fill: int = 3600,
+                 clock: Optional[Callable[[], float]] = None):
+        """
+        Args:
+            repository: upsert_candles_batch 를 제공하는 캔들 Repository (SqliteCandleRepository)
+            timeframes: 집계할 타임프레임 (하루를 나누어떨어지는 고정 길이: '1s', '1m', '5m', '1h', '1d' 등)
+            flush_interval: start() 시 주기적 flush 간격 (초)
+            close_grace_ms: 체결이 끊긴 심볼의 봉을 버킷 종료 후 이 시간이 지나면 닫음 (지연 체결 허용)
+            max_empty_fill: 한 번에 생성할 최대 빈 봉 수 (초과분은 REST 백필에 맡김)
+            clock: 현재 시각(초) 함수 (기본값: time.time, 리플레이/테스트용 주입)
+        """
+        self._repository = repository
+        self._timeframes = tuple(timeframes)
+        self._periods = []
+        for timeframe in self._timeframes:
+            period_ms = TimeUtils.get_timeframe_ms(timeframe)
+            if _DAY_MS % period_ms != 0:
+                raise ValueError(f"실시간 집계를 지원하지 않는 타임프레임: {timeframe}")
+            self._periods.append(period_ms)
+
+        self.flush_interval = flush_interval
+        self.close_grace_ms = close_grace_ms
+        self.max_empty_fill = max_empty_fill
+        self._clock = clock or time.time
+
+        self._series: Dict[str, List[_Series]] = {}
+        self._last_sequential_id: Dict[str, int] = {}
+        self._pending_replace: CandleBatch = collections.defaultdict(list)
+        self._pending_insert: CandleBatch = collections.defaultdict(list)
+        self._pending_since: Optional[float] = None  # 가장 오래된 미반영 봉의 닫힌 시각 (perf_counter)
+        self._listeners: List[Callable[[CandleBatch], Any]] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._websocket_client: Optional[WebSocketClient] = None
+        self.stats = LiveCandleAggregatorStats()
+
+        logger.info(f"LiveCandleAggregator 초기화: {self._timeframes}, flush {flush_interval}s")
+
+    # === 체결 입력 (핫패스) ===
+
+    def on_trade(self, symbol: str, trade_ms: int, price: float, volume: float,
+                 sequential_id: Optional[int] = None) -> None:
+        """체결 1건 반영 (동기, I/O 없음)"""
+        if sequential_id is not None:
+            if self._last_sequential_id.get(symbol) == sequential_id:
+                self.stats.duplicate_trades += 1  # 재연결 SNAPSHOT 등 직전 체결 재전송
+                return
+            self._last_sequential_id[symbol] = sequential_id
+
+        series_list = self._series.get(symbol)
+        if series_list is None:
+            series_list = [_Series(symbol, timeframe, period)
+                           for timeframe, period in zip(self._timeframes, self._periods)]
+            self._series[symbol] = series_list
+
+        self.stats.trades += 1
+        for series in series_list:
+            start = trade_ms - trade_ms % series.period_ms
+            bar = series.bar
+            if bar is not None and bar.start_ms == start:
+                if price > bar.high:
+                    bar.high = price
+                elif price < bar.low:
+                    bar.low = price
+                bar.close = price
+                bar.acc_price += price * volume
+                bar.acc_volume += volume
+                if trade_ms > bar.last_trade_ms:
+                    bar.last_trade_ms = trade_ms
+                bar.trade_count += 1
+                continue
+
+            if bar is not None:
+                if start < bar.start_ms:
+                    self.stats.late_trades += 1  # 이미 지난 버킷 - 닫힌 봉은 수정하지 않음
+                    continue
+                self._close_bar(series, bar)
+            elif series.last_real_start is not None and start <= series.last_real_start:
+                self.stats.late_trades += 1
+                continue
+
+            if series.last_real_start is not None:
+                self._emit_empty_bars(series, series.last_real_start + series.period_ms, start)
+            series.bar = _OpenBar(start, price, volume, trade_ms, series.fresh)
+            series.fresh = False
+
+    def on_trade_event(self, event) -> None:
+        """WebSocket TradeEvent 콜백 (subscribe_trade 에 직접 등록)"""
+        trade_ms = event.trade_timestamp or event.timestamp_ms
+        if not event.symbol or trade_ms is None or event.trade_price is None or event.trade_volume is None:
+            return
+        self.on_trade(event.symbol, int(trade_ms), float(event.trade_price), float(event.trade_volume),
+                      event.sequential_id)
+
+    def on_trade_dict(self, data: Dict[str, Any]) -> None:
+        """업비트 체결 Dict (WebSocket code/trade_timestamp 또는 REST market/timestamp 형식)"""
+        symbol = data.get('code') or data.get('market')
+        trade_ms = data.get('trade_timestamp') or data.get('timestamp')
+        if not symbol or trade_ms is None:
+            return
+        self.on_trade(symbol, int(trade_ms), float(data['trade_price']), float(data['trade_volume']),
+                      data.get('sequential_id'))
+
+    def mark_stream_gap(self, symbol: Optional[str] = None) -> None:
+        """
+        스트림 끊김 표시 (WebSocket 재연결 등)
+
+        끊긴 동안의 체결을 알 수 없으므로 형성 중인 봉은 버리고, 다음 봉은 부분 봉으로 취급하며
+        끊김 구간에는 빈 봉을 만들지 않습니다 (REST 백필이 채움).
+        """
+        targets = [self._series.get(symbol, [])] if symbol else list(self._series.values())
+        for series_list in targets:
+            for series in series_list:
+                if series.bar is not None:
+                    self.stats.partial_bars_dropped += 1
+                series.bar = None
+                series.last_real_start = None
+                series.fresh = True
+        if symbol:
+            self._last_sequential_id.pop(symbol, None)
+        else:
+            self._last_sequential_id.clear()
+
+    def get_open_bar(self, symbol: str, timeframe: str) -> Optional[Dict[str, Any]]:
+        """형성 중인 봉 (실시간 차트 표시용, 업비트 캔들 형식)"""
+        for series in self._series.get(symbol, ()):
+            if series.timeframe == timeframe and series.bar is not None:
+                return self._bar_to_dict(series, series.bar)
+        return None
+
+    # === 봉 마감 / 빈 봉 ===
+
+    def close_due(self, now_ms: Optional[int] = None) -> int:
+        """체결이 끊긴 심볼의 봉 중 버킷 종료 + close_grace_ms 가 지난 봉을 마감"""
+        if now_ms is None:
+            now_ms = int(self._clock() * 1000)
+        closed = 0
+        for series_list in self._series.values():
+            for series in series_list:
+                bar = series.bar
+                if bar is not None and bar.start_ms + series.period_ms + self.close_grace_ms <= now_ms:
+                    self._close_bar(series, bar)
+                    series.bar = None
+                    closed += 1
+        return closed
+
+    def _close_bar(self, series: _Series, bar: _OpenBar) -> None:
+        series.last_real_start = bar.start_ms
+        if bar.partial:
+            self.stats.partial_bars_dropped += 1
+            return
+        self._pending_replace[series.key].append(self._bar_to_dict(series, bar))
+        self.stats.bars_closed += 1
+        if self._pending_since is None:
+            self._pending_since = time.perf_counter()
+
+    def _emit_empty_bars(self, series: _Series, first_start: int, end_exclusive: int) -> None:
+        period = series.period_ms
+        count = (end_exclusive - first_start) // period
+        if count <= 0:
+            return
+        if count > self.max_empty_fill:
+            self.stats.truncated_gaps += 1
+            first_start = end_exclusive - self.max_empty_fill * period
+            count = self.max_empty_fill
+
+        reference = _format_utc(series.last_real_start)
+        pending = self._pending_insert[series.key]
+        symbol = series.symbol
+        for i in range(count):
+            start = first_start + i * period
+            pending.append({
+                'market': symbol,
+                'candle_date_time_utc': _format_utc(start),
+                'candle_date_time_kst': None,
+                'opening_price': None,
+                'high_price': None,
+                'low_price': None,
+                'trade_price': None,
+                'timestamp': start,
+                'candle_acc_trade_price': None,
+                'candle_acc_trade_volume': None,
+                'empty_copy_from_utc': reference,
+            })
+        self.stats.empty_bars += count
+        if self._pending_since is None:
+            self._pending_since = time.perf_counter()
+
+    @staticmethod
+    def _bar_to_dict(series: _Series, bar: _OpenBar) -> Dict[str, Any]:
+        return {
+            'market': series.symbol,
+            'candle_date_time_utc': _format_utc(bar.start_ms),
+            'candle_date_time_kst': _format_kst(bar.start_ms),
+            'opening_price': bar.open,
+            'high_price': bar.high,
+            'low_price': bar.low,
+            'trade_price': bar.close,
+            'timestamp': bar.last_trade_ms,
+            'candle_acc_trade_price': bar.acc_price,
+            'candle_acc_trade_volume': bar.acc_volume,
+            'empty_copy_from_utc': None,
+        }
+
+    # === flush ===
+
+    def add_listener(self, callback: Callable[[CandleBatch], Any]) -> None:
+        """flush 성공 후 저장된 봉 통지 콜백 등록 ({(symbol, timeframe): [봉 Dict, ...]})"""
+        self._listeners.append(callback)
+
+    def pending_rows(self) -> int:
+        return (sum(len(rows) for rows in self._pending_replace.values())
+                + sum(len(rows) for rows in self._pending_insert.values()))
+
+    async def flush(self, now_ms: Optional[int] = None) -> int:
+        """마감 대상 봉을 닫고, 대기 중인 봉/빈 봉을 한 트랜잭션으로 저장"""
+        async with self._flush_lock:
+            self.close_due(now_ms)
+            if not self._pending_replace and not self._pending_insert:
+                return 0
+
+            replace, insert = self._pending_replace, self._pending_insert
+            pending_since = self._pending_since
+            self._pending_replace = collections.defaultdict(list)
+            self._pending_insert = collections.defaultdict(list)
+            self._pending_since = None
+
+            started = time.perf_counter()
+            try:
+                saved = await self._repository.upsert_candles_batch(dict(replace), dict(insert))
+            except Exception as e:
+                # 실패한 봉은 다음 flush 에서 재시도 (새로 쌓인 봉보다 앞에 둠)
+                for target, rows_by_key in ((self._pending_replace, replace), (self._pending_insert, insert)):
+                    for key, rows in rows_by_key.items():
+                        target[key] = rows + target[key]
+                self._pending_since = pending_since
+                self.stats.flush_errors += 1
+                logger.error(f"실시간 캔들 flush 실패: {e}")
+                return 0
+
+            finished = time.perf_counter()
+            self.stats.flushes += 1
+            self.stats.rows_flushed += saved
+            self.stats.flush_duration_ms.append((finished - started) * 1000)
+            if pending_since is not None:
+                self.stats.close_to_commit_ms.append((finished - pending_since) * 1000)
+
+            if self._listeners:
+                batch = {key: rows for key, rows in replace.items()}
+                for callback in self._listeners:
+                    try:
+                        callback(batch)
+                    except Exception as e:
+                        logger.warning(f"실시간 캔들 리스너 오류: {e}")
+
+            logger.debug(f"실시간 캔들 flush: {saved}행 ({(finished - started) * 1000:.1f}ms)")
+            return saved
+
+    # === WebSocket 구독 ===
+
+    async def subscribe(self, symbols: Sequence[str], client: Optional[WebSocketClient] = None) -> bool:
+        """
+        WebSocket 체결 스트림 구독 + 연결 상태 리스너 등록
+
+        다시 호출하면 이전 구독을 해제하고 새 심볼 목록으로 구독합니다.
+        교체 사이의 체결은 알 수 없으므로 전체 심볼을 스트림 끊김으로 처리합니다.
+
+        Args:
+            symbols: 집계할 심볼 목록
+            client: 사용할 WebSocket 클라이언트 (기본: 새 'live_candle_aggregator_*' 컴포넌트)
+
+        Returns:
+            bool: 체결 구독 성공 여부
+        """
+        await self.unsubscribe()
+        self._websocket_client = client or WebSocketClient(f"live_candle_aggregator_{int(time.time() * 1000)}")
+        await self._websocket_client.add_connection_listener(self._on_connection_state)
+        # 재구독 때마다 오는 SNAPSHOT 체결은 받지 않음 (중복은 sequential_id 로도 걸러냄)
+        success = await self._websocket_client.subscribe_trade(list(symbols), self.on_trade_event,
+                                                               stream_preference="realtime_only")
+        if success:
+            logger.info(f"실시간 캔들 체결 구독: {len(symbols)}개 심볼")
+        else:
+            logger.warning("실시간 캔들 체결 구독 실패")
+        return success
+
+    async def unsubscribe(self) -> None:
+        """체결 구독/연결 상태 리스너 해제 (이후 체결은 알 수 없으므로 스트림 끊김 처리)"""
+        if self._websocket_client is None:
+            return
+        client, self._websocket_client = self._websocket_client, None
+        try:
+            await client.cleanup()
+        finally:
+            self.mark_stream_gap()
+
+    def _on_connection_state(self, connection_type: WebSocketType, state: ConnectionState) -> None:
+        """WebSocketManager 연결 상태 리스너 - Public 연결이 끊기면 스트림 끊김 표시"""
+        if connection_type == WebSocketType.PUBLIC and state not in _STREAMING_STATES:
+            logger.info(f"WebSocket 연결 끊김 감지 ({state.value}) - 형성 중인 봉 폐기")
+            self.mark_stream_gap()
+
+    # === 실행 ===
+
+    async def start(self, task_factory: Optional[Callable[..., asyncio.Task]] = None) -> None:
+        """
+        주기적 flush 시작
+
+        Args:
+            task_factory: flush 루프 태스크 생성 함수 (기본 asyncio.create_task, AppKernel.create_task 등으로 추적)
+        """
+        if self._flush_task is None or self._flush_task.done():
+            factory = task_factory or asyncio.create_task
+            self._flush_task = factory(self._flush_loop(), name="live-candle-flush")
+
+    async def stop(self) -> None:
+        """구독 해제 + 주기적 flush 중지 + 마감된 봉 최종 저장 (형성 중인 봉은 저장하지 않음)"""
+        await self.unsubscribe()
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+        logger.info(f"LiveCandleAggregator 중지: {self.stats.to_dict()}")
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
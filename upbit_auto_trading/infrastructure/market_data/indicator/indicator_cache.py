@@ -0,0 +1,540 @@
+"""
+IndicatorCache - 2단 기술적 지표 캐시 (메모리 LRU + market_data DB 컬럼형 블록)
+
+Purpose: MarketDataRepository의 지표 캐시 계약(get_indicator_data, save_indicator_data,
+         is_indicator_cached, get_missing_indicator_timestamps)을 실제로 구현
+Key: (symbol, timeframe, indicator, params)
+
+핵심 설계 원칙:
+1. 메모리 계층: 바이트 예산 기반 LRU (OrderedDict, 배열 nbytes 합산)
+2. 영속 계층: 고정 행 수 블록 단위 컬럼 저장
+   - timestamps: int64 ms 델타 인코딩 + zlib 압축
+   - values: float64 원시 바이트 + zlib 압축
+   - 블록마다 종료 시점 계산 상태(JSON)를 함께 저장
+3. 증분 계산: 마지막 캐시 시점 이후 추가된 캔들만 블록 경계에 맞춰 계산
+4. 정밀 무효화: 캐시 범위 안의 캔들이 바뀌면 해당 시점을 포함한 블록부터 잘라내고
+   직전 블록 상태에서 다시 계산 (빈 캔들 → 실제 캔들 교체, 과거 구간 보강 등)
+5. 빈 캔들: NULL 종가는 직전 종가로 채움 (EmptyCandleDetector의 직전 종가 복사와 동일)
+"""
+
+import json
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from upbit_auto_trading.infrastructure.database.database_manager import DatabaseManager
+from upbit_auto_trading.infrastructure.logging import create_component_logger
+from upbit_auto_trading.infrastructure.market_data.indicator.indicator_calculator import (
+    IndicatorState, get_indicator_function
+)
+
+logger = create_component_logger("IndicatorCache")
+
+SERIES_TABLE = "indicator_cache_series"
+BLOCK_TABLE = "indicator_cache_blocks"
+
+TimeLike = Union[datetime, str, int]
+
+
+@dataclass
+class IndicatorSeries:
+    """단일 지표 키의 계산 결과 (캔들 시작 UTC ms 기준 오름차순)"""
+    timestamps: np.ndarray
+    values: np.ndarray
+    state: Optional[IndicatorState] = None
+    last_close: Optional[float] = None
+
+    @classmethod
+    def empty(cls) -> "IndicatorSeries":
+        return cls(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64))
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.timestamps.nbytes + self.values.nbytes)
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        return int(self.timestamps[-1]) if len(self.timestamps) else None
+
+
+def _to_ms(value: TimeLike) -> int:
+    """datetime/UTC 문자열/ms → UTC ms (naive datetime은 UTC로 간주)"""
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', ''))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+def _ms_to_utc_text(ms: int) -> str:
+    """UTC ms → 캔들 테이블 PRIMARY KEY 형식 ('2025-09-08T14:12:00')"""
+    return str(np.datetime_as_string(np.datetime64(int(ms), 'ms'), unit='s'))
+
+
+def _ms_to_datetime(ms: int) -> datetime:
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+
+
+def _encode_block(timestamps: np.ndarray, values: np.ndarray) -> Tuple[bytes, bytes]:
+    deltas = np.diff(timestamps, prepend=np.int64(0)).astype(np.int64)
+    return (zlib.compress(deltas.tobytes(), 1),
+            zlib.compress(values.astype(np.float64).tobytes(), 1))
+
+
+def _decode_block(ts_blob: bytes, value_blob: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    deltas = np.frombuffer(zlib.decompress(ts_blob), dtype=np.int64)
+    values = np.frombuffer(zlib.decompress(value_blob), dtype=np.float64)
+    return np.cumsum(deltas), values.copy()
+
+
+class IndicatorCache:
+    """
+    기술적 지표 캐시
+
+    get_series()가 기본 진입점이며, 호출 시점에 캔들 테이블에 새로 추가된 꼬리만 계산해 캐시를 확장합니다.
+    MarketDataRepository 지표 메서드와 같은 시그니처의 호환 메서드를 함께 제공합니다.
+    """
+
+    def __init__(self, db_manager: DatabaseManager,
+                 memory_budget_bytes: int = 64 * 1024 * 1024,
+                 block_size: int = 4096):
+        """
+        Args:
+            db_manager: DatabaseManager 인스턴스 (market_data DB 사용)
+            memory_budget_bytes: 메모리 계층 바이트 예산
+            block_size: 영속 블록당 행 수
+        """
+        self.db_manager = db_manager
+        self.memory_budget_bytes = memory_budget_bytes
+        self.block_size = block_size
+
+        self._memory: "OrderedDict[str, IndicatorSeries]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.RLock()
+        self._stats = {
+            "memory_hits": 0,
+            "db_loads": 0,
+            "computed_rows": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+        self._ensure_schema()
+        logger.info(f"IndicatorCache 초기화: 메모리 예산 {memory_budget_bytes / 1024 / 1024:.0f}MB, 블록 {block_size}행")
+
+    # === 키/스키마 ===
+
+    @staticmethod
+    def make_key(symbol: str, timeframe: Any, indicator_name: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """캐시 키 생성 (파라미터는 정렬된 JSON으로 정규화)"""
+        timeframe = getattr(timeframe, "value", timeframe)
+        params_json = json.dumps(params or {}, sort_keys=True, separators=(",", ":"))
+        return f"{symbol}|{timeframe}|{indicator_name.upper()}|{params_json}"
+
+    def _ensure_schema(self) -> None:
+        with self.db_manager.get_connection("market_data") as conn:
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {SERIES_TABLE} (
+                    cache_key TEXT NOT NULL PRIMARY KEY,
+                    symbol TEXT NOT NULL,
+                    timeframe TEXT NOT NULL,
+                    indicator TEXT NOT NULL,
+                    params_json TEXT NOT NULL,
+                    first_ts_ms INTEGER,
+                    last_ts_ms INTEGER,
+                    row_count INTEGER NOT NULL DEFAULT 0,
+                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_{SERIES_TABLE}_symbol_timeframe
+                ON {SERIES_TABLE}(symbol, timeframe)
+            """)
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {BLOCK_TABLE} (
+                    cache_key TEXT NOT NULL,
+                    block_index INTEGER NOT NULL,
+                    first_ts_ms INTEGER NOT NULL,
+                    last_ts_ms INTEGER NOT NULL,
+                    row_count INTEGER NOT NULL,
+                    timestamps BLOB NOT NULL,
+                    indicator_values BLOB NOT NULL,
+                    end_state TEXT,
+                    PRIMARY KEY (cache_key, block_index)
+                )
+            """)
+
+    # === 핵심 API ===
+
+    def get_series(self, symbol: str, timeframe: Any, indicator_name: str,
+                   params: Optional[Dict[str, Any]] = None,
+                   start: Optional[TimeLike] = None,
+                   end: Optional[TimeLike] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        지표 시계열 조회 (미계산 꼬리 자동 계산)
+
+        Returns:
+            (UTC ms 타임스탬프 배열, 지표값 배열) - 워밍업 구간은 NaN
+        """
+        timeframe = getattr(timeframe, "value", timeframe)
+        params = params or {}
+        key = self.make_key(symbol, timeframe, indicator_name, params)
+
+        with self._lock:
+            series = self._load_series(key)
+            series = self._extend_series(key, symbol, timeframe, indicator_name, params, series)
+            self._remember(key, series)
+
+        lo = 0 if start is None else int(np.searchsorted(series.timestamps, _to_ms(start), side="left"))
+        hi = len(series.timestamps) if end is None else int(np.searchsorted(series.timestamps, _to_ms(end), side="right"))
+        return series.timestamps[lo:hi], series.values[lo:hi]
+
+    def invalidate(self, symbol: str, timeframe: Any, changed_from: TimeLike) -> int:
+        """
+        캔들 변경 시점 이후 지표 무효화
+
+        changed_from 이후(포함) 값에 영향을 받는 블록만 잘라내고, 다음 조회 시 직전 블록 상태에서 재계산합니다.
+        캐시된 마지막 시점보다 뒤의 변경(단순 꼬리 추가)은 무효화하지 않습니다.
+
+        Returns:
+            무효화된 지표 키 수
+        """
+        timeframe = getattr(timeframe, "value", timeframe)
+        changed_ms = _to_ms(changed_from)
+
+        with self._lock:
+            with self.db_manager.get_connection("market_data") as conn:
+                rows = conn.execute(
+                    f"SELECT cache_key, last_ts_ms FROM {SERIES_TABLE} WHERE symbol = ? AND timeframe = ?",
+                    (symbol, timeframe)
+                ).fetchall()
+                affected = [row[0] for row in rows if row[1] is not None and changed_ms <= row[1]]
+
+                for key in affected:
+                    # 변경 시점을 포함하는 블록부터 삭제 (이전 블록의 종료 상태는 유효)
+                    first_block = conn.execute(
+                        f"""SELECT MIN(block_index) FROM {BLOCK_TABLE}
+                            WHERE cache_key = ? AND last_ts_ms >= ?""",
+                        (key, changed_ms)
+                    ).fetchone()[0]
+                    if first_block is None:
+                        continue
+                    conn.execute(
+                        f"DELETE FROM {BLOCK_TABLE} WHERE cache_key = ? AND block_index >= ?",
+                        (key, first_block)
+                    )
+                    conn.execute(f"""
+                        UPDATE {SERIES_TABLE} SET
+                            last_ts_ms = (SELECT MAX(last_ts_ms) FROM {BLOCK_TABLE} WHERE cache_key = ?),
+                            row_count = (SELECT COALESCE(SUM(row_count), 0) FROM {BLOCK_TABLE} WHERE cache_key = ?),
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE cache_key = ?
+                    """, (key, key, key))
+
+            for key in affected:
+                self._forget(key)
+            self._stats["invalidations"] += len(affected)
+
+        if affected:
+            logger.debug(f"지표 캐시 무효화: {symbol} {timeframe} {_ms_to_utc_text(changed_ms)}~, {len(affected)}개 키")
+        return len(affected)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """캐시 통계 (메모리 사용량/적중/계산량)"""
+        with self._lock:
+            return {
+                **self._stats,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "memory_budget_bytes": self.memory_budget_bytes,
+            }
+
+    # === MarketDataRepository 호환 메서드 ===
+
+    def get_indicator_data(self, symbol: str, indicator_name: str, timeframe: Any, period: int,
+                           start_date: Optional[datetime] = None,
+                           end_date: Optional[datetime] = None) -> List[Tuple[datetime, float]]:
+        """(타임스탬프, 지표값) 목록 조회 (워밍업 NaN 제외)"""
+        timestamps, values = self.get_series(symbol, timeframe, indicator_name, {"period": period},
+                                             start_date, end_date)
+        valid = ~np.isnan(values)
+        return [(_ms_to_datetime(ts), value)
+                for ts, value in zip(timestamps[valid].tolist(), values[valid].tolist())]
+
+    def get_latest_indicator_value(self, symbol: str, indicator_name: str,
+                                   timeframe: Any, period: int) -> Optional[float]:
+        """최신 지표값 조회"""
+        _, values = self.get_series(symbol, timeframe, indicator_name, {"period": period})
+        if len(values) == 0 or np.isnan(values[-1]):
+            return None
+        return float(values[-1])
+
+    def save_indicator_data(self, symbol: str, indicator_name: str, timeframe: Any, period: int,
+                            values: List[Tuple[datetime, float]]) -> int:
+        """
+        외부에서 계산한 지표값 저장
+
+        기존 캐시 뒤에 이어지는 값만 추가합니다. 외부 값에는 계산 상태가 없으므로
+        이후 증분 계산은 전체 재계산으로 시작됩니다.
+        """
+        if not values:
+            return 0
+
+        timeframe = getattr(timeframe, "value", timeframe)
+        params = {"period": period}
+        key = self.make_key(symbol, timeframe, indicator_name, params)
+        ordered = sorted((_to_ms(ts), float(value)) for ts, value in values)
+
+        with self._lock:
+            series = self._load_series(key)
+            last_ts = series.last_timestamp
+            new_rows = [row for row in ordered if last_ts is None or row[0] > last_ts]
+            if not new_rows:
+                return 0
+
+            start_index = len(series.timestamps)
+            series = IndicatorSeries(
+                timestamps=np.concatenate((series.timestamps, np.array([r[0] for r in new_rows], dtype=np.int64))),
+                values=np.concatenate((series.values, np.array([r[1] for r in new_rows], dtype=np.float64))),
+                state=None,
+                last_close=None,
+            )
+            self._persist(key, symbol, timeframe, indicator_name, params, series, start_index, [None])
+            self._remember(key, series)
+            return len(new_rows)
+
+    def is_indicator_cached(self, symbol: str, indicator_name: str, timeframe: Any, period: int,
+                            timestamp: TimeLike) -> bool:
+        """특정 캔들 시점의 지표 캐시 여부 (계산을 유발하지 않음)"""
+        key = self.make_key(symbol, timeframe, indicator_name, {"period": period})
+        with self._lock:
+            series = self._load_series(key)
+        target = _to_ms(timestamp)
+        index = int(np.searchsorted(series.timestamps, target))
+        return index < len(series.timestamps) and int(series.timestamps[index]) == target
+
+    def get_missing_indicator_timestamps(self, symbol: str, indicator_name: str, timeframe: Any, period: int,
+                                         start_date: TimeLike, end_date: TimeLike) -> List[datetime]:
+        """범위 내 캔들 중 지표 캐시가 없는 시점 목록 (계산을 유발하지 않음)"""
+        timeframe = getattr(timeframe, "value", timeframe)
+        key = self.make_key(symbol, timeframe, indicator_name, {"period": period})
+        with self._lock:
+            series = self._load_series(key)
+
+        table_name = self._candle_table(symbol, timeframe)
+        try:
+            with self.db_manager.get_connection("market_data") as conn:
+                rows = conn.execute(
+                    f"""SELECT candle_date_time_utc FROM {table_name}
+                        WHERE candle_date_time_utc BETWEEN ? AND ? ORDER BY candle_date_time_utc ASC""",
+                    (_ms_to_utc_text(_to_ms(start_date)), _ms_to_utc_text(_to_ms(end_date)))
+                ).fetchall()
+        except Exception as e:
+            logger.debug(f"캔들 시점 조회 실패: {table_name}, {e}")
+            return []
+
+        candle_ms = np.array([row[0] for row in rows], dtype="datetime64[s]").astype(np.int64) * 1000
+        missing = candle_ms[~np.isin(candle_ms, series.timestamps)]
+        return [_ms_to_datetime(ms) for ms in missing.tolist()]
+
+    def cleanup_indicator_cache(self, cutoff_date: TimeLike, indicator_names: Optional[List[str]] = None) -> int:
+        """
+        지표 캐시 정리
+
+        cutoff_date 이전에 마지막으로 갱신된(더 이상 조회되지 않는) 키를 통째로 삭제합니다.
+        블록 연속성이 깨지지 않도록 키 단위로만 삭제합니다.
+        """
+        cutoff_ms = _to_ms(cutoff_date)
+        with self._lock:
+            with self.db_manager.get_connection("market_data") as conn:
+                query = f"SELECT cache_key, indicator FROM {SERIES_TABLE} WHERE last_ts_ms IS NULL OR last_ts_ms < ?"
+                rows = conn.execute(query, (cutoff_ms,)).fetchall()
+                names = {name.upper() for name in indicator_names} if indicator_names else None
+                keys = [row[0] for row in rows if names is None or row[1] in names]
+                for key in keys:
+                    conn.execute(f"DELETE FROM {BLOCK_TABLE} WHERE cache_key = ?", (key,))
+                    conn.execute(f"DELETE FROM {SERIES_TABLE} WHERE cache_key = ?", (key,))
+            for key in keys:
+                self._forget(key)
+        return len(keys)
+
+    # === 내부: 계층 관리 ===
+
+    def _remember(self, key: str, series: IndicatorSeries) -> None:
+        """메모리 계층 등록 + 바이트 예산 초과분 LRU 축출"""
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous.nbytes
+
+        self._memory[key] = series
+        self._memory_bytes += series.nbytes
+
+        while self._memory_bytes > self.memory_budget_bytes and len(self._memory) > 1:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+            self._stats["evictions"] += 1
+
+    def _forget(self, key: str) -> None:
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous.nbytes
+
+    def _load_series(self, key: str) -> IndicatorSeries:
+        """메모리 → DB 블록 순으로 조회"""
+        series = self._memory.get(key)
+        if series is not None:
+            self._memory.move_to_end(key)
+            self._stats["memory_hits"] += 1
+            return series
+
+        with self.db_manager.get_connection("market_data") as conn:
+            rows = conn.execute(
+                f"""SELECT timestamps, indicator_values, end_state FROM {BLOCK_TABLE}
+                    WHERE cache_key = ? ORDER BY block_index ASC""",
+                (key,)
+            ).fetchall()
+
+        if not rows:
+            return IndicatorSeries.empty()
+
+        self._stats["db_loads"] += 1
+        decoded = [_decode_block(row[0], row[1]) for row in rows]
+        end_state = json.loads(rows[-1][2]) if rows[-1][2] else {}
+        return IndicatorSeries(
+            timestamps=np.concatenate([block[0] for block in decoded]),
+            values=np.concatenate([block[1] for block in decoded]),
+            state=end_state.get("state"),
+            last_close=end_state.get("last_close"),
+        )
+
+    # === 내부: 증분 계산 ===
+
+    @staticmethod
+    def _candle_table(symbol: str, timeframe: str) -> str:
+        return f"candles_{symbol.replace('-', '_')}_{timeframe}"
+
+    def _extend_series(self, key: str, symbol: str, timeframe: str, indicator_name: str,
+                       params: Dict[str, Any], series: IndicatorSeries) -> IndicatorSeries:
+        """마지막 캐시 시점 이후의 캔들만 계산하여 시계열 확장"""
+        function = get_indicator_function(indicator_name)
+
+        # 상태 없는 기존 값(외부 저장분)은 증분 계산 불가 → 전체 재계산
+        if len(series.timestamps) and series.state is None:
+            series = IndicatorSeries.empty()
+            self._delete_blocks(key)
+
+        last_ts = series.last_timestamp
+        candle_ms, closes = self._load_new_closes(symbol, timeframe, last_ts)
+        if len(candle_ms) == 0:
+            return series
+
+        # 빈 캔들(NULL 종가) → 직전 종가
+        if np.isnan(closes).any():
+            valid = ~np.isnan(closes)
+            positions = np.where(valid, np.arange(len(closes)), -1)
+            np.maximum.accumulate(positions, out=positions)
+            filled = np.where(positions >= 0, closes[np.maximum(positions, 0)], series.last_close
+                              if series.last_close is not None else np.nan)
+            keep = ~np.isnan(filled)
+            candle_ms, closes = candle_ms[keep], filled[keep]
+            if len(candle_ms) == 0:
+                return series
+
+        # 블록 경계에 맞춰 계산 (블록별 종료 상태 확보)
+        start_index = len(series.timestamps)
+        state = series.state
+        value_chunks: List[np.ndarray] = []
+        block_states: List[Optional[Dict[str, Any]]] = []
+        position = 0
+        cursor = start_index
+        while position < len(closes):
+            take = self.block_size - (cursor % self.block_size)
+            chunk = closes[position:position + take]
+            values, state = function(chunk, params, state)
+            value_chunks.append(values)
+            block_states.append({"state": state, "last_close": float(chunk[-1])})
+            position += len(chunk)
+            cursor += len(chunk)
+
+        extended = IndicatorSeries(
+            timestamps=np.concatenate((series.timestamps, candle_ms)),
+            values=np.concatenate([series.values] + value_chunks),
+            state=state,
+            last_close=float(closes[-1]),
+        )
+        self._stats["computed_rows"] += len(closes)
+
+        self._persist(key, symbol, timeframe, indicator_name, params, extended, start_index, block_states)
+        return extended
+
+    def _load_new_closes(self, symbol: str, timeframe: str, last_ts: Optional[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """캔들 테이블에서 last_ts 이후 종가 로드 (오름차순)"""
+        table_name = self._candle_table(symbol, timeframe)
+        since = _ms_to_utc_text(last_ts) if last_ts is not None else ""
+        try:
+            with self.db_manager.get_connection("market_data") as conn:
+                rows = conn.execute(
+                    f"""SELECT candle_date_time_utc, trade_price FROM {table_name}
+                        WHERE candle_date_time_utc > ? ORDER BY candle_date_time_utc ASC""",
+                    (since,)
+                ).fetchall()
+        except Exception as e:
+            logger.debug(f"캔들 테이블 조회 실패: {table_name}, {e}")
+            rows = []
+
+        if not rows:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        candle_ms = np.array([row[0] for row in rows], dtype="datetime64[s]").astype(np.int64) * 1000
+        closes = np.array([np.nan if row[1] is None else row[1] for row in rows], dtype=np.float64)
+        return candle_ms, closes
+
+    # === 내부: 영속 계층 ===
+
+    def _persist(self, key: str, symbol: str, timeframe: str, indicator_name: str, params: Dict[str, Any],
+                 series: IndicatorSeries, start_index: int, block_states: List[Optional[Dict[str, Any]]]) -> None:
+        """start_index 이후 행이 속한 블록만 기록 (마지막 부분 블록은 덮어쓰기)"""
+        size = self.block_size
+        first_block = start_index // size
+        last_block = (len(series.timestamps) - 1) // size
+
+        records = []
+        for offset, block_index in enumerate(range(first_block, last_block + 1)):
+            lo = block_index * size
+            hi = min(lo + size, len(series.timestamps))
+            timestamps = series.timestamps[lo:hi]
+            ts_blob, value_blob = _encode_block(timestamps, series.values[lo:hi])
+            end_state = block_states[min(offset, len(block_states) - 1)]
+            records.append((
+                key, block_index, int(timestamps[0]), int(timestamps[-1]), hi - lo,
+                ts_blob, value_blob, json.dumps(end_state) if end_state else None
+            ))
+
+        with self.db_manager.get_connection("market_data") as conn:
+            conn.executemany(f"""
+                INSERT OR REPLACE INTO {BLOCK_TABLE}
+                (cache_key, block_index, first_ts_ms, last_ts_ms, row_count, timestamps, indicator_values, end_state)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, records)
+            conn.execute(f"""
+                INSERT OR REPLACE INTO {SERIES_TABLE}
+                (cache_key, symbol, timeframe, indicator, params_json, first_ts_ms, last_ts_ms, row_count, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """, (
+                key, symbol, timeframe, indicator_name.upper(),
+                json.dumps(params, sort_keys=True, separators=(",", ":")),
+                int(series.timestamps[0]), int(series.timestamps[-1]), len(series.timestamps)
+            ))
+
+    def _delete_blocks(self, key: str) -> None:
+        with self.db_manager.get_connection("market_data") as conn:
+            conn.execute(f"DELETE FROM {BLOCK_TABLE} WHERE cache_key = ?", (key,))
+            conn.execute(f"DELETE FROM {SERIES_TABLE} WHERE cache_key = ?", (key,))
+        self._forget(key)
@@ -0,0 +1,174 @@
+"""
+IndicatorCalculator - 상태 기반 증분 기술적 지표 계산
+
+Purpose: IndicatorCache가 새로 추가된 캔들(미계산 꼬리)만 계산할 수 있도록
+         각 지표를 (신규 종가, 이전 상태) → (신규 지표값, 다음 상태) 형태로 정의
+
+핵심 설계 원칙:
+1. 정확성: 전체 재계산과 증분 계산 결과가 비트 단위로 동일 (상태가 계산 과정 전체를 보존)
+2. 직렬화 가능 상태: 상태는 JSON 저장 가능한 dict (블록 단위 영속화용)
+3. 벡터화: 윈도우 지표(SMA/볼린저밴드)는 NumPy 슬라이딩 윈도우, 재귀 지표(EMA/RSI/MACD)는 단일 루프
+4. 워밍업 구간: 필요한 캔들 수가 부족한 시점의 값은 NaN
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+IndicatorState = Dict[str, Any]
+IndicatorFunction = Callable[[np.ndarray, Dict[str, Any], Optional[IndicatorState]], Tuple[np.ndarray, IndicatorState]]
+
+
+def _window_values(closes: np.ndarray, state: Optional[IndicatorState]) -> Tuple[np.ndarray, int]:
+    """이전 윈도우 + 신규 종가 결합 (윈도우 지표 공통)"""
+    window = np.asarray(state["window"], dtype=np.float64) if state else np.empty(0, dtype=np.float64)
+    return np.concatenate((window, closes)), len(window)
+
+
+def _next_window_state(extended: np.ndarray, period: int) -> IndicatorState:
+    return {"window": extended[-(period - 1):].tolist() if period > 1 else []}
+
+
+def _rolling_mean_std(extended: np.ndarray, period: int, offset: int) -> Tuple[np.ndarray, np.ndarray]:
+    """결합 배열에서 신규 구간 위치의 이동 평균/표준편차 (모집단 표준편차)"""
+    size = len(extended) - offset
+    mean = np.full(size, np.nan)
+    std = np.full(size, np.nan)
+    if len(extended) < period:
+        return mean, std
+
+    windows = np.lib.stride_tricks.sliding_window_view(extended, period)
+    first = max(offset, period - 1)
+    target = windows[first - (period - 1):]
+    mean[first - offset:] = target.mean(axis=1)
+    std[first - offset:] = target.std(axis=1)
+    return mean, std
+
+
+def sma(closes: np.ndarray, params: Dict[str, Any], state: Optional[IndicatorState]) -> Tuple[np.ndarray, IndicatorState]:
+    """단순 이동평균"""
+    period = int(params.get("period", 20))
+    extended, offset = _window_values(closes, state)
+    mean, _ = _rolling_mean_std(extended, period, offset)
+    return mean, _next_window_state(extended, period)
+
+
+def _bollinger(component: str) -> IndicatorFunction:
+    def calculate(closes: np.ndarray, params: Dict[str, Any],
+                  state: Optional[IndicatorState]) -> Tuple[np.ndarray, IndicatorState]:
+        period = int(params.get("period", 20))
+        std_dev = float(params.get("std_dev", 2.0))
+        extended, offset = _window_values(closes, state)
+        mean, std = _rolling_mean_std(extended, period, offset)
+        if component == "upper":
+            values = mean + std_dev * std
+        elif component == "lower":
+            values = mean - std_dev * std
+        else:
+            values = mean
+        return values, _next_window_state(extended, period)
+    return calculate
+
+
+def _ema_step(value: float, previous: Optional[float], alpha: float) -> float:
+    return value if previous is None else previous + alpha * (value - previous)
+
+
+def ema(closes: np.ndarray, params: Dict[str, Any], state: Optional[IndicatorState]) -> Tuple[np.ndarray, IndicatorState]:
+    """지수 이동평균 (첫 종가 시드, period-1개 워밍업 구간은 NaN)"""
+    period = int(params.get("period", 20))
+    alpha = 2.0 / (period + 1)
+    current = state["ema"] if state else None
+    count = state["count"] if state else 0
+
+    values = np.empty(len(closes))
+    for i, close in enumerate(closes.tolist()):
+        current = _ema_step(close, current, alpha)
+        count += 1
+        values[i] = current if count >= period else np.nan
+
+    return values, {"ema": current, "count": count}
+
+
+def rsi(closes: np.ndarray, params: Dict[str, Any], state: Optional[IndicatorState]) -> Tuple[np.ndarray, IndicatorState]:
+    """RSI (Wilder 평활, 첫 period개 변화량 단순평균 시드)"""
+    period = int(params.get("period", 14))
+    state = dict(state) if state else {"last_close": None, "avg_gain": 0.0, "avg_loss": 0.0, "count": 0}
+    last_close = state["last_close"]
+    avg_gain = state["avg_gain"]
+    avg_loss = state["avg_loss"]
+    count = state["count"]  # 누적 변화량 개수
+
+    values = np.full(len(closes), np.nan)
+    for i, close in enumerate(closes.tolist()):
+        if last_close is not None:
+            change = close - last_close
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            count += 1
+            if count <= period:
+                avg_gain += gain / period
+                avg_loss += loss / period
+            else:
+                avg_gain = (avg_gain * (period - 1) + gain) / period
+                avg_loss = (avg_loss * (period - 1) + loss) / period
+
+            if count >= period:
+                values[i] = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        last_close = close
+
+    return values, {"last_close": last_close, "avg_gain": avg_gain, "avg_loss": avg_loss, "count": count}
+
+
+def _macd(component: str) -> IndicatorFunction:
+    def calculate(closes: np.ndarray, params: Dict[str, Any],
+                  state: Optional[IndicatorState]) -> Tuple[np.ndarray, IndicatorState]:
+        fast_alpha = 2.0 / (int(params.get("fast", 12)) + 1)
+        slow_period = int(params.get("slow", 26))
+        slow_alpha = 2.0 / (slow_period + 1)
+        signal_period = int(params.get("signal", 9))
+        signal_alpha = 2.0 / (signal_period + 1)
+
+        fast = state["fast"] if state else None
+        slow = state["slow"] if state else None
+        signal = state["signal"] if state else None
+        count = state["count"] if state else 0
+
+        values = np.full(len(closes), np.nan)
+        for i, close in enumerate(closes.tolist()):
+            fast = _ema_step(close, fast, fast_alpha)
+            slow = _ema_step(close, slow, slow_alpha)
+            macd_line = fast - slow
+            count += 1
+            if count < slow_period:
+                continue
+
+            signal = _ema_step(macd_line, signal, signal_alpha)
+            if component == "line":
+                values[i] = macd_line
+            elif count >= slow_period + signal_period - 1:
+                values[i] = signal if component == "signal" else macd_line - signal
+
+        return values, {"fast": fast, "slow": slow, "signal": signal, "count": count}
+    return calculate
+
+
+INDICATOR_FUNCTIONS: Dict[str, IndicatorFunction] = {
+    "SMA": sma,
+    "EMA": ema,
+    "RSI": rsi,
+    "BB_UPPER": _bollinger("upper"),
+    "BB_MIDDLE": _bollinger("middle"),
+    "BB_LOWER": _bollinger("lower"),
+    "MACD": _macd("line"),
+    "MACD_SIGNAL": _macd("signal"),
+    "MACD_HISTOGRAM": _macd("histogram"),
+}
+
+
+def get_indicator_function(indicator_name: str) -> IndicatorFunction:
+    """지표 이름으로 계산 함수 조회"""
+    function = INDICATOR_FUNCTIONS.get(indicator_name.upper())
+    if function is None:
+        raise ValueError(f"지원하지 않는 지표: {indicator_name} (지원: {sorted(INDICATOR_FUNCTIONS)})")
+    return function
@@ -29,7 +29,8 @@ from upbit_auto_trading.domain.repositories.settings_repository import SettingsR
 from upbit_auto_trading.domain.repositories.secure_keys_repository import SecureKeysRepository
 from upbit_auto_trading.domain.trigger_builder.repositories.i_trading_variable_repository import ITradingVariableRepository
 
-# Domain Services
+# Domain Events / Services
+from upbit_auto_trading.domain.events.domain_event_publisher import get_domain_event_publisher
 from upbit_auto_trading.domain.services.strategy_compatibility_service import StrategyCompatibilityService
 
 # Infrastructure 구현체들
@@ -38,6 +39,10 @@ from upbit_auto_trading.infrastructure.repositories.sqlite_trigger_repository im
 from upbit_auto_trading.infrastructure.repositories.sqlite_settings_repository import SqliteSettingsRepository
 from upbit_auto_trading.infrastructure.repositories.sqlite_secure_keys_repository import SqliteSecureKeysRepository
 from upbit_auto_trading.infrastructure.repositories.sqlite_trading_variable_repository import SqliteTradingVariableRepository
+from upbit_auto_trading.infrastructure.repositories.sqlite_strategy_read_model import SqliteStrategyReadModel
+from upbit_auto_trading.infrastructure.repositories.sqlite_candle_repository import SqliteCandleRepository
+from upbit_auto_trading.infrastructure.market_data.indicator.indicator_cache import IndicatorCache
+from upbit_auto_trading.infrastructure.repositories.trading_variable_catalog import build_variable_compatibility_index
 from upbit_auto_trading.infrastructure.database.database_manager import (
     DatabaseConnectionProvider
 )
@@ -90,6 +95,9 @@ class RepositoryContainer:
         self._settings_repository: Optional[SettingsRepository] = None
         self._secure_keys_repository: Optional[SecureKeysRepository] = None
         self._trading_variable_repository: Optional[ITradingVariableRepository] = None
+        self._strategy_read_model: Optional[SqliteStrategyReadModel] = None
+        self._candle_repository: Optional[SqliteCandleRepository] = None
+        self._indicator_cache: Optional[IndicatorCache] = None
 
         # Domain Services (Lazy Loading용)
         self._compatibility_service: Optional[StrategyCompatibilityService] = None
@@ -110,11 +118,35 @@ class RepositoryContainer:
 
         # Lazy Loading
         if self._strategy_repository is None:
-            self._strategy_repository = SqliteStrategyRepository(self._db_manager)
+            try:
+                read_model = self.get_strategy_read_model()
+            except Exception as e:
+                self._logger.warning(f"⚠️ 전략 Read Model 없이 Repository 생성: {e}")
+                read_model = None
+            self._strategy_repository = SqliteStrategyRepository(self._db_manager, read_model=read_model)
             self._logger.info("✅ SqliteStrategyRepository 초기화 완료")
 
         return self._strategy_repository
 
+    def get_strategy_read_model(self) -> SqliteStrategyReadModel:
+        """
+        전략 목록 / 대시보드 Read Model 반환
+
+        최초 생성 시 프로젝션 테이블을 준비하고 도메인 이벤트를 구독합니다.
+        프로젝션이 비었거나 스키마 버전이 다르면 생성 시 자동 재구축합니다 (실패 시 핸들러는 기존 조회 경로 사용).
+        """
+        # Mock Repository 확인
+        if 'strategy_read_model' in self._mock_repositories:
+            return self._mock_repositories['strategy_read_model']
+
+        # Lazy Loading
+        if self._strategy_read_model is None:
+            self._strategy_read_model = SqliteStrategyReadModel(self._db_manager)
+            self._strategy_read_model.subscribe(get_domain_event_publisher())
+            self._logger.info("✅ SqliteStrategyReadModel 초기화 완료")
+
+        return self._strategy_read_model
+
     def get_trigger_repository(self) -> TriggerRepository:
         """
         Trigger Repository 반환
@@ -187,6 +219,49 @@ class RepositoryContainer:
 
         return self._secure_keys_repository
 
+    def get_indicator_cache(self) -> IndicatorCache:
+        """
+        기술적 지표 캐시 반환 (market_data DB)
+
+        Returns:
+            IndicatorCache: 캔들 테이블 기반 증분 지표 캐시
+        """
+        # Mock Repository 확인
+        if 'indicator_cache' in self._mock_repositories:
+            return self._mock_repositories['indicator_cache']
+
+        # Lazy Loading
+        if self._indicator_cache is None:
+            self._indicator_cache = IndicatorCache(self._db_manager)
+            self._logger.info("✅ IndicatorCache 초기화 완료")
+
+        return self._indicator_cache
+
+    def get_candle_repository(self) -> SqliteCandleRepository:
+        """
+        Candle Repository 반환
+
+        캔들 저장 시 영향받는 지표 캐시 구간을 무효화하도록 IndicatorCache를 주입합니다.
+
+        Returns:
+            SqliteCandleRepository: 캔들 Repository 구현체
+        """
+        # Mock Repository 확인
+        if 'candle' in self._mock_repositories:
+            return self._mock_repositories['candle']
+
+        # Lazy Loading
+        if self._candle_repository is None:
+            try:
+                indicator_cache = self.get_indicator_cache()
+            except Exception as e:
+                self._logger.warning(f"⚠️ 지표 캐시 없이 Candle Repository 생성: {e}")
+                indicator_cache = None
+            self._candle_repository = SqliteCandleRepository(self._db_manager, indicator_cache=indicator_cache)
+            self._logger.info("✅ SqliteCandleRepository 초기화 완료")
+
+        return self._candle_repository
+
     def get_market_data_repository(self):
         """
         Market Data Repository 반환 (추후 구현)
@@ -232,7 +307,16 @@ class RepositoryContainer:
         if self._compatibility_service is None:
             # SettingsRepository를 dependency로 주입
             settings_repo = self.get_settings_repository()
-            self._compatibility_service = StrategyCompatibilityService(settings_repository=settings_repo)
+            # 호환성 인덱스는 YAML 카탈로그 + 비교 그룹 규칙으로 한 번 생성하고,
+            # 이후 변수 생성/수정/삭제는 Trading Variable Repository 가 인덱스에 반영
+            compatibility_index = build_variable_compatibility_index()
+            self._compatibility_service = StrategyCompatibilityService(
+                settings_repository=settings_repo,
+                compatibility_index=compatibility_index
+            )
+            variable_repo = self.get_trading_variable_repository()
+            if hasattr(variable_repo, 'attach_compatibility_index'):
+                variable_repo.attach_compatibility_index(compatibility_index)
             self._logger.info("✅ StrategyCompatibilityService 초기화 완료")
 
         return self._compatibility_service
@@ -304,6 +388,8 @@ class RepositoryContainer:
                 status['active_repositories'].append('strategy')
             if self._secure_keys_repository is not None:
                 status['active_repositories'].append('secure_keys')
+            if self._candle_repository is not None:
+                status['active_repositories'].append('candle')
 
             from datetime import datetime
             status['timestamp'] = datetime.now().isoformat()
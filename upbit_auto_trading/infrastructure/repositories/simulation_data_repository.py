@@ -6,7 +6,12 @@ DDD Infrastructure Layer - 실제 마켓 데이터 액세스
 import sqlite3
 import pandas as pd
 import os
+import random
 from typing import Optional, Dict, Any, List
+from upbit_auto_trading.domain.strategy_simulation.value_objects.simulation_scenario import SimulationScenario
+from upbit_auto_trading.infrastructure.repositories.strategy_simulation.candle_scenario_index import (
+    CandleScenarioIndex
+)
 from upbit_auto_trading.infrastructure.logging import create_component_logger
 
 logger = create_component_logger("SimulationDataRepository")
@@ -15,12 +20,23 @@ logger = create_component_logger("SimulationDataRepository")
 class SimulationDataRepository:
     """시뮬레이션용 마켓 데이터 Repository"""
 
-    def __init__(self, db_path: Optional[str] = None):
+    # 레거시 시나리오명 → 시나리오 인덱스 라벨
+    LEGACY_SCENARIO_MAP = {
+        '급등': SimulationScenario.SURGE,
+        '상승추세': SimulationScenario.UPTREND,
+        '횡보': SimulationScenario.SIDEWAYS,
+        '하락추세': SimulationScenario.DOWNTREND,
+        '급락': SimulationScenario.CRASH,
+    }
+
+    def __init__(self, db_path: Optional[str] = None, market_data_db_path: Optional[str] = None):
         """
         Repository 초기화
 
         Args:
             db_path: DB 경로 (None이면 기본 경로 사용)
+            market_data_db_path: 실제 캔들 테이블 DB 경로 (지정 시 시나리오 인덱스 우선 사용,
+                색인 갱신은 백그라운드 스레드에서 수행하며 완료 전에는 내장 세그먼트 사용)
         """
         if db_path is None:
             # 내장 시뮬레이션 데이터 경로 (Infrastructure Layer)
@@ -31,6 +47,11 @@ class SimulationDataRepository:
         else:
             self.db_path = db_path
 
+        self._scenario_index: Optional[CandleScenarioIndex] = None
+        if market_data_db_path and os.path.exists(market_data_db_path):
+            self._scenario_index = CandleScenarioIndex(market_data_db_path)
+            self._scenario_index.start_background_refresh()
+
         self._verify_database()
         logger.info(f"SimulationDataRepository 초기화 완료: {self.db_path}")
 
@@ -151,6 +172,10 @@ class SimulationDataRepository:
             }
         }
 
+        indexed_df = self._load_indexed_scenario_data(scenario, limit)
+        if indexed_df is not None:
+            return indexed_df
+
         if scenario not in scenario_segments:
             logger.warning(f"알 수 없는 시나리오: {scenario}")
             return self.load_market_data(limit=limit)
@@ -198,6 +223,37 @@ class SimulationDataRepository:
             logger.error(f"시나리오 데이터 로드 실패 {scenario}: {e}")
             return self.load_market_data(limit=limit)
 
+    def _load_indexed_scenario_data(self, scenario: str, limit: int) -> Optional[pd.DataFrame]:
+        """시나리오 인덱스에서 실제 캔들 구간 로드 (인덱스 미사용/갱신 중/미색인 시 None)"""
+        target = self.LEGACY_SCENARIO_MAP.get(scenario)
+        if self._scenario_index is None or target is None:
+            return None
+
+        if not self._scenario_index.is_ready:
+            logger.debug(f"시나리오 인덱스 갱신 중, 내장 세그먼트 사용: {scenario}")
+            return None
+
+        try:
+            segments = self._scenario_index.find_segments(target, limit=20)
+            if not segments:
+                return None
+
+            segment = segments[random.randrange(len(segments))]
+            df = self._scenario_index.load_segment(segment, limit)
+            if df is None or df.empty:
+                return None
+
+            df.index.name = 'timestamp'
+            logger.info(
+                f"시나리오 인덱스 데이터 로드: {scenario} ({segment.symbol} {segment.timeframe}, "
+                f"{segment.start_utc} ~ {segment.end_utc}, {len(df)}개)"
+            )
+            return df
+
+        except Exception as e:
+            logger.warning(f"시나리오 인덱스 로드 실패, 내장 세그먼트 사용: {scenario}, {e}")
+            return None
+
     def get_available_scenarios(self) -> List[str]:
         """사용 가능한 시나리오 목록 반환"""
         return ['급등', '상승추세', '횡보', '하락추세', '급락']
@@ -6,7 +6,9 @@ overlap_optimizer.py의 효율적인 쿼리 패턴을 활용하여 최적화된
 """
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from upbit_auto_trading.domain.repositories.candle_repository_interface import (
     CandleRepositoryInterface, DataRange
@@ -82,17 +84,68 @@ def _from_utc_iso(iso_str: str) -> datetime:
     return dt_naive.replace(tzinfo=timezone.utc)
 
 
+_CANDLE_COLUMNS = (
+    "candle_date_time_utc, market, candle_date_time_kst, "
+    "opening_price, high_price, low_price, trade_price, "
+    "timestamp, candle_acc_trade_price, candle_acc_trade_volume, "
+    "empty_copy_from_utc, created_at"
+)
+
+
+def _to_db_record(api_dict: dict) -> tuple:
+    """업비트 API 형식 Dict → DB 레코드 (None 값 안전 처리로 빈 캔들 지원)"""
+    return (
+        api_dict['candle_date_time_utc'],    # PRIMARY KEY
+        api_dict['market'],                  # 심볼
+        api_dict.get('candle_date_time_kst'),  # KST 시간 (빈 캔들: None으로 용량 절약)
+        _safe_float(api_dict.get('opening_price')),    # 시가 (빈 캔들: NULL)
+        _safe_float(api_dict.get('high_price')),       # 고가 (빈 캔들: NULL)
+        _safe_float(api_dict.get('low_price')),        # 저가 (빈 캔들: NULL)
+        _safe_float(api_dict.get('trade_price')),      # 종가 (빈 캔들: NULL)
+        _safe_int(api_dict.get('timestamp', 0)),       # 타임스탬프
+        _safe_float(api_dict.get('candle_acc_trade_price')),  # 누적 거래대금 (빈 캔들: NULL)
+        _safe_float(api_dict.get('candle_acc_trade_volume')),   # 누적 거래량 (빈 캔들: NULL)
+        api_dict.get('empty_copy_from_utc', None)  # 빈 캔들 식별 필드 (업비트 API엔 없음, 기본 NULL)
+    )
+
+
 class SqliteCandleRepository(CandleRepositoryInterface):
     """SQLite 기반 캔들 데이터 Repository (overlap_optimizer 효율적 쿼리 기반)"""
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, indicator_cache=None):
         """
         Args:
             db_manager: DatabaseManager 인스턴스 (의존성 주입)
+            indicator_cache: IndicatorCache (선택, 지정 시 캔들 저장 후 영향받는 지표 구간 무효화)
         """
         self.db_manager = db_manager
+        self.indicator_cache = indicator_cache
+        self._ensured_tables = set()  # upsert_candles_batch 에서 확인한 테이블 (반복 DDL 생략)
         logger.info("SqliteCandleRepository 초기화 완료 - overlap_optimizer 효율적 쿼리 기반")
 
+    def _invalidate_indicator_cache(self, symbol: str, timeframe: str, db_records: List[tuple], saved_count: int) -> None:
+        """저장된 캔들이 지표 캐시 범위 안쪽이면 해당 시점부터 무효화 (꼬리 추가는 무효화 없음)"""
+        if self.indicator_cache is None or saved_count <= 0:
+            return
+        try:
+            earliest_utc = min(record[0] for record in db_records)
+            self.indicator_cache.invalidate(symbol, timeframe, earliest_utc)
+        except Exception as e:
+            logger.warning(f"지표 캐시 무효화 실패: {symbol} {timeframe}, {e}")
+
+    def get_indicator_series(self, symbol: str, timeframe: str, indicator_name: str,
+                             params: Optional[Dict[str, Any]] = None,
+                             start: Optional[datetime] = None,
+                             end: Optional[datetime] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """저장 캔들 기반 지표 시계열 조회 (주입된 IndicatorCache 가 새로 추가된 캔들만 계산)
+
+        Returns:
+            (UTC ms 타임스탬프 배열, 지표값 배열) - 워밍업 구간은 NaN
+        """
+        if self.indicator_cache is None:
+            raise RuntimeError("IndicatorCache 가 주입되지 않았습니다")
+        return self.indicator_cache.get_series(symbol, timeframe, indicator_name, params, start, end)
+
     def _get_table_name(self, symbol: str, timeframe: str) -> str:
         """심볼과 타임프레임으로 테이블명 생성"""
         return f"candles_{symbol.replace('-', '_')}_{timeframe}"
@@ -751,7 +804,27 @@ class SqliteCandleRepository(CandleRepositoryInterface):
         - 업비트 API 공통 필드만 지원 (추가 필드는 제외)
         """
         table_name = self._get_table_name(symbol, timeframe)
+        create_table_sql, create_timestamp_index_sql = self._table_ddl(table_name)
+
+        try:
+            with self.db_manager.get_connection("market_data") as conn:
+                # 테이블 생성
+                conn.execute(create_table_sql)
 
+                # timestamp 인덱스 생성 (ORDER BY timestamp DESC 최적화)
+                conn.execute(create_timestamp_index_sql)
+
+                conn.commit()
+                logger.debug(f"테이블 확인/생성 완료 (인덱스 포함): {table_name}")
+                return table_name
+
+        except Exception as e:
+            logger.error(f"테이블 생성 실패: {table_name}, {e}")
+            raise
+
+    @staticmethod
+    def _table_ddl(table_name: str) -> Tuple[str, str]:
+        """캔들 테이블 / timestamp 인덱스 생성 SQL"""
         create_table_sql = f"""
         CREATE TABLE IF NOT EXISTS {table_name} (
             -- ✅ 단일 PRIMARY KEY (시간 정렬 + 중복 방지)
@@ -781,22 +854,7 @@ class SqliteCandleRepository(CandleRepositoryInterface):
         CREATE INDEX IF NOT EXISTS idx_{table_name}_timestamp
         ON {table_name}(timestamp DESC)
         """
-
-        try:
-            with self.db_manager.get_connection("market_data") as conn:
-                # 테이블 생성
-                conn.execute(create_table_sql)
-
-                # timestamp 인덱스 생성 (ORDER BY timestamp DESC 최적화)
-                conn.execute(create_timestamp_index_sql)
-
-                conn.commit()
-                logger.debug(f"테이블 확인/생성 완료 (인덱스 포함): {table_name}")
-                return table_name
-
-        except Exception as e:
-            logger.error(f"테이블 생성 실패: {table_name}, {e}")
-            raise
+        return create_table_sql, create_timestamp_index_sql
 
     async def save_raw_api_data(self, symbol: str, timeframe: str, raw_data: List[dict]) -> int:
         """업비트 API 원시 데이터 직접 저장 (성능 최적화)
@@ -824,20 +882,7 @@ class SqliteCandleRepository(CandleRepositoryInterface):
                     continue
 
                 # None 값 안전 처리로 빈 캔들 지원 (용량 절약)
-                db_records.append((
-                    api_dict['candle_date_time_utc'],    # PRIMARY KEY
-                    api_dict['market'],                  # 심볼
-                    # api_dict.get('candle_date_time_kst', ''),  # KST 시간
-                    api_dict.get('candle_date_time_kst'),  # KST 시간 (빈 캔들: None으로 용량 절약)
-                    _safe_float(api_dict.get('opening_price')),    # 시가 (빈 캔들: NULL)
-                    _safe_float(api_dict.get('high_price')),       # 고가 (빈 캔들: NULL)
-                    _safe_float(api_dict.get('low_price')),        # 저가 (빈 캔들: NULL)
-                    _safe_float(api_dict.get('trade_price')),      # 종가 (빈 캔들: NULL)
-                    _safe_int(api_dict.get('timestamp', 0)),       # 타임스탬프
-                    _safe_float(api_dict.get('candle_acc_trade_price')),  # 누적 거래대금 (빈 캔들: NULL)
-                    _safe_float(api_dict.get('candle_acc_trade_volume')),   # 누적 거래량 (빈 캔들: NULL)
-                    api_dict.get('empty_copy_from_utc', None)  # 빈 캔들 식별 필드 (업비트 API엔 없음, 기본 NULL)
-                ))
+                db_records.append(_to_db_record(api_dict))
             except (ValueError, KeyError) as e:
                 logger.warning(f"잘못된 API 데이터 스키핑: {api_dict}, 오류: {e}")
                 continue
@@ -863,12 +908,91 @@ class SqliteCandleRepository(CandleRepositoryInterface):
                 conn.commit()
 
                 logger.debug(f"원시 데이터 저장 완료: {symbol} {timeframe}, {saved_count}개")
-                return saved_count
+
+            self._invalidate_indicator_cache(symbol, timeframe, db_records, saved_count)
+            return saved_count
 
         except Exception as e:
             logger.error(f"원시 데이터 저장 실패: {symbol} {timeframe}, {e}")
             raise
 
+    async def upsert_candles_batch(
+        self,
+        replace_batches: Dict[Tuple[str, str], List[dict]],
+        insert_batches: Optional[Dict[Tuple[str, str], List[dict]]] = None
+    ) -> int:
+        """여러 (심볼, 타임프레임) 캔들을 한 트랜잭션으로 저장 (실시간 집계 flush 용)
+
+        - replace_batches: 같은 시각 행이 있으면 갱신 (완결된 실시간 봉이 기존 빈 캔들을 대체)
+        - insert_batches: 기존 행이 있으면 유지 (INSERT OR IGNORE - 빈 캔들, REST 로 받은 실제 봉 보존)
+
+        부분 봉(스트림 시작/재연결 직후 첫 봉, 종료 시 미완결 봉)은 호출 측에서 저장하지 않습니다.
+
+        Args:
+            replace_batches: {(symbol, timeframe): [업비트 API 형식 Dict, ...]}
+            insert_batches: {(symbol, timeframe): [업비트 API 형식 Dict, ...]}
+
+        Returns:
+            int: 반영된 행 수
+        """
+        insert_batches = insert_batches or {}
+        keys = set(replace_batches) | set(insert_batches)
+        if not keys:
+            return 0
+
+        values = "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)"
+        upsert_sql = """
+        ON CONFLICT(candle_date_time_utc) DO UPDATE SET
+            market = excluded.market,
+            candle_date_time_kst = excluded.candle_date_time_kst,
+            opening_price = excluded.opening_price,
+            high_price = excluded.high_price,
+            low_price = excluded.low_price,
+            trade_price = excluded.trade_price,
+            timestamp = excluded.timestamp,
+            candle_acc_trade_price = excluded.candle_acc_trade_price,
+            candle_acc_trade_volume = excluded.candle_acc_trade_volume,
+            empty_copy_from_utc = excluded.empty_copy_from_utc
+        """
+        saved_count = 0
+        touched = []
+        try:
+            with self.db_manager.get_connection("market_data") as conn:
+                for symbol, timeframe in keys:
+                    table_name = self._get_table_name(symbol, timeframe)
+                    if table_name not in self._ensured_tables:
+                        for ddl in self._table_ddl(table_name):
+                            conn.execute(ddl)
+                        self._ensured_tables.add(table_name)
+
+                    replace_records = [_to_db_record(row) for row in replace_batches.get((symbol, timeframe), ())]
+                    insert_records = [_to_db_record(row) for row in insert_batches.get((symbol, timeframe), ())]
+                    count = 0
+                    if replace_records:
+                        cursor = conn.executemany(
+                            f"INSERT INTO {table_name} ({_CANDLE_COLUMNS}) {values} {upsert_sql}",
+                            replace_records
+                        )
+                        count += cursor.rowcount
+                    if insert_records:
+                        cursor = conn.executemany(
+                            f"INSERT OR IGNORE INTO {table_name} ({_CANDLE_COLUMNS}) {values}",
+                            insert_records
+                        )
+                        count += cursor.rowcount
+                    saved_count += count
+                    touched.append((symbol, timeframe, replace_records + insert_records, count))
+                conn.commit()
+        except Exception as e:
+            self._ensured_tables.clear()
+            logger.error(f"캔들 배치 upsert 실패: {len(keys)}개 테이블, {e}")
+            raise
+
+        for symbol, timeframe, records, count in touched:
+            self._invalidate_indicator_cache(symbol, timeframe, records, count)
+        logger.debug(f"캔들 배치 upsert 완료: {len(keys)}개 테이블, {saved_count}개")
+        return saved_count
+
     async def save_candle_chunk(self, symbol: str, timeframe: str, candles) -> int:
         """캔들 데이터 청크 저장 (공통 필드만 저장)
 
@@ -924,7 +1048,9 @@ class SqliteCandleRepository(CandleRepositoryInterface):
                 conn.commit()
 
                 logger.debug(f"캔들 청크 저장 완료: {symbol} {timeframe}, {saved_count}개")
-                return saved_count
+
+            self._invalidate_indicator_cache(symbol, timeframe, db_records, saved_count)
+            return saved_count
 
         except Exception as e:
             logger.error(f"캔들 청크 저장 실패: {symbol} {timeframe}, {e}")
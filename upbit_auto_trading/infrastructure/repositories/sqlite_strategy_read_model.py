@@ -0,0 +1,585 @@
+"""
+SQLite 기반 전략 목록 / 대시보드 Read Model (프로젝션)
+
+strategies.sqlite3 의 원본 테이블(strategies, strategy_conditions, strategy_execution)을
+조회 전용 요약 테이블로 투영하여, 전략 목록과 대시보드 쿼리를 각각 인덱스를 타는
+SELECT 한 번으로 응답합니다.
+
+프로젝션 테이블:
+- strategy_list_projection: 전략당 1행 (트리거 수, 최근 백테스트 일시/수익률 비정규화)
+- backtest_projection: 완료된 백테스트 (최근 결과 목록, 전략별 최근 백테스트 계산용)
+- backtest_hourly_projection: 시간 버킷별 완료 건수 / 수익률·샤프 합계 (기간 평균 / 추세)
+- trigger_daily_projection: 일 버킷 × 변수 타입별 트리거 수 / 활성 수
+
+갱신 방식:
+- 모든 갱신은 "영향받은 키를 원본에서 다시 계산"하는 방식이라 멱등적입니다.
+  (같은 이벤트가 두 번 와도, 저장 시점 갱신과 이벤트 갱신이 겹쳐도 결과가 같음)
+- 저장 시점: SqliteStrategyRepository.save/delete 가 refresh_strategies 호출
+- 도메인 이벤트: subscribe() 로 전략/트리거/백테스트 이벤트 구독
+- 전체 재구축: rebuild() 또는
+  python -m upbit_auto_trading.infrastructure.repositories.sqlite_strategy_read_model --db data/strategies.sqlite3
+- 자동 재구축: 생성 시 프로젝션 스키마 버전이 다르거나(프로젝션 테이블 재생성) 프로젝션이 비어 있는데
+  원본 전략이 있으면 rebuild() 수행. 재구축 전/실패 시 is_ready 가 False 이며 핸들러는 기존 조회 경로 사용
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from upbit_auto_trading.infrastructure.database.database_manager import DatabaseManager
+from upbit_auto_trading.infrastructure.logging import create_component_logger
+
+logger = create_component_logger("SqliteStrategyReadModel")
+
+_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S'
+_HOUR_BUCKET_LENGTH = 13   # 'YYYY-MM-DDTHH'
+
+# 트리거 성공률 / 평균 실행 시간은 원본 스키마에 없음 (SqliteTriggerRepository 와 동일한 임시값)
+_TRIGGER_SUCCESS_RATE_PLACEHOLDER = 75.0
+_TRIGGER_EXECUTION_TIME_PLACEHOLDER_MS = 15.0
+
+_SORT_COLUMNS = {
+    'name': 'name',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+    'status': 'status',
+    'performance': 'last_backtest_performance',
+}
+
+# 프로젝션 테이블 정의/투영 SQL 이 바뀌면 올림 → 기존 DB 는 다음 생성 시 재생성 + 재구축
+PROJECTION_SCHEMA_VERSION = 1
+
+_PROJECTION_TABLES = (
+    'strategy_list_projection', 'backtest_projection', 'backtest_hourly_projection', 'trigger_daily_projection'
+)
+
+_SCHEMA_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS read_model_meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS strategy_list_projection (
+        strategy_id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        status TEXT NOT NULL,
+        tags TEXT NOT NULL DEFAULT '[]',
+        entry_triggers_count INTEGER NOT NULL DEFAULT 0,
+        exit_triggers_count INTEGER NOT NULL DEFAULT 0,
+        last_backtest_id TEXT,
+        last_backtest_date TEXT,
+        last_backtest_performance REAL,
+        created_at TEXT,
+        updated_at TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_slp_status_created ON strategy_list_projection(status, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_slp_status_updated ON strategy_list_projection(status, updated_at)",
+    "CREATE INDEX IF NOT EXISTS idx_slp_status_name ON strategy_list_projection(status, name)",
+    "CREATE INDEX IF NOT EXISTS idx_slp_status_performance "
+    "ON strategy_list_projection(status, last_backtest_performance)",
+    # 상태 필터 없는 목록(기본 화면)의 정렬용
+    "CREATE INDEX IF NOT EXISTS idx_slp_created ON strategy_list_projection(created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_slp_updated ON strategy_list_projection(updated_at)",
+    "CREATE INDEX IF NOT EXISTS idx_slp_name ON strategy_list_projection(name)",
+    "CREATE INDEX IF NOT EXISTS idx_slp_performance ON strategy_list_projection(last_backtest_performance)",
+    """
+    CREATE TABLE IF NOT EXISTS backtest_projection (
+        backtest_id TEXT PRIMARY KEY,
+        strategy_id TEXT NOT NULL,
+        completed_at TEXT NOT NULL,
+        total_return REAL,
+        max_drawdown REAL,
+        sharpe_ratio REAL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_bp_completed ON backtest_projection(completed_at)",
+    "CREATE INDEX IF NOT EXISTS idx_bp_strategy_completed ON backtest_projection(strategy_id, completed_at)",
+    """
+    CREATE TABLE IF NOT EXISTS backtest_hourly_projection (
+        bucket TEXT PRIMARY KEY,
+        completed_count INTEGER NOT NULL,
+        return_sum REAL NOT NULL,
+        return_count INTEGER NOT NULL,
+        sharpe_sum REAL NOT NULL,
+        sharpe_count INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS trigger_daily_projection (
+        bucket TEXT NOT NULL,
+        variable_type TEXT NOT NULL,
+        total_count INTEGER NOT NULL,
+        active_count INTEGER NOT NULL,
+        PRIMARY KEY (bucket, variable_type)
+    )
+    """,
+)
+
+# 원본 → 프로젝션 (키 필터는 {where} 자리에 삽입)
+_STRATEGY_SOURCE_SQL = f"""
+INSERT INTO strategy_list_projection (
+    strategy_id, name, status, tags, entry_triggers_count, exit_triggers_count, created_at, updated_at
+)
+SELECT
+    CAST(s.id AS TEXT),
+    s.strategy_name,
+    CASE WHEN s.is_active = 1 THEN 'ACTIVE' ELSE 'INACTIVE' END,
+    CASE WHEN json_valid(s.tags) THEN s.tags ELSE '[]' END,
+    (SELECT COUNT(*) FROM strategy_conditions c
+     WHERE c.strategy_id = s.id AND c.is_enabled = 1 AND c.condition_type LIKE 'entry%'),
+    (SELECT COUNT(*) FROM strategy_conditions c
+     WHERE c.strategy_id = s.id AND c.is_enabled = 1 AND c.condition_type LIKE 'exit%'),
+    strftime('{_TIMESTAMP_FORMAT}', s.created_at),
+    strftime('{_TIMESTAMP_FORMAT}', s.updated_at)
+FROM strategies s
+{{where}}
+"""
+
+_LAST_BACKTEST_SQL = """
+UPDATE strategy_list_projection
+SET (last_backtest_id, last_backtest_date, last_backtest_performance) = (
+    SELECT b.backtest_id, b.completed_at, b.total_return
+    FROM backtest_projection b
+    WHERE b.strategy_id = strategy_list_projection.strategy_id
+    ORDER BY b.completed_at DESC, b.backtest_id DESC
+    LIMIT 1
+)
+{where}
+"""
+
+# strategy_execution.total_profit_loss 가 BacktestResult.total_return 에 매핑됨 (BacktestRepository 주석 기준)
+_BACKTEST_SOURCE_SQL = f"""
+INSERT INTO backtest_projection (
+    backtest_id, strategy_id, completed_at, total_return, max_drawdown, sharpe_ratio
+)
+SELECT
+    CAST(e.id AS TEXT),
+    CAST(e.strategy_id AS TEXT),
+    strftime('{_TIMESTAMP_FORMAT}', e.end_time),
+    e.total_profit_loss,
+    e.max_drawdown,
+    e.sharpe_ratio
+FROM strategy_execution e
+WHERE e.execution_type = 'backtest' AND e.status = 'completed' AND e.end_time IS NOT NULL
+{{where}}
+"""
+
+_HOURLY_SOURCE_SQL = f"""
+INSERT INTO backtest_hourly_projection (
+    bucket, completed_count, return_sum, return_count, sharpe_sum, sharpe_count
+)
+SELECT
+    substr(completed_at, 1, {_HOUR_BUCKET_LENGTH}),
+    COUNT(*),
+    TOTAL(total_return),
+    COUNT(total_return),
+    TOTAL(sharpe_ratio),
+    COUNT(sharpe_ratio)
+FROM backtest_projection
+{{where}}
+GROUP BY 1
+"""
+
+_TRIGGER_SOURCE_SQL = """
+INSERT INTO trigger_daily_projection (bucket, variable_type, total_count, active_count)
+SELECT
+    COALESCE(date(created_at), ''),
+    left_variable,
+    COUNT(*),
+    SUM(CASE WHEN is_enabled = 1 THEN 1 ELSE 0 END)
+FROM strategy_conditions
+GROUP BY 1, 2
+"""
+
+_DASHBOARD_SQL = """
+WITH
+strategy_counts AS (
+    SELECT COUNT(*) AS total_strategies,
+           COALESCE(SUM(status = 'ACTIVE'), 0) AS active_strategies
+    FROM strategy_list_projection
+    WHERE status != 'DELETED'
+),
+periods AS (
+    SELECT
+        COALESCE(SUM(CASE WHEN bucket >= :current_start THEN completed_count END), 0) AS period_backtests,
+        SUM(CASE WHEN bucket >= :current_start THEN return_sum END) AS current_return_sum,
+        SUM(CASE WHEN bucket >= :current_start THEN return_count END) AS current_return_count,
+        SUM(CASE WHEN bucket >= :current_start THEN sharpe_sum END) AS current_sharpe_sum,
+        SUM(CASE WHEN bucket >= :current_start THEN sharpe_count END) AS current_sharpe_count,
+        SUM(CASE WHEN bucket < :current_start THEN return_sum END) AS previous_return_sum,
+        SUM(CASE WHEN bucket < :current_start THEN return_count END) AS previous_return_count,
+        SUM(CASE WHEN bucket < :current_start THEN sharpe_sum END) AS previous_sharpe_sum,
+        SUM(CASE WHEN bucket < :current_start THEN sharpe_count END) AS previous_sharpe_count
+    FROM backtest_hourly_projection
+    WHERE bucket >= :previous_start AND bucket <= :current_end
+),
+trigger_total AS (
+    SELECT COALESCE(SUM(active_count), 0) AS total_triggers FROM trigger_daily_projection
+),
+trigger_stats AS (
+    SELECT json_group_array(json_object(
+        'variable_type', variable_type, 'total_count', total_count, 'active_count', active_count
+    )) AS trigger_statistics
+    FROM (
+        SELECT variable_type, SUM(total_count) AS total_count, SUM(active_count) AS active_count
+        FROM trigger_daily_projection
+        WHERE bucket BETWEEN :trigger_start AND :trigger_end
+        GROUP BY variable_type
+        ORDER BY total_count DESC, variable_type
+    )
+),
+recent AS (
+    SELECT json_group_array(json_object(
+        'backtest_id', backtest_id, 'strategy_name', strategy_name, 'completed_at', completed_at,
+        'total_return', total_return, 'max_drawdown', max_drawdown, 'sharpe_ratio', sharpe_ratio
+    )) AS recent_backtests
+    FROM (
+        SELECT b.backtest_id, COALESCE(s.name, 'Unknown') AS strategy_name, b.completed_at,
+               b.total_return, b.max_drawdown, b.sharpe_ratio
+        FROM backtest_projection b
+        LEFT JOIN strategy_list_projection s ON s.strategy_id = b.strategy_id
+        ORDER BY b.completed_at DESC, b.backtest_id DESC
+        LIMIT :recent_limit
+    )
+)
+SELECT * FROM strategy_counts, periods, trigger_total, trigger_stats, recent
+"""
+
+
+def _placeholders(values: List[Any]) -> str:
+    return ', '.join('?' for _ in values)
+
+
+def _format_timestamp(value: datetime) -> str:
+    return value.strftime(_TIMESTAMP_FORMAT)
+
+
+def _hour_bucket(value: datetime) -> str:
+    return _format_timestamp(value)[:_HOUR_BUCKET_LENGTH]
+
+
+def _average(total: Optional[float], count: Optional[int]) -> float:
+    return total / count if count else 0.0
+
+
+class SqliteStrategyReadModel:
+    """
+    전략 목록 / 대시보드 조회용 Read Model
+
+    조회(query_*)는 SELECT 한 번, 갱신(refresh_* / rebuild)은 트랜잭션 하나로 처리합니다.
+    """
+
+    def __init__(self, db_manager: DatabaseManager, db_name: str = 'strategies', auto_rebuild: bool = True):
+        self.db_manager = db_manager
+        self.db_name = db_name
+        self._subscriptions: List[Tuple[str, Any]] = []
+        self._ready = False
+        self.ensure_schema()
+        if auto_rebuild:
+            self.ensure_ready()
+
+    @property
+    def is_ready(self) -> bool:
+        """현재 스키마 버전으로 재구축된 프로젝션인지 (False 면 핸들러는 기존 조회 경로 사용)"""
+        return self._ready
+
+    def ensure_schema(self) -> None:
+        """프로젝션 테이블 / 인덱스 생성 (원본 테이블은 건드리지 않음, 버전이 다르면 프로젝션만 재생성)"""
+        with self.db_manager.get_connection(self.db_name) as conn:
+            conn.execute(_SCHEMA_STATEMENTS[0])
+            if self._stored_schema_version(conn) not in (None, PROJECTION_SCHEMA_VERSION):
+                for table in _PROJECTION_TABLES:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.execute("DELETE FROM read_model_meta WHERE key = 'schema_version'")
+            for statement in _SCHEMA_STATEMENTS[1:]:
+                conn.execute(statement)
+            self._ready = self._stored_schema_version(conn) == PROJECTION_SCHEMA_VERSION
+
+    def ensure_ready(self) -> bool:
+        """
+        필요하면 자동 재구축 (스키마 버전 없음/불일치, 또는 프로젝션이 비었는데 원본 전략이 있음)
+
+        Returns:
+            프로젝션 사용 가능 여부
+        """
+        try:
+            with self.db_manager.get_connection(self.db_name) as conn:
+                empty = conn.execute("SELECT 1 FROM strategy_list_projection LIMIT 1").fetchone() is None
+                has_source = conn.execute("SELECT 1 FROM strategies LIMIT 1").fetchone() is not None
+            if not self._ready or (empty and has_source):
+                logger.info("전략 Read Model 자동 재구축 (스키마 버전 불일치 또는 빈 프로젝션)")
+                self.rebuild()
+        except Exception as e:
+            self._ready = False
+            logger.warning(f"⚠️ 전략 Read Model 재구축 불가 - 기존 조회 경로 사용: {e}")
+        return self._ready
+
+    @staticmethod
+    def _stored_schema_version(conn) -> Optional[int]:
+        row = conn.execute("SELECT value FROM read_model_meta WHERE key = 'schema_version'").fetchone()
+        return int(row[0]) if row else None
+
+    # ================================================================
+    # 갱신
+    # ================================================================
+
+    def rebuild(self) -> Dict[str, Any]:
+        """
+        기존 데이터로 모든 프로젝션 재구축
+
+        Returns:
+            프로젝션별 행 수와 소요 시간(ms)
+        """
+        started = time.perf_counter()
+        with self.db_manager.get_connection(self.db_name) as conn:
+            for table in _PROJECTION_TABLES:
+                conn.execute(f"DELETE FROM {table}")
+            conn.execute(_BACKTEST_SOURCE_SQL.format(where=''))
+            conn.execute(_HOURLY_SOURCE_SQL.format(where=''))
+            conn.execute(_STRATEGY_SOURCE_SQL.format(where=''))
+            conn.execute(_LAST_BACKTEST_SQL.format(where=''))
+            conn.execute(_TRIGGER_SOURCE_SQL)
+            conn.execute(
+                "INSERT OR REPLACE INTO read_model_meta (key, value) VALUES ('schema_version', ?)",
+                (str(PROJECTION_SCHEMA_VERSION),)
+            )
+            counts = {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in _PROJECTION_TABLES
+            }
+        self._ready = True
+        counts['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 2)
+        logger.info(f"✅ 전략 Read Model 재구축 완료: {counts}")
+        return counts
+
+    def refresh_strategies(self, strategy_ids: Iterable[Any]) -> None:
+        """전략 행 재계산 (원본에서 사라진 전략은 프로젝션에서도 제거)"""
+        ids = [str(strategy_id) for strategy_id in strategy_ids]
+        if not ids:
+            return
+        with self.db_manager.get_connection(self.db_name) as conn:
+            self._refresh_strategy_rows(conn, ids)
+
+    def refresh_backtests(self, backtest_ids: Iterable[Any]) -> None:
+        """백테스트 행 + 해당 시간 버킷 + 소속 전략의 최근 백테스트 재계산"""
+        ids = [str(backtest_id) for backtest_id in backtest_ids]
+        if not ids:
+            return
+        marks = _placeholders(ids)
+        with self.db_manager.get_connection(self.db_name) as conn:
+            previous = conn.execute(
+                f"SELECT strategy_id, completed_at FROM backtest_projection WHERE backtest_id IN ({marks})", ids
+            ).fetchall()
+            conn.execute(f"DELETE FROM backtest_projection WHERE backtest_id IN ({marks})", ids)
+            conn.execute(_BACKTEST_SOURCE_SQL.format(where=f"AND e.id IN ({marks})"), ids)
+            current = conn.execute(
+                f"SELECT strategy_id, completed_at FROM backtest_projection WHERE backtest_id IN ({marks})", ids
+            ).fetchall()
+
+            affected = previous + current
+            buckets = sorted({row[1][:_HOUR_BUCKET_LENGTH] for row in affected})
+            for bucket in buckets:
+                conn.execute("DELETE FROM backtest_hourly_projection WHERE bucket = ?", (bucket,))
+                # ':' 다음 문자(';')를 상한으로 써서 completed_at 인덱스 범위 검색
+                conn.execute(
+                    _HOURLY_SOURCE_SQL.format(where="WHERE completed_at >= ? AND completed_at < ?"),
+                    (bucket, bucket + ';')
+                )
+
+            strategy_ids = sorted({row[0] for row in affected})
+            if strategy_ids:
+                conn.execute(
+                    _LAST_BACKTEST_SQL.format(where=f"WHERE strategy_id IN ({_placeholders(strategy_ids)})"),
+                    strategy_ids
+                )
+
+    def refresh_trigger_statistics(self) -> None:
+        """트리거 통계 프로젝션 재계산 (변수 타입 × 일 단위 GROUP BY 한 번)"""
+        with self.db_manager.get_connection(self.db_name) as conn:
+            conn.execute("DELETE FROM trigger_daily_projection")
+            conn.execute(_TRIGGER_SOURCE_SQL)
+
+    def _refresh_strategy_rows(self, conn, ids: List[str]) -> None:
+        marks = _placeholders(ids)
+        conn.execute(f"DELETE FROM strategy_list_projection WHERE strategy_id IN ({marks})", ids)
+        conn.execute(_STRATEGY_SOURCE_SQL.format(where=f"WHERE s.id IN ({marks})"), ids)
+        conn.execute(_LAST_BACKTEST_SQL.format(where=f"WHERE strategy_id IN ({marks})"), ids)
+
+    # ================================================================
+    # 도메인 이벤트 구독
+    # ================================================================
+
+    def subscribe(self, publisher) -> None:
+        """
+        DomainEventPublisher 구독 - 이벤트의 집계 ID 로 해당 키만 재계산
+
+        Args:
+            publisher: DomainEventPublisher (subscribe(event_type, handler) 제공)
+        """
+        handlers = {
+            'strategy.created': self._on_strategy_event,
+            'strategy.updated': self._on_strategy_event,
+            'strategy.deleted': self._on_strategy_event,
+            'strategy.activated': self._on_strategy_event,
+            'strategy.deactivated': self._on_strategy_event,
+            'trigger.created': self._on_trigger_event,
+            'trigger.updated': self._on_trigger_event,
+            'trigger.deleted': self._on_trigger_event,
+            'backtest.completed': self._on_backtest_event,
+            'strategy.backtest.completed': self._on_backtest_event,
+        }
+        for event_type, handler in handlers.items():
+            publisher.subscribe(event_type, handler)
+            self._subscriptions.append((event_type, handler))
+        logger.debug(f"Read Model 이벤트 구독: {len(handlers)}종")
+
+    def unsubscribe(self, publisher) -> None:
+        for event_type, handler in self._subscriptions:
+            publisher.unsubscribe(event_type, handler)
+        self._subscriptions.clear()
+
+    def _on_strategy_event(self, event) -> None:
+        try:
+            self.refresh_strategies([event.strategy_id])
+        except Exception as e:
+            # DomainEventPublisher 는 구독자 예외를 조용히 무시하므로 여기서 기록
+            logger.error(f"❌ 전략 프로젝션 갱신 실패 ({event.event_type}): {e}")
+
+    def _on_trigger_event(self, event) -> None:
+        try:
+            strategy_id = getattr(event, 'strategy_id', None)
+            if strategy_id:
+                self.refresh_strategies([strategy_id])
+            self.refresh_trigger_statistics()
+        except Exception as e:
+            logger.error(f"❌ 트리거 프로젝션 갱신 실패 ({event.event_type}): {e}")
+
+    def _on_backtest_event(self, event) -> None:
+        try:
+            self.refresh_backtests([event.backtest_id])
+        except Exception as e:
+            logger.error(f"❌ 백테스트 프로젝션 갱신 실패 ({event.event_type}): {e}")
+
+    # ================================================================
+    # 조회
+    # ================================================================
+
+    def query_strategy_list(self, status: Optional[str] = None, tags: Optional[List[str]] = None,
+                            name_pattern: Optional[str] = None, created_after: Optional[datetime] = None,
+                            created_before: Optional[datetime] = None, include_deleted: bool = False,
+                            sort_field: str = 'created_at', sort_direction: str = 'desc',
+                            limit: int = 20, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        전략 목록 한 페이지 + 필터 조건의 전체 개수 (SELECT 한 번)
+
+        Returns:
+            (행 dict 목록, total_count)
+        """
+        conditions: List[str] = []
+        params: List[Any] = []
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        elif not include_deleted:
+            conditions.append("status != 'DELETED'")
+        if tags:
+            conditions.append(
+                f"EXISTS (SELECT 1 FROM json_each(tags) WHERE json_each.value IN ({_placeholders(tags)}))"
+            )
+            params.extend(tags)
+        if name_pattern:
+            conditions.append("name LIKE ?")
+            params.append(f"%{name_pattern}%")
+        if created_after:
+            conditions.append("created_at >= ?")
+            params.append(_format_timestamp(created_after))
+        if created_before:
+            conditions.append("created_at <= ?")
+            params.append(_format_timestamp(created_before))
+
+        column = _SORT_COLUMNS.get(sort_field, 'created_at')
+        direction = 'ASC' if str(sort_direction).lower() == 'asc' else 'DESC'
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        # 전체 개수는 상관 없는 스칼라 서브쿼리 - 한 번만 평가되고 페이지가 비어도 값이 남음
+        query = f"""
+        SELECT page.*, counted.total_count
+        FROM (SELECT COUNT(*) AS total_count FROM strategy_list_projection {where}) AS counted
+        LEFT JOIN (
+            SELECT * FROM strategy_list_projection
+            {where}
+            ORDER BY {column} {direction}, strategy_id {direction}
+            LIMIT ? OFFSET ?
+        ) AS page ON 1
+        """
+        with self.db_manager.get_connection(self.db_name) as conn:
+            rows = [dict(row) for row in conn.execute(query, params + params + [limit, offset])]
+
+        total_count = rows[0]['total_count'] if rows else 0
+        items = []
+        for row in rows:
+            if row['strategy_id'] is None:
+                continue   # 빈 페이지 (개수 행만 존재)
+            row.pop('total_count')
+            row['tags'] = json.loads(row['tags']) if row['tags'] else []
+            items.append(row)
+        return items, total_count
+
+    def query_dashboard(self, start_date: datetime, end_date: datetime,
+                        previous_start: datetime, recent_limit: int = 5) -> Dict[str, Any]:
+        """
+        대시보드 요약 / 기간 평균 / 트리거 통계 / 최근 백테스트 (SELECT 한 번)
+
+        기간 경계는 백테스트 시간 버킷, 트리거 일 버킷 단위로 근사합니다.
+        """
+        params = {
+            'current_start': _hour_bucket(start_date),
+            'current_end': _hour_bucket(end_date),
+            'previous_start': _hour_bucket(previous_start),
+            'trigger_start': start_date.date().isoformat(),
+            'trigger_end': end_date.date().isoformat(),
+            'recent_limit': recent_limit,
+        }
+        with self.db_manager.get_connection(self.db_name) as conn:
+            row = dict(conn.execute(_DASHBOARD_SQL, params).fetchone())
+
+        trigger_statistics = json.loads(row['trigger_statistics'])
+        for stat in trigger_statistics:
+            stat['success_rate'] = _TRIGGER_SUCCESS_RATE_PLACEHOLDER
+            stat['avg_execution_time_ms'] = _TRIGGER_EXECUTION_TIME_PLACEHOLDER_MS
+
+        return {
+            'total_strategies': row['total_strategies'],
+            'active_strategies': row['active_strategies'],
+            'total_triggers': row['total_triggers'],
+            'period_backtests': row['period_backtests'],
+            'current_avg_return': _average(row['current_return_sum'], row['current_return_count']),
+            'previous_avg_return': _average(row['previous_return_sum'], row['previous_return_count']),
+            'current_avg_sharpe': _average(row['current_sharpe_sum'], row['current_sharpe_count']),
+            'previous_avg_sharpe': _average(row['previous_sharpe_sum'], row['previous_sharpe_count']),
+            'trigger_statistics': trigger_statistics,
+            'recent_backtests': json.loads(row['recent_backtests']),
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """기존 strategies DB 의 Read Model 재구축 명령"""
+    parser = argparse.ArgumentParser(description="전략 목록 / 대시보드 Read Model 재구축")
+    parser.add_argument('--db', default='data/strategies.sqlite3', help="strategies DB 경로")
+    args = parser.parse_args(argv)
+
+    db_manager = DatabaseManager({'strategies': args.db})
+    try:
+        counts = SqliteStrategyReadModel(db_manager).rebuild()
+    finally:
+        db_manager.close_all()
+    for name, value in counts.items():
+        print(f"{name}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -30,9 +30,15 @@ class SqliteStrategyRepository(StrategyRepository):
     strategies.sqlite3 데이터베이스와 연동합니다.
     """
 
-    def __init__(self, db_manager: DatabaseManager):
-        """Repository 초기화"""
+    def __init__(self, db_manager: DatabaseManager, read_model=None):
+        """Repository 초기화
+
+        Args:
+            db_manager: strategies DB 연결 관리자
+            read_model: 저장 시점에 갱신할 SqliteStrategyReadModel (선택)
+        """
         self._db_manager = db_manager
+        self._read_model = read_model
         self._mapper = StrategyMapper()
         self._logger = logging.getLogger(__name__)
         self._logger.info("🏗️ SqliteStrategyRepository 초기화 완료")
@@ -44,7 +50,8 @@ class SqliteStrategyRepository(StrategyRepository):
         try:
             # Domain Entity를 Mock으로 변환 (임시)
             mock_strategy = self._convert_to_mock(entity)
-            self._save_mock_strategy(mock_strategy)
+            strategy_id = self._save_mock_strategy(mock_strategy)
+            self._refresh_read_model(strategy_id)
             self._logger.info(f"✅ Domain 전략 저장 완료: {entity}")
         except Exception as e:
             self._logger.error(f"❌ Domain 전략 저장 실패: {e}")
@@ -72,7 +79,10 @@ class SqliteStrategyRepository(StrategyRepository):
 
     def delete(self, entity_id: StrategyId) -> bool:
         """전략 삭제 (Domain Interface 구현)"""
-        return self._delete_mock_strategy(str(entity_id))
+        deleted = self._delete_mock_strategy(str(entity_id))
+        if deleted:
+            self._refresh_read_model(str(entity_id))
+        return deleted
 
     def exists(self, entity_id: StrategyId) -> bool:
         """전략 존재 확인 (Domain Interface 구현)"""
@@ -292,6 +302,15 @@ class SqliteStrategyRepository(StrategyRepository):
 
     # === 내부 Mock 처리 메서드들 ===
 
+    def _refresh_read_model(self, strategy_id: str) -> None:
+        """저장 시점 Read Model 갱신 (실패해도 저장은 유지 - rebuild 로 복구 가능)"""
+        if self._read_model is None:
+            return
+        try:
+            self._read_model.refresh_strategies([strategy_id])
+        except Exception as e:
+            self._logger.warning(f"⚠️ 전략 Read Model 갱신 실패 [{strategy_id}]: {e}")
+
     def _convert_to_mock(self, entity: Strategy) -> MockStrategy:
         """Domain Entity를 Mock으로 변환"""
         return MockStrategy(
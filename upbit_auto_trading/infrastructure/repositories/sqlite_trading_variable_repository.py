@@ -14,6 +14,8 @@ from upbit_auto_trading.domain.trigger_builder.entities.trading_variable import
 from upbit_auto_trading.domain.trigger_builder.repositories.i_trading_variable_repository import ITradingVariableRepository
 from upbit_auto_trading.domain.trigger_builder.enums import VariableCategory, ChartCategory, ComparisonGroup
 from upbit_auto_trading.domain.trigger_builder.value_objects.variable_parameter import VariableParameter
+from upbit_auto_trading.domain.trigger_builder.services.variable_compatibility_index import VariableCompatibilityIndex
+from upbit_auto_trading.domain.value_objects.compatibility_rules import CompatibilityLevel, ComparisonGroupRules
 from upbit_auto_trading.infrastructure.database.database_manager import DatabaseManager
 
 
@@ -25,6 +27,21 @@ class SqliteTradingVariableRepository(ITradingVariableRepository):
         self._logger = logging.getLogger(__name__)
         self._cache: Dict[str, TradingVariable] = {}
         self._cache_loaded = False
+        # 호환 변수 조회용 비트셋 인덱스 (이 Repository 의 그룹 호환 규칙) + 외부 연결 인덱스
+        self._compatibility_index = VariableCompatibilityIndex(self._build_group_rules())
+        self._attached_indexes: List[VariableCompatibilityIndex] = []
+
+    def attach_compatibility_index(self, index: VariableCompatibilityIndex) -> None:
+        """변수 생성/수정/삭제를 함께 반영할 외부 호환성 인덱스 연결 (예: StrategyCompatibilityService)"""
+        self._attached_indexes.append(index)
+
+    def _index_upsert(self, variable: TradingVariable) -> None:
+        for index in [self._compatibility_index, *self._attached_indexes]:
+            index.upsert(variable.variable_id, variable.comparison_group, variable.is_active)
+
+    def _index_remove(self, variable_id: str) -> None:
+        for index in [self._compatibility_index, *self._attached_indexes]:
+            index.remove(variable_id)
 
     async def get_by_id(self, variable_id: str) -> Optional[TradingVariable]:
         """변수 ID로 조회"""
@@ -111,8 +128,9 @@ class SqliteTradingVariableRepository(ITradingVariableRepository):
                 for param in variable.parameters:
                     await self._save_parameter(cursor, variable.variable_id, param)
 
-            # 캐시 업데이트
+            # 캐시/호환성 인덱스 업데이트
             self._cache[variable.variable_id] = variable
+            self._index_upsert(variable)
 
             self._logger.info(f"변수 생성 성공: {variable.variable_id}")
             return variable
@@ -149,8 +167,9 @@ class SqliteTradingVariableRepository(ITradingVariableRepository):
                 for param in variable.parameters:
                     await self._save_parameter(cursor, variable.variable_id, param)
 
-            # 캐시 업데이트
+            # 캐시/호환성 인덱스 업데이트
             self._cache[variable.variable_id] = variable
+            self._index_upsert(variable)
 
             self._logger.info(f"변수 수정 성공: {variable.variable_id}")
             return variable
@@ -173,9 +192,10 @@ class SqliteTradingVariableRepository(ITradingVariableRepository):
                 cursor.execute("DELETE FROM tv_trading_variables WHERE variable_id = ?",
                                (variable_id,))
 
-            # 캐시에서 제거
+            # 캐시/호환성 인덱스에서 제거
             if variable_id in self._cache:
                 del self._cache[variable_id]
+            self._index_remove(variable_id)
 
             self._logger.info(f"변수 삭제 성공: {variable_id}")
             return True
@@ -191,13 +211,9 @@ class SqliteTradingVariableRepository(ITradingVariableRepository):
             if not target_var:
                 return []
 
-            compatible_groups = self._get_compatible_groups(target_var.comparison_group)
-
-            await self._ensure_cache_loaded()
-            return [var for var in self._cache.values()
-                    if var.is_active
-                    and var.variable_id != variable_id
-                    and var.comparison_group in compatible_groups]
+            # 비트셋 인덱스: 활성 + 호환 그룹 + 자기 자신 제외가 비트 연산 한 번
+            return [self._cache[compatible_id]
+                    for compatible_id in self._compatibility_index.get_compatible_ids(variable_id)]
 
         except Exception as e:
             self._logger.error(f"호환 변수 조회 실패 ({variable_id}): {e}")
@@ -320,6 +336,7 @@ class SqliteTradingVariableRepository(ITradingVariableRepository):
                     # 파라미터 로드
                     await self._load_parameters_for_variable(cursor, variable)
                     self._cache[variable.variable_id] = variable
+                    self._index_upsert(variable)
 
             self._cache_loaded = True
             self._logger.info(f"DB에서 {len(self._cache)}개 변수 캐시 로드 완료")
@@ -431,6 +448,18 @@ class SqliteTradingVariableRepository(ITradingVariableRepository):
             parameter.min_value, parameter.max_value, parameter.description
         ))
 
+    def _build_group_rules(self) -> ComparisonGroupRules:
+        """_get_compatible_groups 매트릭스를 인덱스용 규칙으로 변환 (같은 그룹 외 호환 쌍만 명시)"""
+        cross_group_rules = {}
+        for group in ComparisonGroup:
+            for other in self._get_compatible_groups(group):
+                if other != group:
+                    cross_group_rules.setdefault(group.value, {})[other.value] = CompatibilityLevel.COMPATIBLE
+        return ComparisonGroupRules(
+            same_group_compatible={group.value for group in ComparisonGroup},
+            cross_group_rules=cross_group_rules
+        )
+
     def _get_compatible_groups(self, group: ComparisonGroup) -> set:
         """호환 가능한 비교 그룹들 반환"""
         compatibility_matrix = {
@@ -0,0 +1,477 @@
+"""
+캔들 테이블 기반 시뮬레이션 시나리오 인덱스
+실제 캔들 테이블(candles_{symbol}_{timeframe})을 고정 길이 구간으로 나누어
+시장 국면(상승/하락/횡보/변동성 확대/급등/급락) 라벨을 미리 계산하고 증분 유지
+
+- 구간 라벨은 market_data DB의 simulation_scenario_index 테이블에 저장
+- 테이블별 진행 상태(simulation_scenario_index_state)로 새로 추가된 캔들만 라벨링
+- 시뮬레이션 요청 시 인덱스 조회 + PRIMARY KEY 범위 스캔만 수행
+- 색인 갱신(첫 실행 시 전체 테이블 스캔)은 start_background_refresh()로 백그라운드 스레드에서 수행
+"""
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from upbit_auto_trading.domain.strategy_simulation.value_objects.simulation_scenario import SimulationScenario
+from upbit_auto_trading.infrastructure.logging import create_component_logger
+
+logger = create_component_logger("CandleScenarioIndex")
+
+INDEX_TABLE = "simulation_scenario_index"
+STATE_TABLE = "simulation_scenario_index_state"
+
+
+@dataclass(frozen=True)
+class ScenarioIndexConfig:
+    """시나리오 라벨링 설정"""
+    window_size: int = 100          # 라벨링 구간 길이 (캔들 수)
+    stride: int = 20                # 구간 간격 (캔들 수)
+    jump_span: int = 5              # 급등/급락 판정 구간 길이
+    jump_sigma: float = 4.0         # 급등/급락 판정 임계값 (robust sigma 배수)
+    trend_threshold: float = 2.0    # 추세 판정 임계값 (표준화 누적 수익률)
+    volatility_ratio: float = 1.5   # 변동성 확대 판정 임계값 (선행 구간 대비)
+    reference_windows: int = 10     # 기준 변동성 산출 선행 구간 수 (window_size 배수)
+
+    @property
+    def fingerprint(self) -> str:
+        """설정 식별자 (설정 변경 시 재구축 판정용)"""
+        return (f"{self.window_size}/{self.stride}/{self.jump_span}/{self.jump_sigma}/"
+                f"{self.trend_threshold}/{self.volatility_ratio}/{self.reference_windows}")
+
+
+@dataclass(frozen=True)
+class ScenarioSegment:
+    """라벨링된 캔들 구간"""
+    symbol: str
+    timeframe: str
+    table_name: str
+    start_utc: str
+    end_utc: str
+    scenario: SimulationScenario
+    score: float
+    total_return: float
+
+
+def label_windows(
+    closes: np.ndarray,
+    window_ends: np.ndarray,
+    config: ScenarioIndexConfig
+) -> Tuple[List[SimulationScenario], np.ndarray, np.ndarray]:
+    """
+    구간별 시장 국면 라벨 계산 (벡터화)
+
+    Args:
+        closes: 종가 배열 (빈 캔들은 직전 종가로 채운 상태)
+        window_ends: 구간 종료 인덱스 배열 (각 구간은 window_size개 캔들)
+        config: 라벨링 설정
+
+    Returns:
+        (라벨 목록, 점수 배열, 구간 수익률 배열)
+    """
+    window = config.window_size
+    span = config.jump_span
+    eps = 1e-12
+
+    log_closes = np.log(closes)
+    returns = np.diff(log_closes)
+    starts = window_ends - (window - 1)
+
+    # 구간 수익률 행렬 (구간 수 x window-1)
+    return_windows = np.lib.stride_tricks.sliding_window_view(returns, window - 1)[starts]
+    total_log_returns = log_closes[window_ends] - log_closes[starts]
+    sigma = return_windows.std(axis=1)
+
+    # 급변 구간에 영향받지 않는 robust sigma (MAD 기반)
+    medians = np.median(return_windows, axis=1, keepdims=True)
+    robust_sigma = 1.4826 * np.median(np.abs(return_windows - medians), axis=1)
+    robust_sigma = np.where(robust_sigma > eps, robust_sigma, sigma)
+
+    # 구간 내 span 캔들 수익률의 최소/최대 (급락/급등)
+    span_returns = log_closes[span:] - log_closes[:-span]
+    span_windows = np.lib.stride_tricks.sliding_window_view(span_returns, window - span)[starts]
+    worst_jump = span_windows.min(axis=1)
+    best_jump = span_windows.max(axis=1)
+    jump_threshold = config.jump_sigma * robust_sigma * np.sqrt(span) + eps
+
+    # 선행 구간 기준 변동성 (누적합 기반)
+    prefix = np.concatenate(([0.0], np.cumsum(returns)))
+    prefix_sq = np.concatenate(([0.0], np.cumsum(returns * returns)))
+    reference_start = np.maximum(0, starts - config.reference_windows * (window - 1))
+    reference_count = starts - reference_start
+    safe_count = np.maximum(reference_count, 1)
+    reference_mean = (prefix[starts] - prefix[reference_start]) / safe_count
+    reference_var = (prefix_sq[starts] - prefix_sq[reference_start]) / safe_count - reference_mean ** 2
+    reference_sigma = np.sqrt(np.maximum(reference_var, 0.0))
+    volatility_ratio = np.where(
+        (reference_count >= window - 1) & (reference_sigma > eps),
+        sigma / np.maximum(reference_sigma, eps),
+        1.0
+    )
+
+    trend_score = total_log_returns / (sigma * np.sqrt(window - 1) + eps)
+
+    crash = (worst_jump < -jump_threshold) & (-worst_jump >= best_jump)
+    surge = ~crash & (best_jump > jump_threshold)
+    high_volatility = ~crash & ~surge & (volatility_ratio > config.volatility_ratio)
+    undecided = ~crash & ~surge & ~high_volatility
+    uptrend = undecided & (trend_score > config.trend_threshold)
+    downtrend = undecided & (trend_score < -config.trend_threshold)
+
+    codes = np.select(
+        [crash, surge, high_volatility, uptrend, downtrend],
+        [0, 1, 2, 3, 4],
+        default=5
+    )
+    scores = np.select(
+        [crash, surge, high_volatility, uptrend | downtrend],
+        [-worst_jump / jump_threshold, best_jump / jump_threshold, volatility_ratio, np.abs(trend_score)],
+        default=1.0 / (1.0 + np.abs(trend_score))
+    )
+
+    scenario_by_code = (
+        SimulationScenario.CRASH,
+        SimulationScenario.SURGE,
+        SimulationScenario.HIGH_VOLATILITY,
+        SimulationScenario.UPTREND,
+        SimulationScenario.DOWNTREND,
+        SimulationScenario.SIDEWAYS,
+    )
+    labels = [scenario_by_code[code] for code in codes.tolist()]
+    return labels, scores, np.expm1(total_log_returns)
+
+
+def _fill_empty_closes(closes: np.ndarray) -> np.ndarray:
+    """빈 캔들(NULL 종가)을 직전 종가로 채움 (선두 빈 캔들은 NaN 유지)"""
+    valid = ~np.isnan(closes)
+    positions = np.where(valid, np.arange(len(closes)), 0)
+    np.maximum.accumulate(positions, out=positions)
+    filled = closes[positions]
+    if len(closes) and not valid[0]:
+        first_valid = int(np.argmax(valid)) if valid.any() else len(closes)
+        filled[:first_valid] = np.nan
+    return filled
+
+
+class CandleScenarioIndex:
+    """
+    캔들 테이블 시나리오 인덱스
+
+    market_data DB의 모든 캔들 테이블을 대상으로 시나리오 구간을 색인합니다.
+    refresh()는 테이블별로 마지막 색인 이후 추가된 캔들만 라벨링하므로 반복 호출 비용이 작습니다.
+    """
+
+    def __init__(self, market_data_db_path: str, config: Optional[ScenarioIndexConfig] = None):
+        self.market_data_db_path = market_data_db_path
+        self.config = config or ScenarioIndexConfig()
+        self._schema_ready = False
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_done = threading.Event()
+
+        logger.debug(f"시나리오 인덱스 초기화: {market_data_db_path} (window={self.config.window_size})")
+
+    # === 스키마 ===
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.market_data_db_path)
+        if not self._schema_ready:
+            self._ensure_schema(conn)
+            self._schema_ready = True
+        return conn
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        """인덱스 테이블 생성"""
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {INDEX_TABLE} (
+                table_name TEXT NOT NULL,
+                symbol TEXT NOT NULL,
+                timeframe TEXT NOT NULL,
+                start_utc TEXT NOT NULL,
+                end_utc TEXT NOT NULL,
+                regime TEXT NOT NULL,
+                score REAL NOT NULL,
+                total_return REAL NOT NULL,
+                PRIMARY KEY (table_name, end_utc)
+            )
+        """)
+        conn.execute(f"""
+            CREATE INDEX IF NOT EXISTS idx_{INDEX_TABLE}_regime
+            ON {INDEX_TABLE}(regime, score DESC)
+        """)
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {STATE_TABLE} (
+                table_name TEXT NOT NULL PRIMARY KEY,
+                symbol TEXT NOT NULL,
+                timeframe TEXT NOT NULL,
+                first_candle_utc TEXT,
+                last_window_end_utc TEXT,
+                config_fingerprint TEXT NOT NULL,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.commit()
+
+    # === 색인 유지 ===
+
+    def refresh(self, table_names: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        증분 색인 갱신
+
+        Args:
+            table_names: 대상 캔들 테이블 (None이면 전체 candles_* 테이블)
+
+        Returns:
+            테이블별 새로 라벨링된 구간 수
+        """
+        added: Dict[str, int] = {}
+        with self._connect() as conn:
+            targets = table_names or self._list_candle_tables(conn)
+            for table_name in targets:
+                try:
+                    added[table_name] = self._refresh_table(conn, table_name)
+                except sqlite3.Error as e:
+                    logger.warning(f"시나리오 색인 실패: {table_name}, {e}")
+            conn.commit()
+
+        total = sum(added.values())
+        if total:
+            logger.info(f"시나리오 인덱스 갱신: {len(added)}개 테이블, {total}개 구간 추가")
+        return added
+
+    def start_background_refresh(self) -> None:
+        """
+        증분 색인 갱신을 백그라운드 스레드에서 시작 (중복 호출 무시)
+
+        첫 갱신은 모든 캔들 테이블을 스캔하므로 UI 스레드에서 refresh()를 직접 호출하지 않습니다.
+        완료 여부는 is_ready로 확인합니다.
+        """
+        if self._refresh_thread is not None:
+            return
+
+        def worker() -> None:
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"시나리오 인덱스 백그라운드 갱신 실패: {e}")
+            finally:
+                self._refresh_done.set()
+
+        self._refresh_thread = threading.Thread(target=worker, daemon=True, name="CandleScenarioIndexRefresh")
+        self._refresh_thread.start()
+
+    @property
+    def is_ready(self) -> bool:
+        """백그라운드 갱신 완료 여부"""
+        return self._refresh_done.is_set()
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """백그라운드 갱신 완료 대기 (UI 스레드 밖 호출자용)"""
+        return self._refresh_done.wait(timeout)
+
+    def rebuild(self, table_name: str) -> int:
+        """테이블 색인 전체 재구축 (과거 구간 보강/데이터 교체 시)"""
+        with self._connect() as conn:
+            self._clear_table(conn, table_name)
+            count = self._refresh_table(conn, table_name)
+            conn.commit()
+        return count
+
+    def _list_candle_tables(self, conn: sqlite3.Connection) -> List[str]:
+        rows = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name LIKE 'candles\\_%' ESCAPE '\\'"
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def _clear_table(self, conn: sqlite3.Connection, table_name: str) -> None:
+        conn.execute(f"DELETE FROM {INDEX_TABLE} WHERE table_name = ?", (table_name,))
+        conn.execute(f"DELETE FROM {STATE_TABLE} WHERE table_name = ?", (table_name,))
+
+    def _refresh_table(self, conn: sqlite3.Connection, table_name: str) -> int:
+        """단일 테이블 증분 색인"""
+        config = self.config
+        first_row = conn.execute(
+            f"SELECT candle_date_time_utc, market FROM {table_name} ORDER BY candle_date_time_utc ASC LIMIT 1"
+        ).fetchone()
+        if first_row is None:
+            return 0
+
+        first_candle_utc, symbol = first_row
+        timeframe = table_name.rsplit("_", 1)[-1]
+
+        state = conn.execute(
+            f"SELECT first_candle_utc, last_window_end_utc, config_fingerprint FROM {STATE_TABLE} WHERE table_name = ?",
+            (table_name,)
+        ).fetchone()
+
+        # 과거 데이터 보강 또는 설정 변경 시 전체 재구축
+        if state is not None and (state[0] != first_candle_utc or state[2] != config.fingerprint):
+            logger.debug(f"시나리오 인덱스 재구축: {table_name}")
+            self._clear_table(conn, table_name)
+            state = None
+
+        last_window_end = state[1] if state else None
+        utcs, closes, anchor = self._load_closes(conn, table_name, last_window_end)
+        closes = _fill_empty_closes(closes)
+
+        # 선두 빈 캔들 제거
+        valid_from = int(np.argmax(~np.isnan(closes))) if len(closes) else 0
+        if len(closes) == 0 or np.isnan(closes[valid_from]):
+            return 0
+        if anchor is not None:
+            anchor -= valid_from
+        utcs = utcs[valid_from:]
+        closes = closes[valid_from:]
+
+        if anchor is None:
+            window_ends = np.arange(config.window_size - 1, len(closes), config.stride)
+        else:
+            window_ends = np.arange(anchor + config.stride, len(closes), config.stride)
+            window_ends = window_ends[window_ends >= config.window_size - 1]
+
+        if len(window_ends) == 0:
+            self._save_state(conn, table_name, symbol, timeframe, first_candle_utc, last_window_end)
+            return 0
+
+        labels, scores, total_returns = label_windows(closes, window_ends, config)
+        starts = window_ends - (config.window_size - 1)
+        records = [
+            (table_name, symbol, timeframe, utcs[start], utcs[end], label.name, float(score), float(total_return))
+            for start, end, label, score, total_return in zip(
+                starts.tolist(), window_ends.tolist(), labels, scores.tolist(), total_returns.tolist()
+            )
+        ]
+        conn.executemany(f"""
+            INSERT OR REPLACE INTO {INDEX_TABLE}
+            (table_name, symbol, timeframe, start_utc, end_utc, regime, score, total_return)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, records)
+
+        self._save_state(conn, table_name, symbol, timeframe, first_candle_utc, records[-1][4])
+        logger.debug(f"시나리오 색인: {table_name}, {len(records)}개 구간")
+        return len(records)
+
+    def _load_closes(
+        self,
+        conn: sqlite3.Connection,
+        table_name: str,
+        last_window_end: Optional[str]
+    ) -> Tuple[List[str], np.ndarray, Optional[int]]:
+        """
+        라벨링 대상 종가 로드
+
+        증분 모드에서는 마지막 구간 종료 시점 이전의 선행 캔들(구간 + 기준 변동성 범위)만 함께 읽습니다.
+
+        Returns:
+            (UTC 목록, 종가 배열, 마지막 구간 종료 위치 또는 None)
+        """
+        if last_window_end is None:
+            rows = conn.execute(
+                f"SELECT candle_date_time_utc, trade_price FROM {table_name} ORDER BY candle_date_time_utc ASC"
+            ).fetchall()
+            anchor = None
+        else:
+            lookback = self.config.window_size * (self.config.reference_windows + 1) + self.config.stride
+            head = conn.execute(
+                f"""SELECT candle_date_time_utc, trade_price FROM {table_name}
+                    WHERE candle_date_time_utc <= ? ORDER BY candle_date_time_utc DESC LIMIT ?""",
+                (last_window_end, lookback)
+            ).fetchall()
+            tail = conn.execute(
+                f"""SELECT candle_date_time_utc, trade_price FROM {table_name}
+                    WHERE candle_date_time_utc > ? ORDER BY candle_date_time_utc ASC""",
+                (last_window_end,)
+            ).fetchall()
+            head.reverse()
+            rows = head + tail
+            anchor = len(head) - 1
+
+        utcs = [row[0] for row in rows]
+        closes = np.array([np.nan if row[1] is None else row[1] for row in rows], dtype=np.float64)
+        return utcs, closes, anchor
+
+    def _save_state(self, conn: sqlite3.Connection, table_name: str, symbol: str, timeframe: str,
+                    first_candle_utc: str, last_window_end: Optional[str]) -> None:
+        conn.execute(f"""
+            INSERT OR REPLACE INTO {STATE_TABLE}
+            (table_name, symbol, timeframe, first_candle_utc, last_window_end_utc, config_fingerprint, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        """, (table_name, symbol, timeframe, first_candle_utc, last_window_end, self.config.fingerprint))
+
+    # === 조회 ===
+
+    def find_segments(
+        self,
+        scenario: SimulationScenario,
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        limit: int = 50
+    ) -> List[ScenarioSegment]:
+        """시나리오에 해당하는 구간 조회 (점수 내림차순)"""
+        query = f"""
+            SELECT symbol, timeframe, table_name, start_utc, end_utc, score, total_return
+            FROM {INDEX_TABLE} WHERE regime = ?
+        """
+        params: List = [scenario.name]
+        if symbol:
+            query += " AND symbol = ?"
+            params.append(symbol)
+        if timeframe:
+            query += " AND timeframe = ?"
+            params.append(timeframe)
+        query += " ORDER BY score DESC LIMIT ?"
+        params.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        return [
+            ScenarioSegment(
+                symbol=row[0], timeframe=row[1], table_name=row[2],
+                start_utc=row[3], end_utc=row[4], scenario=scenario,
+                score=row[5], total_return=row[6]
+            )
+            for row in rows
+        ]
+
+    def get_regime_counts(self) -> Dict[SimulationScenario, int]:
+        """시나리오별 색인 구간 수"""
+        with self._connect() as conn:
+            rows = conn.execute(f"SELECT regime, COUNT(*) FROM {INDEX_TABLE} GROUP BY regime").fetchall()
+        return {SimulationScenario[row[0]]: row[1] for row in rows if row[0] in SimulationScenario.__members__}
+
+    def load_segment(self, segment: ScenarioSegment, data_length: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """
+        라벨링된 구간(start_utc ~ end_utc)의 캔들을 OHLCV DataFrame으로 로드
+
+        반환 길이는 라벨 구간 길이(window_size)와 같고, data_length가 더 작으면 구간 끝에서 data_length개만 반환합니다.
+        빈 캔들은 직전 종가의 평탄한 봉(거래량 0)으로 채웁니다.
+        """
+        limit = self.config.window_size if data_length is None else min(data_length, self.config.window_size)
+        with sqlite3.connect(self.market_data_db_path) as conn:
+            rows = conn.execute(f"""
+                SELECT candle_date_time_utc, opening_price, high_price, low_price,
+                       trade_price, candle_acc_trade_volume
+                FROM {segment.table_name}
+                WHERE candle_date_time_utc >= ? AND candle_date_time_utc <= ?
+                ORDER BY candle_date_time_utc DESC
+                LIMIT ?
+            """, (segment.start_utc, segment.end_utc, limit)).fetchall()
+
+        if not rows:
+            return None
+
+        rows.reverse()
+        df = pd.DataFrame(rows, columns=['datetime', 'open', 'high', 'low', 'close', 'volume'])
+        df['close'] = df['close'].astype(float).ffill()
+        for col in ('open', 'high', 'low'):
+            df[col] = df[col].astype(float).fillna(df['close'])
+        df['volume'] = df['volume'].astype(float).fillna(0.0)
+        df = df.dropna(subset=['close'])
+
+        df['datetime'] = pd.to_datetime(df['datetime'])
+        df.set_index('datetime', inplace=True)
+        return df
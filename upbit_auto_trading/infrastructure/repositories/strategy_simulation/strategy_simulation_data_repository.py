@@ -16,6 +16,9 @@ from upbit_auto_trading.domain.strategy_simulation.value_objects.simulation_scen
 from upbit_auto_trading.domain.strategy_simulation.repositories.i_strategy_simulation_repository import (
     IStrategySimulationDataRepository
 )
+from upbit_auto_trading.infrastructure.repositories.strategy_simulation.candle_scenario_index import (
+    CandleScenarioIndex
+)
 from upbit_auto_trading.infrastructure.logging import create_component_logger
 
 logger = create_component_logger("StrategySimulationDataRepository")
@@ -40,6 +43,10 @@ class StrategySimulationDataRepository(IStrategySimulationDataRepository):
         self._sampled_data_cache: Dict[str, pd.DataFrame] = {}
         self._embedded_datasets: Dict[str, Dict[str, Any]] = {}
 
+        # 실제 캔들 테이블 시나리오 인덱스 (첫 실제 DB 로드 시 백그라운드 증분 갱신)
+        self._scenario_index = CandleScenarioIndex(market_data_db_path)
+        self._segment_candidates = 20
+
         logger.debug(f"전략 시뮬레이션 데이터 Repository 초기화: {market_data_db_path}")
 
         # 내장 데이터셋 생성
@@ -309,77 +316,42 @@ class StrategySimulationDataRepository(IStrategySimulationDataRepository):
         return df
 
     def _load_real_database_scenario_data(self, scenario: SimulationScenario, data_length: int) -> Optional[pd.DataFrame]:
-        """실제 DB 시나리오 데이터 로드"""
+        """실제 DB 시나리오 데이터 로드 (캔들 테이블 시나리오 인덱스 기반)"""
         if not self._check_real_database_availability():
             return None
 
         try:
-            with sqlite3.connect(self.market_data_db_path) as conn:
-                # 기본 쿼리 (KRW-BTC 일봉 데이터)
-                query = """
-                SELECT datetime, open, high, low, close, volume
-                FROM daily_candles
-                WHERE symbol = 'KRW-BTC'
-                ORDER BY datetime DESC
-                LIMIT ?
-                """
-
-                df = pd.read_sql_query(query, conn, params=[data_length * 2])
+            if not self._ensure_scenario_index():
+                logger.debug(f"시나리오 인덱스 갱신 중: {scenario.value}")
+                return None
 
-                if df.empty:
-                    logger.warning("실제 DB에서 데이터를 찾을 수 없습니다")
-                    return None
+            segments = self._scenario_index.find_segments(scenario, limit=self._segment_candidates)
+            if not segments:
+                logger.warning(f"실제 DB에 시나리오 구간이 없습니다: {scenario.value}")
+                return None
 
-                df['datetime'] = pd.to_datetime(df['datetime'])
-                df.set_index('datetime', inplace=True)
-                df = df.sort_index()
+            # 상위 점수 구간 중 무작위 선택 (심볼/타임프레임 무관)
+            segment = segments[np.random.randint(len(segments))]
+            df = self._scenario_index.load_segment(segment, data_length)
 
-                # 시나리오에 맞는 데이터 세그멘테이션
-                df = self._apply_scenario_segmentation(df, scenario, data_length)
+            if df is None or df.empty:
+                logger.warning(f"시나리오 구간 데이터 없음: {segment.table_name} {segment.start_utc} ~ {segment.end_utc}")
+                return None
 
-                logger.debug(f"실제 DB 시나리오 데이터 로드: {scenario.value}, {len(df)}개 포인트")
-                return df
+            logger.debug(
+                f"실제 DB 시나리오 데이터 로드: {scenario.value}, {segment.symbol} {segment.timeframe}, "
+                f"{segment.start_utc} ~ {segment.end_utc}, {len(df)}개 포인트"
+            )
+            return df
 
         except Exception as e:
             logger.error(f"실제 DB 데이터 로드 실패: {e}")
             return None
 
-    def _apply_scenario_segmentation(self, df: pd.DataFrame, scenario: SimulationScenario, target_length: int) -> pd.DataFrame:
-        """시나리오에 맞는 데이터 세그멘테이션"""
-        if len(df) <= target_length:
-            return df
-
-        close_prices = df['close']
-
-        if scenario == SimulationScenario.UPTREND:
-            # 상승 구간 찾기
-            rolling_returns = close_prices.pct_change(20).rolling(20).mean()
-            uptrend_mask = rolling_returns > 0.02  # 2% 이상 상승
-
-        elif scenario == SimulationScenario.DOWNTREND:
-            # 하락 구간 찾기
-            rolling_returns = close_prices.pct_change(20).rolling(20).mean()
-            uptrend_mask = rolling_returns < -0.02  # 2% 이상 하락
-
-        elif scenario == SimulationScenario.HIGH_VOLATILITY:
-            # 높은 변동성 구간 찾기
-            volatility = close_prices.pct_change().rolling(20).std()
-            uptrend_mask = volatility > volatility.quantile(0.8)
-
-        else:
-            # 기타 시나리오는 무작위 구간
-            start_idx = np.random.randint(0, max(1, len(df) - target_length))
-            return df.iloc[start_idx:start_idx + target_length]
-
-        # 조건에 맞는 구간 선택
-        valid_indices = df.index[uptrend_mask]
-        if len(valid_indices) >= target_length:
-            start_idx = np.random.choice(len(valid_indices) - target_length + 1)
-            selected_indices = valid_indices[start_idx:start_idx + target_length]
-            return df.loc[selected_indices]
-        else:
-            # 조건 만족 구간이 부족하면 끝에서부터
-            return df.tail(target_length)
+    def _ensure_scenario_index(self) -> bool:
+        """시나리오 인덱스 백그라운드 증분 갱신 시작 (Repository 인스턴스당 1회) → 갱신 완료 여부"""
+        self._scenario_index.start_background_refresh()
+        return self._scenario_index.is_ready
 
     def _load_synthetic_scenario_data(self, scenario: SimulationScenario, data_length: int) -> Optional[pd.DataFrame]:
         """합성 시나리오 데이터 로드"""
@@ -440,32 +412,26 @@ class StrategySimulationDataRepository(IStrategySimulationDataRepository):
         return df
 
     def _validate_real_database_integrity(self) -> bool:
-        """실제 DB 무결성 검증"""
+        """실제 DB 무결성 검증 (시나리오 인덱스 커버리지 기준)"""
         try:
-            with sqlite3.connect(self.market_data_db_path) as conn:
-                cursor = conn.cursor()
-
-                # 기본 테이블 존재 확인
-                cursor.execute("SELECT COUNT(*) FROM daily_candles WHERE symbol = 'KRW-BTC'")
-                count = cursor.fetchone()[0]
+            if not self._check_real_database_availability():
+                return False
 
-                if count < 100:  # 최소 100개 레코드 필요
-                    logger.warning(f"실제 DB 데이터 부족: {count}개 레코드")
-                    return False
+            if not self._ensure_scenario_index():
+                logger.debug("시나리오 인덱스 갱신 중, 실제 DB 검증 보류")
+                return False
+            regime_counts = self._scenario_index.get_regime_counts()
 
-                # 데이터 품질 확인
-                cursor.execute("""
-                    SELECT COUNT(*) FROM daily_candles
-                    WHERE symbol = 'KRW-BTC'
-                    AND (close IS NULL OR close <= 0 OR high < low)
-                """)
-                invalid_count = cursor.fetchone()[0]
+            total_segments = sum(regime_counts.values())
+            if total_segments == 0:
+                logger.warning("실제 DB 캔들 테이블에서 색인된 시나리오 구간이 없습니다")
+                return False
 
-                if invalid_count > count * 0.05:  # 5% 이상 무효 데이터
-                    logger.warning(f"실제 DB 품질 문제: {invalid_count}개 무효 레코드")
-                    return False
+            missing = [s.value for s in SimulationScenario.get_all_scenarios() if s not in regime_counts]
+            if missing:
+                logger.debug(f"실제 DB에 없는 시나리오: {missing}")
 
-                return True
+            return True
 
         except Exception as e:
             logger.error(f"실제 DB 무결성 검증 실패: {e}")
@@ -0,0 +1,55 @@
+"""
+매매 변수 YAML 카탈로그 로더
+- data_info/trading_variables/<카테고리>/<변수>/tv_trading_variables.yaml 분산 정의를 읽어 변수 목록 구성
+- 카탈로그 + 비교 그룹 규칙으로 VariableCompatibilityIndex 를 한 번에 생성
+"""
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import yaml
+
+from upbit_auto_trading.domain.trigger_builder.services.variable_compatibility_index import VariableCompatibilityIndex
+from upbit_auto_trading.infrastructure.logging import create_component_logger
+
+DEFAULT_CATALOG_DIR = Path(__file__).resolve().parents[3] / "data_info" / "trading_variables"
+
+logger = create_component_logger("TradingVariableCatalog")
+
+
+def load_trading_variable_catalog(catalog_dir: Optional[Union[str, Path]] = None) -> List[Dict[str, Any]]:
+    """
+    분산 YAML 카탈로그의 변수 정의 목록 (variable_id 순)
+
+    Returns:
+        [{'variable_id', 'comparison_group', 'is_active', ...}] - 파일 하나가 여러 변수를 담아도 모두 포함
+    """
+    root = Path(catalog_dir) if catalog_dir is not None else DEFAULT_CATALOG_DIR
+    if not root.exists():
+        logger.warning(f"매매 변수 카탈로그 폴더가 없습니다: {root}")
+        return []
+
+    variables: Dict[str, Dict[str, Any]] = {}
+    for path in sorted(root.glob("*/*/tv_trading_variables.yaml")):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = yaml.safe_load(f) or {}
+        except Exception as e:
+            logger.error(f"카탈로그 파일 로드 실패 ({path}): {e}")
+            continue
+        for key, definition in data.items():
+            if not isinstance(definition, dict):
+                continue
+            variable_id = definition.get('variable_id', key)
+            variables[variable_id] = dict(definition, variable_id=variable_id,
+                                          is_active=bool(definition.get('is_active', True)))
+
+    logger.debug(f"매매 변수 카탈로그 로드: {len(variables)}개 ({root})")
+    return [variables[variable_id] for variable_id in sorted(variables)]
+
+
+def build_variable_compatibility_index(catalog_dir: Optional[Union[str, Path]] = None,
+                                       rules: Optional[Any] = None) -> VariableCompatibilityIndex:
+    """YAML 카탈로그와 비교 그룹 규칙으로 호환성 인덱스 생성"""
+    index = VariableCompatibilityIndex.build(load_trading_variable_catalog(catalog_dir), rules)
+    logger.info(f"변수 호환성 인덱스 생성: {len(index)}개 변수")
+    return index
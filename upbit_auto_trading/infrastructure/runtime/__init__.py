@@ -19,6 +19,16 @@ from .app_kernel import (
     get_kernel,
     create_task
 )
+from .loop_health_monitor import (
+    LoopHealthMonitor,
+    SlowCallbackEvent
+)
+from .startup_profiler import (
+    StartupPhase,
+    StartupProfiler,
+    get_startup_profiler,
+    set_startup_profiler
+)
 
 __all__ = [
     'LoopGuard',
@@ -32,5 +42,11 @@ __all__ = [
     'KernelConfig',
     'TaskManager',
     'get_kernel',
-    'create_task'
+    'create_task',
+    'LoopHealthMonitor',
+    'SlowCallbackEvent',
+    'StartupPhase',
+    'StartupProfiler',
+    'get_startup_profiler',
+    'set_startup_profiler'
 ]
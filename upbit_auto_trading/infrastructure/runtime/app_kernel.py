@@ -6,16 +6,18 @@ AppKernel - QAsync 통합 런타임 커널
 - QAsync 이벤트 루프와 LoopGuard 초기화
 - TaskManager를 통한 태스크 생명주기 관리
 - EventBus 및 HTTP 클라이언트 통합 관리
-- 안전한 shutdown 시퀀스 제공
+- 안전한 shutdown 시퀀스 제공 (태스크 취소 전 컴포넌트 종료 훅 실행)
+- LoopHealthMonitor를 통한 이벤트 루프 지연/느린 콜백 감시
 - Infrastructure 컴포넌트들의 의존성 주입
 """
 
 import asyncio
 import logging
 import sys
-from typing import Optional, Dict, Any, Set
+from typing import Awaitable, Callable, Optional, Dict, Any, Set
 from datetime import datetime
 from dataclasses import dataclass, field
+from pathlib import Path
 
 try:
     import qasync
@@ -25,6 +27,7 @@ except ImportError:
     QASYNC_AVAILABLE = False
 
 from .loop_guard import LoopGuard, get_loop_guard
+from .loop_health_monitor import DEFAULT_DUMP_DIR, LoopHealthMonitor
 
 
 @dataclass
@@ -36,6 +39,11 @@ class KernelConfig:
     enable_http_clients: bool = True
     shutdown_timeout: float = 30.0
     log_level: str = "INFO"
+    enable_loop_monitor: bool = True
+    slow_callback_threshold: float = 0.1      # 느린 콜백 판정 기준 (초)
+    loop_lag_interval: float = 0.25           # 루프 지연 프로브 주기 (초)
+    loop_health_dump_dir: Path = DEFAULT_DUMP_DIR
+    loop_health_max_dumps: int = 20           # 보관할 최근 덤프 수
     component_registry: Dict[str, Any] = field(default_factory=dict)
 
 
@@ -45,6 +53,7 @@ class TaskManager:
     def __init__(self, logger: logging.Logger):
         self._tasks: Set[asyncio.Task] = set()
         self._named_tasks: Dict[str, asyncio.Task] = {}
+        self._task_components: Dict[asyncio.Task, str] = {}
         self._logger = logger
         self._shutdown_requested = False
 
@@ -65,6 +74,7 @@ class TaskManager:
 
         task = asyncio.create_task(coro)
         self._tasks.add(task)
+        self._task_components[task] = component or "(unowned)"
 
         # 태스크 이름 설정
         task_name = name or f"task-{id(task)}"
@@ -84,6 +94,7 @@ class TaskManager:
         # 완료 콜백 설정
         def cleanup_callback(finished_task):
             self._tasks.discard(finished_task)
+            self._task_components.pop(finished_task, None)
             if name and name in self._named_tasks:
                 self._named_tasks.pop(name, None)
 
@@ -104,6 +115,17 @@ class TaskManager:
         """이름으로 태스크 조회"""
         return self._named_tasks.get(name)
 
+    def get_owner(self, task: asyncio.Task) -> Optional[str]:
+        """태스크 소속 컴포넌트 조회 (TaskManager 외부에서 생성된 태스크는 None)"""
+        return self._task_components.get(task)
+
+    def get_task_counts(self) -> Dict[str, int]:
+        """컴포넌트별 실행 중 태스크 수"""
+        counts: Dict[str, int] = {}
+        for component in self._task_components.values():
+            counts[component] = counts.get(component, 0) + 1
+        return counts
+
     def cancel_task(self, name: str) -> bool:
         """이름으로 태스크 취소"""
         task = self._named_tasks.get(name)
@@ -142,12 +164,14 @@ class TaskManager:
         # 강제 정리
         self._tasks.clear()
         self._named_tasks.clear()
+        self._task_components.clear()
 
     def get_status(self) -> Dict[str, Any]:
         """현재 상태 반환"""
         return {
             "total_tasks": len(self._tasks),
             "named_tasks": list(self._named_tasks.keys()),
+            "tasks_by_component": self.get_task_counts(),
             "shutdown_requested": self._shutdown_requested
         }
 
@@ -173,8 +197,10 @@ class AppKernel:
         # 핵심 컴포넌트들
         self.loop_guard: Optional[LoopGuard] = None
         self.task_manager: Optional[TaskManager] = None
+        self.loop_monitor: Optional[LoopHealthMonitor] = None
         self.event_bus: Optional[Any] = None
         self.http_clients: Dict[str, Any] = {}
+        self._shutdown_hooks: Dict[str, Callable[[], Awaitable[None]]] = {}
 
         # 상태 관리
         self._initialized = False
@@ -242,6 +268,19 @@ class AppKernel:
             self.task_manager = TaskManager(self._logger)
             self._logger.info("✅ TaskManager 초기화 완료")
 
+        # LoopHealthMonitor 초기화
+        if self.config.enable_loop_monitor:
+            self.loop_monitor = LoopHealthMonitor(
+                self._loop,
+                task_manager=self.task_manager,
+                slow_callback_threshold=self.config.slow_callback_threshold,
+                lag_interval=self.config.loop_lag_interval,
+                dump_dir=self.config.loop_health_dump_dir,
+                max_dumps=self.config.loop_health_max_dumps
+            )
+            self.loop_monitor.start()
+            self._logger.info("✅ LoopHealthMonitor 초기화 완료")
+
         # EventBus 초기화 (나중에 구현)
         if self.config.enable_event_bus:
             self._logger.info("⚠️ EventBus 초기화 예정 (Step 2에서 구현)")
@@ -276,6 +315,34 @@ class AppKernel:
         """등록된 HTTP 클라이언트 조회"""
         return self.http_clients.get(name)
 
+    def register_shutdown_hook(self, name: str, hook: Callable[[], Awaitable[None]]) -> None:
+        """
+        종료 훅 등록 - shutdown 시 태스크 취소 전에 등록 역순으로 await (최종 저장, 구독 해제 등)
+
+        Args:
+            name: 훅 이름 (같은 이름은 교체)
+            hook: 인자 없는 코루틴 함수
+        """
+        self._shutdown_hooks.pop(name, None)
+        self._shutdown_hooks[name] = hook
+        self._logger.debug(f"종료 훅 등록: {name}")
+
+    def unregister_shutdown_hook(self, name: str) -> None:
+        """종료 훅 해제 (컴포넌트가 먼저 정리된 경우)"""
+        self._shutdown_hooks.pop(name, None)
+
+    async def _run_shutdown_hooks(self) -> None:
+        hooks = list(self._shutdown_hooks.items())
+        self._shutdown_hooks.clear()
+        for name, hook in reversed(hooks):
+            try:
+                await asyncio.wait_for(hook(), timeout=self.config.shutdown_timeout)
+                self._logger.debug(f"종료 훅 완료: {name}")
+            except asyncio.TimeoutError:
+                self._logger.warning(f"종료 훅 타임아웃: {name} ({self.config.shutdown_timeout}초)")
+            except Exception as e:
+                self._logger.error(f"종료 훅 실패: {name}, 오류: {e}")
+
     async def run(self) -> None:
         """
         메인 애플리케이션 실행
@@ -330,13 +397,22 @@ class AppKernel:
         self._logger.info("🛑 AppKernel 종료 시퀀스 시작...")
 
         try:
-            # 1. 새 작업 수락 중지 (TaskManager에서 처리됨)
+            # 1. 컴포넌트 종료 훅 (태스크가 취소되기 전에 최종 저장/구독 해제)
+            await self._run_shutdown_hooks()
 
-            # 2. 태스크 취소 및 정리
+            # 2. 루프 감시 중지 및 덤프 (느린 콜백이 있었을 때만, 태스크 정리 전 상태 보존)
+            if self.loop_monitor:
+                self.loop_monitor.stop()
+                try:
+                    self.loop_monitor.dump_if_stalled()
+                except OSError as e:
+                    self._logger.error(f"루프 상태 덤프 실패: {e}")
+
+            # 3. 태스크 취소 및 정리
             if self.task_manager:
                 await self.task_manager.shutdown(self.config.shutdown_timeout)
 
-            # 3. HTTP 클라이언트 정리
+            # 4. HTTP 클라이언트 정리
             for name, client in self.http_clients.items():
                 try:
                     if hasattr(client, 'close'):
@@ -348,18 +424,18 @@ class AppKernel:
                 except Exception as e:
                     self._logger.error(f"HTTP 클라이언트 {name} 정리 실패: {e}")
 
-            # 4. EventBus 정리 (나중에 구현)
+            # 5. EventBus 정리 (나중에 구현)
             if self.event_bus:
                 self._logger.info("EventBus 정리 예정...")
 
-            # 5. LoopGuard 정리
+            # 6. LoopGuard 정리
             if self.loop_guard:
                 violations = self.loop_guard.get_violations()
                 if violations:
                     self._logger.warning(f"종료 시 {len(violations)}개 루프 위반 기록 발견")
                 self.loop_guard.clear_violations()
 
-            # 6. QApplication 종료 준비
+            # 7. QApplication 종료 준비
             if self._qapp:
                 self._qapp.quit()
 
@@ -386,6 +462,7 @@ class AppKernel:
                 "enable_task_manager": self.config.enable_task_manager,
                 "enable_event_bus": self.config.enable_event_bus,
                 "enable_http_clients": self.config.enable_http_clients,
+                "enable_loop_monitor": self.config.enable_loop_monitor,
             }
         }
 
@@ -396,6 +473,9 @@ class AppKernel:
         if self.loop_guard:
             status["loop_guard"] = self.loop_guard.get_status_report()
 
+        if self.loop_monitor:
+            status["loop_health"] = self.loop_monitor.get_summary()
+
         status["http_clients"] = list(self.http_clients.keys())
 
         return status
@@ -0,0 +1,332 @@
+"""
+LoopHealthMonitor - 이벤트 루프 지연(lag) 및 느린 콜백 감지
+목적: Qt 페인팅·WebSocket·Rate Limiter·동기 sqlite 호출이 공유하는 단일 qasync 루프에서
+      UI 끊김을 일으킨 코루틴/콜백을 이름과 스택으로 특정
+
+주요 기능:
+- 지연 프로브: interval 마다 sleep 예약 시각 대비 실제 재개 시각 차이(스케줄링 지연) 측정
+- 느린 콜백 감지: asyncio.Handle._run 을 감싸 threshold 를 넘긴 콜백/태스크 스텝만 기록
+  (느리지 않은 콜백은 perf_counter 2회 + 속성 대입만 추가)
+- 블로킹 스택 캡처: 워치독 스레드가 threshold 를 넘겨 실행 중인 콜백을 발견하면
+  sys._current_frames() 로 루프 스레드의 현재 스택을 그 자리에서 캡처
+- TaskManager 소유자(component)별 태스크 수 추적
+- 고정 크기 메모리 저장소 + JSON 덤프 (기본: logs/loop_health/, 최근 max_dumps 개만 보관) + 디버그 패널용 요약
+
+사용 예시:
+    monitor = LoopHealthMonitor(loop, task_manager=kernel.task_manager)
+    monitor.start()
+    ...
+    summary = monitor.get_summary()
+    monitor.dump_if_stalled()   # 느린 콜백이 있었을 때만 저장
+"""
+
+import asyncio
+import json
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from upbit_auto_trading.infrastructure.logging.performance.latency_tracer import LatencyHistogram
+
+DEFAULT_DUMP_DIR = Path("logs") / "loop_health"
+
+_original_handle_run = asyncio.Handle._run
+_active_monitor: Optional["LoopHealthMonitor"] = None
+
+
+def _monitored_handle_run(handle: asyncio.Handle) -> None:
+    """asyncio.Handle._run 대체 - 감시 대상 루프의 콜백만 시간 측정"""
+    monitor = _active_monitor
+    if monitor is None or handle._loop is not monitor._loop:
+        return _original_handle_run(handle)
+
+    monitor._running_seq += 1
+    seq = monitor._running_seq
+    started = time.perf_counter()
+    monitor._running_since = started
+    monitor._running_handle = handle
+    try:
+        return _original_handle_run(handle)
+    finally:
+        monitor._running_handle = None
+        elapsed = time.perf_counter() - started
+        if elapsed >= monitor.slow_callback_threshold:
+            monitor._record_slow_callback(handle, elapsed, seq)
+
+
+@dataclass
+class SlowCallbackEvent:
+    """threshold 를 넘긴 콜백/태스크 스텝"""
+    timestamp: str
+    duration_ms: float
+    kind: str                       # task_step / callback
+    task_name: Optional[str]
+    owner: Optional[str]            # TaskManager component
+    callback: str
+    stack_source: str               # sampled (블로킹 중 캡처) / task_suspended / callback_source
+    stack: List[str] = field(default_factory=list)
+
+
+class LoopHealthMonitor:
+    """이벤트 루프 건강 상태 모니터 (루프당 하나, 동시에 하나만 활성)"""
+
+    def __init__(self,
+                 loop: Optional[asyncio.AbstractEventLoop] = None,
+                 task_manager: Optional[Any] = None,
+                 slow_callback_threshold: float = 0.1,
+                 lag_interval: float = 0.25,
+                 max_events: int = 200,
+                 max_lag_samples: int = 1200,
+                 stack_depth: int = 25,
+                 dump_dir: Optional[Path] = None,
+                 max_dumps: int = 20):
+        """
+        Args:
+            loop: 감시할 이벤트 루프 (None 이면 start() 시점의 현재 루프)
+            task_manager: 소유자별 태스크 수를 제공하는 TaskManager (선택)
+            slow_callback_threshold: 느린 콜백 판정 기준 (초)
+            lag_interval: 지연 프로브 주기 (초)
+            max_events / max_lag_samples: 메모리 저장소 크기 상한
+            stack_depth: 캡처할 스택 프레임 수 (안쪽 프레임 기준)
+            dump_dir: dump() 기본 저장 폴더
+            max_dumps: dump_dir 에 보관할 최근 덤프 수 (초과분은 오래된 것부터 삭제)
+        """
+        self._loop = loop
+        self.task_manager = task_manager
+        self.slow_callback_threshold = slow_callback_threshold
+        self.lag_interval = lag_interval
+        self.stack_depth = stack_depth
+        self.dump_dir = Path(dump_dir) if dump_dir else DEFAULT_DUMP_DIR
+        self.max_dumps = max_dumps
+        self._logger = logging.getLogger(__name__)
+
+        # 저장소 (고정 크기)
+        self.slow_events: Deque[SlowCallbackEvent] = deque(maxlen=max_events)
+        self.lag_samples: Deque[tuple] = deque(maxlen=max_lag_samples)   # (unix time, lag ms)
+        self.lag_histogram = LatencyHistogram("event_loop.lag")
+        self.task_counts: Dict[str, int] = {}
+        self.peak_task_counts: Dict[str, int] = {}
+        self.total_slow_callbacks = 0
+
+        # 실행 중 콜백 상태 (루프 스레드가 쓰고 워치독 스레드가 읽음)
+        self._running_handle: Optional[asyncio.Handle] = None
+        self._running_since = 0.0
+        self._running_seq = 0
+        self._sampled_stacks: Dict[int, List[str]] = {}
+
+        self._loop_thread_id: Optional[int] = None
+        self._probe_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._started_at: Optional[datetime] = None
+
+    # ==================== 생명주기 ====================
+
+    @property
+    def is_running(self) -> bool:
+        return _active_monitor is self
+
+    def start(self) -> None:
+        """감시 시작 - 루프 스레드에서 호출"""
+        global _active_monitor
+        if self.is_running:
+            return
+        if _active_monitor is not None:
+            raise RuntimeError("다른 LoopHealthMonitor 가 이미 활성화되어 있습니다")
+
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._started_at = datetime.now()
+        self._stop_event.clear()
+
+        _active_monitor = self
+        asyncio.Handle._run = _monitored_handle_run
+
+        self._probe_task = self._loop.create_task(self._lag_probe())
+        self._watchdog = threading.Thread(target=self._watchdog_loop, daemon=True, name="LoopHealthWatchdog")
+        self._watchdog.start()
+        self._logger.info(f"🩺 LoopHealthMonitor 시작 (느린 콜백 기준 {self.slow_callback_threshold * 1000:.0f}ms)")
+
+    def stop(self) -> None:
+        """감시 중지 (Handle._run 원복)"""
+        global _active_monitor
+        if not self.is_running:
+            return
+        _active_monitor = None
+        asyncio.Handle._run = _original_handle_run
+
+        self._stop_event.set()
+        if self._probe_task and not self._probe_task.done():
+            self._probe_task.cancel()
+        self._probe_task = None
+        if self._watchdog:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+        self._logger.info(f"🩺 LoopHealthMonitor 중지 (느린 콜백 {self.total_slow_callbacks}건)")
+
+    # ==================== 측정 ====================
+
+    async def _lag_probe(self) -> None:
+        """sleep 예약 시각 대비 실제 재개 지연 측정 + 소유자별 태스크 수 샘플링"""
+        loop = self._loop
+        while True:
+            scheduled = loop.time() + self.lag_interval
+            await asyncio.sleep(self.lag_interval)
+            lag = max(0.0, loop.time() - scheduled)
+            self.lag_histogram.record(int(lag * 1e9))
+            self.lag_samples.append((time.time(), round(lag * 1000, 3)))
+            self._sample_task_counts()
+
+    def _sample_task_counts(self) -> None:
+        counts: Dict[str, int] = {}
+        if self.task_manager is not None and hasattr(self.task_manager, "get_task_counts"):
+            counts.update(self.task_manager.get_task_counts())
+        counts["(all asyncio tasks)"] = len(asyncio.all_tasks(self._loop))
+        self.task_counts = counts
+        for owner, count in counts.items():
+            if count > self.peak_task_counts.get(owner, 0):
+                self.peak_task_counts[owner] = count
+
+    def _watchdog_loop(self) -> None:
+        """threshold 를 넘겨 실행 중인 콜백의 스택을 블로킹 도중 캡처"""
+        interval = max(0.005, self.slow_callback_threshold / 2)
+        while not self._stop_event.wait(interval):
+            handle, seq = self._running_handle, self._running_seq
+            if handle is None or seq in self._sampled_stacks:
+                continue
+            if time.perf_counter() - self._running_since < self.slow_callback_threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None or self._running_seq != seq:
+                continue
+            stack = traceback.format_stack(frame, limit=self.stack_depth)
+            self._sampled_stacks = {seq: stack}   # 최신 1건만 유지
+
+    def _record_slow_callback(self, handle: asyncio.Handle, elapsed: float, seq: int) -> None:
+        """느린 콜백 기록 (루프 스레드)"""
+        callback = handle._callback
+        task = getattr(callback, "__self__", None)
+        if not isinstance(task, asyncio.Task):
+            task = None
+
+        stack = self._sampled_stacks.pop(seq, None)
+        if stack is not None:
+            stack_source = "sampled"
+        elif task is not None:
+            stack_source = "task_suspended"
+            stack = [line for frame in task.get_stack(limit=self.stack_depth)
+                     for line in traceback.format_stack(frame, limit=1)]
+        else:
+            stack_source = "callback_source"
+            stack = [repr(handle)]
+
+        owner = None
+        if task is not None and self.task_manager is not None and hasattr(self.task_manager, "get_owner"):
+            owner = self.task_manager.get_owner(task)
+
+        event = SlowCallbackEvent(
+            timestamp=datetime.now().isoformat(timespec="milliseconds"),
+            duration_ms=round(elapsed * 1000, 3),
+            kind="task_step" if task is not None else "callback",
+            task_name=task.get_name() if task is not None else None,
+            owner=owner,
+            callback=self._describe_callback(handle, task),
+            stack_source=stack_source,
+            stack=[line.rstrip() for line in stack]
+        )
+        self.slow_events.append(event)
+        self.total_slow_callbacks += 1
+        self._sample_task_counts()                # 블로킹 시점의 소유자별 태스크 수
+        self._logger.warning(f"🐢 이벤트 루프 블로킹 {event.duration_ms:.0f}ms: "
+                             f"{event.task_name or event.callback} (소유자: {owner or '-'})")
+
+    @staticmethod
+    def _describe_callback(handle: asyncio.Handle, task: Optional[asyncio.Task]) -> str:
+        if task is not None:
+            coro = task.get_coro()
+            return getattr(coro, "__qualname__", repr(coro))
+        callback = handle._callback
+        return getattr(callback, "__qualname__", repr(callback))
+
+    # ==================== 조회 / 덤프 ====================
+
+    def get_summary(self, top: int = 5) -> Dict[str, Any]:
+        """디버그 패널용 요약"""
+        lag = self.lag_histogram.snapshot()
+        offenders = Counter(event.task_name or event.callback for event in self.slow_events)
+        worst = max(self.slow_events, key=lambda event: event.duration_ms, default=None)
+        return {
+            "running": self.is_running,
+            "started_at": self._started_at.isoformat() if self._started_at else None,
+            "slow_callback_threshold_ms": self.slow_callback_threshold * 1000,
+            "lag_ms": {
+                "samples": lag.count,
+                "p50": round(lag.percentile_ns(0.5) / 1e6, 3),
+                "p99": round(lag.percentile_ns(0.99) / 1e6, 3),
+                "max": round(lag.max_ns / 1e6, 3),
+                "last": self.lag_samples[-1][1] if self.lag_samples else None,
+            },
+            "slow_callbacks": {
+                "total": self.total_slow_callbacks,
+                "top_offenders": offenders.most_common(top),
+                "worst": asdict(worst) if worst else None,
+            },
+            "task_counts": dict(self.task_counts),
+            "peak_task_counts": dict(self.peak_task_counts),
+        }
+
+    def format_summary(self) -> str:
+        """디버그 패널 표시용 텍스트 요약"""
+        summary = self.get_summary()
+        lag = summary["lag_ms"]
+        lines = [
+            f"루프 지연: p50 {lag['p50']}ms / p99 {lag['p99']}ms / 최대 {lag['max']}ms ({lag['samples']}회 측정)",
+            f"느린 콜백 (≥ {summary['slow_callback_threshold_ms']:.0f}ms): {summary['slow_callbacks']['total']}건",
+        ]
+        for name, count in summary["slow_callbacks"]["top_offenders"]:
+            lines.append(f"  - {name}: {count}건")
+        if summary["task_counts"]:
+            counts = ", ".join(f"{owner} {count}" for owner, count in sorted(summary["task_counts"].items()))
+            lines.append(f"태스크 수: {counts}")
+        return "\n".join(lines)
+
+    def dump(self, path: Optional[Path] = None) -> Path:
+        """요약 + 느린 콜백 전체 + 최근 지연 샘플을 JSON 으로 저장"""
+        if path is None:
+            path = self.dump_dir / f"loop_health_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.json"
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = {
+            "generated_at": datetime.now().isoformat(),
+            "summary": self.get_summary(),
+            "slow_callbacks": [asdict(event) for event in self.slow_events],
+            "lag_samples": list(self.lag_samples),
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        self._logger.info(f"🩺 루프 상태 덤프 저장: {path}")
+        self._prune_dumps()
+        return path
+
+    def dump_if_stalled(self) -> Optional[Path]:
+        """느린 콜백이 기록된 경우에만 dump() (종료 시 정상 세션은 파일을 남기지 않음)"""
+        if self.total_slow_callbacks == 0:
+            return None
+        return self.dump()
+
+    def _prune_dumps(self) -> None:
+        """dump_dir 의 자동 이름 덤프 중 최근 max_dumps 개만 유지"""
+        dumps = sorted(self.dump_dir.glob("loop_health_*.json"))
+        for stale in dumps[:max(0, len(dumps) - self.max_dumps)]:
+            try:
+                stale.unlink()
+            except OSError as e:
+                self._logger.warning(f"오래된 루프 상태 덤프 삭제 실패: {stale} - {e}")
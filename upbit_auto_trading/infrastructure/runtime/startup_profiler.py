@@ -0,0 +1,265 @@
+"""
+StartupProfiler - 애플리케이션 시작 구간별 시간 측정
+목적: run_desktop_ui.py → AppKernel → DI 컨테이너 → 첫 화면까지의 지연 원인을 단계별로 기록
+
+주요 기능:
+- 단계(phase)별 시작 오프셋/소요 시간/새로 로드된 모듈 수 기록
+- with 블록(동기 단계)과 begin/end(이벤트 루프를 넘나드는 비동기 단계) 모두 지원
+- 첫 paint 감지용 Qt 이벤트 필터 설치
+- 대기 단계가 모두 끝나면 JSON 리포트 자동 저장 (기본: logs/startup_profile.json)
+
+표준 단계 이름:
+    import → container_wiring → db_open → first_paint → websocket_connect
+
+사용 예시:
+    profiler = get_startup_profiler()
+    with profiler.phase("container_wiring"):
+        di_manager = get_di_lifecycle_manager()
+    profiler.watch_first_paint(main_window)
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Set
+
+# 첫 paint 전에 로드되면 시작 지연의 주범이 되는 모듈 (리포트에 로드 여부 표시)
+HEAVY_MODULES = (
+    "pandas",
+    "matplotlib",
+    "finplot",
+    "pyqtgraph",
+    "aiohttp",
+    "websockets",
+    "scipy",
+)
+
+DEFAULT_REPORT_PATH = Path("logs") / "startup_profile.json"
+DEFAULT_REPORT_AFTER = ("first_paint", "websocket_connect")
+
+
+def _loaded_heavy_modules() -> Set[str]:
+    return {name for name in HEAVY_MODULES if name in sys.modules}
+
+
+@dataclass
+class StartupPhase:
+    """시작 단계 측정 결과"""
+    name: str
+    start_ms: float
+    duration_ms: Optional[float] = None
+    modules_before: int = 0
+    modules_after: Optional[int] = None
+    status: str = "running"  # running / ok / failed
+    detail: Optional[str] = None
+    heavy_modules: List[str] = field(default_factory=list)  # 이 단계에서 새로 로드된 HEAVY_MODULES
+
+    @property
+    def is_finished(self) -> bool:
+        return self.duration_ms is not None
+
+    @property
+    def modules_loaded(self) -> Optional[int]:
+        if self.modules_after is None:
+            return None
+        return self.modules_after - self.modules_before
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["modules_loaded"] = self.modules_loaded
+        return data
+
+
+class StartupProfiler:
+    """
+    애플리케이션 시작 프로파일러
+
+    모든 오프셋은 origin(기본: 프로파일러 생성 시각, run_desktop_ui.py 는 스크립트 첫 줄 시각)
+    기준 밀리초입니다. 같은 이름의 단계는 한 번만 기록합니다.
+    """
+
+    def __init__(self, origin: Optional[float] = None, origin_modules: Optional[int] = None):
+        """
+        Args:
+            origin: 기준 시각 (time.perf_counter 값, None 이면 지금)
+            origin_modules: 기준 시점의 sys.modules 개수 (None 이면 지금)
+        """
+        self._origin = origin if origin is not None else time.perf_counter()
+        self._origin_wall = datetime.now() - timedelta(seconds=time.perf_counter() - self._origin)
+        self._origin_modules = origin_modules if origin_modules is not None else len(sys.modules)
+        self._phases: Dict[str, StartupPhase] = {}
+        self._heavy_before: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._report_path: Optional[Path] = None
+        self._report_after: Sequence[str] = ()
+        self._report_written = False
+        self._paint_filter = None
+        self._logger = logging.getLogger(__name__)
+
+    # ------------------------------------------------------------------
+    # 단계 기록
+    # ------------------------------------------------------------------
+    def elapsed_ms(self) -> float:
+        """origin 기준 경과 시간 (ms)"""
+        return (time.perf_counter() - self._origin) * 1000
+
+    def begin(self, name: str) -> None:
+        """단계 시작 (이미 기록된 단계면 무시)"""
+        with self._lock:
+            if name in self._phases:
+                return
+            self._heavy_before[name] = _loaded_heavy_modules()
+            self._phases[name] = StartupPhase(
+                name=name,
+                start_ms=self.elapsed_ms(),
+                modules_before=len(sys.modules)
+            )
+
+    def end(self, name: str, status: str = "ok", detail: Optional[str] = None) -> None:
+        """단계 종료 (시작되지 않았거나 이미 종료된 단계면 무시)"""
+        with self._lock:
+            phase = self._phases.get(name)
+            if phase is None or phase.is_finished:
+                return
+            phase.duration_ms = self.elapsed_ms() - phase.start_ms
+            phase.modules_after = len(sys.modules)
+            phase.status = status
+            phase.detail = detail
+            heavy_before = self._heavy_before.pop(name, set())
+            phase.heavy_modules = sorted(_loaded_heavy_modules() - heavy_before)
+        self._logger.info(
+            f"⏱️ 시작 단계 '{name}' {status}: {phase.duration_ms:.1f}ms, 모듈 +{phase.modules_loaded}"
+        )
+        self._write_report_if_complete()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """동기 단계 측정 - 예외 발생 시 failed 로 기록 후 다시 던짐"""
+        self.begin(name)
+        try:
+            yield
+        except BaseException as e:
+            self.end(name, status="failed", detail=f"{type(e).__name__}: {e}")
+            raise
+        self.end(name)
+
+    def record(self, name: str, start_ms: float = 0.0, status: str = "ok", detail: Optional[str] = None) -> None:
+        """origin 부터 지금까지의 구간을 사후 기록 (예: 프로파일러 생성 전 import 구간)"""
+        with self._lock:
+            if name in self._phases:
+                return
+            self._heavy_before[name] = set()
+            self._phases[name] = StartupPhase(
+                name=name,
+                start_ms=start_ms,
+                modules_before=self._origin_modules
+            )
+        self.end(name, status=status, detail=detail)
+
+    def get_phase(self, name: str) -> Optional[StartupPhase]:
+        return self._phases.get(name)
+
+    @property
+    def phases(self) -> List[StartupPhase]:
+        """시작 오프셋 순 단계 목록"""
+        return sorted(self._phases.values(), key=lambda phase: phase.start_ms)
+
+    # ------------------------------------------------------------------
+    # 첫 paint 감지
+    # ------------------------------------------------------------------
+    def watch_first_paint(self, widget, name: str = "first_paint") -> None:
+        """
+        위젯의 첫 Paint 이벤트에서 단계를 종료하는 이벤트 필터 설치
+
+        단계는 호출 시점(보통 show() 직전)에 시작됩니다.
+        """
+        from PyQt6.QtCore import QEvent, QObject
+
+        profiler = self
+
+        class _FirstPaintFilter(QObject):
+            def eventFilter(self, watched, event):
+                if event.type() == QEvent.Type.Paint:
+                    watched.removeEventFilter(self)
+                    profiler._paint_filter = None
+                    profiler.end(name)
+                return False
+
+        self.begin(name)
+        self._paint_filter = _FirstPaintFilter(widget)
+        widget.installEventFilter(self._paint_filter)
+
+    # ------------------------------------------------------------------
+    # 리포트
+    # ------------------------------------------------------------------
+    def configure_report(self, path: Optional[Path] = None,
+                         after: Sequence[str] = DEFAULT_REPORT_AFTER) -> None:
+        """after 단계가 모두 끝나면 path 에 JSON 리포트 자동 저장"""
+        self._report_path = Path(path) if path is not None else DEFAULT_REPORT_PATH
+        self._report_after = tuple(after)
+        self._report_written = False
+
+    def report(self) -> Dict:
+        """현재까지의 측정 결과"""
+        return {
+            "started_at": self._origin_wall.isoformat(timespec="milliseconds"),
+            "elapsed_ms": round(self.elapsed_ms(), 3),
+            "python": sys.version.split()[0],
+            "pid": os.getpid(),
+            "module_count": len(sys.modules),
+            "heavy_modules_loaded": sorted(_loaded_heavy_modules()),
+            "phases": [phase.to_dict() for phase in self.phases],
+        }
+
+    def write_report(self, path: Optional[Path] = None) -> Optional[Path]:
+        """JSON 리포트 저장 - 실패해도 예외를 던지지 않음 (시작 흐름 보호)"""
+        target = Path(path) if path is not None else (self._report_path or DEFAULT_REPORT_PATH)
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with open(target, "w", encoding="utf-8") as f:
+                json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            self._logger.warning(f"⚠️ 시작 프로파일 리포트 저장 실패: {target} ({e})")
+            return None
+        self._report_written = True
+        self._logger.info(f"📄 시작 프로파일 리포트 저장: {target}")
+        return target
+
+    def flush(self) -> None:
+        """자동 저장 전에 종료되는 경우 현재 상태라도 저장"""
+        if self._report_path is not None and not self._report_written:
+            self.write_report()
+
+    def _write_report_if_complete(self) -> None:
+        if self._report_path is None or self._report_written:
+            return
+        for name in self._report_after:
+            phase = self._phases.get(name)
+            if phase is None or not phase.is_finished:
+                return
+        self.write_report()
+
+
+# 전역 인스턴스 (편의성을 위해)
+_global_startup_profiler: Optional[StartupProfiler] = None
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """전역 StartupProfiler 인스턴스 반환"""
+    global _global_startup_profiler
+    if _global_startup_profiler is None:
+        _global_startup_profiler = StartupProfiler()
+    return _global_startup_profiler
+
+
+def set_startup_profiler(profiler: Optional[StartupProfiler]) -> None:
+    """전역 StartupProfiler 교체 (진입점에서 origin 지정 / 테스트용)"""
+    global _global_startup_profiler
+    _global_startup_profiler = profiler
@@ -10,6 +10,7 @@ DDD Architecture:
 """
 
 from dependency_injector import containers, providers
+from upbit_auto_trading.infrastructure.dependency_injection.lazy_import import lazy_import
 from upbit_auto_trading.infrastructure.logging import create_component_logger
 
 logger = create_component_logger("PresentationContainer")
@@ -45,14 +46,14 @@ class PresentationContainer(containers.DeclarativeContainer):
 
     # Navigation Bar Service
     navigation_service = providers.Factory(
-        "upbit_auto_trading.ui.desktop.common.widgets.navigation_bar.NavigationBar"
+        lazy_import("upbit_auto_trading.ui.desktop.common.widgets.navigation_bar.NavigationBar")
     )
 
     # Status Bar Service (DatabaseHealthService 의존성)
     status_bar_service = providers.Factory(
-        "upbit_auto_trading.ui.desktop.common.widgets.status_bar.StatusBar",
+        lazy_import("upbit_auto_trading.ui.desktop.common.widgets.status_bar.StatusBar"),
         database_health_service=providers.Factory(
-            "upbit_auto_trading.application.services.database_health_service.DatabaseHealthService"
+            lazy_import("upbit_auto_trading.application.services.database_health_service.DatabaseHealthService")
         )
     )
 
@@ -62,18 +63,18 @@ class PresentationContainer(containers.DeclarativeContainer):
 
     # Screen Manager Service (ApplicationServiceContainer 연동 - 백업본과 동일)
     screen_manager_service = providers.Factory(
-        "upbit_auto_trading.application.services.screen_manager_service.ScreenManagerService",
+        lazy_import("upbit_auto_trading.application.services.screen_manager_service.ScreenManagerService"),
         application_container=application_container
     )
 
     # Window State Service (순수 UI 상태 관리)
     window_state_service = providers.Factory(
-        "upbit_auto_trading.application.services.window_state_service.WindowStateService"
+        lazy_import("upbit_auto_trading.application.services.window_state_service.WindowStateService")
     )
 
     # Menu Service (UI 메뉴 관리)
     menu_service = providers.Factory(
-        "upbit_auto_trading.application.services.menu_service.MenuService"
+        lazy_import("upbit_auto_trading.application.services.menu_service.MenuService")
     )
 
     # =============================================================================
@@ -82,7 +83,7 @@ class PresentationContainer(containers.DeclarativeContainer):
 
     # MainWindowPresenter - MVP 패턴 완전 구현 (백업본과 동일한 services Dict 패턴)
     main_window_presenter = providers.Factory(
-        "upbit_auto_trading.presentation.presenters.main_window_presenter.MainWindowPresenter",
+        lazy_import("upbit_auto_trading.presentation.presenters.main_window_presenter.MainWindowPresenter"),
         services=providers.Dict(
             # Infrastructure Services - 직접 서비스 인스턴스 주입
             theme_service=external_container.provided.theme_service,
@@ -91,7 +92,7 @@ class PresentationContainer(containers.DeclarativeContainer):
             # UI Infrastructure - 실제 인스턴스 생성
             navigation_bar=navigation_service,
             database_health_service=providers.Factory(
-                "upbit_auto_trading.application.services.database_health_service.DatabaseHealthService"
+                lazy_import("upbit_auto_trading.application.services.database_health_service.DatabaseHealthService")
             ),
 
             # Application UI Services - 실제 인스턴스 주입
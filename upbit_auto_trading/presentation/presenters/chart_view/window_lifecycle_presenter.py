@@ -12,7 +12,11 @@ from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 from PyQt6.QtWidgets import QWidget
 
 from upbit_auto_trading.infrastructure.logging import create_component_logger
-from upbit_auto_trading.application.chart_viewer.chart_viewer_resource_manager import ChartViewerResourceManager
+from upbit_auto_trading.application.chart_viewer.chart_viewer_resource_manager import (
+    ChartDataBuffer,
+    ChartViewerResourceManager,
+    get_chart_viewer_resource_manager
+)
 from upbit_auto_trading.domain.events.chart_viewer_events import ChartViewerPriority
 
 
@@ -30,8 +34,9 @@ class WindowLifecyclePresenter(QObject):
     state_changed = pyqtSignal(str)  # 상태 변경 시그널
     resource_optimized = pyqtSignal(float)  # 리소스 최적화 시그널 (절약률)
 
-    def __init__(self, window: QWidget, parent: Optional[QObject] = None):
-        """창 생명주기 프레젠터 초기화"""
+    def __init__(self, window: QWidget, parent: Optional[QObject] = None,
+                 resource_manager: Optional[ChartViewerResourceManager] = None):
+        """창 생명주기 프레젠터 초기화 (resource_manager 생략 시 모든 창이 공유하는 메모리 예산 사용)"""
         super().__init__(parent)
 
         self._logger = create_component_logger("WindowLifecyclePresenter")
@@ -46,7 +51,7 @@ class WindowLifecyclePresenter(QObject):
         self._chart_id = f"chart_window_{id(window)}"
 
         # 리소스 관리자
-        self._resource_manager = ChartViewerResourceManager()
+        self._resource_manager = resource_manager or get_chart_viewer_resource_manager()
 
         # 초기 차트 등록
         self._resource_manager.register_chart(self._chart_id, "active")
@@ -311,6 +316,10 @@ class WindowLifecyclePresenter(QObject):
 
         return allocation_map.get(self._current_state, allocation_map["minimized"])
 
+    def attach_chart_data(self, name: str, data: ChartDataBuffer) -> None:
+        """창의 데이터 버퍼를 메모리 예산 관리 대상으로 등록"""
+        self._resource_manager.attach_data(self._chart_id, name, data)
+
     def cleanup(self) -> None:
         """리소스 정리"""
         self.stop_monitoring()
@@ -20,7 +20,9 @@ from dependency_injector.wiring import Provide, inject
 from upbit_auto_trading.ui.desktop.common.widgets.status_bar import StatusBar
 from upbit_auto_trading.ui.desktop.common.widgets.navigation_bar import NavigationBar
 
-# 화면 임포트 (임시로 더미 클래스 사용)
+# 화면 임포트 - 첫 화면(대시보드)만 즉시 로드
+# 나머지 화면은 ScreenManagerService.load_screen_lazy 에서 처음 열 때 import 합니다.
+# (차트/설정 등 화면 모듈이 pyqtgraph·웹소켓 등 무거운 의존성을 첫 paint 전에 끌어오지 않도록)
 
 
 def create_placeholder_screen(name):
@@ -40,71 +42,6 @@ except ImportError:
         return create_placeholder_screen("대시보드")
 
 
-try:
-    from upbit_auto_trading.ui.desktop.screens.chart_view.chart_view_screen import ChartViewScreen
-except ImportError:
-    def ChartViewScreen():
-        return create_placeholder_screen("차트 뷰")
-
-
-try:
-    from upbit_auto_trading.ui.desktop.screens.settings.settings_screen import SettingsScreen
-except ImportError:
-    def SettingsScreen():
-        return create_placeholder_screen("설정")
-
-
-try:
-    from upbit_auto_trading.ui.desktop.screens.notification_center.notification_center import NotificationCenter
-except ImportError:
-    def NotificationCenter():
-        return create_placeholder_screen("알림 센터")
-
-
-try:
-    from upbit_auto_trading.ui.desktop.screens.asset_screener.asset_screener_screen import AssetScreenerScreen
-except ImportError:
-    def AssetScreenerScreen():
-        return create_placeholder_screen("종목 스크리닝")
-
-
-try:
-    from upbit_auto_trading.ui.desktop.screens.strategy_management.strategy_management_screen import StrategyManagementScreen
-except ImportError:
-    def StrategyManagementScreen():
-        return create_placeholder_screen("매매 전략 관리")
-
-
-try:
-    from upbit_auto_trading.ui.desktop.screens.backtesting.backtesting_screen import BacktestingScreen
-except ImportError:
-    def BacktestingScreen():
-        return create_placeholder_screen("백테스팅")
-
-
-try:
-    from upbit_auto_trading.ui.desktop.screens.live_trading.live_trading_screen import LiveTradingScreen
-except ImportError:
-    def LiveTradingScreen():
-        return create_placeholder_screen("실시간 거래")
-
-
-try:
-    from upbit_auto_trading.ui.desktop.screens.portfolio_configuration.portfolio_configuration_screen import (
-        PortfolioConfigurationScreen
-    )
-except ImportError:
-    def PortfolioConfigurationScreen():
-        return create_placeholder_screen("포트폴리오 구성")
-
-
-try:
-    from upbit_auto_trading.ui.desktop.screens.monitoring_alerts.monitoring_alerts_screen import MonitoringAlertsScreen
-except ImportError:
-    def MonitoringAlertsScreen():
-        return create_placeholder_screen("모니터링 & 알림")
-
-
 class MainWindow(QMainWindow):
     """
     메인 윈도우 클래스
@@ -326,8 +263,11 @@ class MainWindow(QMainWindow):
         """실제 WebSocket 초기화 수행 - LoopGuard 적용"""
         # LoopGuard로 이벤트 루프 안전성 확보
         from upbit_auto_trading.infrastructure.runtime.loop_guard import ensure_main_loop
+        from upbit_auto_trading.infrastructure.runtime.startup_profiler import get_startup_profiler
         ensure_main_loop(where="MainWindow._perform_websocket_initialization", component="MainWindow")
 
+        startup_profiler = get_startup_profiler()
+        startup_profiler.begin("websocket_connect")
         try:
             self._log_info("🚀 WebSocket v6 Application Service 초기화 시작 (LoopGuard 적용)")
 
@@ -364,8 +304,10 @@ class MainWindow(QMainWindow):
             self.websocket_service = websocket_service
 
             self._log_info("✅ WebSocket v6 Application Service 초기화 완료")
+            startup_profiler.end("websocket_connect")
 
         except Exception as e:
+            startup_profiler.end("websocket_connect", status="failed", detail=f"{e.__class__.__name__}: {e}")
             self._log_error(f"❌ WebSocket v6 초기화 실패: {e.__class__.__name__}: {e}")
             self._log_warning("⚠️ WebSocket 없이 계속 진행 (실시간 데이터 수신 불가)")
             # WebSocket은 선택적 기능이므로 실패해도 애플리케이션 계속 실행
@@ -5,11 +5,17 @@
 마켓 데이터 백본과 연동하여 실시간 차트 및 호가 데이터를 제공합니다.
 """
 
-from typing import Optional, Dict, Any
+import asyncio
+import functools
+from typing import Optional, Dict, Any, List
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSizePolicy
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 
 from upbit_auto_trading.infrastructure.logging import create_component_logger
+from upbit_auto_trading.infrastructure.database.database_manager import DatabaseConnectionProvider
+from upbit_auto_trading.infrastructure.market_data.candle.live_candle_aggregator import LiveCandleAggregator
+from upbit_auto_trading.infrastructure.repositories.sqlite_candle_repository import SqliteCandleRepository
+from upbit_auto_trading.infrastructure.runtime.app_kernel import AppKernel, get_kernel
 from upbit_auto_trading.ui.desktop.screens.chart_view.widgets.dynamic_splitter import DynamicSplitter
 from upbit_auto_trading.presentation.presenters.chart_view.window_lifecycle_presenter import WindowLifecyclePresenter
 from upbit_auto_trading.ui.desktop.screens.chart_view.widgets.coin_list_widget import CoinListWidget
@@ -51,6 +57,10 @@ class ChartViewScreen(QWidget):
         self._orderbook_panel: Optional[OrderbookWidget] = None
         self._candlestick_widget: Optional[FinplotCandlestickWidget] = None
 
+        # 실시간 체결 → 캔들 집계 (완결 봉을 캔들 테이블에 배치 저장)
+        self._live_candle_aggregator: Optional[LiveCandleAggregator] = None
+        self._kernel: Optional[AppKernel] = None
+
         # 프레젠터
         self._window_lifecycle_presenter: Optional[WindowLifecyclePresenter] = None
 
@@ -99,12 +109,68 @@ class ChartViewScreen(QWidget):
 
         self._splitter.setup_layout(panels)
 
+        # 실시간 체결 → 차트 마지막 캔들 갱신 (현재 심볼만 반영)
+        self._coin_list_panel.register_trade_listener(self._candlestick_widget.on_symbol_trade)
+        self._start_live_candle_aggregator()
+
         self._logger.info("🎯 3열 레이아웃(1:4:2) 설정 완료")
 
+    def _start_live_candle_aggregator(self) -> None:
+        """
+        실시간 체결 → 1분봉 집계 시작
+
+        코인 목록이 구독한 심볼의 체결 스트림으로 차트 히스토리 테이블을 채웁니다.
+        연결 끊김 구간은 집계기가 WebSocketManager 연결 상태로 감지해 REST 백필에 맡기고,
+        앱 종료 시 AppKernel 종료 훅에서 구독 해제 + 마감된 봉을 최종 저장합니다.
+        """
+        try:
+            repository = SqliteCandleRepository(DatabaseConnectionProvider().get_manager())
+            self._live_candle_aggregator = LiveCandleAggregator(repository, timeframes=('1m',))
+        except Exception as e:
+            self._logger.warning(f"⚠️ 실시간 캔들 집계 비활성화: {e}")
+            return
+
+        try:
+            self._kernel = get_kernel()
+            self._kernel.register_shutdown_hook("ChartViewScreen.live_candles", self.cleanup)
+            task_factory = functools.partial(self._kernel.create_task, component="ChartViewScreen")
+        except RuntimeError as e:
+            self._logger.warning(f"AppKernel 사용 불가: {e}. 실시간 캔들 flush 태스크 직접 생성")
+            task_factory = None
+
+        self._create_task(self._live_candle_aggregator.start(task_factory), "live_candle_start")
+        self._coin_list_panel.register_subscription_listener(self._on_live_symbols_changed)
+
+    def _on_live_symbols_changed(self, symbols: List[str]) -> None:
+        """코인 목록 구독 심볼 변경 → 실시간 캔들 집계 체결 구독 교체"""
+        if self._live_candle_aggregator is not None:
+            self._create_task(self._live_candle_aggregator.subscribe(symbols), "live_candle_subscribe")
+
+    def _create_task(self, coro, name: str) -> asyncio.Task:
+        """AppKernel TaskManager 로 태스크 생성 (커널이 없으면 asyncio 직접)"""
+        if self._kernel is not None:
+            return self._kernel.create_task(coro, name=name, component="ChartViewScreen")
+        return asyncio.create_task(coro, name=name)
+
+    async def cleanup(self) -> None:
+        """화면 정리 - 실시간 캔들 집계 구독 해제, flush 중지 및 마감된 봉 최종 저장"""
+        aggregator, self._live_candle_aggregator = self._live_candle_aggregator, None
+        if aggregator is None:
+            return
+        self._coin_list_panel.unregister_subscription_listener(self._on_live_symbols_changed)
+        if self._kernel is not None:
+            self._kernel.unregister_shutdown_hook("ChartViewScreen.live_candles")
+        await aggregator.stop()
+        self._logger.info("✅ 실시간 캔들 집계 정리 완료")
+
     def _setup_presenters(self) -> None:
         """프레젠터 초기화"""
         # 창 생명주기 프레젠터 초기화
         self._window_lifecycle_presenter = WindowLifecyclePresenter(self)
+        if self._candlestick_widget is not None:
+            self._window_lifecycle_presenter.attach_chart_data(
+                "candles", self._candlestick_widget.create_managed_buffer()
+            )
 
         # 시그널 연결
         self._window_lifecycle_presenter.state_changed.connect(self._on_window_state_changed)
@@ -131,6 +197,10 @@ class ChartViewScreen(QWidget):
         self._logger.info(f"💰 코인 선택: {symbol}")
         self.coin_selected.emit(symbol)
 
+        # 차트 심벌 업데이트 (저장 캔들 재적재)
+        if self._candlestick_widget:
+            self._candlestick_widget.set_symbol(symbol)
+
         # 호가창 심벌 업데이트 (고급 기능 포함)
         if hasattr(self._orderbook_panel, 'set_symbol'):
             self._orderbook_panel.set_symbol(symbol)
@@ -0,0 +1,333 @@
+"""
+코인 리스트 테이블 모델 - 증분 갱신 + 정렬 인덱스 유지
+
+티커 수신마다 전체 목록을 다시 정렬/생성하지 않습니다.
+- 티커 업데이트는 심볼별 최신값만 모아두었다가 화면 프레임 주기(16ms)마다 반영
+- 가격/변화율/거래대금이 실제로 바뀐 행만 dataChanged
+- 정렬 키가 바뀐 행만 bisect로 새 위치를 찾아 beginMoveRows (나머지 행은 그대로)
+- 검색 필터는 CoinFilterProxyModel이 담당 (즐겨찾기는 항상 표시)
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt, QTimer
+from PyQt6.QtGui import QColor, QFont
+
+from upbit_auto_trading.application.chart_viewer.coin_list_service import CoinInfo
+
+RISE_COLOR = QColor(185, 28, 28)  # 진한 빨강
+FALL_COLOR = QColor(29, 78, 216)  # 진한 파랑
+ALIGN_RIGHT = int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+
+
+def format_volume_krw(volume_raw: float) -> str:
+    """24시간 거래대금 억/백만 단위 표시"""
+    if not volume_raw:
+        return ""
+    volume_billions = float(volume_raw) / 100_000_000
+    if volume_billions >= 1:
+        return f"{volume_billions:.1f}억"
+    return f"{float(volume_raw) / 1_000_000:.0f}백만"
+
+
+class CoinListTableModel(QAbstractTableModel):
+    """정렬 순서를 증분 유지하는 코인 리스트 모델"""
+
+    COL_FAVORITE = 0
+    COL_COIN = 1
+    COL_PRICE = 2
+    COL_CHANGE = 3
+    COL_VOLUME = 4
+    HEADERS = ["", "코인", "현재가", "변화율", "거래대금"]
+
+    SymbolRole = Qt.ItemDataRole.UserRole
+    FavoriteRole = Qt.ItemDataRole.UserRole + 1
+
+    SORT_MODES = ("name", "change", "volume")
+
+    def __init__(self, parent=None, frame_interval_ms: int = 16):
+        super().__init__(parent)
+        self._rows: List[CoinInfo] = []
+        self._keys: List[Tuple] = []  # _rows와 같은 순서의 정렬 키 (bisect용)
+        self._row_of: Dict[str, int] = {}
+        self._favorites: Set[str] = set()
+        self._sort_mode = "name"
+
+        self._pending: Dict[str, CoinInfo] = {}
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+
+        self.stats = {'updates_received': 0, 'rows_changed': 0, 'rows_moved': 0, 'flushes': 0}
+
+        # 프레임 주기 반영 타이머 (대기 중인 업데이트가 있을 때만 동작)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(frame_interval_ms)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self.flush_pending)
+
+    # ==================== Qt 모델 인터페이스 ====================
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        coin = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.COL_FAVORITE:
+                return "⭐" if coin.symbol in self._favorites else "☆"
+            if column == self.COL_COIN:
+                return f"{coin.symbol} - {coin.name}"
+            if column == self.COL_PRICE:
+                return coin.price_formatted
+            if column == self.COL_CHANGE:
+                return coin.change_rate
+            if column == self.COL_VOLUME:
+                return format_volume_krw(coin.volume_raw)
+            return None
+        if role == Qt.ItemDataRole.ForegroundRole and column >= self.COL_PRICE:
+            if coin.change_rate.startswith('+'):
+                return RISE_COLOR
+            if coin.change_rate.startswith('-'):
+                return FALL_COLOR
+            return None
+        if role == Qt.ItemDataRole.TextAlignmentRole and column >= self.COL_PRICE:
+            return ALIGN_RIGHT
+        if role == Qt.ItemDataRole.FontRole:
+            return self._bold_font
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"더블클릭하여 {coin.symbol} 즐겨찾기 토글"
+        if role == self.SymbolRole:
+            return coin.symbol
+        if role == self.FavoriteRole:
+            return coin.symbol in self._favorites
+        return None
+
+    # ==================== 정렬 키 ====================
+
+    def _sort_key(self, coin: CoinInfo) -> Tuple:
+        """즐겨찾기 우선 + 정렬 모드 기준 (동률은 심볼로 고정해 위치 결정을 안정화)"""
+        favorite_rank = 0 if coin.symbol in self._favorites else 1
+        if self._sort_mode == "change":
+            return (favorite_rank, -coin.change_rate_raw, coin.symbol)
+        if self._sort_mode == "volume":
+            return (favorite_rank, -coin.volume_raw, coin.symbol)
+        return (favorite_rank, coin.name, coin.symbol)
+
+    def _rebuild_order(self) -> None:
+        """전체 정렬 (목록 교체/정렬 모드·즐겨찾기 변경 시에만)"""
+        ordered = sorted(((self._sort_key(coin), coin) for coin in self._rows), key=lambda item: item[0])
+        self._keys = [key for key, _ in ordered]
+        self._rows = [coin for _, coin in ordered]
+        self._row_of = {coin.symbol: row for row, coin in enumerate(self._rows)}
+
+    # ==================== 전체 교체 ====================
+
+    def set_coins(self, coins: Iterable[CoinInfo]) -> None:
+        """코인 목록 전체 교체 (마켓 변경/초기 로드)"""
+        self.beginResetModel()
+        self._pending.clear()
+        unique: Dict[str, CoinInfo] = {coin.symbol: coin for coin in coins}
+        self._rows = list(unique.values())
+        self._rebuild_order()
+        self.endResetModel()
+
+    def set_sort_mode(self, sort_mode: str) -> None:
+        if sort_mode not in self.SORT_MODES or sort_mode == self._sort_mode:
+            return
+        self._sort_mode = sort_mode
+        self._relayout()
+
+    def set_favorites(self, favorites: Iterable[str]) -> None:
+        self._favorites = set(favorites)
+        self._relayout()
+
+    def set_favorite(self, symbol: str, is_favorite: bool) -> None:
+        """즐겨찾기 1개 변경 - 해당 행만 이동"""
+        if is_favorite == (symbol in self._favorites):
+            return
+        if is_favorite:
+            self._favorites.add(symbol)
+        else:
+            self._favorites.discard(symbol)
+
+        row = self._row_of.get(symbol)
+        if row is None:
+            return
+        row = self._reposition(row, self._sort_key(self._rows[row]))
+        self.dataChanged.emit(self.index(row, self.COL_FAVORITE), self.index(row, self.COL_FAVORITE))
+
+    def _relayout(self) -> None:
+        """정렬 기준 변경 - 선택 등 persistent index는 심볼 기준으로 유지"""
+        self.layoutAboutToBeChanged.emit()
+        symbol_by_old_row = [coin.symbol for coin in self._rows]
+        persistent = self.persistentIndexList()
+        self._rebuild_order()
+
+        new_indexes = []
+        for index in persistent:
+            row = self._row_of.get(symbol_by_old_row[index.row()])
+            new_indexes.append(self.index(row, index.column()) if row is not None else QModelIndex())
+        self.changePersistentIndexList(persistent, new_indexes)
+        self.layoutChanged.emit()
+
+    @property
+    def sort_mode(self) -> str:
+        return self._sort_mode
+
+    # ==================== 증분 갱신 ====================
+
+    def enqueue_updates(self, coins: Iterable[CoinInfo]) -> None:
+        """티커 업데이트 적재 - 심볼별 최신값만 유지하고 다음 프레임에 반영"""
+        for coin in coins:
+            self._pending[coin.symbol] = coin
+            self.stats['updates_received'] += 1
+        if self._pending and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush_pending(self) -> None:
+        """대기 중인 업데이트 반영"""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        self.stats['flushes'] += 1
+
+        changed: Dict[str, Tuple[int, int]] = {}  # symbol -> (첫 컬럼, 마지막 컬럼)
+        for symbol, coin in pending.items():
+            row = self._row_of.get(symbol)
+            if row is None:
+                # 현재 목록(마켓)에 없는 심볼은 무시 - 목록 구성은 set_coins 담당
+                continue
+            old = self._rows[row]
+            if old == coin:
+                continue
+            columns = self._changed_columns(old, coin)
+            if columns is None:
+                continue
+
+            self._rows[row] = coin
+            new_key = self._sort_key(coin)
+            if new_key != self._keys[row]:
+                self._reposition(row, new_key)
+            # 이후 이동으로 행 번호가 밀릴 수 있으므로 심볼 기준으로 보관
+            changed[symbol] = columns
+            self.stats['rows_changed'] += 1
+
+        if not changed:
+            return
+        # 최종 위치 기준으로 dataChanged (인접 행은 묶어서 발행)
+        final_rows = sorted(self._row_of[symbol] for symbol in changed)
+        first_column = min(columns[0] for columns in changed.values())
+        last_column = max(columns[1] for columns in changed.values())
+        start = prev = final_rows[0]
+        for row in final_rows[1:] + [None]:
+            if row is not None and row == prev + 1:
+                prev = row
+                continue
+            self.dataChanged.emit(self.index(start, first_column), self.index(prev, last_column))
+            if row is not None:
+                start = prev = row
+
+    def _changed_columns(self, old: CoinInfo, new: CoinInfo) -> Optional[Tuple[int, int]]:
+        columns = []
+        if old.price_formatted != new.price_formatted:
+            columns.append(self.COL_PRICE)
+        if old.change_rate != new.change_rate:
+            columns.append(self.COL_CHANGE)
+        if format_volume_krw(old.volume_raw) != format_volume_krw(new.volume_raw):
+            columns.append(self.COL_VOLUME)
+        if old.name != new.name:
+            columns.append(self.COL_COIN)
+        if not columns:
+            # 표시값은 같지만 정렬 원본값(volume_raw 등)이 바뀐 경우에도 정렬은 유지해야 함
+            if (old.volume_raw, old.change_rate_raw) != (new.volume_raw, new.change_rate_raw):
+                return (self.COL_PRICE, self.COL_PRICE)
+            return None
+        return (min(columns), max(columns))
+
+    def _reposition(self, row: int, new_key: Tuple) -> int:
+        """정렬 키가 바뀐 행 하나만 새 위치로 이동 (행 번호 반환)"""
+        keys = self._keys
+        # 현재 위치에서도 정렬이 유지되면 이동 불필요
+        if (row == 0 or keys[row - 1] <= new_key) and (row == len(keys) - 1 or new_key <= keys[row + 1]):
+            keys[row] = new_key
+            return row
+
+        # 자기 자신(이전 키)을 제외한 목록 기준 삽입 위치
+        target = bisect_left(keys, new_key)
+        if target > row:
+            target -= 1
+        if target == row:
+            keys[row] = new_key
+            return row
+
+        # beginMoveRows의 목적지는 이동 전 좌표 기준 (아래로 이동 시 +1)
+        destination = target + 1 if target > row else target
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), destination)
+        coin = self._rows.pop(row)
+        del keys[row]
+        self._rows.insert(target, coin)
+        keys.insert(target, new_key)
+        low, high = (row, target) if row < target else (target, row)
+        for shifted in range(low, high + 1):
+            self._row_of[self._rows[shifted].symbol] = shifted
+        self.endMoveRows()
+
+        self.stats['rows_moved'] += 1
+        return target
+
+    # ==================== 조회 ====================
+
+    def symbol_at(self, row: int) -> Optional[str]:
+        return self._rows[row].symbol if 0 <= row < len(self._rows) else None
+
+    def coin_at(self, row: int) -> Optional[CoinInfo]:
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def row_of(self, symbol: str) -> Optional[int]:
+        return self._row_of.get(symbol)
+
+    def coins(self) -> List[CoinInfo]:
+        """현재 정렬 순서의 코인 목록"""
+        return list(self._rows)
+
+    def is_favorite(self, symbol: str) -> bool:
+        return symbol in self._favorites
+
+
+class CoinFilterProxyModel(QSortFilterProxyModel):
+    """검색 필터 프록시 - 심볼/이름 부분 일치, 즐겨찾기는 항상 표시"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._search_text = ""
+
+    def set_search_text(self, text: str) -> None:
+        text = text.strip().lower()
+        if text == self._search_text:
+            return
+        self._search_text = text
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if not self._search_text:
+            return True
+        model = self.sourceModel()
+        coin = model.coin_at(source_row)
+        if coin is None:
+            return False
+        if model.is_favorite(coin.symbol):
+            return True
+        return self._search_text in coin.symbol.lower() or self._search_text in coin.name.lower()
@@ -11,16 +11,18 @@ QAsync 아키텍처 변경사항:
 - 단일 QAsync 이벤트 루프에서 모든 비동기 작업 처리
 - Thread-5 격리 루프 문제 완전 해결
 - Infrastructure Layer와 완벽 호환성 확보
+
+표시: CoinListTableModel(증분 갱신/정렬 유지) + CoinFilterProxyModel(검색) + QTableView
+- 티커 변경분은 모델이 프레임 주기로 모아 변경된 행만 갱신
 """
 
-from typing import Optional, List, Set
+from typing import Callable, Optional, List, Set
 import asyncio
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QComboBox,
-    QLineEdit, QPushButton, QListWidget, QListWidgetItem, QRadioButton, QButtonGroup
+    QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QLineEdit, QPushButton,
+    QTableView, QHeaderView, QAbstractItemView, QRadioButton, QButtonGroup
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import pyqtSignal, QTimer, QModelIndex
 
 # QAsync 통합 imports
 try:
@@ -37,6 +39,9 @@ except ImportError:
 
 from upbit_auto_trading.infrastructure.logging import create_component_logger
 from upbit_auto_trading.application.chart_viewer.coin_list_service import CoinListService, CoinInfo
+from upbit_auto_trading.ui.desktop.screens.chart_view.widgets.coin_list_model import (
+    CoinListTableModel, CoinFilterProxyModel
+)
 
 # AppKernel 통합
 try:
@@ -97,10 +102,13 @@ class CoinListWidget(QWidget):
         self._sort_change_radio: Optional[QRadioButton] = None
         self._sort_volume_radio: Optional[QRadioButton] = None
         self._sort_button_group: Optional[QButtonGroup] = None
-        self._list_widget: Optional[QListWidget] = None
+        self._list_widget: Optional[QTableView] = None
+        self._coin_model: Optional[CoinListTableModel] = None
+        self._proxy_model: Optional[CoinFilterProxyModel] = None
 
-        # 서비스
+        # 서비스 (티커 변경분은 모델로 바로 전달)
         self._coin_service = CoinListService()
+        self._coin_service.register_change_callback(self._on_coins_changed)
 
         # 즉시 초기화
         self._ensure_initialization()
@@ -166,19 +174,37 @@ class CoinListWidget(QWidget):
         self._sort_button_group.addButton(self._sort_change_radio, 1)
         self._sort_button_group.addButton(self._sort_volume_radio, 2)
 
-        # 리스트 위젯 - 가장 중요!
-        self._list_widget = QListWidget()
-        # HTML 리치 텍스트 지원 활성화
-        from PyQt6.QtCore import Qt
-        self._list_widget.setTextElideMode(Qt.TextElideMode.ElideNone)
-
-        # 컨텍스트 메뉴 설정 제거 (별표 클릭으로 대체)
-        # self._list_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        # self._list_widget.customContextMenuRequested.connect(self._show_context_menu)        # 생성 즉시 검증 - None 체크로 수정
+        # 코인 모델 + 검색 프록시
+        self._coin_model = CoinListTableModel(self)
+        self._proxy_model = CoinFilterProxyModel(self)
+        self._proxy_model.setSourceModel(self._coin_model)
+
+        # 코인 테이블 - 가장 중요! (고정 행 높이, 보이는 행만 렌더링)
+        self._list_widget = QTableView()
+        self._list_widget.setModel(self._proxy_model)
+        self._list_widget.setShowGrid(False)
+        self._list_widget.setWordWrap(False)
+        self._list_widget.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self._list_widget.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self._list_widget.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._list_widget.verticalHeader().hide()
+        self._list_widget.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self._list_widget.verticalHeader().setDefaultSectionSize(22)
+        # ResizeToContents는 dataChanged마다 전체 행을 다시 측정하므로 고정 폭 사용
+        header = self._list_widget.horizontalHeader()
+        header.setMinimumSectionSize(24)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(CoinListTableModel.COL_COIN, QHeaderView.ResizeMode.Stretch)
+        header.resizeSection(CoinListTableModel.COL_FAVORITE, 28)
+        header.resizeSection(CoinListTableModel.COL_PRICE, 100)
+        header.resizeSection(CoinListTableModel.COL_CHANGE, 70)
+        header.resizeSection(CoinListTableModel.COL_VOLUME, 70)
+
+        # 생성 즉시 검증 - None 체크로 수정
         if self._list_widget is None:
             raise RuntimeError("리스트 위젯 생성 실패")
 
-        self._logger.debug(f"✅ 리스트 위젯 생성 완료: {id(self._list_widget)}")
+        self._logger.debug(f"✅ 코인 테이블 생성 완료: {id(self._list_widget)}")
 
     def _setup_layout(self) -> None:
         """레이아웃 설정"""
@@ -227,14 +253,14 @@ class CoinListWidget(QWidget):
             self._sort_button_group.buttonClicked.connect(self._on_sort_changed)
 
         if self._list_widget is not None:
-            self._list_widget.itemClicked.connect(self._on_item_clicked)
+            self._list_widget.clicked.connect(self._on_item_clicked)
             # 더블클릭으로 즐겨찾기 토글
-            self._list_widget.itemDoubleClicked.connect(self._on_item_double_clicked)
+            self._list_widget.doubleClicked.connect(self._on_item_double_clicked)
 
         self._logger.debug("✅ 시그널 연결 완료")
 
     @property
-    def coin_list(self) -> QListWidget:
+    def coin_list(self) -> QTableView:
         """안전한 리스트 위젯 접근"""
         if self._list_widget is None:
             self._logger.warning("⚠️ 리스트 위젯이 None임. 재초기화 시도...")
@@ -356,109 +382,20 @@ class CoinListWidget(QWidget):
             self._logger.error(f"스택 트레이스: {traceback.format_exc()}")
 
     def _update_ui(self) -> None:
-        """UI 업데이트"""
+        """UI 업데이트 - 코인 목록 전체 교체 (로드/마켓 변경 시에만 호출)"""
         try:
             # 안전한 리스트 위젯 접근
-            list_widget = self.coin_list
-            list_widget.clear()
-
-            # 필터링된 데이터 가져오기
-            filtered_data = self._filter_coins()
-
-            # 아이템 추가 - 개선된 형식: 거래량 + 볼드 + 변화율 색상
-            for coin in filtered_data:
-                # 즐겨찾기 상태에 따른 별표 표시
-                star_icon = "⭐" if coin.symbol in self._favorites else "☆"
-
-                # 기본 정보: 심볼과 이름
-                base_text = f"{star_icon} {coin.symbol} - {coin.name}"
-
-                # 가격 정보 추가
-                if coin.price_formatted:
-                    base_text += f" | {coin.price_formatted}"
-
-                # 변화율 정보 추가 (음수 포함)
-                if coin.change_rate:
-                    base_text += f" | ({coin.change_rate})"
-
-                # 거래량 정보 추가 (volume_raw를 사용)
-                if hasattr(coin, 'volume_raw') and coin.volume_raw:
-                    # 거래량을 억 단위로 표시 (24시간 거래량)
-                    volume_billions = float(coin.volume_raw) / 100_000_000
-                    if volume_billions >= 1:
-                        base_text += f" | {volume_billions:.1f}억"
-                    else:
-                        volume_millions = float(coin.volume_raw) / 1_000_000
-                        base_text += f" | {volume_millions:.0f}백만"
-
-                item = QListWidgetItem(base_text)
-                item.setData(Qt.ItemDataRole.UserRole, coin.symbol)
-
-                # 폰트 설정 (볼드)
-                font = QFont()
-                font.setBold(True)
-                item.setFont(font)
-
-                # 변화율에 따른 색상 적용 (음수 포함)
-                if coin.change_rate:
-                    if coin.change_rate.startswith('+'):
-                        # 상승: 빨간색 (약간 어둡게 하여 읽기 좋게)
-                        item.setForeground(QColor(185, 28, 28))  # 진한 빨강
-                    elif coin.change_rate.startswith('-'):
-                        # 하락: 파란색 (약간 어둡게 하여 읽기 좋게)
-                        item.setForeground(QColor(29, 78, 216))  # 진한 파랑
-
-                # 즐겨찾기 상태를 아이템에 저장
-                item.setData(Qt.ItemDataRole.UserRole + 1, coin.symbol in self._favorites)
-
-                # 툴팁 추가
-                item.setToolTip(f"더블클릭하여 {coin.symbol} 즐겨찾기 토글")
-
-                list_widget.addItem(item)
-
-            self._logger.info(f"✅ UI 업데이트 완료: {len(filtered_data)}개 아이템")
+            self.coin_list
+            self._coin_model.set_coins(self._coin_data)
+            self._logger.info(f"✅ UI 업데이트 완료: {self._proxy_model.rowCount()}개 아이템")
 
         except Exception as e:
             self._logger.error(f"❌ UI 업데이트 실패: {e}")
 
-    def _filter_coins(self) -> List[CoinInfo]:
-        """코인 필터링 - 즐겨찾기는 항상 상단, 검색 필터에서 제외"""
-        # 디버그 로그
-        self._logger.debug(f"🔍 필터링 시작 - 전체 코인: {len(self._coin_data)}개")
-        self._logger.debug(f"🔍 즐겨찾기 목록: {self._favorites}")
-        self._logger.debug(f"🔍 검색 필터: '{self._search_filter}'")
-
-        # 즐겨찾기와 일반 코인 분리
-        favorite_coins = []
-        regular_coins = []
-
-        for coin in self._coin_data:
-            if coin.symbol in self._favorites:
-                favorite_coins.append(coin)
-            else:
-                regular_coins.append(coin)
-
-        # 검색 필터는 일반 코인에만 적용 (즐겨찾기는 항상 표시)
-        if self._search_filter:
-            search_lower = self._search_filter.lower()
-            filtered_regular_coins = [
-                coin for coin in regular_coins
-                if (search_lower in coin.symbol.lower()
-                    or search_lower in coin.name.lower())
-            ]
-            self._logger.debug(f"🔍 검색 필터 적용: {len(regular_coins)}개 → {len(filtered_regular_coins)}개 (일반 코인)")
-        else:
-            filtered_regular_coins = regular_coins
-
-        # 최종 결과를 정렬 모드에 따라 정렬
-        all_filtered_coins = favorite_coins + filtered_regular_coins
-        sorted_coins = self._sort_coin_data(all_filtered_coins)
-
-        self._logger.debug(
-            f"🔍 최종 결과: 즐겨찾기 {len(favorite_coins)}개 + 일반 {len(filtered_regular_coins)}개 "
-            f"= 총 {len(sorted_coins)}개 (정렬: {self._sort_mode})"
-        )
-        return sorted_coins
+    def _on_coins_changed(self, coins: List[CoinInfo]) -> None:
+        """서비스 티커 변경분 수신 - 모델이 프레임 주기로 모아 변경 행만 갱신"""
+        if self._coin_model is not None:
+            self._coin_model.enqueue_updates(coins)
 
     def _on_market_changed(self, market: str) -> None:
         """마켓 변경 처리"""
@@ -471,14 +408,14 @@ class CoinListWidget(QWidget):
     def _on_search_changed(self, text: str) -> None:
         """검색 텍스트 변경 처리"""
         self._search_filter = text
-        self._update_ui()
+        self._proxy_model.set_search_text(text)
 
     def _clear_search(self) -> None:
         """검색 초기화"""
         if self._search_input is not None:
             self._search_input.clear()
         self._search_filter = ""
-        self._update_ui()
+        self._proxy_model.set_search_text("")
 
     def _on_refresh_clicked(self) -> None:
         """새로고침 버튼 클릭 처리 (동기 슬롯)"""
@@ -550,60 +487,20 @@ class CoinListWidget(QWidget):
             elif button == self._sort_volume_radio:
                 self._sort_mode = "volume"
 
-            self._update_ui()
+            self._coin_model.set_sort_mode(self._sort_mode)
         except Exception as e:
             self._logger.error(f"정렬 변경 처리 중 오류: {e}")
 
-    def _sort_coin_data(self, coin_data: List[CoinInfo]) -> List[CoinInfo]:
-        """코인 데이터를 현재 정렬 모드에 따라 정렬"""
-        try:
-            # 즐겨찾기는 항상 최상단에 유지
-            favorites = [coin for coin in coin_data if coin.symbol in self._favorites]
-            non_favorites = [coin for coin in coin_data if coin.symbol not in self._favorites]
-
-            # 정렬 모드에 따른 정렬
-            if self._sort_mode == "name":
-                favorites.sort(key=lambda x: x.name)
-                non_favorites.sort(key=lambda x: x.name)
-            elif self._sort_mode == "change":
-                # 변화율 정렬 (높은 순) - change_rate_raw 필드 사용
-                def change_sort_key(coin):
-                    try:
-                        if hasattr(coin, 'change_rate_raw'):
-                            return coin.change_rate_raw
-                        else:
-                            # 기존 로직 (호환성)
-                            if coin.change_rate:
-                                rate_str = coin.change_rate.replace('%', '').replace('+', '')
-                                return float(rate_str)
-                            return 0.0
-                    except (ValueError, AttributeError):
-                        return 0.0
-
-                favorites.sort(key=change_sort_key, reverse=True)
-                non_favorites.sort(key=change_sort_key, reverse=True)
-            elif self._sort_mode == "volume":
-                # 거래량 정렬 (높은 순)
-                favorites.sort(key=lambda x: x.volume_raw, reverse=True)
-                non_favorites.sort(key=lambda x: x.volume_raw, reverse=True)
-
-            # 즐겨찾기 + 일반 순서로 결합
-            return favorites + non_favorites
-
-        except Exception as e:
-            self._logger.error(f"코인 데이터 정렬 중 오류: {e}")
-            return coin_data
-
-    def _on_item_clicked(self, item: QListWidgetItem) -> None:
+    def _on_item_clicked(self, index: QModelIndex) -> None:
         """아이템 클릭 처리 - 코인 선택"""
-        symbol = item.data(Qt.ItemDataRole.UserRole)
+        symbol = index.data(CoinListTableModel.SymbolRole)
         if symbol:
             self.coin_selected.emit(symbol)
             self._logger.info(f"💰 코인 선택: {symbol}")
 
-    def _on_item_double_clicked(self, item: QListWidgetItem) -> None:
+    def _on_item_double_clicked(self, index: QModelIndex) -> None:
         """아이템 더블클릭 처리 - 즐겨찾기 토글"""
-        symbol = item.data(Qt.ItemDataRole.UserRole)
+        symbol = index.data(CoinListTableModel.SymbolRole)
         if symbol:
             self.toggle_favorite(symbol)
             self._logger.info(f"🌟 더블클릭으로 즐겨찾기 토글: {symbol}")
@@ -622,8 +519,10 @@ class CoinListWidget(QWidget):
         # 시그널 발송
         self.favorite_toggled.emit(symbol, is_favorite)
 
-        # UI 업데이트
-        self._update_ui()
+        # UI 업데이트 (해당 행만 이동, 검색 중이면 필터 재평가)
+        self._coin_model.set_favorite(symbol, is_favorite)
+        if self._search_filter:
+            self._proxy_model.invalidateFilter()
 
         # 즐겨찾기 상태 저장 (향후 DB 연동)
         self._save_favorites()
@@ -638,6 +537,8 @@ class CoinListWidget(QWidget):
         # TODO: DB에서 즐겨찾기 상태 로드 구현
         # 임시로 샘플 즐겨찾기 추가
         self._favorites = {"KRW-BTC", "KRW-ETH"}
+        if self._coin_model is not None:
+            self._coin_model.set_favorites(self._favorites)
         self._logger.debug(f"📖 즐겨찾기 로드: {len(self._favorites)}개")
 
     # 외부 API 메서드들
@@ -652,13 +553,29 @@ class CoinListWidget(QWidget):
     def get_selected_symbol(self) -> Optional[str]:
         """선택된 심볼 반환"""
         try:
-            current_item = self.coin_list.currentItem()
-            if current_item:
-                return current_item.data(Qt.ItemDataRole.UserRole)
+            current_index = self.coin_list.currentIndex()
+            if current_index.isValid():
+                return current_index.data(CoinListTableModel.SymbolRole)
         except Exception:
             pass
         return None
 
+    def register_trade_listener(self, callback: Callable[[str, float, float, int], None]) -> None:
+        """실시간 체결 리스너 등록 (symbol, trade_price, trade_volume, trade_timestamp_ms) - 차트 연동용"""
+        self._coin_service.register_trade_callback(callback)
+
+    def unregister_trade_listener(self, callback: Callable[[str, float, float, int], None]) -> None:
+        """실시간 체결 리스너 해제"""
+        self._coin_service.unregister_trade_callback(callback)
+
+    def register_subscription_listener(self, callback: Callable[[List[str]], None]) -> None:
+        """실시간 구독 심볼 리스너 등록 (구독이 바뀔 때마다 심볼 목록 전달) - 체결 기반 캔들 집계용"""
+        self._coin_service.register_subscription_callback(callback)
+
+    def unregister_subscription_listener(self, callback: Callable[[List[str]], None]) -> None:
+        """실시간 구독 심볼 리스너 해제"""
+        self._coin_service.unregister_subscription_callback(callback)
+
     async def cleanup(self) -> None:
         """위젯 정리 (종료 시 호출)"""
         try:
@@ -669,6 +586,9 @@ class CoinListWidget(QWidget):
             if self._refresh_task and not self._refresh_task.done():
                 self._refresh_task.cancel()
 
+            # 티커 변경 콜백 해제
+            self._coin_service.unregister_change_callback(self._on_coins_changed)
+
             # LoopGuard 해제
             if self._loop_guard:
                 self._loop_guard.unregister_component("CoinListWidget")
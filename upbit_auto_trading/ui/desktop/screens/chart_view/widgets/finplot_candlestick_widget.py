@@ -1,47 +1,76 @@
 """
-Finplot 기반 캔들스틱 차트 위젯 - Presentation Layer
+Finplot 스타일 캔들스틱 차트 위젯 - Presentation Layer
 
 DDD 아키텍처 적용:
 - Domain: 차트 상태 관리 (ChartStateService)
 - Application: 데이터 조작 (ChartDataApplicationService)
-- Infrastructure: Finplot 렌더링 (FinplotCandlestickRenderer)
+- Infrastructure: 저장 캔들 배열 로더 + LOD 버퍼/아이템 (CandleLodBuffer, LodCandlestickItem)
 - Presentation: UI 컨트롤 및 이벤트 처리
 
-Phase 3.1 완전 구현: PyQtGraph → Finplot 마이그레이션
+스트리밍 구조:
+- 히스토리는 작업 스레드에서 candles_{symbol}_{timeframe} 테이블을 열 배열로 읽고 LOD 피라미드까지 만든 뒤
+  시그널로 UI 스레드에 넘겨 버퍼 내용만 교체 (심볼/타임프레임 전환 중에도 UI 스레드는 막히지 않음)
+- 실시간 체결/캔들은 마지막 캔들만 갱신하거나 새 캔들을 추가 (전체 DataFrame 재전달 없음)
+- 화면에는 보이는 구간을 약 1픽셀당 1봉으로 다운샘플하여 그리고, 줌/팬 시 해당 레벨로 다시 자름
+- 갱신은 프레임 타이머(16ms)로 모아 한 번만 다시 그림 → 재그리기 비용은 보유 캔들 수와 무관
+- MA20/MA50 오버레이는 보이는 구간만 버퍼 종가에서 계산 (실시간 갱신·축출과 자동으로 일치)
+
+finplot 은 PyQtGraph 위에서 DataFrame 전체를 다시 받아 그리는 구조라 실시간 갱신에 쓰지 않고,
+같은 PyQtGraph 위에 LOD 아이템을 직접 올립니다.
 """
 
-from typing import Optional, List, Dict, Any
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List
+
+import numpy as np
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
-
-try:
-    import finplot as fplt
-    FINPLOT_AVAILABLE = True
-except ImportError:
-    FINPLOT_AVAILABLE = False
-    fplt = None
 
 from upbit_auto_trading.infrastructure.logging import create_component_logger
 from upbit_auto_trading.infrastructure.chart_viewer.db_integration_layer import CandleData
-from upbit_auto_trading.domain.services.chart_state_service import ChartStateService, ChartViewState
+from upbit_auto_trading.infrastructure.chart_viewer.candle_array_loader import CandleArrays, load_candle_arrays
+from upbit_auto_trading.infrastructure.chart_viewer.chart_memory_buffers import ManagedCandleBuffer
+from upbit_auto_trading.infrastructure.chart.candle_lod_buffer import CandleLodBuffer
+from upbit_auto_trading.infrastructure.chart.lod_candlestick_item import (
+    PYQTGRAPH_AVAILABLE, LodCandlestickItem, LodVolumeItem, LodMovingAverageItem, CandleTimeAxisItem
+)
+from upbit_auto_trading.infrastructure.database.database_manager import DatabaseConnectionProvider
+from upbit_auto_trading.infrastructure.market_data.candle.time_utils import TimeUtils
+from upbit_auto_trading.domain.services.chart_state_service import ChartStateService
 from upbit_auto_trading.application.services.chart_data_service import ChartDataApplicationService
-from upbit_auto_trading.infrastructure.chart.finplot_renderer import FinplotCandlestickRenderer
+
+if PYQTGRAPH_AVAILABLE:
+    import pyqtgraph as pg
+
+HISTORY_CAPACITY = 500_000   # 보유 캔들 상한 (1분봉 약 1년)
+INITIAL_VISIBLE_BARS = 200   # 초기/줌 리셋 시 표시 캔들 수
+FRAME_INTERVAL_MS = 16       # 실시간 갱신 합침 주기
+MOVING_AVERAGES = ((20, '#ff9800'), (50, '#7b1fa2'))  # (기간, 색상)
+
+
+@dataclass
+class _HistoryResult:
+    """작업 스레드 히스토리 적재 결과 (피라미드까지 완성된 버퍼)"""
+    generation: int
+    symbol: str
+    timeframe: str
+    source: str = "none"
+    buffer: Optional[CandleLodBuffer] = None
+    error: Optional[str] = None
 
 
 class FinplotCandlestickWidget(QWidget):
     """
-    Finplot 기반 캔들스틱 차트 위젯 - Phase 3.1 구현
+    캔들스틱 차트 위젯 - 실시간 스트리밍 + LOD 다운샘플
 
     핵심 특징:
-    - 금융 차트 전문 라이브러리 Finplot 활용
-    - 명시적 업데이트 제어 (gfx=False → update_gfx())
-    - 실시간 60fps 성능 최적화
-    - DDD 아키텍처 완전 준수
+    - 저장 캔들 10만 건 이상 적재 (고정 용량 NumPy 버퍼)
+    - 실시간 갱신은 마지막 캔들 패치/추가만 수행, 프레임당 1회 다시 그리기
+    - 축소 시 약 1픽셀당 1봉으로 다운샘플 (줌/팬 시 레벨 재선택)
 
-    Performance Target: 60fps 실시간 업데이트, 200+ 캔들 처리
+    Performance Target: 60fps 실시간 업데이트, 보유 캔들 수와 무관한 재그리기 비용
     """
 
     # 시그널 정의
@@ -49,8 +78,9 @@ class FinplotCandlestickWidget(QWidget):
     zoom_changed = pyqtSignal(float, float)
     data_requested = pyqtSignal(str, str, int)
     chart_ready = pyqtSignal()
+    _history_ready = pyqtSignal(object)  # 작업 스레드 → UI 스레드 (_HistoryResult)
 
-    def __init__(self, parent: Optional[QWidget] = None):
+    def __init__(self, parent: Optional[QWidget] = None, capacity: int = HISTORY_CAPACITY):
         """위젯 초기화"""
         super().__init__(parent)
 
@@ -60,14 +90,30 @@ class FinplotCandlestickWidget(QWidget):
         self._chart_state_service = ChartStateService()
         self._chart_data_service = ChartDataApplicationService(self._chart_state_service)
 
-        # Infrastructure 계층
-        self._renderer = FinplotCandlestickRenderer()
+        # 데이터 버퍼 (히스토리 + 실시간)
+        self._buffer = CandleLodBuffer(capacity)
+        self._symbol = "KRW-BTC"
+        self._timeframe = "1m"
+        self._data_source = "none"
+
+        # 히스토리 적재 요청 세대 (마지막 요청 결과만 반영, 적재 중에는 실시간 반영 보류)
+        self._history_generation = 0
+        self._history_pending = False
+        self._chart_ready_emitted = False
+        self._history_ready.connect(self._apply_history)
 
-        # Finplot 구성요소
-        self._ax: Optional[Any] = None
-        self._plot_candles: Optional[Any] = None
-        self._plot_volume: Optional[Any] = None
+        # 실시간 체결 → 캔들 구간 캐시 [시작, 다음 시작) (epoch ms)
+        self._bucket_start_ms: Optional[int] = None
+        self._bucket_end_ms: Optional[int] = None
+
+        # PyQtGraph 구성요소
         self._chart_widget: Optional[QWidget] = None
+        self._price_plot: Optional[Any] = None
+        self._volume_plot: Optional[Any] = None
+        self._candle_item: Optional[LodCandlestickItem] = None
+        self._volume_item: Optional[LodVolumeItem] = None
+        self._ma_items: List[LodMovingAverageItem] = []
+        self._time_axis: Optional[CandleTimeAxisItem] = None
 
         # UI 컨트롤
         self._timeframe_combo: Optional[QComboBox] = None
@@ -78,35 +124,36 @@ class FinplotCandlestickWidget(QWidget):
         self._performance_timer = QTimer()
         self._performance_timer.timeout.connect(self._update_performance_display)
         self._update_count = 0
+        self._trade_count = 0
         self._last_fps_time = datetime.now()
 
-        # 실시간 업데이트 타이머
-        self._realtime_timer = QTimer()
-        self._realtime_timer.timeout.connect(self._realtime_update)
-
-        # 데이터 저장
-        self._chart_df: Optional[pd.DataFrame] = None
+        # 실시간 갱신 프레임 타이머 (변경이 있을 때만 다시 그림)
+        self._dirty = False
+        self._appended = False
+        self._frame_timer = QTimer()
+        self._frame_timer.setInterval(FRAME_INTERVAL_MS)
+        self._frame_timer.timeout.connect(self._flush_frame)
 
         # UI 초기화
-        if FINPLOT_AVAILABLE:
+        if PYQTGRAPH_AVAILABLE:
             self._setup_chart_ui()
         else:
             self._setup_fallback_ui()
 
-        # 초기화 및 테스트 데이터
+        # 초기화
         self._initialize_chart()
 
-        self._logger.info("✅ Finplot 캔들스틱 차트 위젯 초기화 완료")
+        self._logger.info("✅ 캔들스틱 차트 위젯 초기화 완료 (LOD 스트리밍)")
 
     def _setup_fallback_ui(self) -> None:
-        """Finplot 불가용시 대체 UI"""
+        """PyQtGraph 불가용시 대체 UI"""
         layout = QVBoxLayout(self)
-        fallback_label = QLabel("⚠️ Finplot 필요\\npip install finplot")
+        fallback_label = QLabel("⚠️ PyQtGraph 필요\\npip install pyqtgraph")
         fallback_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         fallback_label.setStyleSheet("color: orange; font-size: 14pt; font-weight: bold;")
         layout.addWidget(fallback_label)
 
-        self._logger.warning("Finplot 불가용 - 대체 UI 표시")
+        self._logger.warning("PyQtGraph 불가용 - 대체 UI 표시")
 
     def _setup_chart_ui(self) -> None:
         """차트 UI 설정"""
@@ -118,11 +165,39 @@ class FinplotCandlestickWidget(QWidget):
         control_panel = self._create_control_panel()
         layout.addWidget(control_panel)
 
-        # Finplot 차트 생성 및 임베딩
-        self._ax = fplt.create_plot('업비트 실시간 차트', init_zoom_periods=200, maximize=False)
-
-        # PyQt6에 Finplot 위젯 임베딩
-        self._chart_widget = self._ax.vb.win
+        # 가격(위) + 거래량(아래) 플롯, x축 연동
+        graphics = pg.GraphicsLayoutWidget()
+        graphics.setBackground('w')
+
+        self._time_axis = CandleTimeAxisItem(self._buffer, orientation='bottom')
+        self._price_plot = graphics.addPlot(row=0, col=0, axisItems={'bottom': self._time_axis})
+        self._price_plot.showGrid(x=True, y=True, alpha=0.2)
+        self._price_plot.setMenuEnabled(False)
+        self._price_plot.getViewBox().setMouseEnabled(x=True, y=False)
+        self._price_plot.getViewBox().setAutoVisible(y=True)
+
+        self._volume_plot = graphics.addPlot(row=1, col=0)
+        self._volume_plot.setXLink(self._price_plot)
+        self._volume_plot.hideAxis('bottom')
+        self._volume_plot.setMenuEnabled(False)
+        self._volume_plot.getViewBox().setMouseEnabled(x=True, y=False)
+        self._volume_plot.getViewBox().setAutoVisible(y=True)
+        graphics.ci.layout.setRowStretchFactor(0, 4)
+        graphics.ci.layout.setRowStretchFactor(1, 1)
+
+        self._candle_item = LodCandlestickItem(self._buffer)
+        self._volume_item = LodVolumeItem(self._buffer)
+        self._price_plot.addItem(self._candle_item)
+        self._volume_plot.addItem(self._volume_item)
+        for period, color in MOVING_AVERAGES:
+            ma_item = LodMovingAverageItem(self._buffer, period, color)
+            self._ma_items.append(ma_item)
+            self._price_plot.addItem(ma_item)
+
+        self._price_plot.getViewBox().sigXRangeChanged.connect(self._on_x_range_changed)
+        graphics.scene().sigMouseClicked.connect(self._on_scene_clicked)
+
+        self._chart_widget = graphics
         layout.addWidget(self._chart_widget, 1)
 
         # 상태 표시
@@ -130,7 +205,7 @@ class FinplotCandlestickWidget(QWidget):
         self._status_label.setStyleSheet("padding: 5px; background-color: #e8f5e8; font-size: 12px;")
         layout.addWidget(self._status_label)
 
-        self._logger.debug("Finplot 차트 UI 설정 완료")
+        self._logger.debug("차트 UI 설정 완료")
 
     def _create_control_panel(self) -> QWidget:
         """컨트롤 패널 생성"""
@@ -152,7 +227,7 @@ class FinplotCandlestickWidget(QWidget):
 
         layout.addStretch()
 
-        # 자동 스크롤 버튼
+        # 자동 스크롤 버튼 (마지막 캔들 따라가기)
         self._auto_scroll_btn = QPushButton("🔄 실시간")
         self._auto_scroll_btn.setCheckable(True)
         self._auto_scroll_btn.setChecked(True)
@@ -184,130 +259,220 @@ class FinplotCandlestickWidget(QWidget):
 
     def _load_initial_data(self) -> None:
         """초기 데이터 로드"""
-        if not FINPLOT_AVAILABLE:
+        if not PYQTGRAPH_AVAILABLE:
             return
 
         try:
-            # Application 서비스를 통한 초기화
-            self._chart_state_service.initialize_state("KRW-BTC", "1m")
-
-            # 테스트 데이터 생성 (200개 캔들)
-            test_candles = self._chart_data_service._generate_test_data("KRW-BTC", "1m", 200)
-
-            # Finplot 데이터 형식으로 변환
-            self._convert_and_display_data(test_candles)
-
-            # 차트 준비 완료 시그널
-            self.chart_ready.emit()
-
-            # 실시간 업데이트 시작 (2초마다)
-            self._realtime_timer.start(2000)
-
-            self._update_status(f"✅ 초기 데이터 로드 완료: {len(test_candles)}개 캔들")
-            self._logger.info(f"초기 데이터 로드 완료: {len(test_candles)}개 캔들")
+            self._chart_state_service.initialize_state(self._symbol, self._timeframe)
+            self._request_history(self._symbol, self._timeframe)
+            self._frame_timer.start()
 
         except Exception as e:
             self._update_status(f"❌ 초기 데이터 로드 실패: {e}")
             self._logger.error(f"초기 데이터 로드 실패: {e}")
 
-    def _convert_and_display_data(self, candles: List[CandleData]) -> None:
-        """캔들 데이터를 Finplot 형식으로 변환하고 표시"""
-        # 데이터 변환
-        df_data = []
-        base_time = datetime.now()
-
-        for i, candle in enumerate(candles):
-            timestamp = base_time - timedelta(minutes=len(candles)-i)
-            df_data.append({
-                'time': timestamp,
-                'open': candle.open_price,
-                'close': candle.close_price,
-                'high': candle.high_price,
-                'low': candle.low_price,
-                'volume': candle.volume
-            })
-
-        self._chart_df = pd.DataFrame(df_data)
-        self._chart_df.set_index('time', inplace=True)
+    # ==================== 히스토리 적재 ====================
+
+    def _request_history(self, symbol: str, timeframe: str) -> None:
+        """히스토리 적재를 작업 스레드에 요청 (결과는 _history_ready 시그널로 UI 스레드에서 반영)"""
+        self._history_generation += 1
+        self._history_pending = True
+        self._update_status(f"⏳ {symbol} {timeframe} 캔들 불러오는 중...")
+        worker = threading.Thread(
+            target=self._history_worker,
+            args=(self._history_generation, symbol, timeframe, self._buffer.capacity),
+            daemon=True,
+            name="ChartHistoryLoader"
+        )
+        worker.start()
+
+    def _history_worker(self, generation: int, symbol: str, timeframe: str, capacity: int) -> None:
+        """작업 스레드: DB 읽기 + LOD 피라미드 구성 (위젯 상태는 건드리지 않음)"""
+        try:
+            result = self._build_history(generation, symbol, timeframe, capacity)
+        except Exception as e:
+            result = _HistoryResult(generation, symbol, timeframe, error=str(e))
+        try:
+            self._history_ready.emit(result)
+        except RuntimeError:
+            pass  # 적재 중 위젯이 삭제된 경우
+
+    def _build_history(self, generation: int, symbol: str, timeframe: str, capacity: int) -> _HistoryResult:
+        """저장 캔들(없으면 테스트 데이터)을 새 버퍼에 적재"""
+        arrays = self._read_stored_candles(symbol, timeframe, capacity)
+        source = "db"
+        if arrays is None:
+            arrays = self._generate_fallback_arrays(symbol, timeframe)
+            source = "test"
+        staged = CandleLodBuffer(capacity)
+        staged.load(arrays.time, arrays.open, arrays.high, arrays.low, arrays.close, arrays.volume)
+        return _HistoryResult(generation, symbol, timeframe, source, staged)
+
+    def _apply_history(self, result: _HistoryResult) -> None:
+        """UI 스레드: 마지막 요청의 결과만 버퍼에 O(1) 교체 후 최근 구간 표시"""
+        if result.generation != self._history_generation:
+            self._logger.debug(f"이전 히스토리 요청 결과 무시: {result.symbol} {result.timeframe}")
+            return
+        self._history_pending = False
 
-        # Finplot으로 차트 그리기
-        candle_data = self._chart_df[['open', 'close', 'high', 'low']]
-        volume_data = self._chart_df[['open', 'close', 'volume']]
+        if result.error is not None:
+            self._update_status(f"❌ 히스토리 적재 실패: {result.error}")
+            self._logger.error(f"히스토리 적재 실패: {result.symbol} {result.timeframe} - {result.error}")
+            return
 
-        # 메인 캔들스틱 차트
-        self._plot_candles = fplt.candlestick_ochl(candle_data, ax=self._ax)
+        self._data_source = result.source
+        self._buffer.take_over(result.buffer)
+        self._on_buffer_replaced()
+        self.data_requested.emit(result.symbol, result.timeframe, len(self._buffer))
 
-        # 볼륨 오버레이
-        self._plot_volume = fplt.volume_ocv(volume_data, ax=self._ax.overlay())
+        source_text = "저장 캔들" if self._data_source == "db" else "테스트 데이터 (저장 캔들 없음)"
+        self._update_status(f"✅ {result.symbol} {result.timeframe} {source_text}: {len(self._buffer):,}개 캔들")
+        self._logger.info(f"히스토리 적재 완료: {result.symbol} {result.timeframe} {len(self._buffer)}개 "
+                          f"({self._data_source})")
 
-        # 이동평균선 추가
-        ma20 = self._chart_df['close'].rolling(20).mean()
-        ma50 = self._chart_df['close'].rolling(50).mean()
+        if not self._chart_ready_emitted:
+            self._chart_ready_emitted = True
+            self.chart_ready.emit()
 
-        fplt.plot(ma20, color='#ff6b6b', legend='MA20', ax=self._ax)
-        fplt.plot(ma50, color='#4ecdc4', legend='MA50', ax=self._ax)
+    def _read_stored_candles(self, symbol: str, timeframe: str, limit: int) -> Optional[CandleArrays]:
+        try:
+            db_manager = DatabaseConnectionProvider().get_manager()
+            return load_candle_arrays(db_manager, symbol, timeframe, limit)
+        except Exception as e:
+            self._logger.debug(f"저장 캔들 조회 불가: {symbol} {timeframe} - {e}")
+            return None
+
+    def _generate_fallback_arrays(self, symbol: str, timeframe: str) -> CandleArrays:
+        """저장 캔들이 없을 때 테스트 캔들 200개를 현재 시각 기준으로 생성"""
+        candles = self._chart_data_service._generate_test_data(symbol, timeframe, 200)
+        step_ms = TimeUtils.get_timeframe_ms(timeframe)
+        now = datetime.now(timezone.utc)
+        now_bucket = int(TimeUtils.align_to_candle_boundary(now, timeframe).timestamp() * 1000)
+        times = now_bucket - step_ms * np.arange(len(candles) - 1, -1, -1, dtype=np.float64)
+        return CandleArrays(
+            time=times,
+            open=np.array([c.open_price for c in candles], dtype=np.float64),
+            high=np.array([c.high_price for c in candles], dtype=np.float64),
+            low=np.array([c.low_price for c in candles], dtype=np.float64),
+            close=np.array([c.close_price for c in candles], dtype=np.float64),
+            volume=np.array([c.volume for c in candles], dtype=np.float64),
+        )
+
+    def load_arrays(self, arrays: CandleArrays) -> None:
+        """열 배열 히스토리 적재 (기존 데이터 대체) 후 최근 구간으로 이동"""
+        self._history_generation += 1  # 진행 중인 작업 스레드 적재 결과는 무시
+        self._history_pending = False
+        self._buffer.load(arrays.time, arrays.open, arrays.high, arrays.low, arrays.close, arrays.volume)
+        self._on_buffer_replaced()
+
+    def _on_buffer_replaced(self) -> None:
+        """버퍼 내용 교체(적재·축소·해제) 후 아이템 갱신 및 최근 구간 이동"""
+        self._bucket_start_ms = self._bucket_end_ms = None
+        if self._candle_item is not None:
+            self._candle_item.refresh()
+            self._volume_item.refresh()
+            for ma_item in self._ma_items:
+                ma_item.refresh()
+            self._time_axis.set_buffer(self._buffer)
+        self._reset_zoom()
+
+    # ==================== 실시간 갱신 ====================
+
+    def _bucket_start(self, timestamp_ms: int) -> int:
+        """체결 시각이 속한 캔들 시작 시각 (epoch ms) - 같은 구간이면 캐시 사용"""
+        if self._bucket_start_ms is not None and self._bucket_start_ms <= timestamp_ms < self._bucket_end_ms:
+            return self._bucket_start_ms
+        trade_time = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
+        aligned = TimeUtils.align_to_candle_boundary(trade_time, self._timeframe)
+        following = TimeUtils.get_time_by_ticks(aligned, self._timeframe, 1)
+        self._bucket_start_ms = int(aligned.timestamp() * 1000)
+        self._bucket_end_ms = int(following.timestamp() * 1000)
+        return self._bucket_start_ms
+
+    def apply_trade(self, price: float, volume: float, timestamp_ms: int) -> None:
+        """체결/현재가 한 건 반영 - 마지막 캔들 패치 또는 새 캔들 시작 (그리기는 다음 프레임)"""
+        if self._history_pending or len(self._buffer) == 0:
+            return  # 적재 중인 버퍼는 이전 심볼/타임프레임 내용
+        if self._buffer.apply_trade(self._bucket_start(timestamp_ms), price, volume):
+            self._appended = True
+        self._trade_count += 1
+        self._dirty = True
+
+    def apply_candle(self, candle: CandleData) -> None:
+        """완성/진행 중 캔들 반영 (같은 시각이면 덮어쓰기, 이후 시각이면 추가)"""
+        if self._history_pending:
+            return
+        timestamp = candle.timestamp
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        if self._buffer.upsert(int(timestamp.timestamp() * 1000), candle.open_price, candle.high_price,
+                               candle.low_price, candle.close_price, candle.volume):
+            self._appended = True
+        self._dirty = True
+
+    def on_symbol_trade(self, symbol: str, price: float, volume: float, timestamp_ms: int) -> None:
+        """CoinListService 체결 콜백 형식 어댑터 - 현재 심볼만 반영"""
+        if symbol == self._symbol:
+            self.apply_trade(price, volume, timestamp_ms)
+
+    def _flush_frame(self) -> None:
+        """프레임 타이머: 변경이 있으면 한 번만 다시 그림"""
+        if not self._dirty or self._candle_item is None:
+            return
+        self._dirty = False
+
+        if self._appended:
+            self._appended = False
+            self._follow_last_candle()
+        self._candle_item.refresh()
+        self._volume_item.refresh()
+        for ma_item in self._ma_items:
+            ma_item.refresh()
+        self._update_count += 1
+
+        now = datetime.now()
+        elapsed = (now - self._last_fps_time).total_seconds()
+        if elapsed >= 1.0 and not self._performance_timer.isActive():
+            self._update_status(f"📈 실시간 업데이트 중... FPS: {self._update_count / elapsed:.1f} "
+                                f"| 체결 {self._trade_count / elapsed:.0f}/s | 캔들: {len(self._buffer):,}")
+            self._update_count = 0
+            self._trade_count = 0
+            self._last_fps_time = now
+
+    def _follow_last_candle(self) -> None:
+        """자동 스크롤: 직전 마지막 캔들이 오른쪽 끝에 보이던 경우에만 새 캔들만큼 이동"""
+        if not self._auto_scroll_btn or not self._auto_scroll_btn.isChecked():
+            return
+        (x_min, x_max), _ = self._price_plot.getViewBox().viewRange()
+        last_index = self._buffer.last_index
+        if last_index - 2 <= x_max < last_index + 0.5:
+            shift = last_index + 0.5 - x_max
+            self._price_plot.setXRange(x_min + shift, x_max + shift, padding=0)
 
-        # 차트 표시 (임베딩 모드)
-        fplt.show(qt_exec=False)
+    # ==================== 이벤트 처리 ====================
 
-        self._logger.debug(f"차트 데이터 변환 완료: {len(candles)}개 캔들")
+    def _on_x_range_changed(self, view_box, x_range) -> None:
+        self.zoom_changed.emit(float(x_range[0]), float(x_range[1]))
 
-    def _realtime_update(self) -> None:
-        """실시간 업데이트 시뮬레이션"""
-        if not self._auto_scroll_btn.isChecked() or self._chart_df is None:
+    def _on_scene_clicked(self, event) -> None:
+        if self._price_plot is None or not self._price_plot.sceneBoundingRect().contains(event.scenePos()):
             return
-
-        try:
-            # 마지막 캔들 가격 변동 시뮬레이션
-            last_idx = self._chart_df.index[-1]
-            current_close = self._chart_df.loc[last_idx, 'close']
-
-            # 랜덤 가격 변동 (±2%)
-            price_change = np.random.uniform(-0.02, 0.02)
-            new_close = current_close * (1 + price_change)
-
-            # 고가/저가 업데이트
-            self._chart_df.loc[last_idx, 'close'] = new_close
-            self._chart_df.loc[last_idx, 'high'] = max(self._chart_df.loc[last_idx, 'high'], new_close)
-            self._chart_df.loc[last_idx, 'low'] = min(self._chart_df.loc[last_idx, 'low'], new_close)
-
-            # Finplot 효율적 업데이트 (명시적 제어)
-            candle_data = self._chart_df[['open', 'close', 'high', 'low']]
-
-            # 데이터만 업데이트 (렌더링 지연)
-            if hasattr(self._plot_candles, 'update_data'):
-                self._plot_candles.update_data(candle_data, gfx=False)
-                # 일괄 렌더링
-                self._plot_candles.update_gfx()
-
-            self._update_count += 1
-
-            # FPS 계산
-            now = datetime.now()
-            if (now - self._last_fps_time).total_seconds() >= 1.0:
-                fps = self._update_count / (now - self._last_fps_time).total_seconds()
-                self._update_status(f"📈 실시간 업데이트 중... FPS: {fps:.1f}")
-                self._update_count = 0
-                self._last_fps_time = now
-
-        except Exception as e:
-            self._logger.error(f"실시간 업데이트 실패: {e}")
+        index = int(round(self._price_plot.getViewBox().mapSceneToView(event.scenePos()).x()))
+        if self._buffer.first_index <= index <= self._buffer.last_index:
+            time_ms, open_price, high_price, low_price, close_price, volume = self._buffer.bar(index)
+            self.candle_clicked.emit(index, {
+                'time': datetime.fromtimestamp(time_ms / 1000, tz=timezone.utc).isoformat(),
+                'open': open_price, 'high': high_price, 'low': low_price,
+                'close': close_price, 'volume': volume,
+            })
 
     def _on_timeframe_changed(self, timeframe: str) -> None:
         """타임프레임 변경 이벤트"""
         try:
             # Domain 서비스를 통한 상태 변경
             state = self._chart_state_service.change_timeframe(timeframe)
-
-            # 새 데이터 생성 (실제로는 API 호출)
-            test_candles = self._chart_data_service._generate_test_data(
-                state.symbol, timeframe, 200
-            )
-
-            # 차트 업데이트
-            self._convert_and_display_data(test_candles)
-
-            self._update_status(f"타임프레임 변경: {timeframe}")
+            self._timeframe = timeframe
+            self._request_history(state.symbol, timeframe)
             self._logger.info(f"타임프레임 변경: {timeframe}")
 
         except Exception as e:
@@ -315,74 +480,37 @@ class FinplotCandlestickWidget(QWidget):
             self._logger.error(f"타임프레임 변경 실패: {e}")
 
     def _on_auto_scroll_toggled(self, enabled: bool) -> None:
-        """실시간 업데이트 토글"""
+        """실시간 따라가기 토글"""
         try:
             if enabled:
-                self._realtime_timer.start(2000)
                 self._auto_scroll_btn.setText("⏸️ 실시간")
-                self._update_status("▶️ 실시간 업데이트 시작")
+                self._update_status("▶️ 마지막 캔들 따라가기 시작")
+                self._reset_zoom()
             else:
-                self._realtime_timer.stop()
                 self._auto_scroll_btn.setText("▶️ 실시간")
-                self._update_status("⏸️ 실시간 업데이트 중지")
+                self._update_status("⏸️ 마지막 캔들 따라가기 중지")
 
-            self._logger.debug(f"실시간 업데이트: {enabled}")
+            self._logger.debug(f"실시간 따라가기: {enabled}")
 
         except Exception as e:
             self._logger.error(f"실시간 토글 실패: {e}")
 
     def _on_refresh_clicked(self) -> None:
-        """새로고침 버튼 클릭"""
+        """새로고침 버튼 클릭 - 저장 캔들 다시 적재"""
         try:
-            # 새 테스트 데이터 생성
-            test_candles = self._chart_data_service._generate_test_data("KRW-BTC", "1m", 50)
-
-            # 기존 데이터에 추가
-            if self._chart_df is not None:
-                base_time = self._chart_df.index[-1] + timedelta(minutes=1)
-                new_data = []
-
-                for i, candle in enumerate(test_candles):
-                    timestamp = base_time + timedelta(minutes=i)
-                    new_data.append({
-                        'time': timestamp,
-                        'open': candle.open_price,
-                        'close': candle.close_price,
-                        'high': candle.high_price,
-                        'low': candle.low_price,
-                        'volume': candle.volume
-                    })
-
-                new_df = pd.DataFrame(new_data)
-                new_df.set_index('time', inplace=True)
-
-                # 데이터 병합
-                self._chart_df = pd.concat([self._chart_df, new_df])
-
-                # Finplot 효율적 업데이트
-                candle_data = self._chart_df[['open', 'close', 'high', 'low']]
-                volume_data = self._chart_df[['open', 'close', 'volume']]
-
-                if hasattr(self._plot_candles, 'update_data'):
-                    self._plot_candles.update_data(candle_data, gfx=False)
-                    self._plot_volume.update_data(volume_data, gfx=False)
-
-                    # 일괄 렌더링
-                    self._plot_candles.update_gfx()
-                    self._plot_volume.update_gfx()
-
-                self._update_status(f"🔄 데이터 추가: 총 {len(self._chart_df)}개 캔들")
-
+            self._request_history(self._symbol, self._timeframe)
         except Exception as e:
             self._update_status(f"❌ 새로고침 실패: {e}")
             self._logger.error(f"새로고침 실패: {e}")
 
     def _reset_zoom(self) -> None:
-        """줌 리셋"""
+        """줌 리셋 - 최근 INITIAL_VISIBLE_BARS 개 표시"""
         try:
-            if FINPLOT_AVAILABLE:
-                fplt.refresh()
-                self._update_status("🔍 줌 리셋 완료")
+            if self._price_plot is None or len(self._buffer) == 0:
+                return
+            last_index = self._buffer.last_index
+            first_visible = max(self._buffer.first_index, last_index - INITIAL_VISIBLE_BARS + 1)
+            self._price_plot.setXRange(first_visible - 0.5, last_index + 0.5, padding=0)
 
         except Exception as e:
             self._update_status(f"❌ 줌 리셋 실패: {e}")
@@ -397,11 +525,10 @@ class FinplotCandlestickWidget(QWidget):
     def _update_performance_display(self) -> None:
         """성능 표시 업데이트"""
         try:
-            # Infrastructure 계층에서 성능 통계 가져오기
-            stats = self._renderer.get_performance_stats() if self._renderer else {}
-
-            perf_info = f"FPS: {self._update_count:.1f} | 캔들: {stats.get('candle_count', 0)}"
-            self._update_status(perf_info)
+            lod = self._candle_item.last_slice if self._candle_item else None
+            lod_text = f"LOD x{lod.scale} ({len(lod)}봉)" if lod is not None else "LOD -"
+            self._update_status(f"FPS: {self._update_count} | 캔들: {len(self._buffer):,} | {lod_text}")
+            self._update_count = 0
 
         except Exception as e:
             self._logger.debug(f"성능 표시 업데이트 실패: {e}")
@@ -416,14 +543,9 @@ class FinplotCandlestickWidget(QWidget):
     def set_symbol(self, symbol: str) -> None:
         """심볼 설정"""
         try:
-            state = self._chart_state_service.change_symbol(symbol)
-            current_timeframe = self._timeframe_combo.currentText() if self._timeframe_combo else "1m"
-
-            # 새 심볼 데이터 로드
-            test_candles = self._chart_data_service._generate_test_data(symbol, current_timeframe, 200)
-            self._convert_and_display_data(test_candles)
-
-            self._update_status(f"심볼 변경: {symbol}")
+            self._chart_state_service.change_symbol(symbol)
+            self._symbol = symbol
+            self._request_history(symbol, self._timeframe)
             self._logger.info(f"심볼 변경: {symbol}")
 
         except Exception as e:
@@ -433,35 +555,43 @@ class FinplotCandlestickWidget(QWidget):
     def get_current_symbol(self) -> str:
         """현재 심볼 반환"""
         state = self._chart_state_service.get_current_state()
-        return state.symbol if state else "KRW-BTC"
+        return state.symbol if state else self._symbol
+
+    def get_buffer(self) -> CandleLodBuffer:
+        """캔들 버퍼 반환 (벤치마크/진단용)"""
+        return self._buffer
+
+    def create_managed_buffer(self) -> ManagedCandleBuffer:
+        """메모리 예산 관리용 버퍼 어댑터 (해제 후 복원 시 현재 심볼/타임프레임을 작업 스레드에서 재적재)"""
+        return ManagedCandleBuffer(
+            self._buffer,
+            reload=lambda: self._request_history(self._symbol, self._timeframe),
+            on_change=self._on_buffer_replaced
+        )
 
     def get_performance_info(self) -> Dict[str, Any]:
         """성능 정보 반환"""
-        base_info = {
-            'chart_type': 'finplot_candlestick',
+        lod = self._candle_item.last_slice if self._candle_item else None
+        return {
+            'chart_type': 'lod_candlestick',
             'update_count': self._update_count,
             'realtime_enabled': self._auto_scroll_btn.isChecked() if self._auto_scroll_btn else False,
-            'data_points': len(self._chart_df) if self._chart_df is not None else 0
+            'data_points': len(self._buffer),
+            'data_source': self._data_source,
+            'buffer_capacity': self._buffer.capacity,
+            'lod_scale': lod.scale if lod is not None else 1,
+            'rendered_bars': len(lod) if lod is not None else 0,
         }
 
-        if self._renderer:
-            renderer_stats = self._renderer.get_performance_stats()
-            base_info.update(renderer_stats)
-
-        return base_info
-
     def cleanup(self) -> None:
         """리소스 정리"""
         try:
             # 타이머 정지
-            self._realtime_timer.stop()
+            self._frame_timer.stop()
             self._performance_timer.stop()
+            self._buffer.clear()
 
-            # Finplot 정리
-            if FINPLOT_AVAILABLE:
-                fplt.close()
-
-            self._logger.info("Finplot 캔들스틱 위젯 리소스 정리 완료")
+            self._logger.info("캔들스틱 위젯 리소스 정리 완료")
 
         except Exception as e:
             self._logger.error(f"리소스 정리 실패: {e}")
@@ -0,0 +1,258 @@
+"""
+호가창 테이블 모델 - 레벨 단위 diff 증분 렌더링
+
+호가 메시지마다 전체 레벨을 다시 포맷하고 테이블을 다시 채우지 않습니다.
+- 메시지는 최신 스냅샷 하나만 보관했다가 화면 프레임 주기(16ms)마다 반영
+- 마지막으로 그린 레벨 상태(가격/수량/누적/배경 강도)와 비교해 바뀐 셀만 dataChanged
+- 가격/수량 문자열은 호가 단위 기준 캐시(OrderbookLevelTextCache) 재사용
+- 고정 배치: 매도 i번째(최우선부터)는 depth-1-i 행, 매수 i번째는 depth+i 행
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QFont
+
+from upbit_auto_trading.infrastructure.formatters.orderbook_formatter import (
+    OrderbookFormatter, OrderbookLevelTextCache
+)
+
+ASK_COLOR = QColor("#FF4444")  # 매도 (빨강)
+BID_COLOR = QColor("#4444FF")  # 매수 (파랑)
+NUMBER_COLOR = QColor("#888")
+QUANTITY_COLOR = QColor("#333")
+TOTAL_COLOR = QColor("#666")
+ALIGN_CENTER = int(Qt.AlignmentFlag.AlignCenter)
+
+# 수량 배경 강도 단계 (0.05 ~ 0.6 구간을 양자화 - 미세한 최대 수량 변화로 전체 열이 다시 그려지지 않도록)
+INTENSITY_STEPS = 20
+
+Level = Tuple[float, float, float, int]  # (가격, 수량, 누적, 배경 강도 단계)
+EMPTY_TEXTS = ("", "", "", "")
+
+
+def _side_backgrounds(base: QColor) -> Dict[str, Any]:
+    quantity = []
+    for step in range(INTENSITY_STEPS + 1):
+        color = QColor(base)
+        color.setAlphaF(0.05 + step / INTENSITY_STEPS * 0.55)
+        quantity.append(color)
+    return {
+        "quantity": quantity,
+        "price": QColor(base.red(), base.green(), base.blue(), 50),
+        "total": QColor(base.red(), base.green(), base.blue(), 30),
+    }
+
+
+class OrderbookTableModel(QAbstractTableModel):
+    """마지막 렌더 상태 대비 변경 셀만 갱신하는 호가창 모델"""
+
+    COL_NUMBER = 0
+    COL_QUANTITY = 1
+    COL_PRICE = 2
+    COL_TOTAL = 3
+    HEADERS = ["번호", "수량", "가격", "누적"]
+
+    PriceRole = Qt.ItemDataRole.UserRole
+
+    # 스냅샷이 테이블에 반영된 뒤 발생 (프레임당 최대 1회)
+    orderbook_applied = pyqtSignal(dict)
+
+    def __init__(self, parent=None, depth: int = 30, frame_interval_ms: int = 16,
+                 formatter: Optional[OrderbookFormatter] = None):
+        super().__init__(parent)
+        self._depth = depth
+        self._texts_cache = OrderbookLevelTextCache(formatter or OrderbookFormatter())
+
+        rows = depth * 2
+        self._levels: List[Optional[Level]] = [None] * rows
+        self._texts: List[Tuple[str, str, str, str]] = [EMPTY_TEXTS] * rows
+        self._numbers = [str(depth - row) for row in range(depth)] + [str(i + 1) for i in range(depth)]
+
+        self._backgrounds = {"ask": _side_backgrounds(ASK_COLOR), "bid": _side_backgrounds(BID_COLOR)}
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+
+        self._pending: Optional[Dict[str, Any]] = None
+        self.stats = {'messages_received': 0, 'flushes': 0, 'rows_changed': 0, 'cells_changed': 0}
+
+        # 프레임 주기 반영 타이머 (대기 중인 스냅샷이 있을 때만 동작)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(frame_interval_ms)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self.flush_pending)
+
+    # ==================== Qt 모델 인터페이스 ====================
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._depth * 2
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = index.row()
+        level = self._levels[row]
+        if level is None:
+            return None
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._texts[row][column]
+        if role == Qt.ItemDataRole.BackgroundRole:
+            backgrounds = self._backgrounds[self.side_of(row)]
+            if column == self.COL_QUANTITY:
+                return backgrounds["quantity"][level[3]]
+            if column == self.COL_PRICE:
+                return backgrounds["price"]
+            if column == self.COL_TOTAL:
+                return backgrounds["total"]
+            return None
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if column == self.COL_PRICE:
+                return ASK_COLOR if row < self._depth else BID_COLOR
+            if column == self.COL_NUMBER:
+                return NUMBER_COLOR
+            return QUANTITY_COLOR if column == self.COL_QUANTITY else TOTAL_COLOR
+        if role == Qt.ItemDataRole.FontRole and column == self.COL_PRICE:
+            return self._bold_font
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return ALIGN_CENTER
+        if role == self.PriceRole:
+            return level[0]
+        return None
+
+    # ==================== 증분 갱신 ====================
+
+    def enqueue_orderbook(self, data: Dict[str, Any]) -> None:
+        """호가 스냅샷 적재 - 최신 스냅샷만 유지하고 다음 프레임에 반영"""
+        self._pending = data
+        self.stats['messages_received'] += 1
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush_pending(self) -> None:
+        """대기 중인 스냅샷 반영"""
+        if self._pending is None:
+            return
+        data, self._pending = self._pending, None
+        self.stats['flushes'] += 1
+        self.apply_orderbook(data)
+        self.orderbook_applied.emit(data)
+
+    def apply_orderbook(self, data: Dict[str, Any]) -> None:
+        """스냅샷을 마지막 렌더 상태와 비교해 바뀐 셀만 갱신"""
+        self._texts_cache.set_market(data.get("market", "KRW"))
+        asks = data.get("asks") or []
+        bids = data.get("bids") or []
+        depth = self._depth
+
+        max_quantity = max(max((ask.get("quantity", 0) for ask in asks), default=0),
+                           max((bid.get("quantity", 0) for bid in bids), default=0))
+
+        target: List[Optional[Level]] = [None] * (depth * 2)
+        for i, ask in enumerate(asks[:depth]):
+            target[depth - 1 - i] = self._level(ask, max_quantity)
+        for i, bid in enumerate(bids[:depth]):
+            target[depth + i] = self._level(bid, max_quantity)
+
+        changed: List[Tuple[int, int, int]] = []  # (행, 첫 컬럼, 마지막 컬럼)
+        for row, level in enumerate(target):
+            old = self._levels[row]
+            if level == old:
+                continue
+            columns = self._update_row(row, old, level)
+            changed.append((row, columns[0], columns[-1]))
+            self.stats['cells_changed'] += len(columns)
+
+        if not changed:
+            return
+        self.stats['rows_changed'] += len(changed)
+        self._emit_changed(changed)
+
+    def _level(self, unit: Dict[str, Any], max_quantity: float) -> Level:
+        quantity = unit.get("quantity", 0)
+        step = round(quantity / max_quantity * INTENSITY_STEPS) if max_quantity > 0 else 0
+        return (unit["price"], quantity, unit.get("total", 0), step)
+
+    def _update_row(self, row: int, old: Optional[Level], level: Optional[Level]) -> List[int]:
+        """행 상태/문자열 갱신 후 바뀐 컬럼 목록 반환 (바뀐 값만 다시 포맷)"""
+        self._levels[row] = level
+        if level is None:
+            self._texts[row] = EMPTY_TEXTS
+            return [self.COL_NUMBER, self.COL_QUANTITY, self.COL_PRICE, self.COL_TOTAL]
+
+        cache = self._texts_cache
+        if old is None:
+            self._texts[row] = (self._numbers[row], cache.quantity_text(level[1]),
+                                cache.price_text(level[0]), cache.quantity_text(level[2]))
+            return [self.COL_NUMBER, self.COL_QUANTITY, self.COL_PRICE, self.COL_TOTAL]
+
+        number, quantity_text, price_text, total_text = self._texts[row]
+        columns = []
+        if level[1] != old[1] or level[3] != old[3]:
+            quantity_text = cache.quantity_text(level[1])
+            columns.append(self.COL_QUANTITY)
+        if level[0] != old[0]:
+            price_text = cache.price_text(level[0])
+            columns.append(self.COL_PRICE)
+        if level[2] != old[2]:
+            total_text = cache.quantity_text(level[2])
+            columns.append(self.COL_TOTAL)
+        self._texts[row] = (number, quantity_text, price_text, total_text)
+        return columns
+
+    def _emit_changed(self, changed: List[Tuple[int, int, int]]) -> None:
+        """인접한 변경 행은 묶어서 dataChanged 발행"""
+        start, first, last = changed[0]
+        prev = start
+        for row, row_first, row_last in changed[1:] + [(None, 0, 0)]:
+            if row is not None and row == prev + 1:
+                prev = row
+                first, last = min(first, row_first), max(last, row_last)
+                continue
+            self.dataChanged.emit(self.index(start, first), self.index(prev, last))
+            if row is not None:
+                start = prev = row
+                first, last = row_first, row_last
+
+    def clear(self) -> None:
+        """심볼 변경 등으로 표시 초기화"""
+        self.beginResetModel()
+        self._pending = None
+        self._flush_timer.stop()
+        self._levels = [None] * (self._depth * 2)
+        self._texts = [EMPTY_TEXTS] * (self._depth * 2)
+        self.endResetModel()
+
+    # ==================== 조회 ====================
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def center_row(self) -> int:
+        """매도 1번 행 (매수 1번과의 경계)"""
+        return self._depth - 1
+
+    def side_of(self, row: int) -> str:
+        return "ask" if row < self._depth else "bid"
+
+    def level_number(self, row: int) -> int:
+        """호가 번호 (최우선 호가 = 1)"""
+        return self._depth - row if row < self._depth else row - self._depth + 1
+
+    def price_at(self, row: int) -> Optional[float]:
+        level = self._levels[row] if 0 <= row < len(self._levels) else None
+        return level[0] if level is not None else None
+
+    def text_cache_stats(self) -> Dict[str, int]:
+        return {"hits": self._texts_cache.hits, "misses": self._texts_cache.misses}
@@ -6,20 +6,22 @@ Presentation Layer의 순수 UI 컴포넌트입니다.
 - UI 로직만 담당
 - 비즈니스 로직은 Presenter에 위임
 - QAsync 기반 안정적인 처리 (asyncio 문제 해결)
+- 호가 테이블은 OrderbookTableModel (레벨 diff + 프레임 단위 반영) + QTableView
 """
 
 from typing import Optional, Dict, Any
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
-    QTableWidgetItem, QHeaderView, QLabel, QFrame
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+    QHeaderView, QLabel, QFrame
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QModelIndex
 from PyQt6.QtGui import QFont, QColor
 
 from upbit_auto_trading.infrastructure.logging import create_component_logger
 from upbit_auto_trading.infrastructure.events.bus.in_memory_event_bus import InMemoryEventBus
 from upbit_auto_trading.presentation.presenters.chart_view.orderbook_presenter import OrderbookPresenter
 from upbit_auto_trading.infrastructure.formatters.orderbook_formatter import OrderbookFormatter
+from upbit_auto_trading.ui.desktop.screens.chart_view.widgets.orderbook_table_model import OrderbookTableModel
 
 
 class OrderbookWidget(QWidget):
@@ -53,6 +55,11 @@ class OrderbookWidget(QWidget):
         # UI 상태
         self._should_center_on_next_update = True
         self._colors = self._setup_colors()
+        self._label_texts: Dict[str, str] = {}
+
+        # 호가 테이블 모델 (30행씩 매도/매수, 16ms 프레임 단위 반영)
+        self._table_model = OrderbookTableModel(self, depth=30, formatter=self._formatter)
+        self._table_model.orderbook_applied.connect(self._on_orderbook_applied)
 
         # 자동 갱신 타이머 (WebSocket 시뮬레이션을 위한 빠른 갱신)
         self._refresh_timer = QTimer(self)
@@ -61,7 +68,7 @@ class OrderbookWidget(QWidget):
         self._refresh_timer.start()
 
         # UI 위젯
-        self._orderbook_table: Optional[QTableWidget] = None
+        self._orderbook_table: Optional[QTableView] = None
         self._websocket_status_label: Optional[QLabel] = None
         self._spread_label: Optional[QLabel] = None
         self._price_info_label: Optional[QLabel] = None
@@ -122,7 +129,7 @@ class OrderbookWidget(QWidget):
         layout.addWidget(separator)
 
         # 호가 테이블
-        self._orderbook_table = QTableWidget()
+        self._orderbook_table = QTableView()
         self._setup_table()
         layout.addWidget(self._orderbook_table)
 
@@ -159,10 +166,8 @@ class OrderbookWidget(QWidget):
         if not self._orderbook_table:
             return
 
-        # 테이블 기본 설정
-        self._orderbook_table.setColumnCount(4)
-        self._orderbook_table.setRowCount(60)  # 30행씩 매도/매수
-        self._orderbook_table.setHorizontalHeaderLabels(["번호", "수량", "가격", "누적"])
+        # 테이블 기본 설정 (60행: 30행씩 매도/매수, 헤더는 모델 제공)
+        self._orderbook_table.setModel(self._table_model)
 
         # 헤더 설정 - None 체크 추가
         header = self._orderbook_table.horizontalHeader()
@@ -174,16 +179,18 @@ class OrderbookWidget(QWidget):
             header.resizeSection(0, 40)
 
         # 테이블 속성 설정
-        self._orderbook_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self._orderbook_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self._orderbook_table.setAlternatingRowColors(True)
 
-        # 수직 헤더 숨기기 - None 체크 추가
+        # 수직 헤더 숨기기 + 고정 행 높이 (행 높이 재계산 없이 변경 셀만 다시 그림)
         vertical_header = self._orderbook_table.verticalHeader()
         if vertical_header:
             vertical_header.hide()
+            vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+            vertical_header.setDefaultSectionSize(24)
 
         # 클릭 이벤트 연결
-        self._orderbook_table.cellClicked.connect(self._on_cell_clicked)
+        self._orderbook_table.clicked.connect(self._on_index_clicked)
 
         # 폰트 설정 (12pt)
         font = QFont()
@@ -197,16 +204,16 @@ class OrderbookWidget(QWidget):
         self._presenter.error_occurred.connect(self._handle_error)
 
     def _update_orderbook_display(self, data: Dict[str, Any]) -> None:
-        """호가창 표시 업데이트"""
+        """호가창 표시 업데이트 - 최신 스냅샷만 모델에 적재 (다음 프레임에 변경 셀만 반영)"""
         if not self._formatter.validate_orderbook_data(data):
             self._logger.warning("유효하지 않은 호가창 데이터")
             return
 
-        try:
-            # 테이블 데이터 생성
-            table_data = self._formatter.format_orderbook_for_table(data)
-            self._populate_table(table_data, data)
+        self._table_model.enqueue_orderbook(data)
 
+    def _on_orderbook_applied(self, data: Dict[str, Any]) -> None:
+        """프레임 단위로 테이블에 반영된 스냅샷 후처리"""
+        try:
             # 정보 라벨 업데이트
             self._update_info_labels(data)
 
@@ -220,74 +227,6 @@ class OrderbookWidget(QWidget):
         except Exception as e:
             self._logger.error(f"호가창 표시 업데이트 오류: {e}")
 
-    def _populate_table(self, table_data: list, original_data: Dict[str, Any]) -> None:
-        """테이블 데이터 채우기 - 시각적 개선 포함"""
-        if not self._orderbook_table or not table_data:
-            return
-
-        # 전체 수량 계산 (배경 그라데이션용)
-        asks = original_data.get("asks", [])
-        bids = original_data.get("bids", [])
-
-        max_ask_quantity = max((ask.get("quantity", 0) for ask in asks), default=1)
-        max_bid_quantity = max((bid.get("quantity", 0) for bid in bids), default=1)
-        max_quantity = max(max_ask_quantity, max_bid_quantity)
-
-        for row_idx, row_data in enumerate(table_data):
-            if row_idx >= 60:  # 안전 체크
-                break
-
-            row_type = self._formatter.get_table_row_type(row_idx)
-            is_ask = row_type == "ask"
-
-            # 기본 색상 설정
-            base_color = self._colors["ask"] if is_ask else self._colors["bid"]
-
-            # 수량 데이터에서 배경 강도 계산
-            try:
-                quantity_text = str(row_data[1]).replace(",", "")
-
-                # K, M 접미사 처리
-                if quantity_text.endswith("K"):
-                    quantity = float(quantity_text[:-1]) * 1000
-                elif quantity_text.endswith("M"):
-                    quantity = float(quantity_text[:-1]) * 1000000
-                elif quantity_text == "-":
-                    quantity = 0
-                else:
-                    quantity = float(quantity_text)
-
-                # 정규화된 강도 (0.05 ~ 0.6)
-                intensity = 0.05 + (quantity / max_quantity) * 0.55 if max_quantity > 0 else 0.05
-
-            except (ValueError, IndexError, TypeError):
-                intensity = 0.05            # 배경색 계산 (알파값 조정)
-            background_color = QColor(base_color)
-            background_color.setAlphaF(intensity)
-
-            for col_idx, cell_data in enumerate(row_data):
-                item = QTableWidgetItem(str(cell_data))
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-                # 컬럼별 스타일링
-                if col_idx == 0:  # 번호 컬럼
-                    item.setForeground(QColor("#888"))
-                elif col_idx == 1:  # 수량 컬럼
-                    item.setBackground(background_color)  # 수량 기반 배경
-                    item.setForeground(QColor("#333"))
-                elif col_idx == 2:  # 가격 컬럼 (중요)
-                    item.setForeground(base_color)
-                    item.setBackground(QColor(background_color.red(), background_color.green(), background_color.blue(), 50))
-                    # 굵은 폰트
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
-                elif col_idx == 3:  # 누적 컬럼
-                    item.setBackground(QColor(background_color.red(), background_color.green(), background_color.blue(), 30))
-                    item.setForeground(QColor("#666"))
-
-                self._orderbook_table.setItem(row_idx, col_idx, item)
-
     def _update_info_labels(self, data: Dict[str, Any]) -> None:
         """정보 라벨 업데이트"""
         if not data:
@@ -299,17 +238,23 @@ class OrderbookWidget(QWidget):
         # 스프레드 정보
         if self._spread_label:
             spread_text = self._formatter.format_spread_text(spread_info, market)
-            self._spread_label.setText(spread_text)
+            self._set_label_text("spread", self._spread_label, spread_text)
 
         # 가격 정보
         if self._price_info_label:
             price_text = self._formatter.format_price_info_text(spread_info, market)
-            self._price_info_label.setText(price_text)
+            self._set_label_text("price_info", self._price_info_label, price_text)
 
         # 시장 정보
         if self._market_info_label:
             market_text = self._formatter.format_market_info_text(data)
-            self._market_info_label.setText(market_text)
+            self._set_label_text("market_info", self._market_info_label, market_text)
+
+    def _set_label_text(self, key: str, label: QLabel, text: str) -> None:
+        """바뀐 텍스트만 라벨에 반영 (같은 값이면 레이아웃/다시 그리기 생략)"""
+        if self._label_texts.get(key) != text:
+            self._label_texts[key] = text
+            label.setText(text)
 
     def _update_status_display(self, status: Dict[str, Any]) -> None:
         """상태 표시 업데이트"""
@@ -336,26 +281,23 @@ class OrderbookWidget(QWidget):
         if self._websocket_status_label:
             self._websocket_status_label.setText("🔴 오류 발생")
 
-    def _on_cell_clicked(self, row: int, column: int) -> None:
+    def _on_index_clicked(self, index: QModelIndex) -> None:
         """셀 클릭 이벤트 처리"""
-        if column == 2 and self._orderbook_table:  # 가격 컬럼
-            item = self._orderbook_table.item(row, column)
-            if item:
-                try:
-                    price_text = item.text().replace(",", "")
-                    price = float(price_text)
-                    symbol = self._presenter.get_current_symbol()
+        if index.isValid() and index.column() == OrderbookTableModel.COL_PRICE:  # 가격 컬럼
+            price = self._table_model.price_at(index.row())
+            if price is None:
+                return
+            row = index.row()
+            symbol = self._presenter.get_current_symbol()
 
-                    # 매도/매수 구분 (30행 이하는 매도, 30행 이상은 매수)
-                    order_type = "매도" if row < 30 else "매수"
+            # 매도/매수 구분 (매도 1번 행까지는 매도, 이후는 매수)
+            order_type = "매도" if self._table_model.side_of(row) == "ask" else "매수"
 
-                    # 주문 정보 계산 및 업데이트
-                    self._update_order_info(symbol, price, order_type, row)
+            # 주문 정보 계산 및 업데이트
+            self._update_order_info(symbol, price, order_type, row)
 
-                    self.price_clicked.emit(symbol, price)
-                    self._logger.debug(f"가격 클릭: {symbol} {price}")
-                except (ValueError, TypeError):
-                    pass
+            self.price_clicked.emit(symbol, price)
+            self._logger.debug(f"가격 클릭: {symbol} {price}")
 
     def _update_order_info(self, symbol: str, price: float, order_type: str, row: int) -> None:
         """주문 정보 업데이트"""
@@ -376,10 +318,7 @@ class OrderbookWidget(QWidget):
             min_quantity = max(1.0, min_order_amount / price)
 
             # 호가 번호 계산 (1-30)
-            if row < 30:  # 매도
-                orderbook_number = 30 - row
-            else:  # 매수
-                orderbook_number = row - 29
+            orderbook_number = self._table_model.level_number(row)
 
             # 색상 설정
             color = "#FF4444" if order_type == "매도" else "#4444FF"
@@ -406,10 +345,10 @@ class OrderbookWidget(QWidget):
 
         try:
             # 매도 마지막(1번)과 매수 첫번째(1번) 사이로 중앙 정렬
-            center_row = 29  # 30행 (0-based index 29) - 매도 마지막
-            self._orderbook_table.scrollToItem(
-                self._orderbook_table.item(center_row, 0),
-                QTableWidget.ScrollHint.PositionAtCenter
+            center_row = self._table_model.center_row  # 30행 (0-based index 29) - 매도 마지막
+            self._orderbook_table.scrollTo(
+                self._table_model.index(center_row, 0),
+                QTableView.ScrollHint.PositionAtCenter
             )
             self._should_center_on_next_update = False
             self._logger.debug("📍 호가창 중앙 포지션 설정 완료 (매도1번/매수1번 경계)")
@@ -420,6 +359,7 @@ class OrderbookWidget(QWidget):
     def set_symbol(self, symbol: str) -> None:
         """심볼 설정 - QTimer 기반으로 안전하게"""
         self._should_center_on_next_update = True  # 심볼 변경시 중앙 정렬
+        self._table_model.clear()  # 이전 심볼 호가가 새 심볼 첫 프레임에 섞이지 않도록
 
         # QTimer를 사용하여 안전하게 심볼 변경 (asyncio 사용하지 않음)
         QTimer.singleShot(50, lambda: self._change_symbol_safe(symbol))
@@ -457,7 +397,8 @@ class OrderbookWidget(QWidget):
         status = self._presenter.get_connection_status()
         status.update({
             "widget_initialized": True,
-            "table_rows": self._orderbook_table.rowCount() if self._orderbook_table else 0
+            "table_rows": self._table_model.rowCount(),
+            "table_stats": dict(self._table_model.stats)
         })
         return status
 
@@ -328,9 +328,11 @@ class SimulationResultWidget(QWidget):
         try:
             from upbit_auto_trading.infrastructure.repositories.simulation_data_repository import SimulationDataRepository
             from upbit_auto_trading.application.use_cases.simulation.load_simulation_data_use_case import LoadSimulationDataUseCase
+            from upbit_auto_trading.infrastructure.configuration import get_path_service
 
-            # Repository와 UseCase 초기화
-            self.repository = SimulationDataRepository()
+            # Repository와 UseCase 초기화 (실제 캔들 DB는 설정된 market_data 경로 사용)
+            market_data_db_path = str(get_path_service().get_database_path('market_data'))
+            self.repository = SimulationDataRepository(market_data_db_path=market_data_db_path)
             self.load_data_use_case = LoadSimulationDataUseCase(self.repository)
 
             logger.debug("SimulationResultWidget UseCase 설정 완료")
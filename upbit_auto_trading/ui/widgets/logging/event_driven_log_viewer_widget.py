@@ -1,6 +1,9 @@
 """
 Event-Driven 로그 뷰어 위젯 - QAsync 통합 버전
 격리 이벤트 루프 패턴을 QAsync 통합 패턴으로 전환
+
+로그 표시는 LogListModel(IndexedLogStore 기반 가상화 모델) + QListView로 처리하며,
+LiveLogBuffer(ui_live_log_handler) 피드를 프레임 타이머로 드레인합니다.
 """
 
 import asyncio
@@ -22,11 +25,11 @@ except ImportError:
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QTextEdit, QComboBox, QLineEdit, QLabel, QCheckBox,
+    QTableView, QHeaderView, QAbstractItemView, QComboBox, QLineEdit, QLabel, QCheckBox,
     QFrame
 )
 from PyQt6.QtCore import QTimer, pyqtSignal, pyqtSlot
-from PyQt6.QtGui import QFont, QTextCursor
+from PyQt6.QtGui import QFont
 
 from upbit_auto_trading.infrastructure.logging import create_component_logger
 from upbit_auto_trading.infrastructure.events.logging_events import (
@@ -35,6 +38,11 @@ from upbit_auto_trading.infrastructure.events.logging_events import (
 from upbit_auto_trading.infrastructure.events.event_system_initializer import EventSystemInitializer
 from upbit_auto_trading.infrastructure.events.bus.event_bus_interface import IEventBus
 from upbit_auto_trading.infrastructure.database.database_manager import DatabaseManager
+from upbit_auto_trading.infrastructure.logging.live.indexed_log_store import LOG_LEVELS, LogFilter
+from upbit_auto_trading.infrastructure.logging.live.ui_live_log_handler import (
+    attach_live_log_handler, get_live_log_buffer
+)
+from upbit_auto_trading.ui.widgets.logging.log_list_model import LogListModel
 
 
 class EventDrivenLogViewerWidget(QWidget):
@@ -54,10 +62,9 @@ class EventDrivenLogViewerWidget(QWidget):
         self.domain_publisher = None
         self._event_subscription_ids: List[str] = []
 
-        # 로그 메시지 저장소 (메모리 캐시)
-        self.log_messages: List[Dict[str, Any]] = []
-        self.filtered_messages: List[Dict[str, Any]] = []
-        self.max_messages = 10000  # 최대 메시지 수
+        # 로그 메시지 저장소 (링 저장소 + 레벨/컴포넌트 인덱스)
+        self.max_messages = 500_000  # 최대 보존 라인 수
+        self.log_model = LogListModel(capacity=self.max_messages, parent=self)
 
         # 필터 상태
         self.filters = {
@@ -84,6 +91,11 @@ class EventDrivenLogViewerWidget(QWidget):
         # Event System 비동기 초기화
         self._setup_event_system()
 
+        # 라이브 로그 피드 연결 (프레임 타이머로 드레인)
+        attach_live_log_handler()
+        self.log_model.attach_live_buffer(get_live_log_buffer())
+        self.log_model.start()
+
         self.logger.info("Event-Driven 로그 뷰어 위젯 초기화 완료")
 
     def _init_ui(self):
@@ -94,11 +106,23 @@ class EventDrivenLogViewerWidget(QWidget):
         filter_panel = self._create_filter_panel()
         layout.addWidget(filter_panel)
 
-        # 로그 텍스트 영역
-        self.log_text_edit = QTextEdit()
-        self.log_text_edit.setReadOnly(True)
-        self.log_text_edit.setFont(QFont("Consolas", 9))
-        layout.addWidget(self.log_text_edit)
+        # 로그 목록 (가상화: 보이는 행만 렌더링)
+        # QListView는 행 추가마다 전체 행 레이아웃을 다시 계산하므로, 고정 행 높이의 단일 컬럼 QTableView 사용
+        self.log_view = QTableView()
+        self.log_view.setModel(self.log_model)
+        self.log_view.setShowGrid(False)
+        self.log_view.setWordWrap(False)
+        self.log_view.horizontalHeader().hide()
+        self.log_view.horizontalHeader().setStretchLastSection(True)
+        vertical_header = self.log_view.verticalHeader()
+        vertical_header.hide()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(18)
+        self.log_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.log_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.log_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.log_view.setFont(QFont("Consolas", 9))
+        layout.addWidget(self.log_view)
 
         # 하단 컨트롤 패널
         control_panel = self._create_control_panel()
@@ -199,6 +223,10 @@ class EventDrivenLogViewerWidget(QWidget):
                 lambda checked, l=level: self._emit_filter_changed(f'show_{l.lower()}', checked, True)
             )
 
+        # 모델 신호 연결 (행 추가는 프레임당 1회로 합쳐짐)
+        self.log_model.rowsInserted.connect(self._on_rows_inserted)
+        self.log_model.counts_changed.connect(self._update_stats)
+
         # 컨트롤 버튼 연결
         self.auto_scroll_checkbox.toggled.connect(self._on_auto_scroll_changed)
         self.pause_button.toggled.connect(self._on_pause_toggled)
@@ -301,23 +329,16 @@ class EventDrivenLogViewerWidget(QWidget):
 
     @pyqtSlot(dict)
     def _on_log_message_received(self, message_data: Dict[str, Any]):
-        """로그 메시지 수신 처리 (UI 스레드)"""
+        """로그 메시지 수신 처리 (UI 스레드) - 다음 프레임에 모델로 반영"""
         if self.is_paused:
             return
 
-        # 메시지 저장
-        self.log_messages.append(message_data)
-
-        # 최대 메시지 수 제한
-        if len(self.log_messages) > self.max_messages:
-            self.log_messages = self.log_messages[-self.max_messages:]
-
-        # 필터링 적용
-        self._apply_filters()
-
-        # UI 업데이트
-        self._update_log_display()
-        self._update_stats()
+        self.log_model.enqueue(
+            self._format_log_message(message_data),
+            level=message_data.get('level', 'INFO'),
+            component=message_data.get('logger_name', ''),
+            message=message_data.get('message', '')
+        )
 
     @pyqtSlot(str, str, bool)
     def _on_filter_changed(self, filter_type: str, filter_value: str, is_active: bool):
@@ -330,9 +351,8 @@ class EventDrivenLogViewerWidget(QWidget):
         elif filter_type.startswith('show_'):
             self.filters[filter_type] = filter_value == 'True' or filter_value is True
 
-        # 필터 재적용
+        # 필터 재적용 (인덱스 기반, 프레임 단위 점진 처리)
         self._apply_filters()
-        self._update_log_display()
 
     def _emit_filter_changed(self, filter_type: str, filter_value: Any, is_active: bool):
         """필터 변경 이벤트 발행"""
@@ -352,59 +372,21 @@ class EventDrivenLogViewerWidget(QWidget):
             self.logger.error(f"필터 변경 이벤트 발행 실패: {e}")
 
     def _apply_filters(self):
-        """현재 필터 설정에 따라 메시지 필터링"""
-        self.filtered_messages = []
-
-        for message in self.log_messages:
-            if self._message_passes_filter(message):
-                self.filtered_messages.append(message)
-
-    def _message_passes_filter(self, message: Dict[str, Any]) -> bool:
-        """메시지가 현재 필터를 통과하는지 확인"""
-        # 레벨 필터
-        level = message.get('level', 'INFO')
-        if not self.filters.get(f'show_{level.lower()}', True):
-            return False
-
-        # 특정 레벨 필터
-        if self.filters.get('level') and self.filters['level'] != level:
-            return False
-
-        # 로거 이름 필터
-        logger_filter = self.filters.get('logger', '').strip()
-        if logger_filter:
-            logger_name = message.get('logger_name', '').lower()
-            if logger_filter.lower() not in logger_name:
-                return False
-
-        # 검색 텍스트 필터
-        search_filter = self.filters.get('search_text', '').strip()
-        if search_filter:
-            message_text = message.get('message', '').lower()
-            if search_filter.lower() not in message_text:
-                return False
-
-        return True
-
-    def _update_log_display(self):
-        """로그 디스플레이 업데이트"""
-        if not self.filtered_messages:
-            return
-
-        # 새 메시지만 추가 (성능 최적화)
-        current_line_count = self.log_text_edit.document().lineCount()
-        new_messages = self.filtered_messages[current_line_count-1:] if current_line_count > 1 else self.filtered_messages
-
-        cursor = self.log_text_edit.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-
-        for message in new_messages:
-            formatted_message = self._format_log_message(message)
-            cursor.insertText(formatted_message + '\n')
-
-        # 자동 스크롤
-        if self.auto_scroll:
-            self.log_text_edit.ensureCursorVisible()
+        """현재 필터 설정을 모델에 적용"""
+        levels = [level for level in LOG_LEVELS if self.filters.get(f'show_{level.lower()}', True)]
+        if self.filters.get('level'):
+            levels = [level for level in levels if level == self.filters['level']]
+
+        self.log_model.set_filter(LogFilter.create(
+            levels=levels,
+            component=self.filters.get('logger', ''),
+            search_text=self.filters.get('search_text', '')
+        ))
+
+    def _on_rows_inserted(self, *_):
+        """자동 스크롤"""
+        if self.auto_scroll and not self.log_model.is_filtering:
+            self.log_view.scrollToBottom()
 
     def _format_log_message(self, message: Dict[str, Any]) -> str:
         """로그 메시지 포맷팅"""
@@ -423,11 +405,8 @@ class EventDrivenLogViewerWidget(QWidget):
 
         return f"{timestamp} [{level:8}] {logger_name}{location}: {text}"
 
-    def _update_stats(self):
+    def _update_stats(self, filtered_messages: int, total_messages: int):
         """통계 정보 업데이트"""
-        total_messages = len(self.log_messages)
-        filtered_messages = len(self.filtered_messages)
-
         if total_messages == filtered_messages:
             stats_text = f"메시지: {total_messages}"
         else:
@@ -445,6 +424,7 @@ class EventDrivenLogViewerWidget(QWidget):
     def _on_pause_toggled(self, checked: bool):
         """일시정지 토글"""
         self.is_paused = checked
+        self.log_model.set_paused(checked)
         self.pause_button.setText("재시작" if checked else "일시정지")
 
         # 상태 변경 이벤트 발행
@@ -452,10 +432,7 @@ class EventDrivenLogViewerWidget(QWidget):
 
     def _on_clear_clicked(self):
         """로그 클리어"""
-        self.log_messages.clear()
-        self.filtered_messages.clear()
-        self.log_text_edit.clear()
-        self._update_stats()
+        self.log_model.clear()
 
         # 상태 변경 이벤트 발행
         self._emit_viewer_state_changed("log_cleared", None, None)
@@ -488,6 +465,8 @@ class EventDrivenLogViewerWidget(QWidget):
     def closeEvent(self, event):
         """위젯 종료 시 정리"""
         try:
+            self.log_model.stop()
+
             # 이벤트 구독 해제
             if self.event_bus and self._event_subscription_ids:
                 for subscription_id in self._event_subscription_ids:
@@ -0,0 +1,325 @@
+"""
+로그 뷰어 리스트 모델 - IndexedLogStore 기반 가상화 모델
+
+뷰는 화면에 보이는 행에 대해서만 data()를 호출하므로, 보존 라인 수와 무관하게
+렌더링 비용은 일정합니다. 모델은 필터를 통과한 seq 목록만 유지합니다.
+
+- 추가: 새 라인만 필터 검사 후 beginInsertRows (프레임당 1회로 합침)
+- 축출: 링 저장소에서 밀려난 앞쪽 행만 beginRemoveRows
+- 필터 변경: 인덱스 후보 또는 이전 결과(좁혀지는 필터)만 프레임 예산 안에서 나눠서 순회
+- 필터가 없을 때는 seq 목록을 만들지 않고 저장소 구간(first_seq + row)으로 바로 매핑
+"""
+
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Any, List, Optional, Sequence, Tuple
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QTimer, Qt, pyqtSignal
+from PyQt6.QtGui import QColor
+
+from upbit_auto_trading.infrastructure.logging.live.indexed_log_store import IndexedLogStore, LogFilter
+from upbit_auto_trading.infrastructure.logging.live.ui_live_log_handler import LiveLogBuffer
+
+LEVEL_COLORS = {
+    'WARNING': QColor('#b8860b'),
+    'ERROR': QColor('#d32f2f'),
+    'CRITICAL': QColor('#8b0000'),
+}
+
+
+class _FilterJob:
+    """프레임 단위로 나눠 실행되는 필터 재계산 작업"""
+
+    def __init__(self, log_filter: LogFilter, source: Sequence[int], upto_seq: int):
+        self.log_filter = log_filter
+        self.source = source
+        self.position = 0
+        self.upto_seq = upto_seq  # 작업 시작 시점의 마지막 seq (이후 추가분은 완료 시 처리)
+
+
+class LogListModel(QAbstractListModel):
+    """필터링된 로그 라인 가상화 모델"""
+
+    LevelRole = Qt.ItemDataRole.UserRole + 1
+    ComponentRole = Qt.ItemDataRole.UserRole + 2
+    SeqRole = Qt.ItemDataRole.UserRole + 3
+
+    counts_changed = pyqtSignal(int, int)  # 표시 행 수, 보존 라인 수
+    filter_progress = pyqtSignal(int, int)  # 순회한 후보 수, 전체 후보 수
+    filter_finished = pyqtSignal()
+
+    SCAN_CHUNK = 4096
+
+    def __init__(self,
+                 capacity: int = 500_000,
+                 frame_interval_ms: int = 16,
+                 frame_budget_ms: float = 8.0,
+                 result_cache_size: int = 4,
+                 parent=None):
+        super().__init__(parent)
+        self.store = IndexedLogStore(capacity)
+        self.frame_budget = frame_budget_ms / 1000
+        self.result_cache_size = result_cache_size
+
+        self._filter = LogFilter()
+        self._rows: List[int] = []  # 표시 중인 seq (오름차순, 필터 적용 시)
+        self._row_offset = 0  # 축출로 앞에서 제외된 행 수 (주기적으로 압축)
+        # 필터 없음: 행 i = _all_first_seq + i (50만 개 int 목록 생성/해제 비용 회피)
+        self._all_rows = True
+        self._all_first_seq = self.store.first_seq
+        self._all_count = 0
+        self._job: Optional[_FilterJob] = None
+        self._result_cache: "OrderedDict[LogFilter, Tuple[List[int], int]]" = OrderedDict()
+
+        self._pending: List[Tuple[str, str, str, Optional[str]]] = []
+        self._live_buffer: Optional[LiveLogBuffer] = None
+        self._live_last_seq = 0
+        self._paused = False
+        self._last_counts = (0, 0)
+
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setInterval(frame_interval_ms)
+        self._frame_timer.timeout.connect(self.process_frame)
+
+    # ==================== Qt 모델 인터페이스 ====================
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        if self._all_rows:
+            return self._all_count
+        return len(self._rows) - self._row_offset
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = index.row()
+        if self._all_rows:
+            if row >= self._all_count:
+                return None
+            seq = self._all_first_seq + row
+        else:
+            row += self._row_offset
+            if row >= len(self._rows):
+                return None
+            seq = self._rows[row]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.store.line(seq)
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return LEVEL_COLORS.get(self.store.level(seq))
+        if role == self.LevelRole:
+            return self.store.level(seq)
+        if role == self.ComponentRole:
+            return self.store.component(seq)
+        if role == self.SeqRole:
+            return seq
+        return None
+
+    # ==================== 공급 ====================
+
+    def attach_live_buffer(self, buffer: LiveLogBuffer, include_existing: bool = False) -> None:
+        """LiveLogBuffer를 프레임마다 드레인하도록 연결"""
+        self._live_buffer = buffer
+        self._live_last_seq = 0 if include_existing else buffer.last_seq()
+
+    def enqueue(self, line: str, level: str = 'INFO', component: str = '', message: Optional[str] = None) -> None:
+        """다음 프레임에 추가될 라인 적재"""
+        if not self._paused:
+            self._pending.append((line, level, component, message))
+
+    def set_paused(self, paused: bool) -> None:
+        """일시정지 중 도착한 라인은 버림 (재개 시 라이브 버퍼 위치 재동기화)"""
+        self._paused = paused
+        if paused:
+            self._pending.clear()
+        elif self._live_buffer is not None:
+            self._live_last_seq = self._live_buffer.last_seq()
+
+    def start(self) -> None:
+        self._frame_timer.start()
+
+    def stop(self) -> None:
+        self._frame_timer.stop()
+
+    def process_frame(self) -> None:
+        """프레임 1회 처리: 신규 라인 반영 + 진행 중인 필터 작업 이어서 수행"""
+        deadline = time.perf_counter() + self.frame_budget
+
+        if self._live_buffer is not None and not self._paused:
+            records, self._live_last_seq = self._live_buffer.get_records_since(self._live_last_seq)
+            for line, level, component in records:
+                self._pending.append((line, level, component, None))
+
+        if self._pending:
+            pending, self._pending = self._pending, []
+            self._append_batch(pending)
+
+        if self._job is not None:
+            self._advance_job(deadline)
+
+        counts = (self.rowCount(), len(self.store))
+        if counts != self._last_counts:
+            self._last_counts = counts
+            self.counts_changed.emit(*counts)
+
+    def _append_batch(self, records: List[Tuple[str, str, str, Optional[str]]]) -> None:
+        append = self.store.append
+        new_seqs = [append(line, level, component, message) for line, level, component, message in records]
+        self._trim_evicted_rows()
+
+        # 필터 작업 중이면 작업 완료 시 upto_seq 이후 구간으로 한꺼번에 반영
+        if self._job is not None:
+            return
+        if self._all_rows:
+            # 한 배치가 용량보다 큰 경우 이미 축출된 앞부분 제외
+            matched = new_seqs[max(0, self.store.first_seq - new_seqs[0]):] if new_seqs else new_seqs
+        else:
+            matched = self.store.filter_seqs(new_seqs, self._filter)
+        self._insert_rows(matched)
+
+    def _insert_rows(self, seqs: List[int]) -> None:
+        if not seqs:
+            return
+        first_row = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(seqs) - 1)
+        if self._all_rows:
+            self._all_count += len(seqs)
+        else:
+            self._rows.extend(seqs)
+        self.endInsertRows()
+
+    def _trim_evicted_rows(self) -> None:
+        """링 저장소에서 축출된 앞쪽 행 제거"""
+        if self._all_rows:
+            evicted = min(self.store.first_seq - self._all_first_seq, self._all_count)
+            if evicted > 0:
+                self.beginRemoveRows(QModelIndex(), 0, evicted - 1)
+                self._all_count -= evicted
+                self._all_first_seq += evicted
+                self.endRemoveRows()
+            self._all_first_seq = max(self._all_first_seq, self.store.first_seq)
+            return
+
+        evicted = bisect_left(self._rows, self.store.first_seq, self._row_offset) - self._row_offset
+        if evicted <= 0:
+            return
+        self.beginRemoveRows(QModelIndex(), 0, evicted - 1)
+        self._row_offset += evicted
+        self.endRemoveRows()
+
+        # 앞부분 압축 (행 번호는 변하지 않으므로 신호 불필요)
+        if self._row_offset > 65536 and self._row_offset * 2 > len(self._rows):
+            del self._rows[:self._row_offset]
+            self._row_offset = 0
+
+    # ==================== 필터 ====================
+
+    @property
+    def log_filter(self) -> LogFilter:
+        return self._filter
+
+    @property
+    def is_filtering(self) -> bool:
+        return self._job is not None
+
+    def set_filter(self, log_filter: LogFilter) -> None:
+        """
+        필터 변경
+
+        1) 같은 필터의 이전 결과가 있으면 축출/추가분만 보정해 즉시 사용
+        2) 새 필터가 이전 결과를 좁히는 경우(검색어 추가 입력 등) 그 결과만 다시 거름
+        3) 그 외에는 레벨/컴포넌트 인덱스 후보만 순회
+        2), 3)은 프레임 예산 단위로 나눠 진행하며 결과가 점진적으로 표시됨
+        """
+        if log_filter == self._filter:
+            return
+        deadline = time.perf_counter() + self.frame_budget
+
+        if self._job is None and not self._all_rows:
+            self._remember_result(self._filter, self._rows[self._row_offset:], self.store.last_seq)
+        self._filter, self._job = log_filter, None
+
+        self.beginResetModel()
+        self._rows, self._row_offset = [], 0
+        self._all_rows = log_filter.is_passthrough
+        self._all_first_seq, self._all_count = self.store.first_seq, len(self.store)
+
+        cached = self._result_cache.pop(log_filter, None)
+        if self._all_rows:
+            pass
+        elif cached is not None:
+            rows, upto_seq = cached
+            start = bisect_left(rows, self.store.first_seq)
+            self._rows = rows[start:]
+            self._rows.extend(self.store.filter_seqs(range(upto_seq + 1, self.store.last_seq + 1), log_filter))
+        else:
+            self._job = self._create_job(log_filter)
+        self.endResetModel()
+
+        if self._job is not None:
+            self._advance_job(deadline)
+        else:
+            self.filter_finished.emit()
+
+    def _create_job(self, log_filter: LogFilter) -> _FilterJob:
+        narrower_source: Optional[Tuple[List[int], int]] = None
+        for cached_filter, (rows, upto_seq) in self._result_cache.items():
+            if log_filter.narrows(cached_filter) and (narrower_source is None or len(rows) < len(narrower_source[0])):
+                narrower_source = (rows, upto_seq)
+
+        candidates = self.store.candidate_seqs(log_filter)
+        if narrower_source is not None and len(narrower_source[0]) < len(candidates):
+            rows, upto_seq = narrower_source
+            # 캐시 이후 추가된 라인은 작업 완료 시 upto_seq 이후 구간으로 처리됨
+            return _FilterJob(log_filter, rows, upto_seq)
+        return _FilterJob(log_filter, candidates, self.store.last_seq)
+
+    def _advance_job(self, deadline: float) -> None:
+        job = self._job
+        source = job.source
+        total = len(source)
+
+        while job.position < total:
+            end = min(job.position + self.SCAN_CHUNK, total)
+            matched = self.store.filter_seqs(source[job.position:end], job.log_filter)
+            job.position = end
+            self._insert_rows(matched)
+            if time.perf_counter() >= deadline:
+                self.filter_progress.emit(job.position, total)
+                return
+
+        # 작업 중 추가된 라인 반영 후 완료
+        self._job = None
+        self._insert_rows(self.store.filter_seqs(range(job.upto_seq + 1, self.store.last_seq + 1), job.log_filter))
+        self.filter_progress.emit(total, total)
+        self.filter_finished.emit()
+
+    def _remember_result(self, log_filter: LogFilter, rows: List[int], upto_seq: int) -> None:
+        if log_filter.is_passthrough or self.result_cache_size <= 0:
+            return
+        self._result_cache[log_filter] = (rows, upto_seq)
+        self._result_cache.move_to_end(log_filter)
+        while len(self._result_cache) > self.result_cache_size:
+            self._result_cache.popitem(last=False)
+
+    # ==================== 관리 ====================
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self.store.clear()
+        self._rows, self._row_offset = [], 0
+        self._all_first_seq, self._all_count = self.store.first_seq, 0
+        self._job = None
+        self._pending.clear()
+        self._result_cache.clear()
+        self.endResetModel()
+        self._last_counts = (0, 0)
+        self.counts_changed.emit(0, 0)
+
+    def visible_lines(self) -> List[str]:
+        """현재 필터 결과 라인 목록 (내보내기 용도)"""
+        seqs = range(self._all_first_seq, self._all_first_seq + self._all_count) if self._all_rows \
+            else self._rows[self._row_offset:]
+        return [self.store.line(seq) for seq in seqs]